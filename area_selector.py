@@ -1,15 +1,25 @@
 from PySide6.QtCore import Qt, QRect, QPoint, QSize, Signal, QObject, QTimer
 from PySide6.QtGui import QScreen, QPixmap, QPainter, QPen, QColor, QBrush
 from PySide6.QtWidgets import QApplication, QWidget, QRubberBand
+from screenshot_cache import shared_screenshot_cache, create_dimmed_pixmap, paint_dimmed, source_rect
 
 # 创建信号类
 class AreaSelectorSignals(QObject):
     areaSelected = Signal(int, int, int, int)  # x, y, width, height
     selectorClosed = Signal()  # 新增：选择器关闭信号
 
+# 遮罩颜色和选择框边框
+DIM_COLOR = QColor(0, 0, 0, 150)
+BORDER_COLOR = QColor(0, 174, 255)
+BORDER_WIDTH = 2
+
 # 屏幕区域选择器类
 class ScreenAreaSelector(QWidget):
-    def __init__(self):
+    def __init__(self, screenshotCache=None):
+        """
+        参数:
+            screenshotCache: 截图缓存，默认使用全局共用的缓存
+        """
         super().__init__()
         # 创建信号对象
         self.signals = AreaSelectorSignals()
@@ -22,6 +32,10 @@ class ScreenAreaSelector(QWidget):
         
         # 背景变透明，而不是半透明黑色
         self.setStyleSheet("background-color: transparent;")
+        # paintEvent 会画满需要重绘的区域，不需要 Qt 先擦除背景
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        # 选择器隐藏后保留下来重复使用，关闭时不能让整个应用程序退出
+        self.setAttribute(Qt.WA_QuitOnClose, False)
         
         # 创建橡皮筋选择框
         self.rubberBand = QRubberBand(QRubberBand.Rectangle, self)
@@ -29,29 +43,78 @@ class ScreenAreaSelector(QWidget):
         self.origin = QPoint()
         self.selection = QRect()
         
-        # 获取屏幕截图
-        screen = QApplication.primaryScreen()
-        self.screenshot = screen.grabWindow(0)
+        # 屏幕截图在每次显示时获取，隐藏时交还给缓存
+        self.screenshotCache = screenshotCache or shared_screenshot_cache()
+        self.screenshot = None
+        self.dimmedScreenshot = None
+        
+    def loadScreenshot(self):
+        """获取屏幕截图（刚截取过时直接复用缓存中的截图）并开始新的一次选择"""
+        if self.screenshot is not None:
+            return
+        self.screenshot = self.screenshotCache.acquire()
+        # 遮罩层在第一帧画完后才合成（buildDimmedLayer），不占用从点击到显示的时间
+        self.dimmedScreenshot = None
+        self.origin = QPoint()
+        self.selection = QRect()
+        self.rubberBand.hide()
+        
+    def buildDimmedLayer(self):
+        """合成预先变暗的截图，之后的绘制直接贴图"""
+        if self.screenshot is not None and self.dimmedScreenshot is None:
+            self.dimmedScreenshot = create_dimmed_pixmap(self.screenshot, DIM_COLOR)
+        
+    def showEvent(self, event):
+        # 主窗口在 show() 之前已调用 loadScreenshot()，这里只处理直接 show() 的情况：
+        # 显示之前选择器还没有映射到屏幕上，此时截取的是选择器下面的桌面
+        # 窗口管理器发来的显示事件（spontaneous）发生在映射之后，此时截图只会截到覆盖层本身
+        if not event.spontaneous():
+            self.loadScreenshot()
+        super().showEvent(event)
+        
+    def hideEvent(self, event):
+        # 每次选择结束（完成、右键取消、关闭窗口，或被窗口管理器隐藏/最小化）只在这里发出一次关闭信号
+        if self.screenshot is not None:
+            self.releaseScreenshot()
+            self.signals.selectorClosed.emit()
+            if event.spontaneous():
+                # 被窗口管理器隐藏时本次选择同样结束，真正隐藏窗口，下次由 show() 重新开始
+                QTimer.singleShot(0, self, self.hide)
+        super().hideEvent(event)
+        
+    def selectionDirtyRect(self, selection):
+        """选择框连同边框所占的区域"""
+        margin = BORDER_WIDTH
+        return selection.adjusted(-margin, -margin, margin, margin)
+        
+    def releaseScreenshot(self):
+        """把截图交还给缓存并丢弃遮罩层，可以重复调用"""
+        if self.screenshot is not None:
+            self.screenshot = None
+            self.dimmedScreenshot = None
+            self.screenshotCache.release()
         
     def paintEvent(self, event):
+        if self.screenshot is None:
+            return
         painter = QPainter(self)
+        # 只重绘需要更新的区域
+        dirty = event.rect()
         
-        # 先绘制原始截图
-        painter.drawPixmap(0, 0, self.screenshot)
-        
-        # 创建半透明黑色遮罩，覆盖整个屏幕
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 150))
+        # 先贴预先变暗的截图
+        paint_dimmed(painter, dirty, self.screenshot, self.dimmedScreenshot, DIM_COLOR)
+        if self.dimmedScreenshot is None:
+            QTimer.singleShot(0, self, self.buildDimmedLayer)
         
         # 如果有选择区域，将该区域还原为原始图像
         if not self.selection.isNull():
-            # 从原始截图中复制出选中区域
-            selected_area = self.screenshot.copy(self.selection)
-            
-            # 在选中区域绘制原始图像
-            painter.drawPixmap(self.selection, selected_area)
+            # 直接从原始截图按源矩形绘制，不复制出新的 QPixmap
+            visible = self.selection.intersected(dirty)
+            if not visible.isEmpty():
+                painter.drawPixmap(visible, self.screenshot, source_rect(self.screenshot, visible))
             
             # 绘制选中区域周围的边框
-            pen = QPen(QColor(0, 174, 255), 2)
+            pen = QPen(BORDER_COLOR, BORDER_WIDTH)
             painter.setPen(pen)
             painter.drawRect(self.selection)
             
@@ -62,18 +125,19 @@ class ScreenAreaSelector(QWidget):
             self.rubberBand.show()
         elif event.button() == Qt.RightButton:
             # 右键点击取消
-            print("右键取消选择，发送关闭信号")
-            # 先发送信号，再安全关闭
-            self.signals.selectorClosed.emit()
-            # 使用延迟关闭，确保信号被处理
-            QTimer.singleShot(100, self.safeClose)
-            # 不直接调用 self.close() 避免意外关闭整个程序
+            print("右键取消选择")
+            self.safeClose()
     
     def mouseMoveEvent(self, event):
         if not self.origin.isNull():
+            previous = self.selection
             self.selection = QRect(self.origin, event.pos()).normalized()
             self.rubberBand.setGeometry(self.selection)
-            self.update()  # 更新绘制
+            # 只重绘新旧选择框的并集
+            dirty = self.selectionDirtyRect(self.selection)
+            if not previous.isNull():
+                dirty = dirty.united(self.selectionDirtyRect(previous))
+            self.update(dirty)
     
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton and not self.selection.isNull():
@@ -84,38 +148,19 @@ class ScreenAreaSelector(QWidget):
             x, y, width, height = self.selection.x(), self.selection.y(), self.selection.width(), self.selection.height()
             print(f"选择区域坐标: x={x}, y={y}, width={width}, height={height}")
             
-            # 发出信号
+            # 发出信号，随后隐藏选择器（隐藏时发出关闭信号）
             self.signals.areaSelected.emit(x, y, width, height)
-            print("发送区域选择信号，准备关闭选择器")
-            
-            # 发送关闭信号
-            self.signals.selectorClosed.emit()
-            
-            # 确保选择器被正确关闭但不会导致整个程序退出
-            QTimer.singleShot(100, self.safeClose)
+            self.safeClose()
     
     def safeClose(self):
-        print("安全关闭区域选择器...")
-        try:
-            # 在关闭前再次发送信号
-            self.signals.selectorClosed.emit()
-            # 仅销毁此窗口而不是退出程序
-            self.deleteLater()
-        except Exception as e:
-            print(f"关闭区域选择器时出错: {str(e)}")
+        print("关闭区域选择器...")
+        # 仅隐藏此窗口，下次选择时直接重新显示；关闭信号在 hideEvent 中发出
+        self.hide()
             
     def closeEvent(self, event):
-        print("区域选择器正在关闭...")
-        try:
-            # 再次发送关闭信号，以防万一
-            self.signals.selectorClosed.emit()
-            # 接受关闭事件但不传播到整个应用程序
-            event.accept()
-            super().closeEvent(event)
-        except Exception as e:
-            print(f"处理关闭事件时出错: {str(e)}")
-            # 确保事件被接受
-            event.accept()
+        # 接受关闭事件但不传播到整个应用程序，关闭信号由随后的 hideEvent 发出
+        event.accept()
+        super().closeEvent(event)
 
 # 使用示例:
 # selector = ScreenAreaSelector()
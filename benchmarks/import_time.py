@@ -0,0 +1,98 @@
+"""
+冷启动导入时间基准：在新的子进程中按 python main.py 的方式加载 main.py（不进入事件循环）
+
+用法:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 20 --top 15
+
+每次运行都是独立的进程，统计加载耗时的中位数/最小值/最大值，并检查：
+    main 是否被再次作为模块 "main" 导入（循环导入会导致 main.py 执行两遍）
+    pyautogui 等重依赖是否在启动时就被加载
+--top 使用 python -X importtime 列出累计耗时最高的导入。
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 启动时不应加载的重依赖
+HEAVY_MODULES = ("pyautogui", "pymsgbox", "pyscreeze", "PIL", "Xlib")
+
+CHILD_CODE = """
+import sys, time, json, runpy
+start = time.perf_counter()
+runpy.run_path("main.py", run_name="__startup__")
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({
+    "elapsed_ms": elapsed,
+    "main_imported_twice": "main" in sys.modules,
+    "heavy_modules": [name for name in %r if name in sys.modules],
+    "module_count": len(sys.modules),
+}))
+""" % (HEAVY_MODULES,)
+
+
+def run_once(importtime=False):
+    """
+    在子进程中加载一次 main.py
+
+    参数:
+        importtime: 是否同时开启 -X importtime
+
+    返回:
+        (结果字典, stderr 文本)
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", CHILD_CODE]
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="1")
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"子进程失败:\n{proc.stderr}")
+    # main.py 的模块级 print 也会写到 stdout，结果在最后一行
+    return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+
+def slowest_imports(stderr, top):
+    """解析 -X importtime 的输出，返回累计耗时最高的 top 个导入 [(毫秒, 模块名)]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative) / 1000, name.strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="main.py 冷启动导入时间基准")
+    parser.add_argument("--runs", type=int, default=10, help="运行次数")
+    parser.add_argument("--top", type=int, default=0, help="列出累计耗时最高的导入数量")
+    args = parser.parse_args(argv)
+
+    results = [run_once()[0] for _ in range(args.runs)]
+    times = [r["elapsed_ms"] for r in results]
+    last = results[-1]
+    print(f"运行 {args.runs} 次: 中位数 {statistics.median(times):.1f} ms, "
+          f"最小 {min(times):.1f} ms, 最大 {max(times):.1f} ms")
+    print(f"已加载模块数: {last['module_count']}")
+    print(f"main.py 被重复导入: {'是' if last['main_imported_twice'] else '否'}")
+    print(f"启动时加载的重依赖: {', '.join(last['heavy_modules']) or '无'}")
+
+    if args.top:
+        _, stderr = run_once(importtime=True)
+        print(f"\n累计耗时最高的 {args.top} 个导入:")
+        for ms, name in slowest_imports(stderr, args.top):
+            print(f"  {ms:8.1f} ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""
+启动基准：分阶段统计主窗口启动耗时，输出中位数和 p95 到 JSON 文件
+
+用法:
+    xvfb-run -a python benchmarks/startup.py --runs 20
+    python benchmarks/startup.py --runs 20 --output startup.json
+    python benchmarks/startup.py --compare baseline.json --tolerance 0.2
+
+每次运行都在新的子进程中完成，统计的阶段（毫秒）:
+    interpreter        父进程启动子进程 → 子进程开始执行脚本（解释器启动）
+    import_modules     import modules（界面、资源、UIFunctions，以及它导入的 widgets）
+    import_pyautogui   import pyautogui（未安装时不统计）
+    import_main        加载 main.py 其余部分（不进入事件循环）
+    setup_ui           Ui_MainWindow.setupUi
+    ui_definitions     UIFunctions.uiDefinitions（阴影效果和 CustomGrip 的创建）
+    main_window        MainWindow() 构造总耗时
+    first_paint        主窗口第一次收到 Paint 事件
+    total              子进程启动 → 第一次绘制
+    init_services      MainWindow.initServices（第一次绘制之后执行，不计入 total）
+    load_config        其中 ConfigManager._load_config 的耗时
+
+每个子进程在单独的临时目录中运行，使用仓库 app_config.json 的副本和独立的单实例地址，
+不会改动真实的配置、档案数据库，也不会与正在运行的程序冲突。
+
+没有 DISPLAY 时使用 offscreen 平台。--compare 时任一阶段的中位数比基准慢超过 tolerance 则退出码为 1。
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import shutil
+import platform
+import tempfile
+import subprocess
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PHASES = ("interpreter", "import_modules", "import_pyautogui", "import_main",
+          "setup_ui", "ui_definitions", "main_window", "first_paint", "total",
+          "init_services", "load_config")
+
+# 第一次绘制的最长等待时间（毫秒），超时视为失败
+FIRST_PAINT_TIMEOUT_MS = 10000
+
+
+def _child(spawn_time):
+    """子进程入口：在临时工作目录中依次执行各启动阶段，把耗时以 JSON 输出到最后一行"""
+    start_wall = time.time()
+    start = time.perf_counter()
+    phases = {"interpreter": (start_wall - spawn_time) * 1000}
+
+    def measure(name, func):
+        begin = time.perf_counter()
+        result = func()
+        phases[name] = (time.perf_counter() - begin) * 1000
+        return result
+
+    def timed(owner, attr, name):
+        """把 owner.attr 替换为记录耗时的包装函数"""
+        original = getattr(owner, attr)
+
+        def wrapper(*args, **kwargs):
+            begin = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                phases[name] = phases.get(name, 0.0) + (time.perf_counter() - begin) * 1000
+        setattr(owner, attr, wrapper)
+
+    sys.path.insert(0, ROOT)
+    import importlib
+    modules = measure("import_modules", lambda: importlib.import_module("modules"))
+    try:
+        measure("import_pyautogui", lambda: importlib.import_module("pyautogui"))
+    except Exception:
+        phases.pop("import_pyautogui", None)
+
+    import runpy
+    import job_server
+    from config_manager import ConfigManager
+    # 使用本进程独有的单实例地址，不占用正在运行的程序的地址
+    address = os.path.join(os.getcwd(), "startup.sock") if sys.platform != "win32" \
+        else f"battle_report-startup-{os.getpid()}"
+    job_server.server_address = lambda: address
+    timed(ConfigManager, "_load_config", "load_config")
+    timed(modules.Ui_MainWindow, "setupUi", "setup_ui")
+    timed(modules.UIFunctions, "uiDefinitions", "ui_definitions")
+    main_globals = measure("import_main", lambda: runpy.run_path(os.path.join(ROOT, "main.py"),
+                                                                 run_name="__startup__"))
+    main_window_class = main_globals["MainWindow"]
+    timed(main_window_class, "initServices", "init_services")
+
+    from PySide6.QtCore import QObject, QEvent, QTimer
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+
+    class FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and "first_paint" not in phases:
+                phases["first_paint"] = (time.perf_counter() - window_start) * 1000
+                phases["total"] = (time.perf_counter() - start) * 1000 + phases["interpreter"]
+                QTimer.singleShot(0, app, exit_after_services)
+            return False
+
+    def exit_after_services():
+        # initServices 在第一次绘制之后才执行，记录到它的耗时后再退出
+        if "init_services" in phases:
+            app.exit()
+        else:
+            QTimer.singleShot(10, app, exit_after_services)
+
+    paint_filter = FirstPaintFilter()
+    window_start = time.perf_counter()
+    # MainWindow 在构造函数中就会 show()，过滤器必须在构造前安装到应用上
+    app.installEventFilter(paint_filter)
+    window = measure("main_window", main_window_class)
+    QTimer.singleShot(FIRST_PAINT_TIMEOUT_MS, app, app.exit)
+    app.exec()
+    app.removeEventFilter(paint_filter)
+    window.close()
+
+    if "first_paint" not in phases:
+        raise RuntimeError(f"{FIRST_PAINT_TIMEOUT_MS} ms 内主窗口没有绘制")
+    if "init_services" not in phases:
+        raise RuntimeError(f"{FIRST_PAINT_TIMEOUT_MS} ms 内没有创建后台服务")
+    print(json.dumps(phases))
+
+
+def run_once():
+    """
+    在新的子进程中完整启动一次主窗口
+
+    子进程的工作目录是临时目录，ConfigManager 读取其中的 app_config.json 副本，
+    生成的档案数据库随临时目录一起删除。
+
+    返回:
+        {阶段: 毫秒}
+    """
+    env = dict(os.environ)
+    if not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    command = [sys.executable, os.path.abspath(__file__), "--child", repr(time.time())]
+    with tempfile.TemporaryDirectory(prefix="startup-bench-") as workdir:
+        config_path = os.path.join(ROOT, "app_config.json")
+        if os.path.exists(config_path):
+            shutil.copy(config_path, workdir)
+        proc = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"子进程失败:\n{proc.stderr}")
+    # main.py 会向 stdout 打印日志，结果在最后一行
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def summarize(runs):
+    """
+    汇总多次运行的结果
+
+    参数:
+        runs: run_once() 结果列表
+
+    返回:
+        {阶段: {"median": 毫秒, "p95": 毫秒, "min": 毫秒, "max": 毫秒}}，只包含出现过的阶段
+    """
+    summary = {}
+    for phase in PHASES:
+        values = np.array([run[phase] for run in runs if phase in run], dtype=np.float64)
+        if len(values) == 0:
+            continue
+        summary[phase] = {
+            "median": round(float(np.median(values)), 3),
+            "p95": round(float(np.percentile(values, 95)), 3),
+            "min": round(float(values.min()), 3),
+            "max": round(float(values.max()), 3),
+        }
+    return summary
+
+
+def compare(summary, baseline_path, tolerance):
+    """
+    与基准结果比较各阶段的中位数
+
+    返回:
+        变慢超过 tolerance 的 [(阶段, 基准中位数, 当前中位数)]
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["phases"]
+    regressions = []
+    for phase, stats in summary.items():
+        if phase in baseline and stats["median"] > baseline[phase]["median"] * (1 + tolerance):
+            regressions.append((phase, baseline[phase]["median"], stats["median"]))
+    return regressions
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["--child"]:
+        _child(float(argv[1]))
+        return 0
+
+    parser = argparse.ArgumentParser(description="主窗口分阶段启动基准")
+    parser.add_argument("--runs", type=int, default=10, help="运行次数")
+    parser.add_argument("--output", default="startup_benchmark.json", help="结果 JSON 文件")
+    parser.add_argument("--compare", help="基准结果 JSON 文件，用于检查启动是否变慢")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="允许比基准慢的比例")
+    args = parser.parse_args(argv)
+
+    runs = []
+    for i in range(args.runs):
+        runs.append(run_once())
+        print(f"第 {i + 1}/{args.runs} 次: total {runs[-1]['total']:.1f} ms", file=sys.stderr)
+
+    from PySide6 import __version__ as pyside_version
+    summary = summarize(runs)
+    result = {
+        "runs": args.runs,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pyside6": pyside_version,
+        "platform": platform.platform(),
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM") or ("offscreen" if not os.environ.get("DISPLAY") else "xcb"),
+        "phases": summary,
+        "samples": runs,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+    print(f"{'阶段':<18}{'中位数':>10}{'p95':>10}")
+    for phase, stats in summary.items():
+        print(f"{phase:<20}{stats['median']:>10.1f}{stats['p95']:>10.1f}")
+    print(f"结果已写入 {args.output}")
+
+    if args.compare:
+        regressions = compare(summary, args.compare, args.tolerance)
+        for phase, before, after in regressions:
+            print(f"变慢: {phase} {before:.1f} ms → {after:.1f} ms")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+资源构建脚本：只打包界面实际引用的图片，生成二进制资源文件 modules/resources.rcc
+
+用法:
+    python build_resources.py
+    python build_resources.py --list
+
+扫描 .py、.ui、.qss 中形如 ":/icons/images/icons/cil-home.png" 的资源路径，
+按 resources.qrc 中的前缀找到对应文件，生成精简的 qrc 后调用 pyside6-rcc --binary 编译。
+运行时由 modules/resource_loader.py 通过 QResource.registerResource 加载（Qt 直接映射文件）。
+修改界面或主题中用到的图标后需要重新运行本脚本。
+"""
+import os
+import re
+import sys
+import shutil
+import argparse
+import tempfile
+import subprocess
+import xml.etree.ElementTree as ET
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+QRC_FILE = os.path.join(ROOT, "resources.qrc")
+OUTPUT_FILE = os.path.join(ROOT, "modules", "resources.rcc")
+SCAN_DIRS = ("", "modules", "themes")
+SCAN_EXTENSIONS = (".py", ".ui", ".qss")
+
+RESOURCE_PATTERN = re.compile(r":/([\w\-]+)/([\w\-./]+\.\w+)")
+
+
+def read_qrc(path=QRC_FILE):
+    """
+    读取 qrc 文件中登记的全部资源
+
+    参数:
+        path: qrc 文件路径
+
+    返回:
+        {(前缀, 文件相对路径): 别名或 None}
+    """
+    entries = {}
+    for qresource in ET.parse(path).getroot().iter("qresource"):
+        prefix = qresource.get("prefix", "").strip("/")
+        for node in qresource.iter("file"):
+            entries[(prefix, node.text.strip())] = node.get("alias")
+    return entries
+
+
+def scan_references():
+    """
+    扫描源码、界面文件和主题中引用的资源路径
+
+    返回:
+        排序后的 (前缀, 文件相对路径) 列表
+    """
+    references = set()
+    for directory in SCAN_DIRS:
+        folder = os.path.join(ROOT, directory)
+        for name in os.listdir(folder):
+            if not name.endswith(SCAN_EXTENSIONS):
+                continue
+            with open(os.path.join(folder, name), "r", encoding="utf-8", errors="ignore") as f:
+                references.update(RESOURCE_PATTERN.findall(f.read()))
+    return sorted(references)
+
+
+def write_qrc(resources, path):
+    """把选中的资源写成新的 qrc 文件"""
+    by_prefix = {}
+    for (prefix, file), alias in resources.items():
+        by_prefix.setdefault(prefix, []).append((file, alias))
+    lines = ["<RCC>"]
+    for prefix in sorted(by_prefix):
+        lines.append(f'  <qresource prefix="{prefix}">')
+        for file, alias in sorted(by_prefix[prefix]):
+            # 临时 qrc 不在仓库根目录，用绝对路径定位文件，用别名保留原来的资源路径
+            absolute = os.path.join(ROOT, file).replace(os.sep, "/")
+            lines.append(f'    <file alias="{alias or file}">{absolute}</file>')
+        lines.append("  </qresource>")
+    lines.append("</RCC>")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def find_rcc():
+    """查找资源编译器，优先使用 PySide6 自带的 pyside6-rcc"""
+    for command in ("pyside6-rcc", "rcc"):
+        path = shutil.which(command)
+        if path:
+            return path
+    raise RuntimeError("找不到 pyside6-rcc，请先安装 PySide6")
+
+
+def build(output=OUTPUT_FILE):
+    """
+    生成只包含被引用资源的二进制资源文件
+
+    参数:
+        output: 输出的 .rcc 文件路径
+
+    返回:
+        打包的资源数量
+    """
+    registered = read_qrc()
+    selected = {}
+    for key in scan_references():
+        if key in registered:
+            selected[key] = registered[key]
+        else:
+            # 别名或未登记的路径无法确定对应文件，提示后跳过
+            print(f"警告: resources.qrc 中没有登记 :/{key[0]}/{key[1]}")
+
+    fd, qrc_path = tempfile.mkstemp(suffix=".qrc")
+    os.close(fd)
+    try:
+        write_qrc(selected, qrc_path)
+        subprocess.run([find_rcc(), "--binary", qrc_path, "-o", output], check=True)
+    finally:
+        os.remove(qrc_path)
+    print(f"已打包 {len(selected)}/{len(registered)} 个资源到 {os.path.relpath(output, ROOT)}"
+          f"（{os.path.getsize(output) / 1024:.1f} KB）")
+    return len(selected)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="生成只包含被引用资源的二进制资源文件")
+    parser.add_argument("--output", default=OUTPUT_FILE, help="输出的 .rcc 文件路径")
+    parser.add_argument("--list", action="store_true", help="只列出被引用的资源，不编译")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for prefix, file in scan_references():
+            print(f":/{prefix}/{file}")
+        return 0
+    build(args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
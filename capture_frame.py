@@ -0,0 +1,91 @@
+import sys
+import time
+import numpy as np
+from PySide6.QtGui import QImage
+
+# 帧统一使用 Format_RGB32（0xffRRGGBB），按字节顺序在小端机器上为 B, G, R, A
+FRAME_FORMAT = QImage.Format_RGB32
+CHANNEL_ORDER = "BGRA" if sys.byteorder == "little" else "ARGB"
+
+
+class _ImageBuffer:
+    """
+    通过 __array_interface__ 把 QImage 的像素缓冲区暴露给 NumPy
+
+    生成的数组以本对象为 base，因此只要数组（或其任意切片）还存在，
+    QImage 就不会被释放，数组也不会指向悬空内存。
+    """
+
+    def __init__(self, image):
+        self.image = image
+        bits = image.constBits()
+        # 只读取指针地址，不复制数据
+        address = np.frombuffer(bits, dtype=np.uint8).ctypes.data
+        self.__array_interface__ = {
+            "version": 3,
+            "shape": (image.height(), image.width(), 4),
+            "typestr": "|u1",
+            "strides": (image.bytesPerLine(), 4, 1),
+            "data": (address, True),  # True 表示只读
+        }
+
+
+class CaptureFrame:
+    """
+    截图帧，把 QImage 包装为只读的 NumPy 视图（零拷贝）
+
+    array 的形状为 (height, width, 4)，dtype 为 uint8，通道顺序见 CHANNEL_ORDER。
+    行步长使用 QImage.bytesPerLine()，因此行尾有填充字节时也能正确索引。
+    """
+
+    def __init__(self, image, x=0, y=0, timestamp=None):
+        """
+        初始化截图帧
+
+        参数:
+            image: QImage 截图
+            x: 帧左上角在屏幕上的 x 坐标
+            y: 帧左上角在屏幕上的 y 坐标
+            timestamp: 截图时间（time.perf_counter），默认为当前时间
+        """
+        if image.format() != FRAME_FORMAT:
+            # 只有格式不一致时才转换一次，grabWindow 在常见平台上直接就是 RGB32
+            image = image.convertToFormat(FRAME_FORMAT)
+        self.image = image
+        self.x = x
+        self.y = y
+        self.timestamp = time.perf_counter() if timestamp is None else timestamp
+        self._array = None
+
+    @property
+    def width(self):
+        return self.image.width()
+
+    @property
+    def height(self):
+        return self.image.height()
+
+    @property
+    def array(self):
+        """
+        只读的 (height, width, 4) uint8 视图，与 QImage 共享内存
+        """
+        if self._array is None:
+            self._array = np.asarray(_ImageBuffer(self.image))
+        return self._array
+
+    @property
+    def pixels(self):
+        """
+        每个像素作为一个 uint32 的 (height, width) 只读视图，便于整行比较和哈希
+        """
+        return self.array.view(np.uint32)[:, :, 0]
+
+    def copy(self):
+        """
+        返回像素数据的独立副本（可写），用于需要在帧释放后继续保存数据的场景
+        """
+        return np.array(self.array)
+
+    def __repr__(self):
+        return f"CaptureFrame(x={self.x}, y={self.y}, width={self.width}, height={self.height})"
@@ -1,20 +1,52 @@
 import os
 import json
+import time
+from mouse_trajectory import MouseTrajectory
+from profile_store import ProfileStore
+from write_behind import WriteBehindWriter
+
+# 迁移到档案数据库之前保存在 JSON 配置文件中的键
+LEGACY_PROFILE_KEYS = ("selected_area", "mouse_track", "mouse_trajectory")
+
+DEFAULT_PROFILE = "default"
 
 class ConfigManager:
     """
     配置管理类，用于保存和加载应用程序配置，如选定区域的坐标
+
+    选定区域、拖动轨迹和完整鼠标轨迹按档案（名称 + 分辨率）保存在 SQLite 数据库中，
+    JSON 配置文件只保存当前档案和宏等少量设置。
+
+    所有保存操作只更新内存并交给后台写入线程（WriteBehindWriter），合并后原子地写盘，
+    调用方不会阻塞在磁盘上；退出前调用 close() 把尚未写入的修改写完。
+    读过或改过的档案缓存在内存中，切换、列出和删除档案时以内存中的修改为准，不需要先等待写盘。
     """
     
-    def __init__(self, config_file="app_config.json"):
+    def __init__(self, config_file="app_config.json", profile=None, resolution=None, writer=None):
         """
         初始化配置管理器
         
         参数:
-            config_file: 配置文件名，默认为 app_config.json
+            config_file: 配置文件名，默认为 app_config.json；档案数据库为同名的 .db 文件
+            profile: 使用的档案名称，默认使用配置文件中记录的当前档案
+            resolution: 档案对应的分辨率，例如 "2560x1440"
+            writer: 后台写入器，默认创建一个新的 WriteBehindWriter
         """
         self.config_file = config_file
+        self.writer = writer or WriteBehindWriter(name="config-writer")
         self.config = self._load_config()
+        base, _ = os.path.splitext(config_file)
+        self.store = ProfileStore(base + ".db")
+        self._migrate_legacy_config()
+        active = self.config.get("active_profile", {})
+        self.profile = profile or active.get("name", DEFAULT_PROFILE)
+        self.resolution = resolution if resolution is not None else active.get("resolution", "")
+        # (名称, 分辨率) -> 档案内容 / 完整轨迹，保存时同时更新，与即将写入数据库的内容一致
+        self._profiles = {}
+        self._trajectories = {}
+        # 本次运行中修改过、以内存为准的档案，以及已删除但删除可能尚未写入的档案
+        self._dirty = set()
+        self._deleted = set()
     
     def _load_config(self):
         """
@@ -28,7 +60,10 @@ class ConfigManager:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except Exception as e:
-                print(f"加载配置文件失败: {e}")
+                # 保留无法解析的文件，避免下次保存时被默认配置覆盖
+                backup = self.config_file + ".corrupt"
+                os.replace(self.config_file, backup)
+                print(f"加载配置文件失败: {e}，已备份为 {backup} 并使用默认配置")
                 return self._default_config()
         else:
             return self._default_config()
@@ -40,6 +75,17 @@ class ConfigManager:
         返回:
             默认配置字典
         """
+        return {
+            "active_profile": {
+                "name": DEFAULT_PROFILE,
+                "resolution": ""
+            }
+        }
+
+    def _default_profile(self):
+        """
+        返回尚未保存过的档案的默认内容
+        """
         return {
             "selected_area": {
                 "x": 0,
@@ -54,30 +100,174 @@ class ConfigManager:
                 "end_y": 0
             }
         }
+
+    def _migrate_legacy_config(self):
+        """
+        一次性迁移：把旧版 JSON 配置中的区域和轨迹导入数据库的 default 档案
+
+        迁移完成后从 JSON 中删除这些键，并在数据库中记录迁移时间
+        """
+        legacy = {key: self.config[key] for key in LEGACY_PROFILE_KEYS if key in self.config}
+        if not legacy:
+            return
+        if self.store.get_meta("json_migrated") is None:
+            if "selected_area" in legacy:
+                self.store.save_selected_area(DEFAULT_PROFILE, "", legacy["selected_area"])
+            if "mouse_track" in legacy:
+                self.store.save_mouse_track(DEFAULT_PROFILE, "", legacy["mouse_track"])
+            info = legacy.get("mouse_trajectory")
+            if info:
+                path = os.path.join(os.path.dirname(self.config_file), info["file"])
+                try:
+                    with open(path, "rb") as f:
+                        self.store.save_trajectory_bytes(DEFAULT_PROFILE, "", f.read())
+                except OSError as e:
+                    print(f"迁移鼠标轨迹文件失败: {e}")
+            self.store.set_meta("json_migrated", os.path.basename(self.config_file))
+            print(f"已将 {self.config_file} 中的区域和轨迹迁移到档案数据库 {self.store.db_path}")
+        for key in legacy:
+            del self.config[key]
+        self.config.setdefault("active_profile", {"name": DEFAULT_PROFILE, "resolution": ""})
+        self.save_config()
     
     def save_config(self):
         """
         保存配置到文件
+
+        只在调用线程中序列化当前配置，写盘由后台线程在合并后原子地完成
+        """
+        data = json.dumps(self.config, indent=4, ensure_ascii=False).encode("utf-8")
+        self.writer.write_file(self.config_file, data)
+
+    def flush(self, timeout=None):
+        """
+        把尚未写入的配置和档案修改立即写盘
+
+        返回:
+            是否在超时前全部写入
+        """
+        return self.writer.flush(timeout)
+
+    def close(self):
+        """写入所有修改，停止后台写入线程并关闭档案数据库"""
+        self.writer.close()
+        self.store.close()
+
+    @property
+    def _key(self):
+        return (self.profile, self.resolution)
+
+    def _active_profile(self):
+        """
+        返回当前档案的内容（读取后缓存，保存时同时更新缓存）
+        """
+        key = self._key
+        if key not in self._profiles:
+            profile = None if key in self._deleted else self.store.get_profile(*key)
+            self._profiles[key] = profile or self._default_profile()
+        return self._profiles[key]
+
+    def _touch(self):
+        """记录当前档案已在内存中修改，列出档案时以内存中的内容为准"""
+        key = self._key
+        self._active_profile()["updated_at"] = time.time()
+        self._dirty.add(key)
+        self._deleted.discard(key)
+
+    def _summary(self, key):
+        """按 ProfileStore.list_profiles 的格式返回内存中档案的摘要"""
+        profile = self._profiles[key]
+        return {
+            "name": key[0],
+            "resolution": key[1],
+            "selected_area": dict(profile["selected_area"]),
+            "mouse_track": dict(profile["mouse_track"]),
+            "has_trajectory": key in self._trajectories or profile.get("has_trajectory", False),
+            "updated_at": profile.get("updated_at"),
+        }
+
+    def use_profile(self, name, resolution=""):
+        """
+        切换当前档案，之后的读取和保存都作用于该档案
+        
+        参数:
+            name: 档案名称
+            resolution: 分辨率，空字符串表示不区分分辨率
+        """
+        # 排队中的修改已在内存缓存里，切回该档案时直接读缓存，不需要等待写盘
+        self.profile, self.resolution = name, resolution
+        self.config["active_profile"] = {"name": name, "resolution": resolution}
+        self.save_config()
+
+    def list_profiles(self, resolution=None, tag=None):
         """
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4)
-            print(f"配置已保存到 {self.config_file}")
-        except Exception as e:
-            print(f"保存配置文件失败: {e}")
+        列出已保存的档案
+        
+        参数:
+            resolution: 只列出该分辨率的档案
+            tag: 只列出带有该标签的档案
+        
+        返回:
+            档案字典列表
+        """
+        # 数据库中可能还没有刚保存或刚删除的修改，这些档案以内存中的内容为准
+        overridden = self._dirty | self._deleted
+        profiles = [p for p in self.store.list_profiles(resolution, tag)
+                    if (p["name"], p["resolution"]) not in overridden]
+        for key in self._dirty:
+            if resolution is not None and key[1] != resolution:
+                continue
+            if tag is not None and tag not in self._profiles[key].get("tags", ()):
+                continue
+            profiles.append(self._summary(key))
+        profiles.sort(key=lambda p: (p["name"], p["resolution"]))
+        return profiles
+
+    def set_profile_tags(self, tags):
+        """
+        设置当前档案的标签
+        
+        参数:
+            tags: 标签列表，例如游戏客户端名称
+        """
+        tags = list(tags)
+        self.writer.submit(self.store.set_tags, self.profile, self.resolution, tags,
+                           key=("tags", self.profile, self.resolution))
+        self._active_profile()["tags"] = tags
+        self._touch()
+
+    def delete_profile(self, name, resolution=""):
+        """
+        删除档案
+        
+        返回:
+            是否删除了档案
+        """
+        key = (name, resolution)
+        existed = key in self._dirty or (
+            key not in self._deleted and self.store.get_profile(name, resolution) is not None)
+        # 尚未执行的保存会在删除之后重新建出档案，直接丢弃；之后的保存排在删除之后
+        for kind in ("selected_area", "mouse_track", "trajectory", "tags"):
+            self.writer.discard((kind,) + key)
+        self.writer.submit(self.store.delete_profile, name, resolution)
+        self._profiles.pop(key, None)
+        self._trajectories.pop(key, None)
+        self._dirty.discard(key)
+        self._deleted.add(key)
+        return existed
     
     def get_selected_area(self):
         """
-        获取已保存的选定区域坐标
+        获取当前档案已保存的选定区域坐标
         
         返回:
             包含 x, y, width, height 的字典
         """
-        return self.config.get("selected_area", self._default_config()["selected_area"])
+        return dict(self._active_profile()["selected_area"])
     
     def save_selected_area(self, x, y, width, height):
         """
-        保存选定区域的坐标
+        保存当前档案的选定区域坐标
         
         参数:
             x: 区域左上角 x 坐标
@@ -85,26 +275,25 @@ class ConfigManager:
             width: 区域宽度
             height: 区域高度
         """
-        self.config["selected_area"] = {
-            "x": x,
-            "y": y,
-            "width": width,
-            "height": height
-        }
-        self.save_config()
+        area = {"x": x, "y": y, "width": width, "height": height}
+        self._active_profile()["selected_area"] = area
+        self._touch()
+        self.writer.submit(self.store.save_selected_area, self.profile, self.resolution, area,
+                           key=("selected_area", self.profile, self.resolution))
+        print(f"选定区域已保存到档案 {self.profile!r}")
         
     def get_mouse_track(self):
         """
-        获取已保存的鼠标轨迹坐标
+        获取当前档案已保存的鼠标轨迹坐标
         
         返回:
             包含 start_x, start_y, end_x, end_y 的字典
         """
-        return self.config.get("mouse_track", self._default_config()["mouse_track"])
+        return dict(self._active_profile()["mouse_track"])
     
     def save_mouse_track(self, start_x, start_y, end_x, end_y):
         """
-        保存鼠标轨迹的起始和结束坐标
+        保存当前档案鼠标轨迹的起始和结束坐标
         
         参数:
             start_x: 起始点 x 坐标
@@ -112,10 +301,75 @@ class ConfigManager:
             end_x: 结束点 x 坐标
             end_y: 结束点 y 坐标
         """
-        self.config["mouse_track"] = {
-            "start_x": start_x,
-            "start_y": start_y,
-            "end_x": end_x,
-            "end_y": end_y
-        }
-        self.save_config() 
\ No newline at end of file
+        track = {"start_x": start_x, "start_y": start_y, "end_x": end_x, "end_y": end_y}
+        self._active_profile()["mouse_track"] = track
+        self._touch()
+        self.writer.submit(self.store.save_mouse_track, self.profile, self.resolution, track,
+                           key=("mouse_track", self.profile, self.resolution))
+        print(f"鼠标轨迹已保存到档案 {self.profile!r}")
+
+    def get_mouse_trajectory(self):
+        """
+        获取当前档案已保存的完整鼠标轨迹
+        
+        返回:
+            MouseTrajectory，没有保存过或数据无法解析时返回 None
+        """
+        key = self._key
+        if key not in self._trajectories:
+            data = None if key in self._deleted else self.store.get_trajectory_bytes(*key)
+            if data is None:
+                return None
+            try:
+                self._trajectories[key] = MouseTrajectory.from_bytes(data)
+            except Exception as e:
+                print(f"加载鼠标轨迹失败: {e}")
+                return None
+        return self._trajectories[key]
+
+    def save_mouse_trajectory(self, trajectory):
+        """
+        保存当前档案的完整鼠标轨迹
+        
+        轨迹点以二进制形式保存在档案数据库中
+        
+        参数:
+            trajectory: MouseTrajectory 实例
+        """
+        self._trajectories[self._key] = trajectory
+        self._touch()
+        self.writer.submit(self.store.save_trajectory_bytes, self.profile, self.resolution, trajectory.to_bytes(),
+                           key=("trajectory", self.profile, self.resolution))
+        print(f"完整鼠标轨迹已保存到档案 {self.profile!r}: {len(trajectory)} 个点")
+
+    def get_macros(self):
+        """
+        获取所有已保存的宏
+        
+        返回:
+            宏名称到宏定义的字典
+        """
+        return self.config.get("macros", {})
+
+    def get_macro(self, name):
+        """
+        获取指定名称的宏
+        
+        参数:
+            name: 宏名称
+        
+        返回:
+            宏定义字典，不存在时返回 None
+        """
+        return self.get_macros().get(name)
+
+    def save_macro(self, name, macro):
+        """
+        保存宏定义（保存前应先用 compile_macro 校验）
+        
+        参数:
+            name: 宏名称
+            macro: 宏定义字典，包含 steps 和可选的 output
+        """
+        self.config.setdefault("macros", {})[name] = macro
+        self.save_config()
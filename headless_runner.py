@@ -0,0 +1,164 @@
+"""
+无界面运行器：不创建主窗口，直接读取已保存的配置执行截图或宏
+
+用法:
+    python -m headless_runner capture --output frame.png
+    python -m headless_runner report --output report.png
+    python -m headless_runner macro <名称>
+    python -m headless_runner macro --file macro.json
+
+运行日志输出到 stderr，结束时向 stdout 输出一行 JSON 摘要；成功退出码为 0，失败为 1。
+只使用 QGuiApplication，不加载 QtWidgets、主窗口和资源文件；配置和宏校验失败时不加载 QtGui。
+"""
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m headless_runner", description="无界面执行截图或宏")
+    parser.add_argument("--config", default="app_config.json", help="配置文件路径")
+    parser.add_argument("--injector", choices=("auto", "xtest", "pyautogui"), default=None,
+                        help="鼠标事件注入后端")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    capture = subparsers.add_parser("capture", help="截取一次选定区域")
+    capture.add_argument("--output", required=True, help="图片保存路径")
+
+    report = subparsers.add_parser("report", help="滚动截取整份战报并拼接为长图")
+    report.add_argument("--output", default="report.png", help="长图保存路径")
+    report.add_argument("--linear", action="store_true", help="使用直线拖动而不是录制的完整轨迹")
+
+    macro = subparsers.add_parser("macro", help="执行已保存的宏或 JSON 文件中的宏")
+    macro.add_argument("name", nargs="?", help="配置中保存的宏名称")
+    macro.add_argument("--file", help="宏定义 JSON 文件")
+    macro.add_argument("--output", help="覆盖宏的长图保存路径")
+
+    return parser.parse_args(argv)
+
+
+def _load_macro(args, config_manager):
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            return args.file, json.load(f)
+    if not args.name:
+        raise ValueError("请指定宏名称或 --file")
+    macro = config_manager.get_macro(args.name)
+    if macro is None:
+        raise ValueError(f"配置中没有名为 {args.name!r} 的宏")
+    return args.name, macro
+
+
+def _run_program(app, executor, program, trajectory):
+    """在执行器工作线程中运行宏，主线程运行事件循环以处理截图转发"""
+    from PySide6.QtCore import QTimer
+    job = executor.execute_macro(program, trajectory)
+    # 回调在工作线程中执行，通过带上下文对象的 singleShot 投递到主线程退出事件循环
+    job.future.add_done_callback(lambda _: QTimer.singleShot(0, app, app.quit))
+    app.exec()
+    if job.future.cancelled():
+        return False, "宏已取消"
+    return job.future.result()
+
+
+def _needs_screen(program):
+    """宏中是否有截图或等待画面稳定的步骤"""
+    from macro_engine import OP_CAPTURE, OP_WAIT_STABLE
+    return any(op in (OP_CAPTURE, OP_WAIT_STABLE) for op, _ in program.instructions)
+
+
+def _create_app():
+    from PySide6.QtGui import QGuiApplication
+    return QGuiApplication.instance() or QGuiApplication([sys.argv[0]])
+
+
+def run(args):
+    """
+    执行一条命令
+
+    先读取配置并校验区域、编译宏，全部通过后才加载 QtGui 并创建 QGuiApplication；
+    不截图的宏完全不创建 QGuiApplication。
+
+    参数:
+        args: 解析后的命令行参数
+
+    返回:
+        JSON 摘要字典
+    """
+    from config_manager import ConfigManager
+
+    config_manager = ConfigManager(args.config)
+    summary = {"command": args.command}
+
+    if args.command == "capture":
+        area = config_manager.get_selected_area()
+        if area["width"] <= 0 or area["height"] <= 0:
+            return dict(summary, success=False, message="截图区域无效，请先选择屏幕区域")
+        _create_app()
+        from screen_capture import RegionCaptureEngine
+        frame = RegionCaptureEngine.from_config(config_manager).capture_frame()
+        if frame is None:
+            return dict(summary, success=False, message="截图区域无效，请先选择屏幕区域")
+        saved = frame.image.save(args.output)
+        return dict(summary, success=saved, output=args.output, width=frame.width, height=frame.height,
+                    message="截图完成" if saved else f"保存截图失败: {args.output}")
+
+    from macro_engine import build_report_macro, compile_macro
+
+    if args.command == "report":
+        name, macro = "report", build_report_macro(config_manager, args.output, use_trajectory=not args.linear)
+    else:
+        name, macro = _load_macro(args, config_manager)
+        if args.output:
+            macro = dict(macro, output=args.output)
+    program = compile_macro(macro, name)
+    trajectory = config_manager.get_mouse_trajectory()
+
+    from input_injector import create_injector
+    from mouse_action import MouseActionExecutor
+
+    app = capture_engine = None
+    if _needs_screen(program):
+        app = _create_app()
+        from screen_capture import RegionCaptureEngine
+        capture_engine = RegionCaptureEngine.from_config(config_manager)
+    # 未指定后端时由执行器在第一次注入事件时再创建，只含等待和截图的宏不会加载 pyautogui
+    injector = create_injector(args.injector) if args.injector else None
+    executor = MouseActionExecutor(capture_engine, injector)
+    if app is not None:
+        success, message = _run_program(app, executor, program, trajectory)
+    else:
+        # 没有截图转发，主线程直接等待工作线程执行完
+        job = executor.execute_macro(program, trajectory)
+        success, message = job.future.result()
+    executor.shutdown()
+    summary.update(success=success, message=message, macro=name, instructions=len(program))
+    if program.output:
+        summary["output"] = program.output
+    report = executor.scheduler.last_report
+    if report is not None:
+        summary["jitter"] = report.to_dict()
+    return summary
+
+
+def main(argv=None):
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    start = time.perf_counter()
+    try:
+        # 各模块的运行日志改写到 stderr，stdout 只输出 JSON 摘要
+        with contextlib.redirect_stdout(sys.stderr):
+            summary = run(args)
+    except Exception as e:
+        summary = {"command": args.command, "success": False, "message": f"{type(e).__name__}: {e}"}
+    summary["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    print(json.dumps(summary, ensure_ascii=False))
+    return EXIT_OK if summary.get("success") else EXIT_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
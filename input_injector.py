@@ -0,0 +1,182 @@
+import os
+import sys
+import threading
+
+
+class InputInjector:
+    """
+    鼠标事件注入后端的基类
+
+    所有方法都只发送一个事件，不做插值和等待；时间节奏由调用方控制。
+    后端可以把事件先缓存起来，在 flush() 时一次性发送。
+    """
+
+    name = "base"
+
+    def move_to(self, x, y):
+        """把鼠标移动到屏幕坐标 (x, y)"""
+        raise NotImplementedError
+
+    def mouse_down(self, button="left"):
+        """按下鼠标按钮"""
+        raise NotImplementedError
+
+    def mouse_up(self, button="left"):
+        """释放鼠标按钮"""
+        raise NotImplementedError
+
+    def scroll(self, clicks):
+        """
+        滚动鼠标滚轮
+
+        参数:
+            clicks: 滚动格数，正数向上，负数向下
+        """
+        raise NotImplementedError
+
+    def click(self, x, y, button="left"):
+        """在 (x, y) 处单击"""
+        self.move_to(x, y)
+        self.mouse_down(button)
+        self.mouse_up(button)
+        self.flush()
+
+    def flush(self):
+        """把缓存的事件发送出去"""
+
+    def close(self):
+        """释放后端占用的资源"""
+
+
+class PyAutoGUIInjector(InputInjector):
+    """
+    基于 pyautogui 的注入后端（跨平台）
+
+    调用时都传入 _pause=False，去掉 pyautogui 每次调用后默认的 PAUSE 延时，
+    移动也不使用 duration 参数，避免 pyautogui 在 Python 中用 time.sleep 插值。
+    """
+
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        # 确保鼠标操作安全，防止意外移动到屏幕边缘
+        pyautogui.FAILSAFE = True
+        self._pyautogui = pyautogui
+
+    def move_to(self, x, y):
+        self._pyautogui.moveTo(x, y, _pause=False)
+
+    def mouse_down(self, button="left"):
+        self._pyautogui.mouseDown(button=button, _pause=False)
+
+    def mouse_up(self, button="left"):
+        self._pyautogui.mouseUp(button=button, _pause=False)
+
+    def scroll(self, clicks):
+        self._pyautogui.scroll(clicks, _pause=False)
+
+
+class XTestInjector(InputInjector):
+    """
+    基于 X11 XTEST 扩展（python-xlib）的注入后端，仅限 Linux
+
+    事件通过 fake_input 写入 Xlib 的请求缓冲区，flush() 时一次性发送给 X 服务器，
+    没有额外的 Python 层延时。可以在 Xvfb 中运行。
+    """
+
+    name = "xtest"
+
+    _BUTTONS = {"left": 1, "middle": 2, "right": 3}
+    _SCROLL_UP = 4
+    _SCROLL_DOWN = 5
+
+    def __init__(self, display_name=None):
+        """
+        初始化 XTEST 后端
+
+        参数:
+            display_name: X 显示名称，例如 ":99"，默认使用 DISPLAY 环境变量
+        """
+        from Xlib import X, display
+        from Xlib.ext import xtest
+        self._X = X
+        self._xtest = xtest
+        self.display = display.Display(display_name)
+        if not self.display.has_extension("XTEST"):
+            self.display.close()
+            raise RuntimeError("X 服务器不支持 XTEST 扩展")
+
+    def _button(self, button):
+        if button not in self._BUTTONS:
+            raise ValueError(f"不支持的鼠标按钮: {button}")
+        return self._BUTTONS[button]
+
+    def move_to(self, x, y):
+        self._xtest.fake_input(self.display, self._X.MotionNotify, x=int(x), y=int(y))
+
+    def mouse_down(self, button="left"):
+        self._xtest.fake_input(self.display, self._X.ButtonPress, self._button(button))
+
+    def mouse_up(self, button="left"):
+        self._xtest.fake_input(self.display, self._X.ButtonRelease, self._button(button))
+
+    def scroll(self, clicks):
+        # X11 中滚轮是按钮 4（上）和 5（下）的按下/释放
+        button = self._SCROLL_UP if clicks > 0 else self._SCROLL_DOWN
+        for _ in range(abs(int(clicks))):
+            self._xtest.fake_input(self.display, self._X.ButtonPress, button)
+            self._xtest.fake_input(self.display, self._X.ButtonRelease, button)
+
+    def flush(self):
+        self.display.flush()
+
+    def close(self):
+        self.display.sync()
+        self.display.close()
+
+
+def create_injector(backend=None):
+    """
+    创建鼠标事件注入后端
+
+    参数:
+        backend: "xtest"、"pyautogui" 或 "auto"；默认读取环境变量 BATTLE_REPORT_INJECTOR，
+                 未设置时为 "auto"：Linux 下有 DISPLAY 且安装了 python-xlib 时使用 XTEST，否则使用 pyautogui
+
+    返回:
+        InputInjector 实例
+    """
+    backend = backend or os.environ.get("BATTLE_REPORT_INJECTOR", "auto")
+    if backend == "xtest":
+        return XTestInjector()
+    if backend == "pyautogui":
+        return PyAutoGUIInjector()
+    if backend != "auto":
+        raise ValueError(f"未知的注入后端: {backend}")
+
+    if sys.platform.startswith("linux") and os.environ.get("DISPLAY"):
+        try:
+            return XTestInjector()
+        except Exception as e:
+            print(f"XTEST 后端不可用，改用 pyautogui: {e}")
+    return PyAutoGUIInjector()
+
+
+_default_injector = None
+_default_lock = threading.Lock()
+
+
+def get_default_injector():
+    """
+    返回进程内共享的默认注入后端，第一次调用时创建
+
+    返回:
+        InputInjector 实例
+    """
+    global _default_injector
+    with _default_lock:
+        if _default_injector is None:
+            _default_injector = create_injector()
+            print(f"鼠标事件注入后端: {_default_injector.name}")
+        return _default_injector
@@ -0,0 +1,244 @@
+"""
+常驻进程的轻量客户端：把任务提交给 python -m job_server 启动的常驻进程
+
+用法:
+    python -m job_client ping
+    python -m job_client capture_region output=frame.png
+    python -m job_client run_macro name=report output=report.png
+    python -m job_client select_area
+    python -m job_client quit
+
+参数写成 key=value，value 能按 JSON 解析时按 JSON 解析（数字、true/false、对象），否则作为字符串。
+output、file 等路径参数在提交前转换为绝对路径（相对于当前目录，而不是常驻进程的工作目录）。
+回复以一行 JSON 输出到 stdout；成功退出码为 0，任务失败为 1，常驻进程未运行为 2。
+
+本模块只使用标准库，不导入 PySide6，提交一个任务只需要几毫秒。
+协议：每条消息是一行 UTF-8 JSON。
+    请求 {"id": 1, "job": "run_macro", "args": {...}, "wait": true}
+    回复 {"id": 1, "success": true, "message": "...", ...}
+"""
+import os
+import sys
+import json
+import time
+import socket
+import getpass
+import tempfile
+import itertools
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_NO_SERVER = 2
+
+SERVER_NAME = "battle_report"
+
+# 值为文件路径的任务参数
+PATH_ARGS = ("output", "file")
+
+# Windows 错误码：所有管道实例都在使用中
+ERROR_PIPE_BUSY = 231
+
+_request_ids = itertools.count(1)
+
+
+def server_address():
+    """
+    返回常驻进程监听的地址，服务端 QLocalServer 与客户端使用同一个地址
+
+    Unix 下是临时目录中按用户区分的套接字文件，Windows 下是命名管道名称。
+    """
+    name = f"{SERVER_NAME}-{getpass.getuser()}"
+    if sys.platform == "win32":
+        return name
+    return os.path.join(tempfile.gettempdir(), f"{name}.sock")
+
+
+def encode_message(message):
+    """把消息编码为一行 JSON 字节串"""
+    return json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def decode_message(line):
+    """把一行 JSON 字节串解码为消息字典"""
+    return json.loads(line.decode("utf-8"))
+
+
+class ServerNotRunning(ConnectionError):
+    """常驻进程没有运行"""
+
+
+def _deadline(timeout):
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _remaining(deadline):
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def _open_pipe(path, deadline):
+    """打开命名管道；所有实例都被占用时用 WaitNamedPipe 等待到超时"""
+    import ctypes
+    while True:
+        try:
+            return open(path, "r+b", buffering=0)
+        except FileNotFoundError as e:
+            raise ServerNotRunning(str(e)) from e
+        except OSError as e:
+            if getattr(e, "winerror", None) != ERROR_PIPE_BUSY:
+                raise ServerNotRunning(str(e)) from e
+        remaining = _remaining(deadline)
+        # NMPWAIT_WAIT_FOREVER = 0xFFFFFFFF；0 表示使用默认等待时间，所以剩余时间为 0 时直接超时
+        wait_ms = 0xFFFFFFFF if remaining is None else int(remaining * 1000)
+        if wait_ms == 0 or not ctypes.windll.kernel32.WaitNamedPipeW(path, wait_ms):
+            raise TimeoutError(f"连接 {path} 超时")
+
+
+def _pipe_readline(pipe, deadline):
+    """
+    从命名管道读取一行；按文件打开的管道 read 不支持超时，
+    先用 PeekNamedPipe 查看可读字节数，只读取已经到达的数据
+    """
+    import ctypes
+    import msvcrt
+    handle = msvcrt.get_osfhandle(pipe.fileno())
+    available = ctypes.c_ulong(0)
+    data = b""
+    while b"\n" not in data:
+        if not ctypes.windll.kernel32.PeekNamedPipe(handle, None, 0, None, ctypes.byref(available), None):
+            # 服务端关闭了连接
+            break
+        if available.value:
+            data += pipe.read(available.value)
+            continue
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError("等待常驻进程回复超时")
+        time.sleep(0.005)
+    line, sep, _ = data.partition(b"\n")
+    return line + sep
+
+
+def _open_channel(address, timeout):
+    """连接常驻进程，返回 (写函数, 读一行函数, 关闭函数)；连接和读取回复都受 timeout 限制"""
+    if sys.platform == "win32":
+        # QLocalServer 在 Windows 上使用命名管道，可以直接按文件打开
+        deadline = _deadline(timeout)
+        pipe = _open_pipe(rf"\\.\pipe\{address}", deadline)
+        return pipe.write, lambda: _pipe_readline(pipe, deadline), pipe.close
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(address)
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        sock.close()
+        raise ServerNotRunning(str(e)) from e
+    reader = sock.makefile("rb")
+
+    def close():
+        reader.close()
+        sock.close()
+    return sock.sendall, reader.readline, close
+
+
+def submit(job, args=None, wait=True, timeout=None, address=None):
+    """
+    向常驻进程提交一个任务
+
+    参数:
+        job: 任务类型，例如 "run_macro"、"capture_region"、"select_area"
+        args: 任务参数字典
+        wait: 为 True 时等待任务执行完毕，为 False 时常驻进程接受任务后立即回复
+        timeout: 等待回复的超时时间（秒），None 表示一直等待
+        address: 常驻进程地址，默认使用 server_address()
+
+    返回:
+        回复字典，至少包含 success 和 message
+
+    异常:
+        ServerNotRunning: 常驻进程没有运行
+    """
+    request_id = next(_request_ids)
+    write, readline, close = _open_channel(address or server_address(), timeout)
+    try:
+        write(encode_message({"id": request_id, "job": job, "args": args or {}, "wait": wait}))
+        line = readline()
+    finally:
+        close()
+    if not line:
+        return {"id": request_id, "success": False, "message": "常驻进程关闭了连接"}
+    return decode_message(line)
+
+
+def forward_to_running_instance(argv, timeout=2.0, address=None):
+    """
+    已有实例在运行时，把本次启动的命令行参数转发给它
+
+    转发的是 activate 任务且不等待任务完成，运行中的实例接受后立即回复。
+
+    参数:
+        argv: 命令行参数（不含程序名）
+        timeout: 等待回复的超时时间（秒）
+        address: 实例地址，默认使用 server_address()
+
+    返回:
+        回复字典；没有实例在运行时返回 None
+    """
+    try:
+        return submit("activate", {"argv": list(argv)}, wait=False, timeout=timeout, address=address)
+    except ServerNotRunning:
+        return None
+    except OSError as e:
+        # 实例存在但没有及时响应，不能再启动第二个实例
+        return {"success": False, "message": f"运行中的实例没有响应: {e}"}
+
+
+def resolve_path_args(args):
+    """
+    把路径参数转换为绝对路径，常驻进程的工作目录可能与客户端不同
+
+    参数:
+        args: 任务参数字典
+
+    返回:
+        新的参数字典
+    """
+    return {key: os.path.abspath(value) if key in PATH_ARGS and isinstance(value, str) else value
+            for key, value in args.items()}
+
+
+def _parse_value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(__doc__.strip())
+        return EXIT_OK
+
+    job, args, wait = argv[0], {}, True
+    for item in argv[1:]:
+        if item == "--no-wait":
+            wait = False
+            continue
+        key, sep, value = item.partition("=")
+        if not sep:
+            print(f"参数格式应为 key=value: {item}", file=sys.stderr)
+            return EXIT_FAILED
+        args[key] = _parse_value(value)
+
+    try:
+        reply = submit(job, resolve_path_args(args), wait=wait)
+    except ServerNotRunning:
+        print(json.dumps({"job": job, "success": False, "message": "常驻进程未运行，请先启动 python -m job_server"},
+                         ensure_ascii=False))
+        return EXIT_NO_SERVER
+    print(json.dumps(reply, ensure_ascii=False))
+    return EXIT_OK if reply.get("success") else EXIT_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,402 @@
+"""
+常驻进程：保持 Qt、截图引擎和鼠标事件注入后端处于已加载状态，通过 QLocalServer 接收任务
+
+用法:
+    python -m job_server
+    python -m job_server --config app_config.json --injector xtest
+
+任务由 job_client.py 提交（协议见 job_client 模块说明），支持的任务:
+    ping            检查常驻进程是否在运行
+    capture_region  截取一次选定区域，参数 output
+    run_macro       执行宏，参数 name（配置中的宏）、file（宏 JSON 文件）、macro（宏定义）
+                    或 report=true（按配置生成滚动截图宏），可选 output
+    select_area     显示区域选择器，选择结果保存到配置并用于后续截图
+    quit            退出常驻进程
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from concurrent.futures import Future
+from PySide6.QtCore import QObject, QTimer, QLockFile, Signal
+from PySide6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+from job_client import server_address, encode_message, decode_message
+
+# 退出前等待正在执行的任务响应取消的最长时间（秒）
+QUIT_TIMEOUT_S = 10.0
+# 同时启动的多个进程依次检查和监听地址，等待前一个进程完成的最长时间（毫秒）
+LISTEN_LOCK_TIMEOUT_MS = 5000
+
+
+class JobServerSignals(QObject):
+    jobReceived = Signal(str, object)  # 任务类型, 参数
+    replyReady = Signal(object, object)  # 连接, 回复字典
+
+
+class JobServer(QObject):
+    """
+    基于 QLocalServer 的任务服务端
+
+    每个任务类型对应一个处理函数 handler(args)，运行在主线程中，返回值可以是：
+        (success, message) 元组或包含 success 的字典：立即回复
+        concurrent.futures.Future：任务完成后再回复（回调可以在任意线程中触发）
+    """
+
+    def __init__(self, address=None, parent=None):
+        """
+        初始化任务服务端
+
+        参数:
+            address: 监听地址，默认使用 job_client.server_address()
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.address = address or server_address()
+        self.signals = JobServerSignals()
+        self.jobReceived = self.signals.jobReceived
+        # 任务完成回调可能在执行器工作线程中触发，通过信号转到主线程写回复
+        self.signals.replyReady.connect(self._send_reply)
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._handlers = {}
+        self._buffers = {}
+        # hold() 之后收到的请求暂存在这里，release() 时再处理
+        self._held = None
+
+    def register(self, job, handler):
+        """
+        注册任务处理函数
+
+        参数:
+            job: 任务类型
+            handler: 处理函数 handler(args)
+        """
+        self._handlers[job] = handler
+
+    @staticmethod
+    def is_running(address=None, timeout_ms=100):
+        """
+        检查是否已有服务端在监听该地址
+
+        参数:
+            address: 监听地址，默认使用 job_client.server_address()
+            timeout_ms: 连接超时时间（毫秒）
+
+        返回:
+            是否已有服务端在运行
+        """
+        socket = QLocalSocket()
+        socket.connectToServer(address or server_address())
+        running = socket.waitForConnected(timeout_ms)
+        socket.abort()
+        return running
+
+    def listen(self):
+        """
+        开始监听
+
+        检查和监听在同一个锁文件的保护下进行，同时启动的多个进程只有一个能监听成功。
+
+        返回:
+            是否监听成功；已有服务端在运行时返回 False
+        """
+        lock = QLockFile(os.path.join(tempfile.gettempdir(), os.path.basename(self.address) + ".lock"))
+        if not lock.tryLock(LISTEN_LOCK_TIMEOUT_MS):
+            print(f"等待监听锁超时: {lock.fileName()}")
+            return False
+        try:
+            if self.is_running(self.address):
+                print(f"已有常驻进程在监听 {self.address}")
+                return False
+            if not self._server.listen(self.address):
+                if self._server.serverError() != QAbstractSocket.AddressInUseError:
+                    print(f"监听 {self.address} 失败: {self._server.errorString()}")
+                    return False
+                # 上面的连接已经失败，说明是上次异常退出留下的套接字文件，删除后重试
+                QLocalServer.removeServer(self.address)
+                if not self._server.listen(self.address):
+                    print(f"监听 {self.address} 失败: {self._server.errorString()}")
+                    return False
+        finally:
+            lock.unlock()
+        print(f"常驻进程正在监听 {self.address}")
+        return True
+
+    def hold(self):
+        """暂不处理收到的请求（例如处理函数所需的对象还没有创建），直到调用 release()"""
+        if self._held is None:
+            self._held = []
+
+    def release(self):
+        """按收到的顺序处理 hold() 之后暂存的请求，之后的请求立即处理"""
+        held, self._held = self._held or [], None
+        for socket, line in held:
+            self._dispatch(socket, line)
+
+    def close(self):
+        """停止监听并删除套接字文件"""
+        self._server.close()
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b""
+            socket.readyRead.connect(lambda socket=socket: self._on_ready_read(socket))
+            socket.disconnected.connect(lambda socket=socket: self._on_disconnected(socket))
+
+    def _on_disconnected(self, socket):
+        self._buffers.pop(socket, None)
+        try:
+            socket.deleteLater()
+        except RuntimeError:
+            # 退出时连接对象随 QLocalServer 一起被删除
+            pass
+
+    def _on_ready_read(self, socket):
+        data = self._buffers.get(socket, b"") + bytes(socket.readAll())
+        *lines, self._buffers[socket] = data.split(b"\n")
+        for line in lines:
+            if not line.strip():
+                continue
+            if self._held is not None:
+                self._held.append((socket, line))
+            else:
+                self._dispatch(socket, line)
+
+    def _dispatch(self, socket, line):
+        start_time = time.perf_counter()
+        try:
+            request = decode_message(line)
+            job = request["job"]
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_reply(socket, {"success": False, "message": f"无效的请求: {e}"})
+            return
+
+        base = {"id": request.get("id"), "job": job}
+        handler = self._handlers.get(job)
+        if handler is None:
+            self._send_reply(socket, dict(base, success=False, message=f"未知的任务类型: {job}"))
+            return
+
+        print(f"收到任务: {job} {request.get('args') or {}}")
+        self.jobReceived.emit(job, request.get("args") or {})
+        try:
+            result = handler(request.get("args") or {})
+        except Exception as e:
+            self._send_reply(socket, dict(base, success=False, message=f"{type(e).__name__}: {e}"))
+            return
+
+        if not isinstance(result, Future):
+            self._send_reply(socket, self._make_reply(base, result, start_time))
+        elif not request.get("wait", True):
+            self._send_reply(socket, dict(base, success=True, message="任务已提交"))
+        else:
+            result.add_done_callback(
+                lambda future: self.signals.replyReady.emit(socket, self._future_reply(base, future, start_time)))
+
+    def _future_reply(self, base, future, start_time):
+        if future.cancelled():
+            return self._make_reply(base, (False, "任务已取消"), start_time)
+        try:
+            return self._make_reply(base, future.result(), start_time)
+        except Exception as e:
+            return self._make_reply(base, (False, f"{type(e).__name__}: {e}"), start_time)
+
+    @staticmethod
+    def _make_reply(base, result, start_time):
+        if isinstance(result, dict):
+            reply = dict(base, **result)
+        else:
+            success, message = result
+            reply = dict(base, success=bool(success), message=message)
+        reply["elapsed_ms"] = round((time.perf_counter() - start_time) * 1000, 1)
+        return reply
+
+    def _send_reply(self, socket, reply):
+        try:
+            if socket.state() != QLocalSocket.ConnectedState:
+                return
+            socket.write(encode_message(reply))
+            socket.flush()
+        except RuntimeError:
+            # 客户端已断开，连接对象已被删除
+            pass
+
+
+class WarmJobService(QObject):
+    """
+    常驻进程中的任务处理：复用同一个配置、截图引擎和鼠标操作执行器
+    """
+
+    def __init__(self, server, config_manager, capture_engine, executor, parent=None):
+        """
+        初始化任务处理并注册到服务端
+
+        参数:
+            server: JobServer 实例
+            config_manager: ConfigManager 实例
+            capture_engine: RegionCaptureEngine 实例
+            executor: MouseActionExecutor 实例
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.server = server
+        self.config_manager = config_manager
+        self.capture_engine = capture_engine
+        self.executor = executor
+        # 区域选择器常驻（隐藏），每次选择时重新显示
+        self.selector = None
+        self._selection_future = None
+        self._started = time.time()
+        server.register("ping", self.ping)
+        server.register("capture_region", self.capture_region)
+        server.register("run_macro", self.run_macro)
+        server.register("select_area", self.select_area)
+        server.register("quit", self.quit)
+        server.register("activate", self.activate)
+
+    def ping(self, args):
+        return {"success": True, "message": "常驻进程运行中", "pid": os.getpid(),
+                "uptime_s": round(time.time() - self._started, 1)}
+
+    def capture_region(self, args):
+        output = args.get("output")
+        if not output:
+            return False, "缺少参数 output"
+        frame = self.capture_engine.capture_frame()
+        if frame is None:
+            return False, "截图区域无效，请先选择屏幕区域"
+        if not frame.image.save(output):
+            return False, f"保存截图失败: {output}"
+        return {"success": True, "message": "截图完成", "output": output,
+                "width": frame.width, "height": frame.height}
+
+    def run_macro(self, args):
+        from macro_engine import build_report_macro, compile_macro
+        if args.get("report"):
+            name = "report"
+            macro = build_report_macro(self.config_manager, args.get("output") or "report.png",
+                                       use_trajectory=not args.get("linear", False))
+        elif args.get("macro") is not None:
+            name, macro = args.get("name") or "macro", args["macro"]
+        elif args.get("file"):
+            with open(args["file"], "r", encoding="utf-8") as f:
+                name, macro = args["file"], json.load(f)
+        elif args.get("name"):
+            name, macro = args["name"], self.config_manager.get_macro(args["name"])
+            if macro is None:
+                return False, f"配置中没有名为 {name!r} 的宏"
+        else:
+            return False, "请指定 name、file、macro 或 report"
+        if args.get("output"):
+            macro = dict(macro, output=args["output"])
+        program = compile_macro(macro, name)
+        job = self.executor.execute_macro(program, self.config_manager.get_mouse_trajectory())
+        return job.future
+
+    def area_selector(self):
+        """返回常驻的区域选择器，第一次调用时创建并连接信号"""
+        if self.selector is None:
+            from area_selector import ScreenAreaSelector
+            self.selector = ScreenAreaSelector()
+            self.selector.areaSelected.connect(self._on_area_selected)
+            self.selector.selectorClosed.connect(self._on_selector_closed)
+        return self.selector
+
+    def prewarm(self):
+        """预先创建隐藏的区域选择器（含原生窗口），第一次选择时直接显示"""
+        selector = self.area_selector()
+        selector.ensurePolished()
+        selector.winId()
+
+    def select_area(self, args):
+        if self._selection_future is not None and not self._selection_future.done():
+            return False, "区域选择器已经打开"
+        self._selection_future = Future()
+        selector = self.area_selector()
+        selector.showFullScreen()
+        selector.raise_()
+        selector.activateWindow()
+        return self._selection_future
+
+    def _on_area_selected(self, x, y, width, height):
+        self.config_manager.save_selected_area(x, y, width, height)
+        self.capture_engine.set_region(x, y, width, height)
+        if self._selection_future is not None and not self._selection_future.done():
+            self._selection_future.set_result({"success": True, "message": "区域选择完成",
+                                               "area": {"x": x, "y": y, "width": width, "height": height}})
+
+    def _on_selector_closed(self):
+        if self._selection_future is not None and not self._selection_future.done():
+            self._selection_future.set_result((False, "已取消区域选择"))
+
+    def activate(self, args):
+        # 再次启动 main.py 时会转发 activate；常驻进程没有主窗口，同一用户只允许一个实例
+        return False, "常驻进程正在运行，没有主窗口；请通过 job_client 提交任务"
+
+    def quit(self, args):
+        from PySide6.QtCore import QCoreApplication
+        app = QCoreApplication.instance()
+        # 必须在事件循环仍在运行时停止执行器：正在执行的任务截图要由 GUI 线程处理，
+        # 事件循环停止后再等待工作线程会永远阻塞
+        self.executor.shutdown(wait=False)
+        deadline = time.monotonic() + QUIT_TIMEOUT_S
+
+        def quit_when_stopped():
+            if self.executor.is_stopped or time.monotonic() > deadline:
+                app.quit()
+            else:
+                QTimer.singleShot(20, quit_when_stopped)
+        QTimer.singleShot(0, quit_when_stopped)
+        return True, "常驻进程即将退出"
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m job_server", description="常驻进程，接收截图和宏任务")
+    parser.add_argument("--config", default="app_config.json", help="配置文件路径")
+    parser.add_argument("--injector", choices=("auto", "xtest", "pyautogui"), default=None,
+                        help="鼠标事件注入后端")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    from PySide6.QtWidgets import QApplication
+    from config_manager import ConfigManager
+    from input_injector import create_injector
+    from mouse_action import MouseActionExecutor
+    from screen_capture import RegionCaptureEngine
+
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    # 区域选择器关闭时不退出常驻进程
+    app.setQuitOnLastWindowClosed(False)
+    server = JobServer()
+    if not server.listen():
+        return 1
+
+    config_manager = ConfigManager(args.config)
+    capture_engine = RegionCaptureEngine.from_config(config_manager)
+    executor = MouseActionExecutor(capture_engine, create_injector(args.injector) if args.injector else None)
+    service = WarmJobService(server, config_manager, capture_engine, executor)
+
+    # 预先加载注入后端、宏引擎和区域选择器，第一次任务不再承担导入和创建窗口的开销
+    try:
+        print(f"鼠标事件注入后端: {executor.injector.name}")
+    except Exception as e:
+        print(f"注入后端暂不可用，将在第一次注入事件时重试: {e}")
+    import macro_engine
+    service.prewarm()
+
+    exit_code = app.exec()
+    # quit 任务已在事件循环中停止了执行器；这里不再等待，避免等待已无法处理截图请求的工作线程
+    executor.shutdown(wait=False)
+    server.close()
+    config_manager.close()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
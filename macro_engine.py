@@ -0,0 +1,415 @@
+import time
+import numpy as np
+from region_stability import wait_until_stable
+
+# 指令操作码
+OP_DRAG = 1
+OP_DRAG_TRAJECTORY = 2
+OP_CLICK = 3
+OP_WHEEL = 4
+OP_WAIT = 5
+OP_WAIT_STABLE = 6
+OP_CAPTURE = 7
+OP_LOOP_INIT = 8
+OP_LOOP_TEST = 9
+
+OP_NAMES = {
+    OP_DRAG: "drag",
+    OP_DRAG_TRAJECTORY: "drag_trajectory",
+    OP_CLICK: "click",
+    OP_WHEEL: "wheel",
+    OP_WAIT: "wait",
+    OP_WAIT_STABLE: "wait_stable",
+    OP_CAPTURE: "capture",
+    OP_LOOP_INIT: "loop_init",
+    OP_LOOP_TEST: "loop_test",
+}
+
+LOOP_CONDITIONS = ("unchanged", "count")
+MAX_LOOP_DEPTH = 4
+
+
+class MacroError(ValueError):
+    """宏步骤无效"""
+
+
+def _require(step, key, kind, path):
+    if key not in step:
+        raise MacroError(f"{path}: 缺少字段 {key!r}")
+    value = step[key]
+    if kind is int and isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if kind is float and isinstance(value, int) and not isinstance(value, bool):
+        value = float(value)
+    if not isinstance(value, kind) or (isinstance(value, bool) and kind is not bool):
+        raise MacroError(f"{path}: 字段 {key!r} 类型应为 {kind.__name__}")
+    return value
+
+
+def _optional(step, key, kind, default, path):
+    if key not in step:
+        return default
+    return _require(step, key, kind, path)
+
+
+def _point(step, key, path):
+    value = step.get(key)
+    if not isinstance(value, (list, tuple)) or len(value) != 2 \
+            or not all(isinstance(v, int) and not isinstance(v, bool) for v in value):
+        raise MacroError(f"{path}: 字段 {key!r} 应为 [x, y] 整数坐标")
+    return int(value[0]), int(value[1])
+
+
+class MacroProgram:
+    """
+    编译后的宏程序
+
+    步骤列表在编译时一次性校验并展开为扁平的指令数组，
+    每条指令是 (操作码, 参数元组)，循环用跳转指令表示。
+    整个程序在执行器的工作线程中运行，步骤之间不经过 UI 线程。
+    """
+
+    def __init__(self, name, instructions, loop_count, output=None):
+        """
+        初始化宏程序（请使用 compile_macro 创建）
+
+        参数:
+            name: 宏名称
+            instructions: 指令数组
+            loop_count: 循环计数器的数量
+            output: 拼接长图的保存路径，None 表示不保存
+        """
+        self.name = name
+        self.instructions = tuple(instructions)
+        self.loop_count = loop_count
+        self.output = output
+
+    def __len__(self):
+        return len(self.instructions)
+
+    def dump(self):
+        """返回可读的指令列表，便于调试"""
+        return [f"{i:3d} {OP_NAMES[op]} {args}" for i, (op, args) in enumerate(self.instructions)]
+
+    def run(self, executor, capture_engine=None, trajectory=None, on_capture=None):
+        """
+        在当前线程中执行宏（通常由 MouseActionExecutor 的工作线程调用）
+
+        参数:
+            executor: MouseActionExecutor 实例，提供注入后端和取消检查
+            capture_engine: RegionCaptureEngine 实例，截图和等待稳定时使用
+            trajectory: drag 步骤使用 "trajectory": true 时回放的 MouseTrajectory
+            on_capture: 每次拼接截图后的回调 on_capture(页码, 新增行数)，在工作线程中调用
+
+        返回:
+            (是否成功, 消息)
+        """
+        return MacroRun(self, executor, capture_engine, trajectory, on_capture).run()
+
+
+class MacroRun:
+    """一次宏执行的运行状态"""
+
+    def __init__(self, program, executor, capture_engine, trajectory, on_capture=None):
+        self.program = program
+        self.on_capture = on_capture
+        self.executor = executor
+        self.capture_engine = capture_engine
+        self.trajectory = trajectory
+        self.counters = [0] * program.loop_count
+        # 每个循环本轮是否截过图、截图是否有变化；嵌套循环的截图同时计入外层循环
+        self.loop_captured = [False] * program.loop_count
+        self.loop_changed = [False] * program.loop_count
+        self.active_loops = []
+        self.capture_count = 0
+        self.last_frame_unchanged = False
+        self._last_capture = None
+        self._stitcher = None
+
+    def _need_capture_engine(self):
+        if self.capture_engine is None or not self.capture_engine.is_valid():
+            raise MacroError("截图区域无效，请先选择屏幕区域")
+        return self.capture_engine
+
+    def run(self):
+        program = self.program
+        instructions = program.instructions
+        executor = self.executor
+        pc = 0
+        executed = 0
+        try:
+            while pc < len(instructions):
+                executor.check_cancelled()
+                op, args = instructions[pc]
+                pc += 1
+                executed += 1
+
+                if op == OP_DRAG:
+                    executor.perform_mouse_track(*args)
+                elif op == OP_DRAG_TRAJECTORY:
+                    if self.trajectory is None:
+                        raise MacroError("没有已保存的完整鼠标轨迹，无法执行 trajectory 拖动")
+                    executor.perform_mouse_trajectory(self.trajectory)
+                elif op == OP_CLICK:
+                    x, y, button = args
+                    executor.injector.click(x, y, button)
+                elif op == OP_WHEEL:
+                    x, y, clicks = args
+                    injector = executor.injector
+                    if x is not None:
+                        injector.move_to(x, y)
+                    injector.scroll(clicks)
+                    injector.flush()
+                elif op == OP_WAIT:
+                    time.sleep(args[0])
+                elif op == OP_WAIT_STABLE:
+                    stable_ms, timeout_ms = args
+                    wait_until_stable(self._need_capture_engine(), stable_ms=stable_ms, timeout_ms=timeout_ms)
+                elif op == OP_CAPTURE:
+                    self._capture(*args)
+                elif op == OP_LOOP_INIT:
+                    slot = args[0]
+                    self.counters[slot] = 0
+                    self._reset_loop(slot)
+                    self.active_loops.append(slot)
+                elif op == OP_LOOP_TEST:
+                    slot, condition, max_iterations, target = args
+                    self.counters[slot] += 1
+                    done = self.counters[slot] >= max_iterations
+                    # 本轮截过图且所有截图都与前一帧相同时才认为画面不再变化
+                    if condition == "unchanged" and self.loop_captured[slot] and not self.loop_changed[slot]:
+                        done = True
+                    self._reset_loop(slot)
+                    if done:
+                        self.active_loops.pop()
+                    else:
+                        pc = target
+
+            if self._stitcher is not None and program.output:
+                if not self._stitcher.save(program.output):
+                    return False, f"保存长图失败: {program.output}"
+            message = f"宏 {program.name!r} 执行完成，共执行 {executed} 条指令，截图 {self.capture_count} 次"
+            if self._stitcher is not None:
+                message += f"，长图 {self._stitcher.width}x{self._stitcher.height}"
+            return True, message
+        finally:
+            if self._stitcher is not None:
+                self._stitcher.close()
+
+    def _reset_loop(self, slot):
+        self.loop_captured[slot] = False
+        self.loop_changed[slot] = False
+
+    def _capture(self, path, stitch):
+        frame = self._need_capture_engine().capture_frame()
+        if frame is None:
+            raise MacroError("截图失败")
+        self.capture_count += 1
+        if stitch:
+            if self._stitcher is None:
+                # 拼接器依赖 QtGui，只在真正需要拼接时导入，编译和校验宏不加载 GUI 模块
+                from report_stitcher import ReportStitcher
+                self._stitcher = ReportStitcher()
+            new_rows = self._stitcher.push(frame)
+            self.last_frame_unchanged = self.capture_count > 1 and new_rows == 0
+            if self.on_capture is not None:
+                self.on_capture(self.capture_count - 1, new_rows)
+        else:
+            previous = self._last_capture
+            self.last_frame_unchanged = previous is not None and np.array_equal(previous.pixels, frame.pixels)
+            self._last_capture = frame
+        for slot in self.active_loops:
+            self.loop_captured[slot] = True
+            if not self.last_frame_unchanged:
+                self.loop_changed[slot] = True
+        if path:
+            frame.image.save(path.format(index=self.capture_count))
+
+
+def compile_macro(macro, name="macro"):
+    """
+    校验宏步骤并编译为扁平指令数组
+
+    宏格式:
+        {"steps": [...], "output": "report.png"}  或直接是步骤列表
+
+    支持的步骤:
+        {"type": "drag", "start": [x, y], "end": [x, y], "duration": 0.5}
+        {"type": "drag", "trajectory": true}               回放已保存的完整轨迹
+        {"type": "click", "x": 100, "y": 200, "button": "left"}
+        {"type": "wheel", "clicks": -3, "x": 100, "y": 200}  x, y 可省略
+        {"type": "wait", "seconds": 0.2}
+        {"type": "wait_stable", "stable_ms": 150, "timeout_ms": 3000}
+        {"type": "capture", "path": "page_{index}.png", "stitch": true}
+        {"type": "loop_until", "condition": "unchanged" | "count", "max_iterations": 300, "steps": [...]}
+
+    unchanged 循环在一轮中截过图、且本轮（含内层循环）的截图都与前一帧相同时结束；
+    capture 的 path 中可以用 {index} 表示第几次截图。
+
+    参数:
+        macro: 宏定义（字典或步骤列表）
+        name: 宏名称
+
+    返回:
+        MacroProgram
+
+    异常:
+        MacroError: 步骤无效
+    """
+    if isinstance(macro, dict):
+        steps = macro.get("steps")
+        output = macro.get("output")
+        if output is not None and not isinstance(output, str):
+            raise MacroError("output 应为文件路径字符串")
+    else:
+        steps, output = macro, None
+    if not isinstance(steps, list) or not steps:
+        raise MacroError("宏至少需要一个步骤")
+
+    instructions = []
+    loop_slots = [0]
+    _compile_steps(steps, instructions, loop_slots, depth=0, path="steps")
+    return MacroProgram(name, instructions, loop_slots[0], output)
+
+
+def _compile_steps(steps, instructions, loop_slots, depth, path):
+    for index, step in enumerate(steps):
+        step_path = f"{path}[{index}]"
+        if not isinstance(step, dict):
+            raise MacroError(f"{step_path}: 步骤应为字典")
+        kind = step.get("type")
+
+        if kind == "drag":
+            if step.get("trajectory"):
+                instructions.append((OP_DRAG_TRAJECTORY, ()))
+            else:
+                start = _point(step, "start", step_path)
+                end = _point(step, "end", step_path)
+                duration = _optional(step, "duration", float, 0.5, step_path)
+                if duration <= 0:
+                    raise MacroError(f"{step_path}: duration 必须大于 0")
+                instructions.append((OP_DRAG, (start[0], start[1], end[0], end[1], duration)))
+
+        elif kind == "click":
+            x = _require(step, "x", int, step_path)
+            y = _require(step, "y", int, step_path)
+            button = _optional(step, "button", str, "left", step_path)
+            if button not in ("left", "middle", "right"):
+                raise MacroError(f"{step_path}: 不支持的鼠标按钮 {button!r}")
+            instructions.append((OP_CLICK, (x, y, button)))
+
+        elif kind == "wheel":
+            clicks = _require(step, "clicks", int, step_path)
+            if ("x" in step) != ("y" in step):
+                raise MacroError(f"{step_path}: x 和 y 需要同时提供")
+            x = _optional(step, "x", int, None, step_path)
+            y = _optional(step, "y", int, None, step_path)
+            instructions.append((OP_WHEEL, (x, y, clicks)))
+
+        elif kind == "wait":
+            seconds = _require(step, "seconds", float, step_path)
+            if seconds < 0:
+                raise MacroError(f"{step_path}: seconds 不能为负数")
+            instructions.append((OP_WAIT, (seconds,)))
+
+        elif kind == "wait_stable":
+            stable_ms = _optional(step, "stable_ms", int, 150, step_path)
+            timeout_ms = _optional(step, "timeout_ms", int, 3000, step_path)
+            if stable_ms <= 0 or timeout_ms <= 0:
+                raise MacroError(f"{step_path}: stable_ms 和 timeout_ms 必须大于 0")
+            instructions.append((OP_WAIT_STABLE, (stable_ms, timeout_ms)))
+
+        elif kind == "capture":
+            save_path = _optional(step, "path", str, None, step_path)
+            if save_path is not None:
+                try:
+                    save_path.format(index=0)
+                except (KeyError, IndexError, ValueError):
+                    raise MacroError(f"{step_path}: path 中只能使用 {{index}} 占位符") from None
+            stitch = _optional(step, "stitch", bool, False, step_path)
+            instructions.append((OP_CAPTURE, (save_path, stitch)))
+
+        elif kind == "loop_until":
+            if depth >= MAX_LOOP_DEPTH:
+                raise MacroError(f"{step_path}: 循环嵌套超过 {MAX_LOOP_DEPTH} 层")
+            condition = _optional(step, "condition", str, "unchanged", step_path)
+            if condition not in LOOP_CONDITIONS:
+                raise MacroError(f"{step_path}: 不支持的循环条件 {condition!r}")
+            max_iterations = _optional(step, "max_iterations", int, 300, step_path)
+            if max_iterations <= 0:
+                raise MacroError(f"{step_path}: max_iterations 必须大于 0")
+            body = step.get("steps")
+            if not isinstance(body, list) or not body:
+                raise MacroError(f"{step_path}: 循环体至少需要一个步骤")
+            if condition == "unchanged" and not _contains_capture(body):
+                raise MacroError(f"{step_path}: unchanged 条件的循环体中需要 capture 步骤")
+
+            slot = loop_slots[0]
+            loop_slots[0] += 1
+            instructions.append((OP_LOOP_INIT, (slot,)))
+            body_start = len(instructions)
+            _compile_steps(body, instructions, loop_slots, depth + 1, f"{step_path}.steps")
+            instructions.append((OP_LOOP_TEST, (slot, condition, max_iterations, body_start)))
+
+        else:
+            raise MacroError(f"{step_path}: 未知的步骤类型 {kind!r}")
+
+
+def _contains_capture(steps):
+    for step in steps:
+        if isinstance(step, dict):
+            if step.get("type") == "capture":
+                return True
+            if step.get("type") == "loop_until" and _contains_capture(step.get("steps") or []):
+                return True
+    return False
+
+
+def build_report_macro(config_manager, output="report.png", use_trajectory=True,
+                       stable_ms=150, timeout_ms=3000, drag_duration=0.5, max_pages=300):
+    """
+    根据已保存的鼠标轨迹生成常用的战报截图宏：截图 → 循环(拖动 → 等待稳定 → 截图) 直到画面不再变化
+
+    参数:
+        config_manager: 配置管理器
+        output: 拼接长图的保存路径
+        use_trajectory: 有完整轨迹时是否回放完整轨迹
+        stable_ms: 画面保持不变多久（毫秒）视为滚动结束
+        timeout_ms: 每次等待画面稳定的最长时间（毫秒）
+        drag_duration: 直线拖动的持续时间（秒）
+        max_pages: 最多截取的页数，防止异常情况下无限循环
+
+    返回:
+        宏定义字典
+
+    异常:
+        ValueError: 没有完整轨迹，且保存的起点和终点缺失或重合
+    """
+    track = config_manager.get_mouse_track() or {}
+    if use_trajectory and config_manager.get_mouse_trajectory() is not None:
+        drag = {"type": "drag", "trajectory": True}
+    else:
+        start = (track.get("start_x"), track.get("start_y"))
+        end = (track.get("end_x"), track.get("end_y"))
+        if None in start + end or start == end:
+            # 起点和终点相同（例如从未记录时的 (0, 0)）的拖动不会滚动战报，还可能触发 pyautogui 的角落保护
+            raise ValueError("没有可用的鼠标轨迹数据，请先使用轨迹记录功能")
+        drag = {
+            "type": "drag",
+            "start": [track["start_x"], track["start_y"]],
+            "end": [track["end_x"], track["end_y"]],
+            "duration": drag_duration,
+        }
+    wait_stable = {"type": "wait_stable", "stable_ms": stable_ms, "timeout_ms": timeout_ms}
+    return {
+        "output": output,
+        "steps": [
+            wait_stable,
+            {"type": "capture", "stitch": True},
+            {"type": "loop_until", "condition": "unchanged", "max_iterations": max(1, max_pages - 1), "steps": [
+                drag,
+                dict(wait_stable),
+                {"type": "capture", "stitch": True},
+            ]},
+        ],
+    }
@@ -18,18 +18,62 @@ import sys
 import os
 import platform
 import time
+import queue
+import argparse
+from concurrent.futures import Future
+
+# 宏文件的扩展名；--macro 的值以此结尾时按文件执行，否则按配置中的宏名称执行
+MACRO_FILE_SUFFIX = ".json"
+
+
+def absolutize_path_options(argv):
+    """
+    把命令行中的文件路径（--capture 的值、--macro 的宏文件）转换为绝对路径
+
+    转发给运行中的实例时，相对路径应相对于本次启动的工作目录，而不是那个实例的工作目录。
+
+    参数:
+        argv: 命令行参数（不含程序名）
+
+    返回:
+        转换后的参数列表
+    """
+    def resolve(option, value):
+        if option == "--capture" or value.endswith(MACRO_FILE_SUFFIX):
+            return os.path.abspath(value)
+        return value
+
+    result, pending_option = [], None
+    for arg in argv:
+        option, sep, value = arg.partition("=")
+        if pending_option is not None:
+            arg, pending_option = resolve(pending_option, arg), None
+        elif option in ("--capture", "--macro"):
+            if sep:
+                arg = f"{option}={resolve(option, value)}"
+            else:
+                pending_option = option
+        result.append(arg)
+    return result
+
+
+# SINGLE INSTANCE
+# 已有实例在运行时只把命令行转发给它然后退出，不加载 PySide6 和界面模块
+# ///////////////////////////////////////////////////////////////
+if __name__ == "__main__":
+    from job_client import forward_to_running_instance
+    _forwarded = forward_to_running_instance(absolutize_path_options(sys.argv[1:]))
+    if _forwarded is not None:
+        print(f"已有实例在运行: {_forwarded.get('message')}")
+        sys.exit(0 if _forwarded.get("success") else 1)
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
-from modules import *
-from widgets import *
+from modules import Ui_MainWindow, Settings, UIFunctions, AppFunctions
 from PySide6.QtCore import Qt, QTimer, QEventLoop
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication, QMainWindow, QHeaderView, QMessageBox
-from area_selector import ScreenAreaSelector
-from config_manager import ConfigManager
-from mouse_tracker import MouseTracker
-from mouse_action import MouseActionExecutor
+from window_visibility import WindowVisibilityController
 
 os.environ["QT_FONT_DPI"] = "96" # FIX Problem for High DPI and Scale above 100%
 
@@ -37,19 +81,57 @@ os.environ["QT_FONT_DPI"] = "96" # FIX Problem for High DPI and Scale above 100%
 # ///////////////////////////////////////////////////////////////
 widgets = None
 
+# 主窗口显示后多久预先创建区域选择器和鼠标跟踪器（毫秒）
+OVERLAY_PREWARM_DELAY_MS = 300
+
+
+def parse_command_line(argv):
+    """
+    解析命令行参数；再次启动时这些参数会转发给已运行的实例执行
+
+    参数:
+        argv: 命令行参数（不含程序名）
+
+    返回:
+        argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(prog="main.py", description="战报截图工具")
+    parser.add_argument("--select-area", action="store_true", help="启动后立即选择屏幕区域")
+    parser.add_argument("--capture", metavar="PATH", help="截取一次选定区域并保存")
+    parser.add_argument("--macro", metavar="NAME|FILE.json", help="执行配置中保存的宏或宏 JSON 文件")
+    # 转发来的参数不能让运行中的实例因为 argparse 报错而退出
+    args, unknown = parser.parse_known_args(argv)
+    if unknown:
+        print(f"忽略无法识别的参数: {' '.join(unknown)}")
+    return args
+
+
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, startup_args=None, job_server=None):
         QMainWindow.__init__(self)
         
         # 保存应用程序引用，用于正确恢复窗口
         self.app = QApplication.instance()
 
-        # 初始化配置管理器
-        self.config_manager = ConfigManager()
-        
-        # 初始化鼠标操作执行器
-        self.mouse_executor = MouseActionExecutor()
+        # 配置、截图引擎和执行器在主窗口第一次绘制之后再创建（见 initServices）
+        self.config_manager = None
+        self.capture_engine = None
+        self.mouse_executor = None
+        # 单实例服务由启动代码在创建窗口之前开始监听，请求暂存到 initServices 完成后再处理
+        self.job_server = job_server
+        if job_server is not None:
+            job_server.hold()
+        self.job_service = None
+        self._remoteAreaFuture = None
+        # 由本窗口按钮发起的鼠标任务 ID，只有这些任务完成时才恢复主窗口
+        self._uiJobIds = set()
+        # 启动时的命令行参数，服务创建完成后执行
+        self._startupArgs = startup_args
         
+        # 区域选择器和鼠标跟踪器常驻（隐藏），启动后空闲时预先创建，点击按钮时直接显示
+        self.selector = None
+        self.tracker = None
+
         # SET AS GLOBAL WIDGETS
         # ///////////////////////////////////////////////////////////////
         self.ui = Ui_MainWindow()
@@ -77,10 +159,6 @@ class MainWindow(QMainWindow):
         # ///////////////////////////////////////////////////////////////
         UIFunctions.uiDefinitions(self)
 
-        # QTableWidget PARAMETERS
-        # ///////////////////////////////////////////////////////////////
-        widgets.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
         # BUTTONS CLICK
         # ///////////////////////////////////////////////////////////////
 
@@ -91,27 +169,6 @@ class MainWindow(QMainWindow):
         widgets.btn_save.clicked.connect(self.buttonClick)
         widgets.btn_home_New.clicked.connect(self.buttonClick)
         
-        # 绑定屏幕区域选择功能到按钮
-        if hasattr(widgets, 'pushButton_2'):
-            widgets.pushButton_2.clicked.connect(self.selectScreenArea)
-            
-            # 在启动后显示上次选择的区域坐标
-            self.showLastSelectedArea()
-            
-        # 绑定鼠标轨迹跟踪功能到按钮
-        if hasattr(widgets, 'pushButton_3'):
-            widgets.pushButton_3.clicked.connect(self.trackMouseMovement)
-            
-            # 在启动后显示上次记录的鼠标轨迹
-            self.showLastMouseTrack()
-            
-        # 绑定鼠标操作执行功能到按钮
-        if hasattr(widgets, 'pushButton_4'):
-            widgets.pushButton_4.clicked.connect(self.executeMouseAction)
-            
-            # 连接操作完成信号
-            self.mouse_executor.actionCompleted.connect(self.onMouseActionCompleted)
-
         # EXTRA LEFT BOX
         def openCloseLeftBox():
             UIFunctions.toggleLeftBox(self, True)
@@ -129,6 +186,8 @@ class MainWindow(QMainWindow):
         # 确保窗口置于最前
         self.activateWindow()
         self.raise_()
+        # 打开选择器/跟踪器前隐藏主窗口、结束后恢复主窗口，都由这个状态机按窗口事件驱动
+        self.visibility = WindowVisibilityController(self)
 
         # SET CUSTOM THEME
         # ///////////////////////////////////////////////////////////////
@@ -148,6 +207,70 @@ class MainWindow(QMainWindow):
         widgets.stackedWidget.setCurrentWidget(widgets.home)
         widgets.btn_home.setStyleSheet(UIFunctions.selectMenu(widgets.btn_home.styleSheet()))
         
+        # 主窗口第一次绘制后再创建后台服务，启动时尽快显示界面
+        self.visibility.when_exposed(self.initServices)
+        # 主窗口显示后再预先创建覆盖层窗口，不占用启动时间
+        QTimer.singleShot(OVERLAY_PREWARM_DELAY_MS, self.prewarmOverlays)
+
+    def initServices(self):
+        """创建配置管理器、截图引擎、鼠标执行器和单实例服务，并绑定依赖它们的按钮"""
+        start_time = time.perf_counter()
+        # 这些模块只有服务用到，和服务一起在第一次绘制之后导入
+        from config_manager import ConfigManager
+        from mouse_action import MouseActionExecutor
+        from screen_capture import RegionCaptureEngine
+        from job_server import JobServer, WarmJobService
+
+        # 初始化配置管理器
+        self.config_manager = ConfigManager()
+        
+        # 初始化选定区域截图引擎
+        self.capture_engine = RegionCaptureEngine.from_config(self.config_manager)
+        
+        # 初始化鼠标操作执行器，用区域稳定检测代替固定延时；轨迹回放的注入频率默认与显示器刷新率一致
+        self.mouse_executor = MouseActionExecutor(self.capture_engine)
+        
+        # 单实例服务：再次启动的 main.py、job_client 都通过它把任务交给本实例
+        if self.job_server is None:
+            # 嵌入使用（测试、基准）时没有预先监听的服务端
+            self.job_server = JobServer()
+            if not self.job_server.listen():
+                print("警告：单实例服务未能启动")
+        self.job_service = WarmJobService(self.job_server, self.config_manager,
+                                          self.capture_engine, self.mouse_executor)
+        self.job_server.register("activate", self.onInstanceActivated)
+        self.job_server.register("select_area", self.onRemoteSelectArea)
+        self.job_server.register("quit", lambda args: (False, "主窗口实例请在界面中退出"))
+
+        # 绑定屏幕区域选择功能到按钮
+        if hasattr(widgets, 'pushButton_2'):
+            widgets.pushButton_2.clicked.connect(self.selectScreenArea)
+            
+            # 在启动后显示上次选择的区域坐标
+            self.showLastSelectedArea()
+            
+        # 绑定鼠标轨迹跟踪功能到按钮
+        if hasattr(widgets, 'pushButton_3'):
+            widgets.pushButton_3.clicked.connect(self.trackMouseMovement)
+            
+            # 在启动后显示上次记录的鼠标轨迹
+            self.showLastMouseTrack()
+            
+        # 绑定鼠标操作执行功能到按钮
+        if hasattr(widgets, 'pushButton_4'):
+            widgets.pushButton_4.clicked.connect(self.executeMouseAction)
+            
+            # 连接任务完成信号（单实例服务和宏的任务也会发出，由 onMouseJobFinished 过滤）
+            self.mouse_executor.jobFinished.connect(self.onMouseJobFinished)
+        print(f"后台服务已创建，耗时 {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+        # 处理在服务创建完成前转发来的请求
+        self.job_server.release()
+
+        if self._startupArgs is not None:
+            args, self._startupArgs = self._startupArgs, None
+            self.handleCommandLine(args)
+        
     # 显示上次选择的区域坐标
     def showLastSelectedArea(self):
         if hasattr(widgets, 'lineEdit_2'):
@@ -193,49 +316,56 @@ class MainWindow(QMainWindow):
             "确认执行",
             f"即将执行鼠标从 ({track['start_x']}, {track['start_y']}) 到 ({track['end_x']}, {track['end_y']}) 的操作。\n\n"
             "注意：即将自动控制您的鼠标，请确保这是您想要的操作。\n"
-            "程序将最小化，执行完成后会自动恢复。\n\n"
+            "程序窗口将隐藏，执行完成后会自动恢复。\n\n"
             "确定要执行吗？",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
-            # 给用户3秒时间切换到目标窗口
-            if hasattr(widgets, 'lineEdit_2'):
-                widgets.lineEdit_2.setText("准备执行鼠标操作，3秒后开始...")
-            
-            # 执行倒计时
-            QTimer.singleShot(1000, lambda: self.updateCountdown(2))
-            QTimer.singleShot(2000, lambda: self.updateCountdown(1))
-            QTimer.singleShot(3000, lambda: self.performMouseAction(track))
-    
-    def updateCountdown(self, seconds):
-        if hasattr(widgets, 'lineEdit_2'):
-            widgets.lineEdit_2.setText(f"准备执行鼠标操作，{seconds}秒后开始...")
+            # 不再固定倒计时，执行器会等待选定区域稳定（主窗口隐藏完成）后再开始
+            self.performMouseAction(track)
     
     def performMouseAction(self, track):
         if hasattr(widgets, 'lineEdit_2'):
             widgets.lineEdit_2.setText("正在执行鼠标操作...")
         
-        # 最小化窗口
-        print("最小化窗口以执行鼠标操作...", flush=True)
-        self.showMinimized()
-        # 确保窗口状态更新
-        QApplication.processEvents()
-        
-        # 执行鼠标轨迹操作
-        self.mouse_executor.execute_mouse_track(
-            track["start_x"], 
-            track["start_y"],
-            track["end_x"],
-            track["end_y"],
-            duration=0.5  # 可以调整拖动速度
-        )
+        # 隐藏窗口，窗口真正从屏幕上移除后再提交任务，拖动不会落在主窗口上
+        print("隐藏窗口以执行鼠标操作...", flush=True)
+        self.visibility.hide_then(lambda: self.submitMouseAction(track))
+
+    def submitMouseAction(self, track):
+        """把拖动任务提交给执行器，完成后由 onMouseJobFinished 恢复窗口"""
+        # 优先按录制的完整轨迹回放，没有时执行起点到终点的直线拖动
+        trajectory = self.config_manager.get_mouse_trajectory()
+        try:
+            if trajectory is not None and len(trajectory) > 2:
+                job = self.mouse_executor.execute_mouse_trajectory(trajectory)
+            else:
+                # 执行鼠标轨迹操作
+                job = self.mouse_executor.execute_mouse_track(
+                    track["start_x"], 
+                    track["start_y"],
+                    track["end_x"],
+                    track["end_y"],
+                    duration=0.5  # 可以调整拖动速度
+                )
+            # jobFinished 从工作线程排队投递到 GUI 线程，记录 ID 时任务完成的信号还不会被处理
+            self._uiJobIds.add(job.job_id)
+        except queue.Full as e:
+            # GUI 线程不等待队列空出位置，直接报告失败并恢复窗口
+            self.onMouseActionCompleted(False, str(e))
     
+    def onMouseJobFinished(self, job_id, success, message):
+        # 其他来源的任务（命令行、job_client 等）由各自的流程决定是否恢复窗口
+        if job_id in self._uiJobIds:
+            self._uiJobIds.discard(job_id)
+            self.onMouseActionCompleted(success, message)
+
     def onMouseActionCompleted(self, success, message):
         print(f"鼠标操作结果: {'成功' if success else '失败'}, {message}")
         # 操作完成后恢复窗口
-        QTimer.singleShot(500, self.forceRestoreWindow)
+        self.forceRestoreWindow()
         
         if hasattr(widgets, 'lineEdit_2'):
             widgets.lineEdit_2.setText(message)
@@ -243,33 +373,40 @@ class MainWindow(QMainWindow):
     # 屏幕区域选择方法
     def selectScreenArea(self):
         print("开始选择屏幕区域...", flush=True)
-        # 隐藏窗口而不是最小化，避免闪烁
-        self.setVisible(False)
-        # 让窗口立即隐藏，确保处理完成
-        QApplication.processEvents()
-        time.sleep(0.1)  # 短暂延迟确保窗口已隐藏
-        # 立即显示区域选择器
-        self.showAreaSelector()
+        # 隐藏窗口而不是最小化，避免闪烁；窗口真正从屏幕上移除后再显示区域选择器（截图中不会有主窗口）
+        self.visibility.hide_then(self.showAreaSelector)
         
-    def showAreaSelector(self):
-        print("显示区域选择器...", flush=True)
-        try:
+    def areaSelector(self):
+        """返回常驻的区域选择器，第一次调用时创建并连接信号"""
+        if self.selector is None:
+            # 选择器和跟踪器只在第一次使用时导入，不拖慢启动
+            from area_selector import ScreenAreaSelector
             self.selector = ScreenAreaSelector()
             # 连接信号
             self.selector.areaSelected.connect(self.onAreaSelected)
             # 连接关闭信号
             self.selector.selectorClosed.connect(self.forceRestoreWindow)
-            
-            # 设置属性以防止选择器关闭导致整个应用程序关闭
-            self.selector.setAttribute(Qt.WA_QuitOnClose, False)
-            
-            # 显示选择器
-            self.selector.show()
-            
-            # 确保在选择器销毁时恢复主窗口
-            self.selector.destroyed.connect(self.forceRestoreWindow)
+            # 远程请求的区域选择被取消时也要回复（选择完成时 areaSelected 先于 selectorClosed 发出）
+            self.selector.selectorClosed.connect(
+                lambda: self._finishRemoteAreaSelection((False, "已取消区域选择")))
+        return self.selector
+        
+    def showAreaSelector(self):
+        print("显示区域选择器...", flush=True)
+        try:
+            start_time = time.perf_counter()
+            selector = self.areaSelector()
+            # 主窗口已经从屏幕上移除，先截取桌面再显示，覆盖层映射时截图已经就绪，showEvent 中不再截图
+            selector.loadScreenshot()
+            # 显示选择器（showFullScreen 同时清除被窗口管理器最小化的状态）
+            selector.showFullScreen()
+            selector.raise_()
+            selector.activateWindow()
+            print(f"区域选择器已显示，耗时 {(time.perf_counter() - start_time) * 1000:.1f} ms", flush=True)
         except Exception as e:
             print(f"显示区域选择器时出错: {str(e)}", flush=True)
+            if self.selector is not None:
+                self.selector.releaseScreenshot()
             # 出错时也要确保主窗口恢复
             self.forceRestoreWindow()
     
@@ -277,87 +414,149 @@ class MainWindow(QMainWindow):
         print(f"主窗口接收到选择区域: x={x}, y={y}, width={width}, height={height}")
         # 保存选择的区域坐标到配置文件
         self.config_manager.save_selected_area(x, y, width, height)
+        # 截图引擎改为截取新的区域
+        self.capture_engine.set_region(x, y, width, height)
         # 更新界面显示
         if hasattr(widgets, 'lineEdit_2'):
             widgets.lineEdit_2.setText(f"选择区域: x={x}, y={y}, width={width}, height={height}")
+        self._finishRemoteAreaSelection({"success": True, "message": "区域选择完成",
+                                         "area": {"x": x, "y": y, "width": width, "height": height}})
     
     # 鼠标轨迹跟踪方法
     def trackMouseMovement(self):
         print("开始跟踪鼠标轨迹...")
-        # 隐藏窗口
-        self.setVisible(False)
-        # 让窗口立即隐藏，确保处理完成
-        QApplication.processEvents()
-        time.sleep(0.1)  # 短暂延迟确保窗口已隐藏
-        # 立即显示跟踪器
-        self.showMouseTracker()
+        # 隐藏窗口，窗口真正从屏幕上移除后再显示跟踪器
+        self.visibility.hide_then(self.showMouseTracker)
         
-    def showMouseTracker(self):
-        print("显示鼠标跟踪器...", flush=True)
-        try:
+    def mouseTracker(self):
+        """返回常驻的鼠标跟踪器，第一次调用时创建并连接信号"""
+        if self.tracker is None:
+            from mouse_tracker import MouseTracker
             self.tracker = MouseTracker()
             # 连接信号
             self.tracker.trackCompleted.connect(self.onTrackCompleted)
+            self.tracker.trajectoryCompleted.connect(self.onTrajectoryCompleted)
             # 连接关闭信号
             self.tracker.trackerClosed.connect(self.forceRestoreWindow)
-            
-            # 设置属性以防止跟踪器关闭导致整个应用程序关闭
-            self.tracker.setAttribute(Qt.WA_QuitOnClose, False)
-            
-            # 显示跟踪器
-            self.tracker.show()
-            
-            # 确保在跟踪器销毁时恢复主窗口
-            self.tracker.destroyed.connect(self.forceRestoreWindow)
+        return self.tracker
+        
+    def showMouseTracker(self):
+        print("显示鼠标跟踪器...", flush=True)
+        try:
+            start_time = time.perf_counter()
+            tracker = self.mouseTracker()
+            # 主窗口已经从屏幕上移除，先截取桌面再显示，覆盖层映射时截图已经就绪，showEvent 中不再截图
+            tracker.loadScreenshot()
+            # 显示跟踪器（showFullScreen 同时清除被窗口管理器最小化的状态）
+            tracker.showFullScreen()
+            tracker.raise_()
+            tracker.activateWindow()
+            print(f"鼠标跟踪器已显示，耗时 {(time.perf_counter() - start_time) * 1000:.1f} ms", flush=True)
         except Exception as e:
             print(f"显示鼠标跟踪器时出错: {str(e)}", flush=True)
+            if self.tracker is not None:
+                self.tracker.releaseScreenshot()
             # 出错时也要确保主窗口恢复
             self.forceRestoreWindow()
     
-    def forceRestoreWindow(self):
-        print("强制恢复主窗口...", flush=True)
-        # 确保程序没有被销毁
-        if not QApplication.instance():
-            print("错误：应用程序实例不存在！", flush=True)
-            return
-            
-        # 确保窗口可见且活跃
-        QTimer.singleShot(100, self._delayedRestore)
+    def prewarmOverlays(self):
+        """预先创建隐藏的区域选择器和鼠标跟踪器（含原生窗口），第一次点击时不再承担创建开销"""
+        start_time = time.perf_counter()
+        for overlay in (self.areaSelector(), self.mouseTracker()):
+            overlay.ensurePolished()
+            overlay.winId()
+        print(f"覆盖层窗口已预先创建，耗时 {(time.perf_counter() - start_time) * 1000:.1f} ms")
     
-    def _delayedRestore(self):
-        print("执行延迟恢复...", flush=True)
-        
-        # 将窗口标记为有效
-        if not self.isVisible():
-            print("窗口不可见，正在恢复...", flush=True)
-        
-        # 如果窗口处于最小化状态，需要先恢复
-        if self.isMinimized():
-            print("恢复最小化窗口...", flush=True)
-            self.showNormal()
-            QApplication.processEvents()
-            
-        # 确保窗口的正确状态
-        self.setVisible(True)
-        
-        # 取消最小化并激活窗口
-        self.setWindowState(self.windowState() & ~Qt.WindowMinimized | Qt.WindowActive)
-        self.raise_()
-        self.activateWindow()
-        
-        # 更新界面
-        QApplication.processEvents()
-        
-        # 再次提升窗口以确保在前台
-        QTimer.singleShot(100, lambda: self._finalRestore())
+    def forceRestoreWindow(self):
+        """恢复主窗口到前台；同一次操作中多次调用只会恢复一次"""
+        self.visibility.restore()
         
-    def _finalRestore(self):
-        print("执行最终恢复...", flush=True)
-        # 确保窗口位于最前方
-        self.raise_()
-        self.activateWindow()
-        self.show()  # 确保窗口显示
-        print("主窗口已恢复!", flush=True)
+    def handleCommandLine(self, args):
+        """
+        执行命令行参数对应的操作
+
+        参数:
+            args: parse_command_line() 的结果
+
+        返回:
+            (success, message) 或 Future，供单实例服务回复
+        """
+        if args.select_area:
+            return self.onRemoteSelectArea({})
+        # 截图和宏在主窗口隐藏后执行，截图区域里不会出现本程序的窗口
+        if args.capture:
+            output = os.path.abspath(args.capture)
+            return self.runWithWindowHidden(lambda: self.job_service.capture_region({"output": output}))
+        if args.macro:
+            if args.macro.endswith(MACRO_FILE_SUFFIX):
+                macro_args = {"file": os.path.abspath(args.macro)}
+            else:
+                macro_args = {"name": args.macro}
+            return self.runWithWindowHidden(lambda: self.job_service.run_macro(macro_args))
+        self.forceRestoreWindow()
+        return True, "已激活主窗口"
+
+    def runWithWindowHidden(self, action):
+        """
+        隐藏主窗口，窗口从屏幕上移除后执行 action，完成后恢复主窗口
+
+        参数:
+            action: 无参数的函数，返回 (success, message)、回复字典或 Future
+
+        返回:
+            Future，结果为 action 的结果
+        """
+        future = Future()
+
+        def finish(result):
+            if not future.done():
+                future.set_result(result)
+            self.forceRestoreWindow()
+
+        def outcome(done):
+            if done.cancelled():
+                return False, "任务已取消"
+            try:
+                return done.result()
+            except Exception as e:
+                return False, f"{type(e).__name__}: {e}"
+
+        def start():
+            try:
+                result = action()
+            except Exception as e:
+                result = (False, f"{type(e).__name__}: {e}")
+            if isinstance(result, Future):
+                # 任务在执行器工作线程中完成，回到 GUI 线程再恢复窗口
+                result.add_done_callback(
+                    lambda done: QTimer.singleShot(0, self, lambda: finish(outcome(done))))
+            else:
+                finish(result)
+
+        self.visibility.hide_then(start)
+        return future
+
+    def onInstanceActivated(self, args):
+        print(f"再次启动的实例转发了命令行: {args.get('argv')}")
+        # 只激活时恢复主窗口；截图、宏和区域选择会先隐藏主窗口
+        return self.handleCommandLine(parse_command_line(args.get("argv") or []))
+
+    def onRemoteSelectArea(self, args):
+        """通过主窗口选择区域（与按钮相同的流程），选择完成后回复"""
+        if self._remoteAreaFuture is not None and not self._remoteAreaFuture.done():
+            return False, "区域选择器已经打开"
+        self._remoteAreaFuture = Future()
+        self.selectScreenArea()
+        return self._remoteAreaFuture
+
+    def _finishRemoteAreaSelection(self, result):
+        if self._remoteAreaFuture is not None and not self._remoteAreaFuture.done():
+            self._remoteAreaFuture.set_result(result)
+
+    def onTrajectoryCompleted(self, trajectory):
+        print(f"主窗口接收到完整鼠标轨迹: {trajectory}")
+        # 保存完整轨迹，回放时可以重现真实的手势
+        self.config_manager.save_mouse_trajectory(trajectory)
         
     def onTrackCompleted(self, start_x, start_y, end_x, end_y):
         print(f"主窗口接收到鼠标轨迹: 从 ({start_x}, {start_y}) 到 ({end_x}, {end_y})")
@@ -375,6 +574,29 @@ class MainWindow(QMainWindow):
     # BUTTONS CLICK
     # Post here your functions for clicked buttons
     # ///////////////////////////////////////////////////////////////
+    def loadPage(self, name):
+        """
+        返回指定页面，延迟创建的页面在第一次调用时才创建
+
+        参数:
+            name: 页面的 objectName
+
+        返回:
+            页面 QWidget
+        """
+        if not widgets.isPageBuilt(name):
+            start_time = time.perf_counter()
+            widgets.ensurePage(name)
+            if name == "widgets":
+                # QTableWidget PARAMETERS
+                widgets.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            print(f"页面 {name} 创建完成，耗时 {(time.perf_counter() - start_time) * 1000:.1f} ms")
+        return getattr(widgets, name)
+
+    def showPage(self, name):
+        """切换到指定页面，页面尚未创建时先创建"""
+        widgets.stackedWidget.setCurrentWidget(self.loadPage(name))
+
     def buttonClick(self):
         # GET BUTTON CLICKED
         btn = self.sender()
@@ -394,13 +616,13 @@ class MainWindow(QMainWindow):
 
         # SHOW WIDGETS PAGE
         if btnName == "btn_widgets":
-            widgets.stackedWidget.setCurrentWidget(widgets.widgets)
+            self.showPage("widgets")
             UIFunctions.resetStyle(self, btnName)
             btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet()))
 
         # SHOW NEW PAGE
         if btnName == "btn_new":
-            widgets.stackedWidget.setCurrentWidget(widgets.new_page) # SET PAGE
+            self.showPage("new_page") # SET PAGE
             UIFunctions.resetStyle(self, btnName) # RESET ANOTHERS BUTTONS SELECTED
             btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet())) # SELECT MENU
 
@@ -437,9 +659,21 @@ if __name__ == "__main__":
         
         app = QApplication(sys.argv)
         app.setWindowIcon(QIcon("icon.ico"))
+
+        # 创建窗口之前先占用单实例地址：与本进程同时启动的另一个实例只有一个能监听成功
+        from job_server import JobServer
+        job_server = JobServer()
+        if not job_server.listen():
+            _forwarded = forward_to_running_instance(absolutize_path_options(sys.argv[1:]))
+            if _forwarded is None:
+                print("单实例服务未能启动，也无法连接到已运行的实例，退出")
+                sys.exit(1)
+            print(f"已有实例在运行: {_forwarded.get('message')}")
+            sys.exit(0 if _forwarded.get("success") else 1)
         
         # 创建主窗口并显示
-        window = MainWindow()
+        # 命令行参数在主窗口绘制、后台服务创建完成后执行
+        window = MainWindow(parse_command_line(sys.argv[1:]), job_server)
         
         # 防止应用程序意外关闭的安全机制
         def handle_exception(exc_type, exc_value, exc_tb):
@@ -454,8 +688,7 @@ if __name__ == "__main__":
         def custom_quit_handler():
             print("拦截到退出请求！")
             # 不执行退出操作，而是确保主窗口可见
-            if hasattr(window, '_delayedRestore'):
-                window._delayedRestore()
+            window.forceRestoreWindow()
             return
             
         # 替换应用程序的退出函数
@@ -464,6 +697,10 @@ if __name__ == "__main__":
         
         # 运行应用程序事件循环
         exit_code = app.exec_()
+        job_server.close()
+        if window.config_manager is not None:
+            # 把后台尚未写入的配置写完
+            window.config_manager.close()
         print(f"应用程序正常退出，退出码: {exit_code}")
         sys.exit(exit_code)
     except Exception as e:
@@ -14,13 +14,14 @@
 #
 # ///////////////////////////////////////////////////////////////
 
-# MAIN FILE
+# IMPORTS
 # ///////////////////////////////////////////////////////////////
-from main import *
+from . app_settings import Settings
 
 # WITH ACCESS TO MAIN WINDOW WIDGETS
 # ///////////////////////////////////////////////////////////////
-class AppFunctions(MainWindow):
+# 方法的 self 是 MainWindow 实例，以 AppFunctions.xxx(window) 的形式调用
+class AppFunctions:
     def setThemeHack(self):
         Settings.BTN_LEFT_BOX_COLOR = "background-color: #495474;"
         Settings.BTN_RIGHT_BOX_COLOR = "background-color: #495474;"
@@ -30,6 +31,8 @@ class AppFunctions(MainWindow):
         """
 
         # SET MANUAL STYLES
+        # widgets 页面是延迟创建的，设置样式前先创建
+        self.loadPage("widgets")
         self.ui.lineEdit.setStyleSheet("background-color: #6272a4;")
         self.ui.pushButton.setStyleSheet("background-color: #6272a4;")
         self.ui.plainTextEdit.setStyleSheet("background-color: #6272a4;")
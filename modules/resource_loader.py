@@ -0,0 +1,51 @@
+import os
+import sys
+from PySide6.QtCore import QResource
+
+# 由 build_resources.py 生成，只包含界面实际引用的图片
+RESOURCE_FILE = "resources.rcc"
+
+_registered_path = None
+
+
+def resource_path():
+    """
+    返回二进制资源文件的路径
+
+    打包后的程序（cx_Freeze）放在可执行文件旁边的 modules 目录下，源码运行时与本模块同目录。
+    """
+    if getattr(sys, "frozen", False):
+        return os.path.join(os.path.dirname(sys.executable), "modules", RESOURCE_FILE)
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), RESOURCE_FILE)
+
+
+def register_resources(path=None):
+    """
+    注册二进制资源文件，注册后即可通过 ":/icons/..." 路径访问图片
+
+    Qt 会直接映射该文件，不需要像 resources_rc.py 那样在 Python 中解析整个字节串。
+    重复调用不会重复注册。
+
+    参数:
+        path: .rcc 文件路径，默认使用 resource_path()
+
+    返回:
+        是否注册成功
+    """
+    global _registered_path
+    if _registered_path is not None:
+        return True
+    path = path or resource_path()
+    if not QResource.registerResource(path):
+        print(f"注册资源文件失败: {path}，请先运行 python build_resources.py")
+        return False
+    _registered_path = path
+    return True
+
+
+def unregister_resources():
+    """注销已注册的资源文件"""
+    global _registered_path
+    if _registered_path is not None:
+        QResource.unregisterResource(_registered_path)
+        _registered_path = None
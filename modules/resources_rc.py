@@ -1,34150 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.0.2
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x07b\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:05-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:05-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:c7fb928b-ba98\
--2a47-aab7-32bd9\
-e5735ca\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:af1dca07-dd5d-b\
-240-88be-8127d81\
-b0db7\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:dd25d94\
-b-10f5-ba48-b573\
--f065a617833d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:dd25d94b-10f5\
--ba48-b573-f065a\
-617833d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:c7\
-fb928b-ba98-2a47\
--aab7-32bd9e5735\
-ca\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:05-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>a,\
-\x99\x82\x00\x00\x01\x17IDAT8\xcb\xad\xd3\xb9J\
-\x83A\x14\x05\xe0\x89\xa5O\xa0U\xd4XX\x88\x16A\
-\x5c\xc0\x05\x1bK\x1b\x15\xc1\x0d5\x9a(\x82K\xe1\xb3\
-X\x08F4\x82\xfb\xf6:\x16V_\xef\x13\xc4\xe6\x06\
-~DQ\x12\x8b\xc3\xb93\xf7\xce\xb9g.3\x09\xb9\
-@\xca\xc4\xbf!\xa1\x0d\xb9\x14\x8b\xa6\x910\x8bW<\
-\xe0\xf1\x8fx\xc2\x05\x0a)\x0e\xbe`\x01\xdb\xd8@\xe9\
-\x07\xde\xc2&V\xf1\x86\xbd\x84k\xccc\x11\xc5H\xfe\
-\xc6\x838\xc1a\xc2Mt\x18E\x01\x13\xdfpOf\
-=\x89^\x5c\xe2\xa0!P\x8e\xa1\x1cc\x08\x95\x10l\
-p\x19#q\xc5\xe9\xa8\xbd\xc7\xfeW\x81\x19tc\x18\
-\xf98\x94\xcf\xb8\x18G_\xd4\xdee\x1d\xacc'\xba\
-\xad\xe1\x19\xb5\x98\xf4\x13\xfa\xb1\x1b\x82eL\xa1\xda\x10\
-\xb8\xc52\x06\xa2{1\xac\xae\xc4\xc06\xd1\x811t\
-E\x93\xce\x108J8\xc7;N\xc3\xcd\x15\xce\xa2\xa0\
-\x1a\xf1M8\xba\x8e|\x0d\x1fXJ\xa1Z\x8a+T\
-\x82w\x83\x1bq%\x93\xaf\xc4\xde\x1c\xda\xff\xe5)\xe7\
-\xe2c4\x83\x94\xea\xf5zKhY\xe0\x13$%\xfc\
-x\x14uD8\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07g\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:25-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:25-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:e0d5d3dd-3ff2\
--f743-bb6d-820cc\
-b4f1257\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ac1de974-550c-1\
-e4e-9795-bd083fb\
-89d5c\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a8265d5\
-a-45dc-b04f-ba6c\
--d68162a03ead\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a8265d5a-45dc\
--b04f-ba6c-d6816\
-2a03ead\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:e0\
-d5d3dd-3ff2-f743\
--bb6d-820ccb4f12\
-57\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:25-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>5\xb8\
-x6\x00\x00\x01\x1cIDAT8\x11\x95\xc1\xb1j\
-\x93Q\x18\x00\xd0s\xaf_\xa0\x01\x85\x88\xef\xe0\xe6\xd4\
-\xadP*\xe2\x22\xb8\xb8\xf8\x12\x8a\xc5\xb5\xd4\xc5n]\
-\x5c\x9c\xfb\x00v(B\x1f\xc2>B\x07\x07\x87\x06D\
-\xd0)\x85Dr?\x85+\xa4?\xa1\xd2\x9e\x13\xd3\xe9\
-\xd4\x15\x15\xbbx\x8c9\x0a\x8a\xa1D\xc1\x0c\xefCW\
-\xd10\xc1k|\xc29\xc6HC\x05s\xec\xe1Y\xe8\
-\x9a\x95_\xf8\x88\x0b\xff\xb7\x83\x08TL0GE\xc5\
-\x04\x17\x084C\x05K\x8c\x91\x817x\x85ox\x8b\
-\x05R\xb7D\x1a*VJ`\x07\xc7\xf8\x80\x11FH\
-7\x14\x98\xe3\x1c?\xf0\x00\xd5-\x04\x0a\xc6\xba\x8at\
-\x0b\x81\x82\xd4\xa5.t#4+E\xf7\x1b\x05\x19\xd6\
-5|\xd7-\x5co\x86\x1a\xd6\xdd\xc5;|\xc5\x06R\
-WQ\xd0\xb0\xc06\xceB\x97\xba\x9f8\xc4\x13<B\
-E\xa2b\x86%\xee\xe9N\xf19\x90\x86\x8epd\xdd\
-C\xdc\xc7\x99+\x02\x05\x0b]s\xbd\x97\xd8\xc4\x0b\xdc\
-A\xa2\x05.\xb1\x8f\xa7\xd8\xb0\xae\xe0\x12[8\xd5%\
-\x9a\xbf\x02\x07x\x8e@\xa2\x18JT|\xc1\x89\xae\xf9\
-\xe7\x0f\xb3\xa3J\x9cUi&i\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07\x95\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:21-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:21-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:efcad239-3e61\
--6646-995c-502e8\
-7418f5d\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:8b5f17d8-d06c-9\
-c49-b507-4f3d9a9\
-671bd\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:2e8c398\
-c-af83-3447-81a9\
--c8c107f548d8\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:2e8c398c-af83\
--3447-81a9-c8c10\
-7f548d8\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ef\
-cad239-3e61-6646\
--995c-502e87418f\
-5d\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:21-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>i\xf1\
-n}\x00\x00\x01JIDAT8\xcb\x8d\xd3\xcb+\
-\x05a\x18\xc7\xf1\x999\x1c+\xfe\x01v\xb6\x8a$\xc2\
-F\xca]\xa4\x14\x16l\xed\xfc5J\x1d;Qr\xc9\
-m%\x22\xf7X\xf9\x0b\x5cR\x13\xb9\xfe\x03\xe2\xfb\xd6\
-\xef==\xbd\xcd\xc4\xe2s\xce\xf3\xcc3\xef\xcc\xf3^\
-&J\xd34\x0a\xc49qV\x1e\xe5\x0dv\xff\x89\xe2\
-\xf0\xbf\xc2\xdeo\x07'&\xde\xc4\xae\xc9\xfd\xa0\x02\xce\
-\xb0\x18v`\x07o\xe3\x08[XA\xb5y\xc8\x056\
-p\x80yT\x86\x83wp\xa9x\x00?hR~\xad\
-\xce\x5c<\xa3Z\xbd\x9d\x82{\xe3\xb9\xe26\xbcb\xc4\
-\x0c^W<\x8a\x17\xf4\xfa)\xb8\x0eVq\xaa\x1bZ\
-4xR\xf9\x89\xdav\xf1 \x9e1\xec\xa7\xee~J\
-\xb8\xd7\x85Z|cV\xf91\xae\x147\xab6\xae\xbc\
-\xe8;\xe8\xc2\x03\xa6T(\xa9\x9b\xa2\xde\xf4\x88~\xd5\
-\xd6\xb0\xaf\xdd(w\xe0t\xe0\xcb\xb4\xbd\x84[\xc5}\
-\xaa\xf5(\xdf\xd3n\xc4\xbe\x03\xbf\xc7\x9d\xf8\xc4\x84\xf2\
-\x05\xdc\xa0\x0aC\xf8\xf0\x0b\x87e\x1c\xa2&<(\xed\
-z\xdb\x18\xa6\x157\xaa\xe6\xae\xbd\xa3\x1bsxC]\
-\x94q\xda\xfcC\x9e\xb4p\xe5\x05\xd3\xb6\xba\xda\x9d;\
-\x03Y\xdf\x82_\x9cVM\xc9\x1e\xb4\x82Y\x93\x86p\
-\x11\xf3\xbe\x89\xe4\xafZ\xd6\x03\xfc\xd7\x18\xff\xa7\xf6\x0b\
-+&\xef\x0e0\xdd\x92\x88\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07`\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:54-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:54-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:91878102-9e6a\
--d248-911a-5879a\
-9949010\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:208606e8-49c5-6\
-d40-8c54-9a366ca\
-cc7b6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:839d35c\
-7-9351-dc4b-9b82\
--c4b7c33f30f7\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:839d35c7-9351\
--dc4b-9b82-c4b7c\
-33f30f7\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:91\
-878102-9e6a-d248\
--911a-5879a99490\
-10\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:54-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xa5\x97\
-\xb3\xae\x00\x00\x01\x15IDAT8\x11cx\xf6\xec\
-\x19\x03\x0e\x1c\x00\xc4\x0b\x80x\x09\x10'\xe3R\x87.\
-\xc0\x08\xa5\xeb\x81\xf8)\x10\xd7\x02q!\x10\xdf\x04\xe2\
-E\x84\x0c`\x82\xd2\xa6@\xfc\x00\x88U\x91\xe48\xa0\
-\x86\x84\xa2\xa9E1\x80\x05J\x97\x00\xf1J(\x9b\x15\
-\x88\xd9\xa1l\x90k\xe6\x13c@\x05\x92s\x19\xf1\x88\
-\xe35`!\x16\x03\xca\x895\xa0\x14\x88\xd7C\xd9\xcc\
-H\xe2M\xd0X\xc1\xe9\x05\x98\xa01\x10\xdf\x06bY\
-$9\x90A\x17\x09\x05\x22,\xd0@\xf44\xb4h\x03\
-\x05\xe0\x0e$\xe73\xe22\x00\x84\xb5\x80\xf8,\x10o\
-\x85F\x1fHl\x0e\x10\xdf\x05bG\xf44\x83\xae\x19\
-\x94h\x9e@mdB\x0b\xb0\xb8g\x100\x19\xdd\x05\
-\xccPN\x024\xf5\xe9aI\x990Z\x0c\x88\xcf\x01\
-q\x07,,\x90\x03d5\x10\x17A\xd9lh\x9a\x19\
-\x91\x12\x94\x17\xd4\x10\xb0\x1c\xb2\xe9 \x03b\xf1d.\
-\x18\xb6\x03\xe2\x13\xd8\x0cX\x05\x8d>P\xee[\x83\x05\
-\xaf\x05\xe2e@|\x06\x88\xaf#\x1b\x80lr\x09\xd4\
-\x1b \x5c\x8c\x86\x91\xc5\x83a\xfa\x00\x82\x8d\xe4\x1f\xbd\
-Y\xa6\x92\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x00\xf8\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
-\x00\x00\x00\x09pHYs\x00\x00\x01\x90\x00\x00\x01\x90\
-\x01!\xf7\xeb~\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x00\x85ID\
-AT8\x8d\xed\x93\xb1\x0d\x83@\x10\x04\xe7^\xf4\x80\
-\x85\x13*q\x03\x88:\x1c\x92B\x07n\xc1\x91\x8bp\
-\xec\xc8\x8d\x90\x10P\xc5\x12\xd8\x01\xa0\x97O\xd6\x87\xfc\
-\x84\xab\xbb\xd1\x05\xb7\x90I\xc5\xf6\x81\xa4\x13\xd0\x03\x95\
-\xb3;\x0173\x9b\xd7a\x11\x19\x1c\x80\x06x9\xc2\
-\x16\x08@\xe7\x09k\xe0mf\xd7_6I\x8f\xef\xec\
-\x86\xe0\x5c\xf17Yx\x04a\xec\x0fG\xa0\x91tw\
-v/\xc0s\x1f\xc6\xaaW\xf2\xa9\xde\xd9\x11F\xab\x97\
-Ig\x01Tv\x19\x17\xday\x9b_\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07\xba\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:20-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:20-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:d10713ac-755a\
--c047-9762-615b4\
-48361cc\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:97785eb8-7e33-2\
-847-9ef8-68098cb\
-47876\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:4f432ee\
-e-6cf2-2d43-935b\
--e9d83654a322\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:4f432eee-6cf2\
--2d43-935b-e9d83\
-654a322\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:d1\
-0713ac-755a-c047\
--9762-615b448361\
-cc\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:20-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>2\xc8\
-\xe6\x87\x00\x00\x01oIDAT8\xcbu\xd31H\
-\xd5Q\x14\x06\xf0\xfb\xd4P\x82\xec\x89\xb4\xd9\xd0\x12\x81\
-\xe2P8\x99[\xb3C8<\x07\x97\x827\x08\x91C\
-\x83\x04\x09:5\xd5\xe2\xd0 E8IC\x81(\x0a\
-nn\xe2\x10YJ\x22X\x08\xbf\xd5\xc5\xdd\x96s\xe1\
-\xf0x\x0d\x87{\xef\xff\xde\xf3\x9d\xef\xff\x9d\xef\x14\x94\
-\x88\x9eX\xfb\xd0\xc2{\xac\xe3#V\xf0\xb8\xcb\xdbR\
-?4b\x9d\xc6/|\xc7\x1a\x16\xb1\x84/\xf8\x8d-\
-\xdc\xcd \x19\xed\x05.\xd1N\x95r4\xf1\x01\x7f1\
-VAJ\xaa|\x89G\x09\xbdF\x03\xbd\x09h1\xd8\
-4+\x83\xbe\xa0\xdd\xee\xf8\x9d\x9e.,\xfac\xfd\x8a\
-w\x15\xa0\x85\xa3\xb8x\x82m\x0c&\x90\x0a\xf8\x16\xab\
-\xb1\x7f\x88\x13\x0c\x95P\xfbS\xaa\xb0\x1e\x80\xf7R\xe5\
-W\xf8\x83\x07q\x1e\xc0!\xa6J$\xbc\xee\xa0\xfa2\
-\xa9]\xb0\x80\xc9\xd8W=\xbe\xe1yI}\xae\x97\x95\
-\xf2}\xccc\x0e7\x92G*\xe8\x0eZ\x05\xcb!J\
-I\x0f\xdb\xb8\xc2u\xc41FS\xf2\xad\x10~\xbc\x04\
-\xb53\xdcI\x02]w\x89\xfd\xd4\x85\xa78@oE\
-\xdc\xc2\xe7\xd8\xcf\xe2\x1c?\xf03\xe28D\x1b\x8e7\
-'x\x96\xad<\x82\x0b\xbc\xf9\x8f\x0bs\xeca#\xcf\
-B5\xcc(N\x83\xcd\x04n&c51\x13\x957\
-R'\x1a\x9d\xd3u;\x1cv\x1a\x03\xb5\x89\xddH<\
-\xa8\xb4\xb3cK\xb7\x11\xc5\x10\xa6\x22a\x16\xe3\x1d\xf3\
-P[]\xfe\x01\xa0}\xf8\xb1\x13\xfca\x0b\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07\x84\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:32-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:32-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:aeea8c60-320c\
--1345-8525-cb5d8\
-9b01a53\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:be88146f-19c7-c\
-a42-acbe-6597905\
-4f9e6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:0d93abf\
-3-8eff-8649-b93a\
--d9a52d7cdc26\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:0d93abf3-8eff\
--8649-b93a-d9a52\
-d7cdc26\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ae\
-ea8c60-320c-1345\
--8525-cb5d89b01a\
-53\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:32-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>3\x96\
-\x1c\xec\x00\x00\x019IDAT8\xcb\x95\xd3=/\
-DA\x14\xc6\xf1;\x08+$H\x84\x8eP\xd2yK\
-\x88\x82B\xeb\xab\xecR\xe8\x14\x82JD+\x12\x89B\
-\xbc-\x05\x85F!\xd1X\xa2Yo\x05B(\xee7\
-P\xf3\x1fy\xae\x1c\x93Y\xa2\xf8e\xee\xcc\x9d9s\
-\xce\xdc;I\x9a\xa6I\xa0*2VQ8P\xad\xb6\
-\x15C\xe8\xaf`\x00\xbd~\xbe]\x5c\xa3\xb6\x07\xcfx\
-\xc0-n\x8c;\xdc\xe3\x1a\xef\x98\x0c\x17w\xe2\x0d3\
-f\xbc\x11\xf5h@\xad)\xf3\x00\xd36\xed6<a\
-N\xfd\x11t\x07\xe7\xd2\x82\x09=\xef \x9f\x98\x17>\
-\xc5%SR\x01\xaf\xe8R?\x87+\xac\xa9_\xf4s\
-\x12\xa5V\xc2z\xe40\x17\xf0\xa8s9\xc5\xae\x99\xb3\
-\x97\x05\xd8\xc0\xb1\x06\x9d\xd8 \xb3\xf8\xc0\xb6\x99\x93(\
-\xd8W\x80)\x94\xd1n\x16:\x93\xf6\xa1\xca;GG\
-,\x03oE\x9f\xa7\xc9\xec\xd2\xac\xd2\x8a\x1a\x9b\xc7\x8b\
-\xca\xf9q\x06\x99U\x5c\xea\xb3\xf9\xfe\xa2Y\x9cY\xc6\
-\x96\x9e\xf7\xb3\x00\xceL\xf0u\x9e\xfd\xf1K\xd7\xa9\xdd\
-\xb4\x19\xd8 G8\xc1 \xc60nZo\x14\xc3*\
-\xaf\x10\xbbDN\xd1\xcb:\xb8\x92qa\xf8\x7f\xa2/\
-L\xcf\xfd\xe7&\xc6n\xa3\xcd\xc6\xfd\xe2{\xb3O\xbb\
-\xbf\xf1\x056\xe7\x0d\xa3\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\x9e\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:42-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:42-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:43a218b7-2aa5\
--a847-93eb-2f4bf\
-d8f1ff8\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e43250fb-c8d2-8\
-c4f-a9c8-6a26c4c\
-d9398\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:aebad1f\
-1-0f6b-da40-af2b\
--903712f619a4\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:aebad1f1-0f6b\
--da40-af2b-90371\
-2f619a4\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:43\
-a218b7-2aa5-a847\
--93eb-2f4bfd8f1f\
-f8\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:42-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>z\xbe\
-\xa0\x99\x00\x00\x01SIDAT8\xcb\x8d\xd2;(\
-\x85a\x1c\xc7\xf1\xf7\xbc\x8e\x81\xc1\xa5t\x18\x5cb0\
-(\x83\x92A\xb9o\x92\x92r)\x93\xa2X\x0f\x93\xdd\
-dTLR\x86CY1(\x13\x12\xe5Z\xca-Q\
-^\x83\xc4f\xe4\xfb\xe4\xf7\xd4\xe3q\xde:\xa7>\xbd\
-\xff\xf3\x5c\xfe\xcf\xed\x1fDQ\x14\xc4H`\x12\xdd\xce\
-\xff\x7f\xe3\xb2M\x0c\xf5\x9d\xc7=n\xd1\x15\x97$\xdb\
-\xaa\xe6[\x8d'\x94`\x1a\xbb\xb9&\xb0\xab\xb7\xe0\x5c\
-q'NrM\x90\xafo\x03\xce\x14\xf7\xe0Pq\xd2\
-O\xe2\xae\x1c:\x1d\xe3:\x7f\xa0\xf3\xbf\xa2\xca\xe9\xcf\
-\xb3\x89\xfc\x1dt`\x1b/z\x01\xd3V\x8a%<c\
-\x11u\xfe\x0e\xcc\xca\xad\x9ax\x8d9\xad\xe0'7\x17\
-\xbb\x82\x07,\xdb\x1d\x99\x8e\x11\xbcaV\xd9k\xd0\x87\
-^MLa\x18m(G3\xd6\x94(e\x06\x0c\xe2\
-\x1d[8\xc21\xeep\xaa\x04\xed\xf8P\xbbi\xdb\xc3\
-\x01nP\x16\xe8\xad\x87\xd0\x8fFm\xbf\x1eW\x8a\x07\
-4\xc9\x8c\xad\xd0\x13\x8f\xaaB\x13qe\x5c\x88K\x14\
-a\x02\xebq%\xef>KRq%\x16\xf0\x85bU\
-\xe2'\xc6P\xe0\x8c\x0f\xdd\x04\xb68j\xa3\xdf_F\
-\x97e\x8b\xc7\x1c\xf1\x02;~E\xfa%\xdc\x84o\xac\
-\xca&6\xf4l\xfbx\x8cK`\x99-O!\xadg\
-M;\xf1\x8c.\xf4\xcf\x9c\x1fD\xa8\xedO\xa8\xf7_\
-\xdc\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x85\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:56-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:56-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a84497ed-8437\
--574d-bd16-68cc5\
-bd88477\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:19f87962-89c1-b\
-a46-be2d-89e7bb3\
-ecdb8\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:6f74bc2\
-2-7a12-5047-becc\
--a4088957600b\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:6f74bc22-7a12\
--5047-becc-a4088\
-957600b\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a8\
-4497ed-8437-574d\
--bd16-68cc5bd884\
-77\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:56-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x92\xe5\
-\xb5\xce\x00\x00\x01:IDAT8\xcb\x8d\xd3O+\
-EA\x18\xc7\xf19\xe3\xcf\x8d\x85r\xcbV6\xde\x80\
-\x22\xf2\x06\xa4\xd8X\xcbBBw\xa3\xec\xc8M\xca\x8e\
-\xb2\x10+\x1b\x1b\x89H\x16vJV\xc2B\x16H\x22\
-\x8b\xb3\xb0\xf6\x02|\xa7~\xa3\xc7i\xee\xc9\xe2\xd3\x99\
-9w\xe6\x99\xe7<\xf3\x5c\x97\xe7\xb9Kh\xd2\xb3\x17\
-G8\xc6!\xce\xb1\x86,\xae-\xdb\xdc\x85\x17\xeca\
-\x0a\xf3\x98\xc5\xbb\xe6a\x8d/n\xf6zV\xf0\x80\xcd\
-\xc4\x01cxF\xb5\x98\x817\xe3k\xeck\x9c\xe97\
-o\xb2\xbb\xc4\xb4\x0d\x90\x99\xcd'\xb80\xf3,1\x0e\
-k\xe6R5\xd8\xc5\x0d\x9a\x13\x9b\xed\xfcL\xf5\xf8\x13\
-`\x1d\xafh\xd7\xbc\xc3\xa4\x1c7\xb7h|Z\x0c0\
-\x83G\xb4\xa1\x13\xf7\xf8\xc0j\xe1f\x9c\xc9\xa0\x16\x03\
-\x84\x93\xbe\xb1\x83\x11|\xa2\x8e-\x1c\x98M\xdd\x98\xd4\
-g~a\xd4f0\xae\xc2\xddbA\xef\x16\xd5\x03U\
-5P\xc8\xf0\x0a\x1b\xe8\x8f\xf5p\x0d:1XQV\
-\x03\xca\xaa'\xb5\xce\x16(j\xd5\xbbe\xa5;\xa8\x9b\
-q\xa6\x1fJ[9^\xe1\x12\xb6\x95\xee]\xa3L\xcb\
-\x02\xd4U\x83a}\x7f\xaa/\x92\x01bK\x0f\xe1\x09\
-o\xe6?\xe1\xff\x13\xc0\x9e\xd4\x87\x89D\x1f\xfc\xfa\x01\
-0\x11\xe3\xb5\xb2\xc3\xf8\xf0\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07\xa0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:47-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:47-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:5c4fb655-3e59\
--604f-afa0-f2885\
-5101ac7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ffed663c-c8be-5\
-141-aea1-0230e44\
-79095\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a29819d\
-1-0d0a-ee41-b735\
--323948188c82\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a29819d1-0d0a\
--ee41-b735-32394\
-8188c82\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:5c\
-4fb655-3e59-604f\
--afa0-f28855101a\
-c7\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:47-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xba\xdf\
-I3\x00\x00\x01UIDAT8\xcb\x95\xd3\xcd+\
-DQ\x1c\xc6\xf1;\x97Fj\xccFJv\xde\xb2\x9b\
-\x85(%\xb1\xb0P\xb2\xb1\xb1\xf4R^\xf2\xb2\xf0\xf2\
-OXH\xecl\xac\x88\x19,\xaclH\x92\x06y+\
-;/eu\x15\xfe\x07\xbe\xbf<\xa7N\xb7\x19\x93\xa9\
-\xcf\x9ds\xe6\x9e\xf3\xdc{\xce\xefL\x10EQ=z\
-J\xe8F\xaf\xc6\x06\x9e\x84]6\xf0\x8es\x5c\xe12\
-&\x8f\x1b\x9c\xa0\x0e+8u!v\xd9\xc7X,\xb9\
-\x98U\xdc\xe2\x00\x87\xa8\xb2\x1f\xb3\x98\xd0\x802\x09\xd5\
-\xb7\xef\x84\xda\xebxQ;\x83o\x0cX'\x87q/\
- (\xd0^\xc3\xb3\x02\x1b\xa2\xdf\xcf\xb0[B\xce{\
-\x033\x8d\xce\x02\x93\xedM\x1a\xf1\x89\x19\xd4 \xe5\x02\
-&5x\x1e_xC+\x96\xf1\xaa\xb7i\xd2\xbd\x11\
-\xd4\xe2\x18\xe9@\x1b2\x84>\xad\xabY}k?\xc4\
-&\xcf\xeaA\x1dxD\xd2:{\x18\xb5\x0e\xce\xb0\xa9\
-A\x83\xa8V\xed?\xb44\xb7\xac6\xdc\xa1\xc2Ua\
-J7\xd2\xb8\xc6\x8e\xfa-z\xb2\x9b\x5c\xee\x05\xdc\xbb\
-\x00\xbf\x0a&\x85\x0b\x1c\xe1\x09s^I\xc3b\x01\xae\
-\x0aI/$\xafM\xf5\xcfC\xc9\x800V\xff@\x13\
-\x13\xb1\xb3\xd1\xee\x07dU\x9a\xe0\x1f2\xfe&\xee\xea\
-\xa0l\xe9\x7fQ\xca\xb6\xf6\xc8\x02*-\xa0\x0bKX\
-\x90\xc5?\xb816\xbe\xdf\x96\xf4\x03\xce\xbe\x05}\xf5\
-\x01j\xba\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x8c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:35-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:35-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:47ca9ca0-ef91\
--8142-b170-01b41\
-984a980\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:6d7bb61d-d62b-f\
-e43-a4bc-cf65626\
-14f95\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:250db0e\
-f-8582-f046-a938\
--6e20d26000b7\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:250db0ef-8582\
--f046-a938-6e20d\
-26000b7\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:47\
-ca9ca0-ef91-8142\
--b170-01b41984a9\
-80\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:35-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>bY\
-\x924\x00\x00\x01AIDAT8\xcb\x8d\xd2\xcd+\
-DQ\x18\xc7\xf1;3X\x08;e\xcf\xc6\xc6J\x84\
-)!e&3C\xe4e\xa1fM6l\xf8\x03,\
-(;\xa5(+\x1bK\xff\xc1d'dV$e\x83\
-\xab\xbcei#\xbeO=\xa7\x9eN\xf7\xdc,>\xf7\
-\xdes\xef\x9c\xdf<\xe79'\x8a\xe3x\x0d\x15Dh\
-\xd0{\x14\x18g\xbdq$\x97Y\xbc\xa3\xa8/\x9b\xb1\
-\x80\x1a.p\x89ct&\x85\xb8\x872>0\x82n\
-\x5c\xa3\x8a\x01\x0cb\x1bO\xc8\xfb!r\xc9\xe9\xa0\xa2\
-?*\xe9x\x1dW8\xd3\xa0%\xdc\xa15\xa9\x02\xb7\
-V)\xfb\x07\xa3\x98\xd40\x99\xf8\x89^\x9cb\xd5\xce\
-\xb1\x0di\xc19v\xb5\x92~\xf3m\x0b\xcb\xd8\xc4^\
-(\xa0\x0dG\xe8\xc2-~1\xe1u}\x1f;\xa1\x80\
-\x0c\x9a\xd0\xa1\xeb\xde\xc0\xa3.E\xbe\xb7\xe3\xc6\xf4(\
-\xe7\x07X\xb2\x0bs\xba+_\x18\xd2\xdd8I:\x07\
-\x96\xdb\x11)\xfd^\x9f\xa5\x82WSI6-\xc0\xaa\
-\x9bI\x8bx\xc3\x98\xf7G\xa9\x01ys\xfa\x1a\xf1\x80\
-o\x8c\x87\x9a\x98fJ\x8f\xb5\x9c\xceg\x14\x5c%\xa1\
-\x09\x19\xbd\xcf\xe3P\xcfEU\xdf\xcdhO\x0ai\x15\
-\xb8\x80\x15\x1c`\xd8,E\xee\xd3xA\xdf\x7f\x97`\
-\xbb\xef\x1a(\xa1=\x7f\xe7\xf6\xe8S(\xd1Y\x8d\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xb1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:47-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:47-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:c8ee79ec-fe12\
--704f-ac3c-d9942\
-2b0f0fd\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:42b54684-bd67-5\
-44f-bacb-60f26da\
-6741f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a039d83\
-4-5ac0-1641-bbae\
--46d2ada45e8b\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a039d834-5ac0\
--1641-bbae-46d2a\
-da45e8b\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:c8\
-ee79ec-fe12-704f\
--ac3c-d99422b0f0\
-fd\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:47-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x14\xd2\
->\xd6\x00\x00\x01fIDAT8\x11\x05\xc1\xbf\x8b\
-\xce\x01\x00\xc0\xe1\xcf\xfb}\xdf;\x06\xd2I)a\xb8\
-Q\x91\xe1,R\x06\xa3\xa4\xa8S\x8c\xce\x8f\xcb\x8e\xe9\
-0\x18\xc9fA\xba\xd1\x89\xc4)\xfe\x85+\xa1\xcb\x8f\
-K\x06\xf4\x8c\xeeO\xe0yB\x08\x03\xc2\x04\xe7p\x1f\
-\xcbx\x82;8\x86\x10\x06\x84B\x18!\x9c\xc4:>\
-\xe2\x11n\xe2\x16\x9e\xe1;V\xb1\x0fa@a@\xb8\
-\x86\xbf\xb8\x82\x10B\x08;\xf0\x10\xbfp\x10a\x08\xe1\
-$6q\x04!\x8c\x11\xc2\x14B\xb8\x8e\x0d\xcc\xa00\
-\xc6:\xae\x22Lc\x84p\x0ag\x11\xa60Fx\x81\
-\x07(\xcc\xe33B\x180F8\x81M\xcc#L\x10\
-\x0e\xe1\x1bv\x86{x\x8a\x10B\x08a\x0e\x7fp\x1a\
-!Lc\x0d\xc7\xc32\x96\x10\xf6\xe35V\xf0\x1c/\
-\xf1\x14\x9f\xf0\x0f\xc7\x11\xc2K\x5c\x0e\x8fq\x17a'\
-\x16\xb1\x80KX\xc0\x05|\xc77\xcc\x22\x84\xb7\xb8\x10\
-n\xe3\x15B\x08!\x84\x1b\xf8\x80\xdd\x08a\x1b\xd6q\
-8\x1c\xc5\x0f\xecB\x98\xc6\x14\xc2\x22~b\x0f\xc2\x16\
-\x84\xd3X\xc3$\x847x\x820`\x8c0\x8b=\x08\
-[\x10\xc2:\x16P\x08{\xf1\x1bK\x08!\x84\x10B\
-x\x8f\x15\x84\xc2\x80p\x00\x1bX\xc5\x1c\xb6\x22\x84\xed\
-8\x83/X\xc1\x04a\x14\xc2\x80\xb0\x03\xf7\xb1\x81\x8f\
-x\x8dw\xf8\x8a5\x5cD\x08#\x14B\x18\x10\xc2\x0c\
-\x8e\xe1\x22\xce\xe3\x10&\x08a\x84\xd0\x7f\x1b\xef\xf1{\
-!jd\xbd\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07{\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:45-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:45-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:41b13989-2537\
--1043-baac-e9eed\
-06e6706\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:7bb976d2-529e-b\
-d45-87ce-abe0812\
-a8192\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:23ec516\
-3-1f52-2b4c-b9a8\
--6c4f4961dc44\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:23ec5163-1f52\
--2b4c-b9a8-6c4f4\
-961dc44\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:41\
-b13989-2537-1043\
--baac-e9eed06e67\
-06\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:45-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>6\x18\
-\xcbj\x00\x00\x010IDAT8\x11\xa5\xc1\xb1j\
-\x14Q\x14\x00\xd0\xf3f\xeeb\xc2\x9a\xd8\x08\xf17\xec\
-l\xac\x04\xc1B,mc\xb1\xa0\x85\xa5E\xc0\x0fH\
- \x04\xb1\xd4\xc6\xceb!\x85\x7f`!\xa2\xe87X\
-\xa4X+\x0bq3&\xd9\xcc\xcd\xc0\x13\xc2\x82H\xd4\
-s\x223\xfd\x8f\x98\xcdf\x06\xeb\x08\xa4\x8b)\xe8\xd0\
-\x056\xf1\x04s\xb48\xf5g\x89\x16G\x98\x04\xee\xe1\
-\x0dv\xb1\x86\xcb\xe8\x91h,+\xaa9^\xe1v`\
-\x81OX\xc75\xbcw1\x07\x06\x81\x16\x89[x\x89\
-g\xd8\xc3W<\xc6U\x9c q\x09_\xf0\x02#\x83\
-P\x15|W=\xc2\x14\x07X\xc5\x1a\x8e\x91X\xc1\xaa\
-*\x0dB\x95\x18\xe1\x1d\xee#q\x03S\xf4(H\xb4\
-8T\x15\x83\xc0)\xae`\x8a}t\xd8\xc1\x1d\x1c\xa1\
-Q\xf5\x18\xe3\x03\x1e\xa07\x08\xf4\x18\xe1\x07\x0a\x0a\xb6\
-\xf1\x1ciY\x83cUc\x10\xaaF\xb5\x82\x0eOq\
-\x17\x87(\xaa\x1ec|\xc4\xa6_\x02\x05\xdfT\x9dj\
-\x0b;\xe8-k1\xc7\x02\x1d\x9a\xc0\x09&\xd8\xc0X\
-\xf5\x13\x0b\x14\xcb\x12\x81\x82\x9bx\x1b\xd8\xc3C\x5cw\
-\xae\xa0\xf8\xbdD\x8b\xd7\xd8\x0f|\xc6\xc4?\x0a\x14\x14\
-\xa4\xbfS\xd0\x9f\x01.\x84Q{[\xfd\xf6)\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xb2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:30-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:30-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:8819feed-c843\
--924c-8156-08322\
-e1479a0\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:2a9f67be-c3d1-0\
-04f-9630-42b8437\
-2e8b7\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:82c0cb3\
-d-a7d1-554c-956e\
--0b649ef7caa8\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:82c0cb3d-a7d1\
--554c-956e-0b649\
-ef7caa8\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:88\
-19feed-c843-924c\
--8156-08322e1479\
-a0\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:30-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x85\x84\
-F\xf8\x00\x00\x01gIDAT8\x11\x05\xc1=k\
-Sa\x18\x00\xd0\xf3\xde<\x9a\xd2 \x82\xe0\xc7\xe0`\
-1\x83\xa2\x1d\x04G\x9d\x1c\x057w\x07A\x5cu\x12\
-\x1ct\xf4#\x93\x8b\x83\x19\x85\xd2\xdf\xa0(N%C\
-W\xa7R\xb1m\x10:\x94\x10\x9b\xd8\xe4\xde\xfbxN\
-\x8c\xc7\xe3\x0a-n\xe3\x19N#Q\x00\x00\x89\x0ev\
-\xf1\x0aS\x08\x14\xc0:\xee\xe05V\x90\x00(\xf8\x87\
-+x\x84\x01\xa6(\x81\x0a\x0d\x8e\xb1\x85!\x00\x00\x00\
-Vq\x0fs@\x09,\x01}\xf4q\x13=\xb4\x00\xa8\
-0G\x1f\x97\xb1\x86#\xb4\x81\xb3\x18b\x1d\x13l \
-\x01\x00P\xd0`\x0f\x9b\xf8\x88\xf7\x81\xe78\x87[\xa8\
-\x90\x00\x00\x80D\x07+X\xc3&\xbe\x06\xae\xe13f\
-\x00\x00\x00\x00\x80\x01\xde\xe2\x1b\xee\x06\x12\x1d\x14\x9cG\
-\x83\x02\x00\x80D\xc1'\xec\xa1\x8bN \x11x\x83\x87\
-\x98 Q\x90(HT\xa8\x90x\x80\x1a\x02\x05\x89\x17\
-\xb8\x81}\xbc\xc4%\xd4(8\xc1u\x0c\xf0\x04\xbf\xd0\
-E\x06\x0a\x8e\xd1\xe0\x00\xbfq\x88C\x00\xc0\x12G\x18\
-\x01\x1a\x08\x9c\xe0\x1dv0C\x0f\xd0\xc5\x12\x15j\x9c\
-A\xe2*\x9e\xe2>\xbe\x07>`\x1b\xfb\x08\xb4\x80D\
-\xa2\x05$*\xfc\xc5\x0fl\xe3K`\x84\x11`\x15\x7f\
-\x00\x0b@\x02f\x80\x096\x00\x02\x15\x02\x0b\xcc\xf1\x18\
-}\xf4\x90\x80\x1a\x17q\x01\x00\xa7P\x07Z,\x00C\
-\xfcD Q\x90\x80\x82\x03L\x01K\xf8\x0f4\xc4m\
-\x1bwip0\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07h\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:50-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:50-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:8678e215-acc2\
--594f-8496-d2d75\
-ba630e4\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:941d0bcd-96fc-1\
-54f-9f59-d5cd0d8\
-6c99e\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:1861f70\
-e-24b8-7745-b5bc\
--de0108b240ed\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:1861f70e-24b8\
--7745-b5bc-de010\
-8b240ed\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:86\
-78e215-acc2-594f\
--8496-d2d75ba630\
-e4\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:50-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xb9&\
-\xf1\xc9\x00\x00\x01\x1dIDAT8\x11\x95\xc1?K\
-Uq\x18\x00\xe0\xe7w|\xa1\x02\x91f\xbfC\xa3\x10\
-\xb8\xd9\xd0\x10\xf8%\x9a\x9aBh*Z\xa3I0\x89\
-\xb6\xa8\xa5\x0f\xe0\xd8$\xd2\xd8\xee\x90\xf3\xb5I!J\
-%\x8f\xe7\xed\xc2\x1b\x1cov\xfb\xf3<1\x99L\xee\
-c\x1d\xa7\xe8\xfc\x9bDb;\xb0\x8e\xc4\x0e\x96\x90F\
-MI\xa5!q\x86'X\x09\x9cb\x07\xef\xfc\x9f5\
-d\xa0\xc3\x92\xf2\x08wp\x8e\xc49:\x04\x1a\x12\x9b\
-\xd8\xc5\xa2\xa90\xeb\x1e\xbe\xe1-V\xb1\x81C<\xc7\
-1\x9e\xe1\x16v\xd1\xd0B\x19\x94\xa78\xc0g\xec\xe3\
-!>\xe1\x85\xb2\x8fc\xe5\xc2T(\xa9|0\xba\x89\
-\x0e\xd7\xb0\x88\x13|4\x1aL\x85\xd2\x94\x05\xe5\x02\x83\
-\x92\xe81`\x01\x89\x01\xcdT\x98\x95\xfel\xf0\x8b0\
-_3\xea\xcc\x11\xaej\xcaW$z\x9c\x98#\xcc\xea\
-\xd0c\x19\xaf\xd1p\x1b\xaf\xf0\x00\x0d\xe9\x92\xf0{g\
-x\x83-\xdc\xc0\x17\xa3\x86\xf4S \xf1]\xe9\x95#\
-\xbct\xd5`\xd4#\x03\x89\xc7X\xc3u$\x1a\xc2(\
-\xd1\xa3)=\xeeb/\xb0\x8d\x15\xa4\xd2\xfc]b\x0f\
-\xef\x7f\x00\x00-R\xb9\xedr\xdc\x22\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07\x92\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:10-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:10-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:51bf25d4-75c4\
--f34d-8c2c-68fc1\
-ec77995\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:d84d529e-7932-d\
-b4c-b2f4-18222b6\
-3f894\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e11338a\
-e-467c-6c42-a9c8\
--90470decaba1\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e11338ae-467c\
--6c42-a9c8-90470\
-decaba1\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:51\
-bf25d4-75c4-f34d\
--8c2c-68fc1ec779\
-95\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:10-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xb1}\
-\xd2\x16\x00\x00\x01GIDAT8\xcbu\xd3\xabK\
-DA\x14\xc7\xf1\xf1\xae\xc1G\x10\xad*\x186\x18,\
-\x06\x83\x96u\x05\x9b\xc1`\x13\x83\x08\x1ad\xc1*\x0b\
-\x82\x1a\xecv\x05A\x10VP\x83A\x0d\xa6]Q\xc4\
-\xe0+\x08b\xf3\x82\xff\x85\xdf\x81\xdf\xc0\xe1po\xf8\
-\xb03sg\xce\x99\xc7\xd9\x90\xe7y0\xba\xf4;\x86\
-=d\xea/\xe3\x18\xa7\xd8\xc6\x80\xc6\xb3\xe0\x02\xa4\x05\
-\xd3\xf8F/\x8e\xf0\x85&\x1a\xb8\xc3;\xaaq\xae\xcf\
-^Q{\x0a\x1d\xedd\x17\xfd.\xd1\x01\xda>\x805\
-\x81\x17\xb7\xb0b\x12\xc4\x9d\xbe\xa1\x96>\x8e\xe0\x1aW\
-8\xc3\x03^\xd1\xe3\x8ef\xef\xa9\x85\x8d48\x14;\
-X\xc4\x8a\xda\xb3&\xa3_\x9c)A\xddG_\xc5h\
-\xc9\xb1\xec\xdc\x1d<\xc6\x80\xf6\xc3\x0d\xee\xed\x13\x95,\
-\xde\xc2/\xc6\xed%\x9e\xe3\xb6`\xab~\xf1\x1a~0\
-i\xeb \x16\xc9g\xc1\xe4\x22\xc3\xe8\xb3\xf3\x82*\xac\
-i\x9e\xca\xef\xa2\xaab\xba\xc4\x09.p\x98\xe6\x04\x95\
-g\xc3\x05\x88\x8b\xbb\xd5\x9e\xc7\x9f.x\x1d\x9bXJ\
-\x89\x82j\xbb\xec\xfc\x83\x0a\xd0);V\xd0\xad\x7f\xa8\
-<3\x13$\xf6\xf71\x83g\xb3\xc3\xcc&\x09\xe6\x9c\
-m\x95gKE\xf2\xa4\xff\xc2\x9c\xc6\x8b^'\xf8[\
-\xaf\xa9\x0a\xebf<\xde\xfcB\xd9\x11\xfe\x01a\xb6\xe4\
-\x81H\x7f\x81:\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\x96\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:47-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:47-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:623c0e2e-5932\
--5641-a10b-bc106\
-8b554c8\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:6880d3cc-a35e-4\
-c46-9509-6e02ed6\
-6cdbf\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:7c996ab\
-8-fa1b-a149-91c0\
--f48baae81a2d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:7c996ab8-fa1b\
--a149-91c0-f48ba\
-ae81a2d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:62\
-3c0e2e-5932-5641\
--a10b-bc1068b554\
-c8\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:47-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xbbb\
-ns\x00\x00\x01KIDAT8\xcb\x95\xd3;K\
-\x1dQ\x14\xc5\xf1\xa3^M|\x5c0\xc1&\x10,\xc4\
-\xc2/\x22\xc4\x0f \x0ab\x1d\xc4V\x844),\x94\
-\x80\x01\xaf\x85\x11$\x0aj\x95\x07\x8a`ab!\xe2\
-\x83H\xb0\xd0\xa8\x85b\xf9\xfb\x0a)\xb5\xd9\x17\x0e\xc3\
-(Z\x0c\x9bY\xb3\xf9\xef5\xeb\xec\x93\x90\x9e\xf84\
-\x94\xe9\x09=X\xc1\x06~\xe2\x07\xb6\xf1\x09\xcd\x98\xc0\
-\xf8C\xa0\x84%\xec`\x18#Q\x87\xb0\x8fo\xe8\xc3\
-\x0d\xa6\xca )&\x0e\x87\xf0\x1e\x8b\xa8\xc6\xfb>\xd6\
-\xf0\x06W\x98-BR\xd8\x1e\xc2 \xce\xb0\x8c\xbd\xac\
-\xf1  ]\xb8\xc0|\x0e\xc9\x1d\x0c\xe0\x1f6#\x8f\
-<\xac\xa3\xc8\xa9\x1aC\x16\xf2_\xd8\xc0h\x08c\x98\
-\x0b\xcb\x09MQ\x1bq\x12\xee\xda\xf1\x17_\xeb\x80\x19\
-\x1c?r|\x8dQ[\xa2\xef3^\xe1\x10_\x12*\
-\x91\xc3\x01^Fs\xa5\x00i\x8e\xda\x87;t\xe2\x1d\
-\xee\xf2\xa6u\x9c\xa2\xa3\xc4~B[d\xf4\x01\xdd\xb8\
-\xc5Xq1\x16q\x8e\xd7\x85\xc9\x09\x7f\xe2\xfb\x0b\x5c\
-\xe2c=\x83\x22\xa4\x86k\xbc\xcd\xb4\xdf\xf8\x9e\x81j\
-\xf91\xe6\x90:h:,\xf6b\x15\xbfB\xdf\x8a\xed\
-Le\x80\x22d\x12\xff\xb1\x8b\xd6\x00\xed\x94m\xe2c\
-7\xaf?\x12o\x8b\xe3\xae\x16\x82M\xcf\xbe\xbeE\xfd\
-\x1e\xce\x9e\xf1\x1a\xcbB\x10\x86\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07\x5c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:20-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:20-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a6daaadf-ae8e\
--704c-94b6-c7e83\
-9842953\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:6d2c535c-c223-e\
-f44-a99d-6e82130\
-3404d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:7f536f5\
-d-5e9a-b94c-9d27\
--da3266602793\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:7f536f5d-5e9a\
--b94c-9d27-da326\
-6602793\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a6\
-daaadf-ae8e-704c\
--94b6-c7e8398429\
-53\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:20-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xb0B\
-b\xe9\x00\x00\x01\x11IDAT8\xcb\xa5\xd3\xcd*\
-EQ\x14\x07\xf0}\x8ekB\x191V\x22\x99\x92x\
-\x06C\xde\xe0\x8e\xc8\x5c\x91\xd7\xe0\x05\x98\xfb\x8c\xe4\x22\
-#O\xa0L}\xfd\xcc\xbc\x81\x8e\x81}j9\x9d{\
-SN\xad\xce^k\xaf\xff\x7f\xad\xbd>\x12R\x90\xb2\
-\xa1\xb7\xc9/\x9f\xfaP\x04c\xd1\x07X\xb4\x91\xc4\x8b\
-\x12\xcb}Hj\xc0\x08\x16\xa2-:\xed\xa3B7\xeb\
-C-)\x1f\xe2\x0bku\xa0\xfab\x0f\x0fX\xc1\x0b\
-6\xb2}8\x80Op\x99\xc1\xafX\xad3X\xcf\x91\
-\xc7\xb3\xe3\x12>\x02I\xc21n1\x9a\xf5n\xc6L\
-&\x8c\xe1\x14G\x01\xb0\xe8\xe7\xdb\xc4\x01\xee\xf3\xfb\x13\
-\xe6\xf0\x84\xadX\x83\x0enp\x16H\xe6\xf1\x89\xeb\x00\
-\x9e\xc9O\xdc\x8d](C\xd1z9\x9b\x9ad\x16\x13\
-\x01\xfc\x86\xed\xb6.\x94\xe1\xdfkd\x920\x8dg\xec\
-4\xdb\xdc\xd6\xeb:\x93\xf3\xacO\xe1=D.\xda&\
-\xb1I\xd2\xc1\x15\xee\xf0\xd8\x88<\x90\xa0Ir\x11\x0a\
-V\xb4\x8dy\xfa\xc3\xdc\x0f\xdc\x91A[W\xfca3\
-S\xaa\xaa\xea_\xf2\x0d4\x18\xdf\x05\x9c\xdd\xa5\xf7\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xb5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:02-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:02-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a7460d46-0d3e\
--f845-b6da-c027b\
-dc5d145\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c76b2025-470f-9\
-e42-b268-892c7e6\
-4c3ca\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e6902de\
-d-60cb-ea44-8c8f\
--67e2eb99982b\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e6902ded-60cb\
--ea44-8c8f-67e2e\
-b99982b\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a7\
-460d46-0d3e-f845\
--b6da-c027bdc5d1\
-45\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:02-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x9f\xe6\
-\xf9?\x00\x00\x01jIDAT8\x11\x05\xc1=\x88\
-\xce\x01\x00\xc0\xe1\xdf\xfb\xfeu!\xcarte9#\
-I\x8a,\x8c\x06I\x0cb2\x88,\x16&W\x8a\x14\
-\x83\x0c\x922\x19\x19\xe4X\x94\x81\xe4{\xd2\xc5@\xe7\
-\xab\x1b\xc43\xc8\xc7d~=O\x08c\x8c\x11B\x08\
-!\x84\x10\xc22\x8cP\x18#\x84\xf5\xd8\x8b\x8b\x98\xc7\
-<\x1e\xe06Na'V#\x84q\x08;p\x0b\xef\
-\xf1\x0b\xffp\x14Kx\x8a9L\xf0\x19\xcfq\x01\xd3\
-(\x9c\xc5\x17\x5c\xc1f,b?6\xe2\x0b\x06\xcc\xe1\
-\x0eV\xe23\x96\xf0\x02\x87\xc2G\x9cF\xb8\x8e{\x18\
-\xe1;\x0e`+\xfeb\x15\xce\xe0\x19\xc2c\xdc\x0f\x87\
-\xb1\x80\x13\xf8\x86U\xb8\x89\xbb\x08\x9fp\x04\x1b\xf0\x1b\
-3\xd8\x8b\xafX\x17\xc2UL\xb0\x0b\xbb\xf1\x03\xe12\
-\x1e!\xbc\xc3)L\x01\xf6\xa1\x10V\xe0-\xe6\xb0\x88\
-=\xd8\x88_X\x83\xb3x\x8d\xf0\x107\x10\x860 \
-l\xc3\x04\xd7\x11\x16q\x0c\xb3\xf8\x83\xb58\x81\x0f\x18\
-\x10F!\x0c\x08\x970\x8f+x\x82\xf0\x16'1\x83\
-\x9f\xd8\x8e0\xa0\x10B\x08\xaf0\xc1r\x9c\xc3+\x84\
-78\x870 \x14B\x18#l\xc2{\x9c\xc6\x12f\
-p\x1e/\x11B\x08\x85\x10\xc2\x80p\x14\x13\x1c\xc4\x16\
-\xfc\xc4,\xc2\x18!\x14B\x08a\x84p\x07\xb7\xf1\x0e\
-\xc7\x11\x06\x84\x10\x0a!\x840F\x98\xc6\x02\xae!\x8c\
-\x10B\x08\x85\x10B\x08#\x84)\x84\x10B\x08\xa1\xff\
-f\xcf\xfc\xfa\xf1\x19\x8a)\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07[\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:23-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:23-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:661047bc-3ffc\
--0b43-9bce-d42e5\
-9f272f3\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ac2b4595-c27f-8\
-341-b14b-6f034b6\
-88d0d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:3b2783d\
-3-3659-644c-b1b1\
--e60d399642fb\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:3b2783d3-3659\
--644c-b1b1-e60d3\
-99642fb\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:66\
-1047bc-3ffc-0b43\
--9bce-d42e59f272\
-f3\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:23-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xfa\xd9\
-~\xff\x00\x00\x01\x10IDAT8\x11\xa5\xc1=J\
-\x5cQ\x18\x00\xd0s\x9f\xd7q\x10\xb1\xb3\x11L\xa7\x85\
-`k\x1b$\x1bH\x93m\xd8\x8b\x85\x85X\x0aq\x01\
-\x0a\xee\xc0\x15$\x95\x85`c\x11l\xc4\xc2\x04\xa6J\
-#\x84$\xa3\xf3>\x1f|\x82\xbc\xc2\x1f\xf0\x9c\x12\x11\
-\xde\xa3\x8eF\xa3\x15\xec`\x1e\x13\x14/k1\xc49\
-v+\x96\xf0\x11;\x18\xa2x^\x83[\xac\xe13\xf6\
-*\x1a\xdc\xe0\xd0\xdb-c\x03Q\xa5\x81\xf4\x05k\x18\
-\xa3\xe8\x0b\x0cp\x8cYL\xe9T}\x8bX\xc5?\x14\
-}\x81!\xe60F\xd1\xa9R+\x1d\xe0\xc0\xeb\xd61\
-\xd1\xa9R#m\xe1\x13\xfe\xa2H\x81\x90f\xb0\x8d[\
-L\xe9T)\xa43\xfc\xc6\x1d\x0a\x0a\xaa'\xd3\xf8\x85\
-\x05\x84N\xd5\xf7\x1d\xdf\xbcn\x09\xadN#\x15i\x1f\
-W\xb8\xc0%N\xb1,Mc \x85GU\x0a\xe9+\
-\x8e\xd0\xa2`\x82\x9f\xd2=\x1a\xa9 t\xaat/\xdd\
-x^`\x22\xfd\xf1\xa8b\x8c\x15\x9c\xa0A\xd1\xd7z\
-R\xf0\x1f\x1f\x10h*~`\x13\xf3h\xbdM\x83k\
-\x8cKDx\x8f\x07\x82\xeaC\xea\xa39&\xdc\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07/\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:44-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:44-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:749262cc-e212\
--e747-9175-dc713\
-d2de1ac\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:45286b6f-9ef8-3\
-a49-b026-8a20d11\
-95b03\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:8a9f690\
-b-0a8f-014d-8c1f\
--9f8376bddeda\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:8a9f690b-0a8f\
--014d-8c1f-9f837\
-6bddeda\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:74\
-9262cc-e212-e747\
--9175-dc713d2de1\
-ac\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:44-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x84\x90\
-\xbe\xb1\x00\x00\x00\xe4IDAT8\x11\xa5\xc1\xb1.\
-CQ\x18\x00\xe0\xef\xdc\x9e\xde6\x0cF\x11\x03\xbb\xc1\
-\xe65,\x06\x12\x8b\xcdd\x96x\x05\x0f\xe0\x0d<\x8a\
-\xbd\xbbX\xe4\xef$i$*\xad\xde\x1eM\x18H\xa5\
-m\xf4\xfbR)\xc5:r\xbf\xdf\xdf\xc76&HV\
-W\xe11\xe3\x02\xe7\x18\xa0F\xb2X\xc1\x07:\xb8N\
-\x11\x91\xd1\xc6\x08S\xab\xa9Qa\x9c1\xc1\x04;8\
-E\x8db^A\x8d'\xdc\xa3\x98\xc9h\xa1\xc1\x16\x0e\
-\xd1\xc5\xd4\xbc\x82.jt02\x93\x22\xc2:2\xae\
-p\x8cW\xb4-W\xd0\xa0\xc6mF\x0f\x09C4\x96\
-K\xc8\xc8xN\x11a\x1d\x195\xc68\xc2\x1d6\xd0\
- \xf9m\x8aM<\xe0\x12C\x94\x14\x11~\xd8E\x85\
-\xe2o\x15\xde\xf0\xe2[\xc6\x01\xf6\xf0\x8e1\x8a\xc5Z\
-\xe8\xa0\x85^\xc6\x09\xce0@F\xb2XA\x83.n\
-RDXG\xf6%\xf9\x9f\xf2\x09\xd0\x93C\x18\xac\xfa\
-)\x19\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x89\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:08-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:08-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6f1aebf4-da92\
--1a48-b9ed-8c4f7\
-6d64a99\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:4ea96d48-3d39-7\
-042-a421-f67502a\
-123bc\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:77e4e07\
-9-f107-9a42-9c69\
--50fc40c65682\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:77e4e079-f107\
--9a42-9c69-50fc4\
-0c65682\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:6f\
-1aebf4-da92-1a48\
--b9ed-8c4f76d64a\
-99\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:08-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>L\x0c\
-\x1d\xdb\x00\x00\x01>IDAT8\x8d}\xd3\xbf+\
-\xc5Q\x18\xc7\xf1\xef\xf7^F\xd7B\xb1\x18\xe8ZM\
-J\x89\xd8)\x9bI\xb7\x90\x94\xb2\xa8[\x06\x92_)\
-\xf9\x952(\x16\x06Qd \xa3\xcd\xa0HIJ\x91\
-\xc1\x19\xe4\x7f\xe0\xfd\xed\xfb<\xf5tz2\xbc\xba\x9d\
-s\xbe\xcf\xe7\xfc\xbcI\x08!qtb\x0dG8\xc4\
-\x0c\x1ad\xac`\xbf\xf5\x8a7\xf0\x81\x03Lc\x16\xd7\
-x\xc7@\x1c\x92D\x1d[xB\xb3\x13<\x84\x1f\xf4\
-K\xbb\xa8\x01Z\xdc-37J\xbb\x06\xa9\x8c\x17\xa5\
-o\x14\x0f\xa6\x9d&\xa6\xb1\x83]SlgO\xe5\xb7\
-\x16\x8f\xe8\xd5\x95\xdb\x8f.1\x12\x15x!'\x98\xb2\
-\x01:p\x86\x09\xef\xa4\xa3\x80s\x8c\xd9\x00]\xee\x22\
-N\xcd\x16\x0a\x86n\xb3\x1eo\xe8\xb0g\xa0\xc9\xad\xf8\
-D\x8f3\xbb\xda\xc4\x95\xed\x8b\xafq\x5cfX\xc0\x12\
-\x96\xb1\x829\xec\xe3\x05m\xb6\xc6\xa6k\xc8\x05\xee\xb1\
-\x8a\xed\x90\xbf\x8du|\xa3\x12\xcc\x1b\x88\x03t+\xc7\
-\x98G\x13\xdaQF\x0bn\xbc[\xb2\x01\x9a\xba\x87_\
-\xdc\xe1\x15\xcf!\x7f<Y__|K^\xc0 \xbe\
-B\xfe\x87\xd2\x1b\xa8JX\xdd\x7f+\xb0\x03U\xb9\x91\
-\xec\xceo\xe5\xf0\xba\xe2\xd9\xbd\x00+\xdb\xff$\x86Q\
-\xf2\x8a3\x7f\xc5\x93\xe5\x0b`\x975\xaa\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07j\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:33-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:33-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:b0e8f204-4085\
--174d-ba83-a693f\
-a440b2e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:3ea6ed66-0459-c\
-14a-9a9f-303c94d\
-4a46d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:24165ef\
-b-e918-0642-9036\
--92038572acaa\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:24165efb-e918\
--0642-9036-92038\
-572acaa\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:b0\
-e8f204-4085-174d\
--ba83-a693fa440b\
-2e\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:33-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xab\xcb\
-\xb0\x88\x00\x00\x01\x1fIDAT8\x8d\x95\xd2\xbf+\
-\xc4a\x1c\x07\xf0\x87\xbb3\xdc\xa2,\x17I\xb9\x92\x92\
-\xc5`\xd3MJQ&\x9b2\xd8\x94]\x99\x15%\xc3\
-\x15vY\xd4\xa5X\x90\x0c2(J\x19I\x89\xd2\xeb\
-\xdf`y\x9ez\xfav\xdc\x19\xde\xf5\xf9<\x9f\xcf\xfb\
-\xfd|~\x05\x84.\xd0\x83R\xbb\xd8\x7f\x895l\xe3\
-\x04}\x7f\x09\xf4F$\xbf\x8e&^\xf0\x81\xd7\x14\xef\
-D\x9c\xc4\x11\xdep\x8aal\xe08\xe5\xa7\xc4b\x7f\
-\x0d\xb4\xf0\x89\x03Ld\xb1\x0b\xac\x16\x05\x12\x16p\x13\
-K\xdd\xc1P!>\x18cciF\x01\x15,\xe2\x12\
-\xcf\xd8\xc4@F*\xa1\x1c\xed9\xdcg~\x08\x98\xc2\
-7\xaeP\xcd\x88\x95\xb8\x854\x9b\x10\x07\xd9\xcc\xdb\x0e\
-\xe8\xc7:\xae\xf1\x80-\x8c\xb7Yg\xc0\x1d\x96\x8b\x02\
-\x09e\xcc\xe3\x0c\xef\xd9O\x89\x5c\x8f-\x8e\xe4\xef9\
-9\x17\xab\xc7]\xafeo+\xb8-\x88\xb6\xbd\x83J\
-\xb4g\xf0\x85\xd1\xe8\x1fb\xaf0\x93_/1U\xb4\
-\x8f\xf3h?b\xb6[\x81Tb\x15O\xd8\x8d\x03\xae\
-uj!G\xba\xceF\x5cs\xabH\xee$\x90'/\
-a\xba\x9d\xc0\x0f5\x9e\xdbz]\xf2PO\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07{\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:03-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:03-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:69cd4846-1360\
--6c4b-92ef-adc23\
-0cf5c6f\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:b8db7e1f-71cf-a\
-e40-9ac7-f4b261b\
-7530b\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e998360\
-1-4f01-a84e-8777\
--71a6b942eeb4\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e9983601-4f01\
--a84e-8777-71a6b\
-942eeb4\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:69\
-cd4846-1360-6c4b\
--92ef-adc230cf5c\
-6f\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:03-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xff\xa4\
-\x80\xf1\x00\x00\x010IDAT8\x11\x8d\xc1\xb1K\
-\x94a\x1c\x00\xe0\xe7\xfd\xfa}\x9ce\xe0\x14\xe4\x16B\
-J\xb8;\xb45X\xffA\x7fB\x93\x10\x84\xb3-\xd1\
-\xd0VP\xd0\xdc&\x82[S\xd4\xd0\xae\xa3S[\x1c\
-\x19.\xa6$w\xdc\xbdo\xc1+\x9c\x9f\xe7E\xcf\x13\
-\xfd~\xdf\x05\x09\xf7p\x1bc$WK8\xc1^\xa8\
-\x12\x0a\x96\xf0\x09\xdf1F\x83bZ\xc6\x12\x9e\x04\x12\
-Z\x0c\xb1\x88\x01\xeec\xe4\xdf\xb6q7P0T\xed\
-\xe3\x15Ffk\x90Q0\x0a\xacb\x1d\x05\x19\x03<\
-5-\xe3#\xbe\xa9\x12R`\x13k\xf8\x8a\x1bH\xc8\
-&\x1a\x9c\xe2\x01V\xb0\xe1\x82\xc0u\xbc\xc7\x1b\xdcD\
-\xd6\xd5\xe2\x18[XvI\xe0\x0c\xcf\xf1\x18=\x14]\
-\x09\x03\xac`\xc7%\x819\xbc\xc6;, \xeb\x0a\x1c\
-b\x0b\xb7L$\x94@B\x1fG82\xdb\x0f,\x9a\
-8C\x13\xaaVu\x0dYW\x8b!\xe6\xf0\x0bk\xd8\
-\xc0C|\x09]\x09\xc9l\x09'\xf8\x89\x17\xd8\x0d\x14\
-\xfcV\x8dL\x1b\xaaN1\x8f\x03l:\x17\xe8a\x15\
-w\xb0\x80\xac+p\x88e\xb4\xaa@F\x0e|\xc63\
-<B\xe3j\x05=\xbcT\x8dQ\xfc\x15x\x8b\x0f\xfe\
-\xcf\xb1\xaa8\xf7\x07\x01\xfbN\xbd \x8a$\xc6\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xa2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:18-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:18-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:2c01424d-fac4\
--7c4c-bf20-04e46\
-bb77150\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:bbd2bb3e-0f89-2\
-54c-aa1b-ec4f074\
-a8442\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:f0e3455\
-9-bee3-cd49-8a63\
--88dc351edff0\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:f0e34559-bee3\
--cd49-8a63-88dc3\
-51edff0\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:2c\
-01424d-fac4-7c4c\
--bf20-04e46bb771\
-50\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:18-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>?S\
-;\x02\x00\x00\x01WIDAT8\xcb}\xd3\xcf+\
-DQ\x14\xc0\xf1;3~$V\x944J\xa1\xfcX\
-\xdbX\x90\x85\x9d\xfd\x14\x91\x8d\xb2 %%\xe5GJ\
-\xa6d\xc7$\x99d\xa1\x88%\xc9B,H\xcdB)\
-I\xa4\x186\xaf\xfc\x15|o\x9d;\x9dN\xf3,>\
-3\xf7\xdd\x1f\xe7\x9d{\xee\xbb.\x8a\xa2$\x9c\xfc\x8f\
-a\x07\xc7\xc8c\x0auj\xdcY\xa1\xd1\x81\x02\x1e\xb0\
-!\x0b\xd7q\x87W\xf4\xc7\x05\xf1?\xf5xF\xb6\xdc\
-\x1b$\xd8\x0fz\xe4\xb9\xc2\x06X\xc2\xa5\xea\xf4oI\
-\x89\xd0\xd7\x8b63\xa7\x14\xe0\x08\xd3j \xa1&\x0e\
-a\x0b\x07\xd8\xc7*\xbal\x06{\xd84\xe95\xe0\x02\
-/\xc8a\x06\xf38\xc5\x17Vt\x80A|\xa2]:\
-\xabq\x8bC\x93\x8d.\xf8\x9bl\xbdt\x0a99\x85\
-P\xb4\x82Z\x90\x92@\x09\x95a7\xbe\xd1\x12&\x9d\
-`Y\xb5\xe7\xd4b\x9bA(\xa0/\xfc\xb8o\xcc\xe2\
-W\x8a9 5Y,wd\xc65\x86}c\x0d\xf7\
-\xd8E3F\xf1d\xb6P)\xc1BF}(\xa2\xd1\
-\xc9\xa0M\xf5\x1cWh\x8a)\xe2;&u\x11\x9d\xf9\
-x\xaa\xe4.\x14ekY\xc9\xb4\x16i9\xb5V\x1b\
- \xd0G\xe7\xab\xbd\x80m\xdc\xe0C\xea\xe4\xb7{\x16\
-\x17\xc0\xa9c\xb3\xfd\x13x\x94\x0b\xe6\x0b\x9fq\xffT\
-9\x04J\x9aO\xbcF\xee\xc6\x08:\xff\x00cT\xec\
-E'\xe21G\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07g\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:38-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:38-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:e34b501e-bda4\
--6c45-acb6-eea4c\
-c62cb7d\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:31956fb2-8042-d\
-240-a463-f4aa187\
-c13ee\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:cfc00b9\
-a-ac6b-1b40-a254\
--13a41c7063b8\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:cfc00b9a-ac6b\
--1b40-a254-13a41\
-c7063b8\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:e3\
-4b501e-bda4-6c45\
--acb6-eea4cc62cb\
-7d\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:38-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x00{\
-?\xcc\x00\x00\x01\x1cIDAT8\x8d\x8d\xd3=/\
-EA\x10\xc6\xf1s]!J\xa2P(n\x85\xe4&\
-7$^\x1a\x1d\xb5^\xa9\x13\x8dF)\xa1\xf2\x92H\
-D!>\x81/\xa0\x12\xe2\x16\x0aB\x10QH\xa8\xf9\
-}\x0d\x0a\xbb\xc9\xda\xec\x09'\x99\xec\x9c93\xff\x99\
-g6\xa7BU\xb0\x9ep\xae`6\x8b\xfd\xb2Rq\
-3\x9c\x93\xf8\xc2]]q\x1d \xda=6p\x86\x9d\
-\x0c^\x0b\x88\x09\x9b\xb8\x0d~\x1b\x9f\xe8\x94\xa4\x94t\
-\x8f\x87\x82\xa9\xe4\xdb\x16\xae\xff+\xe1\x12\xbb\xc1\xefM\
-\xe2\x8fX\xcf\xa5\xe4\xddW\xf1\x92i\x8d\xfe<>\xd0\
-\x0a\xef\x8d\x08h\x84\xc00\xde\xb0PXX\xf4\x8fq\
-\x9a\x03\xe2\x98k\xb8\xa8\xb9\xf3\xd8\xa4\x15\x9a\x8c\xc6x\
-\x0a8\xc0Q\x0d Z?\x1e0\x17\xf3R\xc0\x1eN\
-\xfe\x98`\x00O\x98N\x01Q\xdf2n\x92\x82F\x02\
-\x88M:x\xc5P*!MzN\xae\xaad]\xec\
-\xa7S\xe6\xd78\xe3\xe7\xd9\xc6`\x98\xa2\x89\xb1\xb0\xe0\
-n2M#\x05\xa4\x906\xce\xc3\xb6\xaf\x82\xacw\x1c\
-\xa2/\xdbI\xed\xbfPa\x02KX\xc4Ha\xa1\x15\
-\xaao\x81\xf9\xd7\xfa\xc7\xc6\xdd\xd7\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07\x83\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:18-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:18-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:2fd18789-a88d\
--2e42-99bf-ccd45\
-d32079a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:4be78897-f27c-e\
-f49-875f-1963095\
-b8d20\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:b226231\
-6-f46f-124c-aa12\
--1d362420914c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:b2262316-f46f\
--124c-aa12-1d362\
-420914c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:2f\
-d18789-a88d-2e42\
--99bf-ccd45d3207\
-9a\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:18-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xbc7\
-hy\x00\x00\x018IDAT8\xcb\x8d\xd3\xcf+\
-EA\x14\xc0\xf1\xebz\xf2\xac\x94\xb5\x92\xb2\xf0z\x16\
-\xc8\x8f$+?V\xd6\xaf\xf7JvJ\x89\x94H\xc9\
-\x8a\xb5\x9d\x8d\xb2\x13[$\x96\xac\xfc\x88B\x92$\xa1\
-t\xf93|\xa7\xce\xa9\xd3q\xefc\xf1i\xe6\xde;\
-s\xee\x9c\x993Q\x92$Q\x86I\xecb\x0b=\xf2\
-.\xf6\xe3\xfc$\x1d\xb0\x8ew,b\x13\x9f\x18J\x0b\
-b'\xd7H\xdb\x82W\x14\xcd\xb7U\x1c\xb9q\xbf\x02\
-\xe4\xa4\x1d\xc3\x95\xf4\xeb\xa4\xed\xc2-\xf2>HZ\xee\
-\xa3\xb8\x96~\xad\xb4\xbd\x12\xa0\xbe\xda\x1e,\xa0\x0f\x83\
-\xb8\xc9\x08\x10\xf2\x9f\xc3\xb0\xae\xc4.\xe7\x18\x13\xe87\
-+\xd0\x14\xbaq'\xfd}\xcc\xe8\x86\xda]\x0dG6\
-\x85\x02\x1e\xddn\x8f\xe3B\xfa\x87\xa8\xd8\x009st\
-;\xd2?\xc76\x9a\xd0\x81'I1|{A\xa7M\
-A\xff\x14\x8e\xed\x03\xadh\xc4\x19\x1e\xf0\x8c\x0d\x19\xb3\
-\x8c\xd3\xb4M\xd4 +x\x934\xc2s3\x1a\xa4?\
-\x8do\xf3\xf78\xab\x90\x96$\xc8\x01\xe6\xb1\x86K\xdc\
-c\xc0W\xa3\xaf\x01\x0d\xd2&\x93\xbfd\xc9%SD\
-q\xb5\xbb\xe0\x07\xec\xa1l\xde\xffy\x99\x22W@'\
-\x98u\xa5\xfe\xaf\x00j\x04\xedi\x97H\xfd\x00\xe9\x9b\
-\xe1\xb4\xcd\xe4\x1a\xcf\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07w\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:42-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:42-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a98e3700-c88d\
--f846-9a6b-a9766\
-a664cf7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:10a073ee-3b63-d\
-443-99c3-db1c3f8\
-764c0\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e6027a9\
-a-34e1-0d4d-8893\
--998fde7a877c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e6027a9a-34e1\
--0d4d-8893-998fd\
-e7a877c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a9\
-8e3700-c88d-f846\
--9a6b-a9766a664c\
-f7\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:42-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd1\xd0\
-\xbd\xe2\x00\x00\x01,IDAT8\xcb\x8d\xd3\xbb+\
-\xc5a\x18\xc0\xf1\xf7pb8\x93E\x19\x19\x95E\x91\
-\xcb`P2)L\xca\x22r\x1b\x5c2\xf8\x13\xfc\x09\
-\x16\x06)\xd7\x01a\xb0\x19\x0d\x08\x99XL\x9f\xc4\xe0\
-\x0f\xb0X\x9e_\xfd\xfauN\xce\xf0\xf4\x5c\xde\x9e\xef\
-\xfb\xbe\xcf%a\x16\xe78\x0c\xe9GBC\xe8\xbc\x94\
-r\xf1e\x8c$\x5c\x84L\xe0#\x0e\x12\xca\x85\xe4\x22\
-\xf0\x1a\x9b\x09G\x98\x8e\xe0)\xe6\xc3n\xac\x92\xdc\x86\
-\xae\xb0\x0f\xb0\x92p\x82\xa5\x08^a\xa1\x00\xc8t\x17\
->q\x1b\xfe!\xd63@\x96tY\x00d\xdf\x18\xc0\
-\x1b\xf6q\x17\xb5\xa8\x09X\x0c\xbb)\xf40\xbe0\x89\
-v<\xd7\xfb\x82\x841|c*\xfc><\xfd\x07\xc8\
-\xba0\x8e_\x8c\xe6\x80=\xf5\x00\xb2\x82v\xe2\x05[\
-9@o=\x80\xfc\x17Z\xf1\x8a\xdd\xf0\xbb\x03\x9a\xea\
-)bs\xe8\x16<`;Z\xf9X\x0d\xb0X\xa3\x8d\
-\xd9\x0cTp\x83w\xdc\xc7`\xfd\x0b(\x17\x06\xa99\
-vf/\xf7\x82\xb5\x84c\xccD\xf0\xac\xca$\x16\xf7\
-\xa0\x12\xfa\x08\xab\x99\xf1\x86\x1d\xfc`\xae\xc62\x95\x0a\
-\xfe\x196\x12\x06\xb1\x86\xd5\xb8\xbd\xa3FB\x114\x84\
-\xce?9f\xff\x12\xe6\x9eP\xa0\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07\x9d\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:22-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:22-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:ca6088e6-1e35\
--f24d-8731-9cc58\
-4ec6d97\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:42cbb1db-e34d-9\
-540-a842-a6c5d78\
-4e0f2\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:3b1faad\
-8-ac2d-ec4d-aae2\
--420d1c3fce2c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:3b1faad8-ac2d\
--ec4d-aae2-420d1\
-c3fce2c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ca\
-6088e6-1e35-f24d\
--8731-9cc584ec6d\
-97\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:22-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xea\xc3\
-\x08\x5c\x00\x00\x01RIDAT8\xcb\x95\xd3\xcd+\
-DQ\x18\xc7\xf1{\x07ec\xa5i\x92\xbc-\x98Y\
-\xdaJ\xfe\x03\x0b\x85\x94\x9d\x95b4)/Y2\x8a\
-\x92\xbf\xc0?`c#I4\x1b/\xfb\xc9FI\xb2\
-\xd0E\x09)QR\xbe\xa7~\xa7\x9e9]S\x16\x9f\
-;\xe7\xb9\xcf9\xcf=\xe7\x99{\xa3$I\x22\xc4\xc1\
-\xafU/\x17\xb9K&-!\x99?\x8a\xd5\x14p\x9a\
-q\x8c\xa2\xe2\x06\xb38\x8bSL\x98\x5cM\x81V\x1c\
-\xe0\x087\x983\x13\xbau\xff\x10\xf7\x18\x0b\x8b\xb8K\
-\x09?hB\x1f\x1eM\x91M|h<\x807\x8c\xda\
-\x22\xfeI;8\xd7\xb8\x17\x0f\x98Q\xbc\x87\x8a\xc6\x83\
-x\xc5\xb8\xef\x91m\xc8.\xce4.h'S\x8a]\
-\x7fN4\x1eR\x91\x11\xbf\x83\xd8tw\xdf\xec\xc4\x1d\
-\xe7\x13\x93\x8a/\x82\x22\xdf\x18vA\xa3nv\xa2\x8a\
-\xb2\xe2\xa2\x9a\xea\x8e\xd4\x83k,)W\xd6\xdc\x82\xdf\
-~\x07\xee\xb0\xaex\x01OhC;\x9e\xb1\xa8\xdc\x16\
-n\x91\xf3G\xc8\xe3\x12+\x9a\xb0\xac&v\xe9\x18n\
-\xf2\xacr\xdb\xdaU\xce\xff\x13\xee2\x8d/=\xad\xa4\
-\xc5yMX\xc5\x0bZ\xb0\xa1\xc5\xd9\xb4\xbf\xd1\x9d\xed\
-\x1dWf\xb1\xef\xcd\x9a\xde\x85\xaa}r\xf8*G\xda\
-f\x7f\xb0\xd8\x9bW#S_\xe5\xf0#\xf9\xcf\xc7\x15\
-\x85\xc9\xb8\xce\xc2\xd4\xdc/\xc6G\xef\x1dR\xbf\x0c\x8a\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07n\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:43-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:43-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:2fcd4059-a3f9\
--144e-ad3e-403d8\
-a86b0c0\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:95fcc203-20c1-e\
-d4b-8fd4-7530c65\
-6e2e1\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c3d2897\
-3-2432-f843-b13d\
--b00338c9e3cd\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c3d28973-2432\
--f843-b13d-b0033\
-8c9e3cd\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:2f\
-cd4059-a3f9-144e\
--ad3e-403d8a86b0\
-c0\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:43-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xc3\xfb\
-F\xbb\x00\x00\x01#IDAT8\xcb\x8d\xd2;J\
-CQ\x14\x85\xe1\x93D\xb1P\x0b\xb5\x13\xb1\x15\xc9\x10\
-La\xe30\x14A\x8d(jB\xc6 \xe9}\xd5\x82\
-\xa0\xf8\xac,l\x1c\x82\xf8D\x10+A\xf8jg\xa0\
-\xcd\xbep\xbd$!\xc5\xe2<\xb8\xfb_k\xef{\x12\
-R\x1fj\xe1\x16W\xb8\xc61\xcePK\x18\xc6\x04\xc6\
-\x0b\x9a\xc0P\x00\x16\xb0\x83:\x96\xf1\x8d_\xac&\xb4\
-\xf1\x85\x07<\xe3\x09\x8f\xf8\x88\xc2b\x9a6\xeeC\x9b\
-\x097\xd8\xc5\x14\xaa\x98\x0dU1\x1aE\xa5X\x0f\xf1\
-\x8e\x91h\xa3\x95p\x81\xa5>\xe6\xb0\x87\xb7h-3\
-n$\x5cb=.\x07\xc2\xad\x84J\xaex\x1f\xaf1\
-\x9b\x94\x03\xb42@=.\xcb\x85\xc8\x09\x07\xe1<\x16\
-\xe7\xc1Xk\x98\xe9\x04(\x15b\xe7\x9d\x07\x8a\xadu\
-K\x90p\x84\x97\x0e\xc5\xdb\x98\x8f}\xa5\x08\xc8\xfa\x9e\
-\x8a\x872\xd9\xc1\xf9\x0e[\x99a\xaf\x04\xa9\xcb\x5c.\
-\xb1\xd2\x0f ?\x8fRn\x7f\x8d\xb5n\x80J\xee\xe3\
-\xa2\xca\xb9\xdf\xf7\x0fp\x11\xef;\xf5\xa9\xf3\x22\xe0\x1c\
-\x9f8\x894\xbdt\x8a\x1f,\xe6\x01sh\xa2\x11j\
-\xf6P\x03\x1b\x98\xce\x12\xfd\x01\xf03\xf1\xb1\x1b\x5c2\
-\xd3\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07o\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:59-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:59-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:d4c48a93-97f5\
--7d4f-8d70-9a5b9\
-ff6d4ba\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:27a83ef8-fbd2-8\
-642-b943-30f4eb3\
-1b752\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:72fbd7b\
-5-a44e-694a-a21f\
--d9754246937e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:72fbd7b5-a44e\
--694a-a21f-d9754\
-246937e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:d4\
-c48a93-97f5-7d4f\
--8d70-9a5b9ff6d4\
-ba\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:59-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>9\x84\
-\xec\x16\x00\x00\x01$IDAT8\xcb\x8d\xd3=+\
-\x85a\x18\x07\xf0\xe3\xa08\xc7b\xe0,\x06%Ey\
-Y\xbc\x94\xce \x8bU63\x83\xc5\x07P|\x00\x03\
-\x8bA\x06\xc5\xa6L\xca'P\xe2\x90\x90$\x91\xa4\xfc\
-6\xdf\xc1r?\xba\xbb{\xce\xc3pu]\xd7\xfd\xfc\
-\xaf\xff\xf5\xfa\x94P*\x90!\xd4\x22\xbf%\xc5dF\
-7\x96\x22@9\xe8\x13\xac\x04\xbb=\xe8~,\xa6\x04\
-\x15\xdc\xe20\xf8mA\x9fb5\xca\xde\x877le\
-oqY\xbdQ\xb6L\xaaI\xd95,\xe7\xb5\x90\x81\
-\x060\x1b\xc9\x0c\xea\x91_\x0f\xed\xfe\xc6\xc4\xd9:\xf0\
-\x80g\x5c\xa0\x81\xeb\xa0\x1b8\xc77\xb6\x03\xbe5%\
-\xa8\x869\x8c\x16le\x03\x07E\x04\x97\x18O\x06\xd9\
-\x12\xd9\xeb\xd8oF\xd0\x89W\xcc\x15T\xb0\x87\xa3f\
-\x04%\xec\xe0\x13\x9b\xe8\x8a\xde\x07\xc3M\xbcc!\xbe\
-\x95\xbc,Sa\x88g\xc1\x1f\xc6\x07v\xd1\x93^d\
-\x1a\x9c\xf5:\x12\xb6Q\xc2<\xee\x22L9\xef\x0e\xd2\
-\x8f\x93\xb8\x09\xf64\xae\xf2\x82\x8b\x08&\xf0\x851\xac\
-\xe1\xe9\xaf\x9f)\xbd\xc8~<\xe2\x1e/8\xfe/A\
-\x5cI5\xac\xb6\x12t.\xf6\x07L\x89\xdb\x83\x0f\xaf\
-v*\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x8d\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:29-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:29-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:9c0125e3-cc5e\
--e645-b2a7-41525\
-5247298\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:662de7f2-e3db-6\
-749-9b8c-d6f2642\
-beb60\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e6e2b0f\
-e-3d0d-6c46-9e19\
--cfaa4e1398e4\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e6e2b0fe-3d0d\
--6c46-9e19-cfaa4\
-e1398e4\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:9c\
-0125e3-cc5e-e645\
--b2a7-4152552472\
-98\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:29-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd3\xeb\
-\xfb\xac\x00\x00\x01BIDAT8\xcb\x8d\xd3\xbf+\
-FQ\x18\xc0\xf1{/z\xeb-\x83b\x11\x932\x88\
-E\x99\xa4\x98$\x9b\x92\x18L\xef\xa2\x98\x94\x8c\x16\xf9\
-\x95\x12\xa5\x14\x83b\x90\xc4B\x19\x0c\xde\x22\x03\x83\xf2\
-#L~t\xff\x0d\xbeO=\x8f\x9eN\x97\xf7\x0e\x9f\
-\xce=\xf7\x9c{\xees\x9e\xf3\x9c(M\xd3\x08\xb1\xb6\
-\xa2\x11\x13\xd8\xc0>v\xb1\x88!$\xe1|\xdf\x91v\
-\x05\xaf8\xc72\xa60\x8d-\xdc\xe0\x1e\xc3~\x11\xfb\
-k\x11\x97\xb8@\x87\x8b&4\x82\x0f\xcc\xd9\x226p\
-\x84C71\xc9`cMx\xc7\xb8E0\x80'\x14\
-tB\xd5?\x11\xd4h;\x88\x07\x89\x5c:kX\xcf\
-\xf1\xb1\xcfW5\xee\xd0+\x9d=Lf\x9cF%\xc7\
-(\xc9\xc3&\x16rF\xe0#\xb9F\xbftF5\x1c\
-\x9f\xc0\xbf>\xb4\x1ft\xe1\x0du6P\xc6j01\
-v'\x10\xbb\xed\x15\xb4\x1ef|\x1d4\xe3\x05;\xa8\
-\xad\x90\xc0S\xad\xd0\xdfJ\xb4\x90\xeb51\xcf\xd8\xc6\
-\x18\xba%\xd3\xc1\xa2'\x98\xb7\xd3\xc8\xdaw\x8f\x96\xf4\
-\x19\xae\xb4\xb4o\xd1\xae\xe3m\xf8B\x8b\xdfB\xe4\xf6\
-\x1c\x16\x8e\xbc\x9b\xc5'\x96\xd0\xa0\x97\xabl\x85\x14J\
-\xb4P\xc2\xf7\x9d8\xc0\xa3^\xaco)\xe7\xbcg\x9e\
-\x04\xd7\xbdO\x8f\xbf\xf5\x07\xcd\xe4\xe4\x0f.\xbf\xccz\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x8b\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:37-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:37-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:40eccd3a-3a0c\
--2748-be16-eae76\
-add8c20\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:7224d07d-dd9c-2\
-648-a615-ac86d53\
-4ad69\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:b8f8d27\
-4-422b-4d45-a326\
--ab3d7e0d11c3\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:b8f8d274-422b\
--4d45-a326-ab3d7\
-e0d11c3\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:40\
-eccd3a-3a0c-2748\
--be16-eae76add8c\
-20\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:37-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xfb\xe2\
-\xb7U\x00\x00\x01@IDAT8\x8d\x95\xd2\xbb/\
-\x04Q\x14\xc7\xf1\x19\x06\x91\xed\x90\xad\x14\x1b\x85\x8dW\
-4\x1e\x85\xa8l\x22\xd1P\xa9h\x14\x1e\x056\x11\x89\
-Ft*\xff\x80B\xe5=\xd9\x88?aC\xa5!l\
-'h\xc8\x04\x8dN\xcb\xf7\xc4\xb9\xc9\xc9e2Q|\
-r\xef\x9d3\xf77\xf71A\x92$\x81Q\xaf\xed4\
-\x8e\xd0\xaa\xe3\xd0\xab\xf7!\xc6\xc8_\x93\x17\xf1\x81O\
-t\xea\xb3:D\xda\x1f\xc6=\xbe\xb0\x14\x98\x17\xa4]\
-\xc7\x13J\xb8@\xb7>o\xd4v\x14\xaf\x98\xc5.\xca\
-vy[xA\x87~\xed\x16]f\x85\xe3x\xd7\xc9\
-2\xae\xb8\x00\xb1\x8d\x07\x14t\x9c\xc75z\xcc\x99\xbc\
-a\xca\x04\xc6.`C\xf7\x947\xc5\x16]A\xbb\x1c\
-\x94.\xbb\xa4\xb5\x06?\xe0\x1cs^Q\x02j\xda\xae\
-\xe1\xd8\xd4C?\xe0\x04\xf3\xdeM\xb8\x00\xb9\xc6e\x1c\
-\x98\xc3\xfe\x15\x10g\x04\xac\xe00+`\xc1\xdbB[\
-J@d>\x22\xf3V\xa5s\x8a\x19s\x80\xee\xdeo\
-\xcc\x16\xf6\xbc\xba\xd8w\x01g\xd8I~\xfe\xba!\xf4\
-c\x0c\xcf\x1aPF\x15E\x0cb\x00\xbd\xb8t[\xd8\
-\xc4\xa3^[\xcd\xb8B\x0e\x93z\xcd\xb6~\xa7\xed\x84\
-\x044\xe9\x8b\xcd\x9e\x9c\xd9wZ=\xf2\xf7\xf5o\xae\
-\x13\xa6\xc8\xac\x7f\x03\xc9\xc4\xf4`\xeeC\xea\x96\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x81\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:49-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:49-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:2ed8d1c4-39a2\
--e64a-9045-a5252\
-3f71f36\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:40f2b37a-fa77-6\
-f4c-92be-003048f\
-2cb26\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:68d76d6\
-c-4737-af46-9a91\
--13c80c801fc7\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:68d76d6c-4737\
--af46-9a91-13c80\
-c801fc7\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:2e\
-d8d1c4-39a2-e64a\
--9045-a52523f71f\
-36\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:49-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>ij\
-\x85(\x00\x00\x016IDAT8\x11\x95\xc1\xb1K\
-\x94a\x1c\x00\xe0\xe7\xfd\xf8\x1d\xda\xd1\x0d\xc5\x0d\x09-\
-A8\xb5E\x87\xd0\xd4\x1f\xe0\xe0\x1e-\xfd\x0b.\xce\
-5\xb4E{C\x93\xdb\x11\x18g\x0e\xb64\xe8\xe0\xe4\
-\xa6\x047\x1eIC\x81e~q\xde\xeb\xc17|w\
-\xe8]\xf8<1\x18\x0c\x92JFR\xc9(0\xf2\x1f\
-\x81\xac\x96\xd5F*\xc9\xb4lB`\x0d/Q\x22!\
-c\x11\xfbx\x8dl\x8e\xc0\x0b\x8c\xf0\x11-\x5c\xa0\x81\
-\x0d\x1c\xe23Z\xc8\x18\xe2\xb7\x09\x81\x12[\xd84\xad\
-\x85.\x8e\xd0P[G\x0f\x0b(\x03\x09-W\xbd\xc1\
-{4\x90\xf0\x0b\x9bx\x84\x1eJc\x81\xa4\xd6\xc1s\
-$\x5c\xe0\x1c\x19\x09\xe7X\xc6}\xdcE\x89\xb7\xa1\x92\
-T^\xa1\x89\xaf\xb8\x8dE\xb5&\xba\xc8hc\x1d;\
-\x81\x84\x7f\x08\xdc\xc3\x1a\xfa\xe6kc\x05\xfd@\x81?\
-x\x8a\x12}\x14\xaeW`\x88U\x9c\xe0{ \xa1\xc4\
-c|S\x1b\x99\xed\x19\x0e\x8c\x05\x86\xb8\x83\x0evU\
-\x0a\xf3=D\xd7X\xe0\x0cm,\xa1\xa724\xdb\x03\
-\xdc\xc2\x9e\xb1@\x13\x1bX\xc0;\xfcE\x81lZ\x81\
-3<\xc1O\xfc@\x11\xf8\x80c\x9c\xa2\x89\x84l\xb6\
-O\xf8\xa2\x92\x03\xdb\xd8vs\x09\xf9\x12\x02\xf7O!\
-\xc3\x80\xff7\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\x19\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:03-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:03-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:42e1f76a-e47e\
--6043-80cd-efeac\
-7044dea\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:1c13054c-bbe7-4\
-f47-9b05-002d334\
-29979\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:88ab4dc\
-9-b305-d14e-95cd\
--62cf66e18785\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:88ab4dc9-b305\
--d14e-95cd-62cf6\
-6e18785\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:42\
-e1f76a-e47e-6043\
--80cd-efeac7044d\
-ea\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:03-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xdb\x93\
-\xa4\xa1\x00\x00\x00\xceIDAT8\x11\xa5\xc1=.\
-DQ\x18\x00\xd0s'\x9f\xbf\x91\x89R/\xb3\x00\x95\
-N\xa3\xd4\xe8\xd5J\x9dBe\x0d\x16 \x12\x0d\x0b\x10\
-Z\xadn\xb61\x1b \xc63o>\x92[\xa8\xdex\
-2\xe7DfZEL\xa7\xd3\x13\x9c\xe1\x03\x03\xfd\x14\
-\xccp\x158U=a\x84\x85nE\xd5\xe0\x02\xc7\x81\
-\xc4\x0d\x1e\xfd\xcf\x01\xd6\x03\x0d\xce1\xc6\x10i\xb9\x82\
-\x06\x87\x98\x04\x12\xbb\x18c\x0bi\xb9\x82/\x8c\xd0\x06\
-6p\x8d;\xffs\x8f\xedP\x0dU\x81V\xb7\x82\x82\
-\x16k\xc8P\xa5j\x81\xd4-Q\xfc*aEaE\
-\x81DQ\x0d\xfc\xad\xa0Ue \xf1\xae\x9a\xeb\xef\xd3\
-\x8f\xc0&\xf6\xf1\x8a\x1d,t+\xaa\x19\xf60\x09<\
-\xe3\x12G\x18\xe8\xa7\xe0\x0d/\x81[<\xa0 \xf5S\
-0G\xf3\x0dm\xa93zh\xdb&\x0e\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07\x9d\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:47-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:47-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:b75bc51c-c6ab\
--3740-9bc9-ab6dc\
-ecdea86\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:5048aa9b-5c61-a\
-940-bec7-5ee159d\
-8ec28\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a81de00\
-d-8e81-404c-8f53\
--6a97ee6b3db7\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a81de00d-8e81\
--404c-8f53-6a97e\
-e6b3db7\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:b7\
-5bc51c-c6ab-3740\
--9bc9-ab6dcecdea\
-86\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:47-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xcf/\
-\xfc\xf9\x00\x00\x01RIDAT8\xcb}\xd3\xbd/\
-\x04Q\x14\xc6\xe1YK6\x1a\x0d\xbb\x84m\xe9\x88\x0a\
-\x85B\x90h$\x1a\x9f\x115\xa1\x104\xdb\x10\x91\xc8\
-*iDd\x15\x88N\xa3R\xa0RH\x08\xa2!\x11\
-\xf1\x95\x98\x82\xd2\x1f\xc0oygs\xdc\xdc\xb5\xc9\x93\
-;s\xe6\xce;g\xef\x9d\x09\xc20\x0c<*1\x89\
-\xa4\xceK\x8a\xcc\x0b\xdcB4q\x08_\xb8\xc7\xf0\x7f\
-!n!\xa61\x85\x1b\xcc\xe0\x0e\xb3\xc5B\xdc\x80R\
-\x8d\xadxE\x02\xf5\xe1\xef\xaf\xcd\x17\xe2\xbb\xb9I7\
-\x8c\x9bk\xebXs\xe6\xfd\x09\x88kl\xc7\x07&\x9c\
-\xfa\x22r:.s\x03\xa2\x96\x1a\xf1\x8e\x11O\xab\x17\
-\x18\xf3\xacU`\xdb\xbf6\x8b\x157\xadN\xe3\x14\xd5\
-\xb8E\x9f\xed.\x0a\x18\xc5\x99g;\xab\xf0\x82\x16,\
-(\xe0\x01=\xd1\xbc\xe8\x86m\xcc\x9b\xff\x18\x05d\xb1\
-\x87\x0a\xbc\xa1N\x1d<\xe9\xb8\xd0\xc1>\xa6<\xab|\
-\x89\x0e\xf4\xe3\xc4\xd4\x0f\xd4Q!`\x0b\xcb:Nh\
-L\xe3J\xaf\xf5*VL\xc0\x126l@\x17\x1e\xd5\
-jT\xab\xd5\xc2\xa6\x14\x905\xd7\x8e\x90q_\xa4M\
-=\xb1\xc1\xd4\xf2\xab\xdf\x8d\x01\x1c\xaa\x96\xd17\x92\xf4\
-\xbd\xca\xf9\xa7<\xe3\x18;\xf8\xc4.jT\xcf\xef\xc2\
-9\x9a\xdd]\x88\x99\x90\xb4\xbe\xc09-\xec \xca\xd1\
-\x89^\xb3\xc8?;\xf5\x0d\xb50\xeb!\xed\xea\x22\xce\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07#\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:25-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:25-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:c26b9e35-670c\
--f449-82c9-475cf\
-ca31de0\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:207b35db-98ba-1\
-c4c-8079-c07e4b2\
-4a98d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:ef62507\
-1-7abb-af4e-bdab\
--178c2624e5a4\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:ef625071-7abb\
--af4e-bdab-178c2\
-624e5a4\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:c2\
-6b9e35-670c-f449\
--82c9-475cfca31d\
-e0\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:25-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x95\x80\
-/\xd0\x00\x00\x00\xd8IDAT8\x8d\xcd\xd2\xcb\x0a\
-\x01a\x18\xc6\xf1\x19\x8a\x95\x12;\xc9\x05(bc\xe5\
-\x02X\xb0\xb3b-7\xc2\x82\x0bP\xacl\xa4$\x1b\
-\xe5\x1ad\xe1\xb0rX\x89\xe66\xc6\xff\xadw\xa4\xaf\
-)\x8ab\xf1k\xbe\x9ey\xbew\x8e\x96\xeb\xba\xd6'\
->\xda\xfc\x9d\x01\x8e\xe3\x08\x1b\x01]?\xb3\x95\x99=\
-\xba\x96O\xc1\x8fm\x1c\x1f\xb9\xb7\x88#\x83\xa0QH\
-#id1d\xbd\xae\x04ylq\xc5\x18!-v\
-q\xc1\x11U\xcdr\xd8hw\x22]\x09G\xe8iA\
-\x06U\x90\xc0\x0da\xd4\xb1\xd6\xf3S\xb4u-\x83j\
-\xb2\xe8`\x89\x12\x0e( \x8a3\x1a\xe8c\xae\x9b\xe4\
-B\x0b\x94qBQ\xc2\x08\x86\xd8\xa1\xf9\xf4\xacr'\
-+\xcc\x90\xd2L\xba\x03\xec\xd1\xf2\xde\xc1\xbb|\xbf\x96\
-\xf9\xbdmc\xc3\xab\xfc\x1f~\xe5\x9f\x0f\xb8\x03\x14\x83\
-\xef\xab\xadZ8\x7f\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07^\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:43-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:43-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:e2ce7088-1e77\
--a24b-aef8-308d4\
-5b854be\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:66cbb26b-a296-2\
-b43-94f5-35557ae\
-bd9e8\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:2ffe422\
-7-f1ed-9242-b286\
--22c188f81e35\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:2ffe4227-f1ed\
--9242-b286-22c18\
-8f81e35\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:e2\
-ce7088-1e77-a24b\
--aef8-308d45b854\
-be\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:43-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>{\xde\
-\x98D\x00\x00\x01\x13IDAT8\xcb\x95\xd3?.\
-DQ\x14\x06\xf0;3\x1a\x0b\xb0\x01\x9d0\x8d(\x10\
-\x89Ad\xfcY\x00\xcd\x14\x22\xa1\x92Q(DT\xf6\
-`\x05\x14fH$\xf4\x1a\x92!*\x95\x05\x88_\xa1\
-\xb0\x04\xd1\xdc\x91\xeb\xe5\x99\xf7\x14_\xee\xb9'\xe7~\
-\xe7\xcb9\xdf\x0d\x18\xc6,\x16\xd0(\x81y,a\x1c\
-!\xe0\x04\xef\xb8\xc7\x13\x1eK\xa0\x8774\x02\xae\xb1\
-\x8d\xf0O\x5c\xe2 \xe0\x02;1YC\xa5\x00\xd5X\
-\xdbA;\xa0\x9b\x10TKt\xae\xc4\xb3\x8b\xfd<\x82\
-JNq\xc8\xa8\x18H\xf0\xd7\xe3R\x0a\x02\x0e\xd1\x8c\
-\xf11Vb|\x94\xe4\x7f\x11t\xb0\x9b\xb071\x16\
-\xef\xeb\xa8\xc7x\x0d\x13\x99-\xb4\xfb\x04\xad\x9ca\x0d\
-\x15\x0c\xf3\xbc\xaf\xe0\x0a\xa7\x98\xc2\x1cF\x92\xa2:\x96\
-\x13\xf7-F\xc7\xceDC\xed\x05l\xe2\x05\x0f\xf8H\
-\xd4lE\xb7\xf5r\x9c\xf8\x8c;\x8cfe\xdd`\x03\
-\xab\xf8\x8c\x1d\x07\xfa\xa2?\xb8ZL\x9cE\xe6\xd7\xe4\
-q\x9e;\x7f\xd6\x192\xfb\xbf\xc5\x17\xa6K\x0e2d\
-\x13ML&\x9d\x0b?\xd57\xfe\xbf\xec\xa3\xfa\xce;\
-R\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xd0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:22-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:22-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:0b63ef4d-5522\
--3c4f-ab90-70cdc\
-f87818d\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:96b3f730-31d1-0\
-d49-b1ca-6adbd6a\
-7d4bf\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:878ffe7\
-c-8e5e-be4c-a2eb\
--99edc197ecf3\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:878ffe7c-8e5e\
--be4c-a2eb-99edc\
-197ecf3\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:0b\
-63ef4d-5522-3c4f\
--ab90-70cdcf8781\
-8d\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:22-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x05u\
-\x0b\xe5\x00\x00\x01\x85IDAT8\xcb\x85\xd3\xcd\x8b\
-\x8da\x1c\xc6\xf1{\x1c,\xa4H#\xbbYx\x7f[\
-\xb0\xf0\x07(\xab\xf9\x07\xacHSC\xe7\x18\x8c\xbce\
-:X1\x0b+Y\x93\xc9[&\x94(\xb1@j\x88\
-\xbc\x0cJX`\xa1\x8fd\x84\x8cl-\x5c\xa7\x9e\xa6\
-3\xe3\xa9o\xcf\xaf\xbb\xfb\xb9\x9f\xebw]\xbf\xbb`\
-\x03\x8e`\x00\xbbq\x00\x07\xdb0\x80=\xa1\x89\xfdX\
-^p\x05\xa38\x89?\xb8\x85387\x81Sx\x8b\
-\x0f8\x8e1\xf4\x15\x5c\xc0 \xd6\xe5\xa0E(\x93\xd0\
-\x8f\xebX\x8c;\xd8^0\x84\xafx\xec\xdf\xb3:\x9b\
-k\xe8\x08\xd3\xb3\xb6\x0b\xbfp\x1f\xe3\xe8)\x18Fo\
-6<\xc5\xda\xd4\x1d\x95?O\xcb\xfb0N\xa7\xbe\x8a\
-\xfe\x96\x82o\xf9\xf8\xf3$\x0aj\x15\x05\xe3x\x80\xdf\
--\x05\x97p(\xbd\xbf\xc0\xd2)<\xd8\x1b\xd3\xe7\xe2\
-6v\x14\x9c\xc5\xeb\x98\xf9\x1d\xf7\x22\xef\xda\x04.\xe3\
-\x0d\xdeG\xf5\x17\xf4\xb6R\x18\xc2\xc6Dt\x0c=\xa8\
-c[\xa8c3n\xe0.\xba\xd3r\xa3\xe0|d\xf5\
-%\xe7\xae)Zh\xe0\x096\xe1\x15\xea%C2\x82\
-\x13Q\xb0&\x9bg\xc4\xbc\x1affm\x1f\xde\xe1(\
->bk\xcb\xc4&\x16\xe2e%\xc6v)4\xe3\xc5\
-\x9c\xaa\x89\xd5\x18\xfd'\x85Fb\x1c\xa9\xc68\x9c\x8b\
-\xb1 \x0a\xd6c\x16:1/tf\x1a\x07q1\xf5\
-M\xec,\xb9$cx\x84\x1f\x89\xeaY\xee\xc5\xf30\
-\x1a\x85\x9f2l\x0f\xf1\x13[\x0a\xe6c%Vd\x98\
-\x96\xa5n\xc7\x92\xb0*\xad\xce\xfe\x0bD~\x1f+/\
-\x8bRy\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x07\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:55-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:55-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:f7823ae2-fc6b\
--eb4d-9640-4caa6\
-b03ba80\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:4369b5f7-3da4-3\
-044-beec-1d0515b\
-7bbf3\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:74b5ceb\
-2-b21c-2844-b92d\
--ab268d83e54c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:74b5ceb2-b21c\
--2844-b92d-ab268\
-d83e54c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:f7\
-823ae2-fc6b-eb4d\
--9640-4caa6b03ba\
-80\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:55-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x00\xf7\
-\xb1t\x00\x00\x00\xbcIDAT8\x8dc\xf8\xff\xff\
-?\x03%\x98\xe1\xd9\xb3g\xf8\xb0\x0f\x10\xebB\xd9\x8c\
-\xd8\xd4\xe0\xd2\x08S\xbc\x1d\x88\xb3\xa1l\x16r\x0cX\
-\x07\xc4iP639\x06l\x00\xe2\xf4Ac\x00I\
-a\xc0D\xa9\x010\xbc\x09\x883\xf0\xa9\xc1\xe6ly\
- \xde\x02\xc4\x02@\xbc\x02\x88\xc3\x80\xd8\x13\x88\xe7\x92\
-\xe2\x82I@|\x01\x88\xf7@]q\x1b\x88\xfd\xd1,\
-\xc2j\x00\xb2d\x0b\x10\xff\x07\xe2\x9f@\xec\x84\x166\
-\x18\x060\x22a&$\x83*\x81\xd8\x0b\xcafES\
-\xc7HL \x12\xc4 \x22\x0b\x88\xb7\x02\xf1r ^\
-\x85\x86\xd7\x00\xf1j,\xe2+\x81x=\x10\xdb\x83\x0c\
-p\x03\xe2r \xce\x03\xe2\x02\x22q>\x10\x17\x03\xb1\
-&\x00\xc9\xc1\xda\x01s\xf8\x0bj\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07\xb2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:47-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:47-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:4a2c8ce3-1ea8\
--044a-9326-b5493\
-65319da\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:0254f8de-f6ee-1\
-144-bb9f-4955f67\
-c0612\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:7414d9a\
-2-489d-754a-9ed4\
--0d70932a47db\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:7414d9a2-489d\
--754a-9ed4-0d709\
-32a47db\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:4a\
-2c8ce3-1ea8-044a\
--9326-b549365319\
-da\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:47-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xcfj\
-\x0e\xd5\x00\x00\x01gIDAT8\x11\x05\xc1?\x8b\
-\xcf\x01\x00\xc0\xe1\xcf\xef\xfb\xf3\xc3\xc2\x91\x92Db%\
-)\x8b\xe2\x8c\x16uu,g\xb0\x9c\x1c\x85\xd9\x9f\x94\
-x\x01\xacJn9\xcb\x19\x9c\xe2By\x0520\x9c\
-\xf3o\x10yV\xde\x01\xcf\x13B\x18\x106`\x0e\x0f\
-\xb0\x84E\xdc\xc3\x09\x840 \x14\xc2\x08a\x06k\xf8\
-\x80G\xb8\x89;x\x8a/X\xc5^\x84\x01\x85\x01\xe1\
-\x1a\xfe\xe0\x22B\x08!L\xe1!~\xe2\x10\xc2\x10\xc2\
-\x0c\xfe\xe0(\xc2\x08a\x1fv \x84p\x1d_\xb0\x0d\
-\x85\x0dX\xc3\x02\xc2F\x0c\x08\xafp\x15a\x821\xc2\
-\x0a\xee\xa30\x87\x8f\x08a\x841\xc23\x5cB\x98`\
-\x8cp\x04\xeb\xd8\x1e\x1e`\x11a\x8c\x10\xc2\x0a.#\
-\x84\x106\xe2=\xa6\xc3\x12n!\x84\x19\x9cBx\x81\
-\x05\x84+8\x80\x10\x9e\xe3BX\xc4=\x84p\x06\x7f\
-q\x0cOp\x1e7\xf0\x03\xbb\x11\xc2k\xcc\x85\xbbX\
-A\x98 \xcc\xe27\xd6\xf0\x1d\xef\xb1\x0b!l\xc1\x1a\
-\x0e\x87\xe3\xf8\x8e\x1d\x08\x13\x84\xd3\xf8\x87\xcf\xd8\x89\xb0\
-\x09a\x16\xef0\x0ea\x15\x8f\x11\x06L\x10Nb?\
-\xc2&\x84\xf0\x09\xf3(\x84=\xf8\x85\xdb\x08!\x84\x10\
-Bx\x8be\x84\xc2\x80p\x10\xdf\xf0\x12G\xb1\x19!\
-l\xc5Y\xacc\x19c\x84Q\x08\x03\xc2\x14\xee\xe3+\
->\xe0\x05\xde`\x1d\xef0\x8f\x10F(\x840 \x84\
-\xed\x98\xc6<\xce\xe10\xc6\x08a\x84\xd0\x7f\xd2\xbe\xf1\
-\x9b)\xc9\x97\xe2\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\x94\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:09-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:09-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:3f357129-c299\
--0340-83e3-03b81\
-1b40470\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:8337300d-d743-f\
-84f-9ff8-2c4edb3\
-1f2ec\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:800e812\
-a-3ef1-e845-908c\
--cf4e7786025c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:800e812a-3ef1\
--e845-908c-cf4e7\
-786025c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:3f\
-357129-c299-0340\
--83e3-03b811b404\
-70\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:09-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xa0\x88\
-'\xfa\x00\x00\x01IIDAT8\x11\x95\xc1\xbbN\
-\x14Q\x18\x00\xe0\xef\xcc\xfe\xb0\x9b\xac\xab\x9d\x15\x95\xe1\
-\x05\xbct^B\xe9\x16bG\x01\x85\x95\x89\x85\x8d\x89\
-V\xd2\x19\x0b\xdf\xc0\x06\x0b\x1a\xe3\x05\x12M\x88\x91\x9a\
-\x8ew\xb0sm1\x22\xb0\x849G\x921\x99\x8c&\
-\x06\xbf/&\x93\x89?\xdc\xc7\x22\x0eP!\xa1 \xe1\
-\x05v\x91P\x9c\x0a$$$\xd4\xb8\x83\x84-\x8cP\
-0\xc5S\x5c\xc6.*\x14\xe4@A\xd1\xfa\x8e\x0fx\
-\xaf\xeb\x06\x0e4j\xbf\x05\x16\xf1\x00Sd\xdc\xc2U\
-,c\x16\x055n\xe2\x1a\xee\xa2\x8f}\xac\x06\x961\
-\xc0\x06F\xd8F\x0f3(Z\x9f\xd0\xc3\x0cN\xf0\x18\
-\xb7\x03\x19\xef\xb0\xe6\xff, \x02\x09\x174\x86\xc8Z\
-\x15\x0a2\x12\x12jL1D\x09\x1cc\x15o\xf1E\
-\xd7KlcS\xd7=\x8c\xf1&p\x8c\x9f\xf8\x88M\
-dT8\xc2\x18\x970\x8f\xf38\xc2\x1c\xc6\xf8\x8a\xd9\
-\xc09<\xc7\x1eV\xf0\x03\x15N\xd0\xc7E\x5cA\x1f\
-\x05\x81%<\xc204\x06X\xc7\xba\xae\x0dl\xe1\x95\
-\xbf\x8d\x90C#i\x04\xb2F\xc1C\x1cj\xf4\xb4j\
-\x14\xa7\x02\x05E##k}\xd3\xaau\x15\x94@B\
-\xad\x91\x9d]F/\xb0\x8f'\xb8\x8e\x81\xb3\xa9\xb1\x80\
-\xd7\x81g\xd8A\xa0 \xf9\xb7\x82\x0ak\xf8\xfc\x0b0\
-E\x5c\xce\xae}\xeb\x99\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\x8d\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-37-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:56-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:56-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:0783d574-1be4\
--4b4d-85cf-b49f8\
-90f4295\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:9abb3125-cbfb-5\
-d4e-ad5a-2e7d30e\
-fb7f7\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c42e799\
-8-6de5-6244-a49e\
--b31ef52f9a3c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c42e7998-6de5\
--6244-a49e-b31ef\
-52f9a3c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:37-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:07\
-83d574-1be4-4b4d\
--85cf-b49f890f42\
-95\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:56-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x05\xf8\
-\x0f\xcb\x00\x00\x01BIDAT8\xcbu\xd3\xbb.\
-EA\x14\x06\xe0\xd9\x0e\x1a9\x8d[\xe5\x09\x14\x12j\
-\x9eA\xa2BI\x7f:\xadBK\x5c{\xc5Q\x88\x8a\
-FTj\x09\x9d\xb8\xbd\x80/\x1e\x80^\xb3FVv\
-\xb6b2\xb3f\xcd\xba\xfc\xff\xfa\xa7\xa0\xc4\x1a\x89}\
-\x0c\x1b8\xc4\x05\xce\xb1\x87\xe5\x8e\xb7\xa5^4\xb1\xaf\
-\xe2\x19\x0f8\xc5\x00;\x18\xe2\x05\xb7\x98\xcbIr\xb6\
-\x01\xbe\xb0\x99*\xe55\x81\x03|b\xbe&)\xa9\xf2\
-Wr4\x91\xb8A/\x15\xd9\xc5\x0f\x9e0U;\x18\
-\x8b\xb6k\xe5\xf1T\xb5I\xe73|D'\x978\xae\
-\x096\x02s; \x9fO\xf0\x8a\xd9\xb0\x97\xc2\x9e,\
-8\x0a\xc22\x1f]\xc1\xd3\xc97\x1e0VJ\x8cj\
-\x90\x9c9\xf8\x08\xef\x98\x09{4\xf9\xae\xb1]b\xce\
-;q\xd9K\x0f\x8e\xa3\xf2L\x87\xaf\xe0\x0e\xeb%D\
-2lAh\xb7\xddkA\xeb\x87\x7f\xa1\x84\xc2^\x82\
-\xdd\xcavWp\x86\xb0\x86G\xf4\xaa\xe3\x16\xfb1\xe7\
-\x8f\xc4\xf6h\xaa\x9c\xf1\xbfa+Ky.\x14\xf6\x9d\
-:i\xfeQ\xe4=\xae\xf2_\xa8\xb8\xe7c4\x97X\
-l\x09\xaa\x1fm\xbfE\xf0\x1f'\xed\xdf5\x95\xd8\x7f\
-\xc4M\xb0]\xed\xad\xb6\xd0J\xd7\x17\xc5$V\xb0\x1d\
-J]h\x91\xf9\x07\xef\x17:y\xed\xc1I\x14\xea\x0b\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07v\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:59-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:59-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:d22633e2-f550\
--4544-b265-0f893\
-0d4e793\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:1a11682d-8df9-0\
-647-8a98-49ec6ec\
-1729a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:f9be694\
-4-daa9-1f48-a13b\
--6018e8ecb298\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:f9be6944-daa9\
--1f48-a13b-6018e\
-8ecb298\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:d2\
-2633e2-f550-4544\
--b265-0f8930d4e7\
-93\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:59-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x8d&\
-\xae\x84\x00\x00\x01+IDAT8\xcb\x95\xd2M+\
-\xc4Q\x14\xc7\xf1kF3\x94\xb5\x85\xad\xb2\x12\xe5a\
-\x8f(e\xa3\xbc\x01\xe3!be\xc8\xbb\xf0.\xc4b\
-\xd4x\xdc\xb1\x94\x91\xb0D6V\xff,<\xbc\x05\xdf\
-\x93su:\xeeU\xa6>\xdd\xee\xff\xde\xf3\xbb\x0fs\
-CQ\x14\xc1)i\xdb\x81%\xf4h\xbf=17\xe4\
-\x8ae\xf21^p\x8f\xbe\x5cH\xaaX\xda\x0b\x9cj\
-\x7f\x1b\xaf\x18J\x85\xa4\x8a\xcfq\xe2VZ\xc0\x1b&\
-\xb5_\xb6\x01\x7f\x15\x97\xcd\xf8,>0g\x17\x0df\
-[\xbe\xb8\xe4\x82\xa4\x1d\xc7\xbb^\xee\xcf\x0e\xaaZ\x98\
-+\x0e\xee\xec\xc3\xc5\xf7o=\x06L\xe0\xd9\x15\xb7\xa5\
-\xfe2\x132\x8d\x07T\xa43\x85\xab\xc4\xca\x15t)\
-\xbf\xb3A\xdc\xca[\x89\x017n\xc22\x9ep\xad\xef\
-\xa0\x85~\x134\xaa\xdf\xab\xb9\x803\xec\xe8\x03\x1a\xd0\
-\x80U\x130\x92\x0b\x88\xb7\xdd\xc4\xbc)h`\xe5?\
-\x01\x87n\xc5#\x17\xf0\xeb\x08-w\xdb\x07\xae\xa0\xa9\
-\xaf1\xf6\xe5Xw1`L\x1fGC\xed\xe1\x13\x8b\
-n\x07\x8f\xd8\xc5>.5\xa0S\x06\xbbQ\xc3\x16\xea\
-\xd8\xc4\x1azM\x80\xbc\xc0\x0d\x1d\xab\xeb\xdc\x199\xf2\
-\x17\xdeZ\xed\xfe\x19H9N\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07r\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:19-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:19-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:5e695ca8-9d8e\
--174c-9343-f4c72\
-8348b2d\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:3ea27852-0e16-8\
-948-97bc-435161f\
-1184f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:33beb4f\
-9-2f0d-9749-9c15\
--30632f2a8684\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:33beb4f9-2f0d\
--9749-9c15-30632\
-f2a8684\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:5e\
-695ca8-9d8e-174c\
--9343-f4c728348b\
-2d\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:19-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x0b>\
-C{\x00\x00\x01'IDAT8\xcb\xa5\xd3\xdf*\
-\x05Q\x14\xc7\xf1q\xce\x89#\x9eB\x11\x9d\x0e\xf9[\
-\x9e\xc0\x0bH\xe9\x5c\xf8\x7f\x81\x1b\xe1\x19\x94?O \
-\x17D\x91\x8ep%\xb9\x95\xbf\xa7\xfcI\xc9\x0b\xcck\
-\x8c\xef\xaa\xdf\xd4j\x98\x19\xe5\xe23{\xed5\xb3\xd7\
-\xb4v{\x07Q\x14\x05a\x186i\x5c\xc0\x05\xea8\
-s\xear\x89q\xbf&\xb0\x87\x12\xcd\xf8\xc2\x06&1\
-\x8bi\xb1x\x02[xC).\xe2\x0b\xb4\xe2\x03W\
-\xd8\xc3\x01\xf6\xc5\xe2]\x5c\xe3\xde\xbeM+\xf0\xae\xbf\
-\xcca\x19\x8bb\xf1\x0cv\xf0\x84\xf2o\x05\xda\xf4\xb2\
-3\xce%\xf1\xae\x1b\xafhI+\xf0\x8cA\xcdK(\
-H\xdc\xf3\x08^\xf2\x0a\xf4\xfb]V\x5c\xd08\xf4\x97\
-\x02\x03~\xd1\x7f\x0a\x14\xed\x03)*7\x9cW\xc06\
-\xb1\x92\xb1\x89\xbdY\x05\xca\xf8\xc4-Nq\x9ep\x82\
-;<\xe4\x9d\x83M\x9d\xbc%\xcc\xebLX<\x85m\
-\xb5\x99z\x0e\x1e\xd1\xe5rc\xa8\xb9yOV\x0b\xed\
-h\xa0\xearU\x8c\xbay\x9f\xee\xc2\xcf\x16\x94hh\
-\x0f\x8eu\x0b\x8fp\xe8b\xeb\xff\xc6\xaf\x09\x12\xd7\xb9\
-\x82U\xaci\x5c\x978\xb7\x82\x0e\xbf\xe6\x1b+=\x0a\
-\xfe\xd0=\xf8\x9f\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\x98\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:02-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:02-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:41cb90ca-d1a8\
--1544-8d39-b8d69\
-6e8b89c\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:32e1955c-acbb-1\
-846-8b75-30f7510\
-df711\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d8978f5\
-7-0ff4-484d-916e\
--5850e703f22a\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d8978f57-0ff4\
--484d-916e-5850e\
-703f22a\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:41\
-cb90ca-d1a8-1544\
--8d39-b8d696e8b8\
-9c\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:02-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x90@\
-\x11\xe3\x00\x00\x01MIDAT8\xcb\x8d\xd2;K\
-\x9dA\x10\x06\xe0=\x1a\xbc\xd59\x0avjiaa\
-a\x15\xf0\x0fX\x08\xa2\xb6\xa2\xb5\x95ViD\xc1F\
-\x04-\xac,\x02\x82\x01\x89\x86(\x98\x22\xd1\xcaT\xf1\
-J,D\x0f\xa4\x09<\x85\xbd`\x15\xd3\xcc\xc2\xe7\xc7\
-\x89\x9eb\xd9\xd9\xd9\x9d\x99\xf7\xb2\x09\x09M\xb1R\x83\
-\xeb\x0d*H\xa9T\xd8\x8d1l`\x07\x87\xd8\xc7G\
-,\xe1\x1d:\x0a\xef\x9br0\x84-\xd4p\x8c\x15\xcc\
-b\x0a3\x98\xc7&.\xf1\x0b\x8b\xa8f\x04\xefq\x8b\
-U\xf4\xbd\x02\xbd\x05\xc3\x81\xec\x14c\x0971\xad\xf8\
-\xb0\x0d\xadh\x0e\xbe\xf9\x5c|s\x8c\xbd\x14\x9ck\xe8\
-l@\xbc\xac\xd78\xee\xd0\x95/>\xe0K\xc4\xbd\x05\
-\xce\x9fp\x10\x9aL\x06\x9a*\xfe`$k\x90\xd0\x8e\
-\x0b|\x8d\xfd3\xbe\xe1\x01\xd3Q\xf0\x18\x8e\x5cc=\
-\xea\x9aS\xf0\xccN<a\x22\xce?#\xee\x0b\xb8\xd5\
-\xb0\xb3V\xa0R\xc9\x08r\x93E\xecb\x0d\xdf#w\
-\x13vv\xe17\x06\x8b5\xf5\x84\xfa\x81\xbfa\xd92\
-\x8e\x22\x7f\x86\x85\xd2\xc0TO\xe1\xfe\xe09\x17\x13\xdf\
-F\xe1I=g\xca\x89\xdcy*\xf4\x18\xc5\x00\xee\xd1\
-S\x1a\x94\xfeG\xa1\x12\xfb\x0e\xb6q\x15\xdf\xf9\x19\xf4\
-\x97\x1a\xe4\x09U\x9c\x17,\xab4B\xa1\x8c\xa2\xe5\xb5\
-\xdf\xf9\x0f\xd0K\xef\xd8 \x99Y\xfc\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07)\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:34-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:34-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:e83682c8-ebba\
--604e-ae46-8f4b5\
-161a662\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ff4fbfa3-63e4-0\
-74c-9d2f-ad32dd8\
-0d232\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:8f77490\
-7-fbfb-4f4e-b815\
--ec6c45125c1d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:8f774907-fbfb\
--4f4e-b815-ec6c4\
-5125c1d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:e8\
-3682c8-ebba-604e\
--ae46-8f4b5161a6\
-62\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:34-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>#w\
-\xc3\xd0\x00\x00\x00\xdeIDAT8\x8d\xd5\xd1\xbdJ\
-CA\x10\x05\xe0\xbd1\x08\x12\x8c\x85\xbd\xa5\x9dE\xd4\
->]\x1a\x0bK\x1f@\x13Q|\x14\xbb\xe03H\x14\
-\x7f\x10l\xb4\xb0V\x11\x09v\xda\x7f\xaf\xa1\xcd\x08\xcb\
-z\xb9B\xac,\x0e3{f9sf&\xe1\x10\xb7\
-8\xc5Y\x81\x0b\x9ccR\xf0\x13\x5c\xa1\x9f\xd0\xc7\x11\
-\xf60\xc20\xe2\x08;\xd8\xc5~\xc1\x0fq\x80\xd5\x84\
-&l\xfdRO\x09\x15Z\x11\xe7\x22O8\xc6'n\
-2\xae\x9d\xfdo}\x0b\xd4a\x8c\x0fL\xf1\x8e\xebL\
-\xa4*\x1d\x948\xc1\x1bV\xf0\x80\x1e.q\x87n\xdd\
-\x08\xb9\xea\x00/X\x8a\x8e\xafX\x8b\xda},;e\
-n~8\xe8`!\xf2E<a3\xde\xf3\xc1\xd5:\
-\xa8C\x07\xcf1B\xe3\x15JT\x85\xc0zi{V\
-\x07\xd5\xff\x14x\xfc\xab\xc0\x14\x1b\xb3.\xb1\x8dm,\
-7\x9d\xf1\x0b)\xff\xd8\x86\xbbM\xdeD\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07\xbe\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:06-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:06-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:56c058ac-fd60\
--9a40-a1ec-8aa25\
-52a9a11\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:8b898c92-57fd-b\
-74c-83d7-09b87ef\
-ebfbc\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:99ea252\
-2-0a41-3348-b1e6\
--f3e78a42be9c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:99ea2522-0a41\
--3348-b1e6-f3e78\
-a42be9c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:56\
-c058ac-fd60-9a40\
--a1ec-8aa2552a9a\
-11\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:06-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xdb\x04\
-\xbb\x97\x00\x00\x01sIDAT8\xcbm\xd3\xcd+\
-DQ\x18\xc7\xf1{\xc7K\xde\x22\x16j\x94\xb7\x85\xac\
-\x98&\xa5PJ\xb2P\x9aRdA\xca\x0a\x0b\x0by\
-/\x0b+\xb1RV\x06\x1b\xd9(K/\x0baa\x81\
-R\x842D\x98\xcd,\xf8#\xf8\x1e\xfdn\x1d\xa7\xbb\
-\xf8L\xe7\xdey\x9es\xces\xce}\xbcL&\xe39\
-\xb2\xacq\x0d\x8a4\xf6\x9d\xff\xfe\xd8\x0f\x11\x05\x99q\
-!V\xf1\x86{\x0c;\x0b\xf8\xf6\x04\xbe\x92\x83\x80\x11\
-%\x1e!\x8e>Mr\x866w\xa7\xf6\x0e:p\x85\
-;$B\xca\x9a\xc5\x07\xf6Pm\xef\xa0\x0e;J\x9c\
-D\xaeUs\xc4\xa9\xdb$n\xe0\x09\xf3(0/g\
-\xf0\x83%+0\xdb)\xcb\xae\xdb,p\xa9\x9cx\x10\
-\xd0\x84s<b\xc0J\xf4\xadq\x1e\x16\x91F\x12\xd1\
-\xa0\x84\x18\xfa\x15\x94\xd0$f\x85.k\xf5q\xa4p\
-\x8cz\x94\xe9f\x8aM@\x05.p\x8bN%\x8d\xe2\
-\x19\x07\xb8\xd1\xe1\xb6\xea\xbf\x09|a\xcd\xbd\x85A\xbc\
-\xe3D\x07k\xce`\x01\xbd\xd6\xeeR\xda],(\xd1\
-\xfc4c\x1b\xb5z9\x8do\xec\xa2\x1c-\xb8\xc6\x03\
-\xba\x15\xd3\x83u\xf3\x95\x9a\x87|\xac\xe8p6Q\x82\
-\x1c\x05|\xe2\x05cJl\xc0\xa9\xca\x1brK\xa8\xc2\
-\x96&Z\xd6\xe1Eu\xa5\x95\xd8W\x89s\xd6\xb7\xe2\
-\xd9}\x10\x8c\x1bq\x88WL\xe9\xc3I\xab7J\x9d\
-\xde\xf9\xb7\x03\xb7\xdb\xdaumI\xed \xac[=/\
-\xa4\x9d\xdd\xe6\x0a\xed\xc2\xc0/R\x19\xf3\x11\xc6)\xf7\
-\x0f\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xc2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:58-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:58-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:84c48baa-7649\
--6a4f-a9d2-db4eb\
-47cb65d\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:eb1bcf2c-13de-4\
-d4d-b562-b3006c8\
-104ca\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:60ab9b2\
-e-9f90-f44f-a8cf\
--4452d038a299\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:60ab9b2e-9f90\
--f44f-a8cf-4452d\
-038a299\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:84\
-c48baa-7649-6a4f\
--a9d2-db4eb47cb6\
-5d\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:58-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>B\xde\
-\x1ff\x00\x00\x01wIDAT8\xcb\x85\xd3=(\
-\x85Q\x1c\xc7\xf1\xe7>\xde\xc2-e\x91P^\x16/\
-\x83\x05\x17I\x92A\x061\x18H\xb2\xd0\xcd\xa6\xcc\xca\
-\xdb\x22\x06\x03\xc9`Td\x12e\xb0X$\xc4\x83D\
-\x98\xa8\x87A\x19m\xf8\x1e~\xa7NOWn}n\
-\xe79\xef\xffs\xfe\xc7\x0b\xc3\xd0\x8b\x889\xe5I\xcc\
-\xc0w\xea\xd2\xdc\xfev\x80/n\xe3<>q\x8ab\
-t!\x1e]\xd0K\xb1\x03c\x19\xc7\xe8\xc4!*p\
-\x86;$\xa3\x13t`Z[\x9d\xc0\x06\xae\x90\x8e\x1a\
-\x9535\xc0\xf4}\xc0\xa2\x0d\xd7\xfcm\xe1Z\x95\xbb\
-xG\x89:4\xe2\x1c9\xce\xaa\xf9x\xc4\xb0\xdd\xc1\
-&\x06\xd5X\xa5\xad\xdb\x15\x138R\xfd-\x86T\xdf\
-\xad\x9de\xd9\x09\xc6\xd4\xd0\x84\x00\xb9\xfan\xd0\x0e\xe2\
-Z\xe4\x05mj\xbbD\xb3\x0d!\xe9\x0c\xb8@\xb6\xbe\
-\xeb#\xdfKXU\xd9\x84;\x12\x9d \x91b\x82\xc0\
-\x09i\x07s*\x1f\xa0\xdf\x860\xaa\xca:M\xe0\x86\
-p\x82B\xec\xe1\x06\x05\x0a\xe9\x1e\x95\xa6\xd36\xc65\
-\xa0]\xf7\x1ds&0\x87Z\x8e\x05\x94\xa9~\x0a\xfb\
-\xf6\x16V\xf0\xaa\xd36\x07\xf3\x81\x1e\xe7\x1a\x03\xe5\x84\
-\xbd\xc6\xbe\xf0\xf7Wk'(R\xac\x09%\xce\x00\xde\
-\xd0\xaa\x0c\x0c\xb4\xe5\x16\xac\xe1Y\x19\xfa\xf3.\xfeJ\
-e\x93\xf7O\x98\xd5aU+\xfeu\x94\xaa\x8f\x9f\xea\
-1\xf9\xcevM\xda~\xe91\xe5!\xc3Y\xc0\xff\xef\
-1\xf9Nb\xf5:\x87\xeaG\x9e\xbb\xf7\x0d\xabL\xfa\
-\xcf\xa8\xae\xb0_\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x06\x99\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:03-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:03-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:3f70378b-0997\
--ec47-a1f9-6236c\
-a522d23\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c70e12c2-31ce-9\
-f4b-84c7-433faab\
-d8af1\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:88ba42d\
-0-ebd9-7840-9338\
--66cd2f6d6990\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:88ba42d0-ebd9\
--7840-9338-66cd2\
-f6d6990\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:3f\
-70378b-0997-ec47\
--a1f9-6236ca522d\
-23\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:03-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x13\xcc\
-U\xae\x00\x00\x00NIDAT8\x11c\xf8\xff\xff\
-?\x03%\x98a\xd4\x80Q\x03\x06\x8f\x01\xcf\x9e=c\
-\x04b&R0\xd5]\xa0\x0c\xc4f@lB$6\
-\x05bad\x03\xba\x80\xf8\x06\x10\x9f\x05\xe2\xf3x\xf0\
-9(\xbe\x02\xc4\xde\xc8\x06\xb0\x021\x07\x10\xb3\x93\x80\
-\xc1\xe1\x00\x00\x80\x01\xfa\xb3J\xfbv\xa3\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x01\x82\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
-\x00\x00\x00\x09pHYs\x00\x00\x01\x90\x00\x00\x01\x90\
-\x01!\xf7\xeb~\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x01\x0fID\
-AT8\x8d\xd5\x93\xbfm\xc2P\x10\x87\xcf\xc8E\x06\
-\x00\xa4\xcc@\x0f\x03 !\x06Hh\xb3\x00K\xd0\x00\
-\x0dB\xac@\x09\x95\x89\x22\xb1\x04\x08)\x19!1K\
-\x80\xbf\x14~\x86\xe3\xe9\xfc\x07:~\xd5{w\xe7\xef\
-\xeeg\x9fE\x9e^\xc0\x10\xd8\x03\x07\xa0\xf7(\xa4\xa3\
-\xce\x1b\xae\x9a\xb8X\x08\x0c\xaa\xc2\x16@\x02\xac\x81O\
-n\x95\x00[\xe0\xc7\xdd\xe7e\xb0\x01\xf7)\x01\xdaE\
-\xc0Pu\xaf\xa2\x95\xcf\x08\xf5%\x08\x82\x13\xf0+\x22\
--\x15\x8eEd\xe9\xce\x1f\x22\xf2\xaar/E\xd3\xf5\
-\x81\x89\xb3\x91\xe9\x0f\xa8\xab\x9a\x06\x10{SF\xc0\xd0\
-\x02\x1e\x0cKc\xa3nj\xd4\xed\xb2|M\xd5\x9e\x8d\
-\xc1\x83\x87c\xa4\x0b\x1cy\x9dc\xa0\xa1j\x9a\xc0Q\
-\xe5\xcf\xc0\x08\xe8\x1aM.\x0f\xf9\xbb\x17;\x9bS\x0f\
-\x06\xf0\x95\x0bR\xc0\xb5\xf1\x8e\xf2\xf4\x0d\x84E\xb0\x0e\
-\xb7_\xb9\x8a\xde\xca&\x9c\xab\xee[\xa3A\xe4\x5c$\
-\xc0\xac\xd4\xb2\x83\xbegVHw\xf3\x02S5\xf9\xbf\
-\x5c\x09\xbcG\xba\xa3;\xac\x05~:\xfd\x03\x1b,G\
-\x12\x01I_\xcd\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x06\xf8\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:31-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:31-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:56cae500-f651\
--8f40-aa44-4d894\
-a27e678\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e2319321-f4bc-5\
-14b-9f17-bc05896\
-0b5d1\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:4173da7\
-6-560d-d04c-bbf3\
--bea0e9ee1bcb\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:4173da76-560d\
--d04c-bbf3-bea0e\
-9ee1bcb\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:56\
-cae500-f651-8f40\
--aa44-4d894a27e6\
-78\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:31-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>#\xda\
-r\x9a\x00\x00\x00\xadIDAT8\x11\xa5\xc11.\
-DQ\x14\x00\xd0s\xc7\x8d\xe8\x14z\x89L\xab\xb0\x09\
-k\xb0\x04\x0bP\x8a}\xa8$Z+P\xaa%b\x03\
-\xea\xbf\x83\xc1\xc4\xcc\xbb$\xafP1\x7f\xfe\x9c\x93\xc3\
-0\x04\xc24-Q(\x13%\x8ep\x8a0^`\x81\
-\x97\xc4\x0d.\xf0\x86}\x94\xcd\x1a\xe6\xb8L\x1c\xe3\x1a\
-w\xb6\xf3\x80y\xe2\x0b\xa9\xdbC\xf3\xbf@Ca\x95\
-\x08\xbf\x0ae\x9c@\xa4\x1d\xa5\x1d%\x0a\xa1\x9b\xd9,\
-\xb0\xd6U\xa2\xb0\xd0\xad\x8c\xb7\xf4#q\x803<\xe3\
-\x10\xcd\xdfB\xf7\x89\x13\xbc&\x1eq\x85s\xcc\x8c\x13\
-x\xc7S\xe2\x16\xf7\xb6\x13Xc\x99\xba\x0f\x13\xa5.\
-LS\xdf\x1e\x7f(`\xdbJ\xcb\xa5\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07~\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:21-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:21-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6ce093f6-7078\
--8647-a8a2-b17a5\
-441e2b2\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:3725c593-3df8-9\
-a4a-97c8-72fb300\
-a727c\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:dfef2c5\
-3-7fe7-a14a-b803\
--1bc5fec8adc4\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:dfef2c53-7fe7\
--a14a-b803-1bc5f\
-ec8adc4\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:6c\
-e093f6-7078-8647\
--a8a2-b17a5441e2\
-b2\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:21-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>8|\
-\xda\x82\x00\x00\x013IDAT8\xcb\x95\xd2\xbf+\
-\x85Q\x1c\xc7\xf1\xe7\xb9?\xc2\x82\x91\x12\x97A\x161\
-\x99,J\x89\xc1\xa2\xd4\x9d-\xba)\x19\x19\x0c\xc2*\
-\x03\x16\x06\xbf&\x8cr\xddl~$d\x22J1y\
-\xfe\x01\xbb\xbc\x1f>G\xdfN\x0f\xb7\xe7\xd6\xabs\xbe\
-\xe7\x9e\xf3\xb9\xe7\x9es\x82(\x8a\x02d\xd4\xd6b\x11\
-\x13\xaaC\xb5\x7f\xb2\x8b\x0b8\xc7'\xca^\xf0\xbf\x01\
-\xb1z\xbc`\x06\x0bXI\x1b\xb0\x83\x03\xf5\xd7\xb1\x9c\
-&\xa0\x1b\xcfh\xd5\xe0\x126\xd3\x04\xcc\xe2\xd0\x0c\x8e\
-\xe3\x22M\xc0\x16\xe6\xcc`\x1d\x1e0\xac:_-`\
-\x1f%\x0d\xe4\xd4\x96\x14\x927\xe3\xa1\xb9\xd6\xdf~\x5c\
-l\xe8\xee\xdd\x96\xdd\xa4]\x5c\xa2\xb1\xda\x0e\xe2\xab;\
-N\x08p\xe1o\x98F\x0bj\xf4}\x83\xeaL<\xa9\
-]o\xa0K\x8b\xb2^\xc8\x08N\xf0\x84[\xed\xea\x06\
-\x1f\x18p\x93VQ1\x8b\xb2\xda\x8d\xbd\x856\xf4\xa3\
-\x17\xf3xG\xb3]p\x8d\xbd\x84\xff\x99\xf3\xea>\xbc\
-b\xc8\x9dAh\x9e\xf3\x19\xee1\xaa:0W\xd9\x89\
-\xb5\xe8\xe73\xe6\xce,Hx0S\xb8\xc3#Nq\
-\x84+\xbd\xd6mt\xd85vk\xa1\xf7\x8b=(b\
-\x12\x83h\xf2\xce\xe8\xbb\xff\x05u\xd5\xe1t2\xeb\xf5\
-\x09\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xa0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:25-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:25-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:ca98d4da-7bf3\
--f243-8228-c9b9b\
-28efe0b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:4638afea-93c2-3\
-54c-bab2-2e41f2f\
-fa6e5\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:dd5d3a3\
-e-a046-5146-8e7a\
--14b62eeb350d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:dd5d3a3e-a046\
--5146-8e7a-14b62\
-eeb350d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ca\
-98d4da-7bf3-f243\
--8228-c9b9b28efe\
-0b\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:25-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>1\xd4\
-_\xf5\x00\x00\x01UIDAT8\x11\x05\xc11J\
-P\x01\x00\x80\xe1\xff\xbd\x97\x06\x92\xa4\x07po0\xbd\
-\x80\xde \x10\x9c\x94\x9a\x14\x1b\x1dBZ\x9a\xf2\x00B\
-\x1e\xa0\x06kp\x10+\x0c\xa7\xa0\xc9A\xa7\x0657\
-\xa7\xef\x1c}_\x08aD\x98\xc16\x8e\xf0\x0d_\xf0\
-\x11k\x08aD(\x84\x01a\x03\x7fq\x85c\xbc\xc5\
-;|\xc5-.\xb0\x840\xa20\x22\xec\x03\xb6\x10\xc2\
-\x12\xe6\x10\xe6q\x8cG,#\x8c!l\x00^ L\
-\x08\xe7\xd8E\x18\x10\x0e\xf0\x80\x05\x14f\xf0\x17[\x08\
-\xb3\x18\x10.\xb0\x870\x83\x09\xe1\x0cG(l\xe3\x0a\
-aD\x18\x10~b\x0fa\xc2\x88\xb0\x8a{,\x86#\
-|B\x18\x11\x06\x84s\xbcAx\x8a\x01a\x167X\
-\x0f'\xd8G\x18\x11\x06\x84?8D\x08!\x84\x1f\xd8\
-\x0d\x9f\xf1\x1ea@\x18\x10^\xe3\x1f~\xe1\x15\x9e \
-\x84Kl\x85C\x9c L\x08!\x84\x05|\xc0\x1d^\
-\x22<\xc7-V\xc2\x1an\xf1\x0ca@\x08#B\x98\
-\xc1\x1c\xc2&\xae1\x85p\x81c\x84\x09#\x06\x84\x11\
-\x13F\x84\x01w\xd8A!,\xe1\x11\x07\x08!\x84\x10\
-\xc2\x80\xdf8E(\x8c\x08\xcbx\xc0\x19V1\x8b\x10\
-\xe6\xb1\x89;\x9cbB\x18B\x18\x11\x16p\x84{\xdc\
-\xe0;.q\x8bk\xec \x84\x01\x85\x10F\x84\xb0\x88\
-u\xecb\x1b+\x98\x10\xc2\x80\xd0\x7f\xd7\x92\xea\x1d\xd2\
-q.\x95\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xcd\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:47-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:47-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:09d74104-8b2d\
--ae4f-99e1-81238\
-d5205e7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:3c3b04dd-6434-6\
-a41-917c-7917622\
-5ced2\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:3451a59\
-9-5c28-bc4d-bc00\
--e3136e58bf9b\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:3451a599-5c28\
--bc4d-bc00-e3136\
-e58bf9b\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:09\
-d74104-8b2d-ae4f\
--99e1-81238d5205\
-e7\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:47-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>FR\
-\xbaF\x00\x00\x01\x82IDAT8\xcbu\xd3\xcb+\
-\x84Q\x18\xc7\xf1\x19\x97f\xe1\xb2Pb\xc1Bb\x12\
-\x0b\xc5\xc6\x8a4L\x9aqK,\x90K\x12R\x16b\
-\xa1\x5c\xb6.\x116$\x91\x05\x12\x0b\xd9\xb1p\xd9`\
-C\x8ar)J\x98a\xe1\x7f\xf0=\xf9M\x9d^c\
-\xea33\xef\xfb\xces9\xcf9\xe3\x0a\x85B.K\
-\x8c\xf5\xbd\x04C\xc8G\x15Z\x10\xe7\xfc\x9d\x1d\x1c\xab\
-\xcft\x1c\xe2\x1a\x1b\xc8@-.q\x87j;I$\
-8\xde\x0a~\xc6\x0c\xb2\xd1\x839\x0c+\x91\x09\xfeD\
-g\xa4\xa8ys[\x1d\x98\x0a\xa3(\xc2\x136u\xbd\
-\x86\x0f\xf8Q\x18\xfa}\x15\xd8\x1d4\xaa\xf2,\xca\xf1\
-\x85&UZ\x86O3\xf9Vg\xa6\xc3\x1d;A+\
-\x82\x08 \x8c:U\xbf\xc0 \xde\xd0\x80\x11u\xe3\xc5\
-\xba\x99C$A%V\xd4v\x0d\xf6\xb1\x8bL%3\
-]\x9dk\x09gHDVd\x06F;\xc6Q\xac\x1d\
-\xd8\x83\x07\x8f\x9a\x81\xa9~\x846%\xae\xc7\x81\xbd\x04\
-\xbf\xd6\xf5\x82y\xed\xf7-\xa6\xd4nX]\x1e\xa3\x1b\
-\xdb\x98\xb0\x13\xf4bZm%\xe0\x06\x8b\xc8\xd1\xb65\
-cU\xd5\xcd\xbc\x1e\x90d'\xe8\xc7\x96\xd6\x1bP\xe5\
-4\xedL\x17\x16p\x8a\x0a\xbc\xab\x1b\x97=D\x9f\x8e\
-\xad\x09\x98\xd4=3\xed%\xdd?A\x19^\xedC\xe4\
-<\xcaF\xaev\xc2\xab\x8aA\xb5;\x86{\xf49\x8e\
-\xbd\xcb\xf9'J\xc1\x15Ju\xf6\xf30\xa0\xe1v8\
-\x83\xa3u\xe0\xd1\x8e\xa4j\x9d\xc9\x8e\xe7n\xc7\xf5\x9f\
-\x04\xd1\xc4\xfc\x17l\xfc\x00\xc6Q\x01\xfc\xf7\xf9\xc0\xdb\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x070\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:22-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:22-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:29071cd5-3fd5\
--0248-94c9-ee56a\
-58c8ef0\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:7f96e5a5-7bab-3\
-84f-8b5c-8a5ec23\
-3872b\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:adf6c98\
-2-1819-294a-a45d\
--da9f14d14366\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:adf6c982-1819\
--294a-a45d-da9f1\
-4d14366\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:29\
-071cd5-3fd5-0248\
--94c9-ee56a58c8e\
-f0\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:22-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>)M\
-\xd2\x22\x00\x00\x00\xe5IDAT8\xcb\x85\x93=\x0a\
-\xc2@\x10\x85\xb3I,D\x8c\x8dVb\xef_\xad\xd7\
-R\x22x\x1e\xb1\xb1\xb0SL \xe2=\xc4R\xdc\xc2\
-\xc23\xf8\x82\xbb2\x0c3\x9b\xc0G\xb2a\xde\xdb\xd9\
-7ld\xad\x8d\x14b\xf2m\xb4:M\x9c\xb8\xf7\x10\
-t\x04\xc3\xa0A\xea\xdec\xf0\x01\x85\xd2\x95h\xe0\xc5\
-\x13\xfb{rp\x007\xcd$$^\x93\xf3\x9f\xc1U\
-2\xe1g\xf6\xe2\x95p\xb4\x13\xa8x\xb0\xd4m.\x88\
-G c\x9dTd\xc3\x7f\x07\x03pg\xe2:\xc4\xb7\
-\x13\xc5\xc4\xe4\x02v~\xed\x8b\xbb`A\xc43\xf0\x04\
-[p\x04%\xd95\xa3\xb5\xd2\x18\xeb\x1c^`C\xfe\
-\x95\x0eu\x8c\x09\x13\xe7n\xdd\x22\xc5\x8531Z\x88\
-S&N\x84\xb9\x97\xce(\xe5\x1d\xf4\xc1\x83\xb4\x9d\x04\
-\xeeE=\x85=\x0f\xb1\xc7B\x0c]\xae6Xj!\
-\x9a\x06\x13\x13\xba\x0bMb\xb1\xf6\x0b\xf7P\xd4F|\
-\x04\x83\x02\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xad\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:19-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:19-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:e2b96f65-9825\
--6d4e-88b9-d640c\
-80502f7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:795a367e-537d-a\
-443-8747-3167228\
-49cb7\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:ad19de1\
-6-bc32-7d4d-bce0\
--b390f6201407\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:ad19de16-bc32\
--7d4d-bce0-b390f\
-6201407\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:e2\
-b96f65-9825-6d4e\
--88b9-d640c80502\
-f7\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:19-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd9\xbd\
-\x10\xae\x00\x00\x01bIDAT8\x11\x05\xc1\xbb\xab\
-\xcfa\x00\xc0\xe1\xcf\xf7\xfd\x9d$\xb9\xc4&f\xa9\x93\
-\xcb&\xe5\xb2\x19\x0c2\x18D2\x18dpJ)\x19\
-\xc8D)\x0c\xa4\x88H\xc4$&\x0b\xc5 I$\xd2\
-9Y,z\x92\xc5\xbf\xe0yB\x08\x03!\x1c\xc0\x15\
-\xdc\xc7\x1d\x5c\xc0\x0e\x840\x10\x0aa \xec\xc5'|\
-\xc6]\x9c\xc7E<\xc3\x0f\xbc\xc0\x06\x84\x81\xc2@8\
-\x86\xbf8\x85\x10B\x08kp\x1b\xbf0\x8f0B\xd8\
-\x85\xbf\xd8\x89\x10\x06\x06&\xcc\x10\xc29,a\x0d\x0a\
-\xe1\x03N#,C\x08!L\x08\xab\x10\x9e\xe3:\x0a\
-\xfb\xf0\x05\x03a`B\x083\x84\xb3x\x81\xb0\x1d\x8b\
-X\x1b.\xe1\x11\xc2\x84\x10\x06\x06\xc2\x02~c\x07\xc2\
-r|\xc2\xeep\x0b\x97\x116\xe2\x01\xd6#\x84\x05\xc0\
-<\xc2@x\x89\x13\xe1\x06\xae!L\xb8\x87oX\x8e\
-\x93\xf8\x83-\x08s\x08\xe1\x15\x0e\x873x\x89\x10\xc2\
-M\xfc\xc3\x12\xb6!\xcc0!\xac\xc2\x0fl\x0d\x9b\xb1\
-\x84\x0d\x08!\x5c\xc2N\x84\x19\xc2\x1c\xc2!|\xc4,\
-\x84\x87x\x8a00\x10\xc2\xc0\x849\x84\x19\x96p\x1c\
-\x85\xb0\x1a\x8b\xb8\x8a\x10B\x08!\xcc\xe1\x1d\x9e \x14\
-\x06\xc2F|\xc6\x1b\xec\xc1J\x84\x81u8\x82\x9fx\
-\x8c\x09a\x0aa ,\xc3E|\xc5w\xbc\xc6[,\
-\xe2=\x8e\x22\x84\x09\x85\x10\x06BX\x81\xed8\x88\xfd\
-\xd8\x84\x10&L\x08\xfd\x07P\xe7\xeb\x99\xf6\x7f\xaf\x8e\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x82\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:56-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:56-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:90a24353-6a99\
--5941-9472-646fc\
-250e13b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:21c17985-b683-0\
-148-9ca5-3608dae\
-623e0\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:2d569ee\
-d-a6d8-d640-a251\
--928ff00e7050\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:2d569eed-a6d8\
--d640-a251-928ff\
-00e7050\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:90\
-a24353-6a99-5941\
--9472-646fc250e1\
-3b\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:56-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x08\x98\
-\xf13\x00\x00\x017IDAT8\x8d}\xd3\xbf+\
-\xc4q\x1c\xc7\xf1\xef\xf7\xbe\x8e2\x9ebb\xe1\x92\xf5\
-\x98\x88M\x89\xcd\xcebPW\xa4,\x06E\x8a\x94A\
-2\x11&\x83E2\xda\x0d\x0eu\xb7\xa0\xa4H\xfaJ\
-\xf9#<\xbfy}\xf4\xf6\xb9\xcf\xdd\xf0\xe8\xf3\xfd\xfc\
-z}~\xddEi\x9aF\x01\xb1\xcaI\x9c`\xcck\
-\xff\xd3lr/\x1ep\x81*\x0a\xa1\x90P@N\xe5\
-\x04n\xf4}\x8f!\xaf\xbf. \x96D\xf5q\x05\xe4\
-q\x87A\xb5'\xa1\x80\x7f\xa9^@6\xa1\x82>\xd3\
-\x97\xb8\xa3\xd8\x09\x9d\x18@\xab9BE\xdf\xef\xd8U\
-H\x9b\xdd\xb5\xfb(k\xb5G\x9d\xb7\x1b%\x130\x83\
-s<\xe1\x16{(\xda\x1d\x5c\xe1Z\xdb\xda\xc03\x8e\
-\xf0\xe2\x1d\xab\x03#\xa8a\xdf\x06\xb4k\xe5-\xd5\x97\
-p\x89u\xd5\xf3\xde\xf3-k\x81\xc8^`\x17\xde\xb0\
-\x12\xb8P{yY\xb9\x86C\xbb\x03\xd7\xd1\x8fO\xcc\
-\x99\x95C\xbf\x91\xba\x00\x1b2\x8coL\xa9\xde\x12\x08\
-\xc8vy\xec\x07\xd8\xc1\xd3\xf8\xd2K\xb8\xf6\xd8\xf4\x9f\
-a'\x14`C\xe6\xf1\x91\xfe\xfe'l\xff(^\xd1\
-\xd3(\xc0\x1egU\x83\xb3\x1b?\xc5\x81B\x17\xdd\xb8\
-F\x01\xd6,\xb6\xf5\xa4\x9bX\xb0\x97\xfb\x03\x18\xb8\xe4\
-G\xf2\xb2>\x88\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\xa3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:02-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:02-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:398a41f1-1171\
--a54b-8c24-c7dcb\
-2d3a9b9\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:6d57b2eb-5209-5\
-443-babd-e17c545\
-bf83d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:574e815\
-c-e79a-bd49-b4ff\
--0c285a82b5eb\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:574e815c-e79a\
--bd49-b4ff-0c285\
-a82b5eb\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:39\
-8a41f1-1171-a54b\
--8c24-c7dcb2d3a9\
-b9\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:02-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>&\xe2\
-T\xb3\x00\x00\x01XIDAT8\xcb\x85\xd2\xbf+\
-\x85a\x14\xc0\xf1\xf7^\x5ce\xb2\x5c\xbfJY\xc4`\
-\x17\xf2#\x93\x89\x12F)\x8b\x1f\x19\xc8$\x190\xfb\
-\xb1P\x92\xd1\x86\x0c\x141Y\x94\x10J$\x93\xbc\xf8\
-\x1b\x0c|O\xce\xd1\xf1\xf4\xbe\xb9\xf5\xe9=\xcf\xf3\xdc\
-{\xdes\x9es\xa38\x8e\xb3\x880\x86^\x8d\xffS\
-\x88\x8c\xc4\xb2(\xd2\xcd.|\xa0\x0a\xdd8\xc2!\xf6\
-\xb1\x8d\x05\xb4\xa1\xc4%\xcaZ\xd0\x885|\xe2\x14\x0d\
-\x98\xc6\x10\x865\xde\xc05n0\x8f\xbcU0\x8bG\
-,\xa1\x1a\xc7XN)=\x87\x0e\x1c\xe0\x02\xfd\xb2\xf9\
-\x80\x09\xf7%\xc9\xfc\x82A]\x17k\xcf\x05A\xb2\x13\
-\xecJ\xd0\x87'\x94\xb9\xc3N\xbd\x8f:\xeb\xd5]\x9e\
-<\x07\xb4\xear\xfb\xc1&\xf6\x5c\x99\xf2\x9c\xc3\x95\xfb\
-\xb1UP\xa1\x15\xf6\xd8\x1dX\x99\xf7\x18\x09\xde$\x93\
-\xd8\x0a\x12\xc8d\xd6m\xcf\x1f4\xc7?\x9fZ\xd7J\
-)\x9eu\x12\xb2\x9e\xc1\xad{A&\x0a\xb2/\xe2,\
-\xd8\x93\xd9\xbfkbi\xb5\xdd\x9f'\x8d\xea\x5c\xe7l\
-\xad\xc9s\x0awnm\xf7\xf2'\x81m\xd6k+M\
-\xeel\x12_X\xb1\xd2\x93\x12\xf8\xb2\xc7uL\x12\xb7\
-\xe0\x15\xad\xda\xff\xa8\x7faR\x0b\x96]\xc6\xba\x83K\
-7\x1dI\xf2\x86\x9a\xf0\x12\x93\x12\xe4\xf5\xef\xba\x1aT\
-'\x97X\x99\xd6B\x98$\x97\xb2\xff\x1b\x7f\x03A\xbd\
-\xebO\xd4\xf0\xb3q\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07.\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:44-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:44-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:22cfb045-a13f\
--6347-b8cc-3667e\
-ed2fffd\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:144e8317-8905-1\
-a40-be7b-f0ea207\
-582e4\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:350b05c\
-9-0ff7-ab4a-8585\
--1bc51e25f8c9\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:350b05c9-0ff7\
--ab4a-8585-1bc51\
-e25f8c9\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:22\
-cfb045-a13f-6347\
--b8cc-3667eed2ff\
-fd\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:44-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xbcT\
-\xc5\xb2\x00\x00\x00\xe3IDAT8\x11\xa5\xc11+\
-\xc4a\x1c\x00\xe0\xe7\xbd\xfb\xc5\x89A\x97R\x06|\x07\
->\x85\xc9,\x99|\x00\xa3\xb2\xcad\xf6q,f\x8b\
-]\x19\xf4\xde\xa0H\x22r\xf7\x7f\x0d\xef\xa0\xee\xee_\
-\xc7=O*\xa5\x98G\x0c\x06\x83m\xacc\x88dv\
-\x1d\xdc\x07\x8eq\x84g\x84v\x0dF\xaa\x82E\x9c\xa6\
-\x9c\xb3?\xe8\xa1\xf8\xf5\x1d\xd8\xc3.>\xd01\xa9\xc1\
-2npmL`\x13;xC\xc7\xa4\x11V\xf1\xa0\
-\x0a4\xaa\x92r\xce\xe6\x118\xc1>^\xd1\xd5\xae\xa0\
-Q\x15,\xe02p\x8b/|\x22i\xd7A\xa0\xa8\x02\
-\x8f)\xe7l\x06\x09\xc5\x14\x81\x0b\x1c\xe1\x05]\x93\x86\
-X\xc3\x15\xce\xb1\x84\x91j\x98r\xce}\xac\xa0\xd1.\
-\xf0\x84wc\x02}l\xe0\x1b\xc9t\x05[XP\x15\
-tq\x178\xc4\x01^\x10\xda\x15\x14U\x83\x1e\xceR\
-\xce\xd9<B\x95\xfcO\xf9\x01\x1f\x94D\x09\x07\xa6\x05\
-\x8a\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07k\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:17-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:17-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6cddefc2-0c27\
--e94e-920f-05cb0\
-06e038a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:06f36cb0-069f-3\
-740-bc95-7c2ac45\
-326f3\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:792ee7c\
-e-f07d-ff49-ac6c\
--2c2797330da9\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:792ee7ce-f07d\
--ff49-ac6c-2c279\
-7330da9\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:6c\
-ddefc2-0c27-e94e\
--920f-05cb006e03\
-8a\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:17-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xbd[\
-\xf2.\x00\x00\x01 IDAT8\x11\x8d\xc1=k\
-Sa\x18\x00\xd0\xf3\xbc\xb9F\x1d\x14\xf1\x0f\x08\x1d\xea\
-\xd8\xb1\x83\xd1Q\x8c\x9b8\x08\x9d\xc5\xd9\xc5\xc9\xcd\x1f\
-\xd0\x7f t\x145S\xe9\x5c\x04Aqu\x12\xdc\x84\
-[\xea\xe2\xe0\xd0|\x98\xbc\x0e\xcfp5\xe4V\xcf\x89\
-\xb6m\xfd\x87@\xc5C\xeca\x85)^\x14)\x10\x08\
-\xe7{\x8c\x06\xaf1\xc2\xbd\x22UTT\xe7\x9b\xe2-\
-\xde\xe0\x03\x06\x0d\x06\xb8\x8a\xc0\x02?\xf5\x0b\x5c\x91.\
-\xa1\x16<\xc5G\x1c\xe1\x18\xb7\xa4b\xb3\x95N\x14\x8c\
-0\xc1}\xcc\xb1#5\x08\x04\x8a\x1e\x0df\xf8\x82\x1f\
-8\xc1R\x9a\xeb,\xf5hPpY\xba\x88\x85\xf4\x12\
-\xd7\xd0\xe0\x1d\xf6Q\xac)R\xd5\x99\xe2\x06\x1e\xe1\x10\
-\xdf\xf0D\x8f\xc6f\x03|\xc5\x01>cW\xaa\xd6\x14\
-\x9bU\x0c\xa5\xeb(RXS\xa4\xd0o\xa5S\x11\xfe\
-PP\xfd\xadJ\xd5\xbf\xd5\x82\xc0\x5cZ\x22\x10\xa8\xd2\
-L'0\x97~\xa14\x98\xe29n\xe3\x0e\x0e0\xc3\
-M\xbc\xc2\x16.H3<\xc3\x08wq\x18m\xdbn\
-c\x8c!N1\xc1\x19\x1e`\x0bK\xbc\xc7'lc\
-\x8c!\xbec\xf2\x1bb\x8cH\x8a\xab\xd0\xe5.\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07x\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:56-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:56-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:dae97c60-30bb\
--5847-99d1-3f259\
-57fd6aa\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:1a74a032-8b4d-4\
-b43-ba78-1d4597f\
-2154f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:f732e0f\
-b-c5bc-5c44-a1e7\
--46b31c22bdf2\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:f732e0fb-c5bc\
--5c44-a1e7-46b31\
-c22bdf2\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:da\
-e97c60-30bb-5847\
--99d1-3f25957fd6\
-aa\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:56-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x8d\xb2\
-\x1f\xe0\x00\x00\x01-IDAT8\xcb\x8d\xd3;/\
-\x84A\x14\xc6\xf1\xdd\x97\xd5lH\x14\x12\x8d\xe8lA\
-\x10\x05\x8dB\xe2\xb2\xad\xa0\x14%\x8dh\x96h4h\
-\x94Z\x11\x84\x84\x04\xd1\xf9\x08\xd8\x08\x12\x82\xa8\x5c\x0a\
-y]>\x85\xff$\xcf$'kg\xb2\xc5/\xb3g\
-\xe7\xe4\xcc\xcc\x99y3i\x9afj\x90\x84\xe6b\xc9\
-%\x9c#\xa7\xb8\xae\x96\x02Y\x8dm\xb8\xc5%\xcah\
-\x0e\x15\x09\xad\xde\x8bg\xfd\xde\xc4+\xda\xab\x15\xb1+\
-'f2\x8f',)^\xc5'\xfa\x14\xd7\xdb\x02\xd9\
-@\x83:\xf0\x8eY\xc5\xf3\xf8A\xd1\xee\xc4&\x8f`\
-H\x86\xd1\x85\x13\x1c\x99\xa2\x13\xf8\xc5\x8c\xdd\xc1$^\
-p\x81+)ktg_Vr\x83\xc6A|a\xd1\
-\x178\xc6\x81I\xcaE\xde\x83?{\xa7z2\xee\x82\
-1<\xe2Nn\xf0\x81)%W\x16\xf4\x8d>tM\
-\xf6\x7f\xb6`\x00\xfd(`\x07\xfb\x81\xbb\xf7M?\xc5\
-B\xe8\x16z\xf0\x80&S$\xa9\xb8jw\xecR\xe8\
-\x1d4\xe2\x1e\xdd\x81^\x8c\xe2\x1b\xd3\xd5&}\x91]\
-\x5c\xeb\x16\xd6\xb1\x86\x15\x9c\xe1\x0dsn\xd1\xd8\xc7\xe4\
-:\xbd\xa5~l\xcb\x1e6\xd0\x1a\xfb\x1ac\xaf\xf3\xdf\
-N\xff\x00\xeb\xf4\xe48\x9a\xb1\xa9\x13\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07#\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:07-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:07-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:9d505237-c1ab\
--4c46-bbe4-cd10d\
-cc20172\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ae4758d7-e9a9-b\
-e40-8881-16cd5d2\
-ec7ff\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:b3105db\
-f-8357-dd49-b940\
--192c8d4529ad\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:b3105dbf-8357\
--dd49-b940-192c8\
-d4529ad\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:9d\
-505237-c1ab-4c46\
--bbe4-cd10dcc201\
-72\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:07-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd3L\
-\xc3\x1b\x00\x00\x00\xd8IDAT8\x8d\xc5\xd21\x0f\
-\xc1@\x14\xc0qT\x22\x06D,6\xb3\xc5\xa4\x16\x12\
-\xd2\xd9n\xb5\xf8\x16\x8c\xbe\x8b\x0f\xc1&\x11\x91\x10\x22\
-\x11\x1f\xc0\x8d&\x83\xad\xfe\x8dwI\xb5\xbd\xf66M\
-~\xb9\xa6}\xf7\xfa\xde\xbd\xe6|\xdf\xcf\x05\x94R\x05\
-\x83\xbc\x8eIb|aK\x7f\xbd\x08\x17\x1e\x86\x18\x85\
-\xb4\x83J\xb2\x12T\xb0\xc2\x11;\xec\xb1\xc5\x1d\x1b\x94\
-%.\xd6Njyl\xe8\xe0\x82\x92U\x02\x1d\xc0\xea\
-\xc8\xeaJUv\x09\xc2\x13\x91\xb5\x8b\xd3_\x128\x86\
-\x04\xb1id\x1d\xe2O\x02\xab\x1f\x89\xe0*\x1ar\xdf\
-\x93\x04z\x8c\xadh\x1bIe\x8fqC]~\xa2\xab\
-<\x9f\xe2\x80\x9a\xcd\x18\x978c\x825f\xea{y\
-\xd1\xc3L\xeb\x7f\x81\x17\xdex`\x90t\x90Yc\x9c\
-\xe3\x89~\xb8M\xeb)\xc8\xa6\xa6i\x84\x81\x0f\xe5\xdb\
-\xfd\xa3H$x\x98\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07z\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:22-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:22-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:5b44362e-3307\
--9b42-bcba-3c429\
-4135bb9\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c1f4431b-943b-6\
-945-9250-8b13d2b\
-03faf\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d48424b\
-6-4db2-7f4a-8f70\
--d01c43fe9f7c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d48424b6-4db2\
--7f4a-8f70-d01c4\
-3fe9f7c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:5b\
-44362e-3307-9b42\
--bcba-3c4294135b\
-b9\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:22-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>6\xf6\
-y\xec\x00\x00\x01/IDAT8\xcb\x8d\xd3=+\
-Gq\x14\x07\xf0\x9f?2\xcbD2\x19X\xcc\x16\xbb\
-2K\x06\x0c\xa4<-\x88\xd9\x8b0X<\x14\x85$\
-$\x0foB\xe4)\xa5\x98>y\x07ba9\xb7~\
-\xdd\xee_\x86\xdb9\xf7<|\xcf\xb9\xdf\xf3\xbd\x09\xa9\
-\xe2\xa9\x85\x1dDO\xf8MU\xb5\x7f5\x0f\xe3\x07\xef\
-\xe8*\xe5\xea\x024\x84\x9d\xc4\x1b\xeeq\x87[\xf4U\
-\x81T5'\xacc\x00[\x98\xc0\x1cf\x22\xd7\x98\xd7\
-V5\xe7\xfe\x09f\xeb\xe4j\x05@\xb1\xd2\x0c6\xc2\
-o\x0e{\x1c\xd3\x8b\xa6N\x5cd\xc46\x16\x89\x11\xbc\
-\xa2\xbf\xc4\xc9a\xf0\x91\xc7V\xf0P\x10\x9b0\x14l\
-?\xe1\x00\xd7\xb8\xc29>\xf0\x88\xb3\x88_F\xcdg\
-\x0clK\xe8\xc6K\x00\x8ca\x0a\xd3\xe1\xdf`\x0f\xa3\
-\xf1\x89\xe3X\xc6w\x10\xdcT\xac\xd5\x1e\xc5K\xa5u\
-\xf7\xe3\x0ay\xec\x0c\x9b\xf9\x15\x0a\x85\xf5\xc6\xf4T\xba\
-\xc2B\xf6\xde\x81\xf98eB-U\x88\xa3!\xd8N\
-8\xcaH\xec\xa8\x12]9Pls\x8a5\xec`5\
-6Y\x8c\x5c\xcb\x7f\xa4\xdc\x1d\x12\xfe\xc4\x17\xb63m\
-\xfc\xfbgj\xc73v\xeb(\xb1.@\x0e\xd2\x9aM\
-\xaeU\xd5\xfe\x02\x99\xb1\xe6\xd7Re?b\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07\x8d\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:28-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:28-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:c5cd4124-10b5\
--784c-ae6f-40e8d\
-2fd429c\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:5a81ca79-1a1f-2\
-b46-bb20-c9c4586\
-67e0e\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:30f0cd8\
-0-f34a-5b44-8278\
--a4ae9c65c55c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:30f0cd80-f34a\
--5b44-8278-a4ae9\
-c65c55c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:c5\
-cd4124-10b5-784c\
--ae6f-40e8d2fd42\
-9c\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:28-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xbdR\
-\xf1\xd1\x00\x00\x01BIDAT8\x8d}\xd2\xcd*\
-FQ\x18\x05\xe0\xf3\xf9\x98\xcao(#\xa1\x84\x81;\
-0\x91\x0b\x10\x19\x19\xc8X10\x92\x89\xfc$)\x0a\
-\x190\x22#nBR\x0c\x14\x22\x7f\x89\xf2\x8c\xc9\x0d\
-\x18\xd8[\xbb\xd3\xe1\xd4\xdb\xd9\xe7\xddk\xad\xb3\xd6\xbb\
-w\x86\xec\x8f*\x85w\x03\xd6\xb0\x8b\xf6\xd0+G\xdc\
-_\xe4T\xe0\x00\xc7X\xc7+zR\x91\x22B\x05*\
-\x93\xfe\x09\x06\xc2z\x1a\xef\xe8\x8e\xd8,!\x15\xb9\xa8\
-\xc7\x05\x8e\x92\xde\x94\x9f\xa77:\x88\xe4n\x9cb\x09\
-\xfd\xd8\xc6\x0b\xf6\xd1\x9c\xcb>\x83;4D\xd56\x5c\
-b\x19\x87x\xc2\x16\xbar\x8e\xca\xa8\x09\xeb3\x8c\xc5\
-\x8d!|\xa16|W\xe7f\x13g2\x8b7\xec\xe0\
-\x16\xed\xa9\xfa\x22\x1e\x13\xbbU\x81\x1c#\xf6\xe2\x1e\x93\
-\xe1X\xfb\x8a\x8eq%\x884%\x96\xa3\xc0\x0e\xf6\xf2\
-\x83\xce\xe7\x8bN\x9e\xd0\x98\xecu\x84\xbfw&\xd8R\
-*PJ\xc0\x0b\xf8\x0cCm\x09\xbd\xe1\x90\xb9\x9c\xc7\
-\xe7\xc9[\xb8\x09\xc3\x5c\xc2\xb3\x9f\xbb\x90\xe1\x1c\x13r\
-\xf7&\x8d\xb0\x89+\xd4%\xbdU\x5cc\x14\x0f\x18)\
-r\x90a#\x00\xe31V&\xa0y|`\xbc n\
-\x96a.\xe4\x8b\xe4r\x0a\x08U[\xd0\xfb\x15\x18D\
-\xeb?\xe4\xa2A\xff\xd67\xed(\xe5\x0d\x92\x10c\x9c\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x93\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:57-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:57-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6a65f4f9-710f\
--8d46-91f9-8a6a0\
-6a2835d\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:d348cef8-c55b-1\
-e47-858b-0fe9c46\
-5a36c\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:eaf9993\
-f-8c4b-0a43-8a2e\
--5316b4425494\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:eaf9993f-8c4b\
--0a43-8a2e-5316b\
-4425494\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:6a\
-65f4f9-710f-8d46\
--91f9-8a6a06a283\
-5d\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:57-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>*O\
-\xa5[\x00\x00\x01HIDAT8\x11\xa5\xc11j\
-\x14Q\x18\x00\xe0\xef\x7fL\x9c\x1dW\x04E\x17\xa3\xa0\
-\x85\x85(\x88\x07\xf0\x06\xe9\xb4\xd3\x0bx\x8b\x80X\xa6\
-\xf7\x06v)llSXh\x13\x89n%\x12P\x04\
-gU\x08DH\xd8\x8c\xc9\xe49\xf0\x8a%\x9d\xb0\xdf\
-\x179g\xcb\xa8f\xb3\x99\xff\x10\xc8\xce\x0a\xe4\x0a\x81\
-\x0a\xc7\x08T8A\x8d\x0a=\xe6\x08\xd4X\xc1\x09\xe6\
-\x06\x09\x0f\xb1\xa9x\x80W\xb8\x87\xcf\xd8\xc2\x14\xeb\xb8\
-\x8bml\xe1#^\x18$\x8cq[q\x1e\xb7p\x09\
-\x81gx\x895\x5cF\x83'\xd8\xc0#\x8c\x12z\xcc\
-\x15\xc7\x98+~c\x07\xdb8D`\x0f\xbbx\x8f\x0e\
-9)*\xc5\x05\x84\xa2R4H\xc8\xa8\x15W\xd0 \
-*\x1c\xe1&\xdea\x15_\x10\x162\x12:\xdc\xc0\x14\
-\xd7\xb0\x89\xa3\x84\x1a?\xf1\x14\xcfQ#;+\xa3\xc6\
-w\xac\xa3\xc3\x86AB\xc2!\xbea\x07\x81\x8cSE\
-\x8fS\x04z\xbc\xc6\x14\x8f\x0d\x12\x02\xb5b\x8c\x0a\x81\
-\x11F\xb8\x88\x06\x81Z\xf1\x01\xf7\x0d*\xfc\xc5\x9e\xa2\
-\xc3\x1f\x1c`\x15oq\x15o\xd0a_q\x80}\x83\
-h\xdbv\x8c\x09\xbe\xa2\xc1\x04\xbfp\x07\xe7\xd0\xe3\x13\
-j\x5c\xc7.&X\xc1\x8fh\xdb\xd62\x92\x22,\x84\
-\x22!!Y\x08E \x0c\x22\xe7l\x19\xff\x00\xde\xf5\
-W_DA\x9f\xaa\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07\x9d\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-36-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:55-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:55-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:ab36d83f-4ba9\
--2f46-927d-30c9a\
-77bfc0e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:4fc0dd05-a831-a\
-d4a-b63a-0e0b4cc\
-118c5\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d6b6fcd\
-4-a025-ac4e-8cd4\
--7c922c32dd41\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d6b6fcd4-a025\
--ac4e-8cd4-7c922\
-c32dd41\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:36-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ab\
-36d83f-4ba9-2f46\
--927d-30c9a77bfc\
-0e\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:55-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xc0\x84\
-\xba\x0c\x00\x00\x01RIDAT8\xcbu\xd3\xafK\
-\x04A\x18\xc6\xf1u\xf5\xee0\x89(\x08\x22r\x82\x9c\
-A\xc5\xb8X\x0c\x96;m\xc2\xf9\xa3j\xd0\xae\xa0U\
-\x8c\x82\x18\x0cf\xc1$\x88\x82\x18,\xa2\xc8\x99\xf40\
-\x19\x04\x0d\x86\xf5\xfe\x04\xa3\xdf\x81\xf7]^_v\xc3\
-\x87\x9d\x9d\xdbyg\xe6\x99\xb9(M\xd3\xc8\xe8\x12\xfa\
->\x8e\x04\xfd\xa6/\xb6c\x22W@u\xcb\xf3\x0c\xdf\
-x\xc1%\xa6\xccDY\x01})\xe1\x18\x13\xa6\xd0\x1d\
-v0\x82#t\xb0aWbg=\xc5/\xee\xa5X\
-\xe8;A\xd3|\x93H\x91\x15-\xa2?\xac\xe2\x1d\x15\
-\xdc\xe0<gKei/\xe0\x13\x03v\x05\x8f\xd8\x94\
-v\x1f>\xb0\xed\xf2\x08z\xe4y\x8b=-0\x8aW\
-\x0c\x9b\x0f\xa7\xf1\x83E\x1f\x9a\x08\x93]i\x819<\
-`F\x82\xd2\x8f\xd6q\xed\x0a\xd4p\x80y<\x87\xac\
-B\xe7,Z\x18\xc3\x92\x1b\xd0\xebf\x1eB\x1d\x0d\xd9\
-v\xac{~3g\x1c\x17\xdc\x0dk_\xeeH\x16\xe2\
-\x05\x0e\xa5].\x18dsh\xcb\xc9e\x05&\xe5|\
-\x13\x97vM\x96m\x0b\x85\x89\x9e\xecM\x8cMh\x1d\
-\x93|$\x81\xd5\xdd\xe0/TuU~y\xcbrI\
-\xc29oI\xda\x0d\xd9s[f\xae\x16]e]\xc9\
- v\xe5\x9c[\x92v\x08l-\xef\x1f\xe9\x83\xf2'\
-P\xca\xe9\xfbw\xa9\xfe\x00\x84\xd5\xe4\xc6\x12\x8b\xba\xc0\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xa7\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:17-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:17-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:35251ae0-9880\
--8c4b-9062-80915\
-60cc9c5\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:7d1fc590-eca7-f\
-24d-92f2-57469a5\
-7186b\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:352b6b3\
-c-b900-d446-bb91\
--76bd47ba1694\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:352b6b3c-b900\
--d446-bb91-76bd4\
-7ba1694\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:35\
-251ae0-9880-8c4b\
--9062-8091560cc9\
-c5\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:17-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x8e\xc9\
-\xc3\x19\x00\x00\x01\x5cIDAT8\xcb\x8d\xd3O+\
-\x84Q\x14\xc7\xf1;c\xcaLaf\xb2\xa5\xacl\x08\
-ER\xcc[\x98\x05\x16l,\x88\x85\xb2\x14I\x8a\x17\
-\xc0\xd6\x82\xd9XM\x16\x14\x8a\xf2\x024(\x16\xc8\x9f\
-Rh\xb6\xde\x82\xef\xads\xea\xd7\xd3\x88\xc5\xa7\xe7\x99\
-g\xee=\xf7\xdcs\xcf\x0d\xf5z=\x98\xb4=3\x98\
-\xc2\x0e\x0eP\xc1\x16\xc6\x1a\x8c\x0d\xfe!e\xcf2\x1e\
-p\x87=\xacb\x03\x87x\xc6\x19:5\x88F[\xc2\
-7\xe6e%U\xc0.>\xd0\xebA\x82\xac\x1c'\x0f\
-Jt\x17\xb3k\x92@+\x96M\xc13\xc8X\xda\x0b\
-R\x83\xf0\x0b\xcf\xf6\x08\xdb\x1e \x16\xec^\x06e\xd1\
-\xd6`b^\x82\x0f\xe0\x09\xc5`\xd5\xae\xc8\xe0E\x5c\
-\xd9\xbb\xa7\xde\x8d/)`\x5c\xe4\x06\xa5`G\xb5&\
-\x01z0\x99\x08P\xc4\x0cZd\xdc1\xe6\x82\x9cs\
-H\x14\xeb/\xe7q\xfb\xf1e\xd3\x8a\xa2\xd5\xef\xc70\
-\x86\xecdF\xd0%\x93[\xad\xf0}\xf1\xc7(\xde\xd0\
-n\x7f6\xe3\x04\x8f\xb8\xc55\xde\xb1,\x01\xc6Q\x8b\
-\x19\xfb\x87\xd8a\xfb\x92E\xced\x8d\xbf\xfb\xf8\x18|\
-V[\xb9\x03\x9fX\xff\xc7\xde/Q\xd5\xbb\x90\x96\xea\
-\xbf\xe2\xd4\xf6\x9e\x93I\xb1\x07&l\xe5\xaa\x14;\x95\
-\xec\xb0\xbcu\xd8\x8b]\xa8X\x8b\x0bk\x9a\x9a\xa7\xad\
-\x17\xb0Q\x9b\xfa\xb9\x97l\xc2t\xacv\xe2\x88\xfd\xf6\
-\x86\x1f\xc1\x97\xea\xc8\xea%\x8cG\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07P\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:22-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:22-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:280c3c82-fb61\
--9848-801e-51d32\
-dbb76f7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:727c23e0-a09c-0\
-547-8742-e3fa8ab\
-c7d56\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:76db3ca\
-a-5ad9-1c44-a0e9\
--e4fce9b320bd\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:76db3caa-5ad9\
--1c44-a0e9-e4fce\
-9b320bd\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:28\
-0c3c82-fb61-9848\
--801e-51d32dbb76\
-f7\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:22-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x08E\
-\xf1w\x00\x00\x01\x05IDAT8\xcb\x8d\xd3\xbdJ\
-\x03A\x14\xc5\xf1\xf8Q$\x8de@+A\x90\xa0\x95\
-\x8f`0\x8d\xd8\xd8\x08\xfa\x08\x8aE\xd4G\xf0-\x04\
-K1\xb5/`\xa3\xa8\x9d`\xa3\x08\x22\xe8O\xb1\x10\
-|\x82M3\x0b\xd7e\xb2l1\x0c;\x97\xff\x99s\
-\xe7\x9em\x15E\xd1\x9a\xb40\x93\xf65\xf4\xe3Y\xb9\
-\x9a\xc0+x\xc7\x1f6\xd2\xd9t\xad@\x05\xfe\xc2\x01\
-6\xf1\x81A\xaaMe\x05*0\x0cCm\x84\xc7\x89\
-\x0e\x02\xbc\x9an;\x0a\xb5\x13\xbc\xa0\x97uP\xaa&\
-X\x05\x1e&\xc1^\xf6\x0d\x02\xdc\xc3'\x8e\x03|\x98\
-\xe0\xe5\xf4=\xfbo\x0a\xa5\x15,\xe1\xa7\xd2\xf3>~\
-\xb1\x98\x83\xab\x02]\x5c\xe3,\x08l\xe1\x15\xdb\xb9\x0c\
-\xe4Z\xe8\xe0\x1e\x17Ad\x90\x9c\xed\xd4\x06)L\xa0\
-\x8d\x1b\x5c\x86\xda:\xbe\xb1\x97u0A\xe4\x16\xa3P\
-\xeb\xe3\x19\xbbM\x83\xd4INb;Wx(\xe1&\
-Qn\xe3\x0e\xe78\xc5\x13\x16j\x1d\xd4\x88\xbc\xa1\xdb\
-\xe8g\xca\xa4s\x0e\xf3\xb9)\x8c\x01[\xaf\x04d`\
-$Ct\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x81\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:36-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:36-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:51c03d8c-315d\
--d54c-984e-2806e\
-99f4f1e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:3bc258cf-7134-7\
-e4f-8a00-662b2e2\
-14929\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:3d94788\
-6-3906-a644-be7f\
--d026a9e996eb\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:3d947886-3906\
--a644-be7f-d026a\
-9e996eb\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:51\
-c03d8c-315d-d54c\
--984e-2806e99f4f\
-1e\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:36-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x85\x95\
-\xaec\x00\x00\x016IDAT8\xcb\x95\xd2\xcf+\
-DQ\x18\xc6\xf1\x19\xc3\xb0aea\xa34\x1b\x0bI\
-I\xa8I\x84&\x1b\xc2\x1eE\xb1\x91\xa5?@v\xb6\
-\xb3\x1a;Ia\x9af\xa9\x94D\x0a\xb1Q6$Y\
-\xb8EJY*\xf1=3\xef[g\xde\xee\xfc0\xf5\
-\xb9\xb7s\xe7\xbc\xcf}\xef9'\x12\x04A\xa4\x8c:\
-\xb9w`\x17\x0b\xe6y\x81-\x88\x86\x04%\xf1\x85W\
-,\xdb\x90\xb077\xa0\x19-2\x9e\xc4)\xba\xf0\xe1\
-\x85\xc4l\xc0\x1c\xceq#nq\x85'\x5c\xcb\x9c^\
-\xbcc\xc5v\xb0\x85\x07\x09\x19\xc4\x80\xd1\xe9\xb5\xdd\x87\
-\x17,i\xc0\x04\x9e\xd1ZaAU\xa3\xdc\xd7\xf0\x83\
-67\xd8\xc6\xa6\x99\xd8\x8f1\x8c\x8a\x1e\xaf\x83TP\
-\xfcMi\x07\xfb\xde\xc2t\xe3\x0cw\xb8\xc4\x05\x1ee\
-=\xdc\xff\xe3\xf8\xc4\xac\x8c\xa3\xeer\x88E\xc4q\x8f\
-\x0d4y\xdd\x0c\xe1\x04\xc3R<mw!\x87\x19\xac\
-\xe2\xc8+\xac\xf7\x02\xbe\xf1f\x8b5\xe0@:\xc8\xca\
-.\xe8\x04=T\xedH\xcby()\xd6\x80\x1di\xdb\
-\xeduB\xbf\xad\xca\xf1.\x09p\xbbp\x8c|\x85\xc2\
-XX\xb1\x06d\xf0\x8bu\xf3\xed5q\x97=\x09H\
-\x96k\xb3Z\xc0\x08\xe6\xbdS\xf6/\x7f4\xa4\xe7\xd1\
-@\x19P2\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\x97\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:51-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:51-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:04b194b5-dc31\
--b947-9abc-8cc30\
-289ad9b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:d98b6ff2-6bba-5\
-a43-8a6b-ea19413\
-b4f39\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:ea13bab\
-3-95fc-6845-8bf3\
--fdff0622c850\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:ea13bab3-95fc\
--6845-8bf3-fdff0\
-622c850\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:04\
-b194b5-dc31-b947\
--9abc-8cc30289ad\
-9b\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:51-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x0f\xb6\
-=\x14\x00\x00\x01LIDAT8\x8d\x8d\xd2\xcb+\
-\x05a\x18\xc7\xf1s\xce\xe0Pl\x5c\x16\x94\xa5\x8dd\
-\x81XJnec\xa1\xa4\xac\xd8\xd8(\x1b;\x97\x8d\
-\xcb\xc6\xe6$\xa2,,H\xb1\xb2s\x92\xa2\xe4^\xe4\
-\xbaa#\x99\xbf\xc3\xf7=~\xa3\xa71s8\xf59\
-\xf3\xbe\xf3\xbc\xef\xf3>\xf3\xcc$|\xdfO\xfc\xa1\x1a\
-i\x8d\x93\xe1x\xdc\xa6`a9\x9ep\x89\xca\xa8$\
-q\x09R\xba\xce`\x1f[X\xd1=/.A\xb8\xbc\
-b\xbc\xa0\x0d\x1d8\x8eZ\x1b\xb5\xb1@\xd71\x9ck\
-\xbc\x89\xa5|\x8f\xe0J.B\xa1\x09^cX\xe3[\
-\x0ch\x5cb\x0e\xc9%h\xc0\x11np\x8f^\xf4\xe0\
-YI\xdd\x9a\x03|\xe2\x0cWx\xc4h\x90\xc05\xea\
-\x045\xd8\xc3*\x9a\xd1o\xaa\xa9B\x8b\xfaQ\x8f\x11\
-\xbc\xa1\xcc\x05\xd70\xab\x85S\x9a\xc75\xd6r\x87\x0e\
-\xb9\xc16&ts\xd1$H\x87\x12\xa5\xcc+,\xc5\
-\x03\xfa\xdcd\x07\xe3\x0a,`=\xb4\xd1\xd3\xe6\x94i\
-\xf2\x1c\xb2A\x0f60m\x02\x19\xb4b0\xa6\xf4Z\
-\xbc\xa3)H0\x8f]\x053jb\x1d>t\xbf\x1b\
-\xed\xe8Ts\xb3\xa6J\xcf\xfdu\xe1\x15\xa7\xfe\xf7o\
-R\xc1\x0a,\xe3\x0e\x17\xe2\xbe\x87C\xc5r\x8fh\xcb\
-j\xd4\xc9?\x1f\xc9\x7f\xe4\x0b\x06\x9dO\x9a\xf9\xafW\
-\xfb\x05\x5c\x01\xe7>\xd5Rq\x06\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07\x85\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:43-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:43-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:5201b86c-29f9\
--164e-a372-2fb0a\
-48eeeb6\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:6cada50c-7d04-8\
-844-a853-1de16a5\
-379f6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:852ae68\
-2-8c8e-b24b-95c6\
--0c1895f87395\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:852ae682-8c8e\
--b24b-95c6-0c189\
-5f87395\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:52\
-01b86c-29f9-164e\
--a372-2fb0a48eee\
-b6\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:43-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xa2e\
->\x09\x00\x00\x01:IDAT8\xcb\x9d\xd3;J\
-\x03Q\x14\xc6\xf1D\x0c\xf8\x88\xcd\xe0\x06\xb4\x10_\xa0\
-Qq\x07\x96\xe9\xb2\x00\xd7\xe0\x03EP\x14\xb5\xb1\xd3\
-A\xc5W\x14\xf7`aZm\xd4\xc4\xc2\x22\x8a`;\
-`\xa1[\xd0\xff\x81\xef\xc2a\x18\x13\xb0\xf8qgr\
-8\xdf\x9c\x9b\xb9\x93K\x92$'\xbd(\xb6\x10\xea}\
-(\x84\xbe\xd0|\x83W<\xe1\xd9iH]\xf7V\xbf\
-\xc77\x16B@\x0f\x9a\x98\xc7\x08J\x98\xd0:#\xb3\
-Z\xc7p\x8b\x1f\xc4!\xc0F{\xc0\xb0\xdbJ7:\
-\xdd\xf6\x82=\xd4\xd4|\xe4\x03\x1aJ\xdf\xc6;\xdep\
-\xadZh\x8e5\xa9\x05/\xe2\xc2\x07\xd8\xde&\x11a\
-\x1c\xa3\x18@^\xcd\xfbxA\xbf\xee\xb7p\x96\x0e\x98\
-\xca\x18\xd97G\xee\xb7\xf5\xac\x80\x92\x8a\x85\x8c'G\
-\xae\xd66\xa0\xe3\x8f\xe6\xaeV\x01\x8f\x98n3\xf6\x01\
-*\xba\xdeL\x07\xd4\xdd\x04q\xc6\x93\xad\xf9\x13\x1f(\
-c\xc9\xbf\x85\xa2\xce\xc1\x90\xdes\xd3\xfd\xdb\x05\xa9\xa8\
-\xd9N\xec \xd6p\xee\x03\xeeT\xac\xf9s\x9eRV\
-\xb3]/\xe3$\x04\xd8\xc1\xf8\xd2\xf1<\xc6\x0av\xf5\
-\xae\x83\x1d\xacbC\xabm\xf1\xd2\x7fL\xf6a\x1c*\
-\xa0\xaa\xf1\xd2\xaa\xda\xf7)\xae0\xe7\x03\xfe+\xff\x0b\
-i\xbd\x007-\xd1'\x17\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07N\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-34-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:42-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:42-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6bde2528-4e3d\
--7f4c-ac55-d513d\
-a4ddcc7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:67782750-f519-d\
-447-87df-f1ee238\
-f3dec\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:1f110c0\
-f-f990-584c-b34a\
--364e27541aa0\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:1f110c0f-f990\
--584c-b34a-364e2\
-7541aa0\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:34-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:6b\
-de2528-4e3d-7f4c\
--ac55-d513da4ddc\
-c7\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:42-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>M\x9c\
-\x82\xfb\x00\x00\x01\x03IDAT8\x8d\x95\x92\xcb\x0a\
-AQ\x14\x86\xcf\x85\x89\x99\x09)\x942\x16\xe5i\x0c\
-\x94)ELdb\xe22\xf1\x0e\x8a\x90K\xc9\xd4\xcc\
-C(\x03E\xa83\xf6\x08\xfeuZ'\xcbv\xd8\x0c\
-\xbe}\xf6\xf5_\xff:k\x19\x8e\xe3\x18\x82\x0c\xe8\x80\
-1\x18\x816H\xf3\x99\xa9\xdcu\x91\x8b.8\x83\x09\
-\xa8\x83\x06X\x82\x0b\xa8\xfa=\x96\x02=p\x00)\x9f\
-K9\x16\xa9\xf0\xdaR\x05\xb2\xe0\x04\x92\xbc\x19\xe0K\
-\x16\xcfi/\x0fn \xae\xa6C\xc3\x00L\xc5c\xd5\
-\x81\xb77\x07-\xd5\x05\x0d}P\xfa\xf2\xa3<\x81\xa6\
-\x08\xf4\xe2@\x87'P\xe3\x9f\xfa&`~*\x91\x8f\
-\xc0\xe2_\x076\x08\xfa8\xb0\xf8\xec\xa7\x14\xcc\x0f\x02\
-Z\x07d\xbd\x08\xc2\xbc\xa6\xe6Z\x89\xf3\x02H\xe8\xa2\
-\xaf\xc1\x8e\xe7e!@\x95;\x82\xa8\xce6\xb1\x053\
-.\xe3\x90\xbf\xd4\xf2\x09]\x0aR\x84\x22\xdf\xc1\x15\xec\
-\x9dg\xd7\xda\xba\x14d\xdfo8rL\x96\xf7\x97*\
-x\x22!\x10\x11\xe5u\xcf\x1f\xd9%\xd7\x13d\xe5V\
-\xce\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x84\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:33-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:33-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:d5f2d36b-264a\
--0b4d-8d1a-c543e\
-b2876cc\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e3b94bdc-e394-9\
-249-ad6a-ced6f0c\
-3c91b\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:09b0b59\
-2-d6ba-bb4c-8ef5\
--411f176bf225\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:09b0b592-d6ba\
--bb4c-8ef5-411f1\
-76bf225\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:d5\
-f2d36b-264a-0b4d\
--8d1a-c543eb2876\
-cc\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:33-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x87\x0e\
-\x87\x1c\x00\x00\x019IDAT8\xcb\x8d\xd3\xbbJ\
-\x03A\x14\xc6\xf1d\x13c\xaf\x8d\xa8\xb1\x12\x14\xc1'\
-\x10_@l\x05A\x88DT\xc4\x14A\xadl|\x0c\
-\xd1FD\x82\xe0\xfd\x0a\x16A\x10\x04{\xc5\x0bXX\
-\x04\xd9G\xd0\xd6\xff\x81od\x18w$\xc5\x8f\xd9\x9d\
-\x99=3s\xe6l.M\xd3\x5c\x86D\xed\x04\x86\xf5\
-\x5c\xcc\x9a\xfb\xdf\xc7S\xf8\xc2\x0b\xca\xc1X4@^\
-\xed\x1cZ\xb8\xc1=\x1e1\x12\xcc\xf9\x13\xc0\x1f\xd8\xc6\
-8\xf6Q\xc5\x0a\x96\xbc\xa3\xe4\xc3\x00I$\xd0\x05\x16\
-#c\x89\x0b\xe0>\xb6\x156\xf5\xdc\xa1\xf6\xdc[\xd9\
-\x0c\xe0\x1a\x83.\x88\x1b\x98\xc6\x07\xc6\x82\x9c\x9c\xea\x08\
-~\xdf\x06^\xd1\xefv0\x89o\x5cb\x0f'8\xc6\
-!\x1e\xd0\xc4\x81\xfa\x8f\xb0\xa3\xa4\xbe\xa3\xcb\x02\x0c\xe1\
-\x19w\xa8`^\xe7\x9e\xc5-\xb60\xa3\xa3\xd8\xf8\x1a\
->\xb1k\x09u\xdb\xb2{~B-\xe3\x08\x95\xa0\xef\
-J;\xfd\xbd\x05Wa\xa3X\x08&\xdb-,{\xef\
-}\xa8{\x89Ob\xd7\xd8\xab\xe73/\x89=YE\
-\x17v\x14\xbd\x95\xd7\xb5\xd5U\x1d\xa5\xae\xb1\xcevJ\
-\xd9\x12\xfb\xa6l[I7\xbc\xdah\xfbg*\xeb\xaa\
-\x1a\x91J\x8c\x060\x05\xb5\xdd(\xc5\xfeD\xf3\x03v\
-n\xe5Y\xff\xbc\xc5a\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\x9a\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:08-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:08-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:8f92d221-fab5\
--254d-b3ff-e24d8\
-0c92484\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:31f6e365-4dad-1\
-d43-bf31-8f0d317\
-4fc27\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:2c5c5b5\
-f-b110-7046-bc5e\
--781c85c0efd7\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:2c5c5b5f-b110\
--7046-bc5e-781c8\
-5c0efd7\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:8f\
-92d221-fab5-254d\
--b3ff-e24d80c924\
-84\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:08-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xea\x13\
-.\xaa\x00\x00\x01OIDAT8\x11e\xc1\xb1j\
-SQ\x18\x00\xe0\xef\xdc{bn\x05}\x10\x1d\x04\x1f\
-@\x07\x09X\x10\x04G7\xc5\xd9:e\xe8\xa2D)\
-\xf8\x04>\x81\x8b\x83\x82\xa0\x83\xe0\x03X\x11\x5c,\xb8\
-\x89C\xa0K\xb5jJn\xd2\xdec\xe1\x17\xae!\xdf\
-\x97\xa6\xd3\xa9\x7f*t\xb8\x89;X \x09\x19\x1d:\
-!a\x86I\xd6\xeb\x84\xbbHx\x8ds\xc2!\xce\xe0\
-,:,\xb0\x8d\xcd\x8c\x84\x82\x07\xf8\x80\x9fx\x87\xe7\
-zW\xf0\x0d\xdf\xf5\xae\x22W(\xc2&.\xe0\x18\xe7\
-\x85\xa1\xf0\x10\xb7\x84F\xd8@\xc9\xb8\x8f\x8f\xd8G\x8b\
-\x84\x22\xb4\xc2\x0f\x1c\x0as\xbd\x94q\x1dG8F\x8d\
-\x1a\x7fp\x19\xcf\xd0\xe2\x22.\xe1\x1e\xf6q\x1bK\xa4\
-\x8c_\x98#\x09\x1d\x86\xf8\x8a\xa7\xf8\x8d\x09>\xe1\x15\
-\x06\x98\xa3F\xc9\xa8Q\xe9u\x18`\x86\x97\xc2\x16>\
-\xe3\xbd^\x85RYU\xac\x1a\x0a{8\x10\x86\xfe\x93\
-\xad\xaaPa!\xb4\xc2X\xaf\x15\x96\xa8\xb3P\x90p\
-\x82#<\xc2\x08\x1bB'T\xc2\x12#\xbc\xcdB\xd2\
-\x1bc\x17\x15\x8a\x90\x84\x82\x82\x06/\xf0&\x0b'\x98\
-a\x07#\xa1X\xd7\xa1\xc1\x13|q*\xeb\x8d\xb1\x8b\
-\xda\xba\x84\x82\x8c\x06\xad\x902f\x98\xe0\x9aP\xac+\
-h\xb0\x83=\xbd\x92\xf1\x1870\x10\x92u\x05\x03t\
-BBq\xea/<\x00_\xce\x91\xf2B&\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07\x83\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:12-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:12-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:cb4a9378-510d\
--9d43-8735-f711d\
-46bb315\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:2b276406-f972-8\
-649-a451-3ee0f91\
-6a6dc\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c576758\
-f-aa0c-d54d-b726\
--1a9de6af1c37\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c576758f-aa0c\
--d54d-b726-1a9de\
-6af1c37\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:cb\
-4a9378-510d-9d43\
--8735-f711d46bb3\
-15\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:12-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>F\x89\
-\x9d\x95\x00\x00\x018IDAT8\xcb\x85\xd3\xbd+\
-Ga\x14\x07\xf0\xeb\x9d\x18d\xa1\xbcdPFE\xca\
-d2\x19%\xabbb\x91l\xb2(%/#\xa5\x0c\
-\x92\x97E\x16e`\xb1\xd8\x18(/\x11\x89\xe1\xf3w\
-X\xce\xad\xa7\xdb\xfd1<\xdd\xefs^\xbe\xe7{\xce\
-sn\x86\xac\xe4\x0c`\x15\xfb\xd8\xc1,\xea\xc3W\x9d\
-\xc6\x96%\xaf\xe3\x0b'X\xc1\x16n\xf1\x80\xa1\x22I\
-V0l\xe0\x05\xbd%\xc4\x8b\xf8A_\x9a\x93&\x0f\
-G\xe5\xee\xb8\xd7E+]\x09\xc96\xce\x03W\xe5\x04\
-\xb5I\xf5\x83\xc0\xf5\xd8\xc37^1\x16\xf6n\xbc\xa1\
-''I\x15\x9cb!\xf0H\xa8\xc90\x8f\x9b\xc0M\
-\xb8\x0f\x7f\x86\xea\x94\xe0\x10\xcb\x81\xfb\xf1\x81\xa9\x18f\
-\xae\xac\x05\x8f\x18L\x09\xf2\x16\x96p\x9d\xf4;\x89;\
-\x1c\xa1=Q\xf6\x82\xd6\xb4\x85\xaa\xb8\xb4\xe1\x1d\xe3\x15\
-v#\xc3\x15\xd6\x02\xd7\x94=\xe3t\x0c\xad1\xb1\xd7\
-\x05\x9e\xc13\x1a\x8a\xaf\x90\xa5\x06\x5c`7p\xde^\
-G\xec\xc0X\xa5EJ\x8d\x9d\x11<\x9a\xf8\xceb\xad\
-\xff]\xe5\x9a\xf8\xce\xc5\xb0\xf2a~\xa0\xb9\xa0\xb4\xe2\
-\xbf\x90\x07\x5c\xe2\x18O\x98(\x14\xf8\x93 \x97\xd8\x8b\
-Ol\x96I\xff\x8b U\xd1\x5c\x94\x5c<\xbf\x19\xaf\
-\xe1\xd7Ze\x86\x95\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07y\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-37-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:58-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:58-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:7c4fd108-d774\
--5847-9a70-8aa8a\
-6edecbc\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:196eeec4-b904-e\
-b43-a116-b99ac3e\
-49ea3\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c671a14\
-f-9437-024b-828f\
--4537589ff46d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c671a14f-9437\
--024b-828f-45375\
-89ff46d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:37-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:7c\
-4fd108-d774-5847\
--9a70-8aa8a6edec\
-bc\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:58-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xea{\
-\xb5\xc8\x00\x00\x01.IDAT8\x11\x9d\xc1!k\
-\x95Q\x18\x00\xe0\xe7\x9c\xef\x9dSA\x05\x8b\xb6\x15\xd1\
-\x22\xd8l\x0b\x22,\x9aM\xa6\xfd\x04A\x16LZ\x04\
-A\xb0\x09\x82\xc5\xb8b3+\xcc l\xc9 \x16\xd3\
-\xcd\x8a^\xaf\xc2\xfd\xce\xeb\x853\xf8\x18\x16\xb7\xe7\x89\
-\xd9lf\xa5:\x9e\xe6P\xe8\x9a\x13\x0a\x5c\xc4u\x04\
-\x12\x05\x89\x82D\x9a\x14\xfc\xc0\x01F+\x81\x87\xb8\x8b\
-O8\x83\x11\x03FT\xac!u\x0dWp\x0foQ\
-\x03\x1b\xd8\xc1\x1b$\xce\xe1;\xce\xe3'\xbe9j\x17\
-\x97u-\xb0D\xc3\x13\xbc\xc7&\xdea\x13\x1f\xf1\x12\
-\x03\x12\x0dK\xec`\x0b/\x02\x05\x89u\x0cXG\xe0\
-\x14B\x97h\xba\xe7\xb8\x86\xfb\xb8\x11\xba\x82\x11\x89\x11\
-\x0d\x0d\xe9_{\xd8\xc3-\xd40)\xba\xe2\xff\xb50\
-\xa9\xa8\xa8\xa8\x18Pu\x05\x05\x89-\xdc\xc4m\xec\x07\
-\x12K\xcc\xb1\xc0\x1c\x0b\xcc\xb1\xd0\x8d&\xdb\xb8\x8a]\
-|\x08\x0c\xb8\x84\xc7X\xc3>~\xe3\x00\x7fp\x01\x83\
-\xee\x17\xce\xe2)^[\x09|\xc1\x03\xdc\xc1i4T\
-4T\x04R\x97\xd8\xc03\xdd\x10x\x84W\x18\x90(\
-\x8eJ\x93\x82\x05\xbe\xea\xc6\xc0\x1c\x9f\x9dP\xe8\x8a\xe3\
-I\x87\xfe\x02\xe5hT=\x0e\xc0\x8d\x1e\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07N\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:45-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:45-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:7bcbff55-51b7\
--1d4d-99d2-ba0c1\
-99cd193\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c6f328a5-3dfe-8\
-e42-813f-76ba1ad\
-36d34\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:892a84c\
-7-9c85-5445-8b17\
--2dcd7e777554\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:892a84c7-9c85\
--5445-8b17-2dcd7\
-e777554\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:7b\
-cbff55-51b7-1d4d\
--99d2-ba0c199cd1\
-93\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:45-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>cv\
-*\xf0\x00\x00\x01\x03IDAT8\x8d\xb5\xd3\xbd.\
-\xc4A\x14\xc6\xe1\xfd\x22\xd4*W \x115\x12\x95\xc6\
-MP\x88\xc6W\xc3jh(\x88+\x90\x08[\x92(\
-\xb0(\x15\xe2\x0a6\x94\xa2\x10\x8d\xa7W)G\xe1\xfc\
-\x93\xc9f\x97%1\xc9\x9b\xf3\x9e\x99\x93_&of\
-J)\xa5\x12V\xd1\xc4y\xe8\x22\xabg\xe1\xd7RJ\
-\xa5\x98/\x17\xbe\xd8\xb8\xc55f\xb1\x82\xa5\xa8\xf38\
-\xc0;\x9e\xb0\xdb\x0e)\x9a&\xe6\x8a\xc3\x5c\x98\xc2\x1d\
-\x86\xf0\x82\xfd\xfc\xbc\x18\xba\xc6R\xf8~TP\x8b~\
-\x06\xad\xf0\xc3x\xc6^'\xc0b\xf8j\xd4J\x06x\
-\xc4@\xf4#\xbe\xd6r\xaf\x80I\xbc\xa2\x85\x07\xdc\xe3\
-\x03\xc7\xdf\x02\xb2\x0c\x061\x86\xf1\xd0(\x1a8\xec\x09\
-\xd0%\xd8M4z\x06D\xa8y\xb0;\xbf\x02\xe4\xa0\
-\xa8\xdb\xff\x0a\xa8\xfd\x15P<\xa4>\x94\xbb\xa8\xda\x0d\
-p\x85\x85\x9f\xd2\xcfn\xb2\xd5\xfe\x0en\xe2\xb3\x9c\xe2\
-2~a7\x9d\xe0\x0dG9`\x1a\xeb\xd8@=j\
-'\xd5\xb3\xb9\x89\x94R\xe9\x13\xc7\xca\x11\xdd\x9e\x8c\xc8\
-\x08\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07k\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:57-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:57-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:aae01a3c-2360\
--1d46-9ade-fe6f6\
-df1ebcd\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c514dd32-c213-1\
-44f-8f5d-aafa529\
-464c4\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:74b30ba\
-8-4d75-ac4e-8da6\
--a0f7238df7c6\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:74b30ba8-4d75\
--ac4e-8da6-a0f72\
-38df7c6\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:aa\
-e01a3c-2360-1d46\
--9ade-fe6f6df1eb\
-cd\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:57-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd7B\
-%\xed\x00\x00\x01 IDAT8\x11\xa5\xc1\xa1O\
-\x94a\x1c\x00\xe0\xe7}\xbf\xf7\xf4\x98\xe0\x1cN6u\
-\x93\xe0F\x85\xe2F\x901\xaa\xb3;\xfe\x06\xba\xddl\
-p\xd3\xcdd3R\x08v\xfe\x01\x03\x85\x11!\xdd\x15\
-\x0a\x8e\x93\xcf\x83\xbbW\xb6_\xf8\xc2\x81A\x9e'\xd5\
-Z\xddE\x19\x0e\x87O\xf1\x0cI\x98\xe0\x12}\xffv\
-\x89\x93\x82Ox\x8bC\x14,\xe2\x05\x0e\x90\xddl\x82\
-5\xec\x14\xe1=\xbe\x0ao\xf0\x01\xaf\xd0G\xd5IB\
-\x8b]\xdc/\xc8\x18\xeb\xfcA\x15Z\xb7\x9b\x22\x17!\
-\xeb4HB\x83*$!\xe1\x0a\x19\xb5\x98U1\x15\
-&n7F*f\xb5X\xc6\x9e\x900AE\x11\xae\
-\xb0\x81\xfdbV\x83s\xfc@\x0f#l\xe31\xbe`\
-\x01-^\xa2W\xcc\xba\x87S|\xd3y\x82e|\xd7\
-\xd9B?\xa3\x22\xe9$\x14aNx\x88y\xe1\x810\
-\x87i\x16F:\xe7\x18\x0b\x17\xc2\x08\x17\xc2Hh]\
-+\xe8\xe15\x8e\x91\xb1\x81\xe7\xd8D\x1f\xbf\xb0\x86%\
-\xac\xe3\x11~c\x05?\x0b\x8e\xf0\x0e\xabh\xd0\xe0\x0c\
-\x1f\x91P\xd1C\xc6g$L\xb1\x80\x934\x18\x0c\xdc\
-EA\xf2\xff\xea_\x8f\x14EW\xcad\x1ch\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07 \
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:29-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:29-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:9cbe64e2-aec3\
--a944-b448-ff44a\
-c13e0bf\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e79a2260-d3f2-d\
-c46-8858-6897cb6\
-b4792\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:09628aa\
-8-4a26-b143-80ee\
--c288737ef027\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:09628aa8-4a26\
--b143-80ee-c2887\
-37ef027\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:9c\
-be64e2-aec3-a944\
--b448-ff44ac13e0\
-bf\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:29-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xf6H\
-\x8e\xe9\x00\x00\x00\xd5IDAT8\xcb\xd5\xd2?J\
-\x03Q\x10\x80\xf1\x97\x8d9\x81\x17\x08\xe8\x1d\xbc\x85\xf6\
-\x22\x18\x82\x18\x17\x04#\xb6\x9e\xc1N\xac\xb7\x117.\
-*\x08\xe2\x11<\x81\x8d\x82\xdd\xef\x1a\xda\xcc\x83E\x12\
-\xd6lg\xf1\xc1c\x18\xbe\xf9\xf3&a\x0fOX\xe0\
-\x1eM\x079\xa7\xc2V\xc2#\x9eq\x80\x12'\x1d\x94\
-\x98\xe2\x13\xa7\x09w\xd8GZ\x93\x0a\xf3\x84\x1a\xb3\x08\
-n\xa0\xe8`\x18\xb9\x0b\x9c\xe5\xc7q\x04\x8b?T\x1e\
-\xb4\x04\xf3\xff'\x18,\x13\xd4-\xc1\xb0\x95\xf4\x9b,\
-(\x96u0\xe9\xf1\x8du\x16T\xf8\xc2m\x1c\xd5\xc3\
-\x0a\x1a\xbcb7\x04M\x16\x8cq\x14W6[A\x89\
-C\x5c\xe1\x03\xa3(x\x9ez\xb4\xfe\x82K\xdc\xe0\xa2\
-\xbd\x98.F!\xd8\xc1;\xdeP\xae[=\x9f\xf15\
-\xbe1\xe93B\xc2f\xece\xfb\x07\x01\xcb\xecK\xa6\
-\x03\x9d+\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x077\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:15-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:15-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:06c4d076-1209\
--dd43-8f17-32f12\
-585e3fe\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:72ca85f8-d5f4-9\
-042-a21a-f08a97e\
-616e7\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:ea59fe3\
-0-8371-c54c-a2af\
--cce4708cd798\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:ea59fe30-8371\
--c54c-a2af-cce47\
-08cd798\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:06\
-c4d076-1209-dd43\
--8f17-32f12585e3\
-fe\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:15-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x9c|\
-\xc7)\x00\x00\x00\xecIDAT8\x8d\xed\xd2\xb1.\
-DQ\x10\xc6\xf1\x1b\x11\x9d\xc2;l\xa5\x93\x10\xad\xa0\
-Uh\x08\x09\x22\xd8\xbb\x9eE\xeb\x05D\x84pcw\
-e\x1fAH\xd0\x10\xc2\x03\xc8/\xde\xe2h\xe6\xcaq\
-\xb3\xdd*\x15\x93\xf9\xce\xcc\x9c\x7f\xe6\xe4|EJ\xa9\
-\x18%\x8a\x94R\x81U\xf4p\x85K\x0c\xd0\x89\xde\x14\
-\x8e\xd1\x8f\xde5N\xd0\xca\x01\x03T\xd8\xc06\x8e\xf0\
-\x16\xbd\x05|b\x17ml\xe1\x03\xed\x1c\xd0\xc5f\xbd\
-\x16Zx\x0e\xbd\x84\xfb|m\x5c\xa0\xcc\x01=\x1cf\
-\x03\xf3\x19`\x11O\xa1'\x22\xf7\x87\x01\xca\x0c0\x8b\
-\x97!\x80\xb1\xe6\xfc?\xe0\x0f\x01\xdd\xdayq\x9ek\
-|\xe3c\xe8\xf1\x0c\xf0\xcbH7\xd8\xc9\x00\xd3x\x0d\
-\xbd\x8c\x87\x86\x91\xaa\xda7u\xe1\x14\xef8\xc39\xee\
-p\x9b=G\x5c\xaa\xc2\x85_X\xcf\x01-\xec\xe3 \
-r\x073\xf5\xdaX\x89\xda\x1eJ\xaca\xf2\x070J\
-|\x03\x9d\x8b\x18\xf7\x02\x06^f\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07@\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:15-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:15-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:b12940c3-b6fd\
--3945-8016-863be\
-de12a0b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:65b3ae21-70a7-8\
-149-bae7-502ce0d\
-711f3\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e2c9e49\
-4-4daf-de49-b2c1\
--d1f6ffd35064\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e2c9e494-4daf\
--de49-b2c1-d1f6f\
-fd35064\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:b1\
-2940c3-b6fd-3945\
--8016-863bede12a\
-0b\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:15-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>h\xd0\
-x\xef\x00\x00\x00\xf5IDAT8\x11cx\xf6\xec\
-\x19\x03\x0e\xcc\x84G\x0e\x8eA\x04#\x94#\x0c\xc4\x0b\
-\x818\x09I\x013\x92<N\x03`69\x02\xf1\x0b\
- >\x0b\xc4{\x81\xd8\x18\xcd \x82\x06\xb8\x01\xf1Q\
-(\xbb\x1e\x88\x1f\x02\xf1t \x16\xc0\xe7-dAW\
- >\x83$)\x07\xc4\xab\x80\xf8\x1e\x10\xa7\xe0\xf2\x16\
-\xba\x01\xa7\xa1l\x16$\x0d\xee@|\x1e\x88\x0f\x01\xb1\
-\x19\x928#>\x03`\xe2\xc8N\xae|\x06\x01\x93\x80\
-X\x10f\x08.\x03\x18q8\x99\x1b\x88O\x00\xf1}\
- \xe6\xc1\xe7\x02F$W0\x22y+\x1b\x88\xaf\x02\
-\xf1\x14\x987q\x19\xc0\x84\x16u\xfe\xd0p8\x0e\x8d\
-n\x06B\x81\x08\xc3\xfa@\xbc\x05\x88\xaf\x03q2z\
-\x00b3\xe0\x04\x94-\x0aM\x03\xa0\xb4\xd0\x0a\xc4\x5c\
-\xb8\xd2\x02zB\x02\xf9/\x07\x1aHK\x80X\x85P\
-jD6@\x07j\xe3\x11 \xb6!6?\xa0\x0b(\
-\xe3I\x07D\x19@RV\x06a\x00\x03\xce\xd7l^\
-\xdb>3\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xa3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:21-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:21-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:73d1ae88-5229\
--be45-baef-4f12b\
-c4e20b9\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:aa0fcb49-cd52-a\
-440-b331-f8da1d6\
-4dd98\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:924f7f6\
-2-c63c-a84d-b2a2\
--32f1e0099e59\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:924f7f62-c63c\
--a84d-b2a2-32f1e\
-0099e59\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:73\
-d1ae88-5229-be45\
--baef-4f12bc4e20\
-b9\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:21-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xebd\
-\x82Z\x00\x00\x01XIDAT8\x11\x05\xc1\xb1J\
-V\x01\x00\x80\xd1\xef\xde\xfb[C\x16\xda\xde\xd0\x1ab\
-=@\x8d\x0e\x0d)\x08\x81\xd4\x964\xe6f\xed\x0e\x8d\
-\x09\xba\xbb\xe4\xe2\x22\x05AS\xb3P.F*-\xe1\
-t\xa4\x9e\xa2sB\x08#\xc2\x1c6\xb0\x8b\x8f8\xc0\
-\x0e\x1e#\x84\x11\xa1\x10\x06\x84U\x9c\xe1\x04{\xd8\xc2\
-[\x1c\xe2\x1c_p\x0faDaDx\x83k\xbcD\
-\x08!\x84y\xec\xe3\x0aK\x08c\x08\xab\xb8\xc6\x03\x84\
-\x01#f\x980!\x84m\xfc\xc6\x02\x0as8\xc3K\
-\x84\x1b\x18\x10B\x181`B8\xc6\x07\x146p\x82\
-0`@\x08\xef\xf1\x1ca\x86\x11\xe1\x11.\xb1\x18v\
-\xb1\x870!\x84]\x5c\xe1\x0f\xd6\x10f\x087p\x8a\
-'\xe1#\xb6\x10B\xd8\xc3/\xdc\xc2\x0a\xfe\xe2\x19\xc2\
-\x88\xf0\x19\x9b\xe1\x00\xef\x10\xc2\x1e~\xe2.Bx\x8a\
-\x7fXC\x08_\xb1\x11vp\x880\xe15\xee#L\
-\x98\x10V\xb1\x82p\x07\xe7X\x0e\x8fq\x8ey\x84\x10\
-F\x840\x22\x84\xb0\x8e\xef\x98B\xf8\x82}\x84\x19&\
-\x84\x10\x06\xcc!\x84\x0b\xbcB!\xdc\xc3\x15\xb6\x11B\
-\x08!\x84\xf0\x0dG\x08\x85\x11a\x09\xbfq\x8c\x87\xb8\
-\x89\x10nc\x1d\x178\xc2\x840\x840\x22,\xe0\x03\
-.q\x8aO\xf8\x8a\x0b\xfc\xc0+\x840\xa0\x10\xc2\x88\
-\x10\x16\xf1\x04\x9bx\x81e\xcc\x10\xc2\x80\xd0\x7f\x8a\xa4\
-\xeb-\x825\xcc\x93\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07v\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:48-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:48-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:7d597107-4a2c\
--bf43-b1ea-24d6e\
-6ee652f\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:2afa919b-e395-a\
-e45-9ec6-27a59ff\
-1a29c\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:4812bba\
-7-8ad3-6d44-b569\
--0245dd3a3ec3\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:4812bba7-8ad3\
--6d44-b569-0245d\
-d3a3ec3\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:7d\
-597107-4a2c-bf43\
--b1ea-24d6e6ee65\
-2f\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:48-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xac\x0e\
-\x88\xc3\x00\x00\x01+IDAT8\xcb\x8d\xd3\xdbJ\
-\x9bQ\x10\x05\xe0\x1d\xc1\x07\xa9x\xa6\x06\xa3`\xa4M\
-\x9b\xa6\x9e\x8f(\xb6\x05EJo\x9a\xd2V\xa2M\x88\
-\xbe\x91h\xa8-\xf6\x8d\xbc\xf9\x9e\xa37\xb3K\xf8\x8b\
-\xf2_,f3\xecY{\xcd\x9a\xd9\x09\x09\x95\x88\x97\
-x\x83oh\xa0\x8bW\xe8D\xfe\x04G8D\x1b;\
-\xb98\x13lb\x0aM\x8cc5b\x0b\x93X\xc2\x02\
-\xe6\xe3N5EaF/\x8aR\x09\x5c`3a\x0b\
-\xcf#\xf9\x02\xcf\xe2<2\xa4l8\xe6s\x1d\xe3\x09\
-\xf7\xf8\x1e\xc9n\xc8\xcd\x04O)8\xc3F\xc2\x0d>\
-G\xb2\x81\xb1\xc2\xab\x8f\xe1\x9f\x82\x01\xbeD\xb2\x8f\x95\
-\x92\x0a:\xd9\x83A\x8c$a\x1b\xb3%\x15\xaca\xae\
-H\xd0\x0e#\xcb(\xf8\x84f\x91\xe0\x18\x8b%\xa7\xf0\
-\x0e\xf5\x22\xc1\x01\xaa%\xf7`\x17\xb5\x84\xdb!\x13\xcf\
-\xf1\x12?\xf0\x1aW\xb1\xc2\xbd0\xf7#>\xe0=N\
-\xb1\x96\x09\xf2\x18\xf7\xc3\xc4\x16&\xb0\x1e+\xbc\x8ai\
-,G\x8b5\xbc\xc5|\xc2/|-)\xfb?\xe4\xed\
-{\xc05~\xe3.H\x8b\xf1'\xfeDK\x09\xa3\xa8\
-dg\xf7\xe2+w\xa3\xdf\x22\xba\x81>f\x86'\xf3\
-\x17B\x8a\xe2\xda&R>\xe3\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07T\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:04-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:04-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:b0355c11-8a6b\
--254b-a234-1707a\
-21ac6c8\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:8099b45e-6c4e-d\
-746-b477-73f336a\
-9b55f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c2b405b\
-e-3ff8-0b46-a167\
--1f29c9920272\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c2b405be-3ff8\
--0b46-a167-1f29c\
-9920272\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:b0\
-355c11-8a6b-254b\
--a234-1707a21ac6\
-c8\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:04-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xf8@\
-\xfb\xc5\x00\x00\x01\x09IDAT8\xcb\xa5\xd3\xbbJ\
-CA\x10\x80\xe1MT\x84D\xf0BD\xac\x04\xab$\
-\x0a\x22\xc4\xc6\xdaW\x10\xac\xec\xc5\xde\xc2B\xb1\x14|\
-\x08\xc1\xd2\xc6R\x0b\x0b\x1b\xefW\x04\xb1\x11\xbb\xaf\xb3\
-\xf0\x09\xb4\x99#\x87pL\xd0\x14?\xb3\x9c\x99\x9d\x9d\
-\xf3\xb3\x9b\x90\xfeI\x19)\xa1\x821\x8c\xfe\x81\x9f&\
-\x09[x\xc5\x05\xae;p\x83K<\xe1\x18\xcdl\x82\
-I\xcc\xa2\x8eF\x01M\xcc\xe4\xd6\xd3\xd8\xc33\xaa\xa9\
-\x07\x07\xe7X\xeeT\xd0\x97[ob\xbb-\x7f\x8a\xd5\
-\x84A\x0c\xa1\x9a\xa3?\x8a\x1a8\xc4\x17\xf6\xe3[\x05\
-\xebx\xc7x\x8a\xce\x99\xc4+\xbc`\x11s\xb1\xf1\x04\
-k\xf8\x8c\xfc}\xfc\xffR&q\x0a\x0b\x98\x0fZ\x18\
-A\x09+8\xc3\x07\x8eBf\x0b\x031M\xa9\x93\x83\
-R\xc4*\x0e\xb0[\x94\xff\x8b\xf5JA\xf3\x94\x9dP\
-\x8b\xdbXD-\x18\x8e\x98o\x94\x12v\xf0\x86[<\
-\xfc\xc2#\xee\xc2\xfcF\xfb[\xe8v\x133\xeaQ7\
-\xd1>AOdB\xca\x11\xbbQ\xce\x0bD\xfa\x06Y\
-\x8c\xe4\xb5\x80\xa0\x1c\xe4\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07G\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:57-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:57-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:339c0f2b-fb4e\
--c140-b270-fe8f9\
-6afdd77\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:117a5d54-7cc1-1\
-745-a343-3a32af2\
-bb227\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:0df24db\
-a-278c-3648-ab84\
--f0f819a10fa5\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:0df24dba-278c\
--3648-ab84-f0f81\
-9a10fa5\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:33\
-9c0f2b-fb4e-c140\
--b270-fe8f96afdd\
-77\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:57-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x8d\xcf\
-!_\x00\x00\x00\xfcIDAT8\x11\xa5\xc1\xb1N\
-SQ\x18\x00\xe0\xef\x9c{\x0a\x8d\x03&n`\xc2B\
-\xe2lL\x5c\x08\x06gu\xe7!\xd8M\x1c\x1d\x98\x99\
-\xf0!|\x16\x07\x13\xe3,\xd3\xed\xc0ZJ\xdb[z\
- \xf9\x87\x93\xe0\xc6\xfd\xbeTk5F\x99\xcdf\xfb\
-8@\x12\xee1`\xaa\xd9b\x8d\xa9f\xc0u\xc1%\
-\xbe\xe0/\x0a^\xe1\x10\xbf\xd1a\x83\x978\xc2\x1fl\
-q\x8f\xb78/\xc2W\xfc\x10>\xe1;\xde\xe3\x05\x16\
-8\xc6\x15>\xe2\x0e\x03~b\xb7 c\xadY\xa1\x0a\
-\x0ba\x89\x8a\x05\x06a\x8b\x9c\x85\xac\xe9\x90\x84\x22t\
-H(\x9a\xe4Q\xf6\xbf\xaa\xa9B\x15\xaa'\xb2\x91\xb2\
-\x91\xb2\x912*\x92&k\xb2\x90\x85\x8c$$\xd4\x22\
-\xdcj\xe6\x18\x84A\x98c\x83\x85f\xe5Q\xc1\x04'\
-\xf8\x87\x8c\x0fx\x8dSL1\xc7;\x1c\xe03V\x18\
-\xf0\x06\xbfR\xdf\xf7\x178\xc3\x0d:t\x98`\x89\x84\
-\x8a\x0e;X\x0a[\xec\xe1[\xea\xfb\xde\x18\x05\xc9\xf3\
-\xd5\x07\xbb\x9aC\x87\xfa\xe9\x13\xc2\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07\xaf\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:47-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:47-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:3dd347e5-f983\
--d345-a49d-96130\
-fcebd41\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:0ea2b4b2-4f85-9\
-442-9ade-39b9c09\
-941b5\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:632474a\
-4-4bf3-f248-b954\
--dcb897c1eded\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:632474a4-4bf3\
--f248-b954-dcb89\
-7c1eded\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:3d\
-d347e5-f983-d345\
--a49d-96130fcebd\
-41\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:47-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x83\x12\
-\x04'\x00\x00\x01dIDAT8\x11\x05\xc1\xbd\x8b\
-\xcf\x01\x00\xc0\xe1\xcf\xef{_/\x0b\x1d\xfb-&u\
-\xba\x14\x1b\xfe\x84\x1b\xa4\x8e\x8c\xe7t\x19,\xa6KR\
-n\xb1Q&\x037Pt\x0c\x17NQv\x85\xf2\x92\
-\xeb\xc2-R\xcfx\xff\x80\x81\xe7\x09!\x0c\x08#\xce\
-\xe3\x0e\x1ea\x0d\xb7p\x0a!\x0c\x08\x850A\x98\xc7\
-w|\xc6\x03\xac\xe0&\x9e\xe1\x0761\x830\xa00\
- \x5c\xc5..#\x84\x10\xc24\xee\xe37f\x11\x86\
-\x10\xe6\xb1\x8b\x13\x08\x13\x0c\x08aD\x08+\xf8\x81i\
-\x14Fla\x19a?B\xb8\x86#\x08S\x98B\xd8\
-\xc0\x1d\x14.\xe0+\xc2\x04!<\xc07\x1cF\x180\
-\x85p\x1c\xdb8\x14\xeeb\x0da@\xb8\x87\xf7\x08!\
-\x84\x10\xf6\xe2\x13\xce\x84\xc7\xb8\x8e\x10n\xe3\x1f^\xe2\
-\x096\xf0\x1c\xafp\x0f!\xbc\xc0\xa5\xb0\x86U\x84p\
-\x0e\x7f\xf1\x14\x0bX\xc6\x12\xae`\x01!\xbc\xc1\x85\xb0\
-\x8a\x0d\x84\x11a\x1e;8\x89\x10B\x08\x07\xb0\x85\xb9\
-p\x1a;8\x8c\xb0\x07a\x01p\x14a\x0f\xf6!\x9c\
-\xc5\x07\x8c!\xbc\xc6C\x84\x01#\xc2,\xa6\x11F\x84\
-\xb0\x85E\x14\xc2\x0c\xfe\xe0\x06B\x08!\x84\x10\xdea\
-\x1d\xa10 \x1c\xc3/l\xe2\x04\xf6#\x84\x838\x87\
-m\xacc\x0aa\x12\xc2\x800\x8d\xbb\xf8\x89/x\x85\
-\xb7\xd8\xc6G,\x22\x84\x09\x0a!\x0c\x08\xe1\x10\xce`\
-\x09\x171\x87\x11!L\x10\xfa\x0f\xc8\xe0\xf1H|\xb9\
-\x0c^\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07q\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:25-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:25-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:57470679-587f\
--5f4b-af46-db5ad\
-a326a2b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c109ee78-89e2-5\
-b4b-a5f0-8d9fd1a\
-5f423\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:10895cb\
-f-a667-0b42-8872\
--d5d173161bbb\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:10895cbf-a667\
--0b42-8872-d5d17\
-3161bbb\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:57\
-470679-587f-5f4b\
--af46-db5ada326a\
-2b\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:25-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x98r\
-=\x81\x00\x00\x01&IDAT8\xcb\x8d\xd3\xbbJ\
-\x03A\x14\xc6\xf1MPl$$`\x0a\x05\x1b+;\
-\xd17\x08\xda+\xd8jaeae)\x16J\xd0\x88\
-\x04\x02\x16\x0a\x8a\x82\x16b\xa1b\xaf\xbe\x807\xb4\x10\
-\xc4\x0b\xde\x8a_\xe1S\xd8L`Yw\x13\x8b\x813\
-3\xe7\x7f\xbe\x99s\x89\x10\xa5\xac\x5c\xc6\xf9\x1f\x9fv\
-p\x15#\xc1\x9e\xc79\xce0\xda\xf4i\x05o\xe3\x0e\
-\xfd8\xc1\x03f\xb1\x84\x1fL%\x03\xc4\xe1\x9d\x00\x17\
-q\x8c\x8b\x84\xd08\x9e\xd0\xddJ\xb9\x88\xd3\x148B\
-!\x04\x18\xccR.\xa5\xc0%\x0c\x05\xbb\x82g\x14\xa3\
-\x7f*w\xe0&\xfc\xbf\x80o\xcc\xc5sP\xc7}\x86\
-r'\xae\xb1\x87>\xbca%^\x85\x0a\xde\xc3\xe5\x11\
-.\x13\xf0U\x80\xcbxA-\x9e\x8f\x08\x9bX\xc64\
-n3\x94\xcbx\xc5ZZ#\x1d`\x06\x1bX\x0d\x97\
-]\x01\xdeEO\x80k10\x17\x7fA\x15\xfb\xa1\xe3\
->\xd1\xc0#\xb6Z)\xc7\x03\xf4\xe3\x0b\x93\x18\xc6:\
-&0\x10\x12\x96\xaa\x9cl\xe51|\xe00\x94\xa7\x11\
-J\xb5\xd0n\xc0\x22\xe4\xc3\xa6\x17\x8b\xe1\xdf\xf5\xd8\x10\
-\xb5\x9c\xcc\xa6\x91\xcfp\xc8\xb7\x1b\xeb_`\x13\xf0\xd6\
-\x98\xe0\x00\xdb\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\xaf\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:39-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:39-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:b9123f38-94bf\
--ec48-b0ac-b7d07\
-307868a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:2ed55f59-f7db-1\
-f45-9a8f-c781c94\
-06ce5\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e0afc3c\
-b-c962-3b48-b6bf\
--1de7ec141f62\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e0afc3cb-c962\
--3b48-b6bf-1de7e\
-c141f62\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:b9\
-123f38-94bf-ec48\
--b0ac-b7d0730786\
-8a\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:39-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>(\xdb\
-\xce\x91\x00\x00\x01dIDAT8\xcbu\xd31K\
-\xd5a\x14\x06\xf0\xf7\xea\x85\x1c\xc2{]\x82\xa0h\x91\
-\x96D\x02\xa1\xa5\xfc\x00-\x11\x94r\x9b\x84\xc4\x06\xc1\
-Y\x89\x08\x0aZ\xab\xd1\xc1\x5c\x9a\xa4!\x87.\x86\xf8\
-\x01D\x04uPK\x9cJ~\x8d~\x05\x97\xf3\xc2\xe1\
-\xcfm8\x9c\x97\xff\xffy\x9f\xf3\x9c\xf3\x9c\xb7\xa0D\
-\x0cEn\xa3\x87O\xf8\x8au\xbc\xc7\xa3\x01\xd8R?\
-\xb4\x22?\xc11\x0e\xb1\x86\x15\xbc\xc57\xfcF\x1f\xb7\
-3If[\xc2%\x16R\xa5\x1c]\xac\xe2\x0f&*\
-II\x95/1\x95\xd8k\xb40\x9c\x88\x96CM\xb7\
-*h\x87\xecWi\x06\xe5?Q\xd5~\xc7\xc7J\xd0\
-\xc3Q\x02\x8d`t\xc0\xc5N\x22\xbf\x8fS\x8c\x95\x98\
-\xf6z\x02/b7\xceU\xfa]\x5c\xa4\x01\x8e`\x1f\
-\xd3%\xacz\x9d\x08&\xf0\xac\xe1N\x07s\xb8\x9ep\
-\x9b\x98/\xc9\xe7f\xff\xed\xa6\xe7\x0d\xd2\x9f\xe8\x15\xbc\
-\x0b\xb6\x0ax\x83\xa7\x03\x06\xf8\x01\x8f\x93\xa2cL\x16\
-<\xc49n\xc4\xcf\x19\xfc\x8b\xdc\xc5M|\xc6\xaf8\
-\x97hq\x0f\xc3\x95\xbd\x8f/\xa9\xda,\x0e\x02t\x88\
--\x8c\xa7\x96N\xf02\xaf\xf2-\xfc\x0d\xf9Y\xf6=\
-\xdci\xd8\xb9\x83\x8d\xfc\x16\x86\x12\xf8\x0c?\xf0\x00\xd7\
-\x1ak\xfc<*o${[\xcd\x0d\xeb\xc4\x86\x9d\x85\
-\xf4>\xb6ci\xf6\xaa\xec\xec\xc6\xa05-\x18\xc3t\
-\x5cx\x81\xc9\xc6{\xa8V\x96+\xf6\xfe\xed\xbc\xf7\x9f\
-vv\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07*\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:49-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:49-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:d1679615-5a4f\
--4b47-bbe8-fc894\
-5495721\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:858a6cac-9735-3\
-c49-bdbb-114d43a\
-7e324\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:cb8e257\
-a-a85e-8a49-bf8f\
--49ff5fe35f54\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:cb8e257a-a85e\
--8a49-bf8f-49ff5\
-fe35f54\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:d1\
-679615-5a4f-4b47\
--bbe8-fc89454957\
-21\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:49-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xb0\xed\
-\x7f\xcb\x00\x00\x00\xdfIDAT8\x8d\xdd\xd1\xbd.\
-DA\x18\x06\xe0\xd9]\x11\x89\xdd\xc4\x05\xb8\x00\x0a\xd1\
-\xb0\x85\xde%(4JthhD\x82V\xa3\xf6\x13\
-\x0a\x89\xdd\x88\x9b\xa0!\xd4*!\x12\xcfm\x1c\xcd7\
-\xc9\xc9a7Gt\x8a'\x93L\xf2\xbe\xf3e\xbe\x84\
-\x841\xb41\x1e\xdaq\x97\xd0\x88\xf3G\x09\xdbx\xc7\
-\x03\x9e\xc3#^\xb17,\x9c\x0bnq\x84)t\xc3\
-,\x96\xf0\x86i\x8c\xa2S\x9a\xb2\x83V.\xe8ae\
-\xc0\x0b\xe7\xf8\xa8L\xf7\x14^\xb0\x90\xd0\xc7Z\x04F\
-\xd0\x0c\x09\x13\x98\xc3|I\x173\xb8\xc3V.X\x8d\
-@\x0e\xd6q\x85\x8d:\x05\xcd\x8aV\xdc\xf7\xeb\x16T\
-5J\x05\x9b\xff\xa4\xa07`\x8d\x83|\xfb\xc4k,\
-\xffb}\xd9e\x9e\xe0\x06\xf7\xd8\xc1!\xf6\x878\x08\
-\xbb\xf8\xc4z\xc2\x22.p\x82\xd3\x9a\xcep\x8c\xc9T\
-\x14\xc5\x9f|\x01\x0d\x1a\xee\xa8+\x82\x94\xdc\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07\x85\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:54-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:54-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:4793182d-8996\
--4640-969c-3cb80\
-9bf537a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:daed130c-e320-4\
-e41-b981-f75c1bd\
-a8129\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:0048c40\
-3-c2ae-a047-a569\
--dfd1149616a3\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:0048c403-c2ae\
--a047-a569-dfd11\
-49616a3\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:47\
-93182d-8996-4640\
--969c-3cb809bf53\
-7a\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:54-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>+j\
-3\x96\x00\x00\x01:IDAT8\xcb}\xd3O+\
-DQ\x18\xc7\xf1;\x8ci\x14C4k\x91\x9dl\x95\
-X\xd9YY\x98\xe4\x0d\x88\xa4\xe8\xceK\xa0\x14\x1bY\
-\xb1\x11\x16J\xb1\xb1$eA\x12I\x89\xb2\x91\xa8\x9b\
-,\xbc\x06\xdf[\xbf\xa3\xc7\xd31\x8bO\xf7\xfc\xb9\xe7\
-9\xcf=\xcf\xb9I\x96e\x89Q\xd0\xb3\x09\xf3\xd8\xc7\
-6\xc6\xdc\xfc\xaf\xc4\x0fh\xf1\x11\xee\x90b\x15o\x98\
-3\xf3\xd1\x00\xcdz.\xe0\xde\x05\x1d\xc2;z|&\
->\xf5<\xc8\x03&\xd4oAQ\xed=l\xf8,\x12\
-70\x89[\x93\x8d\x9d\x1b\xc53:\xed\xa6>\x833\
-\xd4\xd5.F\x82\x9cc\xd1~\xb2]<\x88'\xb4G\
-\x0e6\x98\xc6\x85?\xc4\x10\xa0\x8ak\x5cb\xdde\xd6\
-\xab\xca<b\xb3\xd1'\xf4\xa3\xa6Lf\xcdN'8\
-\xd4}\xa8\xc4\xcah/\xc8\x08\xbe\xb0\xa2~\x1bnp\
-\x8a\x8eX\x19C\xa7\x15\xbb\xf8\xc0\x94{1?\xd05\
-|c\xe6\xbf3\xd8\xc2\x95v\xb4\xe36\xbb\xbc\x94\x9f\
-\x18\x0f\xd5\x09\x13\x15\xd5x@\xfd\x92\x16\xda\x7f\xa3\xac\
-\xf6\xb2\xfe\x91?\x01\xbau\xf7\xfb\x1a\x940HM\x80\
-B\x18\xec\xc2\x8bj|\xa0\x92y\xc7Z\xf8\x8a\x1d\x9f\
-AI\xd7\xb8\xae\x1dR\xb5\xad0\xb6\x84\xe1\x90\xd1\x0f\
-\x9au\xe6\xfa\xa1\xd0su\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07\x89\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:37-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:37-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:465b4d12-8b21\
--da48-a7ec-c33c0\
-479bb80\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c1f145fa-8a00-c\
-b44-9bee-56ff2b1\
-dd41c\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c10963f\
-f-a6ca-9d46-8047\
--4e1aef25bff1\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c10963ff-a6ca\
--9d46-8047-4e1ae\
-f25bff1\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:46\
-5b4d12-8b21-da48\
--a7ec-c33c0479bb\
-80\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:37-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x8e\xc5\
-\xc4I\x00\x00\x01>IDAT8\x8d\x8d\xd1\xbb.\
-DQ\x14\xc6\xf1}\xc6\x98\xd0\x0eQ+\xb4:\x89\x82\
-\x88DC\xab\x11\x12\x8d\xb8\xc4}\xdc\x12\xd1y\x07\xa5\
-\xca-\x8c)\x84WP\xd2 \x1a\x85\x86\x83\x10\x11O\
-\xe0\xbf\xe5\xdb\xac\xec\xcc\x99L\xf1\xcb\xbe\xacs\xbe\xac\
-\xb3\x8eK\xd3t\x12\x17(\xe3\xd4\xd8C3\xfaqf\
-\xea\x15\xad\xfe\xdc\xe3T<\xc78\xe6\x14\xb8\x81o\x14\
-\xb1\x82\x07\xd5geBw%\x1fp\x8c18#\x8f\
-k\xb4`\x01\xbbQ\xdd\xa9\xc3e\xa7Vft\xd9\xa8\
-\xb5\x15\xb7\x0aX\xc2\xa1\x09n\xd0\xbel\x03\xa6u\x19\
-\x8a\xc5\x8c\x80\x1c\x12\x13P\xca\x0a\xf0\x1d\xdc\xd4\x11\x90\
-\xd9\x81\x9f\xfe\x1d\xda\xb0\x18\x05\xe4\xb5?\xc2z\x08\x98\
-2\xdf\xe84\x93\x17\xedWq\xa0}Ak\x17^1\
-\xe8\x0f'f\x88\xde<\xde\xd0\xab\xf3\x16\xf6M\xbd\x1b\
-\xef\xa1\xeb\xf8\x13\xfc\xff\x7fF\xa7yaS\xed\xfa\xfd\
-\x00>\xd2\xff\xdf\x9e\x84\x0eF\xd5\xea\x13:\xcc\x1cB\
-\x07;\xea\xe8\x0b\xc3v^N\xdf\xe7[\xbeB\xbb\x99\
-E\x98\xc7\x1a>\xf1\x88\xa1h\xd8\xbf\x01\xdb\xb8\xd4\xc4\
-\xed \xc3C#\xb8G_T\xff\x0bh2\xff6g\
-\x8bf\xf2\x85\xac\xba=$U^\xb6\xaa\x85\xbbZ/\
-\xd4\x15\xfe\x03d\xbf\xf4\x9f\xfbG\xe1\x92\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07B\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:32-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:32-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:7ba4a325-6443\
--2c43-9a11-14923\
-915324c\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:227fcce2-ebfd-e\
-e4d-b8e4-a8b8ffa\
-c5ed6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:40c592b\
-2-372a-9743-8029\
--17afa306928c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:40c592b2-372a\
--9743-8029-17afa\
-306928c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:7b\
-a4a325-6443-2c43\
--9a11-1492391532\
-4c\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:32-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>D\xc2\
-\xbbh\x00\x00\x00\xf7IDAT8\x11\xa5\xc1?+\
-Ea\x1c\x00\xe0\xe7=\xf7g\xb0\xb8\x18lJRF\
-\xbb\x92\xd5\xa70\xd8(v\xe5s\x88Av\x83R\xb2\
-\x88\xcd\xc0\xe8\x03\x18\xef]0\x90\xfc\xbb\xe7\xbc\xd4\x19\
-\xce\xa08x\x9e\xc89\xfb\x8f\xe8\xf7\xfb\x05\xba~o\
-\x80\xc7\xc0\x06\xd6p\x8f\x8e\x9fe$\x04V\x03\x8b8\
-\xc06FQ\xf9^\xc23\xf61\x1fx\xc5\x0dz\xe8\
-i\xaf\x8f2\xf0\x82]lbH;\x15&q\x1a\xc8\
-\x08L!\xb4\x93\x91P\x05\x86\xb1\x85\x1d\x8ca\xa0V\
-\xa0B\xd6Hj/\xd8C7P\xa0\x87;\xdci\xef\
-\x01E\xa0\xc0\x00\xb3X\xc7!n\xb1\x8cs\x9c\xa0@\
-FBB\x89\x0erht1\x83q\xbcb\x1a\xd7j\
-\x1dd$\xb5\x12\xc9\xa7@\x89w\x5caI\xe3B\xe3\
-\xddWO(\x02\x09+\x98\xc0\x08JdtP\xa1\xd2\
-HjoX\xc0e`\x17\xcb\x98C\xd2N\xc21\x8e\
-\x02g8\xf3G\x81\x84\x84\xecw\x12\xaa\x0f\xb9,D\
-\x1a\x17s\x13\xf6\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\xae\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:59-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:59-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:68fc61c0-d014\
--974c-b19c-018f5\
-7fb8073\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:24d86baf-adb4-c\
-64f-bd3a-380fabb\
-62974\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a03fb2e\
-e-f9be-8046-b1ff\
--23886a861b07\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a03fb2ee-f9be\
--8046-b1ff-23886\
-a861b07\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:68\
-fc61c0-d014-974c\
--b19c-018f57fb80\
-73\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:59-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>N~\
-\xf2\xf7\x00\x00\x01cIDAT8\x11\x05\xc1\xbd\x8b\
-\xcf\x01\x00\xc0\xe1\xcf\xf7\xfb\xbb\x93\xf7\xc3&eQR\
-\xc2`@\x9dQF\x03\xcap\x17uE\xa9+\x83\xba\
-RJ\x16\x9dE\xb1\x98.\xb9b\xf3\x12\x03\x16+Q\
-,~NI\xa6\xe7\xdf\xe0yB8\x87%\x84M\xb8\
-\x84\x07X\xc7\x1a\xeeb\x1e!\x8c\x08\x85p\x0fk\x98\
-\xc7\x14\x9f\xf1\x087\xb0\x82u\xfc\xc0[\xecG\x18Q\
-\x08\xcb\x80/8\x8f\x10B\x08\xdb\xf1\x10\x7fq\x04a\
-\x0c\xe1:\xfe\xe1+\x9e\xe0\x1a\xc2\x0a\xce \x84p\x13\
-\xbf\xb0\x0b\x85p\x10\x0bX\xc42\xe6\x11\xde\xe3:\xc2\
-,&\x08/\xf0\x00\x85\x11!\x84\x10\xc2+\x5cE\x98\
-\xc5\x04\xe1\x186\xb0'\x840\x83\x09f0Ax\x8d\
-\x05\x84\x10\xc2&|\xc5\xe9\xb0\x0f{\x10B\x18\x10\xde\
-a\x15\x07p\x0a\xbb\x11\xc2k,\x85\xa7\xb8\x830\x22\
-\x0c\x08\xab\xd8\xc0w\xfc\xc6Y\x84\xf0\x0e\x97\xc2m<\
-C\x98 \x84\xb0\x19\xdb\xb0\x05[1\x83\xb0\x13S\x1c\
-\x0d'0\xc5\x1c\xc2\x80\x10B\x08a\x82p\x01\x9f1\
-\x09\xe1%\x1e#\x8c\x181`\xc0\x80\x11\xb3\x08#6\
-p\x05\x85\xb0\x17\x7fp\x0b!\x84\x10B\x18\xf1\x11\xcf\
-\x11\x0a#\xc2!L\xf1\x06\xc7\xb1\x19!\xcc\xe1\x226\
-\xf0\x1c#\xc2\x10\xc2\x88\xb0\x03\xf71\xc57\xbc\xc5\x07\
-\xfc\xc4'\x5cF\x08\x03\x0a!\x8c\x08a\x0e'\xb1\x88\
-\x0b8\x8c\x11!\x0c\x08\xfd\x07\x09?\xebu+\xc1u\
-H\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x06\xef\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:18-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:18-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:df02e466-e833\
--264d-8193-c6ca5\
-204a949\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:36363f91-d7bb-a\
-a4c-8262-0054c53\
-63193\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:f52dac9\
-e-2eca-a84e-80f9\
--b1e7db88bd46\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:f52dac9e-2eca\
--a84e-80f9-b1e7d\
-b88bd46\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:df\
-02e466-e833-264d\
--8193-c6ca5204a9\
-49\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:18-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>d\x04\
-\x81D\x00\x00\x00\xa4IDAT8\xcb\xc5\xd2\xbb\x0e\
-\x01\x01\x10\x05\xd0]\x91\xd0\xaa\xd4\xd4:B\xa1\xf3H\
-\xf8\x11\x1a\x11\xbf \xfe\x87\xe8\x14z\x11D\xa1Q\xa8\
-\xcfwh\x96l\xb1\x8bxDq\x8a[\xcc$s3\
-\x01\x82H\x88\xcc\x8bn3A\x10\x0f\xef\x88\x87\x0a\xfa\
-\xe8\xa0\x9b\xa2\x83\x1e\x8a\xf1\x05a\x14\xa68c\x83]\
-\x8a-Nh\xdf\xce\xfe\xea\x09\xff/q\x825\xe6X\
-\xa6X`\x85fR\x07-\x8c1\xc0\xf0\x81\x11\xca?\
-9\xe1\xe3\x05%4PE\xed\x81:\x0aI\x8f4\xc3\
-\x05{\x1cS\x1c\xa2g\xeb&\x95\x98E\x1e\xb9'\xf2\
-\xf1_\xf8z\x89\xe1\x8b\xee3W^\xe6\xd5\xa5\xd9\xff\
-\x87$\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x9a\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:36-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:36-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:d1521837-887e\
--6a49-bd63-5c359\
-6bb222e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:361b7f0f-86ab-0\
-24d-ab4a-61da03a\
-430ed\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:5a05e2c\
-7-2a16-974f-a2d1\
--704b9b2c3125\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:5a05e2c7-2a16\
--974f-a2d1-704b9\
-b2c3125\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:d1\
-521837-887e-6a49\
--bd63-5c3596bb22\
-2e\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:36-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>*3\
-\x97\xc9\x00\x00\x01OIDAT8\xcb\x95\xd3\xbf+\
-\x85Q\x18\xc0\xf1\xfb\xbe~\xa4dP\x06L\xb7d1\
-\xc8\xa2\x08\x03\xc5\xbd\xcb\x9d\xee`\x11%\x91\xe9f\xbc\
-\x92H\x0c\xc2@R\xf7\xc7`0\x98\xa4\xb0Q\x16\xa5\
-D\x91X\x0c\x8a7\x7f\x86\xef\xa9\xe7\xd1\xe3\xf4z\xcb\
-\xf0\xb9\xe7}\xcf9\xefs\x9e\xe7\x9csSQ\x14\xa5\
-\x10H\xfbo\xfe\xc7\xc3X\xc46\xb6\xb0\x86\x0d\xe4\x93\
-\x028M8\xc73*\xd8\xc3\x81\xb4\xbbx\xc3\x92\xcc\
-\xad\x8d\x0bP\xc6EB)\x1d\xf8\xc2\x90\xe9\x0b5@\
-\x9b\xac\xdci\x06[0%\x99\xe9\x8a\xb3\x92I7\xea\
-l\x06\xe3\xb8\x96\x0e\x1d\x18\xc3#\xea\xedjR\xd6+\
-nq\x89\x01\xd7Y\xc4\x91L\xa8\x91v\x15%\xafO\
-5\xa3\x17\x0f(\xb8\x8e\x1da7\xe8\x04\x0b1\x9b\x16\
-\x9a\xe7+d\xddC\xd5\xec\xb0\xaev\x87\x11\xf3Q \
-\xad\x96\xd8.\xfb\x96v/\x87\x986\x91\x0b\x12 \xe9\
-\x02ep\xef\x02\xba\x97c9\xc2\x19\xc9\xe6\x13\x83^\
-\xca\xad\x18\xc5\x1c6\xf1\x8ey=\x85\xbc\x9c\xf1\x0b\xd6\
-\xd1\xe5\x9d\xc8$>p\x833\xec\x9b\xf2~.\xd2)\
-&L\x8a\x81\xd9\xbce\x19\xff\xf3*7H\xcd\xfd\xde\
-Fj\x80\xa2\x94\xa6c\xa1=\x0d\xf7\xd3\x87'4z\
-\xd15\xc0\x8a\xb9'A\x5c\x06i\xe4b\xd2\xd3\xc9=\
-\xde\x7f\xe0\x97on8\xe7\xf1\xd8\xf1\xd9\xa5\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07\xa3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:20-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:20-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a4858f4b-cac1\
--174f-8bba-bcb10\
-6362120\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:a0689c55-606a-d\
-442-b3a3-3857017\
-25e6f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:1ec1d7f\
-b-224b-5c46-9b95\
--41e57ebda616\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:1ec1d7fb-224b\
--5c46-9b95-41e57\
-ebda616\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a4\
-858f4b-cac1-174f\
--8bba-bcb1063621\
-20\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:20-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xdfU\
-\xbf{\x00\x00\x01XIDAT8\xcbm\xd3?K\
-\x5cQ\x10\x05\xf0\xbb\xae\x7f\x104\xc6\xde\x05K\xd1 \
-6\xa9b\xbeB \xa9D;-\xac\xb4Sk\xd7>\
-\x81\xa4Oa\xd2\x18$dI U*\x85E\xb4Q\
-P\x93J\xab\xdf~\x0d\x9b\xb9axl1\xdc\xfb.\
-3\xe7\x9cwf\xa6\xa0D\x8c\xc49\x865\xbc\xc71\
->\xe3\x10\xaf\x86\xe4\x96\xfa\xd0\x8a\xf3\x0d\xae\xd1\xc7G\
-\xec\xe2\x00_q\x8b\x9f\x98\xcb \x19m\x07\x03l$\
-\xa6\x1c\xd3\xf8\x84\x07,U\x90\x92\x98\x07XL\x8aF\
-Sq\xbe\xef\xe1/f\xaa\x82\xb1\x90]\x99\xc7\xd1\x8e\
-\xfb$zx\xd9\x00\xfa\x1e\x1e\x95\x12\x86\xf5\x13s6\
-\xb3\x8fSL\xc4[\x05^\xc1=f\x0b>\x84a9\
-a\x14g\xf8\x96\xa4\xb7\xd2}\x1cWX-\xf8\x12n\
-gC\xcf\xc3\xf1a\xc55z\xd8,\xd1\xe7\xfd\x06\xc0\
-\x11n\xd0i(\xcb\xf1\x1bk\x05\xddP\xd1L<\xc2\
-c\x02\x19IJ\xa6c.\x96\x0bV\xe3c*%V\
-%\xdd\x00\x99O\xc6\x16\xbc\xc3\x05\xda\x95\xedW\x0cI\
-U\xd1Nl\xdbXh\xc8\xbf\xc3f\x1e\xe5N0\xed\
-5\x12\x87\x99\xf7\x07'y\x17\xaa\xdc\x17\xf8\x17C\xb2\
-\x12\xad\xaaE\xcf\xf06\x98O\x92W\xad\xe6v=\x8f\
-\x09\xbb\x8f>\xff\x08\xb7\xefpYegue\xd8\x8a\
-b\x16\xaf\xb1\x85u,7\xf6\xe1\xff\xaf=\x01c\x1c\
-\xea\xfe\xd0&,\xc4\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x06\xfe\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:48-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:48-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:14b95cfd-f038\
--b341-bef1-3401c\
-fbf6c41\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:f7674f8b-89e3-3\
-341-aa9f-4df6a11\
-b36d6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:67db391\
-6-1f63-1d4e-b446\
--b10670fdd4d2\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:67db3916-1f63\
--1d4e-b446-b1067\
-0fdd4d2\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:14\
-b95cfd-f038-b341\
--bef1-3401cfbf6c\
-41\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:48-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xc1\xf2\
-\xe8\x09\x00\x00\x00\xb3IDAT8\x11c\xf8\xff\xff\
-?\x03%\x98\xe1\xd9\xb3g\xe8\x98\x11\x8b\x18NL\x91\
-ft\x03\x98\xa0\xb4\x06\x10\x0b\x90j\x00\x0b\x94\x0e\x01\
-\xe2\xc7@\xacH\xac\x8b\x90m\x0e\x06\xe27@\xec\x0d\
-\xe53C\x0d\xc0\x87\xe1.\xf0\x05\xe2\x87@lKN\
-\x188\x01\xf1\x7f \xbe\x02\xc4\xf3\x80x\x03\x10\xaf!\
-\x80W\x03\xf1F \xf6d\x80\xfa\x17\xa4\xf96\x10\xc7\
-\x02q\x0a\x10\xa7\x01q*\x1e\x0cR\x93\x01\xc4Z0\
-\xa7\x88\x00\xf1I \xae'\xc7\x0b\xccP\x8e\x04\x10\xdf\
-\x04\xe2\x99\xd0\x80e\x86\xc6\x0e3\x1e\xcc\xc8\x80\x14\xe2\
- Z\x1a\x88\xf7@\xd3\x02\xd1\xd1\x88\x9e\x90\xd0\xd94\
-N\xca\x14\xe7FJ\x0d\x00\x00\x00\x12\xd9\xf2\x1b\xc9=\
-\xce\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xa3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:58-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:58-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:e1b59fde-d82a\
--e349-9a0d-35d93\
-1d15bd0\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:2772d83b-45b9-e\
-34f-a51c-a6ee008\
-66fd3\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:abac3cb\
-8-2d0c-e148-a763\
--d00e75b6ec4e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:abac3cb8-2d0c\
--e148-a763-d00e7\
-5b6ec4e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:e1\
-b59fde-d82a-e349\
--9a0d-35d931d15b\
-d0\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:58-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x18<\
-$\x9f\x00\x00\x01XIDAT8\xcbm\xd3\xcd+\
-DQ\x18\xc7\xf1;3\x06\x0be#\x0bev6\x16\
-\x9a\x9a\xa4\xd4(e!\x0b\xa6\x94\x95\xc6\xc2JV\x06\
-a!6\xcaVdea\x18o5b\xa3\xfc\x03\x22\
-aF\x16\xdec\xc1\xfd;|O\x9e3==\xdd\xa9\
-\xcf\x9c\xd3\xef\xde\xfb\x9cs\xee97\x08\xc300r\
-\xd8E\x09\x93*\x8f\x8b\x18\x1a|\xee/\xc6\xa4]\xc1\
-/\x961\x83W\x14\xcd\x00\x838\xf7\xcf\xf8\xca\xae\xed\
-\xc67:\xd4\xcd\x8dx\xc3\x08Z\xd0+y\x15\xe3\xbe\
-@\x9d\x84s8\x91~RMs\x15\x1b\xc8\xe2Y\xb2\
-E\x1c\xd8\x02.\xdcSK\xf2\xf9\x92\xca\x1f\xd1#\xb3\
-\xbdF\xc2\x16(F\x14X\xc0\xbe\xf4\xef\xd1\x874n\
-\xdd=\xba\xc0<\xce\xa4\x9fP\xf9\x1a\xb6d\xe4/)\
->\x85\xb2}\x89\x19\xbc\xa3]\xbdDW\xe8\x09\xc3H\
-aL\xf2+L\xebmLJ\xbb\xad\xd6\x1b\xc8v^\
-\x9am\x1c\x90\xf57\xe9\x02N\xa7\xac\xf1B\xb6\xcfe\
-;\xf8D\xbf\xba\xaf\x19m\xf6 \xb9C\xf3##\xc6\
-\xcd\xe1\xca\x87\xff\xbfMu-\xd0\x07iB\x1e\xee\xb2\
-\x17U\xdb\x8a\x07\xac\xabwS\x9b\xc11\x0a\x12\xd4\x9b\
-\x87\xf5\xb9\x1fB\xc5\x14\xae\x15\xc8G|T\x96\xdb\xff\
-\x1b\x9b\xbb\xbf#|\xc8\xd7W\x8ep\x8aC\xdc\xe1%\
-j\x06Y\xf9\x0e\x0ab\xd6\xd0\xf9\xa8\x9d\xc1\x1f\xae*\
-\xf1\xb8^\x1d\xfaK\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07n\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:42-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:42-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:41a75f95-724d\
--5343-867b-a7dfa\
-078d64d\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:46bfb3b3-9ca9-2\
-44f-9b78-41542aa\
-7fdd4\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:bebea1e\
-b-2105-4741-9c11\
--ff5ca0c53c22\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:bebea1eb-2105\
--4741-9c11-ff5ca\
-0c53c22\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:41\
-a75f95-724d-5343\
--867b-a7dfa078d6\
-4d\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:42-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xc5!\
-\xff\xd0\x00\x00\x01#IDAT8\xcb\x9d\xd3\xbb/\
-\x05a\x10\xc6\xe1\xef\x1c\xc7%\xa2\x94\xf8\x03(\x5c\x1a\
-\x85\xb84tZ-\x11\x95D%\xa2\x14\x82\x82\xde-\
-n\x91\xa0\xa0T\x10\x9d\x96^\x14\x04\x8d\xea\x11*\x9d\
-V3'Y\xc7&\x0e\xc5/\xbb;\xf3\xcd\xbb\xef\xcc\
-\xec&\x8c\xe2\x10;\xd8\xab\x92]l\xa3'\xe1\x1c7\
-\x98\xc3*V\xaa`\x11\xaf\x98M8\xc5\x08\xd2\x1f\xd9\
-\xc7L\xc2\x19\x9ep\x10b'\xbfp\x8ac|`:\
-a\x18\xcb\x98\xc7B\x05Kaw!\x879t\xa4\x7f\
-X\xffFB\x11\xb5(e\xa8\x8f\x03Ch\x8d\xfb\x86\
-\x8a3%\x14\xf2Tk\xe2:\x88\xcf\xd8Pc\xc4\x8a\
-y\x0e\xf2\x8a\xfb\xf1\x8e\xb1\x98\xf6u\xbc\xf1\x87H\xb6\
-\xb8\x9c\xe8\xc6\x1b\xa62\xb9\x0b\x5ce\x9e\x0b\x95\x02\xe5\
-\xe2\xb6X\xe9dNk\x17\xb1\xc2\x1f-\x94\xd5Z\xf0\
-\x82#4\xa3\x0b\xed\xe8\x8cAv\xc6\xd7\xb7\x93u\x91\
-2\xbd\x0d\xe0\x11\xb7x\xc8p\x1f\xf1;<\xe3\x12M\
-!P\xac\xb4Y@]\xceZK\x11\xab\xcbka\x22\
-lo`\xad\x0a6\xb0\x15\xdb\xe9K\x18\x8f\xff`-\
-\x12\xbf\xb1\x89\xf5\x98E\xef\x173\xbb\x00\x8e\xf1\x91\x10\
-\xca\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07{\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xe8iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00-03:00\
-\x22 xmp:MetadataDa\
-te=\x222020-05-02T1\
-8:00-03:00\x22 dc:f\
-ormat=\x22image/png\
-\x22 photoshop:Colo\
-rMode=\x223\x22 photos\
-hop:ICCProfile=\x22\
-sRGB IEC61966-2.\
-1\x22 xmpMM:Instanc\
-eID=\x22xmp.iid:4b2\
-94cf2-e3a6-8343-\
-90c6-ca2567d3b26\
-3\x22 xmpMM:Documen\
-tID=\x22adobe:docid\
-:photoshop:6fc74\
-897-6f4a-de44-b3\
-1b-9d131319314f\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:830c83cb-2b8d\
--8647-b67f-f0880\
-9615611\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:830\
-c83cb-2b8d-8647-\
-b67f-f0880961561\
-1\x22 stEvt:when=\x222\
-020-03-03T09:50:\
-42-03:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22/>\
- <rdf:li stEvt:a\
-ction=\x22saved\x22 st\
-Evt:instanceID=\x22\
-xmp.iid:4b294cf2\
--e3a6-8343-90c6-\
-ca2567d3b263\x22 st\
-Evt:when=\x222020-0\
-5-02T18:00-03:00\
-\x22 stEvt:software\
-Agent=\x22Adobe Pho\
-toshop 21.0 (Win\
-dows)\x22 stEvt:cha\
-nged=\x22/\x22/> </rdf\
-:Seq> </xmpMM:Hi\
-story> </rdf:Des\
-cription> </rdf:\
-RDF> </x:xmpmeta\
-> <?xpacket end=\
-\x22r\x22?>`^\x1bl\x00\x00\x019IDA\
-T8\xcb\x8d\xd3\xbf+Eq\x18\xc7\xf1s/rG\
-\x922\xca\xea.\x16\x16\xca&\xbf\xb2\xe9.\x92\xcd.\
-\x06R6l&\x89\x0c\x0cB\xa4\x8c&\xba\x03\x22\x03\
-I\x11\xc9p$\x93\xbf\x80\xf7\xd1\xe79=N\xe7\x9c\
-\x0c\xaf\xbe\xdfs\xee9\x9f\xe7{\x9e\x9e\x1b\x84a\x18\
-HAk\x1b6q\x84C\x1c\xe0\x18\xb3\xa8u\xcf\xff\
-\xf2\x175Z\xc7\xf1\x821\xed+X\xc0+Z\x12\xc5\
-\xfe\x04X\xfa\x12\x16\xb5\xef@\xab\xf6Uti_L\
-\x0b\xb0\xd4m\xbc\xe3\x02\xd7\xb8\xc19\xbe0\x9a\x15`\
-/7\xe3\x0d\xbb(\xeb^\x09\x03x\xc4NV\x80\xdd\
-X\xc7^\xb2Q.\xfcIaq\xcf\x92\xd5\xef]e\
-\xdf\xf1:\xad\xf3:]\x5c\xd4W\xef\xc5eFu{\
-\xa6[\xbd\xb1\xc0\x82\xff\xb1\x13W\xa8\xcf\x09\xe8\xc7Y\
-\xd6\x1cD\x0f\xddb\xc8\x1d\xbb(6#[XI\xf6\
-\xc0W\x98\xc4\x1d\x9aRN1\x82gMj\xdc\xbb\xb4\
-\xa3F\x9f\xf1\xa1\xd1\xed\xc1 6\xf0\xad\x89\xf4S\x1b\
-\xa4}\xe7\x1aN\xb0\xaa\xa6\x9eb\x19\x0f\x18\xfe\xcf(\
-\xcf)$y\xbah*\xdb\xf3\x02\xecXQ\x13?\xf5\
-/\xdc\xd7\xf4U\xd5\x9b\x86\xbc\x00\xd3\x88\x09LcJ\
-f\xd0\xe7_4?<\xbf\xe7B\xb6\xa0\x01t\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x99\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:05-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:05-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:d6bac984-ff49\
--904b-b769-f1dce\
-34ce170\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:13fe50f6-94e5-5\
-549-b77c-df9ccc1\
-0671e\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:effac00\
-5-bb28-a047-8417\
--c05acedc969e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:effac005-bb28\
--a047-8417-c05ac\
-edc969e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:d6\
-bac984-ff49-904b\
--b769-f1dce34ce1\
-70\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:05-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>u\x91\
-;o\x00\x00\x01NIDAT8\xcb\x8d\xd2\xcf+\
-\x04q\x18\xc7\xf1\x99\xd9\x12'{Y\xa9\xad\xb5Nr\
-\x93\x93\x9b\x93\xa3\x12\xb9H\x09iO8pr\xda\xda\
-8p\xdb\xb3\xfcH\xe4@\xd2\x96\x03g'\xdaR\xa2\
-\x14r\xd9\x8b?\x82\xf7\xa3\xcf\xd4\xe3\xdb\xacl\xbd\xa6\
-y\xf6;\xcf\x8f\x99\xef7j\xb5Z\x913\x84\x1a\x0e\
-\xb1\x8betk-\x09\x9e\xfd\xe1\x83M\xbc\xe3H\x89\
-\x1b\xb8\xc1\x0b\xc6\xda\x15Io\xb6\xf0\x8c>\xc5Et\
-\xea~\x06\x9f\x18\xc9*b\x97au.\xb9\x85sT\
-\x5c\xbc\x82\xdbv\xaf`\xdd\xf7\x83\x85\x0b,\xb8\xb8\x0b\
-\x8fj\xf6k\x0a\xbb\x1c\xab[Q\x9d-\xd9~M4\
-\xb0\xad\x84K\xccf\x158\xc0\x9a\xbaT\xd4\xb9\xa9\x8f\
-9\x8fI\xc4\xb8\xc6tV\x81u\x5c\x05\xaf\xd0Pr\
-\x1a\xf7\xe2\x0d\x03\x8ac_\xa0\xa0\xc5\x09\x97\xb0\x83)\
-\x17\xdb\x94'.N\xc2m\x1c\xd7V-\xa1\xc3=\xd8\
-\x83=|\xe1\x09u5\xb4\xb5\x5cZ \xad6\x8a;\
-<\xe0L\xafe\x93\x9d*yU\x93\xbc\xba-O\xc2\
-\x91\x12\x1d\x98E\x1d\xa0A\xfd_Wr\xa4\xa3\xfe\x81\
-rx\x94sY\x07E\x0a\xea\x5cS\x5c\xd5\xa4\xf9\xac\
-\x87\x13'v\xd3\x95\xd4\xb9\xaa\xd8\xb6z.\xfa\xa3k\
-\xd6teu\xb6\xe4{\xf4\xff\xb7\x80\xffNy\xebl\
-\xc9\x16\x7f\x03\xa6\x83\xee\xbbk\xfc\xe3\x13\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x00\xf8\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
-\x00\x00\x00\x09pHYs\x00\x00\x01\x90\x00\x00\x01\x90\
-\x01!\xf7\xeb~\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x00\x85ID\
-AT8\x8d\xe5\xd2O\x0a\x81\x01\x10\x87\xe1g\xa4\xfc\
-?\x87\x10[\xf7_\xb1\xb0\x96r\x00;\x85\xb0\x1c\x0b\
-\x9c`>E\xde\x03<\xfdj\x86o/230C\
-\xa7h\xdd#b\xdb\xc6\x12\xab\xf24d\xe6\xa2\x8d#\
-\x0e\xe8\x16\xbd\x1bN\xe5U\xbfW@fN\xd1+Z\
-\xd7\x88\xd8Ef.\xb1.O{6oy^\xe6\xd2\
-\x00\xd6\x94\xf3\xf7EfN\xb0A\xbfh]\xb0ha\
-\xd4\x00\xe6\xe5\x0c\xde\x8f=\xc6\xb0\x08\x9e#b_\x9e\
-\xf5\xf1\x1e\x1e\xe8$<\xae\xc1\x8d\xb7\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07w\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:22-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:22-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:1e4a5aa9-799c\
--a743-bd97-1c90e\
-65e20b8\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:0217d81c-302a-a\
-541-bdfe-ecce0d9\
-23d3a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:87b5601\
-a-c42a-214b-8591\
--60d7e5e24f02\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:87b5601a-c42a\
--214b-8591-60d7e\
-5e24f02\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:1e\
-4a5aa9-799c-a743\
--bd97-1c90e65e20\
-b8\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:22-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>O\xa4\
- s\x00\x00\x01,IDAT8\x11\xa5\xc1!k\
-\x95Q\x18\x00\xe0\xe7\xec{\x1dwZ5\x88 L\x18\
-f\xcb\x14\xfc\x01&\x8b\xb06\xedb[\xb1\x18,\xb3\
-\x898\x19F\xc1\x19\xc4(\x88\xd9hX\x98 \x08\x83\
-\x89\x18\xae\xc5 \xe8tc\xdfy\x15\x8e\xf0ya\xca\
-\x05\x9f'2\xd3\xff\x88\xf1x<\x87y\x1cE\xfa\xbb\
-\xcf\xf8\x88\x8a\x82D\x06\x16\xf1\x12;H\x93\x0a\xf6q\
-\x12\x1fpA\x93~\x0b\x1c\xc1[\x9c\xc7\x08i\xd0\xe1\
-+.\xe2\x15\xee\xa0\xc7w<\xc5N\xa0 Q\xb1\xeb\
-p\xef\xb0\x86Y$\x16\xb0\x8cK\xa1)\x9a\x19\xa4A\
-AE\xc1\x17\x8c\xf0\x037\xf0\x08\x97\xc3\xa4D\x1a\x14\
-\xcdi\xdc\xc2m\x5cE\x8f1\xe6\xc2t:\xbc\xc1*\
-\x8ea\x84\x82\x1a\xa6\x93(\x9a\xc0>\x8a_\xc2t*\
-\xce\xe1>\xae\xe0\x01N\xa0\x0b\xffV5\xef\xb1\x82\xc0\
-]l\xe0\x096C\x93\x9a\x19\xa4AA\x8fY\x9c\xc5\
-\x01\x12\x1b8\x8e\xe7\x81\x1e\xa1\xe9\x1d\xee\x14\x96q\x13\
-\x15[x\x81O\x81\xd7\xd8\xc33la\x84\xaa)\xd8\
-\xc3\x12\xeea\xdd\xa4\x12\xf8\x86k\xb8\x8e3H\x83D\
-\x87\xc7x\x88\x82\x0e\x89\x8a\x0c\x14lc\xc5t\x0e\xfc\
-\xe1'y\xe4T\xe8\xd5\x85\xf5\x88\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07;\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:09-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:09-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:572c220e-d9c8\
--674d-ae94-f1941\
-a3f9387\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:21680f67-b051-7\
-f43-8a38-ba93931\
-6fa66\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d370cc8\
-e-2c7c-274c-8135\
--ef8855de958d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d370cc8e-2c7c\
--274c-8135-ef885\
-5de958d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:57\
-2c220e-d9c8-674d\
--ae94-f1941a3f93\
-87\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:09-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x95\x90\
-\xd7\xc6\x00\x00\x00\xf0IDAT8\x11\xa5\xc1\xbd.\
-CQ\x00\x00\xe0\xef\xdc\x9eV\x93\xd6+\x18<\x81\x8d\
-E$\xc2.V\x9b\x91\xdd\x03X\x8db\xb3H\xccM\
-\xc4\x1b\x18X$L\x1d%\x96;\x18E\xd0\xbf{H\
-\xce M\xda\x22\xfd\xbeP\x96\xa5oMD\xd9\x08\x01\
-\x85\xc9\x12\x0a\xbcc\x14q\x84\x03\xbc\xa0\x86\x16\x06\xe8\
-!\x98\xae\x85\xfd\x885tp\x8e\x06Nq\x8b\x0b,\
-\x22\x19\x17\xf0\x893\xacF\x0cp\x8f\xae\xec\x19\x8f\xe8\
-\x9a\xed\x09)\xa2\x87c\xec b\x03+\xd8E\xc3d\
-C\xac\xe3&\xa2\x86\x07\x5c\xa3\x8d\x0e\xeaX@2.\
-\xc8\xfaXF=\xa2\x8e+\x5c\xfa\x9fM4\xa3\xac%\
-\x8b\xa8\xcc\x160B\x03U\x94%Y\x85\xcal\xc1\x8f\
-P\x98SaN\x11\x09AV\xf8]\xc0H\x96\x22\x12\
-^eC\x7f\xf7\x81\x10\x11q\x88%\xb4Q\x99.\xc8\
-\xfa\xd8\xc2](\xcbr\x1b{\x18 \xf8\x9b\x807\x9c\
-\x84\x94\x92y|\x01\xa1\x06<m.A\x8f\xd3\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xb5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:37-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:37-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:bfb5c45b-f67e\
--224d-8df6-95ee4\
-2ece1e1\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:12203990-294d-e\
-54f-bcef-5798626\
-2c1fb\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:803eb62\
-e-8fa3-1b46-80b4\
--d56e64e2f5fe\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:803eb62e-8fa3\
--1b46-80b4-d56e6\
-4e2f5fe\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:bf\
-b5c45b-f67e-224d\
--8df6-95ee42ece1\
-e1\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:37-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xdf\x87\
-\xeb\xee\x00\x00\x01jIDAT8\x11\x05\xc11H\
-\xd4Q\x1c\x00\xe0\xef\xbd\xfb\x9d$\xe4\xec\x14\xe5\xd8\x10\
-\xd2\x14\x94\x81T&B\x10A\xd2\x14\xd7P\x10\xe9 \
-\xd2\xaekCcM---QC9(VC9\
-F\x9bP8DP\xb74\x18\x98\xdc?\xef\x7f\xef\xf5\
-}\xd1\xef\xf7\xef\xe2:\x06\xc8\x80\x8a\xc0\x01Vq\x0b\
-\xa7\xb1\x82\x16\x19\x05\x02\xd7P\xf1\x16\x13\x80\x8a\x8a\x06\
-\x7f0\x8b\x9b\x98\xc4\x22\x0a2J\xa0\xc1\x1b\xbc\x00\x00\
-\x00\xc01<\xc0y\xbc\xc7e\x14\xe4@\xc6\x04\x00z\
-XB \xa1\xc5\x14\x9e\xe36\xb6\xb1\x85y\x94\x00$\
-\xc0*\x96\xb0\x86=\x0c\x01C\xfc\x04\x5c\xc5Kl`\
-1\x90p\x84.\xee\xa3\x87\x1d\x00@FBB\xc5/\
-\xcc#\x05\x12\x06\x98\xc6\x01vp\x12\xeb8\x8b.*\
-\x1eb\x13O1\x83K\xe8\x06\x00:\x18!\xf0\x0a\xbb\
-\xb8\x87C<\xc3$\xd61\x873X\xc1\xdf\x00@\x07\
-\xfb\xb8\x83\x01z\x00\xf8\x8e\xc7\xf8\x8a\x8bhp\x01\x1f\
-\x02\x90P0\x8eY\xbc\x06\x8c\xe1\x08\xfb\xf8\x86\x1b\xf8\
-\x0d8D\x09\x0048\x85\xe3x\x04\x18\x02\x96\x01\xd0\
-\xc1\x08\x19)\x00\x19\xffp\x02?\xb0\x07\x00HH\x80\
-\x02\x00\x01\xa8\xc8\x80\xcfh\x10\x18!\x01* \xa1\x02\
-\x04\x0a2v\xb1\x80/\x80\x16\x00\x00P\x01-j\xa0\
-`\x0dW\x00=\x8c\xa1 \x01\x00\x00Z\xcc\xe1c\xe0\
-\x09\xce\xa1\xa0\x83\x8a\x82\x04\x00\x00\xa8\x80Ox\xf7\x1f\
-\xd8\xacfB\xf3\x87\xd2K\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x00\xac\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
-\x00\x00\x00\x09pHYs\x00\x00\x01\x90\x00\x00\x01\x90\
-\x01!\xf7\xeb~\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x009ID\
-AT8\x8dc`\x18\x05\xa3`\x18\x02Fd\xce\xff\
-\xff\xff\x99\x18\x18\x18\x16300\x88\x11\xa9\xff%\x03\
-\x03C\x1c##\xe3?\x98\x00\x13\x16E\xff\xc9v\xde\
-(\x18\x05\xc3\x15\x00\x002*\x07\x03\xc6\xcd\xbd,\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07d\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:13-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:13-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:34c7e0d4-ff40\
--ee44-9be5-3df10\
-41b1c0f\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:b59e27f6-58a5-e\
-446-aa60-b414266\
-5c9f4\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:03d22f4\
-3-1e5f-8c43-8026\
--67687451b264\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:03d22f43-1e5f\
--8c43-8026-67687\
-451b264\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:34\
-c7e0d4-ff40-ee44\
--9be5-3df1041b1c\
-0f\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:13-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xf9\xae\
-\x95N\x00\x00\x01\x19IDAT8\xcb\x9d\xd3=/\
-DA\x14\xc6\xf1\xb9v\x13\x8d\x06\x05\x89J\x14\x22\xa1\
-\x90\xe8Qm'\xd1\xaav\x0b\x0a\x14\xa2\x10\xa5\xdd\x0f\
-\x80F\xe3\xb5\xd0H\xb0\x8dR\xe3K\x90\x90 \x14\xbf\
-\xf0\x11T4seVv\xedR\xfcs'\xe7\xce<\
-s\xces\xce\x04\x84\x7f\xd2\x85\x90\x06\xb2\x18\xccZP\
-\x88\xfb*(\xe5\x22\x0dj\x1d2\x8f\x17L\xe4\x19d\
-\xf1\xc7 \xaa\xb8\xc4E\x0b\xea8\xc0\x1b^\xd1\x97\xab\
-\xce\xe0\x19gX\xc1b\x13\x96P\xc6&>p\x84,\
-`\x08\x8f\xb1\xb6NJ\xd8\xc71z0\x1c\xb0\x15S\
-\x0b\xd1\xa8b\xfc\xa6\xa4\xb1\xe9\xb8w\x07\xeb\x01\xa7X\
-M\x04:5\xb3\x8e\xb5\x10\xcdY\xfe\xc3\xc1\xfc\x92+\
-T\x02N0\x8b\x11L%m\xfdI\x16K\x09\x18\xc0\
-\x13F\x03z1\x8e\xbb\xd8\xe3v\x19\x14q\x1d\xdb\x19\
-\x02\xc6\xf0\x8e\x07l\xa0\x16\xa9&\xd4\xa2\xd9{\xb8\xc5\
-9\xbas\x81\x12>q\x83\xddX\xd2a\x0b\xb61\x97\
-\x8e\x7f\xbeX\xc0=\xfa;42\x7f\x1f\x0d\xa3\x5c\xc6\
-dRg\xe1\x97y\xf8\x16K\x15\x9b\xad\xdb\xf2\x05\xed\
-#\xe4)\xa2H\xc27\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07t\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:14-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:14-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:9bf522e5-d602\
--1645-a823-f9213\
-1eebd9a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:6b1673dd-d57e-8\
-54b-bd98-1b5bb23\
-ec64a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:89260ce\
-f-20d1-0846-ae7d\
--11569bb2ad81\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:89260cef-20d1\
--0846-ae7d-11569\
-bb2ad81\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:9b\
-f522e5-d602-1645\
--a823-f92131eebd\
-9a\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:14-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>$\x13\
-\x0f\xb8\x00\x00\x01)IDAT8\x8d\xdd\xd3?+\
-\x86Q\x18\x06\xf0\xe3\xf5\x1a%\xd9)\xb1X0\xf8\x00\
-\x06\x19\x0c&\x06\xca\x9f\x81\x98\xfc-\xf2\x19\xc8B\x06\
-\x16!\xb1\x9aHz\x0dR\x94b\x93\xd8\xfc>\x80E\
-\x99\x0c\xcfyuzzd7\xdc\x9d\xce}\xdf]\xe7\
-\xba\xcfu\xdd\x01!\x17%\x94QSPK\xa3\x8c\x10\
-0\x88-\xf4\xa21\xd7\xd4\x84>lb\x0f\xa3hN\
-{\x02N\xf0\x84\x0a\x9eq\x84e\x9c\xc6{\x05\xf7x\
-\xc3\x19^p\x85U\xd4W\x01F\x22b\x07\xd6\xf1\x85\
-\x95x\x0f\x98\x8a\x0c\x02Z0\x8cw\x8cW\x01f\x12\
-Z\xad\xb8\xc9\x8d\xb2\x80\xe3\x5c\xee\x00\x8b!R\x9dN\
-\x0a\xdd\x91rC\xf2\x91sq\xb4\x80\xbax\x9eb\xae\
-\x08\xa03\x02\xd4'\xb9\x14\xa06\x01\x98\xff'\x00'\
-\x98\xfd\x03`1Q\xa1\x5c\xc4`\xe8\x17\x15\xaa\xb9I\
-\xec\xe6d\xfcQ\xe1\x10\xd7\xe8\x8f\x12\xa5>h\xc0\x00\
-.\xf1\x8a1\xb4\xc5\xda~\x95A;v\xe2\xab\xf7\xb8\
-\xc5'.\xf0\x80;l`Mf\xebG\x9c\xe3\x033\
-\xf9\x0d\xeb\xc1\x12\xb6e\xee\xeb\xca\xd5\x83l\x99&d\
-\x96o\x0d2\xb7\x95\x0a\x1a\xf3+^R\xb0\xe2\xdf8\
-\x83\xfc\x92\xc3\x81u\x7f\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07z\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:13-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:13-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:7ddea27b-4394\
--d84f-a341-f4e61\
-55c8700\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:85ab0eb3-6fb2-a\
-24a-8eb9-411e187\
-bf5cb\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:eeaa43d\
-4-14e6-bd47-b3a6\
--8d1934d078b1\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:eeaa43d4-14e6\
--bd47-b3a6-8d193\
-4d078b1\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:7d\
-dea27b-4394-d84f\
--a341-f4e6155c87\
-00\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:13-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>93\
-d\xb0\x00\x00\x01/IDAT8\xcb\x95\xd3=/\
-DA\x14\xc6\xf1\xb9w\x91P*(h\x84\xa8$[\
-XD#^\x92-5Z%\x8b\x0a\x91H\x14>\x02\
-\x1f\x82\x06\x85Pi5^;\xb1\x09\x91\x10\x14\x97\x9e\
-\x0f\xe0?\xf2\x8cLN\xae\xbb\x14\xbf\xddy={f\
-\xe6\xac\xcb\xb2\xcc!\x95\x12Z\xa2~\xda`\xce9\x05\
-\x08\xfapl\xc6\x82A\x1c\xdaq\xff\xd1\x8eq\x0cc\
-\x09/\xa8b\x0c\x13\x98\xd4\xdc:\x9e0\xaa\xb1\x8a\xcf\
-\xc2\x07\xd8\xc6\x1bNQ\xc7'\xaeq\x89+9\xc7\x1d\
->p\xa1\xfe;\xa6\x9d\xd2\x9aSJe-\xc8;\x82\
-\xcf\xe6,\xea\x1f`\xcd7\xf6Q\xd3`+\xba\xc2\x05\
-I\x12\xb5;\xa29\xbfo9D\x9a\xcf\xf9\xc5\xc4l\
-\x9eA\xa7\xc9`%4j\xd1s\xfaM\xcd&\xd8\x06\
-\x9e\xd1\xdd(@I\xdf;XT{\x13\xaf\xe81k\
-\x0a\x03L\xe1\x11'\xb8G\xaf\x99/<B\xb8\xa4\x11\
-\xbdH\xbf\xfaM\xe6R\x7f\x02\xf8\xdb\x5c\x88\x16%9\
-\x8b\xc3xj\x8e\xf0\xfd\x0a{\x98\xfd\xe5\xed\x8b\xec\x86\
-\x00G\xd8R\xaaC\xaa\xf9\xa0\x92\xd3\xf7\x06TT\xab\
-N5\xf0\x80\x1b\xdc\xfeQ]\xa5^vQ\x05\xfeG\
-\x9b\xfe\xda\xee\x0bz\x1f\xf5\x13\xe8\xed\xe2l\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07r\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:27-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:27-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:41a72668-2697\
--c34b-b659-1d4d1\
-9bb8739\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:0ba35df4-ed1f-9\
-e45-afaf-26118e1\
-dca6a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:7aa692d\
-a-b29d-b342-add3\
--1bcf9ea2dbb8\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:7aa692da-b29d\
--b342-add3-1bcf9\
-ea2dbb8\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:41\
-a72668-2697-c34b\
--b659-1d4d19bb87\
-39\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:27-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>/`\
-\x9cx\x00\x00\x01'IDAT8\xcb\x85\xd3\xbd+\
-\xc5a\x14\x07\xf0\x9f\xeb\xe5..F\x85\x85R&E\
-6\x91U\x16\xa3\x7f\x81\x85n\xd15\x9a\x94A\xfe\x02\
-\x9b\x01\x03&\x8b\x92Q\x06/\x93RJ\xfa\x94\xd5_\
-`\xf0<uz\xba\xdc_==\xe7\xe5w\xbe\xe7|\
-\xcf9O\x85\xaa\xc3\xe9\xc7\x1e\xc6\x92\xde\x15\xfd\xe5\xcf\
-\xd1YK\xf7\x12^Q\xef\x04P+\x80z\x92\xbc\x8d\
-\xd3\xbf\x12\x95\xc1\xb3\x18-lg\xd8L\xf2\x1cF\xa2\
-\xbfBw2L\xf9\xfd\x16B\xa6!\xbc`&\xe9\x07\
-\xb8\x8b\x95d\xa1\x8eg\xb4\x92\xde\x13*z\xc4@\x08\
-\xba\xc5Q\x09p\x82\xcb6\xfd\xd8I\xbe\x08:\x8cO\
-\xace\x0a\xeb\xf8\x08T\xbaB\x93\xae\xb0\x15\x002\xc8\
-\x22\xbe1\x9e\x95\xf7Tn\xecI\x1d\x0f\x98\x0fUe\
-\xdf.\xee\xd1\xc8%o\xe0\x0d\x8d@c!\x01\xf4\x16\
-\xc0+\xf8\xc2D\xa6\x90\xf9\x1e\xe3:\x044qQ\x04\
-O&\xfe\xab\xd9\x1e\x97\xa2\x177X\x0e\xf3o\x16\x00\
-\x87\xd8\x8f\xb6r\xb3\xfa\xd2=\x80\xa70\xffZ\xf0\xff\
-\xfb\x16\xf2\x99N\x00\x83\xed\xf6\xff?\x80\x9c\xa9\x85\xf3\
-6o\xa4#@\x15\xe6<\xdb);\xaa\x1fED\xd8\
-P\x22Am\x98\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x06\xed\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:19-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:19-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:968a856f-3112\
--7443-ae82-056f2\
-fee2414\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:f3cdc500-e6fd-b\
-44a-9824-074090b\
-4ff5d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:811bddb\
-5-357e-7b46-8990\
--8e74c910eb68\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:811bddb5-357e\
--7b46-8990-8e74c\
-910eb68\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:96\
-8a856f-3112-7443\
--ae82-056f2fee24\
-14\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:19-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x8d\x0b\
-\x9e5\x00\x00\x00\xa2IDAT8\x11c\xf8\xff\xff\
-?\x03%\x98d\x0d\xcf\x9e=c\x04a\xb2\x0c\x00j\
-d\x22\xdb\x05@\xcd\xccP\xda\x04\x88\x8bH2\x00I\
-\xb3&\x10?\x05\xe2\x0a\x98w0\xfcG\x84\xe6bd\
-\xb5\x18\x1a\x91\xfd\x89\xa6\xf9\x09\xcc\xe90qd\x03\xa4\
-\x80x'\x10\xebB\xf9,Xl\xc6\xd0\x8c\x12\x06@\
-\x892 ~\x0e\xc4\x86Hb\xe8\xcef\xc6\x1b\x0b@\
-\x05i@\xfc\x16\x88-\x81X\xe5\x19\x04\xe0\xd4\x8c\xee\
-\x02&(\x1d\x01\xb5\x15\xa7\xb3\xf1\xb9\x00fH\x00\x10\
-\xe7\xe2J<x\x13\x12Z,0\x92\x95\x17\xa0\xe9\x9d\
-\x89&\x99\x89\xea\x06\x00\x00kw\xfc\x8d\x05\xbe\xa4\xe5\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x88\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:26-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:26-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:55cb6ad8-a15a\
--e944-a0ec-e83c9\
-ff363b1\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:12e4a41f-4b20-3\
-c4b-a307-b361aa8\
-5e9a9\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:be6834e\
-1-1a33-694e-8698\
--26b0195b82db\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:be6834e1-1a33\
--694e-8698-26b01\
-95b82db\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:55\
-cb6ad8-a15a-e944\
--a0ec-e83c9ff363\
-b1\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:26-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xaa\xbb\
-\x228\x00\x00\x01=IDAT8\x8d\x8d\xd3\xbf+\
-\xc6Q\x14\x06\xf0\xef\xfb\xfa\xb1\xa00\x98\x0c\xca\xa8\x0c\
-^\xa3\xc1$E\xb1P\xec\x12\xc9f!\x8bbR\x16\
-\x16,d\xf2\x0fH~\x0c\xaf\x94(\xca\x8f\x14\x93\xc1\
-g\xf2\x17X\x18\xdc[\xd7\xd7+\x86[\xf7\x9c\xdb\xf3\
-\x9c\xe79\xe7\xdc\x0c\xd9\x1f\xa7*\x17\xf7c\x03\x9d\xc8\
-~\x03\x15P\xcc\xe5\x86Q\xc6\x03>0P\x89\xa0P\
-\xa1\xe28\xcep\x8d\x09\xf4\xe2\x1c\x8d)A\xbeb\x1d\
-fq\x83\x0b\x8c\xa15\xbcM\xe20\xe2\x228\x02\x9b\
-1\x8f\xe7 w$\xe4\xeb\xf1\x88.lb1\xe4\x8b\
-\x11\xd8\x8a\xd5\x00<B_BZ\x8f',\xa3\x16\xf7\
-\xe8N\x09\xa6\xf0\x82\xf5P!\xf5_\x8b+l\x85\xb8\
-\x84[4\xa4\x16\xd6\xf0\x8e%\xb4\xe5\x08N\xb1\x9f\xc4\
-\x0b\xd8\x8b\xd5\xd3&\x96\xb0\x1d\x94\x1cc\x14\xbb\xc1N\
-Jx\x80\x99p\xaf\x8e\x04i\x13[0\x8d;\xbc\xa1\
-)yk\x0c\xa3\x8c6\x0b\xa9\x82\xa2\x9f\xf3/c.\
-\x89\x07\xc3H\xbf\xedN\xa5E\xaa\x09\xf7n\xbc\xa2#\
-\xc4\xcb\xd8I\xfdW\x22\xc8\xef\xffJhd\x16\xfa1\
-\xfe_\x82\x94\xe8\xc2\xd7\x8e\x5c\xa2=\xf5\xff\x17AT\
-Q\xf2\xf5yNr\x0d\xff\x97\x82(u\x08=\xf9\xea\
-\xc8>\x01\xf2\x8e\xe4\xf0b\x16\xea\x11\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x06\xff\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:29-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:29-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:52d4769c-120f\
--d248-a016-0f76e\
-8c76999\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:5d80309b-4856-d\
-e43-893b-7d5e502\
-b5899\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:9faf887\
-9-1915-f248-b102\
--81861202cd97\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:9faf8879-1915\
--f248-b102-81861\
-202cd97\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:52\
-d4769c-120f-d248\
--a016-0f76e8c769\
-99\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:29-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>Ng\
-\x80\xeb\x00\x00\x00\xb4IDAT8\xcb\xad\xd3\xb1\x0d\
-\xc2@\x0c\x05\xd0\x84\x80\xd20\x12{\xa4\xa1\xa0K\x84\
-\x18\x87\x15\xa8\x22\x14A\x81X\x83%\x1ec\x84\xc6\x91\
-\xae\x81$@a\xd9\xf2\xbf\xfbg\x7f\xfb\xb2\xbe\xef\xb3\
-_\xec#\x885\xca\xd9\x04\xc8\xc3\x1fQE\x5c|C\
-p\xc3>\xe2\xe57\x04\x1d\xeaI\x15 O\xac\x88\xdc\
-\x05M\xc4\xab\x01\x9f#\xe2\x19\xbbQ\x11C\xedc\xf4\
-\xdc\xc5\xcbg<\xf1@\x8bk`\xf7\xa4\xad| (\
-Qa\x8f\x1a\x0dvq\xf9\x84m\x82\x1d\xb0\x99\xdaB\
-\x8b\xed\xa4=@\x81e\xf8U\xe4\xae\xc9\x18\xcb\xe4\xcc\
-\xe2\xffc|Cp\xc7a\xf6\x22%D\xf5 XZ\
-\xf6d\x82\x7f\xfc\xc6|\x8c\xe0\x05\x9cL\xff\x03\xfeO\
-\x5c\xee\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xa0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:40-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:40-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:c909f28e-0d7e\
--f940-80e1-fe186\
-1c21a99\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:51296a5b-49db-3\
-c47-824a-eab7f2b\
-5bd1a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:6ed01de\
-2-4703-314b-adf6\
--cd9038080e8f\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:6ed01de2-4703\
--314b-adf6-cd903\
-8080e8f\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:c9\
-09f28e-0d7e-f940\
--80e1-fe1861c21a\
-99\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:40-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x13\xe3\
-\x1bl\x00\x00\x01UIDAT8\x11u\xc1;k\
-\x14Q\x18\x00\xd03w\xc7\x8c(\x92.\x9d\x85\xa4\x12\
-\xe2\x1b-\x04\x1b\xc1n\x89\x88\x16\xa2\x9d\xa4K\x91J\
-DT\xd4\xc6\xc2\x22\xa06\xda\xf9\x0b\x221\x10\xb0\xb2\
-\xd3V\xb4\x13\x15D]\x1b\x17\x12\x05\x97\x98\xc9\x5c\x03\
-_`\x19\xd8=\xa7\xe8\xf5z\xb6\x1d\xc05\xdcG\x8d\
-\x02\x19\x0bx\x8f\xd7(Q\xe30.\xe2\xaemI\x98\
-\xc2\x15\x94B!tqH\xe8\x08\x938/\xa4$d\
-\xac!i\xfb\x8d\x81P\x0b\x97p\x10\xe7\xd0$a\x0d\
-\x9b\xf8\xab\xad\x83$l\xe1&N\xe2:\x9e\xe1H\x12\
-\xe6p\x0a\xb3Ba\xb43x\x81\xc7\xf8\x85c\x097\
-p\x16\x0bx\x88\xe3\xd82\xda#\xcc\xe1\x0d\x06XI\
-8\x81e<\xc1:\x8e\x1am\x02\xaf\xf0\x00\xd3\xe8\xa2\
-\x9f\xf0\x1cW\xf1\x16\x03,\x1b\xaa\xd1h\xfb\x8aO\xf8\
-\x83Tb\x15{\xf0\x143\xe8\xa3@\xc6\x14\xf6i\x9b\
-@%4I\xf8\x88\xcf\xe8\x0b\x19\x8b\x98\xc6<f\xf1\
-O\xc8\xc8B\x91\x84\x0a\x15v\x093\xb8\x8c\xfd\xb8\x8d\
-{\xc6HBFF\x16\xd6\xb1\x81.N\xe3\x871J\
-m\x8d\xf0\x0d\xf3X\xc2;\x5c0Fi(\x1b\xea`\
-\x15+x\x89\x9f\xa8\xb0\x81\x8c\xc6\x8e$$T\x86\xb2\
-\xb0\x17\x93B\x16:\xd8mG)|\xc1-l\x0aY\
-X\xc4w\xa1\x16>\xe0\x8e\x90\xff\x03\x02\xa3X\xa7\xa9\
-\xd4\x0b\xa5\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x84\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:21-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:21-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:5924d4e4-074b\
--b64c-ada6-42f09\
-9ceb39f\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ef1b4d68-4a31-8\
-e41-a6c5-5b5f313\
-e4fbc\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:05daf1e\
-9-ce37-8d49-b123\
--f30a94bce7d2\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:05daf1e9-ce37\
--8d49-b123-f30a9\
-4bce7d2\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:59\
-24d4e4-074b-b64c\
--ada6-42f099ceb3\
-9f\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:21-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x19\x0d\
-M+\x00\x00\x019IDAT8\x8d\x95\xd3\xbd/\
-eQ\x14\x05\xf0\xe7[BG#\x99^\x82\x84<\x89\
-hFO9\x05\x11\x0a\x9f\xa5\x86J\xe3oP1\x09\
-\xaa\x97QH|\xccT*\x91h\x10DD!\x11Q\
-\xe0\xd7h\xf5W1\xfb&\xd7\xf5\xde\x1379\xb9\xeb\
-\xdc}\xf7Zk\xefsv!I\x92\xc2w\x17\x861\
-\x97$I\xa1\x5c\xb0\x06u\x81\x7f\xe1/v\xb1\x17\xab\
-\x84W\xac}\x22@Mn\x7f\x80?\x18\xc1\x04\xe60\
-\x8f)\xfc\xf8@\x90&\xa3\x1d\xab\xa1\xfa\x84c\xfc\xc6\
-X9\xb7\xf9\xe4\x16\x5cb?\x14\xaf\xb1\x1d\xca\x0fX\
-\x8d\xff\x1a\xd3\x9c\x94\xa06\xde\xd38\xc9(\xec`2\
-p\x0f\xee\xd0\x91\x15\xcd\x13\xac`3p3\x0e\xb1\x14\
-\xfb\x0e\x9c\xa3?\x9b\x93'X\xc0\x1bNq\x81g\xdc\
-\xe3\x0c\xb7\xfe?]\xd5\x1c,\xe3\x1f:1\x88^\x14\
-\xd1\x8f!\xdc\xa0\xef\xab\x12\xd6+\x5c\x9e\xdapR\xfc\
-\x8a`#pC$\xa5\xb1\xd6\xe8A\xb1Z\x0f\x16Q\
-\x0a\x5c\x9f;\xe2\xb6\xe8Kg5\x07\x03q\xde\xad\x19\
-\xdbil\x1cW\xf9\xd2\xca\xd5Z\xc2\x11\xda2\xdf~\
-\xe2\x05\xa3Y\xc1JW\xb9\x09[x\x8cY8\x0a<\
-Sn^*\x0e\x13\xba1\x8bQ\xb4W\x1a\xedwt\
-#\x08\xa4@\xa1c\xf1\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\x1b\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:24-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:24-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:142f0777-16f4\
--b849-9e7f-75ef9\
-190ebdc\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:43d5f90a-3e5a-c\
-d4f-a904-b28b76e\
-f0898\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:1ad6eb7\
-3-45dd-c449-b605\
--34a84c141a1e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:1ad6eb73-45dd\
--c449-b605-34a84\
-c141a1e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:14\
-2f0777-16f4-b849\
--9e7f-75ef9190eb\
-dc\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:24-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xdf\x89\
-\xa6z\x00\x00\x00\xd0IDAT8\x8d\x9d\xd2\xc1\x0a\
-\x01A\x1c\xc7\xf1Eq\xa1\xc4Mrw\x11'\x17\x0f\
-@\xc9\xcd\x89;/\xc2a=\x80\xe4\xe4\xa2\xa4\xe4\xa0\
-<\x83\x1cp\xc4\x09\xd9\xd7X\xdf\xad\xff\xd6\xa4f\xdb\
-\x99\xc3\xa7\x99\x9a\x99_\xff\xfe\xf3w|\xdfwT\x9e\
-\xe7%dm`\x85)r\xff\xf7B\xba\xc7E\x5c1\
-\xc3\x11K\xf5<* )k\x0d\x1f\xd9\xb7q\x8b\x15\
-\xa0\x04\xa5\xb0\x96*\xee\x18\x19\x05\xc8\xe54\xbah\xea\
-\xeeD\x06HH\x09y\xab\x00\x1e\xba\xf8\xe2\x19T\x12\
-\xb7\x89\xe1/T\xf1B\x06\x03\x9cL\x03\xca\xd2\xbc!\
-\xe6\xd8\xc5n\xa2\x12\xd2\xc3\x19{T\x8c\x7fA\x17l\
-RA\x1d[if\xd6t\x94\x0b\xb8`\x82\x03\x166\
-\xa3\xfc\x96}\xc7v\x947R\xc5\x03c\x9b_\x08F\
-\xb9\x8fVTs\x7fP\x05\x01\x99\x1a`\xba\x88\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x074\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:04-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:04-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:cf4b52ce-2059\
--9d4b-a801-1b162\
-862a2fb\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:86eaaca0-f1d9-0\
-849-a7d2-b9becd7\
-b4797\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:64436ca\
-5-5bfe-8e4f-82b7\
--c2aceef5c797\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:64436ca5-5bfe\
--8e4f-82b7-c2ace\
-ef5c797\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:cf\
-4b52ce-2059-9d4b\
--a801-1b162862a2\
-fb\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:04-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x03q\
-\x01\x94\x00\x00\x00\xe9IDAT8\xcb\x95\x93M\x0a\
-\xc20\x10\x85\xdb\x1a\x17\xa2B\x11\xbd\x82w\x10\x5c\x0a\
-\xfeau\xe1\x99\xdc\xd7^I\xd0\xb5\xa2\xe2\x01\x8c\xa2\
-\x87\xd0WH\xe01L\xfcY|\xd0\xe9\xe4\xbd\xccL\
-\x92\xc8Z\x1b9b\x90P\x1c\xa2\xc21\x8b\xfdw\xc8\
-$\xd6\xfes\xa2\x0b\xfa\x01\x13\x16OA\x83\x0d\xfc\xe2\
-\x1e\xb8\x82\xcc\xc5F\x11\x17`\x07j>'\xcb\x1e\x83\
-;\x98\xb9\xb8J\xe2\x1c\xecA\x9b\x8d#\xa5\xf7\x913\
-\x99Sn\xed\xc4-\xd9\xa2\x1c\x8a\xa1>\x1f\xcel\x05\
-\x8e$VO\x81\xf1e\x0f\xc0\x0b\x5chhF;\x85\
-\xd0\xb4\xcb\x9d\xcf\xe0\x00&\xda\xee\xd2 \x16=\x9f@\
-\x13\x0c\xc1\x93\x06k\xbe]\xa4\x5c\x0c\x8c\x07\x9b\xc9\xf5\
-\xb2\x85B\x88\x0d\x95]\x9a\xdc\xc0R\x1e#\x1f\xdf\x16\
-t\x94~}\xd9\x0b\xb0\x01\xa9\xbcH%u\xbaa\xc9\
-\x87\xb7\x90\xb2\xf9\xcf\x8f&\x94\xfbG\xac\xaey\x03\xbd\
-\xe9\xce\xc4\x1c\xbdW\x11\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\x87\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:29-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:29-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:c7df5c39-cf5f\
--0d4c-b538-2c72e\
-9d0c878\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:389816d6-0898-e\
-444-8a33-95510f7\
-803ef\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:224b2a1\
-b-c577-a64e-a220\
--71532f4413c8\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:224b2a1b-c577\
--a64e-a220-71532\
-f4413c8\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:c7\
-df5c39-cf5f-0d4c\
--b538-2c72e9d0c8\
-78\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:29-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x98\xfd\
-\xbam\x00\x00\x01<IDAT8\xcb}\xd3;K\
-\x03A\x14\x86\xe1\xc4\xcb\xa2\x16\x22\xd6\x9a\xc6\xa4\xb0\x0b\
-Xy),\x14,m\xc5\x22\x1a\xc1\x10\x22Z(\xd8\
-Y\x8a\x22h\xe7\x0fP\x10D\xf0\x12,\x84D\xd0&\
-\xa8\x85xk\x04;a\xf5g\xf8n<\x0b\x9f\xc3\xac\
-\x0b\x0f;3;sv\xe7\xec\x99T\x18\x86)\x8fV\
-\xbb/c\xdc\xdam\xbe\xb9\xee@\xda\xe9_cE\xfa\
--\xff\x05\xd0\x87\x13\xe8\xc2\x09\x8a\xe8\xc3\x90\xefE\xee\
-\xe2~\xdc\xa0\x81n\x9cb\x0e\xa3\xf8\xc2\xb6\x1bD\x17\
-g\xf0\x81=\xd9o\x15ek\xe7p\x87\xa3\xa4-\xd4\
-\xb0\xeb\xec\xf1\x02%\xe9G\x81\x9f,\xb9\xcd\x97\xeb\x9e\
-\xdf\xd0\xeed\xfc\x0c\x8b\xd6\xee\xb4\xfb\x14^\x10\xe8\x17\
-\xeccG\x16\xc7I\xba\xc2\x92g\xfc\x1e\x93\x1a \xca\
-v\xc53q\x0b\xd3R\x1b\xf1\xf8%\xe65\xc01V\
-=\x05\x13HQ\xe9\xef\x8b\xf25\xab\x016p\xe0T\
-aR\x91\xf5\xe0\x19y\x0d0\x80Od\x9d\xafH\x8b\
-\xc0\xc6\xd6q\x1b?\xd7:\xd8\xc4CR\xcd\x9b\xb1\xf0\
-\xf7\x1a\xd6\x00\xea\x10\xaf\x96\xe1\x0e\x19\xef\xc5\x1a\xbeQ\
-\xd0\xea\xf5\x1d\xa2\x8a\x05y\xc4\xb9\xfd\xcaw\xd4\xad\xa4\
-\xff\x9c\x9b\xa4\x93\x18\x15\xcd\x08\x160\x83A\xcfQo\
-\xfa\x01\xbb\xaf\xdfcv\x1f9\x0f\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07U\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:23-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:23-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:de63df63-2623\
--844f-8e1e-eff0b\
-4f7ec30\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:7f81ae1e-1d38-e\
-14f-af78-0bd706e\
-0554b\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:1b99549\
-8-6d7d-494a-9282\
--3e4d62be73dc\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:1b995498-6d7d\
--494a-9282-3e4d6\
-2be73dc\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:de\
-63df63-2623-844f\
--8e1e-eff0b4f7ec\
-30\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:23-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x13\xc1\
-B\xcc\x00\x00\x01\x0aIDAT8\xcb\x8d\xd3\xbdJ\
-\x03Q\x10\x05\xe0\x8d\xff\x85\x16bo%b\xb0Oa\
-^\xc06>\x80\x95\xa8e \xa2oc\xaf\xe0Oa\
-,\x8c\x82\xe6!l\xecD?\xb0\xb4\x17\xd6f\x227\
-\xeb\xee&\xc5\xe5\xee\xec\xec93g\xe6l\x96\xe7y\
-\x96\xe7y\x86\xc6\xe8F\x17\xab\x11\xcf\x8c\xbe);c\
-\xe0x>G\x8e>\x16&\x91d\x09p.\xc0\xcfX\
-\xc1\x05\x86\x98\xaf#\xf9K\xa0\x1d\x95w\x13\xd2\xeb \
-\xac$)\xea\xdf\xc7'\xda\x09\xc9\x15^\xaa\xe4d%\
-C<\xc0\x17v\x0a$\xc32\x92\xb1v0\x1b\xf7a\
-t\xd2Jr7\x18`1-\xf8o(I\x95c|\
-\xa3\x99\xe4\x9e0(\x95Pl-\xb6p\x87\xb5\x887\
-\xf0\x8a\xb3\xaa\x19\xa4\xe0>\x1e\x93v7\xf1\x8e\xd3i\
-\x8ct\x8f\x87D\xca\x16>p2i\x0b\xcb\xb8\xc4-\
-\x96\xe2]\xb3\x00n\xd4\x19\xa9\x85\x1ft\x22\xde\x8eM\
-\xf4j\x9d\x98&\xd1\x09\xd0\x11\xdeF\x9a\xcb*W\x0e\
-\x11{a\xe9\xee\xd4\x7fc\x89\x1b\xd7\xeb@\xe9\xf9\x05\
-n\x18\x05\x86=\xafg~\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07\x82\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:35-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:35-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:2e5eeb00-c0f6\
--d142-8f33-01332\
-7eb4bb9\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:d6108ab4-9282-b\
-e47-9c48-dcf35f9\
-f1bd0\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:bf73c38\
-4-664f-7943-a264\
--534a5ed4556d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:bf73c384-664f\
--7943-a264-534a5\
-ed4556d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:2e\
-5eeb00-c0f6-d142\
--8f33-013327eb4b\
-b9\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:35-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xa0\xbc\
-\xacL\x00\x00\x017IDAT8\x8d\x8d\xd2\xbd/\
-\x04A\x1c\xc6\xf1\xb3\xceE\xc854\x14\x0a\x14\x22Q\
-#Qi\xfc\x13\x14B\x9cC\xc3!QQ\x10\x89^\
-\x22N\x90 Qx9J\x85h%^\x13\x05Q\x88\
-j{\x95r}'\x9eI&\x93\x1d\xe7\x92O\xe67\
-\xb3\xbf}vg\xf62I\x92d\xe28\x9e\xc19N\
-\xe4\xd4\x19\x8fU\xcf\x9a^\xf5\xd7\xd8\xda.\x5c\xe1\x02\
-\xc3\x98FQ\xe3(6\xf1\x857\xac\xfa!vb\x9e\
->b/\xbaX\x1f\xc05\x9a\xf1\x81u\xf7\xbam2\
-O/\xaa\xce!BV\xf3!<\xa8n\xc5;\xd6\xd2\
-\x02&U\xd7j\x8c\x9c\x80g\xd4k\xde\x15\xff\xfe\xa6\
-\xfe\x1b\xd0\x8fO\xf3\x16x\xc2\x0d\xbeQ\x0e\x05d\xdd\
-Cbl@\x0fz\xa5\x1b;\xd8\x0a\x05Di\x87\xe9\
-\x1d\xec\x92\x09\x09\x05\xe4\xd1\xe8\xc9K\x9dzV\xfc\x80\
-K\x8c;a/\xb8\xd3\xbe\xef\xf1\x88[\xb4\x85\x02\xcc\
-M\x05\xd5\xed\xe8D\x87\xc7\xac\xe7\xd4\xb3\x9c\x160\xa1\
-\xba\xa0=.`\xd1QB\xd3_[\xb0\x01\x1b8\xc0\
-.\xf6d\xdf|6\xb4\x84\x02*\x18\xabv\xfa\xdeW\
-(\xfbo\xf0\x8a#m\xa7\x12p\x86C\xfd\x13\xb7\xdd\
-\x80A\xcca\xbe\x8a\x92\xd3\xd7g\xee\xfd\x01\xf9\x9c\x19\
-x\x90\x95]J\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07 \
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-07T18:58:57-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-7T18:58:57-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:13480074-0859\
--b449-9a80-4692e\
-63f6700\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:a984ae95-18b6-c\
-14f-a5b5-0628b57\
-3b06f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:38ae783\
-5-d3aa-b842-935a\
--31fa60e39c33\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:38ae7835-d3aa\
--b842-935a-31fa6\
-0e39c33\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:13\
-480074-0859-b449\
--9a80-4692e63f67\
-00\x22 stEvt:when=\x22\
-2020-05-07T18:58\
-:57-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xaa~\
-\x0dL\x00\x00\x00\xd5IDAT8\x8d\xc5\xd3=N\
-\x031\x14\x04\xe0\xcf\xbbKEM\xc5\x05@\xe2(@\
-\x0d\x05\xc7\xa1\x01!8\x01'\x80\x13\xf0s\x80\xb4{\
-\x12@\x22\x89\x021\x05o\x91\x15\x9c\x88(\x05\xd3x\
-<~3z~\x96S\xce\xd9&h6r\xa3\xeb\xfb\
-~U\xf8<xB\xb5\xd5e\x1d\xb4a\xde\xc5v\x98\
-\xab\xb55\xb1\xc3'\xf6\xd0\xe3.\xf4y\xad~Q\xe8\
-\xf0\x81}<\xe3\x1c/\xc1\xab!\xcd\x12\xf3\x13.q\
-\x85S\xbc\xe3\xb1\x162\x90v\xc1|\x81\xeb8\xcb8\
-\xc4\x18\x0fEH\x1a\x02\x9a\xb8\xf3Aa\xbe):\xdb\
-\x8a\xf5\x18\xd3\x08i#\xf8\xe7\xa9vp_1\xc3\xac\
-\xe8\xe4(\xf6\xb7\xa1\xa5.\xc8\x04g\x18Y\x8d\x8c\x13\
-\xdf/\x04y\x98\xc1\xdb\x1f\xcc\x03^\xcb\xdar\x88\xeb\
-\xe2\xd7\x10\xd7E\x86\xf4\xef\xbf\xf1\x0ba\x979b\x0e\
-\xf3B\xcb\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xb9\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:52-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:52-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:1ff7f8a3-01b1\
--d844-ae43-5fc67\
-3a3ad24\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:3313adb8-84c6-e\
-745-8eb5-398e51f\
-1ac86\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:fe71178\
-5-ed1c-914e-987f\
--663a0927fc31\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:fe711785-ed1c\
--914e-987f-663a0\
-927fc31\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:1f\
-f7f8a3-01b1-d844\
--ae43-5fc673a3ad\
-24\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:52-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>!\xfa\
-\x05}\x00\x00\x01nIDAT8\xcb\x9d\xd3\xcd+\
-DQ\x18\xc7\xf1;cRHHI);yk\xbc\
-$\xb2\xb0\xb1\xb1@\x166VBYP\xca\xe4\xa5(\
-\x0bee)\xd9)\xd9xO6VR\x22\x0b\xef6\
-^\x8a(\xc6\xb0\x93\xff\xc0\xf7\xa9\xdf\xa9\xeb6&\xb9\
-\xf5\xe9\x9e{\xef9\xcf9\xf7y\xce\xf1\x12\x89\x84\xf7\
-\x0f\xed\xe8\xb3\xf6_:\xe7\xf9\xe4#\x849\xac\xa7\x0a\
-\x10\xd6}\x0c\xb78\xc1\x99\x1c\xe3\x03\xe3\xc1\x00\xe1$\
-\x81v1\x83\x02T\xa0\x14\x95(C\x86\x0b\x10\x0a\x0c\
-\xcaD\xb6/\xc0\x80\xda\xe9\xc9V\xeb\x1a\x16d\x0a\x97\
-\xb8\x10[n\x1c\x8f8\xc7\x15\xaeq\x84\xb6`\x00K\
-\xc8)ZP\x8dF\xd4\xab]\x8b\x06)\xd7\x8a\xde\xd1\
-\xeb\x02\xf4\xe0F\x81\x8aP\x97\xa2\x22\xdd\xba[\xf0\x17\
-\xcb\x8d=,c\x129\xd8\xc1\x81f\xb6\xa4F4\xc0\
-\xbe5\xab_\x87J\xba\x87.\xfb\xb8\xa1U\xc4\xf0\x85\
-O\xac\x06f\xb6\xcc\xaf(W\xb3h\xc5\x22F\xdc\xff\
-\x0f\xaa\xe3\x04\x16|\x03\xb3]\xb9\x90\x865\x94\xe8y\
-\x0b\xc3.@\xbf^\x16h\xb7Y{S\x9b\xe8\xc97\
-A\x89\xca\xec\xc6\xc5<-w4\xb0\xe4%\x1cj\xf3\
-t*\xebM\x81\x0d\xb7\x8d!O\x87\xe2\x19Q\xe4b\
-\x1ew\xc8\xf2\x05\xb4\x92\xbdj\x07z*\xad]Q\xd7\
-a\x1a\x0f\xb8\xc7>\x8a\xf5>\xa2\x7f\xf7\xb4\xd1\xe2\xaa\
-\xd4\x9b\xce\xc9\x8f\xb3P\xe8K\xd0og\xa3F\xf9\xa8\
-r\xef\xbe\x01\x1eE\xf5\xbc%\xf0X\xe4\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07\xb6\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:22-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:22-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:dc09d6ae-a23f\
--5148-8004-f9313\
-1ba37a6\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:5bcd662e-6479-f\
-d4d-ae47-32b2af6\
-35003\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:ed334ea\
-1-fc10-cb4a-a957\
--925ed025202e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:ed334ea1-fc10\
--cb4a-a957-925ed\
-025202e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:dc\
-09d6ae-a23f-5148\
--8004-f93131ba37\
-a6\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:22-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>}\xd8\
-1\xf2\x00\x00\x01kIDAT8\x11\xa5\xc1M\x8b\
-Ma\x00\x00\xe0\xe7=\xe7\xbd\xf3\xb5p)\x9bI\xb3\
-\xb0\xd0\xac(\x1bMi\x8a\x1f`\xa9\x8c\xfc\x81\x89\x95\
-\x8d\x8d\xb2b'Q\xf8\x01c\xa1H\x12\xd9\xd8X\xcc\
-\xc2B1Q\x16\x1a#u\x8e\x8d\xc5\x5cWw\xee\xdc\
-9\xe75\xf5\xaa\x9bX\xf1<!\xa5\xe4\x7f\xc4\xba\xae\
-\xa7q\x103H\xd8F\x81\x0e\x92\xb1o\xf8\x82\x16\x01\
-\x09)\xe2\x18\x9ec\x1d\x0d\xe6\xb1\x89\x1a\x11\xdb\x98\xc5\
-g,\xc8\x92_\x22:x\x8f\x05$<\xc4\x0b\xdc\xc1\
-\x1e\xf4p\x1c/q\x0d\x0d\x06\xb8\x8f\xf5\x02A\xd6\xa0\
-E\xc2H\xd6\x93}\xc0-L`\x0aG\xf0\x14s\x85\
-?\x0d\xb0%\x8b\xb2\x80M\x8c\xd0\xc7y|\xc4\xa9B\
-\x16d],\xe2\xa4\xac\x95\xcd\xe12\xfaX\xc22j\
-L\x17\x08hP\xe01Vq\x18W\xd0\xca\x22\xd6p\
-\x15\x8f0\x85\x80\xb6@\x81\x1fX\xc4,\xce\xe2\x02\xce\
-`\xc6X\x90EY\xb0\xab@\x925\x18\xa2\xc4^\x0c\
-\x8c\xb58\x8a\x9bXB\x0f-\xca(+\xd1G\x17\xab\
-\xd8\x87\x0d$\xd9'\x5cD\xc4u\xac\xe0\x1e^G$\
-L\xe2\x0dN\xa0#\xfb\x8e\x91\xac\x83y\xec a\x05\
-\xfb\xf1$b\x07\x13\xb2\x0d\x7fw\x00\xe7p\x09-\xde\
-\xe2\x19\xbeF\xbc\xc2\x10\x0f\xb0\x86I$Y\xc2\x10\xa7\
-q\x03\xb7\xfd.\x84\xaa\xaa\xec:\x84et\x91\x8c%\
-\x94x\x87\xbb\xd8B\x89\x84\x16)TU\x15\x90\xfc\xa3\
-\x9f\x04\xb6o\xc71\xfa\xe3\x1a\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07}\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:31-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:31-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:42170a6f-6735\
--cd46-bbbe-41f18\
-12bcd1a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:f8b9bbc1-240c-e\
-f4d-851a-7cf7700\
-c39c5\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a4ad613\
-c-6888-1144-b329\
--c9d84072ff18\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a4ad613c-6888\
--1144-b329-c9d84\
-072ff18\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:42\
-170a6f-6735-cd46\
--bbbe-41f1812bcd\
-1a\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:31-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd7U\
-\x1c=\x00\x00\x012IDAT8\xcb\xa5\xd3\xbf+\
-\xc5Q\x18\x06\xf0{/Q\xe2\xa2t\x07\x0b\x9b\x81\x81\
-\xfc\x88?\x01\x8b2J\x06)\x83\xddB)\xa5\x94A\
-R6\x0cb\x92b%\x83\xc9\xa2P\x18\xdcA\xea\xf3\
-\x17\xd8\x8f\xe5\x5c\x9d\xbe\xbe\xd7bx;\xe7\xbc\xe7y\
-\x9f\x9e\xf7=\xcf)\x84\x10\x0ai\xa0!\x9bK\xf3h\
-\xc6\x06zB\x08\x85,\xa8\x94\xec{1\x88~\xb4'\
-\xf92\xde0\xfa\x8b \x02\xa6q\x83\x17<\xe0\x11\xcf\
-\xd8\x8d\xc5E\xdcc(O\xc1&>\xb1\x8cn\xb4\xa2\
-\x13#\xb8\xc0+&p\x87\xe1\x10B\xe1G6VP\
-Ew\xde\x0c\x22f9b\xaa\x18\xf8Q\x80\x0a>0\
-\x16\xcfMqm\x89\xd2\xafq\x89S|\xc5\xe8K\x09\
-Vp\x99}\x054b\x12\x0b\x98\xc3<f1\x85\xb6\
-\x94\xe0\x08\xeb\xb5\xa2z-\xe4E\x8d\xe0\x04\xaby\x04\
-(\xa1!\x1bY\x82m\x1c\xfcG\xc18\xde\xd1Z\xcf\
-\x8d\xa9\xc9~\x11D\xc0\x05\x0eS\xebF\xd3\x94P\xac\
-\xab\xa0v\x89.<\xe1\x18\xe5\x1c\x053\xb8B%\x9e\
-\x8bi\x0b\xa5\x84\xe4<:\xee\x0c[\xd8\xc3m\xf4\xff\
-R\xb6\x95z\x1fi\x02k\xd8\xc7\x0e\x16\xd1\xf1\xe7\x0c\
-j\xb2\xfe\xea7o\x90\xdfz\xe6\x03b\xd9\x9e\xfd\xc9\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x9c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:13-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:13-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:0d01151b-4064\
--6a4b-b54e-f2e48\
-7b1a995\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:a886fb9f-7116-c\
-54f-9d66-c1396b3\
-d9188\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:497fd7f\
-1-85bc-4444-ba98\
--531183773228\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:497fd7f1-85bc\
--4444-ba98-53118\
-3773228\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:0d\
-01151b-4064-6a4b\
--b54e-f2e487b1a9\
-95\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:13-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x11\xb6\
-b\xfd\x00\x00\x01QIDAT8\xcb\x9d\xd3\xcd+\
-EA\x18\xc7\xf1s\xdc\xebea\x83\x05e%\x0b)\
-\x16\xca\x1e\xab[\x16J\xdd,\xa4\x90X\xdc,\xbc\x85\
-%v6H)y\xbb\xcaFy\xd9X\xda\xf8\x17,\
-(\x0a\xb18\xf1'X\xf1}n\xbf\xd1\xdc\xe9\xca\xcd\
-\xe2\xd3\x99g\xe6\x9cgf\x9e\x99\x13%I\x12\xfdS\
-\x85=\xfd\x8eX\x9d\xf1/Rzo\x1c\x19\x97\xa4(\
-[\x99\x06\xf1\x8aN\xb7\x82X\x03MX\xc5\x05\xce\xe5\
-\xb2D\xbc\x8fw\xbc\xa1\xdee\xed\xc5\x0bN\x91\xc3$\
-&0\x82Q\xc5S\x18\xc32>qh\x93\xdb\xc7\xcd\
-x\xd2\xde\xc2\xe5\x0e \x1b\xf4\xed\xe1\x08\xb5h\xb1\x8e\
-\x15--R\xa1j\xd4\x1e\xc2\x97>\xb0\xb8Z\xe3=\
-\x8a71g\x8d\x13L{\x09\xdcLU\xd8\x157\x16\
-{\xe36\xe9L\xa4\xe2\xe4\x82e\xbaD\x96x[\xed\
-t0ve\xdb\xb6F\x1e}hE\xb7\x97\xa4\x1f\xb7\
-A}*\xf5l\xc43\xda,\xa8C\x07\xeeu\xc6.\
-AV\xfb\x5c\xc7\xbc\xd7o+\xb9\xd6q\x16\xeeA;\
->\xf0\x88E\xac\xc9\x12f\xadPXP\xb1wp\x87\
-3\x15\xb5\x90 \xa3j\xdf`K[:\xd0Q\x1d+\
-\xcek\xc6\x0d\x1d\xed\xcf\xf5w\x8da<\xa0\xa1\xcc\xeb\
-\xec\xfe\x8f\xa2\xabl\xb7\xac\xcb\xdbg\xaa\x84tp\xd4\
-\x91\x9f\xb1T\xfbO\xdf\xcbw\xec\xe4@\xa8M~\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07P\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:38-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:38-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:f3cb0b21-6ef9\
--6a47-a5d5-e2697\
-3a5abb2\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:41750c9f-8a0d-6\
-848-b569-2531302\
-c9d4f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:12901ff\
-a-f684-4c48-acbb\
--97ad919aa012\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:12901ffa-f684\
--4c48-acbb-97ad9\
-19aa012\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:f3\
-cb0b21-6ef9-6a47\
--a5d5-e26973a5ab\
-b2\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:38-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>'N\
-'\xc5\x00\x00\x01\x05IDAT8\xcb\x9d\xd3K+\
-Dq\x18\xc7\xf1S\xbc\x13\x16.\x13V\xa6\xf0.\xec\
-,\x15\xce\x18\x19\x0d\xe5%\xd8+\x0bVJ\xc9\xf55\
-\xb0\x16\x1b+\xb7\x05\xe2#\x0b\x1bR\x16\x8a\xcds\xea\
-4e\xe6\x1c\x8b\x7f\xcf\xed\xff\xfb>O\xffK\x82\xa4\
-\xc4\xea\x0a[\xc1!\xc6\xff#\x1e\xc6\x0d~P++\
-\x1e\xc4\x0bj\xd8\xc4RY14#>*\x02\xc8\xc4\
-\x03x\xca\x89\x13\x1ct\x02\xb4v^\x8d\xb8\xbb\x08 \
-\x13\x0f\xe1\x11\x1f\xe8i\xa9\xfd\x09\xc8\x8f}\x1f\x9dO\
-1V\x04\x90\x15\xfb\xf0\x8e\xb5\x88\xcfQ\xed\x04\xc8\x0a\
-#\xb8\xc6\x17&#w\x81\xd1v\x80|\xe7\x07\xcca\
-\x0b\x8bE\x00Y\xa2\x1f\xdfq\xbfI<\xd5\xf9\x1c\xa0\
-\xda\xee\x16\xb2\xb1\xef\xb0\x9e{(\xf5\x22\x80\x0an1\
-\x85il\xc7\x86=\xcc\x84\x7f\x16M\xf2g\xb6\x8bF\
-\x82\xfd\xf8\x18\x1b\xb8\xc23v\xf0\x8a\xcb\xa8\x7f\xe2$\
-\xa0\xc7a\xdf\x90&\x98\xc0\x02Vb\xe44\xfc4\xf2\
-\xcb\x98E#\xfcf\xac:z\x7f\x01\xc7\xfe\xf6t\x83\
-\xc3a\xc7\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07>\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:35-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:35-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:7e15e3ce-6090\
--304f-9b78-e3224\
-dd35b7c\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:7f7bf9ba-8662-d\
-b47-b36f-4fd4f11\
-afaa3\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:47074e0\
-6-3318-7543-bc2e\
--a6503750b486\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:47074e06-3318\
--7543-bc2e-a6503\
-750b486\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:7e\
-15e3ce-6090-304f\
--9b78-e3224dd35b\
-7c\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:35-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x04N\
-\xd1\x8b\x00\x00\x00\xf3IDAT8\xcb\xe5\xd3\xcf*\
-\xc4a\x14\xc6\xf1\xdfo\xc4\x98\xb0q\x09VS\x932\
-2\xd9q\x13\x16V\x94LJ\x16\xc2\xde\x15(\xf7\x80\
-Q\x8c\xd8\xdbZ\x88\x89l]\xc0\xe76^\x9b\xf3\xab\
-\xb7\xf1\xa7ak\xf1t\xce\xf3\xd4\xf9.\xde\xf7\x9c\x22\
-\xa5T\xa0\x8c\xda\xc5-\xae\xd1\xc7M\xa8\x8f+\xdca\
--\x9f)RJE\x04\x13x\xc7\x09\xb6\x02\xb6\x19\xda\
-\xc6\x06N\xf1\x86\xf1\x0a\x92\x03\xa6\xf1\x88f\xf8\x15\xf4\
-p\x86\xf5\xc8\x9ax\xc1\xe4W\x80)<\xa3\x13~\x01\
-{\xd8\xc5jd\xcbxE\xfd'@\xbb\xca\x86\x85\xa5\
-Q\x00\x8b\xe1k\x99\xc6~\x03h\xe7\xaf\x5c\xc1\xfe)\
-\xa0\xf6W@\xf5\x0b%\x1a\xb1`\xe5\xa8\x80\xa7\x0a\x10\
-\xd9\x0e\x8e3\xdf\x89M\xac\x7f\xb7\xca\x03\xb4\xb2l\x06\
-\xb3\x99\x9f\x8f[h|\x02D0\xc0\x03.\xe3\x0a{\
-\xb8\x88\xfe<n\xe5>\x9f)\x86\xce\xb9\x85\x03\x1cf\
-\xf5(\xeb\xf71\x97\xcf|\x00\xb3\x85\x01@\xd3\xde\xeb\
-\x8c\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x90\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:13-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:13-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:3c259d83-790b\
--b943-befc-87a14\
-be1b494\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c938c8b9-be2b-8\
-a46-ba5e-ac5f98a\
-b915b\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:4f87858\
-c-b9f4-f14c-bc58\
--a5ce72313e7e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:4f87858c-b9f4\
--f14c-bc58-a5ce7\
-2313e7e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:3c\
-259d83-790b-b943\
--befc-87a14be1b4\
-94\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:13-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x02\x83\
-LE\x00\x00\x01EIDAT8\xcb\xa5\xd3K+\
-EQ\x14\xc0\xf1}\xb9L}\x00J\xb9#\x1f@\xa1\
-0b\x22\x03\x8f\x09\x03C\x8f(\x92b\xa0\xe45%\
-#\x03oR\x1c\xcc<\x86\x1e1 \xa4\x94\x01e\xe6\
-\xa4|\x88\xe3\xbf\xb4v-\xbb\xa3n\xdd\xc1\xef\xb6\xef\
-^\xfb\xac\xbd\xf6\xda\xe7\xb8$I\x5c!\x5c\x1c\xc7\x19\
-\x95\x85\xfc\xef\xc2\x03.p\x85K\xdc\xe2\x0c\xe5\xba\xa6\
-H\xfd&\x08=c\x12MhE\x1b\xeap\x8e\xc5p\
-\xbd\xfc\xb4\xe3\x04{\xb8\xd6\xdd3)\x89\x1b\xf1\x85\x08\
-\xc7\xba\xbeJ\x02\x87:\xd1\x8d!\xd4\x9a\x87J\xcd\xb8\
-\x04\x9d\x18D/^1,\x81\x03}\xd8\xee\x96\xd3\xa4\
-\x8fj>\xa5\xaa\x1d\x8c\xfa\x04\x03&P\x897\xac\xa0\
-\x06-\xb8\xc7\xae\xa9\xc4W>\xe2\xf4L}&\xc1\x12\
-\x8e\x82\xdd\xca\xf0\x81z3\x17\xf9\x0a\xc2\x04\xa7zV\
-\xbf\x9b\xef\xc3&\xc6\xf2I \xa5.\xe88k\xe6\xe5\
-\x18\x1d\xf9$h\xc0\xb7Y\x5c\xac\xfdx2\xe7\xff\x93\
-@\x9a\xd8\x1f\x5c[\x0f\xdeq\x87\x17}\x13sA\x13\
-#\xdf\xc4\xfd\x94k\xf4\xe4\x9d\xa8\xfe'\xb6\xed+\x90\
-\x8e\xdf`\x02s\x98\xd1{\x9f\xc6\xb8\xce\xcf\x9a\x98\x8c\
-\xa7\xf0)\xd7/\x09\x9a\xb1\x85U\xac\x19\xeb\xda\xf9\x8d\
-`\xde\xc7\x96Q\xe1\x0a\xfd\x9c\x7f\x00\x80\xe7\x06]\x99\
-\xbf- \x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07v\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:50-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:50-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:cbc66f9d-83bf\
--1743-8051-33c7c\
-f9a4ac7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:82114c7f-97ce-e\
-244-b453-b0dc00d\
-43818\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:dc70c03\
-0-2569-f94e-aecc\
--bda0ab8a3a58\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:dc70c030-2569\
--f94e-aecc-bda0a\
-b8a3a58\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:cb\
-c66f9d-83bf-1743\
--8051-33c7cf9a4a\
-c7\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:50-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x18Z\
-X\x03\x00\x00\x01+IDAT8\x8d\xa5\xd3?+\
-\xc7Q\x14\xc7\xf1\xeb\xeb\x7f\xf2\x1c,\x16\xc9\x13 \xc5\
-\xa6\x0c\xf2'Y\xfc\x92U)\x12\xe5Q\x90\x05\xa3\x05\
-\xa3\xd1\xa2L\x98L\x06J\x16\xaf\xa4\xe8\xf7\x0c\xbe\x06\
-\xe7\xab\xdb\xaf\xafR\x86\xd3\xe9\x9e{\xee\xfb\xdc\xf3\xb9\
-\xe7\xa6\xb2,\xd3\x7f\xec_\x87\xcb\xb2L\x09u\xd6\x81\
-^\xf4\x85\xf5\xa0\xab&V\xb4\x1el\x0b\xbf\x8fG\xdc\
-\xe0\x0e\x0fx\xc6}\xaco\xf1\x84\xb9\x84\x22*vD\
-\x95\x84k\x1c`\x10\xc3\xb8B\x89m\x0cE\xec\x16[\
-\xbf\xb50\x83\x81l}\x12\x80\xe9,\xb6\x8c\x89\x84\x09\
-\xecb\x07\xeb\xd8\xc4F\xf8\xc9H>\x0f\xc0|\xa6Q\
-BJ\xb8\xc4\x0b\x8e#\xe954x\xc3E\x0b`6\
-\xd6E\xa5WB\x03#\xb1\xf1\x11\xbd'\x8c\xc75\x13\
-\xcej\x00?7\xa8\xac\x13M\x1c\xd6hr\x1a\x80\xb9\
-:@\x91\x05\x9b8\xca\x80\xed-\x22N\xd5\x01\xda\xb2\
-Jy\x0b\x09\xfd\xd8\xc3g\x00\x1e\xb1\x92C\xaa\xc4\xbe\
-H,\xf1\x1e\xba$\xdf\xd3\xb6\x88U,a\x0d\xa3\xb2\
-\xa1\xab\x00\xddX\x88\xe4\x06\xc6jt\xa8\x9b\xd8_\xff\
-Bn\xed\xf1\xee\x95/\xf2\xfdVj\x91\xbf\xf1_\xec\
-\x0bfp\xf1$\xe5\x90\xe0\x87\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07\x81\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:12-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:12-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:4aa2432a-cb21\
--2943-ac5a-6c4e7\
-e397871\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:af61836e-54fa-8\
-c47-b341-d79e922\
-ade1a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:1ef2eab\
-1-90bd-7040-8d86\
--98b7b0c63fe1\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:1ef2eab1-90bd\
--7040-8d86-98b7b\
-0c63fe1\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:4a\
-a2432a-cb21-2943\
--ac5a-6c4e7e3978\
-71\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:12-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x0b\xcf\
-\x03\x15\x00\x00\x016IDAT8\xcb\x85\xd3\xb1+\
-\x85Q\x18\xc7\xf1\xc3%z\x8b\x01\xc9@IRL\x8a\
-\xcd\xc4f\xbd%&\x8b2\x99\x18(%\x7f\x84A\x8a\
-\x85\xc1h \xc5\xc0\xdd\xe4\x0aEJ\xd8t\x0d\x06\xff\
-\x82\xef\xa9\xdf\xd1\xd3s\xdf\xd7\x1d>\xbd\xef9\x9d\xf7\
-9\xe7y\xce\xf3\x86Z\xad\x16\x8cf=;\xb0\x81#\
-\x1c`\xce\xad\xfbc\x07Mz\x0e\xe0\x01\x97X\xc1\x16\
-\xde\xb0\xd7(@r\x8a\x1d7\xd7\x8eg,\xbb\x93\x06\
-\xbf\xfb\x08^\xd1\xa5q+\xda\xf4\xbe\x88k\xb7>\xf8\
-\xdc\xc7q\x87\x96\x9c\x93M\xe3\xa6Q\x0a3xB\x1f\
-:u\x92n\x9d\xa4\xac\xda\xc4tJ6@\x1a,\xe0\
-\x13\xdf\xa8\xe2V\xaa\xda\xf9\x05?\x9a\xebO\xa9\x04s\
-\xdcM\x9c\xa3\x17c\x185\xe2x\x08\x13x\xd7\x5c]\
-\x80u\xec\x17\xdd\xb7d:Qn\x80\xd88\x87z/\
-\xa9\xd2IJ\xb3\x07\xf7E\x01Vq\xec\xef\xd9][\
-L\xef\x11\xc36@Z<\xab+\xf4\x1f\xd9M\xa6t\
-\x13\x99\x0d`\xc5\x0a\xaf\xfdS\x83\x0a\xb6M\x9au\x8d\
-\x14\xab\xfc\xa5zd\xe6\xc3\xf8\x7f\x9c\xe1\xca\xf6\x80o\
-$\xdb\x8d\x15\xdd\xfb\x09.\xf0\x81]5Qn+\x87\
-\x9c\xe2Mb\x09\xf3\x18,\xa8M\xf8\x05\xec\x7f\xe2\x04\
-a\xdb\xc0/\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\x90\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:58-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:58-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:87d9e222-334d\
--e647-abbd-8e904\
-1f53369\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:836f625e-3401-3\
-54b-89bf-1e20c6f\
-70f5d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:038da0f\
-c-8e33-e042-aad4\
--f51364c74bba\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:038da0fc-8e33\
--e042-aad4-f5136\
-4c74bba\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:87\
-d9e222-334d-e647\
--abbd-8e9041f533\
-69\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:58-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x1e\xc0\
-1\x1b\x00\x00\x01EIDAT8\xcb\x8d\x93M+\
-EQ\x14\x86\xef=\xf7\xc6\xf5\xf1\x03H&\x8cd\x8a\
-\xc3\xc4\xe0\xa6\x94\xd15$c\xc9L\x19\x1b\x90\x01\xa5\
-L\xf0\x0f\x14\x99(\xfe\x81$\xf98(?\xc0\xe0d\
-\xa0\x0c\x8dt<\x9bwk\xb5\xdb\xf7r\xea\xe9\xec\xbd\
-\xd6^\xefYk\xeduJEQ\x94,y\x9e\x97\xcd\
-z\x0d\xd6\xa1\x1a\x9e\xf3|\x07@\x22*&x\x1b>\
-!\x83\xceP\xfcW \xa6\xca\xc1=\xb8\x82i\xbdk\
-M\x050N)\xcd\x0dX\x85Cxti\xc30<\
-@\xbb\x04*1\x81cx\x82\x1d8\x83w\xe8W\xc0\
-8\xdcAG\xab\x1e\x1c\xc1\x82\x02\x86\x94r\x9b\xf6)\
-\x5c\xca\xfe\x0csa)^`Y\x8e\x095\xadK\xfb\
-1e\xd0\xed>\x92\xff<u\xf9\x12[\xc2\x92\x09\xb8\
-\xf7)\xf3\x1e\x0d\xf6\xbbp\xa0u5&\x90F\x042\
-S\xd2)l\x86\x02\xae\x84E\x19G$`K\xb8\x86\
-^8\x97\xaf\xc7\xf6\xc1-N`E\xc6:\xdcx\xa7\
-\x04\x5cS\x07`+\x0c\xf6\x02\xfb\xf0\xaan\xbb;\xff\
-\x80\x86\xb9\xc6\xcc\x8er8L\xce\xd0\xa7ZS\x0d\xce\
-<\xbc\xc1$\x0cJ\xb4\xe6G\xfe\xbf\xa3<\x03/\x9a\
-\xd0\x0b\xd3\xd4\xf2_?S\xe2\xd3\xd5\x88\x17p\xdbR\
-\xa0I\x06\x89\x19\xac\xd9X\xea\x9e/.\xc4\x08\xde\xfc\
-[\x93\x1f\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x99\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:59-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:59-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a9890b46-5f6e\
--874b-b9db-902a9\
-1bfb15e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:aff66c49-1938-3\
-445-bed9-8d68e91\
-7ea28\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c89f164\
-9-430d-2f43-94db\
--750a1e902480\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c89f1649-430d\
--2f43-94db-750a1\
-e902480\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a9\
-890b46-5f6e-874b\
--b9db-902a91bfb1\
-5e\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:59-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xeb\xfc\
-*\xff\x00\x00\x01NIDAT8\xcb\x85\xd3?/\
-\x04A\x18\xc7\xf1\xdbu\xfe\x17\x1a\x9d\xb8FD\x90(\
-\xc49\x8aS\xc8%\x12\x85\xd0\x8aZD!!j\x05\
-\x85D\xa2P\xf0\x12$D%\xe7\x1d\x88 8G\xa3\
-P)6\x0a\x89R%|\xe7\xf2[y2&w\xc5\
-\xe7nfg\xf6\xd9g\x9fy6\x93$I\xc6\x13\x99\
-\xf1\x16\xb6\x91\x0d\xec\xabIo\x88\xa5\xc9,\xee\xe1\x1b\
-\x8f\xe8\x08\x04\xff\x0b\x10r\x88k\xcc\xe8\xbf\xad^\x80\
-\x92\xd2\xdc\xc1&\x8e\xf1\xa4\xb4\x87QE\xabn\x88\xfd\
-@\xee\xe7\x14\xcf\xd8G\x19\x9f\xe8\xd5\x86\x09<\xa0\xdd\
-<5\xebgp\x82%]\x18T\xca-\x9a\x8fk\xde\
-\x8f\x0b\x0c\xe9z\x11\xe7\xe8J\x03\xacjaRE\xeb\
-4\x01*z\xea\xae\xd6\xe6\xf0\x8a\x0d\xfb\x0a+\xde\x0d\
-i\xcay\xcd\xd3\x22\x1e\xe0G\xb5\xaa\xd5\xc4\x0fP\x08\
-\x04\xa8j<\xa6\x0c\x5c\xea7\x18\xb05X6\x9b*\
-\xde+\xb8\xcd9\xbc`M\xd7\xdd\xeb\xdc\xba\xfep\x93\
-3\xacka\x1aw\xe6\x98\xf2\x9awc\xc4\xeb\x81Q\
-Wl78\xc2;\xae\x94\xee\x17\xe6\xcd1\xba\x8c\x9a\
-M\x1fD\xfe1\xf6\xe8I\x055\xce\x22>0\x85>\
-\x05\x0dub\x5c\xaf\x95g\xf1\xa6\x0e\xbd4E\x8d\x1a\
-}L\xb1\xe9\xb4\x92\x8e\xec\xbeQ\x80\x90\xd84\xd6\x82\
-\x99\xff\xf3\x0b\xc5\xc8\xee\x8eq\x0aZ\xe6\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x00\xd2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x0b\x00\x00\x00\x0b\x08\x06\x00\x00\x00\xa9\xacw&\
-\x00\x00\x00\x09pHYs\x00\x00\x01\x90\x00\x00\x01\x90\
-\x01!\xf7\xeb~\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x00_ID\
-AT\x18\x95\x95\x91\xb1\x12\x800\x08C\xdb\xfe\xbf\xbd\
-\xd3N~S]\xea\x0f=\x07\xd3\x85\x83\xab2\x86\x04\
-HH\xc0\x05l@NN\x01Y\xfd\x9e\x80\xca[\xcd\
-\x0aDl\xea\xd7\x09\xec\x02\xce)\x10~X\xdc\x13\x14\
-\x97\x18\xac\xbc\xa3\xd3\xac`\x888V\xc4\xf5d\xc7L\
-\xf1L\x87\xae\xdd\x94\xfe\xe6\xdc\xf9\xf8\xc1\x07Y>'\
-\xe9\xd5\x83\xa9\xc6\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\x1a\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:04-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:04-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:ca9348e3-b77d\
--d84f-ba1e-58a82\
-4ebcc01\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:3ea21df7-0528-2\
-240-a9d0-01e226d\
-767ad\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e8c7dbd\
-e-ca03-384a-b8c1\
--576d4a5c58a5\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e8c7dbde-ca03\
--384a-b8c1-576d4\
-a5c58a5\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ca\
-9348e3-b77d-d84f\
--ba1e-58a824ebcc\
-01\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:04-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>S\x9b\
-\xd7v\x00\x00\x00\xcfIDAT8\x11\xa5\xc1\xa12\
-DQ\x18\x00\xe0\xef\xdc{\x96E\x14\x8cbtq=\
-\x85\xe4\x096i\x8a\xb2o\xa0\x08^\xc63l\x11T\
-M\x10\xfc7a\x8c\x19vgv\x1dEpGpf\
-\xee\xf7\xa5R\x8a!r\xd7u\x87\xd8\xc3\x0aI\xbd\x06\
-\x0f\x19g\x98\xe2\x05Y\x9d/\x8c1K\x11a\x88\x8c\
-\x13\x1c\xe3\x03\x8d:\x05#\xdcd\x1c`\x82w4\xea\
-\x14l`\x9e\x22\xc2\x10\x19\x178\xc5\x1bZu\x0a6\
-q\x95q\x87%\x16H\xea\xb5xL\x11a\x88\x8cK\
-L\xf1\x8a\x91:+\x8c1K\x11\xb1\x8f],\xb1@\
-AB\xd1\x97P\xd0b\x0b\x0d\x9e2:t\x18a\x82\
-\x16\xc5_\x05\x19\xcf\xb8\xf7#\xa3\xc5\x1aG\xb8\xc66\
-\xd6H\xfa\xd6\xd8\xc1-\xce\xf1\x89\x94\x22\xc2\x10Y_\
-\xf2\xbf\xe2\x97o\x8f\x8c;\xde\x9a\xc0wR\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07\x02\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:48-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:48-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:5d8f4828-bc22\
--1d46-884b-b3c6b\
-d2dbd7f\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:88eb7129-8b39-2\
-44f-8bbb-785f49c\
-f8e50\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:5b0baa0\
-a-b066-ec4a-811e\
--52e68221d8fc\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:5b0baa0a-b066\
--ec4a-811e-52e68\
-221d8fc\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:5d\
-8f4828-bc22-1d46\
--884b-b3c6bd2dbd\
-7f\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:48-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xab\xd7\
-I\xea\x00\x00\x00\xb7IDAT8\x11c\xf8\xff\xff\
-?\x03%\x98\xe1\xd9\xb3g\xc4bF(F\x11'\xc5\
-\x00\x18f\x22\xd5\x00\x98\xad\x8a@,\x01e3\x93b\
-\x00Lq\x0c\x10\xdf\x05b9(\x9f\x05\xd9\x00F\x02\
-\x18\xe6\xecf ~\x00\xc4\xf20\xc3\xc9\x09\x832 \
-\xbe\x0a\xc4\xb20\x17\xe4\x00\xf1\x0e ^\x05\xc4k\xf0\
-\xe0\xb5@\xbc\x0e\x88\xe7\x03\xf1\x17 \xbe\x0d\xc4B \
-\x03\xec\xa1\x86$\x03q*\x0e\x9c\x02\xc4\x19@\x1c\x07\
-\xc4E@\xfc\x03\x88\x17\x011+9^\xd8\x04\xc4\x0b\
-\x90c\x81\x09\x1a\xa2\xcc80+T\xb18\x10\x9f\x84\
-z\x05\x9e&H\x89\xc6D ^\x8c\x9e\xa0\xc8M\x81\
-\x8c\xe4&e\xcc\xbc@qn\xa4\xd4\x00\x00z\xef\xd9\
-\xd4\x95#\xf4i\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07|\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:39-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:39-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:8b183ab4-d20f\
--5545-b6ac-97691\
-2a74380\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e1e3201d-93fd-e\
-b43-819a-144e4c9\
-61bc0\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:2f4a22c\
-4-5e83-3d47-8703\
--3171431f0c41\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:2f4a22c4-5e83\
--3d47-8703-31714\
-31f0c41\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:8b\
-183ab4-d20f-5545\
--b6ac-976912a743\
-80\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:39-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xe9\xb4\
-\xca\xfb\x00\x00\x011IDAT8\xcb\xa5\xd2=+\
-\xc6a\x14\x06\xf0\x9b\x87\xc8\x07\xb0\x1a\xa4|\x01\x93\x18\
-\x0c,\xb2\x92IBDy7\x99\x14\x93o@()\
-\xef\x19Xd\xf2\x01\x88PR^\x96\x1fY\xd8\x0d\x8f\
-\xe5<\xf5'\x14\x86\xabs\xdf\xd7}\xceu_\xe7t\
-R>\x9fO\xffAB\xd1\x1fQ\x8c\x94\xf0/$\xf4\
-c\x1f\xdb\xd8\x89\xf8\x13\xb29\x8d)\x88}\xb4\x85X\
-\x1fz\xbf@O\xbcw\xa3\x1d\xb7\x18JX\xc1+\x9a\
-\x7fa}\x1ao\xe8JX\xc5\x16.\xb0\x84\xd2H*\
-G\x0e%(\x0b\xae\x06\xe78\xc01\x06S\x14wD\
-\xe2\x11NQ\x1b\x05\xb9\xcc\xaf\xedx\xc4\x5c\xdcW1\
-\x9a\xb0\x81\x81O\xf6nB\xb4\xc0\xcd\xe3\x0a\xad\x19n\
-\x1b\xc3\x09\x9b1\xb8l\x8f\xc7\xc8c\x11\x87q\x9e\xfa\
-\xe4j\x03#\x05\x81\xfeL\x8f\xa7\xc1\xd5a9\x0a\x9b\
-p\x8d\x85X\xa2\x0f\x0e\xb6\xd0\x89\x16<c\xf6\x9b\xc9\
-W\x86\x9b\x13T\x85\xf8X\x8a\xc3=.3=\x16\xc5\
-Ps\x81\xd2\x8c\xd0\x0c\xee\xf0\x80\xde\x84\xb5P\xad\xf8\
-\xc5\x1e\xd4\xe3\x05\xdd\x09\xeb8\x8b\x1d\xd8\x8b\x96\xbeZ\
-\xe1\x02\xbf\x1b\xb9O\x18Hh\xc0$\xc61\x16\xf1;\
-\x14\xde'0\x84\xeaw\x8a\xe9\x09\x9e\x99\xb3\x0e\xc1\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07~\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:16-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:16-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:8f906217-2d5b\
--364d-9eed-9d33b\
-70fe833\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ad8956fa-c097-d\
-a44-9989-27524db\
-e321b\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d24ac6b\
-b-ff2e-f344-a794\
--0a64c7fa049d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d24ac6bb-ff2e\
--f344-a794-0a64c\
-7fa049d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:8f\
-906217-2d5b-364d\
--9eed-9d33b70fe8\
-33\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:16-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>8\x1a\
-c\xc8\x00\x00\x013IDAT8\xcb\x8d\xd3M+\
-GA\x14\xc7\xf1\xb9\xae\xe7\xf2\x10%\xc9F\xa4\x94\xac\
-D)\x16\xd6\xac\xed\xfe\x0bY\xc8\xde\xc2[P^\x85\
-$\xa5\xa4x\x05\xc8Sy\xd8(Q\x84nYx\x03\
-6|\xa7~\xa3sofX|\xfa\xff\x9bs\xee\x99\
-\x9933\xae(\x0a\x17\x91!\x8f\xc4\xea\xc4\xc5>\xce\
-\x13\x85K\xb1T\xc2\x00\x16\xb4\x920k\xc8\x99\xc6l\
-\xb5\x80M\x98\xc3+>0T\x99`\x15\x9f8FC\
-\x18\xac7\x09\xeb\xfa\xb8\x86SLj\xbc\x0b\x878\xc1\
-\x12.\xd0\xe2\xcc\x12\xfbU\xf5\x08}\x1a\xbb\xc4 \xa6\
-\xf0\x8cM\x8d\x8f\xe0\x06Ma\xd6y\xbc`\xc3\xac\xa4\
-\x03g\xd8V\xacfb~U\xd7\xa1\x80\x0f|\x85\xa6\
-\xa8\x89\x99\xb6\xf5\xa6\xed\xf4(\xd6\xa8\xdfq[`\x02\
-w\x9a=7\x0d\xf5\xc9\x0fx\xc7b\xa5\x91\xa5\x02^\
-7\x0ep\xa5\xfd\xf9\xb1v5qY\xc9{\xe8\xfcm\
-\x0b\xf6\xf8\xd6*3\x9ecX\xff\xb7\xf0\x841\x1dm\
-i\x05\x999\x8d\x19<b\x07\xb7\xdab\xc8[1\xa7\
-\xe1\x8f\xb15v\x0b\xdb\xb0\x8f{\xd3\xc0\x10\x1b\xd5\xf8\
-\xee_W\xd9\xeb\x8d\xc4\x9au\xb1\x5c\xea%\xba\xc4K\
-L>\xa6\xff\x14\xfa\xe9\xd97ih\xe5\xb2\xdfp\xe8\
-\xb0\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07|\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:54-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:54-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6c1dc8bf-43b4\
--434d-a476-2e5fb\
-acd137c\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e765f398-0b8b-1\
-048-a008-3fdd885\
-3e089\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:fe6627b\
-7-a216-f743-8080\
--5f88e51ee78e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:fe6627b7-a216\
--f743-8080-5f88e\
-51ee78e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:6c\
-1dc8bf-43b4-434d\
--a476-2e5fbacd13\
-7c\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:54-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xc3N\
-\xd2\xd3\x00\x00\x011IDAT8\xcb\x95\xd3\xbd+\
-\x87Q\x14\x07\xf0\xe7\xe7\xb5\x08\x892(\xa5L\xcab\
-\xa7\x84X\x18\xc8&\x0c\xca`P\xe4e\x90\xc9n\xc1\
-d\x12\x91(eP\x06\xbb\x97$21(\xfa\x14\x83\
-\xfc\x09\x96\xfb\xe8z\xf2\xf32|{\xee\xf9v\xce\xf7\
-\x9c\xf3\xbd\xcfM\x90\x04\x14\x84o+\xd6\xb1\x83ET\
-\x05>\x17\xe5~\x22[\xdc\x87\x17\xaca\x02\xa78G\
-M>\x918(\xc5\x1dF3I\x07X\xcd4\xfa\x22\
-\x90\x92m\xb8\x88:\x95\x84s/\xce~\x9a \x15\xe8\
-\x0e\xe3\xa6\x89\xf9\xf8\x7f\x0bt\xfdU\xa0\x1dWQ\x5c\
-\x18\x19{\xf9\x17\x13\x8bq\x83\xa1\x10\xa7\x1el\xfef\
-bZ\x9c`\x10\xd7(\x0bq\x07\xeeQ\x1dM\x90\xcb\
-\xb7BE\xe8\xf6\x8c\xc6\xc0\x8d\xe1-\x9a*\xef\x0a=\
-x\xc0.j3\x1etb2\x9c+\xb1\x8c\xfaT0\
-A\x0b\x9e0\xf2\xcdo\x9d\xedX\x1eVj\x8a'\x98\
-\xc3a \x8a2\xc5\xb9h\xbd\x15\x1c\xe3\x15'\xd8F\
-]\x82\x05l|\xf7P\x22\x14a\x003x\xc4\x12\x86\
-Q\x99`\x16\xef\xd8\xc2~\x06{8\xc2x\xf4^n\
-\xd1\x10\xaf\xd0\x8c)L\x07\xccD\x98\xc6|02\x09\
-\xd7\xdb\x1f]k\xf2\x01\x0b\x80\xe5B\xb7>y~\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x88\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:34-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:34-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:99206ce4-e28a\
--b343-a2de-6dff0\
-a04ad87\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e122d351-233f-d\
-04f-834d-1a49005\
-cca87\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:adc160a\
-d-a24b-d54f-a8a1\
--41ab8d55cfc9\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:adc160ad-a24b\
--d54f-a8a1-41ab8\
-d55cfc9\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:99\
-206ce4-e28a-b343\
--a2de-6dff0a04ad\
-87\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:34-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>?\x0b\
-\x85\xc6\x00\x00\x01=IDAT8\xcb}\xd3/K\
-\x04A\x18\xc7\xf1\xd9u\x0d\xda,6\xb3\xc5(\x8a(\
-\x18\x0e\x0dz\xe0\x89XN\x93\x5c1\x9b\xaf\xf9\x02\x04\
-\x0d\x06\xb9&\x08\xfe)V\x05A\x04EP\x10\x83\xc1\
-$\xba\xa8\x9c\xe0K\xf0;\xf0\x9b\xe3a\x985|X\
-fw\x9eg\x9egf\xc7\x95e\xe90\x89\x0e\x0e\xb1\
-\xa8wU2;\x0e\xc1\xef\xd8A\x1b\x9fXIM6\
-\xe3A\x9b\xa0\xa3\xe00\xa9\x85\xdbD\x82>=7p\
-\x12\xbe;\x95\xdd6\x13\x97q\x15%\x08\xc1k\xe8\xa2\
-f\x13,\xa8\xec\x96\x82?\xb0\xa7\x09\x85\x09n*x\
-J\xe3<\xb4\xe0\xd4\xf3\x9dV\xde\xc53\x1a\xa6*\xbf\
-\xf2\x8f\x09.\xec\x1e\xa4\xd4\xf1\x8d9,\xe1\x17\xd3q\
-\xb0M\x90\xabT\xaf_\xefj\x0a\xfc\xc2x*8$\
-\xc8*\xaah\xa8\x8aW\xccG\x9b\xe9R-\x8cb\xcc\
-\xf4\xecW\x9fP%]\xb5\x95l\xc1\x97|\x807m\
-\xde\x0d^0\x93\xd8\x93zj\x13\xb7\xf0\x84a\x0c\xe0\
-\x1cG\x89c\x8c\x93\xf4\x8e\xf1\x18\x9bf\xb5Y\xdcG\
-\xbd\x16&\x89\xdf\xd4U\xfb#m\xe3\xd2L\xde\xc7i\
-\xe2W\x0eI|\xf0\x99M0\x84\x0b<\xe0\x1a\x8f\x18\
-\xa9\xb8Ly\xd5)\x14\xfa\x8d\xd7\xcdM\xcb\xfe\xb9\xce\
-\xbdo\x7f\xf5\x97\xe8\xd7\x9d}f\xfb\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07S\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:03-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:03-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:b63b9769-1d9a\
--c34f-992b-a7073\
-bb85821\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:230310ca-27cb-8\
-849-8f51-9f638da\
-0039c\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:104e48f\
-f-8998-9442-8067\
--efecbc5afb8c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:104e48ff-8998\
--9442-8067-efecb\
-c5afb8c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:b6\
-3b9769-1d9a-c34f\
--992b-a7073bb858\
-21\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:03-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd4\xfd\
-\xce\xbd\x00\x00\x01\x08IDAT8\xcb\xc5\xd3-K\
-DQ\x10\xc6\xf1qW\xc15\xf9\x05\x94\xfd\x0a\x9b\xc4\
-l\x10AA\xebV\x93\xaf \xc6m\x8a\xc1\x8f`1\
-XL\xa2\x88b\xb2*\x82A\x83`0\x89\xfeLZ\
-\x8dk\x99\x0b\x97\xcb\x85\x0d\x1b\x0cO8\xf3\x9f3\xcc\
-3gN\xf4\xfb\xfd\x18F1t\x01\x14\x1aE\x03\xcd\
-TTT\xcb\x03#5\xc9\x91\xc9\x03y\xf9\xb0\x89S\
-\x1cc!\xe3\xcdR\x91\xed\x12\x9f/w\xd0\xc0\x05\x9e\
-\xb0\x85}|b/\x93\xc6q\x8b\xc7\xe4\x07\xf8\xca\x82\
-\x11X\xc7s\xa5\xbd6\xde2\xf9\x06g\x15>\x83\x0f\
-\xb4\x03'\xd8I0\x96\x0aL\xe2\x17\xe7\x95A\x16\xb6\
-.\xb1\x1a8\xc2aep\x81e\xfc\xe0\x01S5\xfc\
-\x0e+\x81\xb9\xf44[\x82k\xf8\xceX\x0f\xef\xe8\x94\
-x\x0f/h\x15\x81\x8d\x1c\xdcuV~M\x9f\x05\xdf\
-M~\x85\xfb\xbc\xdc)?c`\x1a],a\xa2\xf2\
-\x8c\xc5`\xbbXD\xab\xb0\x145\xde\xeab\x8dA\x8b\
-T,K#U\xb7}\xb5<\xfe\xfd7\xfe\x01\xda-\
-\xed\x96\x81\xfe\xa3I\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07\x0f\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:05-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:05-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:5fe81724-7f92\
--ca4d-8f47-dc1a4\
-4be205e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:b1284f16-fd81-c\
-24c-b587-4afa21e\
-e0e29\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e575c6e\
-6-8911-a645-acea\
--7d428b0935e5\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e575c6e6-8911\
--a645-acea-7d428\
-b0935e5\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:5f\
-e81724-7f92-ca4d\
--8f47-dc1a44be20\
-5e\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:05-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x95\x0c\
-\x8aO\x00\x00\x00\xc4IDAT8\xcbc\xfc\xff\xff\
-?\x03%\x80\xf1\xd9\xb3g\x0a@Z\x1c\x88\xff\x80\xf8\
-$\xe8e\x02\xe2\xbb \x03Z\x80\x8c8 ~\x07\xc4\
-,Dj\xfe\x07\xc4\x1c@\x5c\x0a2\x80b/x\x01\
-i\x13 \xfe\x06u\x161\x00\x14p\xac@\xbc\x09d\
-@\x06\x90\xe1\x09\xc4\x9fI4\x80\x0d\x88'S\xc5\x0b\
-\x05@:\x00\x88?\x0213\x09.`\x07\xe2N\x90\
-\x01\xb6@\x86\x0e\x10\xff 1\x1aA\x96\xed\xa7\x8a\x17\
-\x90\xd3\x013R\x22a$\xe0\x05P:(\x06\x19 \
-\x09d\x08\xa3\xa5D\x90w~C\xf9\xb8\xd2:H\xee\
--./(\x03\xb1\x14\x10\xff%\x90\x94o\x82\x0c`\
-D\xb2\x89\x09\xaa\xa9\x13\x88}\xf0$.XR\xae\xa4\
-J 2\xe0\xf1#\xc1\xf4\x00\x00\x9eoMj!\x8e\
-(\x04\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x81\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:01-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:01-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:e7bad16f-5a13\
--9a43-a964-5f40c\
-2c17c9b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:4131f51c-de1f-5\
-04f-af5d-1de729c\
-4c134\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:383731a\
-1-4698-134f-a844\
--c328b1661948\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:383731a1-4698\
--134f-a844-c328b\
-1661948\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:e7\
-bad16f-5a13-9a43\
--a964-5f40c2c17c\
-9b\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:01-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>7r\
-\x8e\x13\x00\x00\x016IDAT8\x8d\x8d\xd1\xbd+\
-\xc5a\x14\xc0\xf1s\xef\xe5*e\xa3+\xca\x22\xac&\
-$\xcaf2\x91Y\xc9`\xf0\xb2\xb0\xdc\x09\xa3\x0c\x0a\
-\x83\xa4\x0c\x06\xc3-\x036\xbb\x22/)\x84\x92\xe5W\
-\xf2G\xf0}\xea\x1c\x9d\x1e\x0f\xf7\x0e\x9f~\xe7\xf7\xbc\
-\x9c\xe79\xe7\x91,\xcb\x04y%5\xaaC.\xc4\x12\
-ml\xc38\xb6p\x84\x13\x1c\xe3\x10\xab\x18F\xa3[\
-\x9f\xb7\xa0\x0f\x07x\xc69\xd61\x87)Lc\x09\xbb\
-\xb8\xc1\x1dV\xd0l7(\xe3\x09\x1b\xe8\xacr\xf5\x22\
-Fp\x8aKL\x88n\x9eO\xd4\x18\x14\x94\xc5~M\
-\xb8iE\xb4\xe6W\x94\x5cC\xffk^\xf8Nj\xb9\
-%\x9b\xd8\xd3f\x89uW\xbf\xfeul\xbc\x15\xef\x18\
-\xb3\x1e\x04\x0dx\xc0\xac\xfe\xd7'N\xb7Dg\xd8\xd1\
-\xb8 \xae\xb6!|\xa0K\xff;\xb4a\x03h\xd2\xb1\
-E\xdc\xbbRr\x96\xdd\x92\xac\xe1\x0a\xfbx\xd4N_\
-\xe3\x16\xdbxC\xbf\xdf\x93j\xd4\x85nnw/0\
-\x8a/,G\x07J\xaa\xc6\x1eM\xd0\xeb\xe6\xcaZ\xfb\
-\xaf\x03\xe3\x01\xcb\xbc\x80\x17\x8d\x07\xf1\x89\xee\xd43\xa7\
-J\xb0\xe7\xaa\xa8\xd0\x83\x99\xf8\xea\xb5$h\xd1&n\
-F\xe3U\x13\xf8\xc5\xc5?\xe6\x7f|\x03\xb5\xb3\xe3[\
-Yg\x12G\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07Y\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:26-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:26-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:91245354-5fd1\
--1846-968e-51ad0\
-680feac\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:b02fde03-2a5b-d\
-b4d-a312-30816d8\
-ab243\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c0f83b7\
-a-1aa9-4443-9693\
--db081e974442\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c0f83b7a-1aa9\
--4443-9693-db081\
-e974442\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:91\
-245354-5fd1-1846\
--968e-51ad0680fe\
-ac\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:26-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x14,\
-\xfe\x95\x00\x00\x01\x0eIDAT8\x8d\x95\xd3=/\
-DQ\x10\xc6\xf1\xbb\x8b\xd8D\xd6\xdbE\x85N%\x22\
-!Q\xfa\x08\x92m\xb4:\x95\x90\xa8$\xc4\xa7\xd0\xd0\
-(\xb0z\xd1\xa94:\x11l\x22D\x94\xbfF\xab\xa7\
-\x99\x9b\x1c7\x9b})&s\xe7\x9c3\xff\xf3\x9cg\
-r3dITJu\xd7H\x8bj\xf2\xbd\x80U\xac\
-`1\xf22\x96\xb0\x86\xf92\xa0\xb8y\x0e\xb7x\xc7\
-\x13\xde\xf0\x1b\xf9\x1b?\xb1wX\xf4\xa5\xcd\xf5h:\
-\xc1$\x860\x8b\xd7\xc8\xfbh\xc6\xd9\xe1T\xc1`\x14\
-\x07\xb8+\xbdq\x0c/\x18\xc7\x0e.\xdayP\xbc\xbd\
-\x19\x87\xb2\xb8=C\x1e\x0a\xa6\xb0\x8b\xab\xb2_\x19\x06\
-\xa28\xc7qI\xe2t\x00\xf2\x12\xa0\xd2\x0e\xb0\x89\x0f\
-\xd4\x12\x895<w\x03\xa4\x0bgha\x0b\xeb\xd8\xc0\
-\x17&\xba\x01\xd2\xd8\xc6=\x1e\xf0\x18\xa3\xabc\xafW\
-@\x1a#1\x85\x99\x00\x5c\xf6\x02\xa8&.\xe7\xe1A\
--\x94\xf5\x04H\x0f\xe4\xf8D\x03\xa7\xb8n7\xc6N\
-\x80Q\xdc\x84\x17-\x1c\xf5\xebA_\x7fc'5i\
-\xfc\xdb\xff\x03\xfe\xb6\xdf+v\x12\xceP\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07S\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:03-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:03-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:d4bc2bde-ff53\
--1544-a1a0-4166b\
-1f9f186\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:d41820c3-fd23-e\
-f4f-8fee-72caaa5\
-24d65\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:83f771c\
-b-440d-7c44-a4ef\
--000121a004b9\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:83f771cb-440d\
--7c44-a4ef-00012\
-1a004b9\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:d4\
-bc2bde-ff53-1544\
--a1a0-4166b1f9f1\
-86\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:03-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>J\x08\
-\x1d\xeb\x00\x00\x01\x08IDAT8\x11\x9d\xc11N\
-TQ\x14\x00\xd0s\xdf<L\xb01a\x03&\x04\x0d\
-\x05\xb5\xb5\x8d\x8d\xc1\xcaj6\x80\x1b@)\x0c,\x04\
-(MLlH4\xb1\x9c\x05P\xcc\x02Hl\x7fi\
-!\x06\x1c\x9c\xf7\xbf\x93\xdc\x02\x08\x142\xe7D\xd7u\
-\x16\x8a\xe5\xf4U\xea-\xa9b\x0d[(\xfe_\xe0\x1c\
-\xd3\x8a\x8f\x18\xe3\x07\x1eap-\xa4\xc1m=\xd6\xb1\
-S\xb1\x81\x03\x1c{\x98/xV\xf0\x13M\xaaX\x91\
-\xde\xe0\x04#\xa9 P\xa4\x01\xf3\x82=|\x92\xe6\xf8\
-+}C\xc3\x89\xd4K\x83\x14\x88\x8a1\xde\xe2\x1c#\
-\x0c(\x98!\xb0\x8d\xcf\x18\xbbG\xc5)f\x98#\xa4\
-\x82_x)M\xa4\xc0\xe0\x86\x8a\x15|E\xe7\xb6\xa7\
-\xd8\xc7;\x1ca$\x05\x9a4\x14\xec\xe2\xb5\xbb\x1e\xe3\
-\x03\x0e\xa5\x86\x86&\xcd,T4l\xe29\x9e\xa0G\
-\xc1\x05\xce\xf0\x02M\x0a\xe9\x0f\xd61\xad\xf8\x8e\xf7x\
-\x85\xe2ZA\xa0\xb9+\xf0\x1b\x93\xe8\xba\xce\xc2\xaa\x87\
-\x09\xccqU\xa5K\xcb\x89*\x85\xe5\x0c\xff\x00.\xc5\
-BF\xf0\xe3\x0a\xa6\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07\xb2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:36-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:36-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:3af4a655-5aa4\
--5746-9437-b3a77\
-d38c26d\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:504f5e6a-e941-b\
-a4a-a875-3bc6392\
-4df2b\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:935523c\
-b-05ec-f54c-8a3c\
--5dcaeefefa6b\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:935523cb-05ec\
--f54c-8a3c-5dcae\
-efefa6b\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:3a\
-f4a655-5aa4-5746\
--9437-b3a77d38c2\
-6d\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:36-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xe4\xec\
-\x9a\xc2\x00\x00\x01gIDAT8\x11\x05\xc1\xbd\x8b\
-\xcf\x01\x00\xc0\xe1\xcf\xf7\x1c\x83\xcb{\x0c\xfc\x03^'\
-&Y\x94\xc1\xa6\x13)\xddJ7\xd8\x0cB\x8a(%\
-e\xe0n \xa5\xc4\xc0\xdd\xc9\xa2d\xa6\xe4N\xf8\x91\
-\xab[0<\xd8\xfc\x09\x9e'\x840`@\xd8\x80Y\
-\xbc\xc4=\xacG\x180 \x84B\x08a\x15\xc2Q\xfc\
-\xc1\x19\xfc\xc5\x11\x84U\x08!\x14\xc2\x04\xb6\x22L\xe1\
-7n\x22\xdc\x02\x9cF\xd8\x86\xb5\x08\x85\xf0\x08?\xb1\
-\x84\x11Nc\x02a\x02S\xf8\x8a%\xfc\xc2C\x84!\
-\x9c\xc2'\x1c\xc4ylE\x08\xab\x11\xc26\x9c\xc7A\
-|\xc6\x09\x14.\xe1\x076!\x84}x\x83\x11^c\
-\x0fB\xd8\x82\x9f\xb8\x80Bx\x86y\x84\xf5\xf8\x88\xbb\
-\xd8\x8bY,b\x02\xe1\x05\x9e\x22\x0c!\xdc\xc0\x0c\xc2\
-I|@\x08a\x11\x93\x08\xb3\xb8\x8a0\x16\xc25<\
-F8\x8ce\xacC\xd8\x88e\x1cBx\x82+\x08c\
-a\x07\x16q\x1b!<\xc6\x08\xd71\xc2}\x84p\x07\
-\xef\xb1\x1d\x85\xdb\xf8\x86\x10\xc2j\x9c\xc3\x03Lc@\
-\x08\xe1;n\xa1\xb0\x1b#\xcc\xe0\x1d\x8e!\x84\x10\xc2\
-$\xdeb\x06_\xb0\x13\x850\x8d9\x5c\xc6\x0a\xe6\xb1\
-\x1f\xe1\x00\x16\xb0\x82\xcb\x98\xc3Y\x84\xb1\x10B\x08\x9b\
-\xf1\x1a\xcf\x11\x16\xf0\x0a\x1b\x11B\x08\x850`\xc0\x1a\
-\x84=\xf8\x87y\xfc\xc3.\x845\x180 \x14B\x08\
-!\x8c\xe38.b\x12\xe3\x08!\x84\xd0\x7f\x0e\x0a\xf7\
-(Z\x0b\xf5\xbb\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x06\xa1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:18-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:18-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:849f931e-5814\
--6045-b315-df73e\
-c7583c5\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:f3e64267-d308-9\
-946-ba10-6ccd7e3\
-9b5f6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:5113771\
-4-a006-ea4d-83df\
--5220430d927f\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:51137714-a006\
--ea4d-83df-52204\
-30d927f\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:84\
-9f931e-5814-6045\
--b315-df73ec7583\
-c5\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:18-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x87\xe8\
-\x93<\x00\x00\x00VIDAT8\x8dc\xf8\xff\xff\
-?\x03%\x98\x22\xcd\xc3\xcd\x80g\xcf\x9e1\x12\x8b\xa9\
-\xef\x02\xa0\xa9<@<\x05\x88\xb7\x01\xf1z \xde\x88\
-\x03\x83\xe4v\x00q:\xcc\xd50\x03\xd8\x818\x1c\x88\
-\xb3@\x92\x04p\x0e\x10\xdb\xd0$\x10\x99\x81\x98\x05J\
-\xe3\xc3 5L\x830\x1d\x0c]\x03\x00p\xd0\xfbK\
-\x00\xb3\xa0\x83\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\xb5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:44-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:44-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:ed45ad30-de25\
--dd41-bd6e-43278\
-17324d8\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:b4edd8c0-8033-a\
-348-9102-b0739c4\
-428c6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:abf7156\
-d-95e0-174f-a523\
--79ecaba0ab28\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:abf7156d-95e0\
--174f-a523-79eca\
-ba0ab28\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ed\
-45ad30-de25-dd41\
--bd6e-4327817324\
-d8\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:44-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xb6\xb0\
-\xff\x9a\x00\x00\x01jIDAT8\x11\x05\xc1\xcdk\
-\xcf\x01\x00\xc0\xe1\xcf\xef\xfb[\xf9-\x89\xe5J)r\
-\xf0Z&%/\x7f\xc2\x0e\x1c\xccu\xb4\x5c\x9c\xa4\x84\
-\x14'\x07qUXj'9l5\x8a\xf2\x17x)\
-\xa5MCI\xea\xb9\xba\xb9\xf2<!\x84\x01a\x0a\xf3\
-x\x84e,\xe1\x1eN#\x84\x01\xa1\x10F\x08sX\
-\xc7g<\xc5\x0d\xdc\xc1Kl\xe25v#\x0c(\x0c\
-\x08W\xf1\x07\x8b\x08!\x84\xb0\x03\x8f\xf1\x0b\x87\x10\x86\
-\x10\xe6\xf0\x07\xb3\x08a\xc0\x80\x11\x06\x84p\x03\x9b\xd8\
-\x81\xc2\x14\xd6\xb1\x880\x85\x09\x06\x840 lEX\
-\xc1C\x14\xe6\xf1\x05\xe1,V\xb0\x8a}\x08#\xdc\xc7\
-;\xdcD8\x86\xaf\x98\x09\x8f\xf0\x1c\xe10\xfe\xe1/\
-\xf6\x22\x84'\xf8\x87\x07\x08\x13|\xc4\x99\xb0\x8c[\x08\
-\x07p\x0d\x8b\xd8\x8f\x10.\xe3\x0a. \x84U\x5c\x0a\
-K\xb8\x87\x10B\x08!\x84\x10Bx\x83\xf9p\x17+\
-\x08c\x8cq\x14'0\x8bY\x9c\xc4\x1e\x84\xb0\x0d\xeb\
-8\x12N\xe1\x07v\x22l\xc1\x1a6\xf0\x09\x1f\xf0\x13\
-\xd7\x11\xc29\xbc\xc78\x84\xd7x\x860`\x1a\xd3\x98\
-`\x82iL\x10\xc2\x06\x16P\x08\xbb\xf0\x1b\xb7\x11B\
-\x08!\x84\xf0\x0e/\x10\x0a\x03\xc2A|\xc7+\x1c\xc7\
-4B\xd8\x8e\xf3\xd8\xc0\x0b\x8c\x11F!\x0c\x08\xdb\xf1\
-\x10\xdf\xf0\x19kx\x8b\xafx\x8f\x05\x840B!\x84\
-\x01!\xcc\xe0\x0c\x16p\x11G0F\x08#\x84\xfe\x03\
-\xb5K\xf1\x94L[b\x17\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07t\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:17-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:17-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:c99710a7-d8be\
--164e-af14-49507\
-55bad8b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:8784d59e-ee9a-d\
-d49-944d-da6294e\
-3bd45\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:6d329bb\
-5-c6ab-d442-8a10\
--3bca420c0787\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:6d329bb5-c6ab\
--d442-8a10-3bca4\
-20c0787\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:c9\
-9710a7-d8be-164e\
--af14-4950755bad\
-8b\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:17-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x9c\xee\
-QI\x00\x00\x01)IDAT8\x11\x95\xc11J\
-+Q\x14\x00\xd03\xc3%\x91\x11\xbf\x8d\x85\x8dU\xc0\
-\xe2o\xc3\xc2\xca\xd2-\x086\x96.\xc15\x88\x0b\x08\
-H\xb0s\x0b\x226\x96V\xc2od\xb0L#H\x9c\
-y\xf3\x8b'\xbc\xc4h\xe19\xd1\xb6\xad/\x02\x17\x98\
-\xa0CB\x83kLQ#\xf9\x14\xd6\x8dp\x8c\x19\x9e\
-\xf0\x81\x13\x1cb\x8a\xca\x92PT\x18P\xe3\x15Wx\
-\x96\xedb\xdf7B1\xc8:\xd4\xd8Vl*\x92%\
-\x81\xc0\x085:\xfc\xc1\x18\x83\xa2B#\xdbB\x8f\x1e\
-\x8b\xc0\x05\x8e\xf1\x8a\x1acl\xe0M\xd1\xe2\x14\xf7\x08\
-$\xec\xe0<0\xc1\x0cW\xd8\xc6\x807\xfcS\xcc\xf0\
-\x80\x90\xbd\xe3\x12{\x81\x0eOx\xf6\xb39\xe6V\xbd\
-`\x08$|\xf8\xbd\x0eC\xa0\xc1\x09v\xb1\x89\x0a-\
-f\x98\xcb\xfe\xe2\x08c\xd9\x02\x07x\x0c\x5c\xe3\x10\xfb\
-\xb2\x06\xa7x\xc0\x5cv\x843\xdc\xa0A\xc2-\xee\x02\
-SL\xad\xbaG(\xc6\xb8\xc1\x99/\x025*Y\xc2\
-\x16\xc2\xbaF6B/K\x81dU\x8f\x84w\xc5\x02\
-I\xd6\xa3\xf7)\xac\xeb\xb1\x83K\xbc\xa0\xc3\x01n}\
-#\xac[\xe0\x1c{\x180\xe0\x11w\xb2d\xc9\x7f\x99\
-0U\xd6\x1b<\x8a\xa6\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\x87\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:27-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:27-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6ee4e473-ca97\
--4f4e-baa9-c1101\
-c647da7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:59e88cde-183d-8\
-e47-90ca-dc66c57\
-216b6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:9a49353\
-9-26e0-664c-9cd7\
--248d37bf1837\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:9a493539-26e0\
--664c-9cd7-248d3\
-7bf1837\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:6e\
-e4e473-ca97-4f4e\
--baa9-c1101c647d\
-a7\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:27-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x0b\x83\
-\x10s\x00\x00\x01<IDAT8\xcb\x95\xd2\xbf+\
-Eq\x18\xc7\xf1s\x8e_\xa5\x0cV\x94\x01\x8b\xbf\xc0\
-\x22,\xcaha\xf2\xabnf]R\x98\x94\x8dd\xb0\
-\x5c\x83\xfcJ\xddR\xcav\xcb`\x93AQ\xae\x92H\
-\xd1Q&\x9b\xd5\xfb\xa9\xe7\xd4\xa7\xef\xed\x9e\x18^\xdd\
-\xefy\xcey\x9es\x9f\xe7<Q\x9a\xa6\x91\x9b\xc5\x11\
-\x8e1-\xf1\x5c\xd9a\x1fU,c\x05/8\xf0{\
-1\x92\xbc\x02SxD\x8b\xdch\xc6=\xc6%\x16\xbb\
-\x9a\x02\xf6\xf65\x0fh\x91C|c\x15\x03A\xa1\x9a\
-\x02\xeb\x12\xec\xc3-\xae\xb0\x81\x12^\xb1W\xaf\x85I\
-\xbc\xa1\xcd\x83\xd5\xa0\xa0i\xc75v\xfc:\x09\x87X\
-\xf29\x5c\xe0\x5c\x12\x9b\x9c\x9d\xbb\xf1\x84\x1e-\xa2=\
-\x0d\xe1\x07\xf3\x92\x9c\x15j\xf0\xdfK\xf9\xc4\x89\xfe\x83\
-N\xec\xe2\x0b\x13A\x92\xbe\xe4\x04\x9fX\xd0\x16\xac\xbf\
-\x07\x9c\xfa\x00[s\x16\xc7\x9e\x1d\xc63\xb6\xb3\x026\
-\xb0\xca_7\xcfu\xe1\x1d\xfdvQFA\xfa\x8es\
-\x12\xad\xefF?\xdb\xb0\x0b\x91\x7f\xdfMy \x0e6\
-O7PW\xfa\x0e\xa3v\x18\xc4\x07F\xfe\xd1\xc2\x16\
-nl\xd0Y`\xce{\xaaxKgu\x94}K-\
-\xb97\xdc\x83\x0e\xcc`\x09E,\x8a\xa2\xc4\xc6d\x0e\
-\xc9/\x0c$\xecM\x9b,\xb7\x8e\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07\xb7\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-36-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:53-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:53-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:52ab04b1-56fd\
--d84c-a882-90f85\
-9f76dcc\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e32edbac-8682-4\
-d43-bbad-5debf5e\
-f7e48\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:efb82df\
-b-3039-4540-8d67\
--93507bd3874a\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:efb82dfb-3039\
--4540-8d67-93507\
-bd3874a\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:36-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:52\
-ab04b1-56fd-d84c\
--a882-90f859f76d\
-cc\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:53-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x90<\
-\xe99\x00\x00\x01lIDAT8\x11\x05\xc1\xbb\x8b\
-\xc8\x01\x00\xc0\xf1\xef\xfd\xdcq\xe7m0(\x8aH\xc9\
-kS\x8a\x01\x83A9\x8b\xc1\xd9\xb0\xc9\xab<v\xcc\
-\x84\xdd\xa3[d\x10\x89\x85\xb0)y\xe4\xf2\xbaP\x06\
->\xfc\x11\x06\x9fO\x08a@\x18\xc3!\x5c\xc14n\
-\xe1\x12v#\x84\x01\xa1\x10F\x10&1\x83W\xb8\x86\
-\x938\x87;\x98\xc1slD\x18P\x18\x10N\xe2/\
-\xa6\x10B\x08a>.\x03\xf6 \xcc\x09a\x12\x7f\xb0\
-\x01a\x14!\x84\x01!\x1c\xc6o\xacCa\x0c3\x98\
-B\x18G\x98\xc0.\xacF\xd8\x8c\xb9\x08\xd7p\x0f\x85\
-Cx\x850\x8a\xb0\x0f\x9f\xf1\x06\xef\xf1\x02\xcf\xb0\x00\
-a%~`u\xb8\x8a\xeb\x08a\x0d~\xe2\x18\xc2\x1a\
-|\xc6;L \x0cx\x89\x03a\x1a\xa7\x10\xc2\x19<\
-F\x18E\xd8\x8b\xb7\x98@\x08wq:\xdc\xc4y\x84\
-p\x02O\x11B\xd8\x8f\xaf\x08!<\xc4\xf1p\x11\xd3\
-\x08a\x05\xbe\xe3\x02\x16c\x1b>\xe0\x1fN`\x1c\x07\
-\xf1\x0bk\xc3\x0e|\xc2B\x84\xb0\x1d\xaf\xf1\x05\xdfp\
-\x0e;\xf1\x16\xb3\xf8\x88\xfd(\x84G\xb8\x810\x860\
-\x86\xf5X\x8e\x10\xe6`\x05\x16!\x8c\x84\xb0\x0a?q\
-\x16!\x84\x10BX\x82\xbd\x08#(\x0c\x08\x9b0\x8b\
-\xfb\xd8\x8ay\x08a\x11\x0e`\x16\xb71\x82P\x08\x03\
-\xc2R\x5c\xc5\x17\xbc\xc1\x03<\xc1'\xbc\xc6\x11\x84\x10\
-\x0a!\x0c\x08a\x19v\xe2(\xa6\xb0\x05\xa3\x08!\x84\
-\xfe\x03\xe1\xd3\xf4\xd31\xd3\x82\xc5\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07i\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:28-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:28-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:f18d3f82-528b\
--ed46-a77f-dc5c3\
-37f9cfb\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:26da8e6a-e893-4\
-649-b3e7-de2a02f\
-9db56\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:12c75a7\
-f-2b78-c947-bace\
--9e4aeb5867cf\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:12c75a7f-2b78\
--c947-bace-9e4ae\
-b5867cf\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:f1\
-8d3f82-528b-ed46\
--a77f-dc5c337f9c\
-fb\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:28-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x8cJ\
-\xbbd\x00\x00\x01\x1eIDAT8\x11\xa5\xc11K\
-\x95Q\x18\x00\xe0\xe7|\xf7\x95\x0a\xc4jk\xaa\xe1\xba\
-\x89?\xa0\xd1%\xc2\xa1\xa5\x1a\xc2\xfeEK\xe0\xe4\xe8\
-,:).5\x04\xedn\x81S\xd0\x12H\x83CS\
-P\x97@rr\xd0\xfb\xdds\x14\x8ep\x08\xb9\xcb\xf5\
-y\xa2\x94\xe26b4\x1a\x99Q\x87\x1c\x9a\xc0\x1d$\
-\xd3\xf5\x18\xe0\x0c\xd9\x95@B\xc1&^\xe2/\xc2M\
-\x05\xf3\xb8@\x8f-\xec\x87f\x88\xcf\xd8\xc5\x02\x8a&\
-\xe1\x0c\xbb8\xc4!v\xf0=4c\x1c\xe1\xd8t\x7f\
-\xf0\x0d\x07\xf8\x8d\xe5\xd0$\xdcS\x05\xb2&a\x82\x0e\
-o\xf1\x0c\x0fp\x10\xfe\xd7\xab2\xb2\xa6S\x8d\xb1\x88\
-c\xbc\xc0I \xa1\xe0\x02\xf7Us\x98h\x122\x1e\
-b\x13\x9fT)\x90T_\xf0\x0e\xdb8w\xd3*\x86\
-\xf8\xaa\xea\x90\x03\x05\x1d\xf6\xb0\x82\x1f\xf8\x88st\xe8\
-\xf1\x04\xaf\xf1\x1e\xbf0\x87\x89+\x81\xacY\xc3*\x9e\
-\xa3\xa8\x068\xc5S\xfcT\x8d]\x0b,\xe11z\x14\
-\xfc\xc3\x07$M\xc6#\x0c\x91Q0\xc0Q\xe0\x15\xde\
-\xe0\x14\x81\xcetY\x95q\x17\xeb\x81\x0dl\x98Q\xa8\
-\x92\xd9\x94Kp\x09M\xeeR\xb8\xdd?\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07\x7f\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:16-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:16-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:34049651-5dcb\
--2640-8d96-839bb\
-d988f88\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:679e9303-46ab-e\
-a42-af88-6cdaa46\
-62f0f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d7e85c5\
-7-1636-7744-8f2d\
--1afda745897a\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d7e85c57-1636\
--7744-8f2d-1afda\
-745897a\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:34\
-049651-5dcb-2640\
--8d96-839bbd988f\
-88\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:16-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xa1\xf8\
-u\x18\x00\x00\x014IDAT8\xcb\x95\xd3;H\
-C1\x18\x86\xe1D\xab\xb5\xb8\xb8hiA\xe8bw\
-\x11\x9c\xebP\x05\x07\xa1t(\x14tu\xd6MqP\
-wQQ\x07/(8\xb8\xba\x89\x9dD\x05\x1d\xecX\
-t\xd0A\x97\x83\x97\xad\x82\xab\xbe\x07\xfe\xc0O\xe8\x09\
-8<'i\x12\xbe$Mb\xa2(2\xe8\x86\x95\xba\
-f\xa5\xcf$\xf1\x1bB\x83\xbb\x92\x02\xd2\xa8#'\x8d\
-)\xb5\x9a<fC\x13\xc4\x9fq\xfc\xe0\x09\x13\xdel\
-\xf3\xf8\xc5%\x0a\xaa\xcf\xea\x80)\xdc\xa1\x8a\x0f\xac\xaa\
-\x19\xd6p\x8c%|\xa1\xe6o)\xae\x94\xf1 \x8dE\
-\xa9_\xa1\x0f\x8b8\x90\xbei\xbca[\x87\xf8\x01\xce\
->Zh`O\xb5\x0f\xe2\x06\xf7\x18\xee\xb4\x02}\x9c\
-3\xb2\x7f7c\xaf\x0a\xda@\x1bY? %e?\
-v%`\xcb\x0b\x18\x91-\x9e#\xe3\x02\x9a*}\x0c\
-\xcf8\xc1&\x0eU\xdf\x1c>\xb1\xaeO\xa1,{2\
-\xf2\xa7\xbdcA~/cG\xeaGxAI\xdf\xd4\
-\xf83\x89G\x9cI9\xaa\x06\xac\xe0\x16\xd7\xb8\xc0\x80\
-\x7f\xa1\xdc\xd1\xbd\xe2\x14=\xd2\xe1\xca\x0a\xbeee\x1d\
-o\xa3\xabd\x13\x06\xc4AC\xde\xe3\x0a>&\xfb\x9f\
-\x87\xa4\x03l\xe0\x15\x86\xfa\xcc\x1fi\x8c\xe6b\x82\xe8\
-\xe0D\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07k\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:58-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:58-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:fa2836bc-2b62\
--c642-ba5c-02515\
-793f7f4\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:fc510d5d-953c-2\
-245-9bb6-c9859ec\
-ac9d9\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:34f9033\
-7-bb94-274f-8f97\
--9c8244ddb7b3\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:34f90337-bb94\
--274f-8f97-9c824\
-4ddb7b3\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:fa\
-2836bc-2b62-c642\
--ba5c-02515793f7\
-f4\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:58-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xc6\xc9\
-d\x99\x00\x00\x01 IDAT8\xcb\x8d\xd3K+\
-EQ\x14\xc0\xf1}=2U\xc6\xbe\x01%\x03\x19*\
-\x03>\x82\x18x\x15n\xca\x15f201U&\xc2\
-\xc4\x80B\xaeg\x19\x99\x93\xc7\xd8\x04\x83[~\x9f\xc3\
-\xc0>\xda\x9d\xce\xb9\x9cZ\xad\xd5:{\xfd\xf7z\xed\
-\x80\x90\x93Jb\xb76\xf9\x17\x10B\x01 `\x14\xf7\
-x\xc6\x0b\x0e\xd1]\x04)\xa2/\xe1+\xeaA\x0ca\
-\x1f\x9f\xe8\xc9C\xf2\xc1}1\xb8\xb7 \xab\x0d<\x94\
-\x95\xd0\x1e\xf5.\xb6\xa3\xdd\x81\x96\x5c\x1f^cy\xbf\
-1\xf9[NP\x8dv[\xe2o\x89\xfa\x06c\xf9\x0c\
-:0\x855\xbca\xa6`\x02Y\x89\xe7\x11\xb2\x8c\xe1\
-\x0c\xb0\x8ew\xec\xf8\xf9\xa6\x9b\x00\xeax\xc2\x01\x1a\x18\
-\x08\xb8\xc0l<p\x81\x85&\x80kLF\xfb\x12+\
-\x01\xa7\x98\x8f\xce\xdb\xc4.\x02\x5c%=\xaa\xa3\x96\x01\
-\xaa\x09`\xee\x0f\xc0b\x92m-k\xccDt\x9e\xfd\
-\xa3\x84\xf1db\xab!\xce\xfd1\xa6\xfe\x91\xd4X6\
-\x85\xbb\xb8\xa5\x0d\x8c\x04ta\x0b\xc7\xd8Dg\x93\x07\
-\xd6\x8f=\x1ce\xe3.{L\xff\x96t\xd3*\xc9\xc6\
-\x95I%\x7f\xf6\x1b&\xec\xe5\xe8\xfc-Qe\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x96\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:50-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:50-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:e3fb7947-b004\
--af49-ac90-d59f9\
-029fa27\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:2a118d05-cb66-e\
-84e-8690-a7b11b2\
-f13ba\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:5fa045e\
-a-708a-3141-afc5\
--33a7cee489f6\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:5fa045ea-708a\
--3141-afc5-33a7c\
-ee489f6\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:e3\
-fb7947-b004-af49\
--ac90-d59f9029fa\
-27\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:50-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>j\xb9\
-z\x96\x00\x00\x01KIDAT8\xcb\x95\xd3\xbf+\
-\xc5Q\x18\xc7\xf1\xf3\xbdWIa\x92B\xc9\xc0\xc2f\
- \x8b\x94l&\x7f\x01\x06\x06\x89\xb2H\xa2\xc4\x1d\x94\
-\x12\xf2s\xa1\x90,6\x0b\x99\xfc\xca\x82Rb\x10\xcb\
--\xe5\x8f\xf0~\xeast\x9c\xbe\xf7\xca\xf0\xfav\xee\
-\xf9\xf1<\xe7<\xe7\x5c\x97\xcf\xe7]\x11Yd\x02\x89\
-\xfa~\xe68u\xc6\x0b\x93?\x02\xff\x0a\xe0\x14\xbd\x02\
-\xa5\xd1\x84\x01\x1c\xe1\x00\xfb8\xc6b8\xcf>mx\
-\xc0\x1d\xde\xd1\x8fj\xdc\xe2\x1e\x13\x18\xc6\x88\xc6\x9e0\
-\xe5\x8fh\x9f\x19\x5c\xa0V\xd9V\xd1\xa5L\xd9\x94m\
-\xb7*Q\x9d\xdf\xc1&f5h\xc16\xa2\x05a\x11\
-K\xd4\xb7\x8b=\x1f\xc0\xce7\xa6\x81\x5c\x10\xa0,\xa5\
-\xb0\x19\xb5-\xfb\x0b\xda}\x80Q\x0d,`+\xca^\
-\xe8\x06\xce0h\x8dmL\xabs\x0e\xcbh\xb2\xe8A\
-\xe6D\x85\xadA%:\xf1f\xbfm\xc2\xbc\x8ag\xed\
-\x15,\xa1\x0f7A\xb6\x1dm\xf9\x1a\x97Z\x9c\xf35\
-\xe8VU\xaf\xf0\x85q-zF\x8f\xda\x8f\x18B\x95\
-vW\x1f?$\xebh\xd1`\xb9\xfa\xecX\xa7j\x9f\
-`\xb2\xd8KLcg~E#zq\x9er\x1b\xce\
-E\x85J\xa2\xea\xafcM\xef\xe30\xedf\x0ae\xf7\
-\x81\x1a\xf0\x89\x0f4\xff'@\xa8C\xc7H\xfd\x97~\
-\x03\x98\x95\xe7\xa5%\x0d\x8a\xed\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07\x1a\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:06-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:06-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:857db5e4-8986\
--8d4a-8578-e8714\
-6f71422\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:43ea0058-db09-0\
-b46-82bf-9a235a9\
-eff94\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:84d1f8a\
-a-d0ea-6246-8842\
--3b696c8c5099\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:84d1f8aa-d0ea\
--6246-8842-3b696\
-c8c5099\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:85\
-7db5e4-8986-8d4a\
--8578-e87146f714\
-22\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:06-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>Y\xcc\
-\xe8\xd1\x00\x00\x00\xcfIDAT8\xcb\xa5\xd3?\x0a\
-\xc20\x14\x06\xf0\xd7V\xbd\x82'\xe89\xc4\xd5\xcdU\
-E\xd1\xa1U\xd1\x1b\x89:*\xf8'u\xf04\xbaf\
-\xf4\x0c~\x81\x17\x09!\x09i\x1d~\xf4\xa5\x0d\x1f\xc9\
-KJRJ\x82\x14\x92Hd\xd6\xc4/\x9aJt1\
-\x04\x01\xb7\x08\x15\x1c 7W\xf0\xe4\x80\x11\xac\xa1\xf4\
-X\xc2\x0c\xde<\xfe\x05\xa8\xe4I\x8d\xa5\x9f\xed\x00\xc1\
-\xe9\xaa\xeepS]2\x9eS\xb9\x02J\xae\xb3P\xd3\
-\xec\xf9\xae\x80V  \xf5\x05\xdc\x8d-\xb4\x03w\xc0\
-\x1b\xa0\xf6\xb4\xa8\xd1\xc4+\xac\xcc\x00\xd5\xd5\x17\x9c8\
-L\x04\x5c\xe0\xa3OM\x07ta\xccg<\xe5\xa7\x8b\
-\xfa6\x87\x81y\x957\xf0\x80\x1d\xec#\x1d\xb9o}\
-\x15\xd0\x83-\x14\x81\x1bh+\xb8\x07\xf9\xbf?\x13\x91\
-q<M\xd0\x17\x92\x06\xec@?\x8a\x0c\xe3\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07:\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:49-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:49-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:ce7dcf94-982b\
--0b4c-ba03-38ec2\
-360d989\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:9a5ac6b6-03ce-d\
-a40-b37d-759ba84\
-fcb64\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:ca18900\
-1-cfc7-d64b-9492\
--043a9f94e905\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:ca189001-cfc7\
--d64b-9492-043a9\
-f94e905\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ce\
-7dcf94-982b-0b4c\
--ba03-38ec2360d9\
-89\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:49-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xa9.\
-\xc2\x03\x00\x00\x00\xefIDAT8\xcb\xad\xd3\xbf\x0e\
-\xc1P\x14\xc7\xf1*B-\x84\x95\xc4`\x16#\x9b\x87\
-\x1010\x18l\x22A\x22x\x07\x83\x1d\xb3\x0702\
-H$6\x83w\xd0\xc1h0\x91\xfa697i\x9a\
-\xb6\xfe\xc4\xf0I\xdb\xd3\xde\xdf==i5\xcb\xb24\
-\x9bi\x9aaD>\xa4\xabu\x9a:\xf9\x95\xda=\x86\
-&\xfa\x18a*\xc7\x9e\xd4\xc6\x98`\x88\x01\xaa\xee\x80\
-4.\xb0\xb0\xc1\x02[\xb9\xbec\x8d\x15NR[\xca\
-:]\x05$q\xc6\x15Y\xa9\x15\xf1\xc0\xde1\xa7\x96\
-\x04\xcc\xdc\x01:r\xc8\xc3\x90ZE\x1e>\x22!\xb5\
-\x14\x0a\xc8\xf8\x0e\x91\x9b!9\x96\x1d\x01\xf1\xc0!\xaa\
-\x85B\xf7\x0bP\xf7\xd5&~\x1d\x04\x06\xf8v\xf0&\
-\xc0\xf8%\xc0k\x88_\x05\x94\xf0\xc4\xc1=\xe0w\x01\
-Q\xcceg\xbb\x83\x1bvh;7\x08\xec\x00\x0dt\
-PC\x1d]\xfb\x95\xbc\xba\xf8\xcf\xcf\xe4\xf51I'\
-N!\xafg_B;\x03\xc4a\xd2!\x14\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07\xaa\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:20-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:20-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:cf117a79-62c7\
--fb42-b700-ffa3e\
-c82b3a8\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:5780669d-9380-3\
-e45-8622-aa2d0fc\
-c14f2\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:97918fb\
-5-ad22-f74c-8e63\
--41f53b46ab55\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:97918fb5-ad22\
--f74c-8e63-41f53\
-b46ab55\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:cf\
-117a79-62c7-fb42\
--b700-ffa3ec82b3\
-a8\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:20-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xcd\xf2\
-\xf7\xb8\x00\x00\x01_IDAT8\xcb}\xd3;/\
-DQ\x10\xc0\xf1\xb3l\x81\xc2\xdd\x0d%\x95\xca#\x22\
-\xa1\xc3\x17P(\xac\x08\xd1\x11\x0aY5\x11\x91\xa0\xa7\
-U\xb0\x8dj\xa3X\x09\x12\x12\x85zCP \x1e\x15\
-\xc9\x8dB\xe2#\xf0\x9fd&\x99\xdc\x1c\x8a_\xce}\
-\x9c3w\xee\x9c9!M\xd3\xa0\x1at\xccc\x1a\xbb\
-8D\x05[\x18\x89\xcc\x0d\xf6 \xa7\xe38\x1ep\x87\
-}\xacb\x03Gx\xc6\x19:}\x10\x1fm\x19\xdfX\
-p_\xf2\x0a\xd8\xc3;\xfa,Hp_\x96\xc5\x83.\
-\xba\x91\xec\x1a]\xa0\x15\xcd\xa6`\x19\xe45\xedEW\
-\x83\xf0\x07\xcb\xb6\x86\x1d\x0b \x05\xbbw\x93\x9a\xd0\x1a\
-Y\x98\xb8\xe0\x03xB1h\xb5+nr\x197.\
-\x98\x8c=\xf8t\x05\x94\xe7\xd7\x18\x0d\xbaUk.@\
-\x97\xbc\x88\xa4?\x86fw\x7f\x8c\xf9\xe0\xf6\xd9^t\
-k=\xcaJvg\x09\xb3\x99_;\x97\xdf\x97\x8bM\
--\x8a\xbd\x98\xc4O\xc4\x17\xdauN\xa2\x85\xef\x97\x9b\
-a\xbc\xa1\xcd\x15\xac\x16\x09\xe0\xfbc\x02u\xd9^{\
- \x1dv\xe0&H\xaa\xdb\xb8\xc5\x15\xa62\xf5x\xc4\
-\x9co\xe5\x0e|`\xfd\x9f\x1e\xb0\x96\xbfD\xd5\x9f\x05\
-k\x8e^\xbc\xe2\x14Chq\x8b\xa4\xebJ\xfa\xe5\xaa\
-\xeb\xcc\x5c\xb6\xc3\x12\xed\xb0\x17=P'\xb8\xd0\xa6\xa9\
-[\xda\xfe\x00\xc6\xdaT\x14\xb5\x17d\xc1\x8cT;s\
-\x1e\xec\xf4\x86_=q\xf5:\x96\x83\x82\xfb\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07\x05\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:46-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:46-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:dd39a92b-0a9a\
--da40-ab9a-8cfb6\
-98f1fd6\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:fdb004c1-9aa3-3\
-140-98f6-fc140db\
-c77dd\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:511cbcb\
-b-c45b-5f47-88d4\
--4cc465a0a428\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:511cbcbb-c45b\
--5f47-88d4-4cc46\
-5a0a428\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:dd\
-39a92b-0a9a-da40\
--ab9a-8cfb698f1f\
-d6\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:46-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>uN\
-\xa3i\x00\x00\x00\xbaIDAT8\x11c\xf8\xff\xff\
-?\x03.\xfc\xec\xd9\xb3L \xb6\x83\xb2\x99\xb0\xa9\xc1\
-\xa5\x91\x11J\xef\x01\xe2<(\x9b\x85\x1c\x03\xd6\x02q\
-*\x94\xcdL\x8e\x01\x1b\x808}\xd4\x00\x12\x0c\x00i\
-\x04)\xc4a\x00+6C0lE\xb6\x0d\xd9\x00\x5c\
-\x18\xdd\x05r@\x1c\x8c\xc4\xdf\x08J\x8dP\xb60\x10\
-G [\x047\x00\xc9\xc9R@|\x0f\x88k\xa1\xfc\
-M@\x9c\x04e\x1f\x02\xe2U\xe8\xaeE\xb6\x9d\x09J\
-+\x01\xf1\x13 .\x00\xe2\xc5@\x9c\x0f\xc4+\x81x\
-;1^\x80\xf9]\x15\x88o\x01\xf1G \xfe\x0a\xc4\
-+\xb0\x85\x15\xd6h\x84e\x1a \xad\x00\xc4\x0f\x81x\
-\x0d\xba+\x89I\x070\x97H\x001'\xbe\xec\x0c\x00\
-d.\xff\x0f\xfd\x8cw\x0c\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07k\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:12-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:12-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:2515002d-ba77\
--3141-930b-25536\
-46b0f9a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:07e0f747-8933-1\
-949-a66a-91bfd3b\
-fdd0a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:47173bf\
-5-a5c2-2245-88d8\
--c1d0a6865186\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:47173bf5-a5c2\
--2245-88d8-c1d0a\
-6865186\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:25\
-15002d-ba77-3141\
--930b-2553646b0f\
-9a\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:12-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xeb\x81\
-\x86\xca\x00\x00\x01 IDAT8\xcb\x8d\xd2?/\
-\x04Q\x14\x05\xf0Y\xeb_\xb6\x13\x9b\xadDD4\xb6\
-\x12t*\xa5V\x22\x0a\x89F\xa2R\xd1l\x14\xe2c\
-\x88\xc46\x14J\x8d\x82B\xa8\xc8\x12\x14h\xa8\x7f\xad\
-\xaf\xa0pG^\xc6\xce2\xc9\xc9\xbc{\xe7\xcd\xb9\xe7\
-\xde{2d]\xd0@\x0b'hc\xa5\xe4^VL\
-T\xe2\xdd\xc65\xb6\xb0\x87w\x1c\xfe\x87 G\xbd\x10\
-\x0f\xe3\x05\x9b\x11\xf7\xf5RPI\xceU\x0cE\xbc\x1e\
-\xaaR\xa5\xa5\x0a\xbaa\x11w\xbdZ\x18\xc4H\x17\x8c\
-b\x00\xcbx\x8av\xaa)A\x1e\xac\xc5\xb0n\xd1I\
-p\x1f\x95\xdf\xf0\x19\xb9\xb1\xbc\x95\x0c\xfd\x11\xec\xe2\x22\
->61\x9d\xa0\x89I\xcc\xe1#r\xbf\x08Z8\xfa\
-c\x0e\xb5PTJp\x1c\xe7j\xb2\x91J\xd2f\x1d\
-\x8fe\x04\xdb8-\xee\xb9\xb0\xb6\x06\x9e1\x95\x12\xe4\
-\x97\x97\xf0\xd0\xe5\xa7\xb4\xc8Bl\xa2\x96\x12\xa4\xe8`\
-\xa7\xc7\x0cn\xb0\x9f\xb4\xf9\xe3\x83\x5c\xc5\xac\xef\xa7\x95\
-T\xc90\x8es\x5c\xa5\x1e(\x1a)'\x99\x09\xcb\xbe\
-\xe2\x0c\x97\xb1\xba\x830QO+\xa7\xc3\x9b\xc7\x06V\
-1Q2\x9b\xec\x0bo\xa8\xdda\x13SD\x86\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07a\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:49-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:49-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6901c68a-ded6\
--c948-81a4-dcb80\
-3f8711a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:5e4c75bd-e10f-2\
-646-ac37-88f84d6\
-80ee3\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:b07ef20\
-d-5dce-e64f-b591\
--ed693f124a0b\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:b07ef20d-5dce\
--e64f-b591-ed693\
-f124a0b\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:69\
-01c68a-ded6-c948\
--81a4-dcb803f871\
-1a\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:49-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x7fr\
-\xfd\xa8\x00\x00\x01\x16IDAT8\xcb\x95\xd2O+\
-\x84Q\x14\xc7\xf1g\xfe\x10\x86\x9d\x97 +\x93\x84)\
-\xbc\x07+K\x1b\xcc\x18)\x8d\xd9x\x17\xca{\x902\
-\xa6d\xafl\xa4(\x92(e!Q\x9f\xd7as\x9e\
-zL3cf\xf1\xed\xde{\xee\xe9w\x7f\xe7\x9e\x93\
- \xc1\x18&Q\x8a\xb5\x1f%L\xa1\x80$\xc1\x11\xbe\
-\xf0\x80g<\xfd\xc3c\xf0\x8e\xd5\x04\x978\xc6\x0c\xca\
-\xa8`\xb9\x0f\x95\xc8\xbbE3A\x0b\x9bQ\xcaJ\xac\
-\x83p\x86F\x826\xb6\xa3\xb6o\x1cDB\x11\xf9.\
-\x14\xe2\xfe\x22\x15ha/\x82\x0b\xf8\xc1F\x9c\x0b\xc8\
-\x05\xe9\xcb\xb9\x8c\xc0a\xba\xa9Gp\x1a\x9fh\xf6\xb0\
-\x9d\xeb%\xb0\x13\xc1W\x9c\xc4~\x1d\xd7Q\xe2\x0d\xaa\
-\x19W\x7f\x04\xda\xd8\x8a?\xd8\xcf\xbcV\x8e\xff\xa8\xa2\
-\x81\xb5\x88\xe7;\x05Z\xd8\xed\xb0\x9a\x1f\xb6\x84Z\x04\
-G:\x92\x8ba\xb9\x98\x11\xcdusP\xff\xa7u}\
-\xdbx\x9e\x19\xa4a8M\x05\xaeb\x94gcT\x17\
-\xfb\xb0\x14\xcc\xe1.\x1d\xe5\x1a>\xf0\x12m\x1c\x847\
-\xdcc>\xb53>$\x13\x18E\xf2\x0b\xf7\x9f\xf5T\
-W\xcd\x91]\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07Z\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-37-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:01-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:01-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:93f342bc-fac0\
--b441-a250-40878\
-28c61be\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:b7ed1378-1248-d\
-e42-afcf-5f1f6e2\
-edd9d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:ef73d32\
-b-4f98-5f4b-81c5\
--a8379595600e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:ef73d32b-4f98\
--5f4b-81c5-a8379\
-595600e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:37-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:93\
-f342bc-fac0-b441\
--a250-4087828c61\
-be\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:01-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>;\xc9\
-9\xa9\x00\x00\x01\x0fIDAT8\xcb\x95\xd2\xbf.\
-DA\x14\x06\xf0\xbb\xbb\x96Hl\xe84\x92\x0d\x8dF\
-\x14\x12\x85\xe8<\x80B\xa8<\x86N\xb6\x90H$\x14\
-*o \x84\x92D\xa1\xa2\x10\x09\xb1\xb6\x11QH\xfc\
-\x8b\xdf+\xe8\x8cf\x8a\xc9\xcd\xbd\x5c\xc5\xe4\xcc9\x99\
-\xf3\x9d\xef|\xdfd!\x84\xac\xe8\xa0\x8e=\xac%\xb5\
-Z\xfe]Qc-\xc6A\xbc\xe1\x1b\x9d\xb2A\xd9/\
-\x0cZ\xb8\xc0\x22\x1e\xb0\xfd'\x00F\xd1L\x00\xba\x98\
-\xc40\x1e\xb1\x93_%O{\x09Wh\xc7\xbc\x87\xe9\
-x\xbf\xc5Q\x15\x0d\xb6\xf0\x8c\xa9\xb8\xc2<.q\x5c\
-Y\x03l\xe2=\xd2\xfe\xc0~\x99\x13E\xcd}1v\
-\x10pX\xd9F\xd4c\x1c\xc0i\x04\xe8a,\xd6\x1b\
-\xa5\x00\x89\x90\x0d\x5c\xe3,\xee~\x82'\x8c\xa7C\xca\
-\x5c\x18\xc1\x0d\x0e\xd0\x8c\xf7\x09\xac\xe7@Jm\x5c\xc1\
-F\xb2F\x17\xb31?\xc7\xfd\x7f~\xe2\x10\xee\xd0\xc6\
-2^\xb0P\xc8\xa0D\xc8V\xd4`\x17\xafIs\xbd\
-*\x83~|\xe2\x0bs\xa9\xc5U\x01jX\xc5L\x99\
-\x85!\x84\xec\x07\xbb\xca\x09@\xf4\xbe\x9dT\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07\xa9\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:50-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:50-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:091fa540-bd80\
--f849-b1ca-c46e3\
-66d6772\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:2d8c469a-11b9-e\
-d41-947d-be546e8\
-6e72a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:03c5f11\
-1-db72-7447-bff6\
--19e945aee7cd\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:03c5f111-db72\
--7447-bff6-19e94\
-5aee7cd\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:09\
-1fa540-bd80-f849\
--b1ca-c46e366d67\
-72\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:50-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xc6\x8e\
-\x89\xa6\x00\x00\x01^IDAT8\x11\x05\xc11\x8b\
-\x0ep\x00\xc0\xe1\xdf\xfb\x7f_u\x0aw\x97\x15\xa3\x12\
-I\xc9t|\x05\x12\xc3I\x19N\x0c\xcaLH\xb9\x0f\
-p\xb7\x1a\xb8\x85\xe52P(d\xb1I\x06\x86s\x1d\
-\x06\xa1g\xf5\x15<O\x08a \xcc\xb0\x8cu<\xc1\
-\x06Vq\x1a!\x0c\x84B\x98 \x9c\xc5\x16\xbe\xe0\x11\
-n\xe3>\x9ea\x07\xafq\x10a\xa00\x10n\xe2\x1f\
-\xae!\x84\x10\xc2\x02\x1e\xe27\x8e!\x8c\x10\xce\xe2\x1f\
-N\x22\x0c\x0c\x0cL0E\x08\xb7\xb0\x83\x05\x14f\xd8\
-\xc2u\x84\x19B\x08!\x84\x81\xf0\x1ck(,\xe3+\
-B\x98\xc3>\x84\x10\x06\xe61C8\x81m,\x86u\
-l \x84\x1b\xf8\x88\xb0\x0b\xe10\xfe\xe2 \xc2\x1c>\
-\xe3Lx\x82;\x08\xe1(. \x84\xb0\x88+\xd8\x83\
-\x10^\xe0j\xd8\xc0*\xc2@\x08a\x09G\x10B\x08\
-\xe1\x0d\x96\xc3\x03<G\x98!\x1c\xc2\x07|\xc5w\xac\
-#\x0c\x84\xbd\xd8\xc2\xf1\xb0\x84\x9f\xd8\x8f\x10\xde\xe1)\
-\xc2!\xfc\xc2u\x84p\x1e\x9f0\x0d\xe15\x1e#L\
-q\x17\x07\x10\xc29\x5cF\x18\xf8\x86\x15\x14\xc2\x01\xfc\
-\xc1=\x84\x10&\x18\x08a\x82\xf7\xd8D(\x0c\x84\xa3\
-\xf8\x81W8\x85\xdd\x08a\x01\x17\xf1\x0d\x9b\x98\x22L\
-B\x18\x08\xf3X\xc3w|\xc1K\xbc\xc56>a\x05\
-!LP\x08a \x84E\x9c\xc1\x0a.\xe18\xa6\x08\
-a\x82\xd0\x7f\x89q\xec}s\xb5os\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07\xb9\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:53-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:53-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:f8b0d1c3-68bf\
--5542-b7c9-501e3\
-f80c8af\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:379f8861-0020-8\
-54e-b52f-f5f3729\
-24ee5\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:116b983\
-8-262f-ec44-b930\
--b5dc1282da50\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:116b9838-262f\
--ec44-b930-b5dc1\
-282da50\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:f8\
-b0d1c3-68bf-5542\
--b7c9-501e3f80c8\
-af\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:53-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>n\x9e\
-7\xe0\x00\x00\x01nIDAT8\xcb\xa5\xd3K(\
-DQ\x1c\xc7\xf1\xb93(\x99(\x0b\x94\xb2\xf2\x88\xad\
-\xc7Bd\xcb\xce\x0a\xc9,\x94W\x16\x1ek;Y(\
-\xb2\xf0\xca\xc2F\xc9\xfb\xbdQ\x92\xa4\xb0\x10y\x0c\x12\
-YH\x93\x95\x8d\xb2\x1d\xdf\xa3\xdf\xd11\x0d\x16\x16\x9f\
-\x99s\xcf\xff\xf4\xbf\xff\xff\xff\xde\xeb\x8bF\xa3\xbe\xff\
-\xf0E\x22\x91*\xaca%\x8eel`\x02\x990\xe7\
-\x03\xf0\xb4\xfeL\xb0\xa0\x04\x8dhC\xab\xc3\x5c\x87p\
-\xab\xb8\xcf\xe1\xd9\x04Kh\x88\x09\xc6\x9a\xc7 rQ\
-\x86\x14\x9b\xc4\xfc,\xa2C\x1bI*\xd1J\xd4\xbei\
-\xe7\x15'x\xc6\x8e\xe2_\x15\xb4\xeb`\x02\xfc\x8e\x80\
-\xf6\xcd\x1c\xba\xb5N\xc6>F\xdd\x04\xa1?Z0g\
-\x9a\x9c\xebT\xdc\xa1\xc2\xed\xaf@\xfd\x95\xa0XJQ\
-\x88#\x0c!\x1f\xe5(\xc2\xae\xa9\xca$\x98\xc1\x1b\xce\
-q\xa9\xff\x1b\x5cI\x18\xa7\xb8P,\xac\xfdw4\xdb\
-!\xda\xfe\xd2\x90\xaeuP\xd3\x0e\xaao\xf3\xd8\xb24\
-'\x13_\xb7\x15\x98\x04\xb5*\xebXw\xab\x8b3\x87\
-\x11U6\xabd\xd3\xe81\x81M\x1c\xe2\x1a\x9d\xa8\xc6\
-\x13\x86\xd1\x8f>li\x0eyz\xa4{xD\xafI\
-P\x8fU\xbc Cw{\xc06\xa60\xae\xc3\x93\x8a\
-u\xe9\xec\x98\x19\xba[\xe2\x80^\xd93\xcc\xc5\x94\x9f\
-\xa3\x01\x1f\xe0\x1e\x95\xee\xb7\xe0w>\x8e\x1a\xf5\x1fp\
-^,;\xb4l\xb4\xe8\xb1\xda\x98\xf7\xdb\xcb\xe3\xfd\xb0\
-\xfev\xfd\x01?B\x05\x0c\xe5X\x82~\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07z\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:41-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:41-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:bfecb496-cf66\
--f24b-b50a-687f3\
-61521c8\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:f285faba-da22-a\
-c44-a4f3-8f67a1e\
-e7c76\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:9e756fa\
-1-29a6-dd49-b984\
--0545128c4dcf\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:9e756fa1-29a6\
--dd49-b984-05451\
-28c4dcf\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:bf\
-ecb496-cf66-f24b\
--b50a-687f361521\
-c8\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:41-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xf4V\
-IO\x00\x00\x01/IDAT8\x8d\x95\xd3M+\
-DQ\x1c\x06\xf033\x94\xe4\x03\xcc~6\xb3%\x0b\
-%{\x92XX\xc8KIy\x8dhdg#K_\
-\xc2\x944\x86\x22\x96\xbe\x81\xb2\xb0\xb3\x98l\xd4o\xa3\
-leg\xe1\x5c\x8e\x9b\x19Y<\xdds\x9f\xf3\xbf\xcf\
-\xff\xed\xb9\x01\x93\xb8B\x13\xe7\xb8\xf8\x03YL\x1d\x95\
-\x80K\xdc`\x1e\xebX\x8bX\xc7F\xf2\x9e\xf2Kh\
-a3\xa0\x81Y\x84\x7f\xa2\x8e\x9d\x803\xacD\xb2\x0b\
-\xa5x\x1e@\x7f<w\xa3\x80br\xdf\xc4v\x88\xfd\
-\xacF\xb2\x18\x110\x85\x17\x0c%\xe2!\x0ae\x02;\
-\x01\xc7X\x8cd)\x06dY\x16\xf0\x8a\xe1\xdc\xfd\x0f\
-\x812z:\xf4:\x8d\xe7\xa4\x92R^`\x1f\x8f\xb8\
-\xc3}\x0e\x0f\xb8\xc5[\xac\xa4\x9c\x08\x7f\x09T1\x8e\
-Q\x8c%\x98\xc0H\x5c\xdb;\x0e\xda\xcd`\x15\x83m\
-\xca\xef\x8b\x95\x1c&\x5c1/p\x8d\xadd]\xd9\xb4\
-\xabx\xc2Q\xf2q\xe1\xb7\x0a\x1aXN\xd4\xb3!\xcd\
-\xe42\x17\xb4i!5R)\x17\x94\xcf\x9a\x99\xe9\x87\
-\x91\x9a\xbe}\xf0\x1f\x9c\xa2\x96\x19\xa9\x85\x13\x7f\xff\x89\
-\x19\x1aq\xads\x01\x15lc\x17\xb5\xf8\xec\x84\x1a\xf6\
-|\xba\xb4\xf7\x03\xb0\xd9\x00\xa7\xbc\xdep\xf0\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07!\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:44-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:44-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a0a241e1-6ea5\
--094e-aa68-f2db4\
-02b2a1b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:2dc68c26-7185-e\
-04f-a237-229d6f1\
-d0da4\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:b37627f\
-c-1d1b-c44e-babf\
--37a40c064841\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:b37627fc-1d1b\
--c44e-babf-37a40\
-c064841\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a0\
-a241e1-6ea5-094e\
--aa68-f2db402b2a\
-1b\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:44-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x95H\
-\xee\xb3\x00\x00\x00\xd6IDAT8\x11\xa5\xc11J\
-\x03Q\x14\x00\xc0y\xd9\xa7\xc9\x01\x844\x22\x82\x9d\x1e\
-\xc6\xc6F\xb0\xb1\xb1\xb4\x11\x0b\x8f\xe0e,<\x83'\
-\xb0\xb7\xb0\xf9\xa9$X\x99\x90e\xbf\xc5\x16\x221!\
-\xb83Qk5D\xcef\xb3cL\xd1\x22\xecn\x84\
-\xb7\xc45\xae0G\xa3\x97\x08\x9bu\x98\xe0>J)\
-\x89D\xf5ciG\x89\x16\xad\xdfnp\x80\x15\xc2\xba\
-\x8a=<'\x02\x81@E\xe2\x14\x87X\x22\xac\xab\xd8\
-\xc7K\x94R\x0c\x91\xb8\xc59>\xd1\xe85\xb6\xab\x18\
-\xe31\xf1\xaa\xb7\xc0\x08\x15-\xaa\xed\x1a\xbcG)\xc5\
-\x10\x89D\xa3\xd7a\x8c'\x9c`\x81\xb0\xaeb\x82\xbb\
-(\xa5\xf8\xc3\x14ct6\x0b|$\xcep\x84\x15B\
-\xef\x0b\x9d\xedFX$.p\x899R/\x106\xeb\
-0\xc1C\x94R\x0c\x91z\xe1\x7f\xea7\xbdT;l\
-\xef\x03\xa7N\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\x84\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:46-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:46-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:779a4c4f-987a\
--9e4e-9aa6-15709\
-7235bf7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:16add400-8e6d-0\
-944-b4c3-e1372f3\
-74964\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:f2164cf\
-0-7731-cc46-bef1\
--874917901b80\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:f2164cf0-7731\
--cc46-bef1-87491\
-7901b80\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:77\
-9a4c4f-987a-9e4e\
--9aa6-157097235b\
-f7\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:46-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>Q\xb9\
-\xe3\xb1\x00\x00\x019IDAT8\xcb\x85\xd3\xcd+\
-DQ\x18\xc7\xf1\xa1A\xcd\x02e\xa1\xf8\x1b\x94\xb2\x90\
-\xa5\xff\xc0V\xac,\xc6\x8c\xb1`\x94H^\xb2P6\
-6\x8a\xb8vc\xe5]Q\x94\xb5\xe5\x94\x9d\x05\x89\xc5\
-\xdd\xf9\x1b\xae\xef\xc9s\xea\xe7t\xcf\x98\xfat\xcf\x9c\
-\x97\xe7>\xe79\xe7\x16\xb2,+\xa4iZ\xc3\x15\xce\
-\xcd\x858\xc3\x1d\x16\xdc\x5c\x9b\xdf\xe6\xdb\xbe\xe3\x117\
-\x98\xc2\x1c*\xa2\x8cy\xbcc;\x0c\xe2\xff\xb8\xb7O\
-\xfb\xc1<\x8c\x0f\xe2\x0d;\xda\xef\x07\xdd\xdb+\xd6\xee\
-\xd2\x14\xad\xaf3\x16D\x03\xcc\xca\x82vLb\x05c\
-\xd6W\x94 \x1fn\xab\xb1\x0c\xba\xf1\x80\xa6\x15\xf0\x0b\
-\xcb>;{n\xa2\x11\x06\xa8Y{\x0b\xcf\x92\xcd0\
->1$}\xeb8\x0a\x03T\xad}-\xd9\x94\xe4\x94\
-\xca\x12`\x03I,\x83=\xdc\xcb\xe4~\xdb\xce\xc8\x7f\
-\x01\xaaR$\xb7\xe0\x09\xbbx\xc57z\x83-$\xad\
-N\xa1\x0fk8\xc4\x04\xf6\xf1\x82\x01)b~\x00\x7f\
-\xe69\x17\xe9\x04\x07R\xe8$v\x8cE\xbb\x07\x1d\x9e\
-\x04\xe9\x89\xd5\xc0U~\xa6\xd5U\x0e\xb2Y\xc5\xb1\x06\
-\xb8\xb5b\x9d\xe22\xf8\x1a\x95\x1bk\xa4\xbf\xbf?\xf7\
-`\x1c\x8bXB\xdd\x9ey\xea2o\xd4\xad\xfd\x01\x91\
-\x80\x1a\xa3\xcc\x16\x934\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\x85\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:57-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:57-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:d2d12e24-fa11\
--5e4d-a1a8-e569f\
-f071ba4\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ccfe3c9b-2c9c-8\
-54e-b13c-6bdfbd3\
-33a1a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:7de79db\
-e-9fef-944e-8c45\
--9f4fbb5ddab4\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:7de79dbe-9fef\
--944e-8c45-9f4fb\
-b5ddab4\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:d2\
-d12e24-fa11-5e4d\
--a1a8-e569ff071b\
-a4\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:57-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x1b\xf3\
-\xb2\x92\x00\x00\x01:IDAT8\x11\x95\xc1O\x8b\
-Ma\x1c\x00\xe0\xe7=\xe7\xc5\x19\xe6jXX\xb3\x99\
-\x94\xcf &J,\x95O`I\xb3\x97\x05\x0b\xe5;\
-\x98\xa52\x8d(\xa3\xfb\x1dX\xdaM\xc6\xca\xe6\x0c)\
-\x7f\xcam\xba\xba\xf7\xbc\xd4o\xf1\xde\x9ah<O\xea\
-\xfb\xfe\x12\xee\xaa\x92\x7f+h\xf1\x09\x0f3\xee\xa0\xc3\
-s\x8c0\x08\x09\x05\xc9AS\xdc\xc3\xbb\x8c\x82M<\
-\xf3\x7f.\xe3D\x16\x96\x85\xd3\xf8&\x8c\xf0\x0b-\x96\
-\x84\x09\xf6\x85\x0eC\x83\x16\x13\x5c\xc0\x06\x0a\x0a\x1e\xe1\
-\x1a\xd6\xf1\x16\xaf\xf1\x067\x84\x06\xa9\x11\x06\x8c\xb0\xaa\
-:\x87\x15\x9c\xc7\x0b\x5c\xc7&\x1e\x08s\x7f4\xaa\x01\
-\xfb\xaa\x09\xe6\x98\xe1=~`\x8cN\x18\x90\xb2\xd0`\
-\x8a\xb3\xd8\xc6\x0ck\xd8B\x8b\xe3\xc2I\x14\x0b\xb2P\
-\xd0\xe2'\xc6\x98c\x15GP\x90T\xc5\x82,\x14d\
-|\xc1\x86p\x05\xc70\xe0\xab\xf0\x1d\xd9\x82\xacj1\
-R\x9dBF\x83\xdbX\xc2-\xec\x0a\x19\xa5A\xc1Q\
-|\xc4S\xd5+\xec`\x8c=\x5c\xc4\x0e\xd6-\xc8\x18\
-\xd0\xa1\xc7c$\xe1\x89\xea\xa5\x83\x0aJF\x8b\xa9\xaa\
-8\x9c9r\xc6g\xdc\xc7Ut\x0eg\x865l\xa5\
-\xbe\xef\xcf\xe0&\x961 \xf9\xbb\x22d|\xc0\xf6o\
-)\xe1T\xdd\x811\xc57\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07\xa1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:20-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:20-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:48cbe43d-d16b\
--1b4a-9ee0-78ba8\
-cf00a2b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:fa35e8d8-a09d-3\
-74b-8cee-674e32c\
-8c43b\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:fa42b63\
-9-fb27-634c-8fb0\
--b4f2893f50b4\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:fa42b639-fb27\
--634c-8fb0-b4f28\
-93f50b4\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:48\
-cbe43d-d16b-1b4a\
--9ee0-78ba8cf00a\
-2b\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:20-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>rL\
-\xe6\x92\x00\x00\x01VIDAT8\xcbu\x93;/\
-\xc3a\x14\xc6_\xe5\xdf\x90hh\xba\x09\x1f\xc0%e\
-\xa6b1\x1b\x84\xa4.\x133\xa661Vb%a\
-70Y\x84\x90\x98\xcc\x22,\x86\xde\x16\x97\xe5o\x91\
-\xf8\x0a\x9eW\x9e#ON\xda\xe1\x97\xf7v\xee\xe7\xbc\
-!M\xd3@2\x5c\x13P\x06G\xe0\x1c\x9c\x81\x1a\x98\
-\xeb \x1b\xec\xa2\x87\xeb\x12x\x05\x8f\xe0\x04\xec\x81*\
-\xb8\x00up\x0bF\xd5\x88Z\xdb\x01_`]<)\
-\x83\xe0\x14\xbc\x83I3\x12\xc4sT\x9e\x10\x85D<\
-\xf5\xca}\x05\xb4\xc0\x90E\x900\xec\x0d\x0a\x0cp\xdd\
-\x07\x87\x92\xa2\x1a\xbab\x8d\xfe\x0c\x94\x99\xb3\x09Z=\
-\xc6\xc1\x9b\x18\x09b`\x064A>\x1e\x8eY0\xad\
-\x87\x19\x19a\xce5\xf7\x9e\x05/\xa0\x14X\xe1]\xdf\
-\x1e\xf1V\x00?\xec\x86\xde\xdf\x80\xad\xc0>W\x9dg\
-\x15\x5c\x01\x9f`\xd1\xc9\xdc\xc7\xf4\xe3\xe6\x80Q\xa8\x92\
-\x09\xad\xd1{\xc9\xbd\xe78\x17\xc5\xc0\xc7:\xfb\xacB\
-\x9b\xe0\x1b\xcc\xf2\xdc'o\xcb\xe0)\x9e-\xdc;\x0e\
-\x89\xf6\x7f\x15,tP\x8e4b\xfe:\xcac\xe0\x83\
-C\xe2'0\xe3\xce\x0f\xe0R\xff\x82\x09L\x816\x87\
-d\x1a\xf4\x8bR\x8ea7\xa8\xfc_+\xefe\x98\x13\
-\xd6d\x9f\xafY\xed\xa8\xf8lak\xa1\xbb\x85\x9a\x07\
-\xf3`\x9b\x9f\xab\xc8:\xf8\xdf\x1b~\x01\xcb\xb6\xebB\
-\x7fh^6\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07I\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:25-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:25-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a9cc2974-a095\
--dd47-bd4a-d21e2\
-34416b4\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:1bb85f3d-b3aa-f\
-548-be1d-53f6bce\
-3278a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:32cde73\
-b-5f38-2b4b-94e8\
--47e8aaedbb93\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:32cde73b-5f38\
--2b4b-94e8-47e8a\
-aedbb93\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a9\
-cc2974-a095-dd47\
--bd4a-d21e234416\
-b4\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:25-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xfe\xb0\
-\xab\xa2\x00\x00\x00\xfeIDAT8\xcb\xd5\xd3=/\
-DA\x14\xc6\xf1]\xb6#\xd9\x84\x9ef\x85J\x22>\
-\x83b\xf5:\x89\x82J#vC4l#:\x1a\xc5\
-&(5\xde\x0bjQ\x90\x10\xb5F-\xbf\x84/q\
-5g\x93q\xdd\xb5\x12\x95\xe2\xc9L\xe6\x9c\xf9\xe7\x99\
-3\xe7\x94\xb2,+\xa5B\x19\xbb\xb8\xc2\x19Np\x8d\
-\xf9|n\x96e\xa5\xce\xa5a\xaca\x03#x\xc5\x1e\
-\x96\xb0\x80{\x1c\xa0\x16\xe7sy\xc0\x0a\xde\xb1\x83q\
-<`4q\xb5\x8a6&q\x897L\xa4\x80\x16\xf6\
-c\xdf\x87'\xbc\xe0\x0e\xb7\xf8\xc0v\x02|\xc4t\x0a\
-\xd8\xc4Q\x920\x86Y\xd4c\x9d\xc1P\xc4\xaax\xc6\
-T\x1ep\x18\xfb\xfe\xa2b%\xf0\x81\x22\xc0V\x0a\x88\
-g\xe4U\xfe5\xe0\xcf\x0e\xfe'\xa0\xe7/\xf4*b\
-\x0a\xa8\xc4<|S\xc4\x07\x8b\x00-\xb4\x7f\xb2\x9e8\
-\xa9D\xa7~\xe9\xc4\xe5h\xd7c\x5c\xe0\xbc\x8bNq\
-\x13\xb3PK\x01U,\xc6D6\xd0\xec\xa2\x06\xd6Q\
-\xef8\xfa\x04\xf9x\x0c\xe8;\xd5N\x98\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07\xc0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:14-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:14-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:502568cb-4185\
--8849-a4c1-9b007\
-a6bb135\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:f9a52ac7-c57b-2\
-c46-ba5c-0adbd94\
-efc5e\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:b81db61\
-3-ea09-9b47-9ceb\
--2c5d249c6f75\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:b81db613-ea09\
--9b47-9ceb-2c5d2\
-49c6f75\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:50\
-2568cb-4185-8849\
--a4c1-9b007a6bb1\
-35\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:14-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xf9\xd9\
-Q\xba\x00\x00\x01uIDAT8\xcbu\xd3\xcb+\
-Da\x1c\xc6\xf1sf\x06\x89\xbd5V6J)e\
-\xe3:\xd3\xb8g\x9aa\xc1B\x16\x16V\xcaJ\xb2a\
-ic\x81\xa8A,\xc6\xb8\xfe\x016\xa4\xc4F)E\
-\x16L\x923\xc8\x1f\xc0\x8a\xef\xab\xe7\xd4\xeb\x18S\x9f\
-9\xb7\xdf\xfb\x9c\xf7v\x1c\xcf\xf3&0\x00\x07a\x1d\
-C\x88\xe8\x18\xd6\xb9\xabg\xbf\x98\xbfn\xbc#\xa9\x9b\
-\x91B\x85V\xf0\x9f\x00\xa3]!\x83\xban\xc3<2\
-\xd8\xc2\x0c\xaa\xac\x86\xae\x1d\xe0w\xbb\x19\xcf\xe8D\x97\
-\x1a\x8f`\x1c\x1b\xc8a*\x18b\x07\x94\xe3\x12\x1f\x88\
-\xe9\xde,\xd2\x0a\xad\xc1\x0d\x96\xec\x10\xc7j|\x85'\
-\xf4\xa8'Ch\xc1\x9c\xeeO\xa3\x04\xd7X\xb4\x87P\
-\xaa\xc6GX\xc7\xaez`B\xe2*4\xe3\x7fA5\
-\xcap\xa7\xe0\x9f\x80U\xdc\xe2\x0c\xbd\xc8b\x1fQ\xbc\
-Z\x13{\x8c1\x9dW\xe0\xcd,\xbf\xb9\x98\xc4\x85\x1e\
-\xe6\x14\xb2\x8d\x03\x85\xe45\xac>4(\xa0\x1f\xf7\xa8\
-\xf7\xe7`A=\x18\xc6\xa3\x8a\xb3\x0a1Kl~)\
-\xd5&\xb5\xe4Q{\x1f\x18+8\xd5\xe4\x991v`\
-\x07{*~\xd0\xdc\xa4\xacM\x17r\x02[tYK\
-\xb9\xa6\xf1\x9b\x86\x87\xd8\xd4\xb0\xbe\xd0\xaa\xdab\xbb\x07\
-v\xc8(\xceU\xfc\x89\x13\x9dg\xb4\xa9\xf2\xd6pB\
-\xc1\xbd\xee\x07\x99\xa5\xad\xd5\x84&Pi\xd5\xc4\xd5\xbb\
-Dp\x0e\x9c\xc0\x17YH\x91\x8e1\xed\x8b\xa6\xff\x0a\
-]}y>\xb7\xc0\x0b\x1aQ\xf7\x0d\xe6\x95\xff\x97c\
-\x8d\xc1\xb8\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07B\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:19-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:19-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:8e283c98-4aca\
--464c-89f8-12f2f\
-390555c\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ee96bc61-3e27-1\
-a47-88d1-dabb2bb\
-a50e7\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:6bfa220\
-c-e960-e84d-99fe\
--03c94a9ee98e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:6bfa220c-e960\
--e84d-99fe-03c94\
-a9ee98e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:8e\
-283c98-4aca-464c\
--89f8-12f2f39055\
-5c\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:19-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>wR\
-*\xb8\x00\x00\x00\xf7IDAT8\x11\xa5\xc1\xb1J\
-\x95a\x18\x00\xe0\xe7\xfd|;*nA\x04\xb6\xba\x8a\
-\x22\x18u3A\xd7\xe0\xe6\xd6\x854\x9d!\x07\xa7s\
-#NM\xe1zDjS\xa2\xe3\xe1\xff\xdf\x82o\xf8\
-\x89r8\xfa<\xb9\x5c.\xfd\xd1l\xaeP\xa9\x1b=\
-Qb\x07'H\xac\xb0\xeb\xff\x02\x03V\xd8\xc3-\xbe\
-&\xce\xf1\x11?\xf0\x06\xd7h(\x93\xc0\x80=\xec\xe3\
-\x1a\xfb\xf8\x908\xc6\x19\xbe\xe13\xde{\xdc\x11\xe6x\
-\x87\x0b\x9c&V\xd8\xc2\x0c\xa3\xae\xa1L\x1a\x06\xcc0\
-\xe8F\xac\x13\xa1+\x84\xaeP&\xa5+\x84.\x10\xe9\
-\x99\xd23\xa5\xae\xa1\x994\x94I\xc3\x88\x86@ P\
-\x89\xc2\x1d\xee\xb1\xd6\x0d\xfe6\xea\xee\xb1F\xe1\x17\x22\
-1\xc3[\xbc\xc4k\x1cb\x1be\xd2p\x87S\xbc\xc2\
-\x09\x0ep\x95\x98\xe3\x13\xd6\xf8\x8e/(\xff\x0a\x0c\xb8\
-\xc5\x1c7X$.\xb1\xc0\x0b\xdd\xe8q\x81\xd0\xfdD\
-%\x02\x0fx\xb0\xb9H\x14\xc2\xe6\x0a\xf5\x1b\x1e\x98D\
-G\x92\x14\xdc\xee\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\x1c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:36-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:36-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:26ea4c95-664f\
--1d4b-a1a3-b2e4e\
-6216508\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:092f8e32-6eb6-6\
-d48-9779-8e453ac\
-4d913\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:119225d\
-0-f375-9743-9d06\
--cb963bb5207a\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:119225d0-f375\
--9743-9d06-cb963\
-bb5207a\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:26\
-ea4c95-664f-1d4b\
--a1a3-b2e4e62165\
-08\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:36-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd8:\
-Z0\x00\x00\x00\xd1IDAT8\x8d\xed\x92A\x0e\
-\xc1@\x18\x85\xa7\xd4\x0ea\x8d\xd8\xb8\x00\xe1\x06\x96\x8d\
-\x85X\xb9\x19\x11\x89\x8d\x1b(\x12\x12\x823\x88Dc\
-7\xe7\xf0\xc2\x9bd\xf2\x9b\x9f\x0bX|I_g\xe6\
-o\xdf\xd7\x1akm\x0e\x18\xd0\x05K0b\xee)y\
-\xc8\xfc\xc2]\x14\xc0\x19\xac\xc0\x1d\xb4\xc0\x0e\xacEN\
-A\x06\x9a<\x17\x19o\xda\x82\x9bO\xa0\x0cf\xdc\x1c\
-\xca\xd5\xd0\x80<\xe8{\x8b\xb1\x92+\xee\xb0\xab\x10\xf1\
-F\x1bL\xc0\x80\xb9\x03\xa6\x81\x9ch\x0e.\xec\x9c\xb1\
-\xf3\x1elE\xde\x80\xc7\xdf\x81\xee`\x0en\xe0\xa88\
-\x98r\xfd \x1d\xb8\x0aE\xfb\xfem\xeb\x8a\x83\x12\xd7\
-k\xd2\x81?\xc4\xc79I\x02k\x1f\x0e\xfc/\xe1;\
-IE\xe7X>L\x9dL'W\xd9\xf9\xd7\x1bH'\
-c\xd0\xf8R\xd3<\x01\xb9\x1c\xf0\xecm\x1e\x99\x94\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x98\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:34-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:34-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:b86bf133-5ad9\
--1e42-a6fa-c3e38\
-dbadf24\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c18791e8-9d11-a\
-14d-b738-98bf778\
-7e2a6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:9fa91d6\
-9-69c6-e24b-87b1\
--5e70179b2629\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:9fa91d69-69c6\
--e24b-87b1-5e701\
-79b2629\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:b8\
-6bf133-5ad9-1e42\
--a6fa-c3e38dbadf\
-24\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:34-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xe5U\
-\xdb\xf0\x00\x00\x01MIDAT8\xcb\x8d\xd3\xcf.\
-\x03Q\x14\xc7\xf1\xa9Z\xd9\xf8\xfb\x02\xe21\xa4;\xf1\
-\x04\x12\x1b\xffB\xfd\xa9\x10m\xd9\xb1\xb6&\x11\x1b\x11\
-\x89d4\x9d)\x1a\x22\x22\x22\xb5a!v\xc2\x02\xeb\
-\x09\xf1\x10|Ornr\x8c\x8b.>\xcd\x9d\x99s\
-\x7f\xf7\x9e\xdb\x99 I\x92<N\x11!\xc6!j:\
-\xae\xfd\x22\xd6\xfa\xfe\x80\x9f:N0\x8c\x02\xa61\x85\
-y\xccyH\xcd$^P\x94\x80*\x860\x8aAt\
-c\x15\xc1?\xf6\xb1\xe4\x02f0\x80^mgO\x8b\
-Z\xd1\x92\x92\xd5g\x91\x0b\x88uK]\xda\xca\xb5)\
-\xf2\xc9\x98\x80\xa2\x0b\x18\xc7\x9an+k\x0a3\x9e\xc9\
-?\x02\xa4\x85\xd9&VL\x07T]@\xa4'\x1f\x98\
-\xd5\xb7pa&\xfaZ\x8a\xed!\xda\x1d\xc8\xe4;\x9c\
-\xe3,\xb5\x83\x0d\xec\xe8\xb8\x82\x92K\xca\xeb\xcdm<\
-\xa0]\xaf\xafL\x88\x04?\xe1\x1e\x9b8\xb0-\x8c`\
-\x1d\x8f\xe8LmU^\xb474\xd0\xa6\xe17\xf8\x94\
-\xc3\x97\x82]|\xe0\x16=\xa9\xff\xdf\x854\xb4%w\
--u\xcf\xd2\xba\x5c\x84xE\x87\x99\xec;<9\xd4\
-K\xf3\xfc[\x0bcM\xbc\xba\xae\x9dc\x1d\x87.\xa0\
-\xa2\x1fF\xf8\xc7\x97w\xa4+\xd6\xb5wi\xf7]>\
-,\x09\xc8a\x05e\xb5\xecQ\xd6\x9a\x12&\xb0\x88\x05\
-\xf4}\x01 g\x0b\x14\xcc\xbcp.\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07\xa3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:13-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:13-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:7f9351c7-6627\
--a748-b85a-44bdd\
-7a2b003\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:f1e27d6d-e01f-8\
-f41-932d-d4ffc1f\
-cbc40\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e2e3ae8\
-4-b4d8-9c41-b373\
--9dbda9df9cb6\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e2e3ae84-b4d8\
--9c41-b373-9dbda\
-9df9cb6\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:7f\
-9351c7-6627-a748\
--b85a-44bdd7a2b0\
-03\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:13-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd9p\
-\xeba\x00\x00\x01XIDAT8\xcb\xa5\xd3\xcd+\
-DQ\x18\xc7\xf1{\x87\xf1^(YIY`c\x83\
-\x84R\xa2\x94\x9d,\xd5\x8cf\x85\xbc\xcf\x90lf\x81\
-be\xa9\xb0P\x8c\xbc\x0ceeaA\xd9\xb0\xb3\x11\
-%Y\xd8\x5c;+\x7f\x80\xef\x99~\xb7\xae\x9c;)\
-\x8bO\xe76s\xees\x9f\xe79\xcfq<\xcfs\x10\
-\xc5\x1a.p&\xe78F\x9b\xf6\x14h\xfd\xc1\x7f\xe8\
-\xc1'f1\x86I\xc4p\x8bL\xe0\x85\x08\xdc\x80\x5c\
-\x00\xb3\xf1\x03W\x96/\x8c\xe2\x0b\x07(\x0a\xcb\xc0\xa4\
-\xbd\x8e\x0a\x95\xe2*\xdd\x88~k\xc5+\xfaP\x8a\x1a\
-TK\xd4\x048A\x5c\x11]\xdbW\xf0\x80'\xdc\xc9\
-=\x9e1d\xfe<\xc5x\xa0F\xb3\x96\xa3\x04\xc5\xa8\
-D\x03\xba\xd0\x82N4\xe3\x1aI\xb39\xab\xc6\x99\xe7\
-B\xad&h\x1a#*\xb1\x09\x8f\x0at\x89^\xec\xd8\
-\x02\xf8\x19\x0c\xa0\x1d\x8d\x18T\xddq\xad\xc3\xa8\xc3\x11\
-\xe6\xc3\x02\xfc\x85yo\xee\xbf\x01~e\xe0O\xdb*\
-\x12*eCM\xf3{\xb1\xad\xc1\xcb\xe4kbZ\x03\
-\xd6\x8f\x15\x9d\xf9&\xca\xb0\x8cz\x05J\xfa\x1d\x0ff\
-`\x9b\x85\x98\xc6{\x11S\x98\xc1\x1b\xa6\x1d]\x9aD\
-\x9eZM\xd0w\xdc\xe8\xe8\xf6\xb1\x87]t\x98\x0d[\
-\x1a\xd5C\x05\x0b\xca\xea\xdc_P\x15v\x17j1\xa1\
-\xf4RX\x90\x94,\xa1\xdbr\x1bs'\xf6\x0d\xd6\xe3\
-\xf8\xab8Y\xe7 \x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x01B\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
-\x00\x00\x00\x09pHYs\x00\x00\x01\x90\x00\x00\x01\x90\
-\x01!\xf7\xeb~\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x00\xcfID\
-AT8\x8d\xed\x92?N\x02A\x18G\xdfg\x08\xd8\
-J,9\x83\xb10\xb1[\xb8\x007\xa0\xe0 \x1c\x83\
-\xc4sx\x05z\x8d\x9e\x81\x82\x0e\xa8\xe4OB\x1e\x85\
-l\xb213\xec\x06\xb5\xe3%\xd3\xcco\xe7\xcdo\xf3\
-\x0d\x5c\xf9W\xd4\x81:7\xcdJ\x1d\xff<\x135\xc2\
-\x19\xf0\x09\xbc&\xe2\x07`\x12\x11\xdd\xeaf+#z\
-\x04\xee\x81\x1e\xf0Q\x89\xbe\x80\xb7\x88\xd8\xa9{\xe0\xee\
-\x5c\xa1R\xf6\x92\xf9\xc5\x92w\xb5\xa3\x16\xaaM\x84[\
-\xb5\x9f\xc9B=\xa8\xcf9\xe1M\xe2\x5c\x07H\xde\x1c\
-\x11\xe5\xfem\xaePJ\xf8+\x92Ci\xc0\x90\xef2\
-\xf3\xbf\x14.\x80Q\xed\x97\xa7I\x16g\xf2Cnh\
-\x90n\xb8\x06\x9e\xd4v\x22\x8b\xd3Z\xd56\xab4\x18\
-\xab\xcb\xcc\x1b\xdc\xa8\xd3\xc6\xb2+\x17q\x04\x10/\xb4\
-~\xc9\x0aJ\xbb\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07&\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-37-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:58-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:58-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a382612a-e7f7\
--cd4f-843a-09370\
-285e329\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:9e60eb43-d983-8\
-c45-b2f1-34ce24d\
-05976\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:442cbd4\
-6-07e2-0244-8261\
--5eadbd8e0cb6\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:442cbd46-07e2\
--0244-8261-5eadb\
-d8e0cb6\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:37-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a3\
-82612a-e7f7-cd4f\
--843a-09370285e3\
-29\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:58-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd62\
-\x82C\x00\x00\x00\xdbIDAT8\xcb\xad\xd3=\x0e\
-\x01A\x14\xc0\xf1\xd9\xd5HT8\x81\x0e\xb5D\xa2\xf0\
-\x11\x898\x84\x02\x85RD\xed\x00:q\x05\x85XA\
-\xe5\x06B\xacJ\xa3p\x00\x1bq\x0a\xffa'\x99D\
-\xf6\x0b\x9b\xfc&\xd9\x97\xc9\x9b7\xef\xed\x0a\xc7q\x04\
-\xcc\x88\x84\x22\xf4\x97o\xc8%\x852\xaa!\xd4P@\
-LO0q\xde\xcf\x0e6\x8e>\x0ex\xa0\xa9\xae.\
-\x97\x0d\xba\x11\xca^\xa1\xadW`\xa1\xe7\x06di\x86\
-\x07\xd5\xbc\x05\xae\x98\xa3\x22\x03K-\x81\x19\xa2\x82\x12\
-:\xb8\xa0\xffM\x02e\x86\xc1\xaf\x09>*\xf0\xeb\x81\
-\xe1\xeei`\x84\x9b\xaa\xc0\x8a8\x05y\xe0\x19S\x14\
-e`\x8d\xa1{z\x1aI\x0f\xf2\x83\x8bc\x8b\x96>\
-\xc61\xee\xd8\xe3\x14\xc0v\xf7\xd6\xd5\x95\xe5\x92@\x16\
-\xb9\x10\xf2\xc8h\xfd\xf8\xcf\xcf$\x02:\xef5\x8d\x97\
-'\x01\xbb\xe2?FC\x18\xdd\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07\x9c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:18-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:18-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:aa3add2a-248b\
--304e-8635-3c139\
-fee80a7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:fdd18eb9-ab4c-d\
-d43-8fd7-7fb93bf\
-f6a94\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:9f178d9\
-6-cfda-3e42-9b51\
--ebef8fe920fa\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:9f178d96-cfda\
--3e42-9b51-ebef8\
-fe920fa\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:aa\
-3add2a-248b-304e\
--8635-3c139fee80\
-a7\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:18-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xbb8\
-\x8e\x9b\x00\x00\x01QIDAT8\xcb\x85\xd2\xbbJ\
-^Q\x10\x05\xe0\xed\x95(*j#\xa8\xa8)~B\
-\x0a!\xa9\xac\x04\xc5B\xd2\xfa\x08B\xd2\x8ah\xad\x22\
-\xa4\x08B \xd8\x05\x04I\x0c\xc4.\x18\xf1\x82MH\
-\xa7\xe2\x0d,\xc5t\xdfkh\x919\xb2\xdd\xfc\xe2\x81\
-\xcd\x9c}\x995\xb3f\xad\x84\x14\xab1\xfbo\xc2\x1b\
-LFL\xc5\xdd\xc3\xbe<\xec\xc1g\x5c\xe2\x14\xc7\x11\
-/\xf0\x11-\x05X\xca+\x8f\xe1\x16?1\x85\xae8\
-\xef\xc0\x0c\x96\xf0*bg\xd9\xc1k\xff\xbf\xf7e\x85\
-b\xed\xe3\x0e\xeb\x15\xed\xea\xe2/V2:M\x05\xb5\
-\x178\xc3\x06zq\x83\xe9\xaa\x83w\xb8\xca\xa84\x14\
-Cm\xc5\x09\xbeg\x9d,c\xbb\x02\xf8\x84\xafER\
-C\x96|\x8c\xad\x82\xcah\x0c\xba;\xe1\x1b\xe6\xebH\
-\xd9\x1c\xc9?\xeaH\xd8\x1f\x94^&lb\xa1\xa8\x9c\
-\xd0\x86\xdf\xf8U\x07`\x00\xe7\x18I\xa1\xeff\xf1 \
-\x07\xda\xc3QA\xe1mx\xa3+a\x02\xd7h\x7fb\
-\x88\x09\xbb8\xcc\xf6kA=\xe5U\xd6\xb3\xc4\xc6\x00\
-\xca;:\xc0\x0ej\xf8\x87\xf1\x1c`0\x5c\xb8\xfc\x8c\
-\x91\xb6\xc2H\xab\xb9\x91\xaaVk\xc1\xebOXw\x18\
-}\x18\xc2\x07|\x89\xe1\xcd\x86\xb1\x1eY\xb9\x02i\xc1\
-b8\xf3*\xa4\xba\x0e\xd0\xb9<\xb1\x04(\x87VI\
-U\x0b\xcd\x9f|w\x0f\xeb\x9e\xe9\xdb\x8b\xfb\xcdl\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x84\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:16-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:16-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:57ab882f-2293\
--7745-8561-0345e\
-0cc6325\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:78d7e24b-d7c0-0\
-644-8e14-7265336\
-fa849\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c30cac6\
-0-7b60-f34d-9e41\
--cea1708fa189\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c30cac60-7b60\
--f34d-9e41-cea17\
-08fa189\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:57\
-ab882f-2293-7745\
--8561-0345e0cc63\
-25\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:16-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xbeW\
-O\x04\x00\x00\x019IDAT8\xcb\x95\xd3\xcd+\
-\x05a\x14\xc7\xf1q/\xe9\x96\x9d\xcb\xc2J\xb2d!\
-d!y[(\xff\x00\xb7K\x11J)\x97\x85\x8dR\
-V\xfe\x00Y\xb3\xb1\xf1\x9a\x9d\x95\x8d\xf2v\x11e\x87\
-\xec\xcc\x82\x7f\xc2\xf7\xd4\xef\xa9\xd344\x16\x9f:3\
-g\xe6<\xcf9\xf3L\x14\xc7\xf1\x12\xceq\x88.D\
-\xc8#\x97Ad\x0f\x8fb\x16\x8f\xd8T\x81\xcc\xfc\xc5\
-\x1av\x15\x0fb\x18C\x7f\xe8G\xa3=\x5c\xa7\x97\xe6\
-p\x866\x5c\xa2\x8a\xdb\x14w\xb8\xc67\xa6\xa3\xd0\x8b\
-Z\xa9\xfec\xfb\x07X\xb5\xa0F7\xda\xf1\x80\x16]\
-\xe7\x94K\x0a\x0b\x1e\xa1\xe2+\xda\xe4\xef\xd5\x9b\xdf\x99\
-\x17\x16k\xc03\x06\x92\x89\x0bL*\xaeMY=\xef\
-\x86\xfc\x84\xfad\x01\xeb\xab\x92\xa1\xff\x1dl\xfb\xcf\x18\
-\xb6k\xe7\xe0\x13\xfb\xfa\x22\xc7\xce\x09N\x15\x7fa,\
-y\x0eL+&\xa4\x8c\x05g\x1e%\x19G!\xad\x80\
-\x99\xc2\x1ezSre\xe5\xfaB\xeb\xc9\x16\x965\xdd\
-u|\xa0\xc7\xbd\xbc\x82\x17\xe5\xde\xd1\xedw\x10\x86h\
-\xfdm(\xbe\xc2\x8c+`s\xd9Rl'u1\xad\
-\x80\x9d\xf1Wwl\x8b\xae\xc0\x08\xdep\xa3\xe2\xcd\xbf\
-\xcd\xa0S\x7fg\xd1\x15\x0f\x0bt(\xd7\x14r?\x06\
-\x1f\xedS\x9a\x92\x9d\xda\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\xab\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:43-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:43-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:21ceb0e5-83ff\
--e946-b7c9-20055\
-6fd8179\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:4f067970-5608-1\
-549-bb77-47e3b0f\
-47654\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:2e1f975\
-9-76ac-ca42-8e6c\
--c1ff44563115\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:2e1f9759-76ac\
--ca42-8e6c-c1ff4\
-4563115\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:21\
-ceb0e5-83ff-e946\
--b7c9-200556fd81\
-79\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:43-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>vp\
-\xf1\xf4\x00\x00\x01`IDAT8\xcb}\xd3\xcf+\
-\x84A\x18\xc0\xf1y\xf7\xb5\xf9Y.[\x8a\xac\x1c(\
-\x07\xc2\x85rG{A\x91\xd4\xee\xc1\x8f\x08\x17\x07'\
-\x92\x8b\x94v\xcbQ\xc9\x11+\x84\x93\x1f\x07'\x1c\x84\
-?\x00\x85\x1c^\x0e\xfe\x04\x07\xdf\xa9gjL\xb3{\
-\xf8\xf4\xce\xcc\xfb\xcc\xec\xb3\xcf<\xaf\x8a\xa2H9b\
-(\xf1\xac\xfb\xd6\x94o\xb3\x19\x07\xa8FU\x91\x18e\
-\x07\x9bq\x076q\x83;\xdc\xe3\x1c\x8br\xe0\xbfC\
-\xdc\xcdY\xbcc\x07}\x18B/2\xb8\xc6\x0b\x06\xec\
-C\xec\xd4\xf6\xf1\x80\x16km\x0d\xfd\xd6|\x10\xdfH\
-\xcb<4/\x96\xf1\x84\x04\xb6\xd1$\xeb\xe5:\x08q\
-L\xc8\xb8\x07_h5\x19\xd4\xe0\x15\x9d\xb2\xa9\x0d\xa5\
-N\xe1\xba\xf0\x89\x06\x99o\xe0\xd8\x1c0\x8fKyQ\
-\xe1l\x8c\xcb\xf3T\xfe\x8e\xc9\xaa\x19\xcfH\xea\x85-\
-\xacb\x05\xc3V\x81L\xa5\xdb\xf1\x86Z\x99\xe70\x82\
-+\xa4L\xf1f\xe5\x8a\x12N\x1f\xd4\xe1\x04\xeb\xa6h\
-\xfaWQ\x89C\xcc)\x19d<]\x96\x93+\xfd\xc5\
-\x98\xe7\xfd\x1e\x16L\x06\xba\x88\xbb\xb8\xc0\x924\xd3\x07\
-\xca0\x8a[\xd4#\x8f3\x1c\xe0\x073\xfa\x80n=\
-\xc0\xa4NI\x1a\xa7Q\x9a&-\xd7z$i\xeb\x98\
-iLa\x5c\xc7)\xdf\x07\x22t\xc7=\xca\x0d$\x0b\
-\xc5\xd9__(\xcfX\x81\xe0@bB+6(\x96\
-A\xe0\xf0\xc6\xfd\x01\xbd\x06\xe9\x8e\xc4\xe2Y\xba\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x9c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xe8iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59-03:00\
-\x22 xmp:MetadataDa\
-te=\x222020-05-02T1\
-7:59-03:00\x22 dc:f\
-ormat=\x22image/png\
-\x22 photoshop:Colo\
-rMode=\x223\x22 photos\
-hop:ICCProfile=\x22\
-sRGB IEC61966-2.\
-1\x22 xmpMM:Instanc\
-eID=\x22xmp.iid:7cf\
-bfd35-cfb5-4540-\
-9a35-8d6643dc0d7\
-1\x22 xmpMM:Documen\
-tID=\x22adobe:docid\
-:photoshop:ed702\
-725-4e8b-4642-b8\
-90-abf061596496\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:67517559-b59c\
--b849-ac01-51d65\
-8184c33\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:675\
-17559-b59c-b849-\
-ac01-51d658184c3\
-3\x22 stEvt:when=\x222\
-020-03-03T09:50:\
-40-03:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22/>\
- <rdf:li stEvt:a\
-ction=\x22saved\x22 st\
-Evt:instanceID=\x22\
-xmp.iid:7cfbfd35\
--cfb5-4540-9a35-\
-8d6643dc0d71\x22 st\
-Evt:when=\x222020-0\
-5-02T17:59-03:00\
-\x22 stEvt:software\
-Agent=\x22Adobe Pho\
-toshop 21.0 (Win\
-dows)\x22 stEvt:cha\
-nged=\x22/\x22/> </rdf\
-:Seq> </xmpMM:Hi\
-story> </rdf:Des\
-cription> </rdf:\
-RDF> </x:xmpmeta\
-> <?xpacket end=\
-\x22r\x22?>pRd\x11\x00\x00\x01ZIDA\
-T8\xcb}\xd2?(\x85Q\x18\xc7\xf1\xd7\xbd\xfe\x8e\
-\x16\xcab \x83B\x19\xd8\xb8\xdd\xae\xc9\x22J)\x03\
-\xba\x83?\x8b.\xb1\x19,\x06)%\x8b\xfd\x96\x88\xcb\
-%\x13\xa3D\xfe\xc4\xa4\x10\xd3\x9bA\x8cV\xdf\x93\xdf\
-\xd1\xe9x\xdf\xfb\xd6\xa7\xf3\xfey\x9e\xe7<\xe7\xbc'\
-\x08\xc30\xf0$4V#\x8b\x06=\x97G\xc4\x06q\
-\xc9&\xb8\x887\xdc\xa1%\xaeHT\xb2\x19\xcfp\xac\
-\xe7\x05\xbc\xa33\xaaHT\xf2)\x8e\xbc\x99&\xf0\x81\
-\x8c\x9e\x93n\x81R\xc9I\xe7\xfb\x00>1\xe4N\x1a\
-8m\xf9\xc9\x09\xe7\xbeBcFE\xb2n\x07UJ\
-\x8cK\xf6\xb5\x87\xbf\xd7\x8c-\x90\xc6\x93\x13`\xba)\
-s\xd6Y\x8f),a\x19\xcd\xcayD\xa5\x09\xe8\xc3\
-E\x89\x19\xd3j{\x1d\xaf\x1a\x1bqo\xce\x8a-p\
-\xad\xe0Y\x1cbG\xe7\xa0\x15=\xb8\xd2\xf7E\xac\xa9\
-\x8b\x07\xb3|[\xe0F\x01'\xd8\xc3 ^0\x8c.\
-\x5c:\x05V\xd1\xe4\x17\xb0\x1d\x98\xd9Gu\xbf\x8b\x11\
-t\xe3[{\xf0\x8cM\xa7\x83\x7fK(\xda\xdd\xd5_\
-\x19C-V\xb0\x81-\xa4\xd0\xa6=\xf8\xeb\xc0\xaeq\
-\x1f\x93\xba/\xa8@\xd4\xc6v\xe0\xd6\x16Hi\x97\xf3\
-\xf8r\x0eIA\xbf7\xaf\xa5\x1dh\xdc\xc6\xb9\x0a\xd4\
-\x98\xc0:\x8cc\x1e\xd3\xda \xf3\xbeW\xefr\x98s\
-\xe4\xf4\xbe\xdf\x9c\x95\x1f\xb3\x9e\xfb\xbf\x85b\xd4\x1f\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x1c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:58-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:58-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:4f846687-5241\
--364a-a312-f5b8b\
-6ae62f8\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:7b353901-6d6f-c\
-14a-90fc-10a975c\
-d3111\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:472fd15\
-6-d503-a748-8e50\
--6379f310e090\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:472fd156-d503\
--a748-8e50-6379f\
-310e090\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:4f\
-846687-5241-364a\
--a312-f5b8b6ae62\
-f8\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:58-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>f\xd5\
-\xa1\xff\x00\x00\x00\xd1IDAT8\x11\xa5\xc1\xa1J\
-CQ\x18\x00\xe0\xefl\xff\xd8\x06.\x18\xb5\x0aV}\
-\x00\x0d\xf6u\x1f\xc2n\x19\xf8\x0a6_\xc1 \xac\xf8\
-\x00\xbe\x80`\x11L\xc2\xda\xbae\xd79\xcfQ8\xf9\
-\xca\xdd\xfc\xbe(\xa5\xf8\x8fX.\x97\x078D\xb2\x9d\
-/,\x02\xb7\x98\xe2\x15C\xdd|\xe3\x14W\xa1\xba\xc6\
-\x1d\xc6\xc8\xda%U\x83\x07\x0c\x03=\xacU+\xdde\
-\xf4\x02\x05}U k\x97\x90\xb0A\x0f%\x90\xb0R\
-mt\xb7F\x0a4\xb8\xc1\x14C\xddlp\x8e\xa7@\
-\x1f/x\xc4\x1e\xb2vI\xb5\xc6\x11\x06\x81\x01\xe6\xb8\
-\xb7\x9d\x0b\x8c\x02\x05\xfb\xaa\x11\xb2vI\xf5\x891r\
-\xa8>T\x8d\xee\x1a\xbf\x02\x03\x9c\xe1\x1d\x13\x14\x7fK\
-hp\x8c\xe7\xc0\x1b.q\x82\xd0M\xc6\x04\x8b\xc0\x0c\
-3;\x0a$\xbb+?\x0a\x022Y\x22\x09&W\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07u\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:56-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:56-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:1c71e5be-f1f7\
--7c47-b3ef-84c2a\
-75040be\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:2a2c4632-bd88-5\
-743-b2ef-70d0551\
-9e162\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:b226826\
-3-78a0-854a-aef7\
--e821fe049206\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:b2268263-78a0\
--854a-aef7-e821f\
-e049206\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:1c\
-71e5be-f1f7-7c47\
--b3ef-84c2a75040\
-be\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:56-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xbb\xe2\
-2\xc7\x00\x00\x01*IDAT8\xcb\x8d\xd3=+\
-\xc6a\x14\x06\xf0\xff\xf3\xa0Da@)\x1f\xc0b\xa0\
-\xbc\x14ElRfb\xb4\x18}\x00\x22\x9b\x89R\xf2\
-R\x8aA\xc9`\xc0\xa4$oy\x19\x88\x0d\x99~\xc9\
-\xe8\x13X\xce\xa3\xff\xf0\xfc\x1f\xcfpu\xdfW\xe7\xdc\
-\xd79]\xe7>\x09\x92\x0c\xe4K\xc4\xfe\x90\x15\xa8\x88\
-\xb3\x1bw\xe8\x08\x9e+G\xa0\xf0x\x04o\xb8\xc6^\
-9\x02\xb9T\xc2$~\xd0\x87~<\xfe'\x90\x0e\xcc\
-\xe2\x1b\xbd\xc1/\xb0\x12\xf7\xca\xf0&\x9f\x16H\x9b\xb5\
-\x8cO\xb4\x05?\x0ady\x95K\x93]<\xa1%x\
-}\x88M\xa3\x0b\xc3\x18\x0c\x0c\xa1\xa1\xd0A\x0dNp\
-\x8e\xda\x94\x91U8\xc63n\xc2\xcck\x5c\xe2>\xf2\
-[\x13\xac\xe1\xac\xc8\x14\x8aM\xa7*\xfc\xaa\xc3\x07&\
-\x12\x1cb*eR\xb1\x91\xae\xe3=*?\xe0\x05\xa7\
-hJ\xb0\x8f\x99\xac1\x85\x17\xafQ\xa4\x1d=\xe8,\
-\x14Kp\x80\xf1H.\xb4\x98\x8f{\x821\xdc\x96\x9a\
-\xc2\x0e\xae\xd0\x9c\x91\xb4\x84\xedR\xff\xa0\x11\x1ba\xca\
-*\xe6\xb0\x88\x05\xcc\xe3\x0b\xa3Y\x0b\x96&\x03!\xb4\
-\x15\xd8\x8c\xee\xe6Q]j\x1bs\xe5\xaen1\xfc\x02\
-\xb3\xc3\xe3\xb0\x9b\x22\xe5\xa8\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07L\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:14-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:14-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:572d4b19-0ced\
--b94d-8ea7-f7957\
-994873e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e7b9c5d3-6e08-d\
-64c-bd5a-a15a521\
-a7f86\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:efd3b08\
-f-0a37-a442-a7ad\
--bc88790401ad\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:efd3b08f-0a37\
--a442-a7ad-bc887\
-90401ad\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:57\
-2d4b19-0ced-b94d\
--8ea7-f795799487\
-3e\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:14-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x00\x00\
-%\x8a\x00\x00\x01\x01IDAT8\xcb\xa5\xd3=J\
-D1\x14\x86\xe1\xcc\x1d\x07\x11\x1d+W \x16\x22V\
-r\x05+\x1b\xd7 .\xc0E\xd8ii\xa9\x9d\xdd\x94\
-\xb6Vv\x22\x88\xda\x88\x7f\xb5\x85X\xe8\x83\x1b\x10l\
-\xe4Z\x98;\x84\xcc\x8f\x037\xf0A\x92s\xce\x9b\xef\
-\x84$TU\x15\x9a(4\x06\xa0\xc0\x0c\xba\x98\xc5\xdc\
-\x04\xeab\x1aE\xc01>p\x85'\xdc\xe3a\x8c\x1e\
-q\xedo\xec\x04\xec\xe2\x07\xdbX\xc1\x06J\xacg*\
-cl\x09\x87\xf8\xc2j@\xc0~$O\xc5\xf58\xad\
-\xe1\x0d[\x08i\xa0\x87\x9b\x04\xd2F+\xaa\x13\xf7\x96\
-\xf1\x19]\x07\xb4CL\xa8!\xe78K\xd6\xadx\xc9\
-\x01\x0bx\xc5^r@\xdfA\x91\x14\xdd\xe1$\xcek\
-7\x1d<\xe3(\xcfO[\xa87\xe7\xf1\x82\x83$v\
-\x89\xd3\xcc\xd9\x00\xa0o\x0b\x8bx\x8f\xbd\xf6p1\xac\
-x\x18 \x85\x94\xf8\xc6m|4y\xab#\x01i\xe2\
-ft\x93\x82'\x02\xe4\xa7\x15\xa3\xf2\xfe{4E\xde\
-\xf3\x00\xa0\xe9o\xfc\x05\xaf\x92\xe5\x8f\x8dJ\xf5]\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07Z\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-34-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:42-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:42-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:40fecee1-2ba8\
--284d-a984-3b415\
-21705dd\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:62d5360b-3149-2\
-640-afa0-7c7b693\
-41dcf\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:0d6613f\
-f-00b3-c344-a839\
--c150e78dfe81\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:0d6613ff-00b3\
--c344-a839-c150e\
-78dfe81\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:34-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:40\
-fecee1-2ba8-284d\
--a984-3b41521705\
-dd\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:42-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x0c\xfc\
-\xb0\x8e\x00\x00\x01\x0fIDAT8\xcb\x8d\xd21+\
-\xc5Q\x18\xc7\xf1s\xefU\xc8BI\xcap\x07eQ\
-\xcaB)\x1b\xbb\xbb(\xb7\x8cda\x90w\xa0L^\
-\x80\xd9\xc0\x0bPR\x06\x93\x91\x92\x8dE\xa9OJ\x06\
-\x19\xac\x06\xe7\xd4\xe9\xf4\xbf\xf7\xfeO=\x9d\xd3\xf3\xf4\
-|\xcf\xf3\xfc\x9e' \x14\xd6\xc8\xdek8\xc59\xce\
-\xb0\x83\xe1\x18k\x22\xf4J\x1e\xc1\x05^b\xe2!N\
-p\x8f',%H\xa8\xa8 \xe0\x0a\xd7\x18\xad\x88\x1d\
-\xf8?\xf3e\x05\xadx\xef\xc5_r\x7f#\x96\x9c*\
-<\xc6MU\x0b\x01w\xd8\x8a\xef\xa1\x1e-\x8e\xe3\x0d\
-\x0be`2\xfe>W!hi\x97\xe8\x94\x80i<\
-`\xb6\x06`\x02cU\x80\xc7\x9a\x80\x904hf\x02\
-\x96\x80V\x9aw?@n% \x0c\xaa$`\x15+\
-\xd11\x135H\x22.b\xbd\x1f$\xa0\x83O,\xc7\
-5}\xc6\x14\xda\xf8\xc0n\xbe\xba\xbdZ\xd8\xc6;\xba\
-\xb8\xc5\x06^q\xd4/9\x171A\xbe\xf1\x85\x9f\xb8\
-\xb2\xa1\xae\x88i\x0a\x9b\xf8\xc5~\xe1\xaf5\x85$R\
-{PRn\x7f\xbb\xb8\xd6\xc0\xab\xb97\xbc\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x07o\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:01-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:01-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:def88b3f-68d3\
--3440-b249-e38d8\
-25076b4\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e166ec98-28a2-f\
-848-a37c-a77ef69\
-ca39c\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:7d26aa5\
-0-1b68-aa4c-8131\
--0d603443bb01\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:7d26aa50-1b68\
--aa4c-8131-0d603\
-443bb01\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:de\
-f88b3f-68d3-3440\
--b249-e38d825076\
-b4\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:01-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>:\x92\
-@\xa8\x00\x00\x01$IDAT8\x8d\x8d\xd2\xbd+\
-\x85a\x18\x06\xf0\xc7!\xca\xec+\xab\xa4\xec\x14\xa5\xfc\
-\x03&2+)\xa5c3\x19D\x06%\x83\x92A\x16\
-\x83\xc1 \x06l\x06\x19\x14ER\xf21Y~\xf93\
-\x0c\xe7yxz{\xcf9\xde\xba\xea~\xef\xfb\xba\xbf\
-\xae\xe7\x0e\x08\xa8D\x84\x7f\xa2\x0d-\x08\xa1\x90\xd8\x8f\
-i\xec\xe1\x04\x178\xc7160\x81\xce\x8c_I\xc6\
-(\x8e\xf0\x81kl\xa3\x8a9\xccc\x05\x07x\xc23\
-\xd6\xd1\x95&X\xc5\x1bv0\xd0d\xf4vL\xe2\x12\
-\x0f\x98\x091y\xb9d\xc76\xb4F$;\xe7\x5c\xe3\
-4`\x06\x9f\xe8\xc9\x04m$^\xc0l\x5c\xb77\x05\
-\x0eq\xd6\xa4@\xf2\xf7\xe1\x0bSI\x83\x80\x0e\xbcb\
-1\xfe\x17\xc7\x0d\xe9\xd9p\x85\xfd\xc4\xcb\xc9\xe3j\xdf\
-`\xc9$\x89S\xc5K\xb6JK\x91\xb0\x89\xdb:\xa3\
-\x0f\xc7\x06#yN\xd9\xaewjG\x93\x8b\x16p\x8f\
-\xb5\xe2\x8ae\x9d\x86b\xa7\xb1,\xb6\x85\x9b2q\x8b\
-\x8eTy\x09\xef\xd1\x1e\xc3\xb7\xbf#\xab4*\x90\xab\
-}\x1a\xf1\x88\x85z\xaf\xd3\xa8@\xb7\xda\xb9\xee\x16\xfc\
-M\x0b\xe4\xe4\xf6:\xf1_\xfc\x00<\xd5\xdd\x9e\xbd\xe2\
-)\xda\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07I\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-34-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:41-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:41-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:0917e609-7cd4\
--3a44-97f2-b8b75\
-1d12b80\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:bcfd2d87-443d-8\
-047-8222-ae98ab4\
-3060f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d98d70e\
-a-cd21-f64d-a678\
--9f2b42512c48\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d98d70ea-cd21\
--f64d-a678-9f2b4\
-2512c48\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:34-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:09\
-17e609-7cd4-3a44\
--97f2-b8b751d12b\
-80\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:41-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xaf\xe3\
-l\x15\x00\x00\x00\xfeIDAT8\xcb\x95\xd3?J\
-\x03A\x14\x80\xf1\xd9M\xd0#\x88`!i\xc4\xc2^\
-\xb0\xb5\xb5\xb3\xd1BD\xa2\x89X$\x9e\xc1\x8b\x88B\
-0\xab`\xe1-\xb4\xb3\xb4\xb0\x11~\x95\x9eA\x9bY\
-\x19\xc6I0\xc5\xc72\xc3\xdb\xef\xed\xfb\xb3\x01!R\
-\xc5\xe7\x06nq\x8f)\x9a\x02S\xdca'\x14\x04+\
-8\xc1\x00\xa78+p\x8c7\x8cSA@';\xcf\
-\xe3\x06\xa3\xf4\xa2\xceDU\xbc\xcbi\x934\xa9\xa0}\
-\xf9\x08\xbb\x05a\xa9\xd4\xa6-\xa1\x0d\x1c\xe0\x13\xdb\xd9\
-W\xa4\x14\x05!6\xe5\x1d\x9b\xff\xa8\xfd\x8f`\x1f\xdf\
-x\xc15\x1e\xf1\x90\xd0\xe0\x09WXJD\xbf\x82-\
-|\xe0\x19\x07\xe8\xc7\xf1\xb5\xf4q\x8e=tK\x82\x80\
-\x1e^c\x1f\x16.\xa1\x9bl \x1c\xc6\xf3rld\
-'\xc6\xd4\xf3\x9a\xd8\xcev\x0d\xebY`\x9e\xbd(\xc8\
-\xe7^\x17FX%\xcbU\x14\xcc\xca:\x8bI\xbe\xca\
-\x8b\xfc\x8d\x13|aX\x12\xac\xe2\x02\x97\x18a\x5c`\
-\x84!z?\x11{\xeaL\xcaP\xf8|\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07\x7f\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:26-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:26-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:cece560c-13c3\
--a547-a5da-7ada6\
-8636abb\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:3198274e-dd45-9\
-14b-861e-9c885c0\
-0f041\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:39a9919\
-3-0208-4c4c-9d2a\
--0dc2c2b32955\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:39a99193-0208\
--4c4c-9d2a-0dc2c\
-2b32955\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ce\
-ce560c-13c3-a547\
--a5da-7ada68636a\
-bb\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:26-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>{\xa3\
-Q!\x00\x00\x014IDAT8\x8d\xa5\xd2\xbd+\
-Eq\x1c\xc7\xf1sYp\x22O\x8b\x141Xd\xb9\
-\x9e\xb2\xc9\xc3jR\x06\xb1H\x14E\xd7\xe8_`!\
-\x1bI)\xce\xbd\x18X\x8d\x14\xc5\x82\x84L\x86\xf3\x1f\
-\x98\x8f\xf77\x9f\xdf\xedWN\xe90\xbc\xee\xf9\x9eo\
-\xdf\xf3\xe9\xf7p\x83$I\x82\xff\x08\xe28\xaeG\x1e\
-\xbd\x19\xf4\xa1\x1b\x95\x16\xb0\x8dO\xdc\xe3\x09\x8f\xde\xd3\
-\xe7\xf7\x1e\xf4\xcd\x84\x05\x94\xb0\x0c\xabk\x11\xa2\x0a5\
-\xa8\xd63T\x1dJ\x0e\xa7(\xd8G\x11\xe6\x14\x90\xc5\
-1V\x5c\xc0\xa2\x9a\x1d8\xc73.\xd0\xa0U\x1d\xa9\
-w\x89.\xcd\x9e`\xd5\x8a\x22\xe6\xd5\xbc\xc2\x01\x060\
-\xa9\xadD\x0a\x1bT\xafI\xb3E\x17`I\xd3\xe8\xd1\
-\x01\xf9\xcbl\xc3\x1b\x1aS\xb6\x10\xb9\x00;\xc4Y\xb4\
-\xe2\x1d\xed\xdeP\xb3\x02\xfaS\x02\xca+\xb0bA\xcd\
--\xbcb\x03{\xba\x81\x02>\xb0\x89}tj\xb6\xe4\
-\x02\xfcC\xac\xd0\x8d\xecb\x0du\xeaO\xa9\xb7\x8e\x16\
-\xef\x10\xcb\xb70\xf3\x87k<t\x01g\xd8\x89\xbf\xff\
-\xa2#\x18\xf3\x0c\xcb\xa8\xde\xc753\x84\x1b\xb7\x85%\
-\xbc\xe0ZMs\xeb\xd5i=\xab\xef\x90\xcf\xba\xec\x1f\
-\xec''~\xfd\x1b7\x1b|\x01\xe8T\x00\xb0!}\
-\x11\x0c\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07M\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:52-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:52-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:cacc91ae-fbba\
--df42-baea-899bd\
-b2018e0\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:3b9f278d-2452-c\
-d41-8edd-d22676a\
-bbef3\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:33bccc7\
-b-7401-3c40-a16c\
--072b4595cd3d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:33bccc7b-7401\
--3c40-a16c-072b4\
-595cd3d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ca\
-cc91ae-fbba-df42\
--baea-899bdb2018\
-e0\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:52-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x92u\
-\x1ek\x00\x00\x01\x02IDAT8\xcb\x9d\xd3\xbfJ\
-\x03A\x10\xc7\xf1\xcd]\x04\xf1\x1f\x01\xedD\xdf\xc0.\
-\xea;\x08\x16\xb6\x96\xb6\x96\xb6\x82H\xacRj#\xa2\
-\xadX\x88\xa8\x85\x95MJQ\x0b\x15A\xac\xac>\xaf\
-`%\xb1\xd9\x83\xe5 \xe7\x9d\xc5\x17ffgvw\
-~\xb3\x1b\x10\x1a\xb0\x86\xe9hg\x08\x01\xad\xe8T\x91\
-\xc7\xa2K\xdc\x17\xc5\xc8B\xc3\x1b\x04\x5c\xe0\xba\xf0\x03\
-6\xd0\xc7\x1e\xf6+\xe8a\x17\x07\xf8\xc1\x0d\xc6\x03\xb6\
-p\x8e\x13\x9cVp\x169\xc27^\xd1\xf9O\x0b=\
-<\xa0\x93\x8a\x98G\xda\x89hy)\x1ep\x8c\x0f\xcc\
-\x96El%'\xe4\x15\xa7oc>\xcd+\x17\x1f\xc6\
-\xa4\xbf6\xca\xd2)\xa4\xc5\xefXh\xa2Ia\xf4\xf1\
-\x89\xc5\xe8\xcf`\x12S#(\xd6\xda\x01\x9b\x18\xc6\xb1\
-\x0c\xf0\x82'<W\xf0\x887\xac\x07L\xc4'\xfa\x85\
-U,a\x05],\x8f\xa0\x1bs\xe6\xd2~\xaep[\
-\x12\xb5\x96\x06Y\x12\xb8\xc3N\xb4\xc7j|\xb2P~\
-\x07Y\x14\xb0\xf6\x0d~\x01\xf6\xa4\xe1\xe7\x0b\x84\x86*\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xb1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:40-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:40-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:24425a1a-91e5\
--6a48-a8b9-eb4d8\
-3a69869\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:d0eb71d8-27bd-6\
-14f-ab1f-2021ad1\
-1a98e\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:3a5f818\
-6-ddb4-3345-b349\
--698e07db3090\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:3a5f8186-ddb4\
--3345-b349-698e0\
-7db3090\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:24\
-425a1a-91e5-6a48\
--a8b9-eb4d83a698\
-69\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:40-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x962\
-O\xc4\x00\x00\x01fIDAT8\xcb\x95\xd3?(\
-\x85Q\x18\xc7\xf1\xd7\xbd\x97R&e0Q\x942(\
-\x92,\xca\x86\xc5L\xc6\x1b\xba\x85{\xfd\x1b\x0c,\x16\
-%\x8bl\x84A\xd7\xdf\xb0H\xc9\xa2d\x90\x08\x83(\
-\x7f\xa2n&\xa5\xec|\xcf\xf5;\xf5\xf4\xf6\x1a\xdc\xfa\
-\xf4\x9es\xde\xe7>\xef9\xcf9'\xc8\xe5rAH\
-B\xcf\x22L\xa1\xcb\xbc\x8b\x87\xe3m\xa7@\x5c\xbb\x1e\
-\x978\xc5\x0d\xd6P\x1c\x95$*s\x06\xef\x98P\xbf\
-\x04\xdbx@\xab\x89\x8b\xf9\x041\x0d\x94\xe1\x00\xb7h\
-\xb4A\x92\xcc\xfd\xfe\xa6m\x12\xdfh\xc3\x1b\x16\xcdl\
-\x12fi>Q5\xceq\x82\x0a?\x037\xe5/\xb4\
-\x87\xa7\x17b\x979\x87\x0f4\xb8\xce:\xbe1\x10\x11\
-\x1c7\xc9\xfcX\xa9\x8a\xea\xfe\x93\x0c\xd4\x99\xc11\x8e\
-T\xb4\xe0\x0f\xcdx\xc6\x02v1\x14\xa8\xc2=\x0ap\
-\xb3yD\x9d\xce\xc1<\x06\xf5\xae\x17\x9f\xe87\xb1\xc3\
-\xae\xb1\x89\x94\xf9JJ5\xb9\xc3!\xce\xf0\x8a\x17\xd4\
-\x988\xf7\xe1\xb4kl)\xbbk\x97c\x09\xf7\xe8\xd6\
-X!f\x950m\x0e\x9bK\x90\xf1\x09\xdc\x1ewj\
-+\xb3*T\xb8\xf2M\xb8\xc2\x05jU\xbb\xfc\x12\x96\
-\xb5\xb6ktD\xdc\x89\x98i;\x93x\xd26\xe6w\
-!\xabY\x04\xffP\xa9\xa3\xdd\xe7:\x1b\xba0\xab\xd8\
-\xd7\xdav\x22\xf8\xf1=\xac\xe8\xbe\xa4\x5c\x82\x16\x8cc\
-\x14#z\xfe\xc5\xbf\x1f\xd3\xc1\xab\xfa\x01\xec\x9d\x02\x0a\
-*RH\x9c\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\xb6\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:27-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:27-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:8444d4fb-1cd2\
--e94a-b082-e3d90\
-0b05953\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:221f40b1-0fe0-c\
-e43-a15c-2e2a24c\
-bd3ca\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:897c42f\
-b-aaaa-474f-b4ec\
--91cdb84c1820\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:897c42fb-aaaa\
--474f-b4ec-91cdb\
-84c1820\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:84\
-44d4fb-1cd2-e94a\
--b082-e3d900b059\
-53\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:27-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>us\
-\x22B\x00\x00\x01kIDAT8\xcbu\xd3\xbb+\
-\xc5a\x1c\xc7\xf1\xe3\xe78.\x0ba0\x18\x18\xc8\xad\
-\x94\x14\x8b\x92\x8c\x16\x93\xc9mpM\x06\xe7,\x06\x92\
-\xc9@\xa7,.\x93r+\x97$\x8b\xdb`\xa2\xe4R\
-\x06J\x91\x94\x93\xc8?`\xf2~\xea\xf3\xabo\x8f\xce\
-\xf0:\xbf\xef\xf3;\xcf\xf3\xfd}\x9f[$\x95JE\
-$\xc3\xc4V'\xd6\xb0\x85\x1e\xff\x7f\x7fp>fq\
-\x8cETbEq\x1co\x98\xb7c\xec\xe0\x02\x5c\xe1\
-\x04CX\xc7\x0b\xca\xcc\x17K\xf1\x81\xfa0\x89\xfb\x89\
-\xaa1\x83\x0b\xaf\xc4el+\xce\xd2\xf3\x10\xfd\x8a\x03\
-[\xc1.F\x15\xe7\xe9\xd9\x8c[d\x9b\xa4\xae\xdf`\
-\xba\x04\x03\x8a\xc3\xaa\x1aq\x87\x1c\x93`GS\xfc\x97\
-`\xcf$\xc8\xd4\xb3\x01\xf7\xc8U\xdbU\xf2\x84v\x9b\
- \xec\xbc\x84Uo\xbec85_\x1f\xc7\x91\xbf\x0b\
-\x81^T\xe1\x01\xd5fK\xdd\xfc;L\x82G\xec\xdb\
-\xb3c\xa7P\x84\x1f\xcc\xa9\xdd\x8b_4\x99\x0158\
-\xd3\xba\xd4\xda\x83\xd4\x8dw$Q\xa8w1\x95\xfc\xa5\
-\xc3e\xb7w\x1a\xaf(q\x8d.|\xa2\xcdt\x08L\
-\x5c\x81gLy\x0b|\xee\xb63\xa23>i\x16/\
-0\x8b\x14S\xdc\xaa\xb2\xa3&\xb1\xbb\x1f\xf10A_\
-\x9a\x8b\x14\xaa\xc35\x8a\xb1\x80\x03|c8L\xe0\xce\
-\xfc\x86\xce\x82o\x13\x97\xb8\xd1}q\xb7sD\x1f-\
-w\x09Z\x90\xc0\x84\xc4\x8d\xf0]B\xdb\x19\xf8\xd5\xfd\
-\x01\xeb\x7f\xf6f\xca\x93B\x96\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07o\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xe8iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-37-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58-03:00\
-\x22 xmp:MetadataDa\
-te=\x222020-05-02T1\
-7:58-03:00\x22 dc:f\
-ormat=\x22image/png\
-\x22 photoshop:Colo\
-rMode=\x223\x22 photos\
-hop:ICCProfile=\x22\
-sRGB IEC61966-2.\
-1\x22 xmpMM:Instanc\
-eID=\x22xmp.iid:a33\
-592e3-4c96-8942-\
-a543-392bef8a7cb\
-f\x22 xmpMM:Documen\
-tID=\x22adobe:docid\
-:photoshop:cb9cd\
-370-24ec-8e4c-9b\
-b7-a0a9032e1c71\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:517fc3d6-5ed2\
--6c40-86a1-15236\
-034be83\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:517\
-fc3d6-5ed2-6c40-\
-86a1-15236034be8\
-3\x22 stEvt:when=\x222\
-020-03-03T09:50:\
-37-03:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22/>\
- <rdf:li stEvt:a\
-ction=\x22saved\x22 st\
-Evt:instanceID=\x22\
-xmp.iid:a33592e3\
--4c96-8942-a543-\
-392bef8a7cbf\x22 st\
-Evt:when=\x222020-0\
-5-02T17:58-03:00\
-\x22 stEvt:software\
-Agent=\x22Adobe Pho\
-toshop 21.0 (Win\
-dows)\x22 stEvt:cha\
-nged=\x22/\x22/> </rdf\
-:Seq> </xmpMM:Hi\
-story> </rdf:Des\
-cription> </rdf:\
-RDF> </x:xmpmeta\
-> <?xpacket end=\
-\x22r\x22?>fta\xae\x00\x00\x01-IDA\
-T8\xcb\x85\xd3\xbf+\x87Q\x14\xc7\xf1\xeb\xfb\xa5d\
-\xa3d\xb6\x180\x88I\x12V6e\xf0'\xd8\x0c\xb2\
-\xca\xc6\xa0\xef`1\x99,\xca \x93b\x91\x92_}\
-C\x92\xc5 \xf5\xca_`\xb6\x9c\xa7\xee\xf7\xe9y\x18\
-n\xcfy\xce9\xf7s\xde\xf7\xdes\x12R\xb6\xba2\
-{\x10s\x98\xaa\x89'\xa4\xaa\xcd\xbd8\xc0+n\xf1\
-\x886V\xaaDRI\xb1\x1bW8\xc3h\xf8\xfa\xb0\
-\x8a/\xac\x85\xafQ\x16(\x1c\xdb\xb8\xacA\x9e\xc6\x07\
-\x86\xf3X\x99\xe0\x01\x8ba\xf7d\xfe\xc2>\xc5FF\
-\xdb!0\x10\x02\xa3\x15\xd5\x0b\xc2=\xb4\xca\x02E\xe2\
-\x10\xee1\xf2\x87\xc0.\xf6\xeb\x08\xfaq\x87\xb1?\x04\
-ZA\xd1!\xd0\xc8.\xe9=\xde?\xa1\x19\xb1F\x91\
-\x8cu\x5c\x94\x9f\xb1\xa8t\x82\xadr\xa3T\xac6\x96\
-\x0a\xb2\xc2\xb9\x80\x1f,\x07\xc9tt\xe1|\xc4f0\
-\x8b\x09\x1c\xe2\xa5\xdc\x07sx\xc2MT\xf8\x8e\xef}\
-t\xe3\x07>q\x1dy\xc7q\xc4T\x87\xf9\x86\xc9\xec\
-\xff\x08;U\xb9\xe5Yhf\xef\xfd\x1cd\x9bA0\
-\x9e]nW\xdd,\xa4,i+\x1a\xeb<\xce\xdf1\
-\x03\xff\x09\xe4B\xb5\xa3\x8c\xf4\x0bB\x91\xe0c(\x84\
-j\xa4\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07k\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:58-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:58-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:5d15c02f-5322\
--5f4d-b2ac-d2a72\
-9880a94\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:98ca12ed-c366-c\
-24e-ac49-f70f5b7\
-98d09\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:20c9438\
-c-2aea-6749-9401\
--a748428197e1\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:20c9438c-2aea\
--6749-9401-a7484\
-28197e1\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:5d\
-15c02f-5322-5f4d\
--b2ac-d2a729880a\
-94\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:58-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x82\xce\
-\xc3G\x00\x00\x01 IDAT8\xcb\x8d\xd2\xbf.\
-DA\x14\xc7\xf1a\x17\x85B!\xab\x15\xadw\x90\x8d\
-\xb0*\x15\x96V!\xdeA\xa7\x12\x1a\xa2$$*\x89\
-x\x00\x1d\xa1\x13\x85\xc6\xbf\x0e\xcd'A\xeb\x014\xe7\
-\xca\xb8\xb97\xab\x98\xcc\xcc\x99\xf9}\xe7\x9c\xdf\x99\x84\
-\x84\xbe\x98\xcb\xa3.\x9e\xd0\x8f\x94\x07\xba\xb8\xc4\x1d\xae\
-\xb1\x1a\xf1!l\xe36\xce\xce1Y@\x0a\xf1&^\
-\xb1\x8ev\x88\x9fq\x8c+\x5c`\x1e\xd3\x01\x13\xf7R\
-B\x07\xef\x18/\xa58\x82\x07\x1cT\xa4\xbf\x8a\x17\x0c\
-'\x1c\x065a0jkf\xfbB\xd4D#\xf3\xe5\
-\x06\xcb\x09gX\xcb\x8d\xa900_7b>\xc1F\
-\xc2\x0eN\xb3WR/\xe7#\xb3'\xb4\x13&\xf0\x86\
-\x95\x1e\x90<\x8b\xa30\xf6\xb7\x8d\xb3\xf8\xc0b\x0d$\
-\x17\xef\xe3\x11\xa3\x05\xa0\xa8\xa9\x83/,\x95 \xb9x\
-/\xda;V\xfe\x07\xcd\x0c\xf2\x99A\x062\xf1n\x88\
-[\xb9\x99\xa9\xd4\xa6\x1c\xd2\xadx\xb9U.\xb1lT\
-q0\x17\xe5,`+\x1coU\xf9S\xe5vqa\
-\x06\xdf\xb8\xaf\x13\xd7\x01\xf2~OE\x9bk\xdb\xfb\x9f\
-OS^\xff\x19?J`\xde\xc8\x9b\xcf\x02g\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x9f\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:01-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:01-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:be37167e-4151\
--b240-b56c-cc43b\
-ece044f\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e34b6d77-9a4d-7\
-14d-8812-ad1f09b\
-86a4d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:9e72c47\
-0-3934-bc4b-95df\
--3540129ad66f\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:9e72c470-3934\
--bc4b-95df-35401\
-29ad66f\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:be\
-37167e-4151-b240\
--b56c-cc43bece04\
-4f\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:01-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x06\xd9\
-\xb6\xfa\x00\x00\x01TIDAT8\x8d\x8d\xd2\xbbJ\
-\x03A\x14\xc6\xf1h\x12\x83QAlm#\x1a\xa3\x85\
-\x18/XY\xf8\x04>\x81\x85`\xa7\x90*\x22*^\
-j\xb1Q4\xdec\xe9\x03\xd8\x09\x16\x8awAH\xc4\
-6\xeav\xb6\x166\xeb\xff\xc8\x198,\xbb\x98\xc0\x8f\
-\xd9d2\xdf\x9c9\xb31\xdf\xf7c\x9e\xe7\xa5\xd0\x82\
-\xd6:\xa5\x91\x90\xb5\xb2\xb8\x09\x17x\xc5=\x1e\xf1\x84\
-g}\x0e\xba\xc1\x07\x96\x5c\x80\xa4U0\x85>\x8cb\
-\x00\xbd\x18\xc6\x10\xf2:\x8e\xa1\x07\xc78t\x01R\xfa\
--\xb2\xf2\x83\x1e\xa9\x1d\x13\xee{\x10s\xf3(\xd9\x80\
-;\x8c\xe8d\x07.\xe1c\xd6,j\xc0\x8c>\x17\xb1\
-o\x03\xe4lY\xc4\xf5\xec;\xe8\xc7'\x0a\xbah[\
-Cw\xb1n+h\xc3\x15\xc6u\xe7\xb2\xd9UB\xde\
-\xb4\xc2st\xe2L\x836\x5c@\xb3v\xfd\xcb\xa5\xea\
-\xe2\xa4\x8e\xd2\xb4o,\x9a\xb9\x07\xa9\xd2\x05$\xf1.\
-\x9d\xb5\xe7\xd51\xaec\x17jr\xf6\xb0\x1e\xa4\xb5\x07\
-9\xbb\xc8\x84\xb9\x10\xb9V\xf9Lc\x0e\x07\xc1[\x18\
-\xb4\xbbG\x84\xe4P\xd5j6m\x80\xbc\x81y\xfdS\
-\x02\x8d!\x5cO\xba\xf1\x83-\x1bp\x8dL\xd4\x8b\x13\
-RQA\xae\xd3\xde\x824\xb1\x8c\x05\xacb%\xc2\x9a\
-6\xf0\x05'.@^\x9ee\x1caO\xba\xfb\x8f\x12\
-N1\xf9\x17Po\xd9Q~\x01yB\x14\xderg\
-\x85\x96\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xa1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-34-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:41-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:41-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:ef3af498-e399\
--0942-91aa-e641c\
-f1f7e4e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:154cd6bb-bfcc-f\
-049-bc52-8169c48\
-8f52d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c41b965\
-7-fccb-7149-9d39\
--d4a090c527ce\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c41b9657-fccb\
--7149-9d39-d4a09\
-0c527ce\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:34-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ef\
-3af498-e399-0942\
--91aa-e641cf1f7e\
-4e\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:41-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd8\x9b\
-\xbf\xde\x00\x00\x01VIDAT8\xcbu\xd3?(\
-\x85Q\x18\xc7\xf1s\x8f\x7fe\xa0\xeeB\x06\xddI)\
-\x8bA\x16\x8aR\xc4\xa0LF\x91\x01\x83?uW\x8b\
-\x12)e!\xd1\x1d\x95A\xd7\xa0\x942\xa0(\x03\x19\
-HQH\xbd2\xd8\x14\x99|O=G\x8f\xc7k\xf8\
-\xd49\xef{\xcf\xef>\xefs\xceqI\x928%\x03\
-\xaf\xe6\xbdhV\xf3R\xf3{\xa7'%j\xdc\x8a\x03\
-|\xe0\x0d\x1b\xa8Q\xef}Z@P\x87\x02^0\x8d\
-=,a\x05O\xc8K\x95\xb1Z\xa7K\x9f\xc2\x03\xb6\
-P/\xcfw0,\xe3\x0e\x9c\xe1\x0a]q]\x0c\x98\
-\xc4\x1dZLEEL\x98gcxF\x93\xae`\x13\
-\xb32\xaeP\xfd\x08\x01\xe32.W\xe5\x9f\xa0_\x07\
-\xacbQ\xc6e\xc2\xc9\xe7\x0c\xa9\xe0\x18p*;\xf4\
-\x13\xb0\x86\x05\xb3\x1bY\xe9I!e\xa7B@\x9f\x0d\
-\x98W\xa5\xe6\xa5\xeba\xf1>.0\xa0\x82\xfe\x04\xc4\
-Oh\xc35\x8e\xd0\xae\x16\x8cJ\x93\x0f\xd1\x88c\x1b\
-\x10\x16\x7f\xca\xe1\x19L;0\xa8\x92F_\xe2=n\
-e|\xd9\x89/\xac\x9b\xc5\xde\x9c\xd0Z\xdc\xc8Y\xc8\
-\xc6\x80\xd8\xd9\x1c\xb6\xf1({\xed\xcc\xbf/\xe3\x15s\
-\xa8\xb4\x07I\x97\xda-e\x9e\xcb\xe9\x1b\xc1=v\xd1\
-`.\xde\xaf\xbb\xe0M\xd0\x0cn\xa5a=f+3\
-\xff]&[M\xb5\xea\x81\xd7\x0b\xa3o\x1be\xef\x1d\
-^\xd3\xf2\x8d\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\xb0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:20-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:20-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:3043125a-8ee8\
--2c41-ab08-00e68\
-3d8f0c9\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:16997b4f-4482-e\
-64b-ab0b-338ab48\
-c85eb\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d8ea74e\
-0-9350-2648-add3\
--8fc22561d22f\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d8ea74e0-9350\
--2648-add3-8fc22\
-561d22f\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:30\
-43125a-8ee8-2c41\
--ab08-00e683d8f0\
-c9\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:20-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>~\x12\
-\xf2B\x00\x00\x01eIDAT8\xcb}\xd3A+\
-DQ\x14\x07\xf0;cD\xc2\xbcIv\xac-h\x12\
-Y\xe1+XL\x163\x8bI\x11EY\x93\xa2\xf8\x00\
-l-4%+YP\x9a\xa2\xecl4Y L&\
-\xa5\xd0\xdbZ\xf8\x00\xfcO\xfdO\xfd{=\x16\xbf\xee\
-\x9b7\xf7\x9e{\xde\xb9\xe7\x868\x8e\x03e9\xe6\xa0\
-\x0c{p\x045\xd8\x81\xa9\x94\xb9\xc1_d8\xce\xc0\
-\x13\xdc\xc1\x01\xac\xc3\x16\x9c\xc0\x0b\xd4aP\x83h\xb4\
-U\xf8\x82E\xd9IE\xb0\x0f\xef0\xe2A\x82\xecl\
-\x8b\xc7%\xba\xb3\xec\xda$\xd0\x1a\xb3\x89<\x83\x1c\xd3\
-^\x92\x1a\x84?x\xb6\xa7\xb0\xeb\x01\xac`\xf72\xa9\
-\x13zS\x16\xe6%\xf8(4\xa1\x10X\xed\x9aL^\
-\x81\x1b\x09f\xe3\x10|J\x01\xed\xfd-L\x07\x1e\xd5\
-\x86\x04\x18\x86\xd9D\x06\xdd0\xc7\xd1\xdf\x9d\xc1B\x90\
-s\x0e\x89bY\xa5\x97\xa1\x9a\xf2I\xe6\xc2>\xdf\x1e\
-\xb6Y\x14{n\xe7h\x05\xfd\x86\x1fz\x94\xa33=\
-,|\xd1~L\xc2+\xf4\xf3\xcf1Y\xa8\xae\xa1\x83\
-sJ\xd0\xb0\x8c=\xa2u\xd8!\x9f+\xf0\x06\x0f\xdc\
-\xd9<\xb3h}\x9cc'0\xaf\xad<\x00\x1f\xb0\xf9\
-O\x0f\xb8+8\xd6\xbb\x90\x95\xea\xb7\x98\xcd\x04t\xc9\
-=\x89x2M.\xf6bg\x92\x1d\x96g\x87\xb5x\
-\xa1\xce\xe1\x92\x0b\x1b\x9e\xb6^\xc0\xb465\x05k\x12\
-.\xb0\x9a\x14\x13G\xec\xb77\xfc\x02\xfa\x9c\xf5\xb6\x8c\
-\xcb\x83\xe5\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07#\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:34-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:34-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:2025def7-af12\
--fd4f-8fdf-fe2a8\
-d6eb12c\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:45df4c82-bcb0-8\
-f40-a9a0-934274d\
-50261\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:655e565\
-e-70ef-8047-9724\
--56ce08c2c5df\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:655e565e-70ef\
--8047-9724-56ce0\
-8c2c5df\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:20\
-25def7-af12-fd4f\
--8fdf-fe2a8d6eb1\
-2c\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:34-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x1b\xf8\
-\x16w\x00\x00\x00\xd8IDAT8\xcb\xd5\xd2\xbf\x0e\
-\xc1P\x14\xc7\xf1j%\xd8\x88\xa7\xf0\x146\x89\x85w\
-0\x1a\xfc\x89A$\x08\x91\xd8m\x84\xd5\x7f\x22\x06f\
-\xa3\xc4l\xf0\x02}\x05\x8b\xc1\xf7&Gr\xd3\xb4\xda\
-\xd4d\xf8\xb4\xa7\xb9\xa7\xbf\xdc\x9c{\x0d\xdb\xb6\x0d\x17\
-\x11y\x17Q\x92\xdat\xeb5<\x02>\xcdC\xcc\xa5\
-\xb6\xc2\x04\xb41\xf9%\xa0\x8b\xe9\xff\x05\x98Z\xb33\
-\xc0\x0a\xba\x83\x8fN\x98\x1d\xe4\x91\x94\xba\x87\x99v7\
-\x0aH\xf8\x05\xa8s\xbfH\xdd\xd2\x02\xc6\xb8!\x16d\
-\x06g\xec\xd0\xc7\x08\x03<\x90v\xdcT\xc3k\xfa\xaa\
-a\x8f\x17\x9e\xb8j?\x9bn;\x88h\xf4a\x1dq\
-GJ\xbe\xa3\x8e~\xdfSP\xe2\xdf\xd6\xd5\xa3\x8c\x13\
-\x96\xd8\x885\xb6Xa!\xf3X;\xd6\x0f\xc8\xaa\x80\
-\x1c\x9a\xa8\xa0\xa6\xa9\xa2.\xaa.k\x0dd\xdeF\xb7\
-\xda\x0a\x94\x84wN\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07M\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:16-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:16-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a0872eaa-7736\
--1d48-8f72-f7b2e\
-b06cec9\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ceaed662-d8a8-e\
-f45-a3fd-65da98b\
-58ddb\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:2719988\
-4-948d-ab43-83d1\
--2b99e3917caa\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:27199884-948d\
--ab43-83d1-2b99e\
-3917caa\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a0\
-872eaa-7736-1d48\
--8f72-f7b2eb06ce\
-c9\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:16-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xa2\xb4\
-\xb1d\x00\x00\x01\x02IDAT8\x8d\x8d\xd3?J\
-CA\x10\xc7\xf1\x97<1\xdaZ(\xa2\xad\xa9,\x84\
-\x04-\x05A\x04;\xb1\x12\x0fa\xe1\x05\xbc\x84\xa5\x85\
-\x95\x9d7\xb0U\xd0\xe0_$\x82\x8dX|\xf0\x04\xb6\
-Z\xb8\x0f\xc7\xc7K\xdc\x85\x1f;\xb3\xcc|\x87\xd9\xdd\
-)P\x04\x95h\xd5\xce\xea*\xa3\x9f\x15\x94\xd4\x08\x8e\
-\xce\x14\xf61\x9f\xfc\x89\x86\x84Y\xec\xc5\x02\x05\xda\xc9\
-Y\xc5'\x86\xd8\x08I\xed\x10\xb3\x86\xd7T\xac@+\
-\x02\xb6p\x89\x1d?\xeb(@&\xd3\xde\xc3\x00\x9d&\
-\xc0&n\x92\xbd\x94\xec\x0b\xcc\x05P\x1fw9\x80J\
-\xc7x\xc7vh3\x0bP\x86\xf3]|a\x1d]<\
-\xe6\x00\xaa\x17\x98\xc6\x09\x9e\xb0\x88e<\x8c\x03\x0cj\
-\xfd\xbe\xe0\x1c3\xb9-\x5c%\xfb\x10\x1f8\xa8\xddI\
-\x0f\xb7\xe3\x00C\x9c\xe1\x19+U\x90\xdf\x8f\xd3\xc7}\
-\x1dP}\xd1.\xdep\x1a\xee\xa0J\xac\x8a\xf4p]\
-\x07D\xc57o\x9a\x87\x0e\x16B\xd1\x91\xc3\xf4\xdfD\
-\x8e\x9c\xc6\x9c\xc4?1\xdf.\xb2\xd8\x0b:\xce0\xb4\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x8e\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:22-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:22-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:41b76bba-1f9c\
--aa41-a120-30daa\
-a633398\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:bd4a1d75-8265-f\
-141-9f67-a51e564\
-8287d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a1ccc90\
-e-cd03-e14d-8dd8\
--50432223a770\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a1ccc90e-cd03\
--e14d-8dd8-50432\
-223a770\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:41\
-b76bba-1f9c-aa41\
--a120-30daaa6333\
-98\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:22-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xa0;\
-\xae}\x00\x00\x01CIDAT8\xcb}\xd3=/\
-DA\x14\xc6\xf1\x1d4D\xa1WRH\xe8I\x84x\
-)\x14\x84\x88E\x08\x85\x82H\xa8\x14\xbe\xc1\xaa|\x82\
-\xd5(\x14\x88D\xc1F%\x22\xa2\x12\x8dZ\xe2\xa5\xd8\
-H\xbc,\x9f\x80\xff$\xcflNn\xce\xb5\xc9/;\
-\xf7\xce\x9csg\xce\xb9\xb7P\xadV\x0b\x8eF\xfd\x17\
-1\xa6q\x93\xb7\xd6\x0bN\x0b\xe7\xf1\x837\x0c\xe6%\
-\xc9\x0b^\xc0'\xfa0\x81o\x0cxI\xbcm\xc7'\
-\x7f\x98\x80h\x0a5\x0cg\xd6\xd6\x13\x04\xf3\xe4/\x13\
-|\x81c\x8d\xa7u\xa4Q]7\xa4\x04)x\x09\xcf\
-\xe85\xc1\x97\xb8\xc6\xa1\xeeM\xe2\xc5\x146\xd8\x04e\
-<\xa0\x05g\xb82G\xb8\xc3>\xda\xf0\x8aR\xda\x85\
-M\x10\xed\xe1\x17\xa7\xba^\xc1\x8c\xc67\x9a+yE\
-\x0c\xa68\x9b\x1a/\xabp\xf17\xae3o\xfc\xd7\xc6\
-\x90\x0a\x83U\x05w\xa9\xa05\x9d?\xb51x\x09R\
-\xf0:\xde\xd1c\xe6\x86\xd4\x9d\xb9\xec\xbb\x90}\x91\xd6\
-\xb4\xb0[\xd7\xf78\xd7xDs\xb3ym\x8cg\x7f\
-B\x87\x09>P\x82\x8a\xee\xf5\xab\xd5\x8b^\x1bw\xf1\
-\x88v\xdc\xe2\xc8\xec,\xbe\x0b'\xe8TQ\xb7m\x1b\
-\xad\x1d\xb5\xaa\xec|d\x15\xcdm\xd9\xcee\x17\x05\x15\
-\xaa\xd9\xe9L\xab\xd9z\xdd\x1fZX\xef\x19N,\x17\
-k\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x9b\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:27-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:27-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:7dba185a-3a24\
--ff4e-8b6c-7e2a8\
-3aad4c7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:146d6e41-fa85-3\
-f46-82ae-f381af7\
-34f3a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:046fff4\
-6-43be-514b-a33a\
--c3eb4c6e31f5\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:046fff46-43be\
--514b-a33a-c3eb4\
-c6e31f5\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:7d\
-ba185a-3a24-ff4e\
--8b6c-7e2a83aad4\
-c7\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:27-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x19r\
-\x01\xa2\x00\x00\x01PIDAT8\xcb}\xd3\xcb+\
-EQ\x14\xc7\xf1s\xcf\xf5\xbeb\x84PJ&\x22\x13\
-E\xb7L\x0c\x98\xf9\x17\x14\xca+23\x90H\xc6F\
-&f\x8a\x94\xf7\xa3\x84\x14%\x19\x18\xa9+L<'\
-\xee\xbf\xc1w\xeb\xb7k\xb5\x1d\x06\x9f\xd6>{\x9d\xbb\
-\xef\xda\xeb\xec\x1d\xe5\xf3\xf9\xc8H)\xd6c\x01\x1bX\
-\xc5P\xc2;?\xec\x8fc\xc5n\xbc\xe2\x10\x93\x98\xc5\
-\x1d\xceQ\x19.\x12\xaeZ\x8bw\x0c\x06\x959\xfb\xd8\
-\xfek\x81\x02\xc5ylj\x9c\x16\x9f\xab\xc0#\xdaL\
->\xb2\xa5;W\x98\xd2\xb8\xc8\xcc\xa7\x15/1g\xfb\
-\xe1\x07Y\xdc\xe2\x0d}\x09\xe5{K\xf8\xc0\x19\xea|\
-\x05-\xf8\xc44J\xcc\xcb\x85j\xe4L\xb0\xef2\xac\
-\xe1\xc6W\xb0\xac\x09\xfbOn\xa1c|\xc9t\xd0+\
-\xe7\x1e\xbd\x91\x9a6\x1e\xec\xdbu|\x07[*;\x87\
-a\xe5\x8a\x15]~\xcc\x0d\x16q\x1aT\x90U\xdcE\
-?2h5\xf9r\xbc\xa0\xc3=T\xe1\x09+:\x81\
-\x19\xd3\xf5#S]\xa9rM\xb8\xc0\x9e=\x07\x8d\xea\
-lN\xa7\xee\x1a\xd5\xaa`\x00=x\xd6\x97z\xc0\xba\
-\x9a\xf9\xeb\x1c4\xa0\x13\xedz>\xc0\x88*\xear%\
-\xa3&\xe9\x1c\xa4\xc2K\x22\xee3\x8e&\xcc\xc7I\x97\
-\xc9/\x14\x9b\x1e\x9c`\xc2|\xa1\xf8\xbf\xdb\x98\xc4\xed\
-\xbd9\xe9\x1a{\xdf\xad\xda\xe8\xe0\x91\xf7\xa5\xd2\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07v\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:14-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:14-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:578016cc-d26f\
--884b-b01f-c8bc3\
-3e3d75a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:38fd30ac-6fac-e\
-947-b713-cf17888\
-06f20\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e917e94\
-3-2f38-fb4c-9bb5\
--8df7c8d669dd\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e917e943-2f38\
--fb4c-9bb5-8df7c\
-8d669dd\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:57\
-8016cc-d26f-884b\
--b01f-c8bc33e3d7\
-5a\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:14-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd7C\
-\xcc\x1f\x00\x00\x01+IDAT8\x8d\x8d\xd2\xbd.\
-DQ\x14\x05\xe03C3\x85\x06\x0d\x83\x82x\x03*\
-^@\xadP\x10\x0f (\xa6\x22\x12\x9dd\xa2\xd2)\
-\x84\x86x\x00\x12\x95^4$\xfe\x1aD!\xf9\x1a\x0f\
-Aa\xdf\xe4\xb8s\x07\xc5\xca\xc9\xbew\xefu\xd6\xda\
-\xeb$\xa4\x0c\xd3h\xe3\x18Gha \xfe\xd5K\xbd\
-\x09)/v\xf1\x86C\xacc\x03\x17x\xc1\x5c7\x92\
-|\xf8\x11\xcd\x8a[\xe6\xf1\x81\xd9*\x92B\xf6[6\
-\xdc\x8bZ4\xf6\xc4\xb7\x15\x5cu\xb3\xd0\x0e\xd9\xc5p\
-\xdeP\x8b\xb3\x81\x07L\x95U$\x9c`\xad4P\x85\
-s,V\x11\x1ca\xf3\xb7M\x07.c\x1f\x1d\x04\xad\
-\xd8v\x0a\xcf\xb9\x8ab\x07\xc3x\xc5dYi\x8a\x9c\
-_2\xf6*\x1c\xe34\xab\x7f(H\x91\xf3Gl\xbb\
-\x9156c\xf8\x13O\xd8\xc7P\xae.g\x9b\x89\xa8\
-\x1ep\x16\x9e_\x83\xe0\x11\xab8\x88\xc8\xc7\x0b%\x1d\
-\x92\x22\xaa\xa5\xb0Tx\xde\x0b\xa2\x84m\xbcc\x22\xb7\
-\xf0W\x02\x83x\xf6\xfdf\x12\xb6p\x87\xfe\xaa\xe6z\
-\x86ZF\xdc\x0c\xf9;Q\xdf`\xb9\xdb\x8de\x14q\
-\x8e\xe2\x16\xf7\xb8\xc6\xd8\x7f\x09r\x8b}X\xc0\x08\xd2\
-\x17\x12\x09\xe39\x80`\x04r\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07k\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:14-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:14-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:99432555-d62c\
--434d-97aa-a9c19\
-01a4aba\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:9b75ec5e-4812-5\
-a49-841b-f195554\
-3a259\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:460a839\
-f-1202-8a43-a32f\
--c4fdc20fbd6c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:460a839f-1202\
--8a43-a32f-c4fdc\
-20fbd6c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:99\
-432555-d62c-434d\
--97aa-a9c1901a4a\
-ba\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:14-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xcc\xe6\
-\x11.\x00\x00\x01 IDAT8\xcb\xa5\xd3\xbf+\
-\xc5Q\x18\xc7\xf1\xefu\x91;\xf8Q\x16\x94d\xb3`\
-\xd3\x1dXl\xfe\x00\x83\xc8\x1f\x80;\xa8\xfb'\xdc\x12\
-\x06B\x16\x0b\xc9@\x19\xc5$\xcad\xa1n\x06\x83\x98\
-^\xa3\x7f\x81\xe5\x9c:\xf1\xbd\xf7*\xc3\xa7\x9e\xd39\
-\xbd\xfb<\xcf\xe7<\x19\xb2\xa0B\xa2\xac\x89\xda\xd2s\
-\xd6\xe2qK\xc5\xa2\x8a\x1b\x9c\xe1\x1c\x9b\x89\xab\xec\x87\
-\xcbYt\xff\x04\xcca\x19\xbb\xf8\xc2G\x9e\xdd\xa0k\
-l\xc5\xfb\x0c\xc5p\x18\xc2#.p\x9b\xe3 \xc2\xc6\
-\xf1\x8a\x91\xd4A\x1f\xdePA\x19\xf5\x06-D\xc8\x15\
-VR\xc0\x1e.C]\xc6I\x83\xa1E\xe0!6\x22\
-\xa0\x03\xcf\x98\x09\x97\x9d(\xb5\x88\xf0\x08\xb5\x08\x98\x08\
-\xbd\xf76\x89\xab\x88\xf6\xc4\xc1\x03\x16#`2\x00z\
-\x9aX\xae`;\xd4\x0bxAW\x04\x94\xf0\x84\xa9\x9c\
-\xe8b]\xc3\x01F\xf1\x89\xf94\xc6\x0c\xc7\xa1\xafF\
-\x80*\xeep\x8f\xa5\xbc\x9f8\x8c\xf7\x90@j=\x02\
-\xd6\xc2\x07\xabc\x15\xeb\xe8\x8f\x80\xf8x\x0c\x03\x0df\
-0\x1dZ\xd8\xc1)\xf61\x98:(\xfcw\x99\xb2?\
-\xae\xf1\xaf\x95\xff\x06\xe8`\xda(\x18\x1d\xb1\x17\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x96\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:43-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:43-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a1d0ef62-876f\
--7f42-85fb-05634\
-2977577\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:7d8e4441-78b1-6\
-e45-999b-624a936\
-38c99\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c71daee\
-3-3cba-8243-bb64\
--4865d97a8678\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c71daee3-3cba\
--8243-bb64-4865d\
-97a8678\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a1\
-d0ef62-876f-7f42\
--85fb-0563429775\
-77\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:43-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>F\xbc\
-r\xca\x00\x00\x01KIDAT8\xcb\x95\xd3\xcd+\
-DQ\x18\xc7\xf1\x8bdfg+;\x0b)\xaf\x0b\x09\
-\xa5(\xafY\xb2\x1e\xa5\x84\xdd\xe4%\xd9X\xd8`g\
-cI6\xe4=\xb3\x9a\x05%\x92\xbc\xe4ml\x14)\
-\xd2U\xfe\x0a\xdf\xa7~\xa3\xd3uoc\x16\x9f\xe6\x9c\
-g\xee}\xees\xcey\x8e\xe7\xfb\xbe'1\xcc#\x85\
-]\x1c`[\xe3}\xec\xe0\x10\x83z\xbe\xc0~mP\
-\xa8@\x1b\xbe0\x821$\x90\xd4x\x18CX\xc6#\
-\x8a\xb3I\xdc\x04\xdd\xb8p*\xea\xd7|\x0f\xe5\x8aU\
-\xe1N\xd5\xfeI\xd0\x89[\x8d+\xf0\x81v,\xe0X\
-\xf1f\xdc\xa3$,A\x97\x93\xc0\xbe\xf4\x8e2\x8c\xe3\
-R\xf1\xa6\x5c\x09n\x9c%\xcc\xe1\x05\x19U\x97w\x02\
-S\x1a\x987\xe6\x93 \xa1\xa3\x5c\xd7\x8b\xff\xaa \xbb\
-\x07\x8bx\xc3\xa8\xc6\xdf\xa8\xd3\xded\xa2\x12\xd81\x9e\
-k\xe3^\xf5p\x5c\xff\xcdb\x0b5x\x88:\xc6\x1e\
-\x9c\xa0Egm\xb1\x15\xc5\xabq\x8aVU\x19\x8b\xaa\
-\xe0J\xf3gu\xa0\xc5\x8b\x90\xc6\x12*\xb5\x84\x9c\x8d\
-\xd4\xa7>\xb0\x06z\xc2\x99^j\xd0\x12B\xf7\xa0\x17\
-\xd7\x81#\x1c@\x87\x13\xab\xd7]\x88\x87%\xa8\xc5\xa7\
-n\x9e\xd9\xc0*\xd6t\x137\xd5\x91Gnox\x81\
-F\xb1\xaf\xcd`\x02S\x98\x96II\xea\x9e\xfc^\xe7\
-\x1f5[\xfcJ\x122\xb6o\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07i\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-37-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:59-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:59-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:835df96b-d001\
--2c4f-bcdb-f9a22\
-6a1f1a6\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:144cb60c-3123-9\
-640-8f5c-f875c06\
-4a572\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d38e5b8\
-e-e982-bb49-a1c2\
--bbc2a4a59f60\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d38e5b8e-e982\
--bb49-a1c2-bbc2a\
-4a59f60\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:37-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:83\
-5df96b-d001-2c4f\
--bcdb-f9a226a1f1\
-a6\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:59-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x08\x04\
-Bw\x00\x00\x01\x1eIDAT8\xcb\x95\xd3\xbd.\
-\x84A\x18\x05\xe0Y\xdbH\x14\xb2\xabV\xe8\x10Q\xc9\
-\x0a\x11KX\xd9\x0bP*lA)\xabW\x8bN\x5c\
-\x81DD\x10Q\xb9\x05?\x8b\x08\x89-\x5c\x80\x87\xb8\
-\x0a\xcd\xecf\xf2e\xf1)N&3\xf3\xce\x993\xef\
-9\x13\x10\xd0\x17Q\x88\xf3\x0e\x0a\xc9^\x8anM\xc8\
-\x1c\x08\x18\xc6j\x8f\xf5\x9e\x08(c\x1e5\xf4\xc7\xf1\
-5\x16L`\x09U,`\x11S(\xa6\x04\xfbx\xc7\
-\x13*\x98\xc3c,\xd8\xc5\x0bnq\x87\x1b|\xa1\xde\
-yz\xc0%\x1a\x89\xac\x1a\x1e~\x91}\x81\xf5T\xc1\
-\x196\x92\x82e\xb4\x92&\x16\x92f\x06\x9c\xe2\x0d'\
-\xa8\x06\x9cg\x08\xeah'\x04Y\x05\xb3Qq\x1b[\
-\xbd\x08*8\xcc\xe1\xc0\x11\x9a\xbd\x08\x061\x99\x93\xa0\
-\xab`3\xd9\x98\xc1q\x12\xb0\xb4\x0f\x01+\xd8\x89\xce\
-5;Ml\xe4\x0dN\xbc\xf0\x19\x07\x98\xee\xd8\xb8\x1d\
-\xc31\x84R\x0cW)\x83r\x0c\xda\x15\xd6R\x1b\xf7\
-\xf0\x81k\xdc\xff\x81\x16>c:\x03\x8a\x01\x03\x18\xc5\
-X\x0e\x8cc$\xb57\xfc\xe3\xed?~\xa6l\xe2\xf2\
-\xa0K\xf0\x0dfu\xe5\xbc\x95\xeb3\xb5\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07\x8e\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:44-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:44-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:f6b11691-e85d\
--8341-8835-bf7ad\
-94e7a37\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:03deb8c8-32ba-1\
-445-a8f6-f22bbe1\
-65797\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:3c13add\
-9-1a78-a549-b67a\
--9c49f8c47b5f\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:3c13add9-1a78\
--a549-b67a-9c49f\
-8c47b5f\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:f6\
-b11691-e85d-8341\
--8835-bf7ad94e7a\
-37\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:44-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x7f#\
-\x86=\x00\x00\x01CIDAT8\xcb}\xd3\xcd+\
-DQ\x18\xc7\xf1{\x99\xd4\x8c\xb70\xcaj\x94\x92\x12\
-Y)&/![\x16,\xd8\xb0\xb3\xb6\x22\xfc\x016\
-\xc4Z\xd9\x18\xf9\x0f\x94\x05\xa1(\x22)\x16J\x12\x8b\
-\xbba\xe1O\xf0\xbd\xf9\x1d=\x9d\xee\xbdS\x9f\xee\x99\
-s\x9e\xf3\xf4\x9c\xb7 \x8a\xa2 \xc34\xfa\xd4\x0e\x93\
-b\x92&U\xeb\xbb\x88o<\xa3=-\x89\xfd\x13\x9a\
-\xc9\x05\xbca\x08;8P\x7f\x8d\x9f$\xad\xb4U\x9c\
-\xa9\xdd\x81wtz1\xa1_A\x09\xe3X\x8a\xfe~\
-cfl\x17\xb7\x98\xc2 \x9al\x05\x13\xb8\xc6\x83\x82\
-N\xb1\xac\x80*}\x9b\xb1\x87\x0b\xdc\xe1\x11\x15\xb4\xc6\
-\x83G8Gm\xdaN{r\xe8\xc5\x0ff\xe3\x8e~\
-\xbcb\xce\x04\x84\x19\xa7\x13\xdb\xc7\x09\xf2\xaec\x04_\
-X\xf0JOR\xd12\xea\xdd\x1e\xb8\xcc\xa3\xda\xbc\xe1\
-\x84$\xae\xbd\xa9\xc9y\xd7\xef\x97w\x85\x19s\xe6n\
-rN\xedCl\xd8q[Z\x11\xf7\xe8\xc9(\x7fE\
-K\xf8\xaf\xca\x967\x80\x1b\x13<\x89c\x1d_\x97Y\
-\xe6\xa5\xddd[\xfe\xbc\xd6W\xd6-\x8c\xdf\xc0\xba\x12\
-|bK\x8f\xeb\x05-\xee6\xda\xab\x5cR\xf6'\xac\
-\xa1\xceT\xd3\xad\xa3\xfb\xc0v\xd2crI\x1a\xd1\xe0\
-\xed\xbe=\x8d6\xef>\x04\xbf\xb8\xfb\xe4\x0c\x16\x85\xca\
-\xd0\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07Y\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:18-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:18-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:9708fed4-1909\
--094a-b315-580e3\
-b01742b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:ac7c84ce-bc78-d\
-643-91cc-45fd5a8\
-5cb7d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:38e605a\
-3-ea62-0349-87d7\
--b31ff1d62922\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:38e605a3-ea62\
--0349-87d7-b31ff\
-1d62922\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:97\
-08fed4-1909-094a\
--b315-580e3b0174\
-2b\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:18-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xfd\xc3\
-b\xf6\x00\x00\x01\x0eIDAT8\xcb\xa5\xd2\xb1.\
-DA\x14\x06\xe0\xb9\xec\x0bH(\xa84\x0a\xabV \
-A\xe3\x19\xd8\xe86YBaWT*\x0f\xa0\xd4\x90\
-\xa8\xd9]\x9b\xecc\xa84*\x09\xf5\x17Qy\x83U\
-87\xb9\xb9\xb1v\xd9I\xfe\xcc\x9c\x999\xff\xf9\xff\
-3\x93\x06\x83A\x9a\x04ib\x02T0\x854\x06\xb2\
-\xb8\x9b#%\x5ca\xafp!\xfd\x05\x09}\x1c\xc5\xc6\
-(%\x0b\xd8\xc1\x1aV1\x9b\xd0Fc\x04A\xael\
-\x17\x8fx\xc5\x00\xb5\x84.\x0e\xc6PP\x89y\x09\xcf\
-\xf8D}\x18A6$\xb9\x8a\x8f\xb0\xdc\xc3y\x99`\
-\xfa\x97\xcaU\xdf\xa3\x19q\x1d\xdb9A\xa3\x94\xb4Y\
-RR\xc5;N\xcaV\x13:8,$_F\x83.\
-\x22^)U.\xda\xcc\xca\x16\xae\xf1\x84\xf5h\xd4-\
-\xde\xd0*$g\xe5\x7f\xd0C\x0d\xc7x\xc1\x5c\x1c.\
-\xc6s\x9d\x16\xfa\x93\x13\xe4H\xb9\x82}\xccc\xe6?\
-?\xb1\x1d\x95np\x17\x8a:x\xc0}\x14\xe8\xc6^\
-q\xdd\xc7V\xc2Fxl\x85\xdcf)n\xfd\x80&\
-\xce\xb0\xfc\x05LH\xef\xd4\x03\xdb\x88\xa2\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07\xb2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:04-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:04-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6ee7ec8b-0ef6\
--f24c-bc1e-37f5b\
-27d96b2\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:98797234-7f4f-7\
-64b-90a2-f572f3c\
-b4c15\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:ce0f646\
-3-9117-0743-a712\
--8c37f20ad95a\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:ce0f6463-9117\
--0743-a712-8c37f\
-20ad95a\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:6e\
-e7ec8b-0ef6-f24c\
--bc1e-37f5b27d96\
-b2\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:04-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xcb\xc5\
-\x8d|\x00\x00\x01gIDAT8\x11\x05\xc1\xb1J\
-\x95\x01\x00\x80\xd1\xef\xfeW\x83\x8aR\x83(\x08{\x81\
-\xc2jk\xd0\xa9\x07p\xa8!\xa1\x16\xdb\x85\x86\xa4-\
-\x92\xb6B\xc1\x9a]li\xb2(pj\x8a\x88\xc4)\
-R)\x0a\x9cNsOP\xe7\x84\x10\x06\x84I,a\
-\x1d\xdb\xd8\xc2\x1a\xe6\x11\xc2\x80P\x08#\x84E|\xc3\
-\x17lb\x05\xabx\x8d\x03|\xc0,\xc2\x80\xc2\x80\xb0\
-\x82?\xb8\x87\x10B\x08Sx\x85c\x5cE\x18BX\
-\xc4\x1f\x5cA\x08\x13\x180`\x8c\x10V\xf1\x03\xd3(\
-L\xe2\x1b\xee#,\xe0!\xc2\x08!<\xc65\x84\x1d\
-l\xa0\xb0\x84/\x08\xe12~\xe2\x05B\xd8\xc4!.\
-\x22\xdc\xc0\x11f\xc2\x066\x11&\x10.\xe07\x9e\xe0\
-)\xbe\xe3\x1cB8\x81},\x84m\xac \x8c0\x81\
-p\x01\xff\xf0\x17\xd3\x08\x13\x08\xe1\x1d\x1e\x84-\xac\x22\
-\x8c\x11\xc2:>\xe33\x9e!\x84\x10vq7\xaca\
-\x1ba\xc0\x08\xaf\xf0\x1dS8\x87_x\x8e\x10\xce\xe2\
-\x00sa\x1e\x07\x98B\xb8\x85O8\x8f\x10.\xe1+\
-n\x22\xdc\xc1\x1e\xc6!\xbc\xc7K\x84S8\x890\xc6\
-\x80p\x1a!\x1cb\x19\x850\x8bc<B\x08!\x84\
-\x10\xc2G\xbcA(\x0c\x08W\xf1\x03;\xb8\x8e\x13\x08\
-\xe1\x0cn\xe3\x10o0F\x18\x850 Lc\x03G\
-\xd8\xc7[\xec\xe2\x00{XF\x08#\x14B\x18\x10\xc2\
-\x0c\x16\xb0\x8c%\xcca\x8c\x10F\x08\xfd\x07v`\xf1\
-\xd5\x93\x88x\xec\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\xc3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:43-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:43-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:3ec36fca-7924\
--fc44-9a65-0c413\
-2d969fb\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:225aa0b1-1ea8-7\
-246-a7eb-4fb1085\
-17c94\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:cbffaf5\
-e-3f30-b24a-9bf7\
--f4e918fcd221\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:cbffaf5e-3f30\
--b24a-9bf7-f4e91\
-8fcd221\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:3e\
-c36fca-7924-fc44\
--9a65-0c4132d969\
-fb\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:43-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x94\xac\
-\xf4\xfc\x00\x00\x01xIDAT8\xcb\x85\xd3O\x88\
-\xcdQ\x1c\x05\xf0\xfb\xe6\xc9B\x99\xa1\xf4V$\xe3\xcf\
-BIS\x16\xf2'y/\x86h\x90?\xd9\xd9)V\
-jX[YZY\xb0\xb0@)JV\xac\xccr\x84\
-\xac(\x91H\x91\x8f1X)v\xd8\x9c_\xdd~=\
-,n\xf7\xff\xb9\xe7{\xce\xb9\x05gp\x08\x05\xdd\xf4\
-M;\x89~\xc6\x9d\xd6^A)\x98\xc2<\xf6gq\
-a\xfa\x0bx\x83\xd7\xd8\xf97\x90f\xb0\x07s8\x90\
-\xf9\x1a|\xc4(N\xe3\xc1\xbf\x00\xba\x15\xc8<\x06\xe8\
-a&\xeb;\xf0\xf4\x7f\x0c\x16\xa4\xdf\x87\xcf\x98\xc4\xd2\
-\x80\x0f\xf0\xb0:\xd7\x19\x060R\xd5>\xc0\x8f0j\
-\x98\xc1\x8a\xeab\xb7\x01j\xab\xba\x0bw#\xde\x5c\x18\
-\x15\x5c\xc6;\x5c\xc2\xea6\x83\x11l\xc1}\xbc\xc4\xf9\
-ln\x8f&{3\xdf\x88\xeb\x01\xbf\xd20*8\x8e\
-/8\x87q\xac\x8c\xb5\x9b\x92\x8fO\x15\x93\xc5\xd8\x8c\
-\x1bx\x8b^\xc1a|\xc3=<\xc6\x93x\xff,\x97\
-N\xe0W\xca[\x17K\x1f\xe1\x15\x96\x15,\xc1\xd1\xbc\
-\xba!%\xad\xc5\xf3\x08\xdb\x8f\x1e\xef\xc3\xa4\x17\xd0>\
-:eX<\xb1(\x00\xa38\x85\xabX\x1fMv\x0f\
-\xb3\xb1[ea9.\xe2'\xc6\x92\xc4\xefy\xfdH\
-@\x0e6\xf7J+a\xab\xe2\xf9\xad\x88\xd8\x84\xe7\x18\
-^\xe0f\xa8\x7fm\xfeN\x1d\xa4\x82\x09\xfc\xc6\xb5\xb4\
-;\xb8\x1d\xdbf\xf1!\xe7\xa6\xf2\xd0\xd6v\xedc\xa9\
-y:\xb6NW\xe3\xb3\xd5\xb7/\xd8\x86\x89?\x18\xca\
-\xfcZ\x17#\x1f\xc2\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07;\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:35-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:35-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:4528a686-ba00\
--8745-97b4-46795\
-dc74d2c\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:865ce468-cb20-1\
-74d-a7b3-3770f63\
-f42c0\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:f7af814\
-9-5c41-8547-bbab\
--2773413d74e5\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:f7af8149-5c41\
--8547-bbab-27734\
-13d74e5\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:45\
-28a686-ba00-8745\
--97b4-46795dc74d\
-2c\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:35-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>s\x11\
-|\x1e\x00\x00\x00\xf0IDAT8\x11\xa5\xc1=.\
-\x04@\x18\x00\xd0\xf7\x8d!\xf1\x1b\x89\xce\x098\x85B\
-\xa7\xa3\x12\xa5K\xa8\x84K\xa8\x5c@#q\x00\xa5h\
-Ei+\x9a\xdd\x96\x02\x8b\xdd\x19\xc5H\x90\xb0!\xfb\
-^\xd4Z\x8d#\xf7z\xbdM\xec\xe2\x19\xc9\xdf\x04\xfa\
-\xd8\xcf\xd8\xc1+\xce0\x87j\xb4\xc0\x0b\xf6\xb0\x91Q\
-p\x8a\x13\xff\xb3\x8e\x9c5\x8b\x9a)\x0c\xfd.\x10x\
-\xc34jF\xa0h\x06(F\x0bME$cJ\xc6\
-\x94\xfcO |\x91Q1\xd4\x14\xa3UTMA\xcd\
-\x98\xc4\xbcf\x01\xc5\xa7!\x02\x09\x15\x81\xc0\x13f\x90\
-3n\xb0\x87mL\xfan\x16\x03\xf4\x11>\x15,\xe3\
-(\xba\xdd\xee4V\x90Q\x11Hx\xc41.p\x8c\
-%\x0cP\x91p\x8fN\xc63\xae\xfc\xec\x0e\xd7\xe8\xf8\
-E\xd6$\x04\x86X\xc5\x01&\xb0\x86\x15l\xa1\x83C\
-\xf4\x91PQ\xb3\xa6 4\x0f\xb8\xc4\x14\xce\x911\x8f\
-[\x0c4\xc5\x87w\x90RD\x10\xd65\xe1\xa3\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07I\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:59-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:59-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:943083fe-61c0\
--a649-a0a4-97550\
-ab8dc9b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c453aa5a-8215-4\
-a47-a457-50a2302\
-3130a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e92a115\
-0-e0e1-0d4f-9b66\
--c9146af80557\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e92a1150-e0e1\
--0d4f-9b66-c9146\
-af80557\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:94\
-3083fe-61c0-a649\
--a0a4-97550ab8dc\
-9b\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:59-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>zh\
-i\xd4\x00\x00\x00\xfeIDAT8\x11\xa5\xc11j\
-\x14a\x18\x00\xd0\xf7\xcf|\x86\x10\x96\x10<In \
-\xa4\x09h#\xe4\x02I/\xe9]D\x10\x8b\x94\x01\x1b\
-\x11A<B\xb0\xd9\x1b\xa4\xd8\x13\x04A\x92n\xedB\
-X\x13\x0d\xce\xcc\xa7\xf0\x97:\xcb\xa2\xefEf\xfa\x1f\
-\xb1X,\xfcv\x88\xa7\xe8Q\x8cKl\xe0\x02/\xf1\
-=p\x84\x178\xc1\x12-\xd2\x9f\x0azL0\xc5{\
-|\x0e<\xc1k\x9c\xe3\x15n\xd0\xf8\xbb\xc4\x03<\xc4\
-\x1b<\x0b$:\xfc\xc4\x1cwh\xac6\xc3\x14\x07\x81\
-\x01\x13\x5c\xe2\xd4\xfa\xf6\xd1\x04\x0az\xd5\x06z\xab\x0d\
-Hla\x08UQu\x18\x8c+\xd8\xc15\x12\x19\xd6\
-S\x90\xd8\xc6;\x1c\xe3\x07JXO\xaa\xbe\xe19\xbe\
-b\x13C Q\xac\xa7\xc7\x17U\x8b!Pp\xaf*\
-(\xc6\x154\xe8TC\xe0\x16\xbb\xaa\xdej\x89A\xd5\
-\xa1\x0d\xbc\xc5G\xcc\xb0D\x8b4\xae\xa0\xc3#\xcc\x02\
-s<\xc6\x1eZ$\x8aq\x89\x06g\xf8\x14(\xb8\xc2\
-\x07\xff\xe0\x17\xd7SH\xc8p$\xc8*\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x07|\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:35-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:35-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:c4a2a0ba-56e6\
--7a4d-b188-1eeb8\
-038365b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:b6eca0f8-4fa6-7\
-d4e-81db-d93420f\
-19ef6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c334dbc\
-e-9510-794c-84ab\
--7ff4279362c7\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c334dbce-9510\
--794c-84ab-7ff42\
-79362c7\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:c4\
-a2a0ba-56e6-7a4d\
--b188-1eeb803836\
-5b\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:35-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xf4F\
-\xb4\xd0\x00\x00\x011IDAT8\x11\x9d\xc11o\
-Ma\x18\x00\xe0\xe7\xfd\xcew/M\x1b\xbdH\xcc\x98\
-\x85\x08\x89\xa4\x83A\x8cv\x16\x8b\xcd\x22\x16\xb1t\xf2\
-+:\xb4MD,b\xf4\x17\xe8\x0fhb\x90\x90T\
-n\xce\xc8`(z\xee\xf9\xdc\xe4krp\x13\xc5\xf3\
-D\xdb\xb6\xe6\x92\xbfWP\x1c\xca\xaa\xde\x7f\xca8\x85\
-\x0bH\xfe\xac\xa0\xc1\x14\xef\x1c\xcaX\xc7\x1d\xbc\xc7\x18\
-\xc5\xa2@\x8fcX\xc1\x0dL\x11\x19g\xb1\x8emG\
-[\xc1\x1b\xacbj.\xe1\x00Y\xd5 \x10\x08\x84*\
-\xa9\xc6\xf8\x8e\x03Ud\x84AA\xb1\xa8\xa8\x96p\x1c\
-'T}r\xb4\x84\x82\xc7\xd8\xc1\x04[x\x8b\xb5\xe4\
-W\x81@ \x10\x06kx\x81\xeb\xb8\x8bO\xb8\x96Q\
-\xd0\xa9f\x16\x15\xd57\xec\xe2\x83j\x0f}\xc6\x08g\
-\xb0\x84\x09zU\x87@\xc6>\x9616\x18\x99\xcb\xd8\
-\xc5}\xdcBFB\xc1*\x0a\xbe\xa0\xc3%<\xf7\x9b\
-\x8c'\xd8B\x83\xc0\x0c{\xd8\xc4W<\xc4i<\xc5\
-\xcc`\x1f\x911\xc3G\x83\xab\xb8\x8d+\xe8\xf0\x08\xcf\
-\xf0\x19\x0fp\x0e#\xdc\xc4NV\x05\x1at\x98\xe02\
-^#\xe1\x22Nb\x03\xf7p\x1e\x0d^\xe2U\xb4m\
-\xeb'\x81\xe2\x1f\xfc\x00/-H\x1a\x012\xedi\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x93\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:26-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:26-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6ef8d2ed-888f\
--0943-b628-bd011\
-f023d4e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:10a0b2bb-3c7f-d\
-44e-a174-10b3a5a\
-fcb18\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:b4c7952\
-8-c40b-c14f-8b82\
--5d5d122cb6ed\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:b4c79528-c40b\
--c14f-8b82-5d5d1\
-22cb6ed\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:6e\
-f8d2ed-888f-0943\
--b628-bd011f023d\
-4e\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:26-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xae\xb9\
-\x0a\x09\x00\x00\x01HIDAT8\xcb\x85\xd3?(\
-FQ\x18\xc7\xf1\xf7^\x7f\x8a7\x83\xa2\x98X\x19\x08\
-\xa5,2\xd8\xcd,\x18(\x89d\xf0\xa7\xac2\xcaf\
- %o)\xff\x12\x99\x98,\xa2$\x03\xf9\x93b\xb8\
-\xbb\xc1\xee{\xf4;z:\xce\xcd[\x9f\xce\xb9\xef=\
-\xe79\xcfy\xce\xb9\x85,\xcb\x0aF\xa2\xb6\x1e\xf3\xd8\
-\xc4:\x06#c~\xd8\xc9\xa9\xda\x1e<\xe3\x0c\x0bX\
-\xc6=NP\x0c\x83\xc4V~\xc3D\x90\x99s\x8a\x9d\
-`\xb1\xdf\x00\xe5j\x17\xb1\xa7~\x99\x06\xfaw\xb5x\
-@\x8b\x9dcW\xa8\xc15\xa6\xcc\x80\xc4\x04s\xed9\
-Vl=|g\x09/x\xc4@0\xc9\xa6\xbc\x8aW\
-\xdc\xa1\xcfg0\x84\x0ftE*=\x89\xdep\xdf\x98\
-Q\xad\xea\xdcCI\xd5\xf6i\xa7A\xca\xd3\xeaW\x06\
-Y]`\xd8u6\xb0\x16\xa9\xbas\x80\xf1\x9cw\xb7\
-n\xbb\xfe\xdc\xddo\x16\xad\xe8T\xeb\xde\x1dcL\xfd\
-n\xb4\xa1C'u\x89\x0a\x1f\xad_\xe9\xde\xe8\xd2\x94\
-\xcc\xd9\x8f\xe8\x84\xdc\xffWZy\x0b\x8d\xbe\x88\xf6j\
-\x16\xa5I\xcfG\x18U\xbf\x19U\xf2\xe7\x18\xd3`\x7f\
-\x87\x98\xc3\xb6*\xbek\x8a\xe9\xc7'\xe1E\xb2\x81\xda\
-\xf1\x84O|)@\xf5\x7f\x1fS\x18\xc4\xa5\xfc\x8e\xfd\
-\xbc/1/\x80\xbd\x85\x0df\xcfil\xec7\xae\xb4\
-\xe6g\xc4A\xa4\x8a\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07\xa1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:25-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:25-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:c6f28393-7e4f\
--894c-abbc-00b33\
-1a22603\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:0576a823-ccbc-8\
-b45-9c73-c23ce70\
-80c9c\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:1fd28ec\
-0-aede-e446-91ee\
--58417dc8497a\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:1fd28ec0-aede\
--e446-91ee-58417\
-dc8497a\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:c6\
-f28393-7e4f-894c\
--abbc-00b331a226\
-03\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:25-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>$\xc1\
-o\xcb\x00\x00\x01VIDAT8\xcb\x85\xd3\xcd+\
-DQ\x18\xc7\xf1;ob1\x93BY\xb0A\xb2\xb1\
-%\xe5\xa5\xac\xa5,$B\x99\x14\x0b\xa5\x94\x05%!\
-,\x94\x85\xf7HX\x88\x9a\x9a\x85\x92\x05\x9a,\x94\x05\
-\x16\xe4%\xc9\xce\xdd\xfa\x13\xf8>z\xa6\xce\x9c\xeea\
-\xf1\xb9\xf7t\xef\xb9\xbf9\xf3<\xe7x\xbe\xef{\x0e\
-\x11\x84\xffx\xff\xcb~\xd0\x80\x0e$\xac\xe7\x12\x14r\
-\x05\x14\xea\xaf\xc9\xf8\x14_x\xc5&Z\x02>\x0a\xd9\
-\x01\x03x\xc22\xeeQ\x82J\xac\xe0\x017\x98Fu\
-P\x88\x5c\x0a\xd0\x8e\x17|c\x0dK\xa8\xd1I\xdd8\
-\xc2\x1b\x0eQf\x86\x98K\xbb\xc0\x10\xf64h\xc1Z\
-z'>Q\x14\x14\xd0\x8c;cr+\xf2\xad\x80y\
-l\x1bE\xcd\xe9\xc2\x06>0\x89Y\x8ca\x0as\x98\
-\xd1\xb1\xbco2Z\x9cS\x03)V\x1a[\xd8\xc5\xbe\
-\xde\xc5:nU\xcc.\xa4\x0czp\xf9\xcf\x86\xd9\xd1\
-\x95\xc9x\x15u\xd9\xbf\x22\x97A\xed@\xbd\xf5QL\
-\x97Z\xaa\xfb\xa2\x0a]Z\xe03D\xb3+\xc8\xc3\xa2\
-\xee\x85kL\xa0\xc2\x08J\x22\xa3\x81\xcfh\xc39F\
-\xec6\xc6\xd1\x87\x14\xdeq\x82~<\xa2\x17\x8dZ+\
-\x99;\x8ec3\xc0>4\xe5\x18\xc5\x95n,)X\
-\xb1\xb6\xfa@W;\x1ct\x98\x22\xaeC\xa3j\xb5+\
-I\xd7i4[\x146\xee\x9e+\xf8\x07\xb2\x06\xef\xa1\
- \xe6L\xf4\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\xaf\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:40-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:40-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:84899f7b-6901\
--c54e-a3de-30c6a\
-37ccddb\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:6bdd22de-bfd4-f\
-946-8257-8a3dfaa\
-cf20b\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d3a3513\
-e-5c82-114b-9961\
--7bbd57020260\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d3a3513e-5c82\
--114b-9961-7bbd5\
-7020260\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:84\
-899f7b-6901-c54e\
--a3de-30c6a37ccd\
-db\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:40-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>T\xe8\
-S<\x00\x00\x01dIDAT8\x8d\xa5\xd3\xcd+\
-DQ\x18\xc7\xf1\xeb\x8ea\x8a\x92\xbf\x81\x92?\x82\x95\
-\x85\xd8H\x12\x22\x89\x19\x91\x92\xbcl\xac\xec\xfc\x03\x92\
-\x95\x0cy\x9d\xbc\x17\x0b\xd9R\xc8\x82\x8d\x85X\xddR\
-J\x91\xf5\xf5}\xf4;9M\xb7fa\xf1\x999\xf7\
-\xdcs\x9e\xe79\xcf\x99\x09\xe28\x0e\xfe#\x88\xa2\xc8\
-\x94\xe9\xbb\x0bG\xd8C\xc1c\xcf\xfb\xc8\xa3\xc1\xdfS\
-\x1c\xe0T\x1bz0\x8a\xac\xe40\x80'\xcd\xdb\xdar\
-?@\xa8o\xcb\xd2\xa7q\x92\xed\xa4\x00\xa1\xb7\xe0\x04\
-\xe3\x1aW\x22%i\xaf\xc2\x11\x8d+\xacr?\xfa\x02\
-b\xf4\xeb9\xe5\xbdsI\xac\x17\x1fhw\xef\xec\xa3\
-\x1eg8\xc0\x0d\x86\x13\x02\xb8\x1e\xed\xa8\xca+,\x22\
-c\x93\xab\xca\xdc\x885\x8ciqZ\x1bC\xaf\x82C\
-\xddTV{\xbamr\x1d\x97\xca\x1e\xab\xdb~V\xdf\
-&\xbep\x81\x07\xeb\x97M\xee\xaa\xf3\xb5\x1a\xbfZd\
-\x05hA\xa76\x0f\xe2\x1d\xcb\xaa\xce\xaa\x9dr\xe7\x9a\
-\xf0\xb2\xb4\xe1\x1b\xcf\xb8\xc7\x9d\x82~\xa2\xd9[gW\
->\xe9:\xdb\xab\xc9\x0e\x1ck\xe3\x1cjt\x9d9\x5c\
-\xe3\x1c\xadZ\x9bw\x15l\xe8\x06\xec\xe5#fQ\x9d\
-p\xfe*\xcc\xe3EIo\xad\xe1\x81\xce\xf2\x16\xfd\xdd\
-\x7f)\x19Ug\xc7\x1cr?O\xeb\xe8\x92\xfaaW\
-\xe5\xfe@\x85\xa2\xb1\xbd\xdb\xc2\x8a\x92\xfeV\xd0\xa4\xb2\
-gd\xba\x04\xb7\xce\x1a_\xf7\x03\xbf\x0a\x0c\xd7\x10\x80\
-1\xbd\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07M\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:10-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:10-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:9f3e5831-0045\
--ce4e-b8d7-287ec\
-e8b6a00\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:c0be3b27-c00a-d\
-b45-868b-73f50a3\
-8e61a\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d3146eb\
-2-f06d-4c4a-aafc\
--28d6a0febd34\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d3146eb2-f06d\
--4c4a-aafc-28d6a\
-0febd34\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:9f\
-3e5831-0045-ce4e\
--b8d7-287ece8b6a\
-00\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:10-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x0a\xce\
-U\xc4\x00\x00\x01\x02IDAT8\xcb\xc5\xd3;J\
-\x83A\x14\x05\xe0kb\x137a\x5c\x82\x88\x0a\x82X\
-\x0aVji+\xf1\x01\x1a\x89\xad\x9d\xa0\xab\x10;\xc1\
-B\x13\x1f\x85B\x0a;\xc1&\x9d\xae@?\x97\x11\x9b\
-\xfb\xcbo\xd0\x22\xa4\xb080sg\xe6\xcc\xb9s\xce\
-D\xbf\xdf\x8fQ\x10#\x13\xa0\xc08*9\x1eK\xc4\
-/\xf3j\x22\x101\xb0q\x18T\x0a\x82\x82\xb5\x89K\
-tp\x8d\x07\xccb\x1b]\x5c\xa1\x8ds,\x97\x15T\
-q\x8f\x1e\x0e\xf2\xc0n\x12Na\x09-\xec\xa0\x81S\
-|\xe6zD\x0ezC\xca\x9f\xc3;\xea\x81\x0b\xec\xe7\
-B\x0d\xc7xL\xb9\xedl\xa9\x93-\xad\x97H\xee\xb0\
-\x198\xc3I\xc9\x89U\x1cbo\x00-\xcc\x94\x08\x9e\
-\xb1\x16\xf9 \x9f\x98\x1f\xa2\x85#\xbc\xa1V\x14\x9a\xf8\
-H\xe97)\xaf\x8b\x85\xbc\xfd\x09\xb7\xe9\xce\x0b^1\
-]\xb61P\xc7F:\xb0\x95\x07'\xb1\x98\xee4\xd2\
-\x89\x15L\x14Y\xf8\x11\x8aQ\x82T$\xb22\x80\xbf\
-\xea\xdf\xe9\x8d\x7f\xff\x8d_\x7fp\xf0\x86\xddz\xe5\x08\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x072\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:15-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:15-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:cb47ea33-de52\
--454a-829e-e012f\
-c72a05a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:958fcb95-2089-0\
-d4b-aa78-19721de\
-57ba9\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:ae4e829\
-1-dd06-f84f-adac\
--81132b7c1183\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:ae4e8291-dd06\
--f84f-adac-81132\
-b7c1183\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:cb\
-47ea33-de52-454a\
--829e-e012fc72a0\
-5a\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:15-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xdb*\
-\x95>\x00\x00\x00\xe7IDAT8\x8dc\xf8\xff\xff\
-?\x03%\x98\xe1\xd9\xb3g\xb80#\x1e98\xa6H\
-3.\x03\x98\x90\xd8\x07\x80\xb8\x1e\xcaf&\xc6\x00d\
-\x9b\xd7\x02\xf1Q \xbe\x06\xc4\xa9\xb8\x0c\xc1e\xc04\
- >\x05e\x9b\x02\xf1\x1b \xf6\x86\xf2Yp\x19\x00\
-3\xbd\x06\x88o\x01\xb1\x00\x92\x9c?\x10?\x07bc\
-t\x97\xa0kN\x84*TB\x12\x87\xc9e\x00\xf1\x13\
- \x96C\xd6\x83\xec$\x90\x13\xdfB\x9d\x8c\xeeT\x98\
-!\x8d@|\x03\x88y`\x01\x0eS`\x0e\xc4\xef\x80\
-\xd8\x0b\xcag\x85\x86\x07\x0c3!\x192\x07\x88O\x22\
-{A\x1d\x88o\x03q\x18\xb1q\x0f\xc4K\x81x5\
-\xcc\x80\x85@\xfc\x1f\x88\x17\x00\xf1: ^\x83\x07\x83\
-\xe4W\x00\xf1\x16\xa8\x9e\x08\x90\x01\x16\xd0\xc0K%\x12\
-\xa7\x01q\x12\x10\xc7\x00\xb1\x0a\xb1N\xc6\x9b\x94\x99\xa0\
-!\xceL\x22\x06\xe9a\xa4(+\x830\x00i\xc0\xe1\
-i\xbb\xc8Q\xf9\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\xa4\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:20-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:20-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:1a7552a2-f68d\
--a64f-90e4-3405c\
-c321f79\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:2c5d6d28-3e2a-4\
-146-9f1c-091cd06\
-44781\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:4faee9c\
-4-c218-1d43-9503\
--98b4959dbf3f\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:4faee9c4-c218\
--1d43-9503-98b49\
-59dbf3f\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:1a\
-7552a2-f68d-a64f\
--90e4-3405cc321f\
-79\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:20-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x1c\xeb\
-F\xde\x00\x00\x01YIDAT8\xcbm\xd3\xbf/\
-\x04A\x18\xc6\xf1Y\xe7Bq\x17?\xa2$\xa2E\x8e\
-\x9a\xd3*\xe4r\x85H\x5c\xe8N\xa1r\x9d\xeb\xe94\
-\x045\x05\x95F\x08\x89J-B#\xd8\xa3\xa2Z\x89\
-\xd6?\xe0;\xf2L\xf2\x9al\xf1\xc9\xecLv\xde}\
-\xe7\x9dw]\x96eN\xba4\x16\xd1\xc0.Np\x8c\
--\xcc\xe6\xbc\xeb\xc2B\xa2\xb1\x8e'\xdc\xe1\x00-\xb4\
-q\x8aW\x5ca\xd8\x06\xb1\xd16\xf0\x85U\xf3%\xab\
-\x84C|`\x22\x04q\xe6\xcb~\xf3\xb8\x89n\x15L\
-\xa0M\xbc\xa1/dPT\xda+\xa6\x06IN\x06\x89\
-\xc9\xf6\x5c5\xfa\x0b\xd0\xd0\x99\xe3z\xc4\xa3=\xee4\
-:\x18\xf0\x93=\x9d\xcd)\xd5#,\x9bl\xc2f\xff\
-\xce\xba\x9e{\xf1\x88\xaaS\x85[\xe6\xc5%\xd5\xa3n\
-\xd6\xf6\xf1\x8c1\xb3v\x89\xa6\xd3=\xb7M\x06~\x5c\
-\xc07j\xd8\xc1\x0b\x06\xa3c\xdc\xf8\xe3\xfb\x87me\
-\x11\x02\x84 \xf3\xf8\xc1\x03\x86\xb4\xd6\xad\xb1\xac\xbe\xa8\
-\xf8IU\x93RN\xb5g0\x9a\x13|\x11\xf7~\x1e\
-\xces\x1d\x152\xbe\xfbB4O\xfd\xf9m+\x8f\xe0\
-SM\xe2\xa2\x8dqO\xdc\xe2\xcc\xfe\x0b!\xddI\xbc\
-\xabI\xa6\xd0c6\x95\x95v\xaa\xcd!\x9b$n\x90\
-~uXG\xf7|\xa1j\xa7*f3n8\x97\xf7\
-\x8b\xfa\x0e\xc3\x1c\xd6\xd4\xe2\x15s\x03\xff\xba\xf3\x17\xc7\
-\x1d\xeb\x0c\x9c\x1a\xd4\xe3\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\x8f\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:34-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:34-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:e6b34f6d-3d90\
--5a46-b4d8-abf36\
-82ac6ff\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:fcd8b74c-779b-0\
-244-adcb-5d7fa6a\
-bee87\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:7c6de3b\
-6-f9f3-af4a-961e\
--8f7d5a7750c1\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:7c6de3b6-f9f3\
--af4a-961e-8f7d5\
-a7750c1\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:e6\
-b34f6d-3d90-5a46\
--b4d8-abf3682ac6\
-ff\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:34-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x92\xea\
-G\xa3\x00\x00\x01DIDAT8\xcb\x8d\xd3\xcd+\
-DQ\x1c\xc6\xf1;\x98\xc6\xc6F\x94-K\x12M^\
-66^\xd76\xb2\xb0\xf0R6\xec\x06\xd9\x88By\
-\xd9X\xcb\x96\x90\x11Y\xb2\x95\x97\xbc'\x0b\xd1D\xe9\
-\x16;\xff\x81\xef\xaf\x9e[\xa7\xd3\x9d1\x8b\xcf=\xf7\
-\xdcs\xees\xde:A\x18\x86\x95\xd8\xc01\x0e\xb0\x8d\
-]dU\xb7r\x0f\xfb\x98D\x80\x84\xca\xc0\x1e]\xf8\
-\xc68\xc6\xf0\xaa\x1f\x87\xf5\xc3\x08\xd6\xf1\x8b/,\xba\
-!\xf6\xd2\x8b\x8b(\x11;\x18r\xea\xa6\x1e\xe7\xa8\xc3\
-\x1bV\xdc\x19X\xc0\x8d\xd39\xabQ\xdd\x80&<\xea\
-\xbd\x069\xcc\x14\x0a\xc8i\x1fN\xb4\xf6+\x05T\xa8\
-O'^\x90\x8a\x0bh\xc3\x84\xf6\xc4\x962\xaaz7\
-\x92\xea\x93\xc6}\x5c@\xc2\x9bzZ\xa7\x14x\xed\xad\
-x\x88\x0b(U\xd9\x81g\x8db\xcbY\xf6\xda[\xf2\
-\x05\x98\x14\x9e0\xa7z\x03>0\xe0\xf4)\x18`\x1b\
-t\xeb\x8d\xb8\x8a\xcdb\x03j\xf1\xae\x91\xa3o\xa7\x98\
-/& \x1aq\x09\x9fX\xc3\x19\xeeP\x95/\xa0\xc7\
-\x09(q:\x0db\x0b\x0b\xa8\xd6\xb7\xb2\xb8S\xe8\xc3\
-\xb5w|\xffiT@\xb9U\xda\xf1\xe3\xdd>s\xa4\
-\x1bj\x0e\x9d6\xbb+\x97\xba?\xc9h\xda\xfd\x98E\
-\x06S\x05dd\x1a\xcd6\x9b?s\x04\x06V\xd4G\
-\x86o\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x06\xfe\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:38-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:38-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:23076a09-b761\
--1c42-bde6-f9ba5\
-e433299\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:0677020a-02f4-c\
-e43-bfaa-b37c44a\
-418ef\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:f963633\
-f-c387-6e4a-9a81\
--5f6ea8d4956b\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:f963633f-c387\
--6e4a-9a81-5f6ea\
-8d4956b\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:23\
-076a09-b761-1c42\
--bde6-f9ba5e4332\
-99\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:38-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>Re\
-,\xad\x00\x00\x00\xb3IDAT8\xcb\x9d\x93[\x0a\
-\xc20\x10E[\xebR\xfc\xb2\x15\x17\xa0\x0b\xf2\x05\xad\
-q5\xe2\xbf\xf8\xa2\xfb\xd1\x05\xa4_\xaeA\xef\xe0\x14\
-\x86\x90i\x12\x03\x87\xa4I\xce\xa5\xb43\x99\xb56K\
-\xa0\xe0\xb9\x02w\xb0\xf8G\x9e\x83\x17\xf8\x80u\xaa\x5c\
-\x82\x8eDp\x04M\x8a<\xb5\xbfa\xf8\xf9\x11\x13\xe0\
-\xca{qv\x0b\x05h\xf28&@\x93i?\x0f\x05\
-\x84\xe4\xc1\x80!\xb9\xbf\xa3\x06\xc4\xc8j@\xac\xec\x0d\
-\x90E\xa2}0){\xdf`\xc6\x15f\xc4\xaf\xca\x1d\
-\xa9g\xe4\x06Pc<\xc1&\xb1\xb1\xce\xa0\xa6\xc5\x95\
-\x1b\xe3\x04Z.\xd1\x10\x17\xf0\x06+\x0aX\x82\x1d8\
-0F\xac}\x18f\x0b&_\x82\x88\xe6\xa1 \xdfR\
-Z\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07H\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:16-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:16-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:4faffc4f-30e5\
--c749-a4e9-8ad40\
-ddc94c9\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:91f40b40-189c-e\
-54a-9f47-8262ba5\
-6c347\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e4d4fb2\
-2-c392-f14e-b28f\
--f5504b5f3a04\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e4d4fb22-c392\
--f14e-b28f-f5504\
-b5f3a04\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:4f\
-affc4f-30e5-c749\
--a4e9-8ad40ddc94\
-c9\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:16-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>0\x0f\
-\xda\xd2\x00\x00\x00\xfdIDAT8\x11cx\xf6\xec\
-\x19\x03\x143\x0213\x12\x1f\x1bf\x82b\xb8\x18\x03\
-\x01\x0d\xc8\x18\xab\xe10\x9bA\xb4,\x10G`Q\xc4\
-\x88\xc4\xb6\x05bGt\x03`N\xf2\x04\xe2kh\x9a\
-\x90m-\x05\xe2_@|\x18\x88Y\xb1\x19\xe0\x02\xc4\
-'\xb0\x84\x87\x00\x10o\x05\xe2\xa3@\x9c\x02\xc4\xa7\x80\
-\x98\x13\xa6\x0e\xd9\x00W\xa8$\xb2\xf3\x9d\x81\xf8\x1e\x10\
-/\x86\xf25\x81\xf8\x02\x10\xb3\xe32\xe04\x92\xe6*\
- ~\x05\xc4\xb1Hb\xe6@|\x1e\x9f\x01g\xa1\xec\
-y@\xfc\x18\x88\xc5\xa0|6(mB\xc8\x803P\
-v2\x10\xdf\x02\xe244/\x114\x00\xd9\x0b\xa6@\
-|\x13\x88\xd7B\x03\x92(/\xc0\x02\x91\x05J\xb3C\
-\x03\xf0>\x10\xeb\x01\xb1\x0a\xb1.@O\xd6Y@\xfc\
-\x00j\x18\xc8\x12.l\x06\x80\xa2\xec\x18ZBbD\
-\x92\xd7\x81zi\x0d\xae\xbc\x00J\x1c\xd2\x04\xf2\x01\x07\
-\x10\x0b\x91\x9b\x99\x98pe&\x5c\x19\x87\x01G\xc6B\
-Q\x03\x00\xcf/\xd8\x13h \x9d\xfe\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07a\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:28-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:28-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:17e4b2b9-6e75\
--404f-a05e-b3fa2\
-3200209\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:0a77dd03-ed27-5\
-041-b2d4-f41f3dd\
-d87ae\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:29f2f79\
-2-848a-5f4a-b23f\
--818c6cb756a4\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:29f2f792-848a\
--5f4a-b23f-818c6\
-cb756a4\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:17\
-e4b2b9-6e75-404f\
--a05e-b3fa232002\
-09\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:28-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>kc\
-\xd4\x0f\x00\x00\x01\x16IDAT8\xcb\x8d\xd3\xbf.\
-DQ\x10\x06\xf0{\xafD\xec\x8a\x9eD\x83\x8dR\xa9\
-\xd8\x86\x07\xa0\xa0\xe2%\xd4\xfb\x0ak\x0b$\xf4l\xa3\
-\xf4\x00\xa2@GXJ\x89\xc26?\xaf\xa10Gn\
-\xae\xbb\xd9{\x92\x933\xe7\xcf|\xf3\x9d\xf9f2d\
-\x0df^\xd9\x17\xc9n\xe2\x9c\x1e\xaf`\x80\xf5\xf2}\
-\xd6\x90A\x86[\x8c\xf0\x19@\xed&\x00\x89\xfa)\x1e\
-\xc2^\xc3\x18\xbb\xd3\x00\x12\xf5\x03|`\xa9tw\x8f\
-\xfdi\x003\xb1\x1e\xe3\xb9t\xde\x8e\xaft'\x01\x14\
-\xe1\x9c\x97\x80\x1e\xd1\x8b\xfd\x16^\xd0\xaa\x02\xe45r\
-\xcd\xc6z\x89\xf3\xb0\x07\xb8N\xc1\xfe\xe9\x8a\xc3x\x94\
-\xbe\xb0\xe9wl\x04\xfdq\xa2\x8f\xbcZ$g\x91\xb0\
-\xa7\xa0}\x85o\x1c\xc5\xfd\x0d\x86e\x85\x92\xe3*\xee\
-B\xaa\xc58\xeb\xe1\x22\x22g8\xc1\x1b\xe6\xeb\x00\x06\
-\x91\xd9\xba\xa4\xceE\xe4w,O*\xe5NP\xef\x94\
-\xa4\xdaF?*o\x88\x85\x8a\xbc\x7f\x00EI\xef\xaf\
-(\x92\x11^#\xdb\xdd\xba&\xaa\xeb\x856v\xb0\x17\
-N\xad)\x127j\xa6b\x92c\x9a?;\xdc\xdc>\
-\x9b\x0e [\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07}\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:26-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:26-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:e860fcc1-752e\
--bd41-b882-9da00\
-1f1edb8\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:05ff5110-169f-3\
-543-87f9-25eca93\
-bcd3d\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c062d93\
-b-2fab-8441-8a52\
--3230c64518e1\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c062d93b-2fab\
--8441-8a52-3230c\
-64518e1\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:e8\
-60fcc1-752e-bd41\
--b882-9da001f1ed\
-b8\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:26-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xb2G\
-\x19\xd1\x00\x00\x012IDAT8\x8d}\xd2\xbd/\
-\x04A\x18\xc7\xf1\xdds\x5cG\xfc\x05T\xa2t\xe2%\
-\x1a=\x0a/\xed%G\xa2\x90\x9c\x5c'\xd1\x89h\xfd\
-\x0fZ\x05!\x94^B!\xc1i.D%4bC\
-\x90hu\xbe\x13\xcf$\xbfLf\xb7\xf8dfw\xe7\
-\xf7\xcc\x93\x99M\xb2,K\x22:l\x9c\xc2>\x16\x90\
-b\x1d{\xd8B\x8f[S\x14^\xc4\x1b\xb6q\x83g\
-\x5ca\x15\x178A9/\x5c\xc7\x17\xc6\xed\xb9\x85\xa3\
-`m\x1b\xb3\xfa\xa2\x14\x84\xc7\xec\xf9\x14\x07\xb2\xael\
-\xa3\xeb\xa2\xee_\xa6\xd2\xf6\xa7\x84o\xf1(\xe1.\x1b\
-\x9bxBwX`\x0e\x936?\xc7%\xee\xd0\x90\x22\
-+x\xc7px\x88%\x99\x9f\xe1\xd8\xe6U|\xa3\x86\
-%|`\xc4g\xb4\x80\xefb\xd7v\xd7o\x83\xf8\xb1\
-\xf0\xa8\x1exx\xfa\x1b\xb8\x97n:\xe5l^dg\
-\xbf>\xd1\xd6'\xec\xde\x07\x82p#\xb6\xb3\x16\xf0\xae\
-\xb1\x16\xb4\xbe\x89W\x0c\xc5\xc2Z\xc0\xb5\xd8\x96s\xe8\
-\xc5!\x1e\xd0\x97\x17\xd6\x02n\xf7yi\xd9\xfd\xb6;\
-r\xef\xd1\xb0/0\x93\xfd\xff\x14M+\xe4~\xdb\xe9\
-\x9c\xeb\x8d\x16X\xc6\xaf\xdd{-\x08\xa6Ea_\xa0\
-\x82\xfe\xe0C\xe1\xae\xea\x0f\xb2\x84\xe9\x12\x9d\x0b\xeaE\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xb1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:21-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:21-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:dd1da57c-495b\
--134a-9faa-028dc\
-3476b62\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:33656f05-49b1-3\
-54d-8eb2-812e9e2\
-e2e80\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e013b45\
-b-a011-b74c-baa2\
--077fa9a71c56\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e013b45b-a011\
--b74c-baa2-077fa\
-9a71c56\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:dd\
-1da57c-495b-134a\
--9faa-028dc3476b\
-62\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:21-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x1b7\
-\x0a\xc7\x00\x00\x01fIDAT8\xcb\x85\xd3\xcd+\
-DQ\x18\xc7\xf1cfV\x16f\xc4\x82b\xabD\x13\
-\xc5\x8a)\x7f\x81\x05%\xb6#R\xc8\xc6\x02Ia\x8d\
-\xad\xf2\x12Y\xc9b\x08EY\xd8)\x0b\xa4\x8c\xd7\x8d\
-\xd4\x94\x0d+k\xbe\xa7~\xa7\x9en\x17\x8bO\xf7\xde\
-\xe7\xbc=\xe7\xb9\xe7\xb8R\xa9\xe4$\xa1g\x0a\xfdX\
-\xc1\x0e6\xb1\x80\xce\x98\xbe.\x04\xca\xf4\xec\xc6\x1dn\
-\xb0\x8e)\xcca\x0f\x8f8F\xbd\x9d\xc4\xce6\x8e\x0f\
-\x0c\x9b\x95\xacJ\xac\xe2\x15\xcda\x12gV\xfeD\xbb\
-\x19\x90Rf\x09\xbd\x87\xf8\xb4\xb2\xc9\x84\x0cRJ{\
-D\x1djQ\x13\xd9\x9a\xd7`\xbe\x0f\xb0\x1c&\xf0\x05\
-\xbbUC#.\x94f\x97bIL\xe2\x0bk\x8ae\
-\xf1\xe0\xb7\xe5T\xed-5L\xa8\xe2~\xc0\x92bu\
-*b\x1f\xb6\xd1\xaa\xf8\x15rN\xbfj\xe6\x97\xc2\xfd\
-e\x1f\x83\xce\xfc\xe7\xd0\xd0\xa2\x0cF\xf5g\xbc1I\
-\x9b~'~\xfb\xfee\x1e\x05\xd3\xd0\x8b\xef\x18\xef\xa8\
-V\x9f\xb4\x0a\x9f\xf5\x1f\x1dxA\x959 \x85\x98\x09\
-\x86\xcc\x22=\xb8\xf4\x05\x0e\x01\x7f\xc26L\x87\x0a,\
-\xe2\x1a\xe7*\xa0\xdd\x7f\x11y{\x94}\xa5\xdf0\xfb\
-O\xe1\xfc98\xc3\xae\xbd\x0b\xe1(7\xe1\x19Gh\
-C\xb9\x19\x94Qm\x8a\x1a\x9c\x0cm\xd1\xdb\x95\xd6\x09\
-{\xd2\x85:\xc4)\xee\xb5\xe7|$\x1b\xe7\xe2\xae\xa8\
-.NN\x03\x06t\xf2\x92\xd1\xc1\xde\x0f\xf5\xc3\xfab\
-u+J\xf0\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\xb3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:48-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:48-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:92751a28-cc55\
--eb48-acde-71575\
-e0e3af7\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:4faee242-a16d-7\
-94b-9be1-c86fd0b\
-b3150\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:199a3eb\
-5-5503-ce48-9956\
--d15502f995e8\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:199a3eb5-5503\
--ce48-9956-d1550\
-2f995e8\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:92\
-751a28-cc55-eb48\
--acde-71575e0e3a\
-f7\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:48-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>G\xff\
-pR\x00\x00\x01hIDAT8\x11\x05\xc1\xcdk\
-\xcf\x01\x00\xc0\xe1\xcf\xef\xfb\xfbyI\xd9&'\xc5_\
-@\x8b\x1c\xc7\xbf\xb0\x92\xcb\x94\xd3\xbc%9J\xa4\x16\
-7\x97\xad\x9c\x14\xdbe9p\xf0\x12\x0b\xe5\xa2\xec\x22\
-\x879\xcc\xf2r\xa2\x9e\xab?\x81\xe7\x09!\x0c\x08\x13\
-,`\x05\xebX\xc3=\x9cB\x08\x03B!\x8c\x10\xe6\
-\xb1\x8d-<\xc6-,\xe1\x19\xbec\x03G\x10\x06\x14\
-\x06\x84\xeb\xf8\x8bK\x08!\x840\x8d\x87\xf8\x8dc\x08\
-C\x08\xf3\xf8\x8b\x93\x08c\x84}\x18\x10B\xb8\x89\xef\
-\x98Aa\x82m\x5cA\xd8\x870\x85M\xac \x8c0\
-Ax\x81e\x14\x16\xf0\x15a\x8c0\x83M\xfc\xc3?\
-\xdcG\x08\xe18vp \xac`\x0d!\x1c\xc2\x16\x1e\
-\xe0\x09\x96\xf0\x11\x8f\x10\xc2\x1e|\xc1\xe9\xb0\x8e\xdb\x08\
-\xe1\x06V\x11^\xe2<v\xe1\x13N \x84\x97\xb8\x10\
-\xd6p\x0fa\x84]\x08\xe1\x15\xae\x22\x8c0A\x08\xef\
-\xb0\x10\xee\xe2\x05\xc2\x18a@x\x8e\xcb\x08\x13\x84\xb0\
-\x1f\xdb\x98\x0ds\xf8\x85\x83\x08\x03F\x08oq\x0da\
-\x82\x09\xc2\x19|\xc68\x84\x0d\xac\x22\x0c\x18#\x5c\xc4\
-\x1c\xc2n\x84\xf0\x0d\x8b(\x84\xc3\xf8\x83;\x08!\x84\
-\x10B\xf8\x80\xa7\x08\x85\x01\xe1(~\xe2\x0dNb/\
-B\x98\xc2Y\xec\xe0)\xc6\x08\xa3\x10\x06\x84i,\xe3\
-\x07\xb6\xf0\x1a\xef\xb1\x83\xcfXD\x08#\x14B\x18\x10\
-\xc2\x01\x9c\xc6\x22\xcea\x16c\x840B\xe8?\xe9\xeb\
-\xf1`Cu\xb2\xe6\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07@\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:37-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:37-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:43620d2b-ca01\
--da48-94e3-a540f\
-bb6b715\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:8693187f-1a2a-9\
-249-8fee-05c5d45\
-ed59c\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:946a827\
-4-bee9-d54c-96ec\
--829730924f9b\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:946a8274-bee9\
--d54c-96ec-82973\
-0924f9b\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:43\
-620d2b-ca01-da48\
--94e3-a540fbb6b7\
-15\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:37-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>J\xd7\
-p\xf2\x00\x00\x00\xf5IDAT8\xcb\xa5\xd3;\x0a\
-\xc2@\x10\x06\xe0M\x8cH\xb0\xf0\x0066\x166\x16\
-bo\xe7AT|\x83\x8a\x85\x85\x17\xf0\x0c6B\xc4\
-\xc6\x07\xbe\xc0;\x88\x85\x9e\x22\x85\x8d'\x90\xf8/\xcc\
-\xc2\x90l\x8c\x8f\xe2c';\xbb\x13v\x87\x15\x9e\xe7\
-\x89\x7f\x08\xd7u\xb94\x14\xa0\x18\x22\x0f)\xbeG\x05\
-&\x8dGx\xc0\x19npe.\xf0\x84*\xad\xb5x\
-\x01\x83\xc6-t)NB\x82\xd84w\x80:\xc51\
-]\x81=[`\xf8\x8e'\xed\xa0\x19U@-\x88\xb3\
-\xf9\x18\xcb7\xa2\x0a4|\x9b\xb8\xc3\xaf\x05\xb2\x90\x81\
-\xf5'G\xe0\x05Tw&0\x85\x19t\xbe)\xa0\xe6\
-{0\x06\x07\xda\xbf\x1c\xc1\x8e\xea\x82\xa9\xe9\x82\xa5\xb9\
-\xc4@^h\xda\xe4o\xa3\xf1&\x1fx\x0b\x1b\xa8h\
-\xfe\x1c\x9a\x17t)'\x98\xc3\x9d\xde\x80\x8cW\xb0d\
-\x16,\xef\xd0}\x94d\x812\x8c\xe8\xa6k\xd0\x82\x01\
-}\xf7\x89\x8aU^\xc6C\xc8\xbd\x00\xb2\x88\xecP\xf9\
-E\xedK\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07^\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:16-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:16-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:856d91b1-148f\
--7f44-b372-1ea49\
-afaee53\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:761b2a90-f1dc-e\
-f4d-9053-22c8de7\
-df2d8\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:32c5db0\
-8-4476-0449-a96b\
--5ebd65b7b5ba\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:32c5db08-4476\
--0449-a96b-5ebd6\
-5b7b5ba\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:85\
-6d91b1-148f-7f44\
--b372-1ea49afaee\
-53\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:16-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x8a\xa4\
-\x86\xb1\x00\x00\x01\x13IDAT8\x8d\xad\xd3\xbf+\
-\xc5Q\x18\xc7\xf1\xf3\xbd7\x83P~l\xa2\xfc\xc8@\
-\xf9\x1f\x98\x8c&\x9b\xc5\x8fB\xa9\xabl\x06\x03\x8b\xc5\
-\x1f \x93\x08)\x84UJ\x190\xb1)\xe6W\xfe\x0b\
-\x06\xcf\xad\xd3\x15n7\xdfz\xf7}\x9e\xe7\x9c\xf39\
-O\xcf\xa7\x93P\x04)\x8b\xff\x22\xa1\x84\x22E\xd20\
-\x09\x93\xb8\xc2)\xce\xea\xe4\x1c\x07\x18Lq\xf0\x02\xd3\
-X\xc2\xc2/,\x063x\xc5r\xc2%f\x1bh\x7f\
-\x0f+\x09\xa3\xe8\x88b\x13\xca1\xa0\x9f(\xc7\xde\x13\
-T\x12\xc61\x8f\xdeL\xbd\xf8\xe5\xe6\x22\x13XI\x98\
-\xc3-^\xb0\x8b\x96\xcc\xa6\xba\x04\xfa\xd0\x8e\xae(>\
-E\xfcS'\xdf\x04\xd6\xf1\x8e\xadX\xd8\xc1u\xb6\xb9\
-\x96\x92\x9a\x19$\xf4\xe0\x0e\x87\x91?c\xea\x0f\x17\x8e\
-\xaa\x02\xdbX\x8b\xe2\x1b\xc6P\xc9\xc4:\xd0\x19\xffj\
-\xdc\x1c\xf6\xaf&\xec\xe3\x03C\xd8\xc4FX{\x13\xb3\
-9\x8e\x8e\xee\xf1\x18<\xf8\xfa&R\x0cl\x10\xadh\
-\x8b\xbc\x09\xdd\xe1\xf9\x00F0\x9c1\x82~\xff\xf5\x98\
-\xf2\xc9\xe66\xd5\xf3\xc4\xd3'\xb2\xa8\xe7\xc0\xe6\xb9\xe8\
-\xf3\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\x9c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-34-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:41-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:41-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:457c200d-a624\
--3745-a56b-a9d2f\
-75f918e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:f7ff82e5-5cdd-7\
-a40-8c3a-83f55e8\
-72391\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:435a3cc\
-6-5747-3e4a-aa31\
--507aa135be9c\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:435a3cc6-5747\
--3e4a-aa31-507aa\
-135be9c\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:34-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:45\
-7c200d-a624-3745\
--a56b-a9d2f75f91\
-8e\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:41-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>k\xb0\
-g\x9c\x00\x00\x01QIDAT8\x11\x95\xc1\xcd\x8b\
-Ma\x1c\x00\xe0\xe7}\xcf\x91+w\x16\x18\x84\x9d\x84\
-R\xb6\xb3\x1c\xca\xd6GV\xfe\x87\xb1\xb2\xbb\xcd\x86\x9d\
-\x8d,,&\xb1\xb0\xf2\x95\x8dY\xca\xd6BRd\x94\
-\x8c\x159qw\x12\xc3p\xce\xeb\xd4oq\xbb\x8ax\
-\x9e\xd44\xcd<\xce\x9aH\xfe\xae\xa0\xc2\x07\x9c\xaf\xb1\
-\x80\x01\xeeb\x06\x9di\x09EHH\xf8\x86\x11\x9e\xd5\
-(\xb8\x85\x9b\xfe\xcf\x11l\xce\xc2P\xd8\x82\x84\x0a\x15\
-\x12f0@\x12\xb6\x0b\x1b\xd1eT\xf8\x8c9\x5cF\
-A\x8b\x16\x05\x17p\x1c\x05gp\xc9D\xca\xc8\xf8\x8e\
-}\xd8-\x9c\xc4aa?f\x85\x11\x1e\x09\xb5^\x16\
-Zl\xc5XX\xc0\xbcP\xf0\x16'\xd0\xe1\xaa\xd0\xea\
-\xd5B\xc2,\x1a\xe1\x0b\xbe\x0ak\xb8\x88m8\xe77\
-5:\x0c\xb1\x13\xa7\xb0\x0bs8\x88\xc7X\xc7\x13\xec\
-\xc1\x01\x13E\xafF\x87M\xb8\x82\xe7X\xc3!\xac\xe2\
-\x1d\x06\xb8\x8dWx\x88%\x8c\x91\xf5\xb2\x90\xf0\x12K\
-\xb8\x81\xf7x\x80O\x18b/\xde\xe0\x05\x16\x85\xac\x97\
-M\xdb ,\xe3\xb5p\x0fO\x85\x11\xc6\xc2\x0f\xbd\x1a\
-\xc5D\x87\x84kB\xc6u!c\x05+BF\xa9Q\
-a]hM\xebLt\xa6\xb5\xa8k|\xc4\x22\x8ea\
-\xe0\xdf\xfc\xc4Q\xdcIM\xd3\xec\xc0i\x0c\xd1!\xf9\
-\xb3\x22\xd4X\xc5\xfd_Y\xcaW\x83vo;\xf5\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xab\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:01-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:01-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:f3d40c64-4c65\
--7a48-a506-fc2c9\
-d8a2a47\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:534ed58d-1edd-4\
-44e-b4b6-591f72f\
-f34ce\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:f245371\
-7-edfe-3d43-be1e\
--6fafe01de319\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:f2453717-edfe\
--3d43-be1e-6fafe\
-01de319\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:f3\
-d40c64-4c65-7a48\
--a506-fc2c9d8a2a\
-47\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:01-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd4\xf3\
-&%\x00\x00\x01`IDAT8\x8d\xa5\xd3;(\
-\x85a\x1c\xc7\xf1\x97\xe3\x92s(\xc9fR\xe4\x1er\
-]\x94b:e1\x1b\x0cfJ)\x85\x84\xc5hp\
-\xbf_V\xbbM\x19(\xf7\x92KV'g\xb3\x1a,\
-\xaf\xef_\xbf\xa7\x9e\xde^\x16\xa7>\xbd\xb7\xe7\xf9=\
-\xcf\xf3\xffw\x82l6\x1b\xa0\x10)\x14\xc7p\xef\x0b\
-4\xb6\x12\xd3\xba\x0f\x02}8\xc5\x0b\xaeq\x8b;\xdc\
-\xeb\xfe\x06\x0fH+l\x02ohF\xb9\x05$\xf1\x84\
-a4\xa2\x1b\xad\xa8G':\xf4\xce&/\xe2\x1d\x1f\
-x\xc4@\xa0\x0f\x97\xa8s\xdbB)\xfa\xbdg_Z\
-\x93s\x90p\x01W\xe8\xd2\x802\x9c!\xc4\xa87\xd1\
-&\x0c\xa9\x06=~\x0dR:\xab\xed \xa1\xb3\xaf\xa3\
-I\xdb\x1d\xd7\xe0U\x85\xee\xa2\x05}.\xa0\x04\xe7\xe8\
-\xd5\xca\x87\xde\xaa\x16\xf2\xaa\x1d\x9e\xa0\x02\xc7\x0aZv\
-\x01E\xaa\xba\x15f\xd3\x9b\x9c\xafk->1\xe3}\
-\xb3n\xad\xb9\x00\x1b\x98\xc1~\xe4\xbc\x81\x8ed\xd7j\
-\xb5nR\xcfv\xddv\x01I\xd5\xa0!2)\x88<\
-[[\xed7\x821\xec\xf8E\xb43\xb6EV\x8f\x0b\
-\xb1E\x9e\xb5\x9b%?\xc0\xce\xd4\xaeAy\xc8\x8d\xe1\
-jR\x83/\xac\xf8\x01\x17\xa8\x8aY\xf97\xd6\xda\x0d\
-\xbf\x0b\x19\xb5o\x0a\xf3\x98\xfb\xc5\x82\x0ah\xff\x8d\x03\
-\x17`\xe7\x9b\xc5\x1e\xb6T\xdd\xbfX\xab\x8f0\xf8\x13\
-\x10\x86\xe1\xbf|\x03Qn\x01\x1f\xc6\xba\xf3\x1b\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xc5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x0a\x00\x00\x00\x0a\x08\x06\x00\x00\x00\x8d2\xcf\xbd\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x06\xbeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:xmpMM=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/mm/\x22 xm\
-lns:stEvt=\x22http:\
-//ns.adobe.com/x\
-ap/1.0/sType/Res\
-ourceEvent#\x22 xml\
-ns:dc=\x22http://pu\
-rl.org/dc/elemen\
-ts/1.1/\x22 xmlns:p\
-hotoshop=\x22http:/\
-/ns.adobe.com/ph\
-otoshop/1.0/\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-04-26T14:37:\
-13-03:00\x22 xmp:Me\
-tadataDate=\x222020\
--05-03T08:46:13-\
-03:00\x22 xmp:Modif\
-yDate=\x222020-05-0\
-3T08:46:13-03:00\
-\x22 xmpMM:Instance\
-ID=\x22xmp.iid:2ce5\
-4e64-1b68-5140-b\
-404-101ae4f2390d\
-\x22 xmpMM:Document\
-ID=\x22adobe:docid:\
-photoshop:06387a\
-18-9b10-4e44-b0d\
-3-6a4c6e30ef94\x22 \
-xmpMM:OriginalDo\
-cumentID=\x22xmp.di\
-d:5349ee02-98da-\
-9648-893b-acc1e6\
-33f5f6\x22 dc:forma\
-t=\x22image/png\x22 ph\
-otoshop:ColorMod\
-e=\x223\x22 photoshop:\
-ICCProfile=\x22sRGB\
- IEC61966-2.1\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:5349ee02-98da\
--9648-893b-acc1e\
-633f5f6\x22 stEvt:w\
-hen=\x222020-04-26T\
-14:37:13-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:68\
-2e5c79-1a3b-8647\
--b55c-bcf3054d2d\
-2f\x22 stEvt:when=\x22\
-2020-04-26T14:37\
-:13-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> <rdf:li stEv\
-t:action=\x22saved\x22\
- stEvt:instanceI\
-D=\x22xmp.iid:2ce54\
-e64-1b68-5140-b4\
-04-101ae4f2390d\x22\
- stEvt:when=\x22202\
-0-05-03T08:46:13\
--03:00\x22 stEvt:so\
-ftwareAgent=\x22Ado\
-be Photoshop 21.\
-0 (Windows)\x22 stE\
-vt:changed=\x22/\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\xcfr\x9f\xf7\x00\
-\x00\x00\xadIDAT\x18\x95\x85\xce\xa1jBq\x14\
-\x07\xe0\xcf\xeb\x15e\x93\x81 \x88\xcf`X\x9ba\xc5\
-\x17XY_\x11\xc50L\x82\xb0w\xd8\x1e\xc0 \xa2\
-\xd9\x22\xa8a\xc2\x9a`\xb2\xdb\x8c\xa2\x82\x0f`\x98\xe5\
-\x9f.\xa2'\x1d8\xdf9\xe7\x97\xfa\xe9\x0d\xdc\xa8\x17\
-\xbcb\x19\xdfRh\xa2\x81\xfe=8F\x84\xf15X\
-\x0a\xc3\x1d\x16X\xe3\x14%P\x01+lPF\x0b[\
-|%a\x0aY\xe4B\x9f\xc1\x032\xc9\xd7'T\x90\
-\xc6\x11=L\xb0\x8fP\xc5\x08\xef\xf8G\x1d\x9fx\xc4\
-3\xda\xa8\xc6\xa8\xe1\x03y\xcc\xf0\x1d\xae\x0f\xf1\x86\x0e\
-\x9eb\xfc\xa2\x88?\x9c\xd1\x0dK\x07LC\xe6\xf9\x05\
-\x90}\x1d\xd4\x12\xb7,_\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07\x96\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:57-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:57-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:f2b9677e-2393\
--754d-9ae5-5eb86\
-93c7b40\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:8b7ceaeb-e3b4-3\
-746-b723-a14178c\
-54146\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a2f3738\
-2-9ec3-4249-916f\
--53f6fdcb3043\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a2f37382-9ec3\
--4249-916f-53f6f\
-dcb3043\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:f2\
-b9677e-2393-754d\
--9ae5-5eb8693c7b\
-40\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:57-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>zh\
-\x97\x9b\x00\x00\x01KIDAT8\x11\xa5\xc1\xb1j\
-\x14A\x00\x00\xd07\xbb\xb3\xf1b\x11\xd1\xa4\xd0\x13\x04\
-\x0d\x9a6\x08\x1a\x90\x88)\xac4\xbd\x1fa/\xd8\x08\
-\x16\xd66jg-X\xa4\x91\x14V\xfe\x80`@\xac\
-\xb5\xda+\xac\x12\xe2\xdd\xe66\xb7\xa30\xc5\xf4\xe6\xbd\
-\x90Rr\x16q2\x99\x5c\xc1\x18A\xb6@\x8f\x91b\
-\xc0\x1c#E\x8f_\x11\xaf\xb1\x8b\x1f\x88\xb8\x84k8\
-@\x8dS\x5c\xc0:\xbec\xc0\x02\x9bx\x1ae\xcf\xf0\
-N\xf6\x08/q\x07\xe71\xc5=\xbc\xc5\x0ef\xe8\xf1\
-\x11\xe7\x22*\xcc\x15'H\xb2\xa9\xacC\xc2\x14\xbdl\
-@U!\xa1VD\x04Y#\x8b\x08h\x10d\x15R\
-D\xc0L\xf1\x07\x0bY/;\xc6\x80\xa9b\x8e\x10\xd1\
-\xe1\x05v\x11q\x19\x1b\xd8CD\x8f5\xac\xe3\x13\x16\
-\x18\xb0\x8d/\x115\xbea\x1f\x1561\xc6>\x960\
-\xc3\x06\xae\xe33z\x9c\xe2\x06\x9a\x88\x06{\xf8 \xdb\
-\xc2]\xbcW\xdc\xc4C\xbcQ\xec`T!\xe1\xa2b\
-\x15\x8dlY\xb6\x86\x06+hd\xcb\x18\xa2\xecHq\
-\x88\xb9l&;D\x8f#E\xe7\x9f\x88\x06\xdb\xf8\x89\
-\x0a\xf7q\x15\x0f0\xc21nc\x8c\xc78A\x8f[\
-\xf8\x1a\xda\xb6}\x85'\xf8\x8d\x1a5\x1at\x08H\xa8\
-\xb1\x84N6`\x05\xcfC\xdb\xb6\xce\x22\x22\xf8\x7f\xe9\
-/\x95.[\x86[\xd33\xc7\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07\x96\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:54-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:54-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:56b09c1a-aaf6\
--114c-988f-0a3ca\
-10c9f46\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:0b17749c-fecf-5\
-24a-b107-45998b1\
-0598f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:6f357b6\
-2-9eb4-1646-8b64\
--01badbead68f\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:6f357b62-9eb4\
--1646-8b64-01bad\
-bead68f\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:56\
-b09c1a-aaf6-114c\
--988f-0a3ca10c9f\
-46\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:54-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xabg\
-\x10\xf7\x00\x00\x01KIDAT8\x8d\x85\xd3=/\
-DA\x14\xc6\xf1\xb5\xbbHP(\x10Q\x89\xc2Rx\
--$HhDT>\x80NB\xa2R 6\xa1\xa6\
-V\xa8\x14j/[\xd2\xe8\xc5[\x10\x1a\x11\x89Jn\
-\xa7\xf0\x09\xae\xffI\x9e\xd9\x1c\xd7,\xc5/sgr\
-\xee\x993g\xee\xcd\xa5i\x9a3I\x92\xd4i\xec\xc4\
-\x0e\x8e\xb0\x87>\xad\xe7C\xac\x97}\xb9\x1b/8\xc3\
-2\x0e\xf1\x81I\x1f\x17K\x90\xd7X\xc1\x81\x0f`\xbe\
-\x81\xdb\xd8\xee\xd5\x04\x0a,\xe0\x01c\x9a7hl\xc5\
-=J\xb1*|\x82f\xdb\x09\xa3\x99\xaa\xa2\xeb\xb1\x04\
--\xb8\xc1H&A\x93\xd6\xffM`Gxr\x0d+\
-hl\xc7#\xfak\x1e\xc1\xedvlW\xa7\xe7F\x8d\
-+\xb8\xfe\xb3\x89\x04\x145v\xe1\x1d\xc3\x9a\xb7\xe1\x15\
-3\x9a\xd7\x87*\xc2\xa6?J\xe2y\x0b_\x98\xd7|\
-\x10\x9fXu1\xbf{\xc0b\x0f.\xadT\xb7{\xe8\
-A/\xe60\x8eM\xadM`=T`\xcd\xbb\xc3~\
-v\x97Lu%<\xeb\xf3\xb6k-\x87\x04S\xd6}\
-\x17X\xf4/[2\xd7\xd0Y\xa4\xb8\xa8\x1eA\x8bW\
-\xb5\xba\xec\x12[?\xde\xb0m\xf1\xd8\x0d\x09\xa6\xd5\xa8\
-S\xa98'8\xc7\x02\x86\xb0\xa4d\x03\xf6\xb3\x85\x04\
-\x1dX\xd4O\xb3f\xcdql^\x0e\xd7\xe8\x9b\x1b|\
-\x03[\xc6\x07X\xf4\x8a\xfc8\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07W\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-37-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:59-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:59-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:2d1bb855-51a4\
--9849-87b4-5fe50\
-795959f\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:9ad96167-5b0d-4\
-e4b-8b29-11c6ab0\
-bd5b2\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:61cfdd3\
-8-4097-b140-adcf\
--5ede4e586cbb\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:61cfdd38-4097\
--b140-adcf-5ede4\
-e586cbb\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:37-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:2d\
-1bb855-51a4-9849\
--87b4-5fe5079595\
-9f\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:59-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x02\x1f\
-\x17\xe9\x00\x00\x01\x0cIDAT8\xcb\xad\xd3\xbf+\
-\x85Q\x1c\xc7\xf1\xc3\x1d\x0cJ\x18\x0c\x0aY\x08\xabb\
-\x22,\xfe\x04\xc9\xbdHa\x12\x7f\x81\xd5&\x8bA~\
-]\x83B\x0cf\xa5nnve2{\x91\xbf\xc2r\
-\x9e\xdb\xe3\xe9>7W\x86O\xef\xf3\xf3\xd3\xe7\x9c\xef\
-9\x01\x01\xadM*$\x0a\xe9\xce_\x14\xd0\x8d)\xcc\
-b\xa6\x01\x93\xf68\x0ai\x83}|\xe0\x01UT\xf0\
-\x94a2^\xc1\x17\xe6\x93\xa3\x07\xdca\x05]\xe8D\
-\x1f:\xea\xb0\x1fm\xb8\xc2j:\xc15J8B1\
-r)\xc3b\x86o\xb8\xc4t\xc0M\x9c(\xc7$y\
-<\xc7:\xc6\xb0\x86Wl%\x06%\x9cb9\x87%\
-\x9c`3U\x81\x0bl\xa7\x0d\xce\xe2\x86z\xcc3\xf8\
-\x91\xa0\x1c/\xa7\x1e\x93#l`\x12\xbbxO\x12\x5c\
-c\x11\x87X\xf8\x05\x8f\xf1\x82\x03L\x04\xdcb\x07\xbd\
-\x18\xc0P,Y\x96\xc3\xe8\xc1}\xacN\xad\x8c{\xf8\
-\xc4#\x9e\xe3\xa3\xc9c5\xae\x9d\x8b\x06\x85\x80\xf6\xe8\
->\x8a\x91\xc8F\x1aD\xcb\xbf~\xa6\x10\x1d\x9bQ\xcd\
-\xe0\x1b\xe2\xf5\x00\x81\xa3\x11o\x5c\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07E\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:19-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:19-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:1919319f-9ab7\
--7248-b2fe-365e8\
-65f46fa\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e84372f6-a9ba-3\
-b4e-95f2-20b054e\
-a4986\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:51c8694\
-1-a17b-d142-996b\
--f26f334c75e1\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:51c86941-a17b\
--d142-996b-f26f3\
-34c75e1\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:19\
-19319f-9ab7-7248\
--b2fe-365e865f46\
-fa\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:19-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>Q\x81\
-\xcb\xa1\x00\x00\x00\xfaIDAT8\x8d\x9d\xd1O+\
-EQ\x14\x05\xf0\xeb\xc9\xa3\x0c$Q\xf4\x90\x91\x81/\
-d\xeaK\x18\x98\xc9\x9f\x0c=\xc5G\x90R\xccM\x15\
-J\x22%\x13D\xea72\xf1\x0509W\xbb\xe3\xdc\
-W\xde\xe0\xb6\xefZ\xed\xb5\xd6\xdegW\xa8\xfa\xf8\x06\
-\xea\xff~\xc4c\xa9\xb6\xfec\xd0Ju\x1d\x1fX\xaa\
-\xf9\xa6\xc68j\xcdm\xe3.\xd5\xb7\xda\xe4\xcfN\x19\
-\xae\xc5\x1bx\xc6B\xc2\xab\xf8\xc4Lljc%\x98\
-\x0c\xa6\xba\x85\x17\xcc&<\x823\x1c\xa2\x1dSO\xf0\
-\x85\x83\xc0m\xe2\x09\xf3\x09\x0f\xe3\x02\xc7\xf1\x0a\xa3\x89\
-8M\x8d\xd7\xd8\xc7\x1a^\x0b\xe2\xa3\xb8j\x85e|\
-c1\x91\xe3\xb8\xc1;:A|\x99\x8b\xe3#\xee\xe0\
-\x1e\xd3\x09Ob.\xbcM.\xfe\xbdV|\x83]<\
-b*pC\xa5\xb1\xe3\xc5r\xa2\x8b\x07L$|\xd5\
-\x94\x9cO\x90\x9b\xdc\xe2\xbcWri\x85\xd8\xb0\x17O\
-UJ.\x194\xa5\x14\x93\x9b\x0crQO1\xaa\x1f\
-'\x04\xda\x03ts\xb6z\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07S\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:08-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:08-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:ff789fa1-c77b\
--ef4e-822b-8100c\
-a564040\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:deed16e6-4c25-d\
-54a-8c1b-b191bc9\
-469a2\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:108884d\
-0-c3f6-2d46-ad80\
--95cb9fd45b9e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:108884d0-c3f6\
--2d46-ad80-95cb9\
-fd45b9e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:ff\
-789fa1-c77b-ef4e\
--822b-8100ca5640\
-40\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:08-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xca\xa8\
-\x1f\xde\x00\x00\x01\x08IDAT8\x11\x9d\xc11J\
-\x1ca\x18\x00\xd0\xf7\xcd\xfe\xc2Z\xe8\x95,\xc2B\x04\
-\xc13\xe8\x01\xc4\xca\xc2J\x8cx\x13\x9b\x94\x01-\xbc\
-\x81Z\xeb\x11\x16\xecDYq]w>\x85_\x18&\
-#\x01\xf3^L\xa7S\x9f\x1a\xb4\xd8\xc6\x0e^\x11\x08\
-}\x89\xc0\x0c\xc7E\xa7U\xed\x22\xf0\x07kH}\x81\
-9\x0e\xb1Y\x10H\xec\xe3\x0a\x0f\xb8\xc4\x99\x7f\xdb@\
-)H\xd5&\x9e\xf0\x86uUA\xab/\xb0\xc4*\xb2\
-`\x0f7\xb8\xc7\x1c\x81V\xd5\xa2\xd5\x17:Q\xf0\x13\
-\xcfx\xc3\xc875x\xc4\x0b\xc2\x7fh0B\xa3/\
-|-\xfc\xa5\xe8K\xa4N \xf4\x05R\x95E_\x83\
-\x06\xaf\xaa\xa5\xa1T-0*\xaaD`\x89g\x1ca\
-\x82U\xa4N\xa8\x16\x98\xe0\xa2\xa8B\xe7\x00\xd7h\x90\
-\x86\x12c\xfc\xc6yQ-1\xc3)&\xaa4\xd4b\
-\x8c\x13\xdc\xfaPt\x0ep\x8d\x91\xa1@\xa2`\x8c\xb9\
-*\x0af8\xc6\x0fU\x1aJ\x8cq\x8a;\x9d,\xf8\
-\x85-\xac\xa8\xc2Pb\x05\xad*\x90>\xbc\x03\xbd.\
-H\xf6LWD\x9f\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07\x08\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:17-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:17-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:2aa5434a-8082\
--294f-ab68-decda\
-f66531b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:70cb38c3-655a-8\
-745-a62f-41fc7df\
-d7c15\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:6952f7f\
-1-e2b8-d143-8936\
--52153a744db5\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:6952f7f1-e2b8\
--d143-8936-52153\
-a744db5\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:2a\
-a5434a-8082-294f\
--ab68-decdaf6653\
-1b\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:17-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>X\x82\
-2o\x00\x00\x00\xbdIDAT8\xcb\xd5\xd3A\x0a\
-\xc20\x10\x05\xd04u\xe3-<RA\xdc\x88 \x8a\
-\xb5z.ED\xad\xa2\xde\xa7\xeer\x00O\xe0\x1f\x98\
-\x94OH5\x88\x1b\x17\x0f\x06\xd2\xfeN\xa7S\xe3\x9c\
-3*S\x5c\x87\xe4\xccRm\x0c\x05|\xc5PZ\x01\
-w\xa8\xe1\xdc\xe1\x02[\x18\xf8N9\xe0\x0a7\x98\xc0\
-\x1a*\xb2R3h`\xee_\x87\x03\x8e0Nh[\
-:(c\x01'Xj\xdd\xd3a\xb1\x5c\xcf\xeaw\x01\
-%M:|r\xf4\xba\xff\x09\xc8R\x03\xfc\x10\xf3\xc8\
-\x16\xdaOC\x94\x83i\xc2g\xdc\xebn\xb4\x01>y\
-\x03\x0f\xd8\xe9\xc6\x85\x1b(\x0e\xf0\x84a\xac\x03Y\xcf\
-\x85n\x5c\xd5A6t\x04\xfd\x9f\xfeL<i\x9b\xa8\
-\xbd\xef\x05U\x86\xdc\xcfyk\x90\x02\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07\xa4\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:21-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:21-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:7bae3a42-9ea6\
--0d42-b89a-7c6a0\
-e5369d8\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:181a5300-5a74-d\
-842-8880-8152f42\
-2d9c2\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:26d15ab\
-6-f5a8-8c46-a5e6\
--13817d38179b\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:26d15ab6-f5a8\
--8c46-a5e6-13817\
-d38179b\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:7b\
-ae3a42-9ea6-0d42\
--b89a-7c6a0e5369\
-d8\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:21-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>?\x03\
-\xb8\x05\x00\x00\x01YIDAT8\xcbu\xd3\xcd+\
-\x05Q\x18\xc7\xf1qq\xddr7(\x97\x15\x16\x94X\
-\xb0Q\xb2\xf1\x0f\xdcR\x92R6JX\xc8\xc2\xca\x92\
-lH)YP\xec\xb8\x0b\x7f\x85H)o\xc5F\x22\
-n4I(e\xe9\xed{\xf4\x9bz\x8c3\x8bOs\
-^\xe6<\xe79\xe7\x99\x09\xc20\x0c\x90\xd2\xb3\x01\x93\
-j;%(S\xbb\x1b\xc3f\xfc\xf7\x1d\xdb\xa9\xc1\x01\
-\xbe\xb0\x10\x0b\xdc\x89\x22\xde1b\x83D;\xa5q\x8e\
-\x0ddq\x89U\xcdu\xe0Y\xbb\xb7\xe1\x03}\xd1\x06\
-\x81Iw\x16\x17\xa8V\x10\x17p\x07\xb7\x18\xd7;\x8b\
-8Fc\x94\x85\x0d\xe0\xcc\xe1AA*\x15dBs\
-+\xca\xac\xce\x1e\xcf.N\x99L\xeeQo\xe6\x96q\
-\x85\x9c\xfa\xa5\xf6\x12\x83\xf8\xa02)*\xc8\x92\x16g\
-5Wn\xb3\x8e\xef\xee.l^\xed\x19U\xe4L\xa5\
-\xec\xc5t\xec\xc8\x7f\xca\xd8\x8cC\xbc\xa9\x1anl\x14\
-U\xe8RF\xaf\x98\xf2\x95\xb1\x02\xd7XS\xff\x14\xdb\
-j\xf7(h\x1eM\xf8\xc6\x80\xaf\x8c\xaeTwhQ\
-\xdfe\xb3\x8b\x1b\x0cjl\x13{\xfa\xe8\xbcetA\
-^\xd0\xaa\xfe>\x86\xd4.\xe0\x04\x19\xdf\x11\xecE\xba\
-\xba?\xa1\xdd\xccm\xe1H_lb\x19m\x901<\
-\xea\x1fX\xd7\xceiO\xb9\xff\x05\xb0A\xdcO\xf3\xa9\
-3g|\x8b\x93\x02\xd8\xd2\xf6\xa36i\xb1\xf3\x03\xf4\
-q\xef\x08h\x03a\xd9\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\x22\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:07-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:07-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:66724da0-8283\
--d94f-95d9-ffe4e\
-91214a0\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:a2649990-acdc-b\
-944-bbba-4a4088d\
-ce427\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:d8e3b2a\
-d-b21e-5a48-bbd5\
--6177e54d8dae\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:d8e3b2ad-b21e\
--5a48-bbd5-6177e\
-54d8dae\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:66\
-724da0-8283-d94f\
--95d9-ffe4e91214\
-a0\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:07-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xba\x82\
-)\x15\x00\x00\x00\xd7IDAT8\x8d\xb5\xd3?\x0a\
-\xc20\x1c\x86\xe1\xb6\x82\xe2\xbfEt\xd1Ep\x10u\
-\x10D\xf0\x00\x1e\xc2\x1b\x09n\x8e\x0e\x8e.\xaez\x01\
-A\x5c\x14T\xd0Yq\xe95\xea[\xf8\x15B\x9a\xd4\
-,\x0e\x0f-i\xf2\xf1%\xa1^\x14E\x9e.\x0cC\
-_y\x9f\xa1\x22\xef\x81>\xf7\xd7\xe2\x05\x22\xec\x95\xb1\
-\xc0\x1a\xa0-^\xe2\x8d\x07\x9e\xd8\x99\xe6\x19\x1b`\x85\
-\x0b\xba8b\x80-\x0e\xa8\x1a\x1b$\xa9<[\xd8\xa0\
-\x81\x824\xe8\xc8\xb75&\xeaVR\x0d\xb46q\xc8\
-\x15}\xdb\x1c\xdb\xc2\xa4MM\x02z\xce\xb7\xf0\xef\x00\
-\xdf\x1a \xa7\x1f\x88\x9c\x8c\xd5qs\x0a\xb04\xc9\xe3\
-\xec\xda\xa0\x1d_\x11F\x18c\x88)^\x99\x01\xca~\
-\xe7\xf8\xe0.w\x9f8\xa1\xe9\xd2 \xae[BQS\
-6-t:\x03\x17\xa6\xff %+\xe0\x0b:A\xfb\
-\xba\xc0\x864\x8a\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\x92\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T18:00:05-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T18:00:05-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:8b039da5-c65d\
--914e-b6d8-04de8\
-6ce1411\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:57919ae5-b96a-c\
-748-bbdb-bde6f4d\
-d7730\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:060f576\
-c-1a5c-304a-8f62\
--a956c6b0f45d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:060f576c-1a5c\
--304a-8f62-a956c\
-6b0f45d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:8b\
-039da5-c65d-914e\
--b6d8-04de86ce14\
-11\x22 stEvt:when=\x22\
-2020-05-02T18:00\
-:05-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>=z\
-=\xe4\x00\x00\x01GIDAT8\xcb\x8d\xd2\xbdJ\
-\x03A\x14\x86\xe1\xc9\xc6\x1f,l\x8c\x8d.\x22(\xde\
-A\xac\xf4\x06RX\xc5\xc2B\x10\x7f\x10\x09b!\x08\
-\x82`'\x04A\xb0\xb3\x10\xb5\x10-E\x14\xb4\xd0\xde\
-BP\x90h\xa3!\x85\xb0\x8d\x17\xa1\xef\xc87pX\
-7\x89\xc5\x132;;\xdf\x9e\x993.I\x12g\x8c\
-\xa3\x8aS\x1cc\x1d\x05\xcdE\xa9w\x7f\xd9\xc1.\x1a\
-8\xc2\x1a6q\x83\x0f\x94\x9a\x85\xd8\xc5\xaf\x883\xbe\
-R\xc6\x17&\xb3BB\xd9\x0d\xb3\xb8\x0by\xe9\xd4\xb3\
-\x0a\x1e\x9am\xa1\xaa\xfd\xba\x16zPC1]\x85\xff\
-9\xc32\x06q\xa1}_\xe3\x0a\xf7\xd8S5\x97\x98\
-\xcd\x0a8\xc1\x06\xba1\x8f%,b\x01+\x98\xd2\x82\
-;\x9d\xc7\x9f\x00\xdf\xaa\xdb6[\xf0\xd5\xd51\xa6q\
-\xce\x06\x14\xd4\xaai3\xd9\xa1\xb2C\x80\xbf\x17\xe7f\
-\x1c\xa5\xdbXR\xab*:\xb0\xf0<\xd6\xe2o\xbc\xe1\
-\x00\x03\x9a\xcb\x87\x80\x906\xa1V\xd5\xcc\x01\xd6\x15\xe0\
-\xef\xc8*\x0e\xd5\xf2\x91P\x89\xcb\xb8\x1cE\x9dv\xd9\
-\xecy_A\xfe\xff6>1\x9a\xbe\xcaQ\x8bC\xec\
-\xc7\xbb\xee\x8c\x1fo\xe1\x05}Y/GF\xce\x04\xc7\
-*\x7fG\xe3'\xcc\xb96\xeds\xf6\xc00\x84g}\
-\xfd\x11\xc3\xff\x0d\xb0[\xec\xc5\x8c\xc2\xdc\x0f\xd0\xf9\xe9\
-\xac$\xe6}@\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07R\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:23-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:23-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:223a4064-00d8\
--6847-85b3-88431\
-7836c0b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:cac9afaf-9ae9-3\
-541-b1d3-2a33bea\
-0c498\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:c21aeab\
-e-a43d-7849-9cf1\
--5ff5f84fe130\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:c21aeabe-a43d\
--7849-9cf1-5ff5f\
-84fe130\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:22\
-3a4064-00d8-6847\
--85b3-884317836c\
-0b\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:23-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd5\x99\
-\xdf{\x00\x00\x01\x07IDAT8\x8d\x8d\xd3\xbd.\
-DA\x18\x06\xe0\xdd\xb5T*\x09Q(D\x14j\xa2\
-A\xe7\x02\x84Z\x22\x11\x8bJ+\x91\xa8\xdd\xc76\x1a\
-\x5c\x81\xc2O\xad\xa2\xa0\x10\x09\xf2\xf8i$\xae@3\
-#\xe3\xcb\x9ec\x8b/s2\xef\xcf\xbcygN\x03\
-\x8d\x9ai\xa1Y\xc7\xf9O\xdc\xeb\xbb/\x83,\x98\xc1\
-H\x9dI/\xf1@Zg\xf1\x85s\x0c\x05\xac\xd2 \
-\x13\xe6\xf1\x86]tq]\x98\xb4\xaa\x0c\xa2x\xbb\xc0\
-\xcep\x89\xc1\x98$\x13\xdai\x9d\xc3G\x10\xe79I\
-&\x7f\x92\xc4\x93\xdf\xd1)D{X\x0eI.J\x93\
-F\x10\xef\x14\xe4\xfdT\xe2#\x16\x8b\xfd\xd3\xd4I;\
-'X\xc0+6\x0a\xd2\x01^0\x81u|&^\xc6\
-\xbb\xb8\xc2p\x03+\xf8\xc6R\x02\x0f\xf1\x8c\xc9B\xb0\
-\x99\x12\xe6$Gx\xc2X&\xac\xa6\x14\xc7\xb8\xc7T\
-Qn\xee\xa8\x83\x87\xd4\xc3\x1dFc\x89k\xb8\xc5t\
-\xb8\x99\x92\xb3\x85\x1b\x8c\xc7\x12\x9b\x81X\xf9\xf6\x0b\xec\
-\xf7\x1a\xa3I\xed\xdf\x179\x95@\xbf\xf3\x0343\xda\
-\x9b\xa6\x8b\xcc\xcd\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\x16\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:05-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:05-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:f7d46de4-a69a\
--e747-94fd-9bd72\
-388c73e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:9ffa29c6-2977-1\
-549-8946-360a9dd\
-59f94\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a82b017\
-a-e5d7-3542-b8dd\
--f8e059b7d108\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a82b017a-e5d7\
--3542-b8dd-f8e05\
-9b7d108\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:f7\
-d46de4-a69a-e747\
--94fd-9bd72388c7\
-3e\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:05-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xdd\x5c\
-~\xb7\x00\x00\x00\xcbIDAT8\x8d\xad\xd21\x0b\
-\x81A\x1c\xc7\xf13X)Vd\xb0\x90\x8d\x88\xb0\xd8\
-\xa4\xbc\x06J\xb1\x190\x18d\x90W\x82\xc5$&\x93\
-U(!\x83Qz\xde\xc6\xe3{\xf5\x1f\x84G\x8f<\
-\xc3\xe7\xee\xea\xee~\xfd\xff\xd7)\xd34\xd5?\x94a\
-\x18a\xa4\x91@\xf2\x07)\xf8u\xc0\x107\x1cp\xb6\
-\xe9\x88+*:\xe0/z(\xa1\x8f6\xba6u\xd0\
-C\x5c\x0740\xc7\x18S\x9b&\x98\xa1\xe0H\x0b-\
-\xac\xa5\x8a\xa5M\x0b\xacP\xd4\x01y4QE\xed\x07\
-uD\x1cia\x84;N\xb8|q\x963o\xff\xc0\
-\x87\x10\x02\x16\x822G\x10CT\xe8\xb5W\xc9F\x01\
-\x19d-\xe4\xe0\xb1ja \xe5l\xb0\x7f\xb1\xc3V\
-J.\xcb%7\x5cB9\xf2\x88\xea)\xf1\x9b\x8f\x01\
-\x0f\xf1\xd1\x00S\xd5\x16\x7f\xc0\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07=\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:14-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:14-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:11dd1d5b-b5d7\
--e143-b26f-19b76\
-c6a2ef5\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:7883eca1-c148-2\
-746-a9b0-df7332f\
-2f7d0\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:dfad02d\
-1-a46f-6c46-a1da\
--31e87cfbec42\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:dfad02d1-a46f\
--6c46-a1da-31e87\
-cfbec42\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:11\
-dd1d5b-b5d7-e143\
--b26f-19b76c6a2e\
-f5\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:14-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>[\xf2\
-\x00\xeb\x00\x00\x00\xf2IDAT8\x11c\xf8\xff\xff\
-?\x03>\xfc\xec\xd93\x16(-\x0f\xc4\x8b\x80\xd8\x16\
-\xcag\x02\xd1\xc4j6\x00\xe2\xeb@\xfc\x1f\x88S\x91\
-\xe5\xf0if\x86\xd2\xce@\xfc\x0e\x88\xe3\x80x1\x10\
-g\x22\xcbc\xd3\xc8\x08\xc2Pv$\x10\xbf\x01\xe2\x10\
-(\x7f=\x92\x01\x98.\x80i\x84\xb2K\x81\xf8%\x10\
-[!\x89\xe16\x00Ms/\x10\xdf\x05bu(\x9f\
-\x15J\xaf\xc3\xeb\x02\xa8\xc4r \xbe\x00\xc4\xc20\x85\
-H^ZG\xc8\x0b\xfb\x80\xf8\x08\x96X \xda\x80:\
- \xbe\x01\xc4\xa6h1\xc1H\x8a\x17R\x81\xf8-\x10\
-\x07\xc2\x0c\x81%\x1ab\x5c\x00\xb3\xd1\xfb\x19\x04\xa4\xa3\
-\x89\x13\xe5\x02\x98\xbf\x8d\x81\xf8\x09\x10\xd7\x22\xc9m \
-h\x00\x9a!r@|\x0b\x88g@\xf9\xab\x818\x8b\
-\xd4\xa4\xcc\x07\xc4\xe7\x80x>\x10oF\xf2\x16\x0b1\
-\x99\x89\x19)-l\x80f\xa6\x04\xa2\x0d@\xce\xb6P\
-6(C\xa9!G-\x00\xe3S\x02\xf0f\xa7E,\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07S\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:27-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:27-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:b788edbf-e465\
--954b-9a61-3b3a6\
-3c0b17c\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:a08c0a17-f23c-1\
-c40-a0bf-91622c0\
-d6f60\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e34016c\
-6-78a9-ac42-ad55\
--386a18c8ed58\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e34016c6-78a9\
--ac42-ad55-386a1\
-8c8ed58\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:b7\
-88edbf-e465-954b\
--9a61-3b3a63c0b1\
-7c\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:27-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>o\xc9\
-\x9c\xc4\x00\x00\x01\x08IDAT8\xcb\x95\xd2\xbd.\
-\x84A\x14\xc6\xf1Y\xbb\xcbV\xb8\x04\xb7\xe0k\xd5\xae\
-@B\xaf\x10+\x11\x17\xa0\xd2\xe8]\x83\x8a\x82\x10\x1f\
-\xd5\x12\xef6:\x0a\x09\x09\x12\xa5\xfc\xc2%\x88F3\
-o2\x99\xec\xbe\xbb\x8a\x93I\xces\xfe\xcf\x99sf\
-\x02\xc2\x90\x18\x8bg\x13\xbb8\xc5>\xa6\x10\xfe\x03w\
-\xf1\x88m\xf4p\x83\xc6(p\x1d\x05N2\xfd\x09+\
-\xa3t\xbe\xc2/\x8e\xb2\x9a\x1e\xd6\xab\xe0F,:\x8f\
-\xb9.n\xa3\xb6\x83\x0fLV\xc1\x05.\x12\xad\x8ec\
-\xbc\xe2\x0d\xed|\x89\xf9\xcc\x97\x89\xd6\x8ag\x07?\x98\
--\x99~\xf0]\x9c\xbb\xd4\xc6\x13\xf8\x0b\xf3Im\x08\
-\xa8%\x0b\x1b\x04oFx)\x85\xf3\x11\xae\xb3k\x97\
-\xf0V\x84\x17r85X\xc6{\x5c^\xc0D\xd2\xf9\
-{\x10\x9c\x1a\x1c\xe2 \xdbG'\xc2\xedApi\xd0\
-\xc4\x03\x16cr\x1a{\xf8\x1c\x06\x97\x06kx\xc1*\
-\xce\xf0\x8c\xfb\xaak\xe7\x06\x1b\xf1\xab\x16\xb1\xf3\x5c\x9f\
-\xbfQi\xd0\xc2LV\x5cK\x9e\xb72\xfe\x00O\xa3\
-\xe0\x80\xf6\xc9\x1dU\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07\x1d\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-07T19:00:59-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-7T19:00:59-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:629c6f97-efef\
--0743-bf78-faf00\
-1161913\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:333c7819-ad90-9\
-846-91de-cab6abf\
-2ebab\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a388297\
-3-1e1d-a045-88c7\
--5e755708fd64\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a3882973-1e1d\
--a045-88c7-5e755\
-708fd64\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:62\
-9c6f97-efef-0743\
--bf78-faf0011619\
-13\x22 stEvt:when=\x22\
-2020-05-07T19:00\
-:59-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xacr\
-\xe7\xb6\x00\x00\x00\xd2IDAT8\x8d\xc5\xd31J\
-\x041\x14\x87\xf1_f#.\x82\xde\xc4R\x0f\xb0\xae\
-'\xf0\x06\xb66\xdeD\xef`c\xad\x9d`+X\x8f\
-\xe0^\xc0\xca\xc6~\xdd\x89\x85\x09\x86a\x06e\xa70\
-M\xf8\x93|_\xde{\x90\x90R2e5\x93h\xc4\
-\xb6m\x1btS*\xe80\xdb\x82\x0dE\x00\x9b-\x04\
-\xa9\x16\xec\xe3\xf8\x8f\xe0A}\xb7\x08\xe6\xb8\xc1\xe5/\
-p\xc0-.J\x8eY\xf2\x8e3<\xe4\x83\xeb\x0a\xda\
-\xc1:\xc3\xf79\x9f\x976\xa2\x9f!\xbe\xe0\x04\x8f=\
-\xc9:\xefw\xd8\xc5iUM\x8a9l\x10\xf1ZI\
-\x02\xae\xaa\x97\xe7XV\xadw2T\xd6\xe7\x80\xa4\xc1\
-\x11\xf6\xb0\xe8\xc3}A_\xb2\xc0\x13\x9e\xc7\xe0!A\
-\x91\xcc\xb0\xc2!>\xc6\xe01\x01\xdf3i\xf0\x96s\
-\x18\x82!\xfc\xfbo\xfc\x02d\x060\xdc\x02*\xb0\x83\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07p\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:42-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:42-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:23a0a7c9-fa1c\
--2c42-96a2-79b36\
-294488e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:af68db94-569c-9\
-643-bbe9-7588463\
-856c5\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:080cea2\
-c-631a-9144-8573\
--4aed99ee2fdb\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:080cea2c-631a\
--9144-8573-4aed9\
-9ee2fdb\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:23\
-a0a7c9-fa1c-2c42\
--96a2-79b3629448\
-8e\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:42-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xff\x9f\
-\xc9Y\x00\x00\x01%IDAT8\x8d\x95\xd3M+\
-\xc5A\x14\xc7\xf1\xbf\xc7{\xc5B\x1e\xca\xc3F\xa2n\
-,\x88\xf22,,\xece\xa5(\x0b\xa1\xa4l-<\
-d\xa3D\xb1\xb2\xf0>\x90\x88R\xba\x22\x16\xeac\xe1\
-\x05\xd8aan\x8d\x89\xdc;u\x9a~s\xe6\xf7m\
-\xe6\xcc\x99\x0c\xf5\x98G72T\x87\xf9\xb7h\xc0\x22\
-\xf6\xb0\x8b\xcd\x0cMx\xc0X\xb4\xb1*1\x96t+\
-^\xb0\x8fU|fh\xc4\x19\x86\x90C\xcf/\xc6\xd2\
-\xdc\x82Kt\x05],\x01\xaeP\xc0$>\xb0\x9c@\
-b\xc0\x0d\x06\x82~\x8e\x01}\xa1\x16\xa78\xc7F\x04\
-\xa9I\x00\x85\xa0\x9fb@/\x96\xb0\x85<\x1e\xb1\x93\
-\xd4\xe2_\xc0\x02\x8eB\xb2\x1d\xb78\x88\x00\xad\xe5\x00\
-bC.\x14\xed8\xe8\xb6J\x01=\xb8\xc3z%'\
-8\x0c\xc9\x11\xdfc\xa5\x92+,b\x13\x83x\xc3\x5c\
-\xd8X[N\x11\xfb1\x8bg\x141\x15=au9\
-\x80\x02&\xf0\x8aq?\xdf?m\xa4AI#]`\
-8,6'\xa6\x14p\x8d\xce\xa0\x1fJ\x80\x1b\x8cF\
-\x86\xf4G\xc6\x80{\x9c\xf8n\xb2\xf7\x0cu\x98F\xc7\
-\x1f\xe68\xf2\x98\x09\xe6m\xac}\x01\xfd\xfd\xfa\x8c\x1d\
-\xd0N\xa2\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xa4\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:33-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:33-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:4d4993ce-3759\
--7d47-941a-783e8\
-51cb32c\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:bdc57426-9d1a-a\
-d46-8439-7b0f160\
-e4dd6\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:ae71151\
-1-69d7-fb4b-b1ef\
--853f969075db\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:ae711511-69d7\
--fb4b-b1ef-853f9\
-69075db\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:4d\
-4993ce-3759-7d47\
--941a-783e851cb3\
-2c\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:33-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?> v\
-\xbc\xb5\x00\x00\x01YIDAT8\xcb\x85\xd3\xcb+\
-GA\x14\xc0\xf1\xf9\xfd\x94W\xbfH\x9e\x0b\x14\x11I\
-d#\x8a<\x96\xecX(K?YK!\x0bJJ\
-Y))\x91\x0d\x85\x08e!Q\x16V\x8a\xf2\x08y\
-DI\xba\x91\x7f\xc2w\xea\x8c\x8e\xc9\xfdY|\xba\xe7\
-\xcc\x9d{\xee\xb9sgL\x10\x04\x06Y\x18B\x1cm\
-H\x97q+\x82\xa8\xca\x7fqA>\xd6q\x803\x5c\
-I\xde\xa8&'%*\xa0%\xa3\x093x\xc1\x0e\x0a\
-\xc3\x8a\x98\xb0\xd6D6\x16\xf0\x8e\x8e\xbf\x8a\xb8\xc0\xbe\
-\xe1\x10k\x18E\xb5W\xa8\x1b\x1f\xe8\xf5\x8b\xb8\x09i\
-\xe8\xc20\xf6\xf0\x88U\xe4\xa9\x22\xad\xf8B\x8b.\x12\
-\xd6z\x09V\xf0\x8az5\xde\x87g\xc4\xdc\x1fr7\
-RP\x8b\x1c\xaf\xd0\x00>Q\xa7\xc6v1'q\xd4\
-\x0d\x16\xe1\x02w\x98G\xaez`\x10\xb7\xea\xadv}\
-\x9eP\xac?\xc1~O\x06j\xb0\x85{\x94\xab\x22G\
-\x98T\xf9>\xc6\x12\xad\xc1\x94l\xa6T\xc9\x9b\xa5\xbb\
-L\xc9\xe3\xb2\xe9~\x0a\x8c\xcb\xe2l\xabu8\x96\xed\
-m\xa4\xd09\xda%\xaf\xc2\xb5\xdd'6\xe9\xc4\x8d\xb4\
-o\x7f\xe1\xacL\xea\xc7\xa9\xeaj\x03\xd3\x12\x17\xe0\x01\
-\x956\xe9\xc1\xa5\xdcX\xc6\x92\xc4\x0d\xd8\x94\xc3d\xf3\
-\x11LH\x1c\x93n+\xdc\x02.\xe2\x0d'(\xfbg\
-{\x87\x9e\x85Ru\x8c#\xde\xd5\xc5~n\xbe\x01\x08\
-\x8e\xe9\xc2R\xfa\x06\x83\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07k\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:24-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:24-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:34b3c532-3c9c\
--ec4d-8f36-38fb0\
-91c7328\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:938564cf-9394-8\
-845-b33c-225b3c9\
-7ad9f\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:37b2195\
-a-7373-6d4d-b917\
--cbbf6160523e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:37b2195a-7373\
--6d4d-b917-cbbf6\
-160523e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:34\
-b3c532-3c9c-ec4d\
--8f36-38fb091c73\
-28\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:24-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xd5\xa7\
-)F\x00\x00\x01 IDAT8\xcb\x8d\xd3\xbd.\
-\x04a\x14\x06\xe0o\xed\x86j\x05\x95;\xa0\x92\x10*\
-Q\xb8\x00\x85NTD\xe1\x1e\xa84\x1aQ\x8b\x9f+\
-X\xd9\x04\x0d\x89;\xb0\x94\xa8(\x9f\xc4]h\xce\xc8\
-1\xd9e\x8a73sf\xbe\xf3\xfe\x9c3\x05%0\
-\x96\xee7p\x8c\x0b\x9c\xe1\x00\xcb\xc3\xbe\xad\x17\xd61\
-\xc03.q\x88#\xf4\xf0\x8e>f\xf3\x99|x\x07\
-_\xd8OL\x193\xa1\xe8\x03sU\x93\x92\x98\xbf\xb0\
-R\x939\x86\x16\xda\xa9~\x887t\xb3\x85Ab\x1e\
-\x1f\xa1\xa0\x95\xd4\xde\xe1\xa4j\xb0\x11\x9eK\x03T\x0d\
-\x96\x22\x93\xa9\x12i_\x0d\x99\xc4(\x15\x05\x13x\xc1\
-j\x89\xb4\x0f\x1a6\xc8\xb8\xc5n\x899\x1f\xd5\x18\x9a\
-\xe0\x01[%\xd8{Ql7\xb4\xd0\xc5+\x16Jl\
-\xd8{\xcc\xf9?\x15\x9d\xb8n\xe2\x09\x9d\xeaE\x1f\xe7\
-C\xe6\x9f\x99;\xe9\xf9\x15{y\x0ff\xf1\x99\xc2\xfc\
-\x0b\x8f\xc9\xf2\xafU\x9e\x0f+\xb7X\x8cQ\x95\xe4y\
-36\xf0:\xa9i\xd5\x17d\x12\xa7\xd1\xe8\x057\xb8\
-\x0f\xc9\x83Jv\xce\xaa\x8c\xf8\x9d\xa7\xb1\x16\x07\xb6\xb1\
-P\xcb\xe0'\x9fohN\xe0y\x0c\xc8\xdd<\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07h\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:42-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:42-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:b0c637c2-599e\
--2c48-9f85-901a6\
-0e2fb8e\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e8ee2f64-1059-7\
-048-ae3e-466e41a\
-5d0d2\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:b2b5c98\
-3-756d-e449-a359\
--6e1a33d2f574\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:b2b5c983-756d\
--e449-a359-6e1a3\
-3d2f574\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:b0\
-c637c2-599e-2c48\
--9f85-901a60e2fb\
-8e\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:42-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xb9\xae\
-\x02\xf7\x00\x00\x01\x1dIDAT8\xcb\x9d\xd3\xbd+\
-\xc5a\x18\xc6\xf1\xdf\xf1\x92L\x14)+eT\xb2(\
-\xc3\xf9\x1f\x8cH\x89\xe18%g\xf4\x1f\x98e&\x83\
-\xe4\xfd5\x8b\x81\x89\x81\x88\x89\xc5`\xf9\xd8L\xfe\x00\
-\xcb\xfd\xd3\xd3\xe9wt\x18\xbe\xdd\xddO\xf7u=w\
-O\xd7\x93\xa1\x8a\x0b\xec\xe0\xa0Ivq\x8cr\x862\
-\x161\x8biLa\xb2\x01S\x98\xc1<\x160\x94!\
-e\x10#\x18\x8d\x9a2\x8aa\xf4\xa7\x9a\x0c\xad\xd1\x8c\
-\xe1\x0bO\xb8\xc1\x03\xee\x82G\x5c\xe3\x03\xb7\xe8\x0cM\
-)\xbd\xbd\x1dG8\xac\xdb*\xa7\x07\xafX\xce\xc5\xf9\
-\x06?M\xd4k\xecG\xdf\x12\xb57\xc4+\xf5\xc6i\
-\x93\x0fw\xe0\x1e\x1b\xd1w\xe1\x19\xab\xc9l\xa9\xc8 \
-}\x8f\xee\x10\xad\xe1\x0a\x9bE\xe2\x22\x83\xd4\xa4\x0f\xef\
-\xd8j$\xce\x0dJ\x05\xb4%\x0f\xd7\x91\x18\xa73-\
-\x8d6\xf8\x13YD\xf92\xa2yZ\xc79\xce\x0a\xce\
-O\xe2\xbc\x9cE\xb6O\x22\xa2\xd5\x88\xe8oT1\x87\
-\x17,f\xf1\x89&\xfe\xb1\xfe:j\xb9\xc1\x1b\xb6#\
-\x89\xcd\xb0\x87OT2\x8c\xa3\x86\xa5\xa0\xd6\x04K\xa8\
-`\xe0\x1b\xdc\xaf\xfef\xc2\x91\xf6\x98\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07p\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:10-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:10-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:2a2d633b-7d65\
--074c-897b-6be88\
-1a7840a\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:a8690234-429f-0\
-648-a947-0ec23c2\
-a4939\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:62d9ef5\
-5-bc66-1047-97f5\
--2303002ab930\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:62d9ef55-bc66\
--1047-97f5-23030\
-02ab930\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:2a\
-2d633b-7d65-074c\
--897b-6be881a784\
-0a\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:10-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\xf0I\
-\x12}\x00\x00\x01%IDAT8\xcb\x8d\xd3\xbb.\
-\x84Q\x14\x05\xe03.\x89\x11\x09*\x1e@x\x08\xdd\
-\x14&D\x22L+\x12\xbdP\x12\xb5Bh\xd4*\x13\
-\x09\xe2\x01$z\xb7N$\xae\xa5\xe6+x\x09\xcd\x9e\
-\xe4\xf8sf(N\xce\xbfO\xf6\xda{\xaf\xb5\xd7\x9f\
-\x90\xba\x9c\xbe\xec{\x1d'8\xc5\x0eF;9\xdd\xc0\
-\xfdq\x0f\xe3\x0aO\xd8\xc5&\xae\xf1\x8ci\xa4\x12\xb8\
-\x16w\x1dw\xb8,\xe4\xec\xe1\x1e\xb5nc\x8f\x07\xf8\
-\xac\x07\xc5G\xcc\x95:'\x1c\x17:\xefc5\x8b\xdb\
-\xd8\xaer\x9e\xc4F\xf0\xcb\x0b\x1e\xe2\xa3\xc3;\xce-\
-Z\xf9\xd8C1\xf6y\xa5s\x07<\x91\xbd\xad\xe1\x15\
-\xf5\x94\xa9}\x83\x8b\x7f\x80\xe7\xf1\x8dF\xbe\x85\xab\x02\
-\xe7\x12\xb8\x19\xe0\x95\xdc\x07\xeb\xb1\xe7\xbf\xc0\xb3\xf8B\
-+\xd7-\x85\xc3v\xb3M\x1c\xe1\xbd\x02\x9e\x8a\xee\x8d\
-\x8a\xe8)\x85=\xb7\xe2a\x04\x07\x15\xb5\x17\xf1\x89\x99\
-\x88\x07\xf3iSx\xfb\xba\x8bY\x16b\xec\xe5\x88\x07\
-\xaa9\x09cx\x09{\xa6\xca\xaa\xbe\xb0T\xf8\xb9~\
-\x15H1\xf2C\xd8\xb3\x1d&y+q.\x15\xe8\xcb\
-\x04lb;\x94\xae\xf7\xea\xdc9?-,\xe7\x12y\
-\xb6TO\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07\xb6\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-35-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:43-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:43-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:617745c7-71e8\
--ad43-9150-b4ee2\
-699f492\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:e6ef899c-e7bc-3\
-e43-85f2-b251d3d\
-e0a96\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:fd7cbab\
-c-fe4e-fc44-9e97\
--052f9af8263e\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:fd7cbabc-fe4e\
--fc44-9e97-052f9\
-af8263e\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:35-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:61\
-7745c7-71e8-ad43\
--9150-b4ee2699f4\
-92\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:43-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>a\x8e\
-\x22U\x00\x00\x01kIDAT8\x8dm\xd3\xcd+\
-Da\x14\xc7\xf1;\xc3`\x10Ey[\x11\x0b\xca\xc2\
-\xd6H\x16,X[\xc9\x82\x22JD\x94\x0d\xcd\xd6\x94\
-2)/k\x9a\x92\xb7\x92\x22o\xc9NJ\x22%)\
-E2\xfe\x0d\xdfS\xe7\xe8\xb8\xcd\xe2\xd3\xf3<\xf7\xce\
-\xfd=\xcf=gn\x90\xcdf\x03\xe4\xe9(\x86\xb1\xa0\
-\xf3|\x1dk\xb1\x8eV]G\x10\x95\xb9-d,\xc1\
-\x16>\xd1\xe5\x02\x8d\x84\xfe`\xc6]\x8b\xd8\xa4\x17\xef\
-\xc8\xa0\x14\x09\xac`\x07\xdbXD\x15\x9a\xf1\x84s4\
-\xd8\x09:\xf1\x86~\x94\xe1\x14/\xd8\xc08fq\x80\
-\x0f$u\xc3M\x5c\xcb\xa9eQ\x8eb\x1d\xe5\x14\xab\
-\xae&\xd5(\xd4y#\xee\xf55e]'5\xf2\xef\
-(\x89\xe9\xd0{\xefa\xd4\xad\xa5\xa8\xcf\x98\x0e\xd7\xa0\
-[\x8f\x1d\x0bU\xff\x18\x13:\x8f\xeb\xd8\xa7!1\xab\
-\x81X\xc3\xb2{\xd8:s\xa8m\x0d\x5c\xb8\xb8C\x8f\
-\x0f\xd8\xc7T\x8e\x80\x0b\xa4\xdc\x83Q\x1dO,\xd8n\
-\xecb.G@B\x0b\x9b\x0a]\xbf\xc4\xa0\x0fHj\
-\xbf\xfd\xbf\xd2v\xab\xc7-\xc6t]\x89G\xb4\xf9\x80\
-&|i\xab|\x11-\xac\x005:\x9f\xc7\x8d\xef\x82\
-\xed\xb4\xa4\xc5\xb1\x87\xc3\xef-:\xf0\x8d\xf6p\x1bM\
-F[$\x15.r\xd7+\xb4F\xf2-\x0c\xf9\xe0\xbf\
-\x8f\xc2\xfdxRC\x1ep\x843\xbc\xe2JO\xf0\xef\
-T~w\x1f\x12\xd7\x0e\x8c`\x00-\xee\x9e\xff\xf4\x83\
-_.+\xedi\x06K\x84\x14\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07^\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-41-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:15-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:15-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:8d4ef758-54b4\
--154b-88d2-cf590\
-eb85ab1\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:89527441-dcb9-3\
-347-adb7-4edd289\
-3dacd\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:a72a768\
-d-ab78-fb43-912c\
--21f4d307b787\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:a72a768d-ab78\
--fb43-912c-21f4d\
-307b787\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:41-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:8d\
-4ef758-54b4-154b\
--88d2-cf590eb85a\
-b1\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:15-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x8cf\
-(\xc6\x00\x00\x01\x13IDAT8\xcb\x9d\xd3\xbdJ\
-\x03A\x10\xc0\xf1\xf3\xfc\x08X)\x04\xa3\x09\xf8\x18\x12\
-Q\x04\xc5\x07H\x13$\x85b\x12,\xd5\xdaRDC\
-\xf2\x0e~4\xa2\x85e*A\x22\x8a\x11\x14\x0b\x1b\xad\
-\xac\xc4\xab|\x87\xf8_\x9c\x85ar\x17\x0f\x0f~\xec\
-\xdd\xed\xee\xec\xec,\x1bDQ\x14\xa40\x94\xd4\xf7\xd7\
-\xc4\x16\xca\xf2>\x9c6\x80\x1f\xb8\x8fO|`))\
-\x88\x9d<\x22\xedz\xf4\xfbL\xa0\x82/\x14\xe2\x82\xc4\
-M\x9e\xc77\x16T\xdf\x11^\xd5\x98\xd0\x06\xf0?f\
-e\xe5\xaa|g\xd4\x8aWh\xc7m\xc1Wx\x14w\
-\xd8\x1bP\xd4\x1b\x1c\xe8\x93\xd1\x9d\x17R4\xb7\x85e\
-\xacH\xeb\xac\xa2\x88M\xf4\xb0\xe63\xd7\x95?\x94\x0c\
-\xee\xd1\xc5\x83\xf1\x88[tP\xf2Y\xe8-\xb86\x8f\
-\x1c\xa6\x12LK\xdbw\x0ac8\xc6\x1b\x9e\xf0\x92\xe0\
-Y\xc6\xd4u\x06N\x16\xefX\xc4\xb8\xac\x925fd\
-l\x03\x976\xc0\xa4Dnb\x0b;\xd86v\xb1\x81\
-k\x9c\xda\x22:5\x9cK\xe7\xd9\x00'\x98\xb3\x19\xfc\
-\x9b\xbd\xb2i\x84\xfaz\xff\x00R\xb4\xe7\xaaCq\xaf\
-\x06\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07x\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-40-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:04-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:04-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:6f55615f-2e08\
--4d4d-be90-85a48\
-451c68f\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:cc443845-8015-5\
-748-acd5-17cd430\
-4fe06\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:8a4311d\
-8-4ef5-534d-8499\
--ff054aca980d\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:8a4311d8-4ef5\
--534d-8499-ff054\
-aca980d\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:40-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:6f\
-55615f-2e08-4d4d\
--be90-85a48451c6\
-8f\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:04-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x9a\xfa\
-\xd7\xaf\x00\x00\x01-IDAT8\x8du\xd2\xbd/\
-\x05A\x14\xc6\xe1\xe5^\x89D\xa1q\x1b\xb4\xc4G\x14\
-WG\xa1T\xe94j\x8d\xcf\x82(.\x05!Z\x89\
-hD\x04\x0d\x89\xce\x7f\xa1Q\xa0P(\x84(<\x22\
-\xd1\xa8T\x12\xc5\x9d\x951\xd9\xdd\xe4\xcd\xec9s\xf6\
-\xb7\xe7\xbc3\x19\xb2\xa0\xd6\xb0Na.\xc9u`\x17\
-\xdd!n\xc9\xbf\xcb\x22@[Xwp\x95\xe4jx\
-\xc2H\x02\xfe\x07\xc8\xb5\x8c\xa3$W\xc55z\xd2\xfa\
-\x98V\xc7J(|\xc6Fh{\x0b{\xf8\x0e\xe0y\
-t\xc6\x80j\x08\x1a\xf8\xc4>\x0eq\x8a\x93H\x078\
-\xc7\x17\xfas/b\xc0:\x8e\x0bF\x8aU\xc1\x0d\x06\
-\xcb\x00\x17\x91y\x95HyM\x0dwe\x80Fh\xf1\
-\x9f\xcb\xc9\xb1u\xe1\x16\x03E\x80M\x9cE\xae\x17\x01\
-\xdaq\x8f\xe1\x18P\x09\xc1\x0c\xde\x22z\xa5\x00\xb0\x84\
-\xd70\xca\x1f .X\xc5;\xc6\x0aFih>\xa3\
-\xf1^Q\x9b\xb3\xf8\xc0d\xb4\xb7\x8d\x17\xf4\xa5\xe0\xf4\
-\x98\xf2\xd9\x17\xf0\x10\xde\xc7\xc3\x9f{\x8b\xfcI\x019\
-y(\xb8\x9daB\xf3v\x16\x99[\x0a\xa8\xe3\x07\x97\
-\x9a\x17\xe71\x19\xb3\x14\x90\xab\x13\x8b\xc1\xd45L\x97\
-\xd4e\xbf_!\xe0\xb3\x02\x12l\x0d\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x07F\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-42-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:59:53-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:59:53-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:a082dffc-8bfe\
--ef49-8ccc-cac4f\
-77d5a3b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:02d650d2-058d-e\
-74b-9709-c1b02df\
-6b2c4\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:83746bd\
-4-0c32-204e-9058\
--7a337663a075\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:83746bd4-0c32\
--204e-9058-7a337\
-663a075\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:42-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:a0\
-82dffc-8bfe-ef49\
--8ccc-cac4f77d5a\
-3b\x22 stEvt:when=\x22\
-2020-05-02T17:59\
-:53-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x9e(\
-\x94\x18\x00\x00\x00\xfbIDAT8\x8d\xa5\xd1+K\
-DA\x18\x06\xe0YWPP\xc4f\x11\xb1\xae\xd1*\
-Z\xb6\x1c\xa3v\xd1j\xb0\x9a\x8d&\xc1j0\x096\
-\xb7\x0a\x1atA\x83l1\x09\xa2\x88\xe5\xc9\xfe\x83c\
-\x99\x81q\xd8\xe3\xb2\x1a^\xce\xe5{/\xdf% 4\
-\xa0\xd5\xf0\xfe\x03\xa3\xc4\xebX\xfe\xcdd\x98x\x22>\
-\x17Q\xe3\xfa\xaf\x06\x978\xc7\x03v\xe2\xbf\xf6(\x83\
-$\xee\xe23\xa6n\xe1\x05S\xe3\xec\xe0\x09\x07\xd9\xf7\
-\x0d\x8e\x86u\x91\x8bRa\x1f\x83b\xee\xd5\xd8\xd1R\
-\xb9\x8fr\xebsxC\x95\x8d\x94\x8c\xcfpQ\x8c\x1a\
-\xca\xf4\x13\xf4\x0aR2_\xc0\x076rMN\xec\xc4\
-6;eJ\x16p\x88~\xb9\x83D\xbc\xc2i\xd3\xb9\
-2\xd3g\xec&^*Tx\xc7|Fl\x15\x98\x8c\
-\xb5m\xbcb:u\xd0\x8eg\xdbkH\x1d\x86\x1e\x8e\
-\x93A\x17_x\xc4]\x9c\xf1\xbe\x01}\xdc\xc6K\x0d\
-0\x1b0\x835l\x8e\x81\x0a+\x08\xa1\xae\xeb\x7f\xe1\
-\x1bYC\xe0j\xe4Bj\x02\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x07;\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-39-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:40-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:40-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:1477bc21-d028\
--be41-9614-58c59\
-0b2a13b\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:9eb9dd61-f612-a\
-d40-a86c-e54fdde\
-db3c2\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:4fc4001\
-f-bbc8-8d40-a13d\
--871ca96859d5\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:4fc4001f-bbc8\
--8d40-a13d-871ca\
-96859d5\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:39-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:14\
-77bc21-d028-be41\
--9614-58c590b2a1\
-3b\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:40-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>Mf\
-\xdf6\x00\x00\x00\xf0IDAT8\x11c\xf8\xff\xff\
-?\x03%\x98\xe1\xd9\xb3g\xc8\x98\x11\x8dOP\x9e\x14\
-\xcdX\xd5\xc2\x04\x98\xa0\xb4\x05\x10\x8b\xe0\xd1h\x05\xc4\
-\x82\xc8\x86\x80\x18\xccP\x01{ ~\x0a\xc4\x1aX\x5c\
-\x04c/\x01\xe2\xd5\xe8\x06\x80\xb08\x10?\x00\xe28\
-(\x9f\x05M#\x8c\xe6\x04\xe2+@\x5c\x06s9\xcc\
-\x80=@<\x85H\xffk\x01\xf1+ v\x80\xb9\xa0\
-\x09\x88/#)0\x00\xe2>(\xbb\x16\x88\xed\xa0.\
-\x9c\x04u\x01H<\x0a\x88\x9f\x83\xc2\x03\xc4\x09\x05\xe2\
-;@,\x0f\x95\x94\x03\xe2`(\xdb\x13\x88U\x80\x98\
-\x17\x88\xc3\x80\x98\x15*>\x11\x88w\x82\xc2\x0ffk\
-\x07\x10\x9f\x222M\xa4C\xc3\x8b\x1f=\x1d\xec\x00\xe2\
-EP63R\xf42\x22E\xb3\x0d\x10\xbf\x00bK\
-\x98:\xe44 \x0c\xc4\x87\x81\xd8\x08-m\xa0Gc\
->\xb2%\xe8\x0a\xd8\x09\xc4\x00\x07\xb5\x922\xc2\x00\x8a\
-s#\xa5\x06\x00\x00\xcbt\xd9\x16(\xb1\x8a\x80\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07G\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-38-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:58:15-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:58:15-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:554d466b-7b0d\
--1747-8040-416d0\
-1e969f2\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:65d58007-93c9-b\
-447-851d-8b32917\
-a52b7\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:e6183ba\
-6-31c3-9c4d-b594\
--bfaaf7bf0e84\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:e6183ba6-31c3\
--9c4d-b594-bfaaf\
-7bf0e84\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:38-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:55\
-4d466b-7b0d-1747\
--8040-416d01e969\
-f2\x22 stEvt:when=\x22\
-2020-05-02T17:58\
-:15-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>\x14\x19\
-]\xfb\x00\x00\x00\xfcIDAT8\x11c\xf8\xff\xff\
-?\xc3\xb3g\xcf\x18\xa1t1\x10w\x80\xd8P>\x13\
-\x8c\x8d\x0b\xa3(\x04\xd2[\x80\xf8?\x10\xaf\x02b\x16\
-\xa8\x1831\x06\xc0\x5c\xb0\x16\x88\xd3\x81x\x06\x10_\
-\x04bAB\x86\xa0\x1b\xb0\x19\x88\x93\xa0l\x90!\xb7\
-\x81X\x11\x9f!\xe8\x06l\x04\xe24\xa40\xa8~\x06\
-\x01\x96\xb8\x0cA7`\x13\x10\xa7B\xd9lP:\x09\
-\x88_\x02q0\xb6\x80\xc5g\x00\x0b\xccF \xed\x06\
-\xc4\xaf`\xae\x83\xa9'd\x00L3+\x94V\x03\xe2\
-/\xa0\xa8Fv\x09^\x03\x90m\x02\xb2s\x80\xf8\x1e\
-\x10;#\xeb!\x18\x06Pv\x0f\x10?\x04bM\xf4\
-p\xc0f@\x0ar \x01\xf9\xcb\xa1iB\x1c\x166\
-\x84\xa21\x03\xca\xe6\x00\xe2=P\xcc\x85M3\xae\x84\
-\x14\x05\xe2\x03\xf1\x15 ^\x86\xe4\x12\xa2\x12\xd2j\xa8\
-\x7fO\x01\xf1\x14b2\x15zfZ\x0f\xcdL\x85H\
-\x9a\x19\x09f&$\xc5\x9e@\xec\x0a\xd3HH3\x08\
-\x03\x00h\x15\x02\xac\x1aw\xe2\x18\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x07z\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xf1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 5.6-c148 79\
-.164036, 2019/08\
-/13-01:06:57    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22 xmln\
-s:photoshop=\x22htt\
-p://ns.adobe.com\
-/photoshop/1.0/\x22\
- xmlns:xmpMM=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/mm/\x22 x\
-mlns:stEvt=\x22http\
-://ns.adobe.com/\
-xap/1.0/sType/Re\
-sourceEvent#\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-1.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-020-03-03T09:50:\
-37-03:00\x22 xmp:Mo\
-difyDate=\x222020-0\
-5-02T17:57:59-03\
-:00\x22 xmp:Metadat\
-aDate=\x222020-05-0\
-2T17:57:59-03:00\
-\x22 dc:format=\x22ima\
-ge/png\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 xmpMM:I\
-nstanceID=\x22xmp.i\
-id:0e5067a2-0e78\
--eb40-991e-513a2\
-ed3cf55\x22 xmpMM:D\
-ocumentID=\x22adobe\
-:docid:photoshop\
-:4fb6cbf5-8fd9-4\
-c46-8a7a-398d2a0\
-2e760\x22 xmpMM:Ori\
-ginalDocumentID=\
-\x22xmp.did:cc3c553\
-a-ae46-b948-b4b1\
--795b6fef3061\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:cc3c553a-ae46\
--b948-b4b1-795b6\
-fef3061\x22 stEvt:w\
-hen=\x222020-03-03T\
-09:50:37-03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 21.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:0e\
-5067a2-0e78-eb40\
--991e-513a2ed3cf\
-55\x22 stEvt:when=\x22\
-2020-05-02T17:57\
-:59-03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-21.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>^-\
-m\x85\x00\x00\x01/IDAT8\xcb\x95\xd39/\
-EA\x14\xc0\xf1y\xcf\xd2\xa8D\x14Z\x15\x85BB\
-aI\xec\xb1\xbc\x10\x89\xa84(\x94\xb6\xc6WPj\
-EG\x22\x08>\x82\xce\x12\x89(D\xa1\x10\x8d\xfc,\
-\xe1\x13((\xccM&/\x8f\xc7M\xfe\xb9s&\x93\
-\xff9\xf7\xdc3\x01+\x98F@E|\xe7\xcb\x102\
-\x02\x0ax\xc0H\x91\xe4Od\x8bu|b4\xc6\x1d\
-\xe8G\x0fz\x13\xfa\xd0\x96&\x09\xd8\xc0=\xae\xf1\x8e\
-\xa1(\xba\xc19.\x12\xce\xf0\x9aT\x9b\x0f8\xc6B\
-\xdc(\xe0\x19\xc3\xbf\x94}\x88\xd9\xb4\x82\xfdD\x10\xa2\
-\xfd\x05\x131\xaeB.i\xde\x1e\xee\xb0\x8b\x9e\x80\x83\
-DP\x9dH\x9e1\x1e\xe3\xca$A'\xe6p\x8b\xc5\
-bA>9\x5cJ\x92KD;X.%\x08\xbfH\
-\xaa\x12\xc1v\xa9\x0a*b\x96\x5crx4v~2\
-\xc6\x8dX\xc3\x13\x96\xb2&\xce\x97\x19\x98\x01<\xc6_\
-\x5c\x87Ml\xa1=\xe0\x08\xab1{\x1dj\x8b\xa8\x8f\
-\x92\x998'\x83\xc5\x93\xb8\x1e\xbf\xf3\x14\x97?p\x85\
-\x13\xbc\xe1#ml@\x0d\x9a\xd0\x5c\x86\x164`\xca\
-\xf73\x91\xde\x85\xff2\x16\x9b\xd8\x95m\xe4\xfeAv\
-\x91\xba\xd1\xfa\x05\x9b\xa9\xf1\xac\xa9Y@\x8c\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x0a\x18\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00(\x00\x00\x00(\x08\x06\x00\x00\x00\x8c\xfe\xb8m\
-\x00\x00\x00\x09pHYs\x00\x00\x07\xb6\x00\x00\x07\xb6\
-\x01T\x81\xc7\xf9\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x09\xa5ID\
-ATX\x85\xad\x99k\x8c\x9cU\x19\xc7\x7f\xe7\xbc\x97\
-\x99y\xe7\xba\xdd\xee\xb6Kw[z\xa3\x14H5\xd9\
-B\xa9\xb0\xa5\x14\x12A\xa2~\x81\x90\x88T\x89\xa4\x91\
-\x08\xd1\x98\x98\xe0\xb7~0\x86\x0fh\xbcP\x05\x8cJ\
-@\xa2\x09\x86\x84(\x12\x0d\xd6\xd6\xde\x94P\xb9H\xb9\
-\xb4ii\xbb\xb0-{\xe9\xce\xce\xcc;\xef;\xef\xe5\
-\x1c?\xcc\xec\xec\xcc\xce,\xbd\xd8\x7f\xb2\x1f\xde\xf3>\
-\xefy\xfes\xces\x9e\xffs\x9e\x15\x5c\x02\xee\xb9\xe7\
-\x1e\xe3\xe3\xf1\xd4\x0d\xb6\xb0\xee2Mk\x9b4\xcd\xd5\
-\x864\xf2BH\x0b@k\x15\xc6Z\x15u\x14}\x18\
-\x04\xb5\xddQT\xfb\xd3\x81\x03k_\x83\x9d\xeab}\
-\x89\x8b1\xde\xb2\xe5\x81!\xa4\xf8n\xd2N>`'\
-\xd3y\xcbL\x5c\xd0wQ\x14P\xf3\xab\xc5 \xa8>\
-\x03\xb5\x1f\xed\xd9\xf3\xfcG\x97\x95\xe0\xc8\xc8\x03}Z\
-\xea\xc72\xa9\xec\xd7\x92\xc9\xac!\xa4\xbc\xd0\xf9\xdb\xa0\
-\xb5\xc2\xf7\xcbq\xd5-=#e\xf0\xe8\x9e=\xbf\x9f\
-\xfc\xbf\x09\xde\xbce\xfbW,+\xf1d6\xd3\x9b5\
-\x0c\xf3\x92\x88\xcd\x87R\x11\x95\xf2\xb9r\x10x;\xf6\
-\xed{\xee\x0f\x97Dpxx\x87\x95t\xfc_\xa4\xd3\
-\xb9\x07\x9dT\x01qQ\xc1pa\xa8Vgp+\xd3\
-Oy\x9e\xf3\xc8\xe1\xc3O\x87\x17Lpxx\x87\x93\
-JW\xff\x98I\xf7\xde\x99Je\x17t\xe0UK\x94\
-J\x93T\xbd\x12q\x1c\x12\xc71BHL\xd3\x22\x91\
-ppR9r\xf9>>m\xe5}\xbf\x82[\x99|\
-\xc5u\x9d\xbb\x0f\x1f~\xbaz^\x82\xc3\xc3;\xacT\
-\xba\xfaR\xda\xe9\xb9\xd3q\xf2\x0bN<6v\x94\xa9\
-\xa9\x8f\x17|\xdft \x04}}+X\xb2d\xe5\x82\
-6U\xaf\x8c[9\xf7\xea\xf49\xff\xae#G^\x08\
-Z\xdf\x19\xf3\x8dW\xad\xb9\xf6\xa9d\xc2\xb97\x93Y\
-\xd4\x1c\x8b\xe3\x08!\x04\xa2\xb1\xcfQ\x1cR.Ob\
-\xdb\x0eN\xba\x80\x93\xca\x22\x0d\x930\xf0\xbb\x12p\xdd\
-\x22RH\xd2\xe9\x02Zk\xc2\xd0\xc7\xf3+h\xad1\
-M\x0b\xcbJ\xa0T\xb4\xca\xb6t\xdf\xe9\xd3o\xbf\xbc\
- \xc1\x9b\xb6|\xf5>)\xcc\x1f\x14\x0a\xfdh\xad\x89\
-\xe3\x10\x10T\xdc)\x5c\xb7\x08\x80e%p\xdd\x22q\
-\x1c\xd1\xd7\xb7\x9c\x0d\xd7]\xcf\xcc\xcc4*\x8e\xf1\xbc\
-2\x00\x8e\x93C\xa3Q*n\xce\xed\x07U\xfa\x16\x0f\
-\xa1TL\xb9<I\x10x\x08!\x9b\xdb\x9fL\xa4\xf1\
-j\xee\xc6\xc1\xe5\x1b\xde\x1f=\xf5\xd6\x91\x0e\x827\xdc\
-\xb6\xbd\xd7\x8cyE\x08RZk\x82\xa0J\xa5r\x8e\
-0\xf0\x08\xc3\x1a H\xa7\x0bHiP\xabU\x09\xc3\
-\x1aK\x07\x86\x08\x82\x90\x99\x99)\x94\x8aI$\x1c\xd0\
-\x9aLv\x11\xa9d\x9a0\xac5I*\x15\xd3\xdf\x7f\
-%R\x1a\xcdU\x8c\xa2\x80\xa0\xe6\xe1y%,+\x89\
-4L\xa2\xc0\xbbc\xd5\xaak\x7fu\xf2\xe4;U\x80\
-f\xf4\xda\xa1\xfe\xa1\x10\xb2Gk\x85\xe7\x95\x9a\xbf\x5c\
-\xe9\x18']\xc04-L\xd3\x06\xe6\x02\xf7\xd4\xc9\xf7\
-1\x0c\x93(\x0a\x89\xe3\x08\x15\xc7\xd8I\x07\xa5b\xa4\
-4\xc8f{\x99\x9e>\x8b\xd6\x0a)\x0cV\xbaU\xa2\
-|\x0f\xa3\xa9\x1c\x09\xdb\xa1T\x99\x22\x0ak\x00\x94+\
-\x93\xf5\x1f#\xc8D\x91\xf9\x18\xf0`\xd3\xd7\xd6\xad\xf7\
-\x0dF\xb1<\x9e\xcb\xf6\xdaZ\x08\x84\x06i\x18\xb8\x95\
-\x22N:\x8fm\xa7\xdab\xaaR\x99F)\x9fZ\x10\
-\x82\x06\xb4FG\x01\xa5J\x910\xaeg\x0b)%B\
-\x1ah\x15\xa3\xd4\x9c\xc2mZ\xfe\x19J\xe9t=\x96\
-\xc3\x1a\xc5\x99O\xb0\x13\x0eq\x14\x12E\x01\x86a\x12\
-\xab(B\x89\xd5\xfb\xf7?{\xda\x04\x88\x94\xf10\x02\
-\xdbN8\x081\xa7\x12\xb9|_\xf3`\xb4\x22\x93\xe9\
-\xe1{\x9f\xbf\x9d\xc7\xff\xf6w\xb4\xd6\xf5\x18\x12&\xb7\
-\x8a\x14?>\xf2\xd7\xc6\x96*P\xed\xd2\xbbt\xd1`\
-\x93\x1c\x80\x90\x92\x9e\x9e\x01\x0c\xc3\x02 \x0ck\x98\xa6\
-\xcd\xb9\xa9\x8fL\x85z\x08\xf8\xbe\x80\x9d\xf2\xe6\x91\xe3\
-\xa7l;5\x98\xcf\xf7w\x90\xd1Z3]<\x8b_\
--\xa3\xf4\x9cC)\x05Ji\x12\xd2 o$H\x0a\
-\x83\xe3\xc51\xfc\xb8k\xbeE\x0a\xc9\xc8\xf0\x97X\xde\
-\xb3\x06\x80j\xe8rl\xe2=B\x15t\xd8\x96\xca\x93\
-\xd4j\xee\xc7\x03K\xfc\x15\xe6\xe7n9\xb1\x09\xc5\xa0\
-5o\x1b\x01\x0c\x1d\xf3\xe1\x87\xff\xc5\xadu\xe4\xcf&\
-\xca\xc0y\x05\x15p\x12\x0eKrC\xdc\xb8\xf6\xb6\xe6\
-\xd8\xc6\xea\x16^|\xe3\xb7T\x82J\x9b\xadm%\xa9\
-\xf9\xee\xb2\xb3gS\xc3\xd2P\xeaV\x00\xcb\xb4\xda\x8c\
-\x86\xec\x0cO\xac\xdc\xca\x1dK\xd7_\x80\xfb\xf3Cv\
-Q\x93\x9cS\xe0\x96\xb5wv\x8c\xcfn\xb9\x16l\x93\
-Z\xb0\x11@\xca\xf6\x09\xfc\xb0\xc6\x7f&O\xf2\xaf\x89\
-\x13\x97\x85\xa00\xcd\xae\xba\xba\xb2\xffjr\x89v\xc5\
-2\xcd\x06\x17\xad\x86M\xb4\xb8\xaaN\xb0\xbd\x84zo\
-\xe2\x04o\x1c\xfb7\xd5\xa8vY\x08\xa6\x9d\x02\xd9d\
-w\xe9\x1c\xc8\x0fR\x1a\x9fi>\xcf\x1dT\xb9\xce\x04\
-\x06\x1a\xc3m\x1f\xd5j\x1e\xe5\xb0\xbbt]4\xb9t\
-\x9eBa\x80\xd5\xfd\xd7t}_H\xf6\xce\x1b\x11\x8d\
-?=`\x02\x19\x00\x8dF\xb4\x90\x8cU\xf4\xa9N\x85\
-\x10\xd8\x89T3^\xba\xc14-r\xd9^2\x99\xc5\
-\xdcx\xe5\x16rNOW\xbb\xa4\xd5~@\xeb\xa9K\
-\x03d\x9b\x81\xa7U\x0c\xc6\x85U\xca\x89\x84\xc3\x8a\x15\
-\xd7\x90I\xe4\xb9\x22\xbf\x9c\x94\x9d\xeej'48\x89\
-,\xab\xfa\xd6\xd1\x9b]\xb2\xe0|R\xb6\xd7,\xad\x1a\
-n\x02\x15`Q\x1cGm\xaba\x18\x1d\x85N\xc3\xab\
-`hh=\xd7\x0d\x0c\xb3u\xfd\x171\xe4\x02v\x17\
-\x01?lOc\xb1j\xe6\xd2\xb2\x04\xce\x00\x84\xf3\x0e\
-\x83mu\xe6E\x80\xa4\xed\xd0\x9bY\xc2\xb6k\xbe|\
-Y\xc8Eq\xc8\x8c7\xdd>\x16\xcc&oqF\x22\
-\xf4Q\xa0\xa3\x96\xcbf\xe7\x07n\x1d\xa6\x95` \xbf\
-\xac\xab\x04^,\xfc\xb0\xca\xf3\xff\xf8\x09\xa7&\x8f\xb5\
-\x8d\x07\xcd\xc3\xa9>\x90B\xf3:\xd4u0n\x91\xa9\
-d2\x8dm';&\x15BSH.\xea\x18\xbf\x14\
-\x9c\xfa\xe4(o\x9e8\xc8xi\xac9\xa6T\xdc(\
-\xef\x00\xcd\xebR)\xbd\xbb\xf9\x8b|\xb7m\x82+\xae\
-X\xdb\x91\x1f\x012\x0b\xe4\xb3\x8bE:\x95e\xfdU\
-7\x90N\x17\x9ac\xbe_\xa1q\x82Q\x86\xdem\x1e\
-8\xb0\xf6\xb5\x9bG\x8e\x8f\x02C\x9eW\xc6I\xe5\x98\
-\xbd\xf7\xa6RYV\xac\xd8\xc0\xe4\xe4)\xa2\xb0\x1e\x17\
-\xa9d\x8e\xc1\xdeU\x0b:U:\xe6\xbd\xd17p\x83\
-2\x86a\x22\x84\xacg\xb4\x16\x1bCH&+\xe3\x1c\
-\x9fz\x9f@\xcf\xa53\xad5^\xb5<\xfbx\xfa\xe0\
-\xde\xb5\x87M\xd8\xa9\xd0\xf7?\x8f\xe0Q\xad\x15\xae7\
-C&=\x97\xaf\x92I\x87\xc1\xc19=\xde\xb0\xec\xfa\
-\x05\x15\x01\xe0\xd57_\xe4\xc8\xf8[X\xf6\x5c\xd7\xe1\
-\xdb\xb7l\xe1\xa7{\xff\xb9\xe07\xb3\xa8z%\x94\xae\
-\xa7\x18\x01\xcf\xc3N%\x01LS\xed\x02\x02\x00\xdf+\
-\x11E\x9d%\x10\xc0`n\x057\xad\xb9\xbd\xf9\x5c\x8b\
-<\x5c\xbfL\xdc\x92\xb7\x86\xd7\x8cP\xb0s\x14\x8bg\
-\x99\x9e\x1eczz\x8c\x9f\xef\xff\x0b\xae;\xddm\xca\
-&\xe2(\xc4\xab6\xe5\xae\x16EbW\x83h\x1d#\
-#\xf7\xffR\xc37\xa1^M\xf4\x14\x962\xbf\xc5\x91\
-\x96\x0e\x9bVme\xa62\xc9\x9e\xb7_\xe2\xd4\xc4Q\
-\x16\xf5,\xc52\x13,\xcd\x0f1\xb8x5)\xdba\
-\xbc4\xc6\xb13\xef\x10\xc5!\xa0\xd0\xba\x1e.\xdd\xea\
-M\x00\xb4f\xbax\x86(\x0a\x1b\xab'\x9e\xd8\xb7\xef\
-\xd9G\xda\x08n\xde\xfc\x8dE\x86\x19|\x00,\x06\xb0\
-\xec$\xf9\x5c\x7fG:\xd1\x1a\xde}wo\xb3\x8c\xb7\
-\xac\x04\x85B]%\xdc\xca4\xa9\xc6\x15\xd4\xb2\x12,\
-[\xb6\x06C\xc2\xf1\x13GH\xa62\x14\xf2\x9dj\xa2\
-5\x94J\x9f\x104\xd2\x9c\x80)\xc3\x88\xae\x9e\xed\xdb\
-4\x97\xe8\xd0\xa1_\x9f\x13\xf0\xc8\xecs\x18\xf8\x94J\
-\x13\xf5\x19Z \x04\xb4v\xb5\xc2\xb0\xc6\xcc\xcc8\xbe\
-_\xc1\xaf\xb9L\x9d\x1b\xab\xdf-\xa4Ao\xef\x22J\
-\xa5\xca\xec\xaat!\xa7)\x95'\x9a\xe4\x1a\x84\x1fj\
-m*\xb5I\xc1\xe9\xd3o\xbf\xb3|\xf9\x86\x01\x84\xd8\
-\x08\xf5\x0b{\x10x\xd8v\xb2M/c\x155\xef\xc9\
-\xadv\xb3\xf7\x13\xcb\xb2A\xc0\xc4\xc4\x18\xc5\xe28J\
-k\x0a\xf9\xfe6)U*\xa6T\x1ao\x17\x08\xcd\xae\
-\xfd\xfb\x9f{\xbc\x95S\x87Vm\xda\xb4\xee\x95J\xc5\
-\xdc\x00\x5c=;\x91\xef\xbbHi`\x186B\x80\xe3\
-\xe4\x89\xe3\x08\xdf/\xcf\xff\x1c\x80 \xf0\xa8VKT\
-*\xd3\xf8~\x05S\x9a,^<\xd4|_\xf3+\x94\
-f&\x88\xe3\xd6\x8aI\xbcl\x9a\xa3_?y\xf2d\
-\xdbMk\xc1\xe6\x91\xe3x/h\xf8B\xeb\xb8i\xda\
-\xa4\x9d<\x96\xed D\x9dHqf\x9c\xaa;C\xad\
-Vm6\x90\xa440M\x13'\x95'\x9b\xeb%\x9f\
-\xaf\xc7r\x10x\xb8n\xb1[\x96\xf8\xb3WM\xdd{\
-A\xcd\xa3\x16\x92\x96\xe3x?\x9b=\xd9\xad0\x0c\x93\
-D\xc2\xc1\xb6SXV\xa7\x1c\xceBkM\x14\xd5\x08\
-B\x1f\xdfwQq\x97\x1aS\xb3\xcb4G\xbf\xb3g\
-\xcf\x9e\xae\x05\xe8y\x15\xff\xa6-\xdb\xef\x15Z?A\
-\xe3twL \xea\xf7\x19iX\xc8\xc6\x89\xd7Z\x11\
-\xab\x18\x15\x87\xf3\xcfX+&\xd0|k\xff\xfe\xe7^\
-\xf84\xff\xe7\xad\x97FO\xbdud\xe9\xda\xcf\xfe\xc6\
-P:\x03b\x03-\xed\x92Yh\xadPq\xd4\xd8\xe2\
-z\x1bD\xab\x05\xfb\xe55\x81x2\x8e\xec\xbb\x0f\x1e\
-|\xe6\xf0\xf9\xfc_T\xcd\xb4y\xf3\xf6e\x86\xa1\x1f\
-Fp\x1f0t\xde\x0f\xda1*\xe0wQ$v\x1d\
-:\xf4\xec\xf9\x1b\x8b\x97Bp\x0e;\xe5\xc8\xc8\x89\x8d\
-Z\xb0\x0d\xad\x86A\xae\x03\xbd\x8c\xc6\xfd\x86z\x95\xfe\
-\x11\xe8\xa3h^W\x86\xde}p\xef\xda\xc3\x97\xf2o\
-\x88\xff\x01\x16/GI\xbb\xb0h&\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00t\xc0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01@\x00\x00\x01~\x08\x06\x00\x00\x00\xf3\xe0\xc3w\
-\x00\x00\x00\x09pHYs\x00\x00\x15f\x00\x00\x15f\
-\x01(d\xe40\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00 \x00ID\
-ATx\x9c\xec\xbdwt\x5c\xd7}\xef\xfb\xdd\xfb\xd4\
-\xe93\xe8 @\x02,\xaa\x94\xa8jI\x14\x8b`Y\
-Q,\xdbql\xc7tlKd\xe4\x14\xdf\x94\xe7t\
-'/\xf7\xde\xac\xe7\xbb\xe2x]\xdf\x97\xbc8\xd7\xc9\
-M\xe2\x16Y\x94K\xa48v\xe2\xd8\xb2\xe4F\xb1H\
-\x96l\xc9\x14eQ\x9d\x05\xac\x00\xd1\xa6\x9f\xbe\xdf\x1f\
-\x03\x80 9\xf5\xcci\x03\x9c\xcfZ\x5cD\xd9g\xef\
-\x1ff\xce\xf9\xcd\xde\xbfJ\x10\x12b\x93[o\xbd7\
-)\x8a\xdc\xa8ea\x88Rt3bu\x13\x86nF\
-\xd0\x0d\x8b\xf6\x00\xac\x17\x04I\x00q\x00\xc2\xfce\x99\
-\xf9\xffE\x00\xb1\xf9\xaf\x8b\x00\xb4\xf9\xafg\xe7\xff\xd7\
-\x01\x14\x18\x90\xa5\xc09F\xd84a\x98f\x04\xd3\x84\
-\xd1i\xcb\xc24\xa58eY\xfc\xd1\x03\x07\xbe\x90\xf7\
-\xe2\xef\x0dY~\x10\xbf\x05\x08\x096cc\xf7\x0e\x1b\
-\x06\xb9\x86\x11l \x8c\x8c2\x82Q\x02\x8c\x02X\x0b\
-\xa0\xcbg\xf1\x00\x00\x04\x98f\xc01\x06\x1c\xa3 G\
-\x19a\xc7\x08\xc3\xeb\x86A~\xf6\xd4S\x0f\x9e\xf2[\
-\xbe\x90\xe0\x12*\xc0\x10\x00\xc0\xc6\x8d;\xc4t:z\
-\x19!\xe6M\xa0\xf4j0\xb6\x11\x0co\x02A\x7f\xab\
-s\x11BA)\x05\xa1\x1c8B\x01BA(\xad\xfc\
-n\xfe\xf7\x95\xaf\x09@\x00\xc6X\xe5B\xc6`a\xc9\
-\xd7\xcc\x02\xb3,X\xcc\xac\xfco\x99v\xfe\xb49\x80\
-\xbd\x08B^\x04\xd8aX\xf4Y\x9e/\x1f\xdc\xb3\xe7\
-\x91\x82\x9d\xc9B\x96\x17\xa1\x02\x5c\xa1l\xd9\xf2\xfeU\
-\x84\x087\x81\x92-`\xd6V\x80\xbc\x09\x95ci]\
-\x08\xa1\xe08\x0e\x94\x13\xc0\xd3\xca\xff\x94\xe3\xc0Q\xa1\
-\xa2\xf4\x08\x07\xe2\xe2]\xc5\x98\x05\xcb\xb2`Y\x06L\
-\xc3\xa8\xfco\x190\xcd\xca\xd7\x96ebA\x9f\xd6\xc1\
-\x04\xf0\x0a\x08\xf6\xc3b\x07\x00k\xff\xfe\xfd_>\xe2\
-\x9e\xd4!A%T\x80+\x84\xad[w]\xce\x88u\
-7\x01\xd9\x02`+\x80\xe1z\xe3\x09\x018N\x00\xc7\
-\x09\xe09\x01\xbc \x81\xe3xp\x9cP\xef2\xdfa\
-\x8c\xc12\x0d\xe8\x86\x06\xd3\xd4a\x98\x1a\x0c]kf\
-\xf7x\x02 \xfbA\xd8\x01\x0a\xf3\xf1\xbd{\xbf\xfc\x9a\
-\x17\xf2\x86\xf8K\xa8\x00\x97)\x9b7\xef\x88p\x5cd\
-\x0b(\xee\x02c\xef\x04pU\xbd\xf1\x1c\xc7C\x10d\
-\xf0\x82\x04Q\x10\xe7\x15\xdd\xf2\xb9=L\xd3\x84ah\
-\xd0\x8d2\x0cM\x83aj\xe7\x8f\xde\xd59\x02\x82\xef\
-\xc1\xc2\xf7\x18\x13\xbe\x13:Z\x96'\xcb\xe7\x0e\x0f\xc1\
-\xf6\xed\x1fZm2\xe3\x97\x08\xc3\xdb@\xb0\x0d\x80\x5c\
-k,\xcf\x0b\x10D\x19\x82 C\xe0%P\xcay(\
-\xa9\xff0\xc6`\x18*t]\x83\xae+\xd0u\xa5\x9e\
-BT\x08\xd8^F\xf0m\x0a\xe1\xdf\xf6\xee\xfd\xe7\x13\
-^\xca\x1a\xe2\x1e\xa1\x02\xecp\xc6\xc6>\xd0c\x18\xfc\
-{@\xd8.\x80\xdc\x8eZ\xef)!\x10E\x19\x92\x10\
-\x81(EW\x9c\xc2k\x04c\x0c\xba\xaeB\xd7\x15h\
-Z\x19\x86\xa1\xd5\x1b\xfe,\x08\xdb\xcdL\xe3\x91\x03\x07\
-\xbez\xda+\x19C\x9c'T\x80\x1d\xc8\xad\xb7~\xa0\
-_\x90\xf8\xf72\xc6\xdeG@\xb6\x02\xa0\xd5\xc6q\x1c\
-\x0fI\x8cB\x94\x22\x10\x04\x09\xe1\xdb\xdd<\xa6i@\
-\xd3\xcaP\xd5\x22\x0cC\xad\xe5X\xb1\x00\xec\x03#\x0f\
-[\x16\xfb\xd7'\x9f\xdc=\xe9\xad\x94!\xed\x12>\x11\
-\x1d\xc3\xc7\xe8\xd6\xadG\xee\x04e\x1f\x06\xc3\xbbp>\
-\xb0\xf8\x028\x8e\x83(\xc6 I\xd1y\xa5\x17\xd2.\
-\xa6iB\xd3JP\xd5\x22t]\xad9\x0c\xc0\x0f\xc1\
-\xf0\x19\x9e?\xf1\xf5={\xf6\x18\x1e\x8a\x18b\x93P\
-\x01\x06\x9cJ\xb8\x0a\xbf\x13\x84\xfc\x17T\x82\x8f/\x81\
-\x10\x0aI\x8eA\x96b\xe0y\xc9\xd50\x94\x95\x8ei\
-\x1a\xd0\xd4\x12\x14%\x0f\xc3\xac\xa1\xe3\x08N\x01\xe4!\
-\x9e\xd2\x7f\xdc\xb3\xe7\x81c\x9e\x0a\x18\xd2\x12\xe1\xa3\x12\
-L\xc8\x96-\xbb\xdeJ(~\x07`o\x05P\xd5`\
-\xc7\xf3\x22\x22r\x1c\x92\x1c[\x0c.\x0e\xf1\x0e\xc3\xd0\
-PV\x0aP\x94\x02j\x9c\x91M\x00\x8f\x82\xb1\xbf\xdf\
-\xbf\xff\xa1\xc7\x004\x8eP\x0c\xf1\x94P\x01\x06\x88\x8d\
-\x1bw\x88\x99\x8c\xf4~\x80|\x14\x04\xd7T\x1bC\x08\
-\x85,\xc7!\xcbq\xf0|\xb0c\xf2V\x0a\x8cYP\
-\x94\x02\xca\xe5\x22L\xb3\x96\xf3\x84\xbc\x06b\xfd\xbd\xa9\
-\xab\x9fy\xea\xa9G\xca\x9e\x0a\x18R\x93P\x01\x06\x80\
-\xbb\xee\xda\x91R4\xe9~\x80|\x14\x0cC\xd5\xc6P\
-\x8eGD\x8e#\x12I\x84\xbb\xbd\x00\xa3\xeb*J\xe5\
-,4\xb5\xa6\x8e\x9b\x04!\xff\xa0\x09\xf8\xf43\xdf\x7f\
-p\xdaK\xd9B.%T\x80>\xb2y\xf3\xae!\x9e\
-\xc7\xff\xcd\xc0>\x84\xf3\x95Q.\x80\xe7ED\x22I\
-\xc8r\x14\xe1\xdb\xd59\x98\xa6\x8er\xb9\x00E\xc9\xd7\
-\x8a/,\x82\xe0\xf3\xcc\xd4?\x19\x86\xd2\xf8G\xf8D\
-\xf9\xc0\xd8\xd8\x07z\x0cK\xf8c0\xf6\xbb\x00\x22\xd5\
-\xc6Hb\x04\x91h*\xf4\xe4v8\x96e\xa2T\xce\
-\xa1\x5c\xce\xd7\xb2\x13j x\x800\xf6\xb1}\xfb\x1e\
-:\xe3\xb5|+\x9dP\x01z\xc8-o\xd9\xd5-\xea\
-\xf8\x08\x18\xfb\x03\x00\xc9jc\x04AB,\x96\x86 \
-\xd4L\xe2\x08\xe9@\x183Q*\xe5Q.\xe7\xea\xee\
-\x08u\xd5\xf8\xc4\xd3O\x7fe\xc2k\xf9V*\xa1\x02\
-\xf4\x80J\xe1P\xf2\xc7\x0c\xe4\xf7\x01$\xaa\x8d\xe1\x05\
-\x09\xf1h\x0a\x82XuC\x18\xb2L\xb0,\x0b\xe5r\
-\xae\x9e\x22\xcc1\xe0S\xb0\x84\xbf\x0a\xf3\x8f\xdd'T\
-\x80\xeeB\xb6n\xbdo'\x08\xf9$\x80\x81j\x03x\
-^@,\xd6\x05Q\x0cw|+\x09\xd34P*e\
-+!4\xd5\x99\x02a\x1f\x1f\xecW\xff\xee\x91G\x1e\
-\xb1U\x081\xa41\xa1\x02t\x89\xad[w\xde\x0aJ\
->\x05\xc6n\xab\xf6{J)\xa2\xd14\x22\x918\xc2\
-\xb7a\xe5b\x18\x1a\x0a\x85\x99z\x19&\xcf1\xca~\
-\xff\xc0\x13\x0f\xed\xf3R\xae\x95B\xf8\xe49\xcc\xd8\xd8\
-\xbd\xc3\x86I?\x01\xe0>Ty}\x09\x01$9\x81\
-x,\x05B\xc2\x82\x04!\x15T\xb5\x84Ba\x16\x96\
-U3\x83\xee?)\xc1\xef\xee\xdd\xbb\xfb\xa8\x97r-\
-wB\x05\xe8\x107\xdd\xf4a!\x12)\xff\x09\x08\xfe\
-\x1bjxvEQF<\xd6\x05.\x0c`\x0e\xa9\x02\
-c\x0c\xe5R\x16\xa5\xda\xf6\xc1\x12\x08\xf9\x0b\x9e\x8e\xff\
-U\x98k\xec\x0c\xa1\x02t\x80\xdbo\xbf\xffz\xca\x99\
-\x9f\x03pS\xb5\xdf\x13B\x11\x8f\xa5!G\xaa\xfa?\
-BB.\xc04u\xe4\x0b3\xd05\xa5\xd6\x90C\x04\
-\xe47\xf6\xed{\xf0\x19/\xe5Z\x8e\x84\x0a\xb0\x0d6\
-o\xde\x11\xe1\x84\xc8\xff\x03\xc6\xfe\x185\xf2u%)\
-\x8ax\xbc+\xac\xbf\x17\xd22J9\x8fBq\x0e\x8c\
-Y\xd5~m\x81\xe0s<U\xfe(l\xf0d\x9fP\
-\x01\xdad\xdb\xb6\x9dw0\xe03\x00.\xaf\xf6{J\
-y\xc4\xe3]\x90\xa40\xac%\xc4>\x96e\xa0\x90\x9f\
-\x85\xaa\x95j\x0d9j\x11\xfa\x9bO\xee\xfd\xe2\xe3^\
-\xca\xb5\x5c\x08\x15`\x8b\x8c\x8d\xdd/\x1b\x96\xf9I0\
-|\x045^?I\x8a\x22\x91\xe8\x0esvC\x1cC\
-Q\x8a(\x14fj\xed\x06\x01`w4\x82\xdfz\xfc\
-\xf1\xddE/\xe5\xeatB\x05\xd8\x02\xb7\x8f\xed\xbc\x86\
-\x9a\xe4\xcb\x00\xbb\xb6\xda\xef\x09\xa1H\xc4\xbb \xc9U\
-\xd3zCB\xda\xc2\xb2\x0c\xe4rS\xb5Cf\x18^\
-\xa6\x94|p\xef\xde\x07\x7f\xea\xadd\x9dKh\x98j\
-\x0e\xb2u\xfb}\xbfG,\xf2\x08\x80U\xd5\x06\x08\xbc\
-\x84T\xba\x0fB\x18\xd0\x1c\xe2\x12\x95Rh1\x10\xa0\
-\xba\x12$\xe8a\xc0\xaf\xae\x19\xbd\x9e\x1b?\xfe\xee\xbd\
-\xc0\x9e\xb0\xfe`\x03\xc2\x1d`\x03\xc6\xc6\xee\x1f0L\
-\xf3\x9f\x01\xbc\xb5\xfa\x08\x82X,\x85h4\xe5\xa9\x5c\
-!+\x1b]W\x90\xcbM\xd5\xecw\xcc\x80\x1fX\x06\
-\xd9\xf5\xd4S\x0f\x9e\xf2X\xb4\x8e\x22T\x80u\xd8\xb6\
-m\xe7\xcf\x03\xf8\x12\x03\xba\xab\xfd\x9e\x10\x0e\xc9dO\
-\x98\xc6\x16\xe2\x0b\x16\xb3\x90\xcfNA\xd3k\xd6\x1e\x9c\
-b\x94}\xf0\xc0\x13\x0f}\xd7K\xb9:\x89\xf0\x08\x5c\
-\x1d\xb2u\xeb}\x7f\x0aB>\x8f:u\xfa2\x99~\
-\xf0\xbc\xe8\xb1h!!\x15\x08!\x8bGb\xc3\xa8j\
-\x17\x8c\x12F>\xb8f\xf4z\x1a\x1e\x89\xab\x13\xee\x00\
-/b\xcb\x96_M\x10\xa2?\x00\x82\xf7\xd4\x1a#\xcb\
-q\xc4\xe3] a\xf7\xa1\x90\x80\xa0\xa9e\xe4\xf2S\
-\xf5\xbc\xc4\xff\xc9s\xdc\xce={\x1e\x98\xf3R\xae\xa0\
-\x13>\xc1K\xd8<v\xff\x95\x9ci\xfe\x1b\x80\xab\xaa\
-\xfd\x9e\x10\x82x\xbc\x0b\xb2\x1c\xf7X\xb2\x90\x90\xc6\x98\
-\xa6\x8elv\x12f\xadnu \xafY\x1c{\xcf\x93\
-{v\xff\xccS\xc1\x02Lx\x04\x9eg\xdb\xb6\xfb~\
-\x890\xf6(jxy\x09\xa1H\xa6\xfa IQ\x8f\
-%\x0b\x09i\x0eJ9HR\x1c\x86\xa1\xd5*\xaa\xd0\
-M\x18v\x8d\x8clzi|\xfc\xd0\xcb^\xcb\x17D\
-B\x05\x08`\xeb\xf6\xfb~\x0f \x9f\x03P\xb5\xfe<\
-\xa5<2\x99~\x08|X\x9e>$\xd8T\xec\x82q\
-X\xa6\x01\xc3\xd4\xab\x0d\x11\x01\xf2\xcbkF\xaf'\xe3\
-\xc7\x9f\xdf\xe3\xb1x\x81cE\x1f\x81w\xec\xd8\xc1\x9d\
-9#\xff-\x08~\xa7\xd6\x18\x81\x97\x90L\xf5\x86\xb9\
-\xbc!\x1dG\xa98\x87b)[o\xc8gy\xee\xc4\
-o\xaf\xe4\xca2+V\x01\xde}\xf7\xceX\xa9\x8c\xaf\
-\x02xG\xad1\xa2\x18A2\xd9\x1b:;B:\x16\
-E\xc9#\x9f\x9fE\x9d\x9e\xec\x8f1K\xd8\xb1R\xcb\
-\xef\xaf\xc8'{\xdb\xb6\xfb\x06\x19\xc87Q\xa3|\x15\
-\x00Hr\x0c\xc9D7V\xe8K\xd4\x12\x96e\xc14\
-u\x98\xa6\x0e\xc3\xd0`\x9a&\x18\x18,\xd3\x00\x18\x83\
-\xb9\x10\xacK\x08\xb8%;i\xca\xf1\xe0(\x07J8\
-P\x8e\x03G9\x10\xca\x83\xe3\xb8p\xc7\xed \x15\x0f\
-\xf1\xb9Z5\x06\x01\xe0\x10\xcfYo\xdf\xb3\xe7K'\
-\xbd\x94+\x08\xac\xb8\xa7{\xf3\xd8}\x1b8\x93|\x0f\
-\xc0H\xad1\x950\x97n\x84\x1b\xbf\xf3\x18\x86\x06E\
-)BU\x8aP\xb524\xbd\x0c]U\xa1\xe9J\xbd\
-*\xc6\xb6!\x04\xe08\x09\xa2 \x81\x17D\x08\x82\x04\
-\x9e\x17!\x0a\x128^\x84(E!\x892V\xe0-\
-l\x0bM+#\x97\xab\xab\x04\x8f\x82\x99w\xed\xdf\xff\
-\xe5#^\xca\xe57+\xea\xee\xd9<v\xff\x95\x9ce\
-~\x0f\x0cC\xb5\xc6D\xe4\x04\xe2\x89./\xc5\x0a\x1c\
-\xcc\xb2P,gQ*\xcc\xa1X\xceA)\xe7a\x18\
-U\x0d\xea\xbeB\x08\x81,E!I1\xc8r\x1c\x92\
-\x14\x85$\xc7 \x8a\x91\xd0lQ\x05]W\x90\xcd\x9e\
-\xab\x17+x\xd6\xe2\xf0s+)Lf\xc5\xdc%\xdb\
-\xb7\xef\xba\xc1b\xec1\x00\xbd\xb5\xc6D\xa3)\xc4b\
-i\x0f\xa5\x0a\x0e\x9aZB6?\x8d|~\x0a\xc5B\
-\x16ulF\x81\x87\xe3xD\xa3)\xc4ciD\xa3\
-)D\xa2\x89\xb04\xd9<\x86\xa1!;7\x01\xab\xb6\
-\x12\x9c\xb4L\xee\xe7\x9f|\xf2\x81\x83^\xca\xe5\x17+\
-B\x01\xde~\xc7\xbdo\xa2\x16\xfd\x0e\x80\x9a[\xbbh\
-,\x8d\xd8\x0a+h\xa0\xeb\x1a\xb2\xd9\x09\xcc\xce\x9c\x85\
-\xa2.\xdf\xa2\xc2\x94RD#)$S=H&{\
-V|\xd3y\xc3\xd0077Qo'8gQ\xf2\
-\xb6'\x9fx\xf0)/\xe5\xf2\x83e\xaf\x00\xb7\xdc\xb1\
-\xeb\xcd\xc4b\xff\x01\xa0f\xfaF$\x92D<\x9e\xf1\
-P*\x7f)\x97\xf3\x98:w\x02s\xd9It\xf2N\
-\xcf.\xd1h\x12\xa9d/R\xa9\x95[\xbeL\xd7U\
-d\xb3\x93\xf5\x94`\x1e\x8c\xbds\xff\xfe\x87\xf6x(\
-\x96\xe7,k\x05\xb8}\xfb}\xb7[\x8c<\x86:\xca\
-O\x8e\xc4\x91\x88W-\xf6\xb2\xec(+E\x9c=\xfb\
-:\x0a\xf9\x19\xbfE\x09\x04\x84\x10$\xe2]\xe8\xea\x1e\
-B\x22\xb12\xee\x81\xa5Tl\x82\x93\xf5\x1c#%\x02\
-\xbcm\xdf\xbe\xddOx)\x97\x97,[\x058o\xf3\
-\xfb\x01\x80\x9aF\xbd\x95\xe2\xed\xb5,\x13g\xce\xbe\x81\
-\xd9\x99S\xa8}\xaf\xafl$)\x8a\x9e\xeead\xba\
-V\xad(\x07\x8a\xa6)\xc8f'\xea\x0d\xc9Y\xd4\xba\
-\xeb\xc9'\xbe\xf4c\xafd\xf2\x92e\xf9No\xdf~\
-\xef\xb5\x8c\xd1\x1f\xd6\xaa\xe3\x07Tn\xf8d\xb2\xa6?\
-d\xd9P*\xe7p\xe2\xc4K\xd0\xd4\x9aMuB\x96\
- \x882\x06\xfb\xd7#\x95\xee\xf3[\x14\xcfP\xd5\x12\
-\xf2\xf9s\xf5>\x1c\xe7(!w.\xc7R\xfb\xcbN\
-\x01n\xdf\xfe\xc1\xcb,\xc6\xed\x050Pk\x8c H\
-H\xa5\xfa\x97\xfd'}.?\x8d\x13\xe3/\xd6\xac\x1a\
-\x1cR\x9bh,\x85\xc1\xc1\xcb\x10]!\xbd\x9cK\xe5\
-<\x8a\x85\xba\xa6\x91IJ0\xb6w\xef\xee\x97\xbc\x92\
-\xc9\x0b\x96U\xb8\xfd\xd6\xad\xbb\xd60\x90\x1f\x02\x18\xae\
-5\x86\xe3x\xa4R\x03\xa0ty\x87E\x14\x8a\xb38\
-~\xecP=#wH\x1dt]\xc5\xec\xcc\x19\x10R\
-\x09\x8fZ\xee\x1f\x96\x82 \x811\x0b\x86\xa1\xd5\x1a\x12\
-c\xc0/\x8e\x8e^\xf7\x8d\xe3\xc7\x0f-\x9b\x9a\x82\xcb\
-F\x01\xde\xf2\x96]\xdd\x9c\xc5\x9e\x00\xb0\xbe\xd6\x18J\
-(\xd2\xe9\x01p\xdc\xb2\xf9\xb3\xabb\x18*\x8e\x1c9\
-\x18\xee\xfc\x1c\xa0X\x9cC\xa9\x94E<\x9e\x01\xc7\xf1\
-~\x8b\xe3*\x82\x10\x811\x9f\xd2X\x83$\x03\xde1\
-2r\xd3W\xc6\xc7\x0f.\x0b\x9b\xca\xb2\xd8\x06\x8d\x8d\
-\xdd/\x8b\x9a\xf5\xef\xa8\xd1\xa4\x1c\xa8x\xfcR\xa9\xbe\
-e\x7f\x13\x03\xc0\xc4\xc4\xb1z7qH\x8b\x14\x0a\xb3\
-x\xe3\x8d\x9f,\xebXI\xa0\x92~\x98L\xf4@\x10\
-\xea\x96}[\xcf\x98\xf1\xb5{\xee\xf9\xc8\xb2\xa8\x0d\xb7\
-\x1c\x14 1M\xf3s\x00\xd9RoP\x22\xd1\x0d\xbe\
-\xfe\x1b\xbb,\xb0,\x0b\xb3\xb3g\xfc\x16c\xd9\xa1\xeb\
-\x1a\x8e\xbcq\x10\xe5\xf2\xf2.\x9aB\x08A2\xd9\xa0\
-\xfc\x1b\xc1\xb6|>\xfb \x96\x81\x0f\xa1\xe3\xcf\x82[\
-\xb7\xed\xfc$\x80\xdf\xaa7&\x12M\x22\x1aIz$\
-\x91\xbf\x94\xca9\xcc\xce\x84\x0a\xd0\x0d\x18\xb3\x90\xcdN\
-V>L\x97q3,B(DQ\x86\xa2\xd4\xd9\xf1\
-\x12l\x5c3z\x1d?~\xfc\xd0\x0f\xbc\x93\xccy:\
-Z\x01n\xd9\xbe\xf3\xd7\x08\xf0\xc9zc\x04AF2\
-\xb9r\xcaZiZ\x19s\xb3g\xdb\x9e\x87\xe7\x04\x88\
-R\x04\xb2\x14C$\x92X\xcc\x93\x8e\xc7\xd3\x88\xc5R\
-\x88\xc5R\x88D\xe2\x90\xe5\x18x^\x00\x01\xa9\xd3\x8b\
-b\xf9\xc0\x98\x85|~\x16\x99L\xff\xb2.\xd9Ei\
-\xa5<\x99\xa6\xd5l\xb9\x09\x00\xdbW\x8f\x5c7qb\
-\xfc\xd0O\xbc\x92\xcbi:V+l\xdbv\xef[\x18\
-\xe8w\x00\xd44\xeaQ\xca!\x93Y\xb5\xec=\xbeK\
-\xc9\xe6&\x91\xcd\x9e\x83i\x1a\xb0L\x03\xa6e\x82\x99\
-&,f\xc2\xb2L0\x86E\xcf0!\x04\x84\xd2\xca\
-\xcd\xce\x89\x10x\x01</\x82\xe7E[^O\xd3\xd4\
-Q(fWD\xcca<\x9e\xc1\xe8\xe8\xf5\xbe\x06\xd1\
-3\xc6`\xe8*t]\x99/Kf\x22\x9d\xee\x07\xa5\
-\xce\xd9\xb9\xf3\xf9\xe9\xfa;A@\x07cwwj\xca\
-\x5cG*\xc0\xad[w\xad\x01a?A\x9d\xca.\x00\
-\x90\xce\x0c\xac\xa8>\x1e\xc5\xc2\x1c\xf2\x85i\xbf\xc5\x80\
-\xa2\x16Q\xc8\xcf\xd4K\xb1Z\x16\x0c\xae\xba\x0c=\xdd\
-5#\xae\x5c\x80A74\xe8\xaa\x02\xcdPa\xe8\xca\
-%\xafq:=\xd0\xc8\x89\xd1\xda\x8a\x8c!;7\x01\
-\xbdz\xdf\xe1\x05&y\xce\xba\xa9\x13\x0b\xaav\xdc\x1e\
-~l\xec~\x991\xebQ\x00\x97\xd5\x1b\x17OtA\
-\x12WN\x077U-!\x9b\x9b\xf4[\x0c\x00\x95\xa6\
-\xf1\xbc AU\x96\xf7N\xb0T\xcc\xa1\xabk\xc0\xd1\
-\x1d\xd7\xc5\x98\xa6\x0eM-\xa1T\xce!\x9f\x9f\x81R\
-\xceC\xd7\x95J\xb5\xed*D\xa3)GO<\x84\x10\
-\x08\xa2\x0cE)\xa2N\xe1\x8c\x98\xc5\xc8\x96\x8d\x1b\xef\
-\xd8\xfd\xfa\xeb\xcftT\xecU\xc7)\xc0\xe1\xe1k\xff\
-\x11\xa4v\x1f\x0f\xa0\xd2\xcb#\x1e\xf7\xbe\xa8i.{\
-\x0e\xaaZ\x04\xa1\x9c\xa7\xe16\x96ean\xeeL\xa0\
-\x82\x9e9\x8e\x07%\x04\x9a\xae\xf8-\x8ak0f\xc1\
-\xb4\x0c$\x93=\x8e\xcdi\x1a:T\xad\x84r1\x87\
-Bq\x06\xa5R\x0e\x9aV\x9e\x0fk\xaa\xbf\xa3&\x04\
-\xae\xdc\xf7\x94R\xf0\x9c\x00\xb5\xbeicXS\xcb\xbd\
-\xe3\xe3\x87\xfe\xd3q\x01\x5c\xa4\xa3\x14\xe0\x96m;\x7f\
-\x93\x10\xfcy\xbd1\x94pH\xa5\xfb</\x80iY\
-\x06\xf2\x85\x19\x98\xa6\x01U-B\xd3\xca\x95\x1b\x87\x17\
-\xe0\xb6\xa5!\x9f\x9fnd\xacn\x08!\x04\x82 !\
-\x12\x89!\x1a\x8d\x811\x13\xa6\xd9\xde\x879\xcf\x8bP\
-\x94\xc2\xb2>\x0a\xabJ\x09]]\x83\xb6w\x81\x96e\
-@\xd3\x14\x94\x95<\x0a\xf9i\x94\xca\xe7\x15^\xab\xaf\
-\x1b\xa5\x1c\xa2Qw\xa2\x1d8^\x80e\x19\xf5+\x83\
-\x13r\xf3\xea\xd1\xebN\x9e8~\xa8cr\x86;\xc6\
-\x06\xb8u\xeb\xce[A\xf0\x04j\xf4\xee] \x99\xea\
-\x83$F<\x92\xea<\x86\xaebv\xeeR\xef+\xa5\
-<\xa2\xd1\x04\x22r\x02nX\xccM\xd3\xc0\xd4\xd4\xb8\
-m%#\x8a2b\xf14$1\x0a\x8e\xe3\xb1~\xfd\
-e\xe08\x0a\x80!\x97\xcb\xe2\xe4\xc9\xa3\x98\x9c<i\
-\xbb\x8aL6;\x09M[\xbe\xbb@\x00\xe8\xed\x1d\xc1\
-\xc0\xc0\xba\x96\xaf\xcb\xe5\xa6\xa0\xaaE\xc7\xe4\xe08\x01\
-]]\xab\x1c\x9b\xefb\x18\xb30;{\xb6Q\x90\xbd\
-B\xc0\xb6\xec\xdb\xf7\xd0s\xae\x09\xe2 \x1d\xe1\x1e\x1d\
-\x1b\xdb\x11'\x04\x0f\xa1\x81\xf2\x8bD\x13\xbe(?\x00\
-0j\xa4\x9dY\x96\x81Ba\x16\xd3\xd3'Q*\xce\
-\xc1\xb2\x9c=\xa6\x96\xcby\x9b\xca\xaf\x92\x19\xd3\xd55\
-\x04I\x8c\x01 \x88\xc7\x13\xf3\xca\xaf\xf2\xfbd2\x8d\
-\xab\xaf\xbe\x017\xde\xb8\x15\xa2h\xcf\xb0N\x96q\xa8\
-\xc8\x02sU>\xf8\x9a\xc1\xa8\xefXh\x19\xc6\xdc5\
-\xbf\x11B\x91H6,\x1f'3\x90\x87\xb7l\xf9\xd5\
-\x8e\xa8\x22\xd1\x11\x0a\xd00\xe5\xff\xc3\x80\x0d\xf5\xc6p\
-\x9c\x88x\xcc\xbffFf\x83\x9b\xd9b\x16\x8a\xa5,\
-\xa6\xa7O \x9f\x9f\x82\xe1P\xcc\x9c\x9d\x1d\x04!@\
-&3\x88\xc8E\x95ND\xb1zpo2\x99\xc1\xcd\
-7\xdbT\x82\xcb\xf8\xf8\xbb\x80\xae\xab(\x97s-_\
-\x97N\xf7;\xea\xa8c\xccr\xdd\xdc \xf0\x12\xa2\x91\
-\x86\xad#\xd6\x13\xa2\xff\x8d\xab\x828D\xe0?\x9e\xb7\
-m\xdb\xf5^\x00\x1f\xaf7\x86\x10 \x99\xea\x05\xe7\xa2\
-7\xae\x11\xc5R\xb6\xe9\xe2\x03\x86\xa1C)\xe7a\x9a\
-\xfa|o\x5c{r3f!\x97\x9bj\xf9\xbaD\xb2\
-\xfb\x12\xe5\x07\x00rDF<V\xbdx6\xcf\x0bH\
-\xa7\xbbp\xf6\xecxKk\x15\x8bY\xc7\x9c3\x95\xd8\
-\xc4`Zm8^l\xb9\xad\x02!\x14\x92\x1c\x83\xc0\
-\x8bm\xdbp\x17\x10D\x09\x1c'82W\xbd54\
-\xad\x5c\xff~'\xb8q\xf5\xe8\xf5/\x9f8\xfe\xfc\x8b\
-\xae\x0a\xd3&\x81V\x80cc\xf7\x0e[\x8c|\x0b@\
-\xddsmd\xc1\xc6\xe60\x86\xa1ASK\x0ds\x88\
-M\xd3@\xb18\xdb\xf2\xfc\xa6\xa9CQ\x0a\xd0\x0d\x15\
-\x84r\xe0[\xbcqMSG\xa9\xd4\xda\xce\x83\xe7\x04\
-\xa4\xd3}\xa8\xa6H,\xcbB&\x93\xa9\xfa;\x00\x90\
-\xa4\x08\x0a\xc5\x02J\xc5\xe6\xf2a-\xcbD\xb1\x98m\
-I\xbe\x8b\xe18\x0e\xb1X\x1a\x89x7b\xf3Y(\
-\x91H\xbc\x12\xdfI\x00\xcb\x0aF\xd1\x07J(2\x99\
-\x9a%(\xeb\xc2\xf1\x02\x04A\x9e\xf7\xb2\xb6\xb7\x83#\
- \x90\xa4\xda\xbbJfY\x98\x9b=\x03U-A\x96\
-+\xa6\x0f;\xab\xf0\x82\xd8(@\x1a\x04\xb8k\xcd\x9a\
-\xeb\xbf2>\xfe|{7\x81\x8b\x04\xf8\x08\xfc1j\
-\x18\xf4A\xd4\xe9\xe4\x06,t\xfcr\xbe\x95\xa5\xae\xab\
-\x98\x9b;\x8b|a\x06\xba^\xffx[*\xb5\xf7\xfe\
-\xea\x9a\x82\x5cv\x12\xb33\xa7[:\xd22\x1b\xe5\xae\
-\x22\xd1\x14j\xdd\xf4\xaa\xaabv\xae\xde\xdf\xc2\xe6\x1f\
-\x9a\xe6\xd04\x15\xed<\xd0\x82 /\x1e\xd5\xe9\x92\x12\
-f\x94r\x90\xe4(\x92\xc9\x1ed2\xab\xdax\x90\x9d\
-\xa3T\xb2k\x8b\xad \x08\x12\x92\x0e\xf4%Q\xd5b\
-];\xb3\xa2\x14`\x98:t]A\xa9l\xbf\xbaM\
-\xe5(\xdcp\xd3\x91f\xc4\xda\xbdc\xc7\x8e\xc0n\xb4\
-\x02\xab\x00\xb7l{\xe3OA\xf0\xe6F\xe3,\xcb\x82\
-\xdab\x99\x22\xc3\xd0j\xde\xac\x8c\x01\xe5r\x0e\xd9\xec\
-\xc4\xe2\x98zQ\xf0\xba\xae6\xfc$lZ.SG\
-.7U\xaf(\xe5\x85\xd8\xf0*Kr}\x9b\xd3\xc4\
-\xd9\xb3\x98\x9b\x9b\xc3\xc5\x8a\xcbb\x16\xce\x9c9\x03]\
-\xb3\x9a\xce\x81\xd54\xfb\x81\xd0\x94rH&{\x1a\x86\
-3q\x1c\x8fD\xa2\x1b\xa9T\x8f\xaf\xb9\xb9\x96e4\
-\xfc\xa0l\x84(E\xdb>\xc90\xc6j\x9eF\x18c\
-(+\xe7O\x0c\xa5\xe2,\xf46\x8e\xde\xd1X\xa6\xe1\
-q\x9b\x80l?=!\xfd\x81\xedE\x5c&\x90\x9ay\
-\xeb\xd6]\x97\x13\x82\xaf\xa2N\x9e\xefR\x0cCC$\
-\x92h*\x7fUQ\x8b\xc8f'\xa1(yX\x96\x09\
-\x8bY\xb0,\x0b\x86\xa1Vz#\x14\xa6/\x09\xf8\xe4\
-\x08W\xf5XaYF\xa3\xaeZ-A\x08\x81$\xc7\
- \xcb\xf1\xa6\xfe\x16\xcb2[2\xbeW\xea\xbd5*\
-\x0c\xc1P(\xe4Q(\xe4\xa1\xeb:\x14EA6\x97\
-\xc5\xc4\xd9\xb3(\x95*\xaf\x8b\xa2\x14aY\x8d\x9d8\
-\xe5r\xc1\xb6g2\x99\xe8\x06/4_q\x85\xe3\x04\
-\xc8r\x0c\x9a\xa6\xf8\x16\x10\x9eL\xf6@l3\x0a\x81\
-\x17D[\x0e\x95\xa5\x18\x86\x06\x8e\x17\xe7cP\xcf\xa3\
-\xaa\xc5\xf9\x8c\x8e\xf3(j\x11\x94r\x10\x04\x11\xad\xee\
-\xa2\x09!\xe0y\xe1\x929/\x19\x07r\xc7\xd0\xba\x1b\
-\xff\xf5\xe4\xb1\x83\xad\x1b\xac]&\x80\xd5A?F\x81\
-7>\x07\xa0\xe9\x86\xad\x96e\xa1X\x9ck*\x0a~\
-\xe1-\xb6,\xabR\xdb\xad\x89\xfan\xd5\xc2\x15L\xd3\
-@6;\xe1H\xd5eJ(\xa2\xb1\x14$)\xdeb\
-\x1aS\xab\x8a\x97\xe2\xe2\x9b\x5c\x10\x04\xf4\xf5\xf7#\x22\
-G`\x18\x06\xa6\xa7\xa7\x90\xcf\xe7\xa1(*\x14\xa5\xfa\
-\x8e\x866\x19d\x9e\x9eo,T\x09\xf6U\xa1\xe9e\
-hj\xb9\xe1\x07\x06\xcf\x0b\x10\xeb\xd8\xb1jA)\x87\
-t\xba\x0fss\x93\xbe\x14\x845\x1c\xc8z\xa1\x94\x83\
-,\xc7\xdb>U\xe4s\xe7@R\xbd\x17x\x99k\xd5\
-2,\x14fP.\xe7!KQ\xf0\x82\x0cJ)\x18\
-\x18L]\x83a\xea\x90\xe5\xc4%\xcat\x01A\x90!\
-I\xd1FY\x22\x12g\x9a\xff\x08\xe0\xcd\x08X#\xea\
-\xc0\xed\x00\xb7m\x1b\xfeM\x10\xf2\xdb\xad^g\x18\x1a\
-D1\xd20\x05\x8d\x10\xd2rQK\x06\x0b\x91\xc8\xf9\
-\xbe\x10\x8aR@.w\xce\x11\xe5'K1$\xd3\xfd\
-\x10\x05\xb9\xe5\x0a,\x96e\xb4\xf8\xb70\xc4b\x99\xc5\
-u8\x8e\xc3\xda\xb5\xeb\x10\x89D\xc0q\x1c\x04A@\
-2\x99\x82\xaa\xa9\xd0\xd4\xda\xc7\xb9R\x0b\x1eo\xa0\xe2\
-\xed\xe4y\x11\x92\x14\x85,\xc7\x01\xc6`\x9a\xb5\x8f\xf9\
-\x91H\xd2vB\xff\xf9Zv\xed;\x14Z%\x1aK\
-#\x16m\x18\x22\xd2\x10J\x08\x14\x07\x02\xa4U\xb5\x04\
-0\xb6\xe8`Q\x94\xda\xf7\x0ac\x16t]\x9d\xdf%\
-\x16\xa0(\x05hZ\x19\x86\xa1\x81\x10Rwg+\x08\
-r\xdd\xb9\xe7\x19\x1d\x19\xd9tr|\xfcP\xa0\x02\xa4\
-\x03e\x03\xdc\xb2\xe5\xfd\xab\x18\xc8'\xec^\x9f\xcb5\
-\xfe\xe4\xe78\xa1\xe549\xc6\x80|a\x06\xa5r\x0e\
-33\xa7\x91\xcfO;r\xcc\x8a\xc6RH${\x9a\
-\xdeQ]J\xeb6\xc0\xa5\xbb\xd9T*\x0d\x9e\xbf\xf4\
-\x03\xa3\xb7\xbbvn+c\xac~:T\x03(\xe5\x10\
-Ot!\x99\xac\x9d\xae\xd8\xca\xd1\xb7\x1a\x1c' \x91\
-\xf0>&\xd4l\xe3uY\x0ao\xe3\xc3\xb0\x16\xa5r\
-\x0eSS\x95\xd8S\xbb4J.\xa0\x94C\xa4\x89\x82\
-\xc3\x0c\xf4\xaf6o\xde5d[\x10\x17\x08\x94\x02$\
-T\xf8{\xd4id\xde\x88JQ\x80\xb3\xd0\x1b\x1cE\
-\xecT\xf3U\x95\x02\x8a\x85Y\xc7\x8eV\xd1H\x02\xb1\
-h\x9b\xdek\x1b\xcf\xc8\xd2\x9d\x85(T?\xd6\xf05\
-~\x0eT\x0a\xae:\xa1\xfcEQF:\xd3_U\x09\
-:\x11\xcf)IQ\xd7\xf2bk\xe1d\xbc\xa3\xb3\x15\
-f\xda\xf1N\x8b\x10\xc4\xc6\xd6\xa8h4\xd9\x84\xcc,\
-\xc5\xf1\xd6\xa7l\x0b\xe3\x02\x81Q\x80\xf3\x01\xcf\xefj\
-w\x1e\xcb\xb2\x90\xcdN\xa0P\x98\xadi\xa8\xe7j\xd8\
-3\xbc\x82\x17$D}\xcaZ)\x15s\x8ba\x12\x8a\
-R\xdd\x03\xa8(\xb5?@\xec\xc4;\xd6\x82\xe7\x04$\
-S=\xb8X\x93s\x0eys\xa3\xd14D\xa1iS\
-r\xdb8\x99\x85\x11\x94\x22\xbe\xcd\xec\xec\x80\xf9\xa0n\
-\xa9\xcaN\xf1\x92\x97\x84\xbcw\xcb\xf6\xfb\xde\xd9\xb6`\
-\x0e\x11\x88Wy\xf3\xe6\x1d\x11\x06\xf6WN\xcd\xb7\x10\
-\xca23s\x1a\xd9\xec$\xca\xe5\xfc\xa2=C\xd3\xca\
-m\xb9\xfe\x9d \x1e\xebr\xa6.\x82\x8d\xe7\xadR\xd2\
-\xbdr\x1c\xca\xe6r\x8b\x9e\xdd\x05,\xcb\xc4\xc4\xc4D\
-\xd5k\xcb\xa5\x9c\xe3\x85\x0dDAF$\xba4\xf4\x83\
-8V4\x82\x90J\xd6\x8b\x9b\xf5\xfa\x963\x1c\xc7\xd7\
-\x0d\xaa^\x8a\xa2\x14\xab\xdb\x01\xab\xbc\x95\x84\x91\xbf\x19\
-\x1b\xbb\xdf\xbbO\xa6:\x04\xe2\xce\xe0y\xf9\xa3\x0c\x18\
-qz^\xc6\x184\xad\xecX\x9a\x91\x13\x88bd>\
-\xe4\xc0?\xca\xe5<8N@<\x9e\xc1\xf1\xe3\xc7\x91\
-\xc9\xa4\x11\x89D\xa0\x1b\x06fgf\xab\xda\xf8T\xb5\
-\x84\x5c\x1bv\xa4z\xc4\xa2ihj\xa5\x04\x94\xd3=\
-\x9b+\xf1\x84\xdd\x98\x9b\xab\xae\xd4\x9d\xc4\xc9\x1d\xa0e\
-\xf9\xef,\xad\xc4$\xd6\xff0\xaad\xfb\xcc6\x0c\x85\
-\xb9\x88u\x86a\xfc\x1e\x1a\xf4\xf3\xf1\x02\xdf\xbd\xc0\x9b\
-7\xef\x1a\x22\x14_\x05\xb0|\xdbl-!\x1e\xebr\
-\xec\x08\xdej\x1c\xe0R*5\xe7\x0c\x88b\x04\xaa\xaa\
-\x22\x9f\xcf\xa3T\xbc4\x8b\x801\x86Ri\x0e\xd9\xec\
-9'D\xae\x0a!\x15E\xa5\xaa%\x08\x82\xd4R\xb6\
-I3p\x1c\x0f\x10\xb4\x1d\xa8\xdc\x88[\xbaF\xf1\x81\
-\x91\x9b\xd0\xc5\xc90\x18C\xae\x8e\xa7\xbb\x11\xba\xa1B\
-\x10d\x88b\x04\xa2 \x83\xe3\x05P\xcay\xda\xec\x9e\
-\x17$\x88U\xec\x7f\x8c-\xa4af\x91\xcfO7\x1f\
-\xb8\xbf\x14Bn\x1d\x19\xd9\xf4\xc0\xf8\xf8!_\x9b-\
-\xfb\xbe\x03\xe4y\xf6I\x068{\xc7\x07\x94\x85\xf2\xe2\
-N\xce\xd7\x0e\xe5r\x1e\xaaZD$\x92\x84$\xc5 \
-\xf0\x12\x08%\x00*\x9e^U-\xa1T\xcay\x12S\
-'IQ\x88\x82\x04\xde\xa5J\xda\xb1h\x0a\xba\xa6\xb8\
-\xaa\x04{\x04\x19\xef\xc8\xac]\xfc\xfe\x94V\xc4\x0f\xb2\
-'\xf1\xd8\xdcq\x94\x9a\x08\x1c_J2Q\xdd\x13\xcf\
-X\xc5\x93\xaf(\x05\xa8j\xc1\xd5b;\xa5R\x16\x8a\
-R\x04\xcf\xf3\xa0T\x00\x98Y9U\xe9\x9a\x13\xa5\xb7\
-\x12\x0c\xf4/\x01\xfc\xaa\x03\xa2\xda\xc6\xd7\x04\xca-[\
-\xee\xbd\x8dP\xfa\xa4\xdfrx\x85\xc0KH\xdbL\x98\
-\xaf\x86ah\x98\x9a:\xe1\xd8|@E\xa9\xfaU\xc1\
-\xd94t\x18\x96\xe1ZMG\xd340;{\xd6\x95\
-L\x11B\x08n\xec^\x8b\xbb\x86\xae\x01\x010\x14\xcb\
-\xe0\xfa\xccj\x0cDR(\x98:vO\xbd\x8c\xef\xcd\
-\x9d\x04s06q\xa1\x08G\x83 \xe4 c\x11\x90\
-\xcd\xfb\xf6=\xf8\x8c_\x02\xf8\xb9\x03$\x84\xe3\xfe\x06\
-\x8cu\xbc\xf2#\x84@\x14\x22\x10\xa4\x08x^\x00G\
-y\x10B\xc1\x18\x03c\x06\x0c]\x87f\xa8 \x8e\xeb\
-\x15\xe7\x15\x95\x9f\xe5\xeb9^\x00\xe7\xe2-\xc9q<\
-\x12\xf14r\xf9\x19G\xe6#\x84\x82\x12\x0ed\xdec\
-\xfb\xfc\xdc)<?w\xea\xfc\xefAp]\xd70\xde\
-\xb9\xfaz\xfc\xfa\xc8\xcd\xd8\x14\xed\xc6\xa7\xcf\xbc\x00\xcd\
-\xa1\xc2\xa5\x1c\xc7#\x99\xec\x85\xa2\x14\x90/\xcctb\
-\xedE\xca\xc0\xfe\x1a\xc06\xbf\x04\xf0M\xf9l\xdb\xb6\
-\xeb\x17\x19\xd87\xfcZ\xdf\x09\x08\xa1\x88F\x92\x90#\
-\x09_\xc2\x16t]\xc3\xf4\xb4\xb3;@7\xb1,k\
-\xbe7\xb1\x05\x06\x06\x02\xba\xe8\xf0%\x84\x9b\xafF\xed\
-\xfe-Y)Eo\x7f\xd7T\xe9\xa7\xcc\xb7\x14\xc0\xbe\
-&\xd6\x8d?\xbd\xf6\xad\x18N\x0f\xe2\x13'\x7f\xd2\x96\
-}\xb0\x1a\xba\xae\xce\xe7\xa5\x07\xa71V\xb30\x82\xb7\
-\x1f\xd8\xbb\xfb\xdb~\xac\xed\x97\x13\x84\xac\x19\xbd\xf6+\
-\x00q\xee<\xe81\x92\x18A*\xdd\x0fQ\x8a8\x16\
-\xb5\xdf*\xed8A\xdc\xa6\x12r\xa4@U\xcb(\x97\
-\x0b\xf3\xf6\xc6\xd2\xbcW^\x81\xae\xa9\xd04e\xf1\x9f\
-\xaa\x96\xa0\xaaE\xe8\xba\xb6\x18\xbfI)\xe7\xcak+\
-\x0824\xb5\xd4\xb2\xb2  \xe0(\x0f\xca\xf1-g\
-\x13e\xf52\xbe}\xf2\x05\x88\x0c\xf8\xd0\xc8\x8d\xd8\x9f\
-?\x0b\xcb\xc1\x1d<\xc7\xf1\xe0\x05\x11jk\xde\xd8@\
-@\x80\xab\xc6\xc7\x0f}\xd6\x8f\xb5}Q\x80[\xb6\xdf\
-\xf7>\xc2\xc8G\xea\x0eb\x00\x08\x10\x8be\xc0q\xdc\
-|\x87\xb2`l\xf1\xa3\xb14\x12\x89n\xcf;\xcf]\
-\x0ccf\xcb\x05Q\xdd\xc2\xb2Lh\xaa\x02E)\xa0\
-T\xcaCU+q\x97\xa6i\xb4t\xac\xaeT\xe6\xd1\
-\xa1i\x0a\x14\xa5\x08\xc3\xd0a1\x13\x04p\xac\xdc\x15\
-!\x95\x82\x9eM\xd7^$\xa4R\xb9{1\x8d\xd2\xbe\
-R~~\xf6\x04&\x0a\xb3\xf8\xe0\xc8\xcdx\xb6\xe8\xac\
-g\xbdR\x9a\x8a\xb9\xee\xedv\x81\xc1\x91\x91M\x07\xc7\
-\xc7\x0f\xbd\xec\xf5\xc2\x9e+\xc0\x1d;vp\x85\x82\xf0\
-0\x80\xde\xba\x03\x09 \x88\x11$\x12]\x90\xa4(\x22\
-\x91$\x08!\x8e7\x92i\x95x,\x83\xa8\x03\x09\xef\
-N`Y>+@\xc6\xa0j\xca\xe2\x0eO74\xc7\
-\xc34,\xcb\xbc@!\x9a\xa6\x01fY\x00X\xe5(\
-js\x87\xc8q<\x18\xab\x17\x1aC@)\x05\xa5\xfc\
-\xa2M\xd7)\x8e\x17\xa7Q,\xe7qU\xef(\xce\xe8\
-\xce:0*aM\xad\xefn}\x87\x91k\xc6\xc7\xdf\
-\xf3O\xc0\x1eOw9\x9e+\xc0\xee\xee\x9b\xef\x05\xf0\
-\xe1f\xc6&\xe2]\x8b\x05\x17+}keHR\x1c\
-\x86\xa1z\x1a\x0f\xb5\x80$\xc5Z\xee\xfb\xe0&~+\
-@MWa\x9a\x06,\xcb\xf0\xec\x81\xb3,\x13\xfa\xfc\
-\xf1ZQJ\xd05\x05\x86\xa9\x83Y\xd6\xa2\x0c\x944\
-\x97M\x22\x8a2t]\x99\xbf\x97\x08\x08\xe5@\x09\x07\
-J9p\x1c\x07B\xdc9\x82\x03\xc0xq\x06k\xf9\
-\x18\xe6D\xd1Q\xcf0P\xb1M\xb7S\x8c\xd6\x17\x08\
-\xfaV\x8f\xce\x1c>q\xfc\x90\xa7=D<5^\xed\
-\xd8\xb1\x83;sV~\x11\xc0\x15\x8d\xc6\xf2\x1c\x8ft\
-f\xa8\xe6}\x5c\xe97[=\xc3\x83\x12\x0aQ\x8aB\
-\x14\xa3\x15\xaf,\xc7a\xe1O5\xcdJsg]/\
-7,\x1f~\xa9<\x83\xbe\x1f{\x97\xe2F\x18\x8c]\
-\x98e-*\xa6z\x15\xb7\xbd\x82\xd2\xf3\x1e\xda\xcaN\
-q\xc9\xfb\xc6\x18\xac\xf9\x0ej\x96e8\xde\xaa\xb4\x15\
-\xee\xbcb\x0b\xcePg_+\xc6\x18ffN7U\
-\xb46`\xbc\xcas'6\xee\xd9\xb3\xc73\xc1=\x0d\
-\x839=!\xbd\x9f4\xa1\xfc\x00\xcc\x1fyk\xff>\
-\x99\xec\xc5\xdc\xdc\xd9\x0b\xa2\xd0)\xe5\x10\x8b\xa6!G\
-j\xf7\x88\xe08~>\xc71\x82X\xac\x0b\x9aZD\
-\xb14\x07\xb3A\x9b\xcaX\xa2+P\xca/h\x10Z\
-\xa9\xc3'\x8ar%XV-CQK\xbe\xec\xd4\x81\
-y\x8f3,\xc0\x9f\xe5\x1b\x22q\x22V\x0d\xaew\x5c\
-\xf9\x01\xf3\x95\xc5\xa5h`\x1ddu\xb8\x5c\xb7\x86\xdf\
-\x03\xe0a\xaf\x16\xf4\xf4\x89&\x8c\xfcaS\xe3\xe6K\
-\xc37\x1a\x93L\xf4,\x1eQ\x22\x91\x04\xba\xba\x86 \
-G\xe2hvcK\x08 \xc91d2\xab\x10\x8d\xa5\
-j*\x5cA\x90!\x0a\xfe4\x5c\xafO0C(+\
-\xef_\x14\xa9T\x0f\xa2\xd1d\xf8\xc1q\x11\xb2\x1c\xc7\
-\xea\xd1k!'\xdc3\xa7TKa\xeb\x04\x08\xc8G\
-\xbd]\xcf#\xb6o\xdfy\xa7\xc5\xf0\xfdf\xc6Jr\
-\xbc\xe9\x0eY\xc5\xd2\x1cx*4T\x98\xcd\xa0ie\
-\xe4r\xe7.9\xbe%\x93=\x90\xa4\xe0e\xeb\x05\xe9\
-\x08\x5c\x0f\xcb\xb2P*\xe5:\xd1;\xe98\xf1D\x06\
-\xc3\xab\xaeX\x0c\x9ev\x0b\xcb21=}\xb2\xe18\
-Q\x90!JQ\xf0\x9c\x00\x8e\x17\x16\x1dK\x96e\xc2\
-4M\x18\xba\x06U+5\xac\xb1\xd9\x08B\xb9\xa6\xbb\
-\x18RB\xef\xd8\xbb\xf7\x8b{\xdbZ\xb0I<;\x02\
-3\x86?jvlT\xae\xde\x9c\xbb\x1am\x17\x15]\
-\x82(F\x90J\xf6a.{\xber\x08!\xe4\x82\xbe\
-\x0a!\xadC)E<\x9eF\xa9\x94\x83\xaa\x06\xa72\
-\x8f\xd7\xa4\xd2}\x18\x1c\xd8\xe0T\xb5\xaf\xba,\xc4P\
-V\xb3\xc5R\xca!\x12MB\x96b5C\x8b(\xe5\
-A)\x0fA\x90\x10\x89&`Y\x06J\xa5<\x14%\
-\xd7T\xc2\x09\xc7\xf1\x10\xa5($1\x06~^\xb1\xce\
-\xcc\x9cn*\xaf\x9c1\xf6G\x00<Q\x80\x9e\xec\x00\
-\xb7l\xb9\xef\x0aB\xc9a4q\xe4\xe68\x01]]\
-\xab<\x90\xaa6\x8aR\x5c\xac\x99'\x882\xd2\xa9~\
-_\xe5\xa9\xc7\xc5\xdeW\x02\x82\xff\xf5\xbf~\x1d\x91\xc8\
-\xa5=5\xe6\xe6\x8a\xf8\xf3?\x7f\xc0q\xafc#\xfe\
-l\xf8&\x5c%w\xc1d\x0c\xbf\xfb\xa3\x87\xf0\xe3\xe9\
-c\x9e\xae\x1f\x04R\xc9\x1e\x0c\xae\xba\xdc\x13\xe5\xb7\xc0\
-\xcc\xcc\xcb\xb7\xaf6\x00\x00 \x00IDAT\xa9\x0b\
-l\xdb\x84\x00\x91H\x0a\xd1h\xca\xb6w\xdb4t\xe4\
-\xf2\xe7j\xb6E\xa0\x94\xce\xdb\xe1/5E\x95JY\
-\x14\x8bs\xcd,\xc3(\xc1\xc6\xbd{w\xbfdK\xc8\
-\x16\xf0\xc48C\x08\xf9h\xb3kE\x22\xcd\xef\xfe\xdc\
-B\x96c\x8bG^\x9e\x0bv\x95.B\xe8\x05\xff@\
-\x08N\x9d\x9aA<\x1e\xbd\xe4\xdf\xa1\x17\x8e\x02\xf3\x1e\
-Q/\xff\xfd\xac4\x87\x04/!-\xc8\xf8\xef\xd7\xfd\
-\x02H@m\x97n\x91Hta\xd5\xd0e\x9e*?\
-\xe0\xc2\xd4`\x8e\xe3\x91J\x0f \x16K\xb7\x15\xda\xc3\
-\xf1\x02\xd2\xe9\xc1\xaa&!I\x8a\xcc\xdb\xe1\xab\xd7\x11\
-\xac\xb4{mj\x19b\x01\xbfo[\xc8\x16p]\x01\
-n\xdb\xf6\xa1^\x10\xdc\xdb\xec\xf8\xa0\xd8\xda\xe2\xf1\xf4\
-|\xceg\xe7\x19\xf0\x0f\xbf4\x0e\x18\x16\xb8s*\xf8\
-\x13%\xd0)\x15`\xc0SO\xb9\xfe\x81Z\x95\xd9%\
-\xc1\xeb\x97'\xfbqy\x80w\xd4N#\xcbQ\x0c\xad\
-\xba\x1c~8\xac\x16\x8e\xbf</ \x9d\x1e\x80\xc0\xdb\
-\xeb\xb4w1\x84\x10$\x93=\x90\x97T\x8b\x8eD\x93\
-H$j7\xba\x020\xdf\x7f\xb8I\xe7\x0c\xc3\xae\xb1\
-\xb1\x0f\xd4\xee\xce\xe5\x10\x1e\xd8\x00\xcd\xfb\xd1d\x8f_\
-Q\x888\x96\xee\xd4.\x94\xf2\x90\xe5D\x1b\x1d\xdb\xfc\
-\xe3\xd4\xe1\xd3H~\xfaU\x10\xed\xfc\xf1\xb8\xd8/\xe2\
-\xe4I\xf7\x8a\x9a\xd6C\xbc\xe85\x5c\x1b\xeb\xc1+\xd9\
-\xb3\xbe\xc8\xe2%\x1c\xc7ch\xf8J\x7f>D\x19\x03\
-c&8N@*=\xe0\xca}\x1cO\xf4\xc00\xcf\
-B\x10e\xc4c\xcdy\xb4e)\xd6l[\x05\xd94\
-\xf9\x9d\x00\xfe\xa6\x1d\x19\x1b\xe1\xfa;\xc3\xc0>\xd4\xec\
-XI\x0e\x96\xb3!\x12\x89u\xe4a\xed\xf0\xa93\xd0\
-\x22\x17\xbe\xb5/\xeaM\xd9^\x5c\xe1\xaa\xe8\x85\x0f\x87\
-\x93E\x00\x82\xcc\xe0\xaa\x0d\x9e6eZ\x8anh\xa0\
-\x84\x22\x9d\xees\xedC\x9c\x10\x82T\xaa\x0f\xb1h\xf3\
-\xe1<\xad4\xbcg\x0c\x1f\x86\xcb[gW\x15\xe0\xb6\
-m;\xef\x00pU3c\x09i\xed\xc5\xf1\x02.\xe0\
-\xf6\xbfz\xbc&.I\xf4'\xc0\xbf\xbe\xfe3_\xe4\
-Hq\x22\xb6$\x06/\xf8\xd9\x8bs\xa7}\x91\xc5K\
-\x92\xc9\x1e$\xe2\xfet\xfe\x03*%\xf5\xe3\x89\x1e\xd7\
-\x1bBU\xbc\xcd\xcd\x8f'\x84B\xac\xd6=\xae\xea`\
-\x5c\xb9m\xdb\xaf\xdcnO\xb2\xe6p{\x07\xf8\x1b\xcd\
-\x0e\x14\x049\x90\xc7M\xeaR\x89v\xb7\xf9\xf7c\xaf\
-.~\x9d\xeb\xe6\xf1\xfa9w\x1a\x1a\xd5\x83\x80\xe0\xc3\
-\x03\xd7 \xb2\xe4!<4{\x12\xa7J\xce\xb5\xd6\x0c\
-\x22\x94\xf2\xe8\xef\x1f\xf5U\x06\xc2H\xf56\x95\x01\xa0\
-5;\xbf\xd9\xb4\x0e\xb1\x83k\x1agl\xec\xfe4\x03\
-\xde\xd3\xecx9 \xce\x8f\x8b\x11\x04g\x0c\xc7^\xf3\
-\xec\xc9\x13(vW\x14\xcf\x8f\x14\xf7;\xa2]\x0c\x07\
-\x8a\xff\xd2\xbf\x11\x9b\xe3\xe7K>Z\x8c\xe1\xff;\xfc\
-\x98\xe7\xb2xM_\xdf\x1a\xf0\xbc\x7f\xa7\x07\xd34\x02\
-\xab\xfc\x00@\x12\xa3M{\xa2\x19\xc8\xfb\xc6\xc6\xeew\
-.\xd8\xf7\x22\x5cS\x80\x86e\xfc\x0a\x80\xa6\xdf\x05!\
-\xa0\xc1\xc6\x9d\x9c\xc6\xb5W=\x0b\xc6\x11<\xf2\xb2\xb7\
-\xc7\xdf\x11)\x89\xbf\x5cs\x1b\xeeN\xaf\xb9\xe0\xe7\xff\
-\xfb\xa5\xef\xe1\xe9sG=\x95\xc5k\x04^B:\xed\
-\xaf\x97\x9b!\xd8'\x97\x85\xcaNM\x121M\xe3\x03\
-n\xc9\xe2\xda\xab\xc4\x18\xf9\x95fM\x03\xbc \xf9R\
-R~\xb9\xf3\xc5\x83?\xc5\xfa\xdb\xc70}\xd8\xfd*\
-\xc1\x02\xa1\xd8\x14\xeb\xc1\x9d\xa9a\xdc\x16\xef\xbf \xd6\
-\xcfd\x16>u\xf8\xbb\xf8\xfck\xfb]\x97\xc3o\xba\
-\xbaW\xf9V!|\x01\xb7:\xeb9\x89(E\x9a\xee\
-\xd7\xcd@\xee\x07\xf0\x0fn\xc8\xe1\xca;\xb5u\xeb\xae\
-\xcbA\xd8+\xcd\x8e\x8f\xc5\xd2\x81)2\xba\xdc\x109\
-\x01\x9a\x83m-\x05B\xd1\xc3\xcb\xe8\x11\x22\xe8\x15\x22\
-\x18\x16\xe3X+%q\x99\x9cF\xf4\xa2\x07\x8f\x81\xe1\
-\x07g_\xc6\xdf\x1d\xfe>^\xce-\xff\xb0\x17\x9e\x17\
-\xb0a\xfdM\x1d\x19;\xea5\x96i`z\xe6T\xe3\
-\x81\x8b\xe3\xe9\x86'\x9f\xfc\xe2\x1bN\xcb\xe1\xcaG\x05\
-#\xf8\xe5V4\xab\xe8R\x1b\xc4 `\x9a\x1a4M\
-\x83ij\xb0\x18\x0b\xa4\xa3g)\x12\xe5\x10\xa3\x02b\
-\x1c\x8f4'\x22\xc9I\x88s\x02\xa2\x1c\x8f4'!\
-\xce\x89\xe7\xed&\x16\x00\xa5\x84\x93J\x09'\xe7\xe3\xfa\
-\xe6\xf42\xb2j\x09\xaf\xe4\xce\xe0\xa7S\xc7qN\xc9\
-\xfb\xf5\xa7xN:\xdd\x7f\x81\xf2\xbbf\xf0F\xc8\x5c\
-\xfba0&3QP\x0b\x98+Ma\xb6<\x03\x83\
-\xb9\xdf\xa7\xd9m\xe8|Y\xbaFe\xe8\x16\xc7S\xf3\
-\xbd\x00>\xe9\xb4\x1c\xae(@\xc2\xd8\xfb\x9a\xdd[R\
-J;:\xdcd)\xa6i \x97\x9bB\xa10\x0bU\
-+\xc1\xd0\xf5\xce+M\x1eb\x9bT\xaa\xef\x82\xef\xaf\
-_s\x1b\xd2\xd1\xe6\xaa\x1a5\x8bi\x19\x18\x9fz\x03\
-G\xce\xbd\x8c7\xa6_\x85f\xb6W\xa5\xc5OD\xb1\
-\x85\x9a\x85\x84\xbc\x0f.(@\xc7\x8f\xc0\x9b\xc7\xee\xbf\
-\x923\xcd\xa6s\xaed9\x8eD\x93\xa5\xaf\x82\x08c\
-\xc0\xdc\xdc\x19d\xe7\xceAQ\x8b\xbeWB\x0e\xf1\x07\
-9\x92\xc0\xda\xd1k/\xf8\xd9}\xb7\xfe\xb6\xe3\x0ap\
-)\x86\xa9\xe3\xa5S?\xc5OO\xfe\x0895\xeb\xda\
-:n\xa1ied\xb3\x93M\x8f\xa7\xc4\xbc|\xef\xde\
-/\xbf\xe6\xa4\x0c\x8e\xef\x009\xcbz\x7f+\xe3\xfd\x8a\
-\x94o\x17\xc6,L\x9d;\x81\xb9\xecd\xcd\xca\x18!\
-+\x87D\x93\xa9`N\xc2s\x02\xae]s\x0b\xaeY\
-\xfd&\xfc\xec\xc4\x8f\xf1\xf4\xf1'\xa0\x18\x9d\xb3#l\
-\xc1\x13\x0c\x00\xb0,\xee}\x00\xfe\xd2I\x19\x9c7H\
-1\xb6\xa3\x95\xe1|\x07\xc6\xd9e\xb3\xe7\xf0\xfa\xeb\xcf\
-bj\xfaT\xa8\xfcB\x00\x00\xd1\xb8\x7fN<B\x08\
-\xae]s\x0b\xee\xbb\xedw0\x92^\xe7\x9b\x1c\xadR\
-\x09\x87i\xe1\xf9'x\x9f\xd328\xaa\x00\xb7o\xff\
-\xe0e\x00\xaenzqZ1\x84v\x0a\x86\xae\xe1\xe8\
-\xb1C8}\xfa\xb5P\xf1\x85,B)\x87H\x0bE\
-|\xddB\x16\xa2x\xc7\xf5\x1f\xc4\xad#\xdbA\xbc\xed\
-va\x9b\x167@\x9b\xb6n\xfd\xa0\xa3\x1a\xde\xd1W\
-\x891\xfe\xad\xad\x8c\xef\xa4,\x8bb1\x87#G\x0f\
-B)\x17\xfc\x16%$`T\xfa\x9e\x04\xa3l\x06!\
-\x04oZw\x07\xde~\xcd\x0e\xf0.\xe7\x01;A\xab\
-:\x80\x11\xeen'\xd7wV\x01\x12\xeb\x9eV\xc6w\
-\x8a\x02\x9c\x9e>\x85\xf1\x13/6\xed\xb2\x0fYYH\
-\x01+\xe2\x01\x00\xa3\xbd\x97\xe3m\x1b\xdf\x0b\x81\x06;\
-\xc2BlQ\x07P\x90\x96tL\xe3\xf9\x1cbl\xec\
-~\x19\x8c\xdc\xd1\xca5\x9d\xa0\x00\xa7\xa6O`r\xf2\
-8\x9aj\x84\x10\xb2\x22\x09j\xcf\x985=\x97\xe1m\
-\xd7\xfc\x12(\x09F\x8d\xcdj\x10\xc2\xb5\x94\xb9\xc2\xc0\
-\xder\xcf=\x1fqLq8\xa6\x00\x0d\xc3\x18\x03\xd0\
-\xf4\x9d@\x08\x09|\xfc\xdf\xf4\xd4I\x9c\x9b\x0c~\xd7\
-\xb5\x10\x7f\x11\xe5\xe0\x06\xf2\xaf\xee\xde\x80m\xeb\xee\xf2\
-[\x8c\xba\xf0\xad\xb5\xf0\x8c\x15\x0a3[\x9dZ\xdb\xb9\
-#0mmk\xcas\xa2\xe7=\x12Zann\x02\
-\x93\xe7B\xe5\x17\xd2\x18)\xe0\x99L\xd7\xae\xb9\x05W\
-\xf4^\xe3\xb7\x185i\xb5r\x0ec\xd4\xb1c\xb0s\
-VR\x86\x9foia^pl\xe9vIs\x12\xde\
-\xd3\xbd\x1e7\xc5\xfb\x90\xa0\x02\xee\xfb\xd9711q\
-\x14\x1c\x01\xb6\xf4]\x8e7\x0f^\x89kRC\x109\
-\x1e\x9fz\xe9\xbb\xf8\xe1\x99\x97\xfd\x169$ \x08\x82\
-\x14\x986\x0e\xf5\xb8\xf3\xea_\xc0\xf4O&1Ul\
->\xf0\xd8+Zn<F\xf0V\x00\x7f\xec\xc8\xdaN\
-L\xb2e\xcb\xfbW\x01\xb8\xa2\x95k8!\x18\xc7\xdf\
-A1\x86\x8f\xaf\xbe\x0d\x99\xf9\x861\x9f>\xf3<\x8e\
-\x9d:\x8cw\xaf\xbe\x01\xbf}\xc5\x9b\xb1\xea\xa2\xbe\xc3\
-o]um\xa8\x00C\x16\x11[;\xbe\xf9\x06Gy\
-\xfc\xdcU\xef\xc2\xc3\xcf~\x01&\x0b\x963\xcf\xc6f\
-h\xe3\xd8\xd8\xfd\x03{\xf6<\xd0v\x85\x0dG\x8e\xc0\
-\x84\x08[Z\xbd\x86\xe7\xfc\xdf\x01\x0a\x84\xe2\xbf\x0e\xdd\
-\xbc\xa8\xfc^(M\xe3\xdf_\xdb\x8f\x7fx\xd3\x07\xf0\
-\xf1\x1b\xde}\x89\xf2\xb3\x18\xc3W\x8f=\xed\x87\xa8!\
-\x01%\xe8mS\x97\xd2\x9d\xe8\xc7uC7\xfb-\xc6\
-%\x10B[\xdeE\x1b\x86\xb5\xd9\x89\xb5\x1d\xb2\x01\x92\
-\xd6\x15\xa0\x8f\x15s\x17xGf\x14C\xe2\xf9J\xd4\
-\xdf\x9dz\x1d\x9f\xda\xf4.l\xee]_u\xfc_\xbf\
-\xf8\x18~:=\xee\x95x!\x1d\x00\x1f\x90\x93L\xb3\
-\xdc\xb2n\x0c1!x\xd5\xd7[\xd7\x07\xace\x9dS\
-\x0dg\x14 mM\x18\x8e\xe3}\xaf\xb4L@pO\
-zd\xf1{\x931l\x8e\xf6\xe1\x9a\xf4P\xd5\xf1_\
-?\xfe\x1c\xbe\xf0\xfa\xf2/\xe8\x19\xd2\x1aA\xb2e7\
-\x03\xcf\x09\xb8et\x9b\xdfb\x5cB\xcb\xaf#m}\
-\xd3Uu\x9av'\xb8\xe9\xa6\x0fG\xc1p]+\xd7\
-p\x018\xfe\xae\x91\x12\xe8\x11\xce{\xef8B\xb0\xb9\
-gm\xd5\xb1\xd3Z\x11\x9f\xf8\xd9\xb7\xbc\x12-\xa4\x83\
-\xe0:L\x01\x02\xc0\xd5C7!)\x06\xab\x00q\xcb\
-!q\x8c\xddt\xd3M\x1fn;\x00\xb3m\x05(\xc7\
-\x95[\x01\xb4t\x17\x04\xa1_\xc1\x1a\xa9\xf9\xdc\xcd\xaf\
-\x1d\xfb\x09\x0a\xba\xea\xa24!\x9d\x0a\xd7\x01\xe9f\x17\
-C\x08\xc5u\xc3\xb7\xf8-\xc6\x05\xd8\xa8\x09 \xc8\xf1\
-\xd2M\xed\xae\xdb\xb6\x02$\xac\xf5\xb38\x17\x80\xb0\x81\
-Ub\xf3v\x90\xbd\x13\xaf6\x1e\x14\xb2\x22\xe9\x84\x10\
-\x98j\x5c\xb3\xfaf\xc8|p<\xd8\x1cg\xe3u\xb4\
-H\xdb\x01\xd1\xed\x1b\xe2\x18Z\xd6\xc2A\xa8\x00\x13%\
-\xcd\xcb\xf0z>x\xb1S!\xc1\x80\xdayp\x03\x00\
-Gy\x5c\xd6\xbb\xd1o1\x16!-<\x8fK\xf0\x7f\
-\x07\x08`S\xab\x17\x04\xc1\x06\xb8\x90\x852\xad\x97\xf1\
-\xdf\x9f\xfb:N\x16\xab7\xeb\xb6\x18C^\xef\x9c\x22\
-\x93!\xde\x12\x84p.\xbb\x5c\xb7\xe6\xd6\x00U\xb1i\
-]/\x10\x90\x96u\xcf\xc5\xb4\xa5\x00\xb7l\xf9\xd5\x04\
-\x80\xea\x9e\x83z\x8b\x06\xe0\xd8P\x98\xaf\xec\xf2\xa5c\
-\xcf\xe0k\xe3\xcf\xe2\xffz\xe6K0\xab\xf4\xef(\x1a\
-*\xac\xb0\x10BH\x0d(\xed\x5c\x05\x98\x8ev\xa3'\
-\xd2\xd7x\xa0G\xb4nOe\xeb\xef\xbe{g[1\
-=m)@\xc6\x1b\xd7\xa0\xc5\xbe\x22\x84\x90@(\xc0\
-#j\x16\x16\x18\xbe~\xf4\xc7\x00\x80W\xb2g\xf1\xcd\
-\x13\xcf_2\xce`\xa6\xd7\xa2\x85t\x08\x95{9\x18\
-;(\xbb\xac\xef\xbd\xd2o\x11\x16\xa1|\xcb\xc7`Z\
-.\x93\xb6\xce\xf1m)@\xc2Z?\xfe\x06A\xf9\x01\
-\xc0+\xe59<={\x12gKs\x8b?{\xe8\xc8\
-\x8f.\x19'\xd8\xb3M\x84\xac\x00\x82\x10\xcd\xd0.W\
-\x0cn\x0a\xcc1\xd8\x8en\xb0\x08\xbb\xb6\xf1\xa8:k\
-\xb6s1\xb1Z_\xdc\xef\x00\xe8\x05\xf2\xa6\x86?y\
-\xee\xdf.\xf8\xd9\x8bs\xa7\xf0\xec\xf4\xf1\x0b~&\x04\
-Da\x87\x04\x8fFu\xec\x88\xf3M\x17\x1d'\x11I\
-##w\xf9-\x06\x00\xd8\xea\x99M,\xe2\x9f\x02\x84\
-\x1d\x07H\x80\x14\xcaLq\xfa\x92\x9f}\xe6\xd5'.\
-\xf8\xbe\x9a]0$\x04\x00\xc4\x06e\xb0\xf8\x0e\xb1\x0f\
-\x0e\xa5G\xfd\x16\x01\x00.h*\xdf<\xac-GH\
-{\x0a\x90\xa0e\x03\x02\x09\x88\x02\xcc\xe7g`Y\x97\
-*\xb7}\x13\xaf\xe1\x99\xa9\xa3\x8b\xdf\x1f\xc9\x9f\xf3R\
-\xac\x90\x0e\x22\x22'\xea\xfc\x96\x22*\x05/\xe7\xb6\x1a\
-#\xdd\x1b\xfc\x16\x01\x00\xecU\xae&\xb8\xaa\xad5\xed\
-^8\xef}\xe9m\xf5\xba\xc0\x1c\x81\xf3\x97\xee\xfe\x00\
-\x80\x81\xe1\xa3?y\x18\xe3\xc5\x19\x00\xc0\xbf\x9f8\xe8\
-\xa5X!\x1dD<Q\xfb\xe8(\xf3b`\xee\xf5F\
-\x0cu\x8d\x06\xa2\x8b\x1c\xb5\xb5\x03D\x7f;)q\xb6\
-\xad\xb8\x05\x0dk\xed\x88k\xe7\x9c\xef\x06\xaaR\xaa\xf9\
-\xbbI%\x8f\x0f\xec\xfd'\xdc\xd6\xbb\x0e\x8f\x9d\xfa\x99\
-\x87R\x85t\x0a</@\x92j\x1f\x81\xa3B0\xfb\
-\x84TC\xe0DtE\xbb1]\xf2\xf7\xb4c\xf3\x03\
-\x83\xc4b\xe5\x11\x00/\xd9\xb9\xd8\xb66\xa2F\xeb\xf1\
-\x7f\x80m-\xef8\x9a^\xae\xfb\xfb\x19\xb5\x88o\x9f\
-|\x01f\x18\x03\x18R\x85x\xbc\xbe\xe3 !g<\
-\x92\xc4\x19\xfa\xe2\x83~\x8b`;B\xc44\xc9\xa8\xed\
-5\xed^H\x88\xcdE\x03\xe0rW\xd5RU\xfb_\
-HH3\x10\x02twW/\x9b\xb6@w\xace\xeb\
-\x90\xaf\xf4%\x06\xfc\x16\xc1\xb6j \xc4\xdef\x0ch\
-C\x012X\xa3\xb6.\x0c\x80\x02,\x14\xe7\x1a\x0f\x0a\
-\x09\xa9\x81,'\x1a\x96\xc2\x1f\x5cRk\xb2\x13\xe8I\
-\xae\xf2[\x04\xb4\x98S\xb1\x08#6u\x11\xda\xf1\x02\
-\xdb\xd4\xbaA\x88\x8dR\xcay\xbfE\x08\xe9P\x08\x01\
-z\xfbV\xd7\x1dC\x09\xc5PWg)\xc0\xbe\xe4\x00\
-\x08\xfc\x8f\xd0\xb0\x13\x94Ml\xa4\xe3.`_\x012\
-\xb2\xc6\xd6u\xfe\xeb?hjX\xdc \xc4\x1e\xb1h\
-\x06\xb1\x8bz\xc5\x5cLo\xac\x0f\x22\xe7X\xefnO\
-\xe0\xa8\x80x \xc2v\xec(@b\xfb\xd3\xa6\x1d\x8f\
-\x84\xad,\xea \xec\x00\x0dC\xf3[\x84\x90\x0e\x84\x10\
-\x8a\xc1U\xeb\x1a\x8e[\xdb}\xb9\x07\xd28O\x5cJ\
-\xfa-\x82\xad\x1d\xa0e#\x1co\x81v\x14`\x8f\xad\
-\xab|\xb6\x012\x06\x98VX\xe0 \xa4u\x06\xfaG\
-\xc1\xf3\x8dvv\x04\x1b\xfa\x83\xdb\x84\xbc\x1e)\xb9\xfe\
-\xce\xd6\x1bl\x1d\x81\xed\xe9\x22\xd8T\x80\x9b7\xef\x88\
-\x00\xa8\x9f\x07T\x03\xbf\xf7\x7f\x96\xa5\x81\x85\xe9m!\
--\xd2\x95\x19D:\xd3\xd8S:\x98\x1cB:\xd6\xed\
-\x81D\xce\x93\x0cBN\xb0=\x05\x11\x1f\x1b\xbb\xdfV\
-yk[\x0aP\x10\xe2\xb65\xae\xdf(J\xfd\xf8\xbf\
-\x90\x90\x8bI\xc43\xe8\x1fh\xce\xce\xbe)\x80}w\
-\x9b%!7\xdf'\xc7-\x08\xec\xc5\xdd\xea\xbabK\
-{\xdb<\x02\x9b\xb6\x15 \xf39\xb0X\xd3B\x05\x18\
-\xd2<\xc9d7\x86W7\x97n\x9a\x94R\xd8\xd0\x1f\
-\x9c2\xf3\xad\x12\x0d\x80\x0d\xd0nx.\xa5\xa2-\x9d\
-d+\x15\xce\xb2\xd0\xed\xfbY\xd6&\xba\x11z\x80C\
-\x9a\x80\x10\xf4\xf4\x0c\xa3\xb7\xa7~\xc8\xcbRn[;\
-\xd61\xf9\xbf\xd5\x08\x82\x13\x04\xb0\xa7\x01-\x0a[v\
-\x07[\x0a\x90Qt\x13\x9b\x1b9\xbfw\x80\x86a\xf8\
-\xba~H\xf0\x11\x05\x09\x83CW \x1ai\xfeH\xd8\
-\x1f\x1f\xc0\xe5\x83m\xb7\xa8\xf0\x95\xb8\xec\xbf\x02\xb4\xab\
-\x1f\x88\xc9\xbc\xdb\x01Rf%\x98\xdd-\xa0\xcf\x0a\x90\
-\x99\xa1\x078\xa4:\x94Rd\xba\x06\xd1\xdb3\xd2R\
-\xb0\x02G9\xbc\xf9\xca_pO0\x8f\x10y\x19\x84\
-\xd0\x0eu\x122[\x06L{;@FE\xd8\xdc\x02\
-\xfa\xbd\x03\xb4\xc2\x1e\x1f!\x17A)\x87d\xaa\x07\xfd\
-\xbd\xa3\xb6\xda\x5c\xde6r\x07z\x02\x90K\xdb.\x84\
-\x10\x08\x94\x87f\xfa\x13'\xdb\x8en`\x94\x8av\xae\
-\xb3\xa7\x00\x09\x13\xed\x9a\x00\x99M/\x8fS0+\xac\
-\xee\x12R\x09j\x96\xa5(R\xe9^\xa4R\x83\xb0[\
-\xa4h$\xb3\x1e7\x8cnqV8\x1f\xe1}T\x80\
-hC7\x10\x8b\xd9J\xbd\xb1\xa5\x00\x09c\x92\xdd\x80\
-f\xcb\xe7\xed\xb5e\xd3\xc8\x1a\xd2\xd9PJ\xc1\xf3\x12\
-\xe4H\x14\xd1X\x0a\xc9x/\xb86\x9b\x9a\xf7\xc7W\
-\xe1m\x9bv8$a0\x109\x09%\xbdv\xadL\
-7\xb1\xdaHP \x84x\xa7\x00\x19\xa1\xa2\xddx\x1d\
-\xbfmp,,\x83\xb5\x08!\x14<\xc7\x83\xe3\x04P\
-\x8e\x03\xe5h *\x03\xb7\x0b%\x1c(\xe5\xc0\x89\x22\
-$A\x86$F \xc9\xce\xe6\xb9\xf6\xc7\x07\xf0\xae\x1b\
-v\x82\xeb\x90\xbe\x1f\xcd\xd2zo^\xe7hgs\xc4\
-\x18\xf3\xee\x08L\x18\x13\xed\xfb@|\xb6\xc1\xad\xe0\x02\
-\xa7\x1c/\x22*\xc7\x11\x8b\xa7\x11\x8b\xa5\x1a6\xf5\x09\
-\xa9\xce\xba\xae\xcb\xf1s\xd7\xbc\x1b\x02g\xeb\x99\x0b4\
-\xd4\xc7\x0f\xc0v6'\x84xx\x04\x06\x81\xedw\xde\
-\xf7#\xf0\x0aS\x80\x94rH$\xba\xd0\x95\x19\x84\xdc\
-BXG\xc8\xa5p\x94\xc3\xcd\xab\xb7\xe2M\xeb\xb6\xfb\
--\x8ak\xf8\x19\xc7\xc8\xda8\x023\xe2\xa5\x13\x04\x10\
-\xec:A\xda9\xe7;\xc3\xcaP\x80\x1c\xc7\xa3\xabk\
-\x10\xdd\xdd\xab\xfd\xae?\xb1,\xe8\x8f\xaf\xc2\x1d\x97\xdf\
-\x83\xbeT\x10\x0a\x87\xba\x07\xf5\xf1^i\xa7\x05\xad\xb7\
-G`@\xb7s\x1d\x80\xb0\x14\xbd\xeb\x10d\xd2}\xe8\
-\xeb_\x07\xea\xe7\xdd\xbcL\xe8\x89\xf6b\xf3\xfa;1\
-\xd2\xd3\x99%\xaeZ\xc5\xcf\xb6\xb5\xed\x1d\x81\x89-\xd7\
-\xb5\xbd#0\x83\xd6\xa96\xc0 \xd4#t\x0b\x8e\xe3\
-14t\x05b\xb1\x94\xdf\xa2t4\x92 cMj\
--6\x0e\xdd\x84\xe1.\xdb\xc5\x86;\x13\x1fMD\x96\
-e?K\x8b0\xcb;\x05\xc8\x08\xd1l{\x81\x19`\
-\x9a\x068\xce'o\xd32\xdd\x15IR\x14##W\
-\x83[\x86\x86y\xb7\x89\x88Qd\xe4.\xf4'\x87\xb1\
-:3\x8a\xe1\xeeu\xf6\x9at/\x03\xfc\xb4\xd1\x9bm\
-D\x880FT;\xd7\xd9\xf4\x02[Z;\x86%\xcb\
-\xf2O\x01.\xc7\x1d`4\x92\xc4\xc8\xa8\xb3E8#\
-|\x04\x99h7\xa2B\x1c1)\x81\xa8\x18\xeb\xe8D\
-\xff\x05\x04*\x80\xe7x\xc8B\x0cq9\x81d$\x03\
-I\x08\xbd\xe1\x0b\xf8\xe9$4\xcd6v\x80^\x1e\x81\
-\x19!j;j\xc44M\x08>\x85O\xd1e\xe6\x11\
-\x90\xe4(FF\xafnk\x0e\xc6\x08zc}\x18J\
-\xafA_r\x15VeF\x90\x90\xc3c\xf4J\xc4\xaf\
-<`\xc6\x18\x18\xb3\xaf\x00\x19c^\xee\x00\x89f7\
-\x17\x18\x00,\xd3\xb6\x0f\xa5m\xec6_\x0e\x22\x82(\
-ctd\x13\xec\x96uLI\x19\x5c=x=\xae\x18\
-\xdc\x14\x88J !\xfecX\xfe<\x9b\x96e\xb4e\
-~d\xd4\xcb#0\xb14\xdb\xd5`\x00\x18>\x86\xc2\
-\xf8\xe9\xe5r\x12B(V\x0f_\x01j#\x89u0\
-1\x84[F\xb7cu\xcf\x06\x17$\x0b\xe9d4\xd3\
-\x96\x1ei\x1b\xb3\x0d\x07\x08\x00\x10\xcbC'\x88Eh\
-\x9e\xb4\xa1\xae\xad6\xce\xfa\xed\xb2\x5cv\x80=\xbd\xab\
-!\xb5\xd8\xc6\xb0+\xda\x83-\xeb\xef\xc2H\xcfe.\
-I\x15\xd2\xe9\x18>=\x9b\xed8@*\x90\x82\x9d\xab\
-l\xd6\x034\xa7X\x1b)3~\xb6\xa5\xe4\xb8\xce\xcf\
-\xdd\x94\xa4(z\xba\x87\x9a\x1eO\x09\xc5\x0dC\xb7\xe2\
-\xd6\x0do^\xb1\xde\xcd\x90\xc60\xc6\xa0\xb7a\x87k\
-\x07SoW'\xb0sv\xae\xb2\xa5\x00MS\x98\xa6\
-\x5c;.k\x0b\x96e\xfa\xb2\x1b\x13\xf8\xce\x0e\x13!\
-\x04\x18h\xb2A\x0f\x00D\xf8(\xde~\xed\xfb0\x90\
-n\xbe\xb4{\xc8\xca\xa4\xa0\xe6|s\x82\x18m\x96\xe0\
-\xa2\x94M\xdb\xb9\xce\x96\x02\x14E}\xca0\xdb\x0b\x89\
-0\x0c\xcd\x97d|A\xb4\x953\x1d\x18\x22\x91\x04\xa2\
-\xd1\xe6<\xb4)9\x8dw^w/R\xd1\x00\xb4;\
-\x0c\x09<\xd9\xa2-\x1d\xe2\x08f\x9b\x8eQ\xc6\xc8\x94\
-\x9d\xebli1U\xd5\xda~\xa5\x0c\xc3\x1fo\x93 \
-\xd8j\x1f\x1a\x18\xba\xbb\xd745.\x1d\xe9\xc6\x8e\x9b\
-\x7f-T~!M\x93W\xb2\xbe\xackYf\xdb)\
-\xb2\xf1xf\xc6\xceu\xb6\x14\xe0SO=R\x06\xd0\
-V\xd5D\xd3';`'+@A\x90\x10\x8f7\xde\
-\xfdE\xf8\x08\xde\xb9\xe9\x03\x90\x85\xa8\x07R\x85,\x17\
-\xf2\xe59_\xd6u\xc0'\x90\x7f\xf4\xd1O\xdbr_\
-\xb7s\x8e\xb5\xb5\xe5\x5c\xc0/G\x08\xc7q\x1d\xeb\x09\
-N\xa5z\x1b\x8e\xa1\x84\xc3=\x1b\xdf\x8bd4\xe3\x81\
-D!\xcb\x89\xbc\x9a\xf3e]\x07t\x81m]\xd4\x8e\
-\x02\xb4\xe5uY\xc00u\xdf\x1a$\xf1|'z\x82\
-\x09\xba\xba\x1a7\xde\xd94x#Vu\x8d\xba/N\
-\xc8\xb2\xa3\xa8\xe6}Y\xd7h\xd3\x03L|Q\x80\x0c\
-\xc7m_;\x8f\xae\xfb\x13t\xc9w\xa0'X\x14\xa5\
-\x86\x85\x0e\x12R\x02\xb7mx\x8bG\x12\x85,7\x0a\
-\xba\xadP\xba\xb6\xd1\x8d\xf6\xf4\x00#8f\xf7Z\xfb\
-\x0a\x900\xdb\x8b.`\xe8J\xbbS\xd8\xa2\x13K\xc1\
-7\xe3\xf9\xbd}\xdd]\xe0\x97A\x9cc\x88\xf7\x98\x96\
-\x89li\xd6\xfbuM\xbd\xed\x22\xc9\x8c\xd9\xd7E\xb6\
-\x15 \x01\xb5\xbd\xe8\x02z\xdb\xc1\x8f\xf6\x88D\x12\xbe\
-\xac\xdb\x0e\xb1\x06\x0a0!%\xb0\xa1\x7f\xa3G\xd2\x84\
-,7\xce\xe5N\xc1\x84\xf7A\xd0N\xe8\x00\xc2\xec\xeb\
-\x22\xdb\x0a\xb0\x1d\xad\xbb\x80n\xf8\xb3\x03\x8cvX\xc1\
-PB\x80X\xbc\xbeS\xe3\xea\x81\x1bA\x96Y\xa5\x9b\
-\x10\xef8=;\xee\xcb\xba\xba\x03\xa7@\xc6p\xd4\xee\
-\xb5\xb6\x15\xa0\xc5\xdb_t\x01\xc6\x98/\xf1\x80\xa2 \
-\xd9*\x22\xe0\x17\x94\xf2u{\xd8r\x84\xc35\xc37\
-y(Q\xc8rc2\x7f\xd6\x97u\xdb\xb5\xff\x01\x80\
-%P\xef\x15`\x5cl_\x01\x02\xce|\x02\xd8A\xea\
- ;`#\xa7\xcdPj\x0d\x22\xa2\xb3}oC\x96\
-\x07\xc7&_\xc1\xd3/\x7f\xafa\xc4\xc5t\xd1{\x05\
-hY\x96\x13\xa5\xf1\x98\x96\x17mo_m+\xc0\xc7\
-\x1f\xdf]D\x9b\xa10\x00\xa0k\xe5v\xa7\xb0\x85\x1c\
-\xe9\x9c\xfaw\x5c\x83\xb0\x9d5\x99u\x1eI\x12\xd2I\
-\x18\xa6\x8e\x7f\xfc\xd6\xc7\xf0\xe0\x0f\xfe\x1a\xff\xba\xff\x1f\
-k\x8e\xd3\x0d\x0dY\xd5\xfb,\x10M/;\xd1\x82d\
-\xe2\xd9g?c;)\xa3\xdds\xe0\xe16\xaf\x87\xa6\
-+\xbe\xc4\x03\xc6\xe3i\xcf\xd7\xb4\x0b\xdf\xa0}\xc0p\
-w\xa8\x00C.\xe5\x95\x93\x07\x17\xb3;\xf6\xbc\xf0\x1f\
-\xf8\xe9\x91\xfdU\xc7\x1d\x99|\xd9\x97^ \xba\xda\xfe\
-\xe6\x87\xb5\xa9\x83\xdaR\x80\x04\xe4\x85v\xae\x07\xe6K\
-\xf0\xf8p\x0c\x8eF3\x1d\x93\x11\xc2\xd59\x02\x0bD\
-Dw\xbc\xdfCiB:\x85s\xb93\x17|\xff\xcd\
-\x1f}\xb1\xeaf\xe3\xe8\xb9\x97\xbd\x12i\x11\xc6*\x9b\
-\x9fv\xa1\xc0\xa16\xaf\xb7\x0fc\xacm\x05\x08\x00\x9a\
-\xe6\xbd\x02\xa4\xb4RW\xaf\x13\xa8\xe7\xdcM\xc8\x89\xd0\
-\xfb\x1bR\x95\x8b\x95\xdd\xc4\xdcI\x1c<z\xe0\x82\x9f\
-Y\x96\x85\xa3\xd3\xafx)\x16\x00\xc00\xd5\xb6\xe3\xff\
-\x00\x80\xb1\xf66am*@\xab-\xed\xbb\x80\xa6\xb5\
-UW\xc16\x89\x06\xa1%\x9d@B\xee\x9c\xa3|\x88\
-\xb7pU\x22\x1d~\xf8\xfc7.\xf8\xfe\x99W\xbf\x8f\
-\x93g\xdf\xf0J\xa4Et\xd5\x99M\x0fc\xcc\xbf\x1d\
-`,F_\x00\xd0\xb6\xf1\xc04\x8d\xb6Z\xe2\xd9%\
-\x9d\x19\xe8\xf8\xddS4\xf4\xfe\x86\xd4\x80\xa7\x97:\xcf\
-\xde8\xf3\x22N\x9c{}\xf1\xfb'_~\x0c\xe5\xb2\
-\xf7E\x104\xdd\x11\xe7\xa7\xa9(\x11\xffl\x80\xf3\x9e\
-`G\xc2aT\xd5\xfb] \xc7\xf1\x1ds\x0c\xae\x85\
-\xc8uv\x81\xd7\x10\xf7\xa8\xd5\xe1\xed\xebO}\x1e\x8c\
-1\xa8\xba\x82c\x13\xaf@\xd3\xca\x8e\x1cG\x9b\xc5\xb2\
-L\xa7\xea\x00\xbc\xd1\x8e\x07\x18\xb0Y\x11\xfa\x02\x08;\
-\x04F\xd6\xb7;\x8d\xaa\x16\x11\x8dz\x1f\x9a\x92N\xf5\
-\xe1\xac\xe2\x88\x0e\xf7\x05\x89\xef\xdc\xfa\x86!\xeeRR\
-\x8bU\x7f\xfe\xca\xc9\x83\xf8\xfcc\x9f@Q\xcb/\x9e\
-\xbc\xbclQ\xa1\xd4\x90\xabu\xda;\xfe\x02\xed\x87\xc1\
-\x800\xfc\xa4\xdd9\x80JM0?:Re\xba\xfa\
-;\xc6\x1b\x5c\x0dY\xe8\x9c\x80\xee\x10o)*\xb5\x8f\
-\xb6?=\xb2\x1f\xaf\x9e|~\xc9O\xbc3\x05i\x8a\
-C\xa7=\x07t\x8f\x03\xf9`\xe4@\xe31\xcd\xa1)\
-N}2\xb4\x02E<\xd1\xb9\xce\x10Y\xec\xec#|\
-\x88{\x9c\x9an\xeedCH\xc5\x1c\xe4\x05\x96i8\
-\x92\xfeV\x81\xb6\xad{\xdaV\x80\x86\xa1<\x03\xc0\x91\
-\xb2.\x8a\x0fv@\x00\xe8\xeb]\x03/?\x01\x9dD\
-\x0aw\x80!U(\xabE\x1c=\xfbRSc\x05A\
-\xf6\xcc\x19\xe8\xe03\xae\xf2<\xf5\x7f\x078\xdf\x1f\xe4\
-`\xbb\xf3\x00\x80ijmw\x87\xb2\x83 \xc8\x88\xc7\
-:3\x9cD\xe6C\x05\x18r)?<\xf4\x0dh5\
-vZ\x17+;I\xf2.\x92@u\xcc\xfe\x87g\xf7\
-\xecy\xa0\xedX\x1aGJ\xa20\xc0\xb1cpY\xf1\
-\xa7*m\xff\xc0hG\x86\xc4\xc4\xe5\xce\xc9i\x0e\xf1\
-\x86\xe3\x93\xaf\xe2\xbb?}\xa4\xea\xef\x04^D:\xd9\
-w\xc1\xcf\x12\x1e\x99\x80\x0cCw\xac\x17\x10\x03sD\
-\xe78\xa2\x00\xa9C\xc2\x00\x80R\xf6\xc3\x0eX\xa9\x12\
-\xddL\xd3\xa1 A\x09\x0d\xe3\x00C. [\x9c\xc1\
-g\x1f\xfd\x8b\xaa\xbb?\x8e\xf2\xb8c\xd3;QR\xce\
-\xf7\xfe\xe0y\x11\x89D\x8f'\xb2)e\xe7z\x8eP\
-\x07\xec\x7f\x95y\x1c@\xd3\xcc\xeaY\xd66`\xcc\xf4\
-%&\x10\x00\x06\x07\xd7uT\xc3\xa4\x88\x18\x05!\x9d\
-S\xd70\xc4}\xfe\xf9{\xff\x13\xb3\xc5K{\x04\xc5\
-#)\xec\xba\xeb\x8fpl\xf6\xf5\x0b\x9e\xaf\xfe\xfeQ\
-Ojc2\xc6\x1c\x0c\x7f\x013M\xf6\x94\x13\x139\
-\xf2\x97?\xfd\xf4W&\x008\x96P\xa8(\xfet\xa7\
-\x02(\xfa\xfb\xd7\xfa\xb4v\xeb\xc4\xa5\xce\xaal\x1d\xe2\
-.3\xf9I\xbcv\xea\xc2\xd4X\x91\x97q\xc7\xb5\xbf\
-\x80\xff\xf6\xcb\xff\x07\xafM\x1e\xc6\xf1S\xe7\x1f\xd3\xde\
-\x9e5H&\xbd\xd9\xfd\xa9j\x11\xcc\xb9\x8a3\x87\x9f\
-|r\xf7\xa4\x13\x139\xe7\xfbf\xe4; \xec\x0a'\
-\xa6\xd24\x05\xa6ix\xe6\x9a_J2\xd9\x83\xd9\xb9\
-\x09\x94\x8a\xde\xd7Gk\x95L\xd4\x9b\x9b7\xa43\xc8\
-\xc4{q\xe7\xf5\xef\xc6\xa9\xa9\xa3HD\xd2\xb8z\xf5\
-M\xd8\xb4v3\x22R\x0c{^\xfaO\xbc~\xf6g\
-`\x96\x89T\xaa\x17\xe9T?\xa21\xef\xec\xc7\x8a\x83\
-!n\x04\xe4Q\xa7\xe6rL\xc3\x10\xc2\x1ee\xc0\xef\
-95\x9f\xa2\x16\x10\x8b\xfa\xe3\x99]=|5\x8e\x1e\
-y\x0e\x9aOm;\x9b%\x13\xeb\xf6[\x84\x90\x00A\
-\x08\xc1/\xdd\xfe\xe1K~\xfe\xca\xe9\xe7\xf1\xe2\xc4A\
-d2\x83\xc8d\x06=\x97\xcb0\x0dGK\xde\x11\xc2\
-\x1cS\x80\x8e\x1d\xfe9\x8e{\x02\x80c\xc6;\xa5\x9c\
-\x87\x13\xe5b\xed@)\xc1\xea5W\x07\xbeoHW\
-\xb4\xb3\x9c6!\xdesd\xe2%|\xff\xd5o\xf9R\
-tx\x01\xa5\xe4\xe8i\xaa\x18\x8b\xa5\x1ds\xba:\xf6\
-\x84\xef\xd9\xf3\x80B\x80=N\xcdgY\x16\xca\xaa?\
-!1@\xc5+<8\xb0!\xd0\xa11\x99X\xa8\x00\
-Cj3>\xf5\x1a\x1e\x7f\xf9\xdfa1\xef\x0a\x1d\x5c\
-\x8ceYN:?\xc0\x80\xef=\xfa\xe8\xa7\x1d;\x9a\
-9\xbc\xc5!\xdfqr\xb6r)\xef\xd7&\x10\x00\x90\
-L\xf5`h\xf8\x8a@*A\x8e\xf2H\xc9\xa1\x13$\
-\xa4:\x87O>\x87o\xbd\xf8H\xcd\x8a0^QV\
-\xf2N\xef>\x1d\xd51\x8e*@\xc6\x8co99\x9f\
-i\xea\xd0\x9d\xa9\x1bf\x9bD\xbc\x0b\xc3\xc3W\x06\xee\
-8\xdc\x13\xef\x0fC`B.\xc1b&~\xf8\xd27\
-\xf1\xc3\xd7\xbf\x0d\xd3\xc3\x12W\xd5`\x8cAq\xb8\xd6\
- a\xe6\xe3N\xce\xe7\xe8\x13\xb4\x7f\xff\x97\x8f\x00x\
-\xd1\xc99K%\xef\x8b5^L<\x9e\xc1\xe8\xc8\xb5\
-\x10\xc4\xe0\xd4\xde\x1bN\x8f\xfa-BH\xc0\x98\xca\x9f\
-\xc5\xd7~\xf2\x05\xbcx\xf6\xa0\xaf6\xbf\x05\x14\xa5\x00\
-\xcbr\xb4\xd9\xd2\xf3\xf3:\xc61\x1c\xdfB\x10\xe0a\
-'\xe7\xd3u\xc5\xa9\xe2\x89m!\xc91\xac[{\x83\
-giC\x8d\x18\xcetN\xbcb\x88\xbb\xe8\xa6\x86}\
-\xaf|\x07\x0f?\xfb\x05L\x14\xfcip^\x8d\xb2\x83\
-\x99\x1f\x00\xc0\x80\x7fqtB8\x19\x078\x8fe\xb1\
-\x7f!\x94\xfc\x0f'\xe7,\x95\xb2H\xa5\xfa\x1a\x0ft\
-\x19J)\x86\x87\xafB\xa10\x8b\x89\x89\xa3\xbe4s\
-\x02*\xf6\xbf\xc1\xf4\xb0/k\x87\x04\x07\xcdP\xf0\xfc\
-\x89g\xf0\xc2\xe9gP\xf2\xa9\xbfv-\x14\xa5\xe8x\
-a\x13\x8bc\xd5\x13\x9c\xdb\xc0q\x05x\xe0\xc0C\xaf\
-l\xdd\xb6\xf3\x10\x80MN\xcd\xa9ie\xe8\xba\x0aA\
-\x08\xc6\x114\x1e\xcf \x1e\xcf`v\xf6,ffN\
-{\xae\x08\x873#U\xfb=\x84,\x7f\x18c\x18\x9f\
-~\x0d/\x9f>\x84c\xb3G\xa0[\xfe\x9f\x8e.\x86\
-1\xa0T\x9asvR\x82\x9f<\xb5\xe7\xa1\xd7\x1b\x0f\
-l\x0dwR-\x18\x1e\x06qN\x01\x02@\xb18\x87\
-t:X\xfdo3\x99\x01d2\x03(\x97\x0b\x98\x9d\
-=\x83b)\x07\xc3\x83\xe3\xfa\x15\xfd\x8e\xbe\xb4!\x01\
-\xa6\xa8\xe4q\xaep\x06S\xb9\xb38\x93=\x81\xb3\x85\
-\xd3P\x0d\x7fN\x1e\xcd\xa2\xaa\x05\xc7\x9b\x9c\x11F\x1c\
-5\xad-\xe0\x8a\x02\xb4,\xfaU\xcaY\x1fwr\xce\
-\x8a-P\x81 \x04\xaf\x07F$\x12G$r\x19\x00\
-\xc02M\x14KsP\x95\xd2|\xe5\xdb\xf6Ch\xe2\
-\xb1\xf3vG\x91\x93\xb0\xae\xc7\x91\x8c\xc3\x8e\xa0\xac\x15\
-p\xf8\xf8\xb3x\xe9\xc4s\x98\xcc\x9dA\xb1\x9cE\xbe\
-\x9c\x05P\xdd\xc8O)\x07Q\x94\xc1s\x02x^\x04\
-/\x88\x10x\x11\xbc \x81\xe7y\xf0u\x9a\xcc\xfb\x8d\
-e1H\xf3\xf2\xa9\xa6\x06\xddt\xa6t\x94\x970\xc6\
-Pt6\xf0\x19\x00\x18\xc7Q\xc7\x8f\xbf\x80\x8be\x90\
-\xb7n\xdb\xf9,\x80\x1b\x9d\x9c\x93\x17$d\xd2\x03N\
-N\xd9q\xdc8r;n_\xf7\x16\xbf\xc5p\x1dE\
-+\xe1\xf1\xe7\x1e\xc6\x13/|\x13\x8a~a\x82\x11!\
-\x04\xd1h\x12\x92\x1c\x85$\xc5 \x8a\x11\x08\xbc\x08A\
-\x10\xe1\xf4-\x9d\x90%\xe4\x95\xe0\x1d3\x83JY\xc9\
-\xa3\x90\x9fqz\xda\xa7\xf7\xef\xdb}\x9b\xd3\x93\x02n\
-\x1d\x81\x01\x80\xe1\x8b \xce*@CW\xa1\xa9e\x88\
-\xd2\xca\xac\x82\xccS\x017\x0co\xf6[\x0c\xd79;\
-;\x8e\xcf<\xfa\x17\x98\x98;y\xc1\xcf%)\x8a\xae\
-\xeeUH&\xba@\xa9\xfb\x852n\x1c\x1e\xc6\xdbG\
-.\xc3_\x1c\xf8\xa1\xebk-\x07\x18\xb3P*:\x1f\
-\xb6F\xc0\xbe\xe8\xf8\xa4\xf3\xb8\x16I\xcb\xf3\xdc\x83p\
-07x\x81B\xd1\xf1O\x97\x8ea\xe3\xaa\x1b\x10Y\
-\xe6M\x90\xa6\xf3\x13\xf8\xd47\xfe\xf4\x02\xe5G)\x87\
-\xc1U\x1b\xb0v\xed\xf5H\xa7\xfa<Q~\x00\xf0\xae\
-\x91+\xb0\xa9\x18GT\x0c\x1dN\xcdP*\xe5`Y\
-\x8ewv,s\x1c\xff\x15\xa7']\xc05\x05\xb8g\
-\xcf\x03s\x04\xf8\xba\xd3\xf3\x9a\xa6\x81\x92\x0f\x9d\xec\xfd\
-F\xe0D\xdc\xb0\xe6v\xbf\xc5p\x15\xc6\x18\xbe\xf0\xf8\
-\xffD\xbe|\xde\x83(\x08\x22\xd6\x8enB:\xd5\x07\
-/3\x12)\xa1\xb8B\x89\x82+\x9bx\xef\xd5\xa1\xd3\
-\xa9\x11\x96i\xa0\xec\xc2s\xc9\x80\x7f\xd9\xb3\xe7\x01\x87\
-]\xca\xe7q;\x97\xea\xb3nLZ*\xcey\xda\xc9\
->\x08\xdc\xb6v\x0cq)\xe1\xb7\x18\xae\xf2\xc2\xf1\xa7\
-ql\xe2\xe5\xc5\xef\x09\xa5X\xbd\xfaj_L\x1e?\
-w\xd9\x06\x08\x85\xca=6\x16_\xe5\xf9\xfa\x9dF\xa1\
-0\xebJ\xf6\x09\x05\xfd\x9c\xe3\x93^0\xbf\x8b\xec\xdb\
-\xb7\xfb\x09\x00\xcd\xf5\xe6k\x01\xc6\x18\x8aE\xd7>\x14\
-\x02G_r\x156\x0d\xbf\xc9o1\x5c\xe7\xe0\x91\x0b\
-\xab\x1cuw\x0dA\x92\xfc9\xf2\xff\xfc\xc0\xfa\xc5\xaf\
-\xd3S&\xd6d\x82\x91\x01\x14D4]\x81\xaa\xb9\xd0\
-\xc6\x82\xe1\xe5}\xfb\xbe\xf8\xa4\xf3\x13\x9f\xc7\xf5lz\
-\x02\xf2\xcfn\xcc\xab(\x05\x18\x86\xbf\x95.\xbc\x80\xa3\
-<\xee\xbc\xe2\x1d+\xa2\xf0\xc1\xe9\xe9c\x17|\x9fN\
-\xfb\x93\xfd#\x0b\x02\xd6d\xb9\xf3?`\xc0;/\xbb\
-\xca\x17Y:\x81ba\xd6\xa5\x99\xc9gQ+\xde\xc9\
-!\x5c\x7f\xaaL\x93}\x11\x80+q\x04\x85\xfc\xb4\x1b\
-\xd3\x06\x8a;\xae\xb8\x07=\xf1`\x05\x80\xbb\x05Y\x12\
-\xc2\xc2\xf3\xa2o\x99?wm\xbc\x12di\x0e?G\
-pEO\xd8~\xa0\x1a\xa5r\xce\xb1V\x97\x17\xa1\xf0\
-\xbc\xfe\xa0\x1b\x13/\xc5uw\xda\x93O\xee\x9e\xdc\xba\
-u\xe7C \xf85\xa7\xe7\xd6\x0d\x15\xe5r\x0e\x91\xc8\
-\xf2\xec\x8d\xbbi\xe8f\x5c=p\xbd\xdfbx\xc6`\
-\xd7\x08\xc6\xcf\xbd\x06\x00 \xd4\xbf\x1a\x8c\xa3[\xd6!\
-w\xfd\x06\xd0\xa2\x01\x98\x0c,!@b&\x84\xef\xf2\
-\xd0u\xc7\xbd\x9c\x1d\x8bi\x1a\xee\xf5\xcea\xec\x8b{\
-\xf6|\xe5\xd2\xf6v\x0e\xe3\xc9\xb9\x8a1\xf6\xff\x02p\
-\xb4.\xce\x02\xc5\xe2\x9c\xe3I\xd7A`M\xd7:l\
-\xbd\xecn\xbf\xc5\xf0\x94[\xaf\xbck\xf1k\xd3\xd0}\
-)\xe9\x14\x89H\xd8\xb4i-\xc0\x11XI\x01VF\
-\x04\xe3\x09\x04\x81\xc7\xda\xb5+;\x08\xffb\x0a\x85i\
-';\xbd-\x85QJ\xfe\xd6\x8d\x89/\x86k<\xa4\
-}N\x9c84\xbdf\xe4\xfa[\x00\x5c\xee\xc6\xfc\x86\
-\xa1C\x96\xe3nL\xed\x0bC\xe9\x11\xbcc\xd3\xfb\xc1\
-y\x14\xef\x16\x14z\x92\x038\x97;\x83\x89\xecI\x10\
-B!\xf0\x228\x9e\x87e\x99\x9e\xfd\xbbz\xe3j\xf4\
-\xf7\xa713\x93\xbd\xe4\xdf\xe4\xe4,\x8e\x1c=u\xc1\
-x0\x06J=y\x8c\x02\x85\xa2\x14]\x09{\x01\x00\
-\x06\xfc\xc7\xfe}\xbb\xff\xce\x95\xc9/\xc2\xb3s\xc6\x96\
-;v\xbd\x99X\xec\x07n\xcd\x9fH\xf4@\x96cn\
-M\xef\x19\x0b\xcaO\xe0\x82\x9b\xb3\xea&\x9a\xa1\xe2K\
-\xfb\xfe\x16o\x9c=\xec\xb7(M!IQ_:\xad\
-\xf9\x09c&ffN;]\xec\xf4\xfc\xfc\x94m?\
-\xf0\xc4C\xfb\x5c\x99\xfc\x22<\xfb\xe8:q\xfc\xf9c\
-kF\xae{\x1b\x80!7\xe67\x0c\x05\x92\x14\xef\xfe\
-&:\x00\x00 \x00IDAT\x0f\x5c\xe9\xfaV\xb8\
-\xbc\xff\x1a\xdcs\xcd{\xc1s+7\xf3\x80\xa3<6\
-\x8d\xdc\x02\xc6\x18NL\xbd\x01\xe6\xae\x13\xb0m\x04^\
-\x84\x1cY>\xa7\x8ff\xc8\xe7\xa6\xddr|\x80\x00?\
-\xde\xbf\xf7\xa1?we\xf2*x\xbaw_3z}\
-\x09\xc0/\xb917c\x0c\x86\xa1A\x92\xe2\x9ef\x0c\
-8\x01!\x14\x9b\xd7\x8da\xeb\x86\xbbW\xe4q\xeab\
-(\xe1\xb0~\xe0j\x5c\xb1\xea:L\xe6N![\x0a\
-n\xfa#\xc7\x0b\x88D\x96w\x80\xfaR\x14%\xefj\
-&\x16\x01\xf9\xfd\xf1\xf1\xe7=\xdb\xfe{\xfa\xb4\xddz\
-\xcb\xe5\x87\x0b\x05\xfe\x97\x01\xb8\x12S`Y\x06\x08\xa5\
-\x81)\x9c\xda\x0c\x099\x8d\x9f\xdf\xf8n\x5c5x}\
- \xbb\xcf\xf9I\x22\x92\xc6M\xeb\xb6\xe3\xb2\xc1k\xa0\
-\xe8%\xcc\x14&\xdd2\xba\xdb\x86_A\x0a\xd04\x0d\
-\xe4r\xe7\xdc\x5c\xe2U\x9e;\xf1\xbb\xc7\x8e\x1d\xf3\xec\
-M\xf6\xfc\x89\xdb\xb6m\xd7}\x0cl\xb7[\xf3\x13\x02\
-\xa4\xd2\x03\x10\xf8\xceP\x82o^\x7f\x0f6\xae\xb9\xd9\
-\xf3uuC\xc3T\xee4\xe6J\xb3(k\x05\x94\xb5\
-\xd2bzaI/ *\xc4!\x0a2d1\x82t\
-\xb4\x0b\xe9X/\x92\x91\xb4\xaf\x01\xd9e\xad\x88\x97N\
-\xfd\x14/\x9d|\x16G'_\x81\xe2F\xf6A\x8b\xac\
-\x1c\x1b \xc3\xec\xdc\x84\xab\x05\x7f\x19a\xbf|`\xef\
-C\xae\x14>\xad\x85\x0f[\x8e\x8f\xd1\xad\xdb\x8e\x1c\x04\
-\xd8\xb5n\xad\xc0q\x022\x99\xc1\xce\xd8Qi\x06\xee\
-\xdb\xf2\xbbH\xc7\xbb]]\xe6\xec\xec8^:\xf1\x1c\
-\x8e\x9cy\x11G\xce\x1e\xc6t\xee,\x18cH\xc4\xbb\
-\x9a\xb6aq\x94C*\xda\x8dL\xbc\x07\xfd\xe9a\x0c\
-eF\xb1*3\x8a\x9e\xa4\xf7\xaf5c\x16N\xcf\x8d\
-\xe3\xe4\xd4\x11<\xf9\xcaw0\x9d\x9f\xf4t\xfd\x05V\
-\x8a\x02,\x16g\xdd\xed\xd0\xc8\xf0\xb3\xfd\xfb\xd7_\x07\
-|\xcc\xd3-\xbe/\x1ab\xeb\xd6\x9d;@\x9c\xed\x1e\
-w1\xb2\x9c@\x22\xd1\xe5\xe6\x12\x8ea\x16J\xf8\x8d\
-\xbb\xff+\xa2\x0e\x17;\x98\xce\x9f\xc5\x81\x17\x1f\xc5s\
-\xaf\xef\xc5\x99\x99\xe35F\x11tu\x0d\x80k\xc3\xf1\
-\x22\xf12\x06\xbbF\xb0\xb6\xefJ\xac\xeb\xbf\x0akz\
-6\xb8\x1e\xc23\x9d\x9f\xc4\xa1\xe3?\xc2sG\xf6b\
-\xb6\xe8z\xbclMV\x82\x02\xd44\x05\xb9\xdc\x04\xdc\
-\x0c\xcb$`\xef\xde\xb7\xef\xa1o\xb8\xb7B\xadu\xfd\
-\x81l\xdd~\xdfs`\xc4\xd54\x87D\xa2\x0b\xb2\x1c\
-|\xfb\x8cah\xd0\xf3\x05\xfc\xd6=\x1fC<\x92j\
-{\xbeWO=\x8f\xef\x1f\xfcW\x1c:\xfaTS\xa1\
-\x0a</ \x93\x19\x80S\xb7\x83\xc0K\x18\xed\xbd\x0c\
-\xeb\x066b}\xdfU\x18\xcc\x8c\xb4\xbdCd\xcc\xc2\
-\xc9\x99\xa3x\xed\xf4\x0bx\xe5\xd4A\x9c\x9a=\xe6\x88\
-\xac\xed\xb2\xdc\x15\xa0i\x1a\x98\x9b;\xe3Z\xc8\xcb<\
-\xcf\xed\xdf\xb7\xfbf\xb8\x9c\xf7[\x0d\xdf\xce\x88\xdb\xb6\
-\xed\xfaE\x06\xe6\xba\xc6Og:\xc3\x1eX.\xe7Q\
-\x9c=\x87\x0f\xfd\xdc\x9fa\xa4\xcf^\xbc\xf8\x99\x99\xe3\
-\xf8\xda\xfe\x7f\xc2\x0b\xc7~\xd4\xf2\xb5\x91h\x12\xf1X\
-\xda\xd6\xba\x8d\x88Jq\xac\xed\xbb\x12\xa3}Wbu\
-\xf7:\x0c\xa4W\xd7\x0d\xf51L\x1d\xd9\xd2,&\xb3\
-\xa7pj\xe6(N\xcd\x1e\xc5\xc9\xa9\xa3(k\x05W\
-\xe4k\x07I\x8c\x22\xd3\xb5<\x15 c\x0c\xd9\xb9\x89\
-\xf9\xde6.\xaeC\xf0\xf6\x03{w\x7f\xdb\xd5Ej\
-\xe0\xa7\x91\x8cl\xdb\xb6\xf3\x00\x03\x5c\xad\xf1N)\x87\
-LfUG\xc4\x07\x16\x0a\xb3\x988{\x14wnz\
-\x17\xee\xbe\xf1}\x90\x84\xe6\xea\xe0\xcd\x15\xa6\xf0\x9fO\
-?\x88\x03\x87\x1f\x85\xc5\xec\xd6I$H\xa7{=k\
-:\x95\x90SHD3 K>\xf3\x0df _\x9e\
-CI\x0d\x9e\xa2\xab\xc5rV\x80\xf9\xfc4\x14\xc5\xf5\
-\xf7b\xff\xfe}\xbb\xb7\xb9\xbdH-\xfc\xcc\xb5b\x8c\
-\xd1\x8f\x80X\xcf\xc0\xc5\x9cd\xcb2\x91\xcf\x9dC*\
-\xdd\x07\x7f\xf5}c\xe2\xf1\x0c\x84\xd5\x12\xbe\x7f\xe8\xeb\
-x\xea\xa5\xc7\xb1u\xe3\xdbp\xe3\x86m\x18\xc8\xac\xb9\
-d\xaceY82q\x18O\x1e\xfe\x0e~\xfc\xea\x0f\
-\xa0\xe9\xed\xb6Jd\xc8\xe5\xa6\xd1\xd55\x00B\xdc\x8f\
-\x8e\xca+Y\xe4\x15\x97\x12\xe9\xbd$\xd8\xb7\x94m\x94\
-r\xde\x0b\xe5gY\xd4\xfaC\xb7\x17\xa9\x87\xefo\xdf\
-\xd6m;\x1f\x04\xb0\xd3\xedu\x22\x91$\xe2\xf1\xce(\
-jiY\x06&'\x8ecvn\x12\x00Cor\x10\
-\x83]#\x88\xcb)\x18\x96\x8e\xe9\xdc\x19\x1c\x9f|\x0d\
-\x8aVt|mI\x8c \x99\xeau|\xde\x05\x0a\x85\
-Y_\xde\x07B\x00Jy0\xc6\xc0\x98\xe9\x98A\x7f\
-9\xda\x00u]\xc5\xdc\xdcY\xf7\x17b\xf8\xfc\xfe\xfd\
-\xbb\x7f\xdd\xfd\x85j\xe3{\xb6=\xcfq\x7fb\x98\xe6\
-/\x02p\xb5\xa6U\xb9\x9c\x03\xc7\xf1\x1d\x11\xb4J)\
-\x8f\x81\xc1\xf5\xe8\xea\x1e\xc2\xec\xec\x19\xcc\xe6\xa6q.\
-w\x06@\xc5.c\xba\xd8/V\xd5\xcaP\x94\xa2+\
-y\xd5\x8cYP\x94<DA\x82\xe8A\xa5gB\x08\
-\x22\x91$\x22\x918x^^\xcc\x10b\x8cA\xd3\xca\
-P\x94\x02\x14%\xdf\x962\x0cv\xa2^\xeb\x98\xa6\xee\
-v\xb0\xf3\x02yB\x98g)o\xb5\xf0=\xef\xea\xd8\
-\xb1\x83\x855k\xae\xe3@p\xa7\xdbk\xe9z\x19<\
-/\xb5\x15\xf2\xe1%\x1c\xc7#\x1e\xcf\xa0\xabk\x15\x92\
-\xc9nD\xe48D)\xe2z;\x00MS \xcb1\
-\xc7\xed\xa6\xa6\xa9\xa1\x5c.\xc204\xc8r\xc2\xd5\x94\
-EQ\x94\xd1\xd5=\x84\x88\x1c\x07\xc7\xf1\x17\xacE\x08\
-\x01\xcf\x0b\x90\xe5\x18$)\x06]/\xdb\xf6r.\xa7\
-T8\x8bY\xc8\xceMx\xd2o\x87\x80\xfc\xf9\xbe}\
-\xbb\x1fs}\xa1\x06\x04\xc23\xc0\xf3\xdc_3\xe0\x98\
-\xdb\xeb0\x06\xe4r\xe7\x5c\x8dfw\x03B*G\xad\
-T\xba\x0f=\xdd\xc3\x1e\xac\xc8\x90\xcbO\xc1\xe9\xfd\x8d\
-aV\x8a\x89\x9a.u\x10[@\x96b\xc8dVU\
-\x89E$\xe8\xcad0<\xbc\x1a\xab\x86\x86\x10\x8b\xc5\
- \x08\x12\xba\xbb\x87m\xa7O\x92e\xb2\x05d\x8c!\
-\x97\x9d\x84izR\xf0\xf5\x8dx<\xf5\xbf\xbdX\xa8\
-\x11\xbe\xef\x00\x01\xe0\xd8\xb1\x83\xc6\xe8\xc8\xa6\x93\x00y\
-\x9f\x17\xebiZ\x19\x92\x14\xed\x08\xcf\xf0\xa50\x9c;\
-W+\xa8\xd99,\xcb\x04c\x0c\xa2\xe8\x5cG6]\
-S\x17\x9d5\x86\xa1B\x14\xa3\x8e\x17\x7f\x10\x04q>\
-\x0b\xe8\xd2\xf7vhx\x18\xdd\xdd=\x90$\x09\xb2$\
-#\x95JA7\x0c\xa8\xaa\x0aI\x8aBQ\x0a-\x17\
-a\xe5\xf9\xce0\xab4\xa2\x90\x9f\x86\xa6\x95\xbdY\x8c\
-\xe1\xfe\x1f\xfc\xe0\xb3\x81\xa8w\x16\x18\x0d\xb0o\xdfC\
-_\x03\xe0I$\xb8e\x99\xc8e\xbd\xd9\xea;\x8fw\
-~\xabr9\x0fUu.\xdf\xd6ZR\xc8\x801\x86\
-|~\x1aN\xa7\x17$\x12=U\x95_4\x1aE2\
-q\xb1\x99\x99\xa0\xbf\xaf\xd2o\x85\xe3x\xc4:\xc4I\
-\xe64\x85\xc2\x0c\x14\xd5y\x87ZU\x18yx\xff\xfe\
-\xdd\xdf\xf4f\xb1\xc6\x04F\x01\x02\x00\x01\xfbm\x00\x9e\
-\xf4\xbb4L\x03\xd9\xec\x84\xdb\x11\xee\x8e\xe3u\xcem\
-.7\xedX\xf7\xbd\x8bc\x14\x0dCC6w\x0eN\
-\x1d\xb5\x05^\xaa\xb9c\x15\xa5\xeaG\x5c\x8e\xe3\xc0\x0b\
-\x95\xa3r,\x9al\xf9T\xc0\xfc\x0f\xa4h\x8bbq\
-\x0e\xe5r\xde\xa3\xd5H\x961\xed\x0f<Z\xac)\x02\
-\xa5\x00\xf7\xed{\xe8\x0c\x03\xfe\xcc\xab\xf5\x0cCG6\
-;\xe1K\xef\x09\xbbT\x14\xa0\x97\x0f\x1dC.w\xce\
-\x912T\xa6q\xa9}I\xd3\x14\xcc\xcdM:\xf2A\
-$\xd5\xf1\x5ckju\xbb\xafiZ0\xf4\x05\xc5L\
- \x89\xfe\xf4!\xf6\x83r9\x87R\xc9\xc3XL\x86\
-?<p\xe0\xab\xa7\xbd[\xb01\x81R\x80\x00p`\
-\xdf\xee\x7fb\x80k\xa5\xf3/\xc604\xcce'\x1c\
-?\x8a\xb9\x09\xcf{\x1b\xbdd\x9a\x06r\xf9\xf6\x8a\x92\
-2V\xb1\xfbUC\xd7U\xcc\xce\x9eA\xb9\xdc^H\
-\x0a\xcf\xd7\xf6\xee\x97Je\x14\x8b\x97\x1e\xf3\xa6\xa6.\
-\xdc\x81r|\x8b\xad\x08:\xe8\xbeYJY\xc9\xa3\xe0\
-Z?\xdf\xaa<\xb1\x7f\xff\x83\xae\xf4\x08o\x87\xc0)\
-@\x00\x8c0\xf2[\x00\xdaMmh\x1aCW\x91\xcd\
-\x9d\xeb\x98\x9d\xa0\x1fa<\x9aZj\xeb\x81\xd1\xd4b\
-\xdd\xd7\xd7\xb2L\x14\x0a\xb3\x98\x999\x85|a\x06\xaa\
-Vn\xd9#Y\xdf\xa1\xc2p\xe2\xc48\xce\x9d;\x87\
-R\xa9\x84B!\x8fS\xa7Nbf\xe6\xc2\xde\xd2+\
-\xa1\x22\xb7\xa2\x14Ph\xf3\x03\xadE\xca&\xc7~\x1d\
-\x01\x0c\x9b\x0c\xe4\xbb=>\xfe\xfc\xf4\x9a\xd1\xebM\x00\
-w5\x1c\xec\x10\xa6i@\xd7UHR,\xf0u\x04\
-\xf3^z\xec\x96`\x18\x1a\x18\xb3 \x08\x91\x16c\xf8\
-*\x0e\x8ff\x8e\xb9\x0b\xad\x0dT\xb5\x84r9\x8fR\
-)W\xb1\xd35\xb13\x93\xe4\x18x^\x04!\x04\xc9\
-d\x0a\x99L\x17\x92\xc9$\x04A\x84\xae\xeb\xb0,\x0b\
-\xa5R\x09\xd9\xec\x1cr\xb9\x1c\xd4*\xc7bU-\xfd\
-\xff\xed\x9dy|\x5ce\xb9\xf8\xbf\xcf\x99-I\x93\xb4\
-\xa5-\x05\xdaB\xd9e\x13\x04\x846ikA\x16/\
-\x8a\x82Z\x94\xa5(.\xb8\x82\xde\x8bB\x12\xb8\xf7\xe6\
-\x83\xa5i\x91\xeb\xf2\xe3\xfaC\x01\x15[\x90+\xd5\x8b\
-\xfcT@@\x1b\x92fR\x10\x10\x14D\xf6\x02\x05\xda\
-\xd2%I\xb3\xccv\xce\xf3\xfbc&i\x96\x99dN\
-23g&}\xbf\x9fO;\x93s\xce\xfb\xbe\xcf\xcc\
-\x9cy\xe6}\xdfgs\xf5\xde\xfa|\xa5\xe5\x07\xd8\x17\
-\xd9MOwaK\x0c\xa8hC\xf8\xd1;\x7f_\xd0\
-A\xb3\xa4\x18g\x80\x00lh9\xe4F\x94\xf5\x85\x1c\
-3\x1e\x8f\xa4\x1cA\x8b\xdb0\x12\xc8\xa1k\x8a[\xfa\
-\xfav\xd3\xd5\xb5\xcd\x95\x05\xbd\xb7w\xf7\x04\x0c)\x9a\
-\xb5\x8f\x9e\x9d\x88\x11\x08\x04\x98?\xff\x10\xe6\xcc\x99\xc3\
-\xf4\xe9\xd3\x99:u\x1a\xb3g\xcf\xe6\xd0C\x0f\xa3\xaa\
-z\xec`\xa3\xc4$\xac1\xddOoo'\xdd\xbbw\
-\x16t\xd5\xaeh\xcb\x01\xb3\xa3\xdf/\xdc\x88\xee(Z\
-\x05\x08\x8d\x8e\xdf\xef\x5c\x0a\x14\xf4\xe7*\x9e\x88\x16\xbd\
-u\xb8<\xe4m\xf9\xcfX,\xc2\xce\x9d\xef\xd0\xd7\xdb\
-5\xe6\xb6A$\xdaCo\xef\xf8\x0d\xfb>\x9f?\xeb\
-%\x7f$\xda\xcb\xbcy\x07RV6RaZ\x96\xc5\
-\xdc9s(/\x1f\xed\xc7C\x89\xb9v\x07)\xbaU\
-]Zz{;\xf3\x1eA\x94\x86]\xa2\xd6\xf2u\xeb\
-\xd6\x15\xad\xbfY\x11+@hn\xbek\xb3\xa0\x97\x17\
-z\xdcD\x22Fg\xc7;\xd8vq~n\xe5\x15\x13\
-O\x9a:QT\x1d\xba{:\xd8\xb9\xf3-\xbaw\xf7\
-\xef\xd9\xc5Qu\xb0\xed\x04\xd1X\x1f\x1d\x9d[\xd9\xdd\
-\xb5cB3\x8e\xa0\x8b\xf4\x5c\xf1X\x94ht\xb4\xe5\
-\xab0k\xd6\xbe\x19\xcf\xf6\xf5u\xbb\xfe\xe1\xf3\xb2F\
-J\xb6tw\xef\xf2B\xf9\xa1\xa2_\xde\xb0a\xcd\x1b\
-\x05\x1f\xd8\x05E\xb9\x078\x987\xde\xf8\xdb\xf3\x07\xce\
-?\xfe\x10\xe0\xf8B\x8e\xeb\xa8C4\xdaK(T^\
-t\x1b\xe3~\x7f\x80\xed\xdb\xdf,\x0a\xa3\xcd\xd0=\xbb\
-nz{\xbb\x06\x1c\xa8\x9d\x1c\xfc\x80TTT\x8fj\
-\xdd\x1dNOO\x17\xfb\xed7/\xe3>n \x10`\
-\xfb\xf6\x1d#\x8e;\x8eMG\xc7V\xd7\xee>\xc9x\
-\xe2\xe2u\x9d\xd9\xdd\xb5\xbd\x10i\xadF\xa0\xc8\xedm\
-\xadkW\x15|`\x97\x14\xff\xcf\x17\xe0\xb7\x22_\x03\
-y\xa9\xd0\xe3:N\x82]\xbb\xb6\xe4 \xd7^n\x11\
-\x11\xaa\xaa\xf3[D\xa9Xpk\xf1\xee\xea\xea\xe0\xc5\
-\x17\x9e\xc98\xeb\x14\x11,k\xa8rT'Y\xf1\xcc\
-q\xdc\xc7\xc1\xe62T0\x978\x8eCG\xc7\xd6\xc2\
-Ex\x0c\xe5\x15\x1c\xbf\xa7y\xfe\xb2\xa5$\x14`s\
-\xf3\xban\x81K\x80\x82g1Pu\xe8\xea\xdc\xe6\xc9\
-\xaf\xe8hTW\xe7/g_11\x1e\x83\xfc;[\
-6\xf3\xf7g\x1f#\x1e\x1fi\xd0\xe8\xb7\x06\xf7c'\
-\xe2\xec\xd8\xb9\x99\xf88\xac\xea\x96e\x11\x0a\x15\x9f\x02\
-\xb4\xed8\x9d\x1d\xef\x10\xf7\xe6\x87\xbb\xcf\x12Y\xd6\xd6\
-\xf6\xb3B\x85\x97L\x88\xe2Z\xdb\x8d\xc2\x1bo<\xf3\
-\xd6A\x07\x1d\xbf\x158\xd7\x8b\xf1c\xb1>\x04\x08\x04\
-\x0b\x932~,\x82\xc12v\xee|\xbb\xe8\x0a\x85\xe7\
-\x9a`\xb0\x02\x9f\xcf\xbd\xe3w_o\x0fo\xbf\xfd:\
-\xea8\x04C!\x02\x81\xa4\x1b\xcd\xce\x1d;\xe8\xed\xeb\
-%\x1e\x8f\xd2\xd3\xd3AW\xd7\xbb\xe3\x8e\x09\xaf\xa8\x98\
-Zt\xcb\xdfD<Jg\xe76l\xaf\xe2\xdcU\xbe\
-\xdc\xda\xba\xe6\x01o\x06wOq;\xbc\xa5\xa1v\xf1\
-\xa5\xb7\x09\xeaY\x16\xd9P\xd9\x14\xaa+g\x8coj\
-\x92c\xb6l}\x95w\xb7\xe5?3\x8c\x97TTT\
-3%\x07\xc5\x9a\x82\x81 \xfe@\x90x,\x86\xed$\
-&l\xe5\x17\xb1\x985\xeb\xc0\xa2\xda\x1f\x8eD\xba\xe9\
-\xee\xde\xe9\xdd\xde\xb0\xe8\xff\xdd\xd0r\xe7\xd7\xbc\x19|\
-|\x94\xc4\x12x0\xd5\x95S\xbf.\xf0\x17\xaf\xc6\x8f\
-Fz\xd8\xb5\xebm\xec\x22\xf0\x17\x9b9c.R\x92\
-)\xbd\xb2'i\x99\x9d\xf8l&\x16\x8f\xd1\xdb\xdbM\
-<\x11\xcb\x89\x8bSU\xd5>E\xa4\xfc\x94\x9e\x9e\x0e\
-v\xef\xde\xe1\xa1\xf2\x93\x8dUS\xa6\x97\xc4\xbe\xdf`\
-\x8a\xe5\x13\xcc\x9a\x97_~\xdc\x9e?\xff\xa4\x07\x15\xe7\
-\x12\xc0\x13\x878G\x1d\x22\x91\x1e|\xbe\xa0+\x0be\
-\xae\xb1,\x1f\x22V\xa1c:\x0b\x8c\x12OD)\x0b\
-U\x14M\x84N0XNU\xd5\xacbX\x04`\xdb\
-6]\x9d\xdb\x88zc\xecH\xa2l\xf5\xfb\x9c3\x1f\
-y\xe4\xf6\x92\xbb\x11KN\x01\x02\xbc\xfe\xfa\xd3]\x07\
-\x1dt\xdcS \x17\xe1\xd9,V\x07n\xba@\xa0\xcc\
-\xb3/CEEu2\xcbu\x8eRV\x15#\x8ec\
-\x13\x8b\xf5\x11\x0c\x96\xe7!\x89\xad\x0e\xcc\x08\xfbgO\
-\xa3)Z\xbf?\xc8>\xfb\x1cP\x14\xca8\x1e\x8f$\
-\xf7\xfb\xbc]\x8d\xc4E\xf8hK\xcb\x9d\x7f\xf7R\x88\
-\xf1\xe2\xfd\xa78\x01j\x97,\xff\xbc(\xb7{-G\
-0XFe\xe5L|>o~O\xfa\xfa\xbay\xf5\
-\xd5'\x8b:z%\x17$\x8b\x1cUQQQ=\x0e\
-\x07d%\x9e\x88c'b$\xe21\xe2\x89(\x8e\xe3\
-\xa4]^\x8b\x80X>,\xf1c\xf9,|\x96\x1f\x9f\
-\xcfO0T\xc1~\xb3\x0f.\x8a\x9a2=\xbd\x9d\xf4\
-\xf6t\xe2u$\x8a\xc2W\xdaZ\xd7\xfe\xd8S!&\
-@I\xce\x00\xfby\xf3\xf5\xbf\xfd\xf5\xc0\xf9'\x94\x03\
-\x8b\xbc\x94\xc3\xb6\x13D\x22\xdd\xf8,\x7fVA\xfb\xb9\
-&\x10\x08\x12\x0c\x96\x17\xaa\x9a\x97\xa7\xc4\xe3Q\x22\x91\
-n\x12\x89X*\xc3\xb4\x0e\xe8\x00U'\xa9\xd4R\x89\
--\xfa+\xbf\xf5\xf6v\xd1\xdd\xddA$\xd2M,\xd6\
-\x97l\xeb8\xa3\xee\x97\xa9*\x8ecc\xdb\x09\x12\x89\
-\x18\xb1X\xd2\xa5d\xe6\xccy\x05x\x95\x99\xb1\xed\x04\
-]]\xdb\x88F<\x5c\xf2\xf6\xa3\xach\xdb\xb0\xf6\xbb\
-^\x8b1\x11Jz\x06\x98B\x16/^\xbeV\xe1b\
-\xaf\x05\x01(+\xab\xa4\xb2r\xba'!R[\xb7\xbe\
-\xc6\xb6m\x9b\x0a>\xee\xdeB\xe5\x94\xe9\x1c|\xc8\x09\
-\x9e\x8d\x1f\x8d\xf6\xa6\x0c\x1d\xde\xcf\xf4\x05~\xd5\xda\xba\
-\xf6B\xbc\x9e\x82N\x90\xc9`BT\x9f\xcf\xf7\x05\xd0\
-6\xaf\x05\x81\xa4+\xc2\xae][H$\xf2W\xbb7\
-\x13\xb3g\x1f\xcc\xec}\xe7\x17|\xdc\xbd\x85\x8a\xca\x89\
-\xbb\xe3\x8c\x07U\x87\xdd]\xdbs\x96\x99{\xe2\x02\xd1\
-ZY9\xed3\x94\xb8\xf2\x83\x12_\x02\xf7\xb3i\xd3\
-\xd3\x89\xfd\x0e?\xe1>\x9f\xcdy\x80\xe71b\xaa\x0e\
-\xd1h7\xb6\xe3\x10\x0c\x84\x0a\xbaa>\xa5r:>\
-\x9f\x9f\xee\x02\xe7|\x9b\xecX\x96\xc5\xbcyGa\x8d\
-(\xb5\x99_b\xb1>:;\xdf%\x9e!\x9b\xb6\x07\
-\xbc\x22\xe2?\xebO\x7f\xfaI\xfe\xea\x9a\x16\x90\xc9\xb0\
-\x04\x1e`\xd1\xa2K\x0fD\xb4\x058\xc8kY\xfa\xb1\
-,?UU\xfb\x14<ft\xf7\xee\x9dl\xde\xfc\xbc\
-'3\xd1\xc9\xc8~\xfb\x1d\xc2\xacY\x85\xbb\xad\x92\x19\
-\xb2w\xe6\xb4*_\x0e\xd8l\x09KZZ\xd6\xbe\xe6\
-\xb5 \xb9bR)@\x80%K.:\xdcQ_\x0b\
-\xb0\x9f\xd7\xb2\x0c&\x14\xaa\xa0\xaaj\x1fD\x0a7\xe9\
-\x8e\xc7cl~\xeb\xf9B\xa7?\x9ftTW\xcf\xe2\
-\xa0\x83\x8e-\xd8x\x91H\x0f==;\x8b\xcd\xaa\xbf\
-\xcd\x12\x96\xb6\xb4\xac}\xdekAr\xc9\xa4S\x80\x00\
-K\x96\x5c|\x9c\xa3V3\xb0\x8f\xd7\xb2\x0c\xc6\xb2,\
-\xa6L\x99NYYeA\xc7\xdd\xb5\xeb\x1d\xb6ly\
--cQ\x22Cf\xa6M\x9b\xcd\xdc\xb9G\x15d\x1b\
-#\x1e\x8f\xd1\xdd\xb3\x93D\xbc\xe8>\xa7\x0eK\xe4\xf4\
-\x96\x965\x7f\xf5Z\x90\x5c3)\x15 \xc0\xe2\xc5\x97\
-\x9e\xa2\xe8#@\xd1\x15l\xf0\xf9\x02TVN/\xe8\
-\xb2X\x1d\x87m\xdb_g\xfb\xbbo\x96hA\xf8\xc2\
-\x22\x22\xcc\x9e}\x083gf\xce-\x98+Tmz\
-z\xba\xe8\xeb+\xcam\xb5.\xc7r\xce\x08?z\x97\
-g\xe1\xa7\xf9d\xd2*@\x80%K.\xa9qT\x1e\
-\xc2\xa3\x90\xb9\xb1\x08\x86\xca\xa9\x9c2\xbd\xa0\x8e\xb5\x89\
-D\x94\x1d\xdb\xdfb\xe7\xae\xb7'u\xf4\xc8D\xa8(\
-\xafb\xff9GR\x91\xe7bG\xaa\x10\x89\xec\xa6\xa7\
-\xa7\xa38\xac\xbb#\xe9\x13\xf8\x97\xd6\xd6\xb5\x8fz-\
-H\xbe\x98\xd4\x0a\x10`\xc9\x92\xe5\xa7;\xca}@a\
-\xd7\x9dY\x22\x22\x94\x95WQQ1\x15\xab\x80\xbe\x83\
-\x8e\xe3\xd0\xd9\xb1\x95\xed;6\x17]\xaeC\xaf\x08\x04\
-\xcb\x98\xbd\xef!L\x9f>;\xaf\xe3\xa8B4\xd6C\
-oO\x87\xeb\xd2\x9f\x05\xa4[-\xf9h\xdb\xa3k\x0a\
-Z\x98\xac\xd0Lz\x05\x08P\xf3\x81\x8b\xdfo9\xd6\
-\x83\x14\xd9\x9e\xe0`D\xac\x09\x84yM\x8cH\xa4\x9b\
-\x8e\xcemtun\xf76\xa8\xde#*\xca\xab\x981\
-\xeb@\xa6M\x9dE\xbe\xbf\x12\xb1X\x1f==\xbb\x8a\
-}\xf6\xdda\x89~\xb8\xa5\xe5\xce\xb0\xd7\x82\xe4\x9b\xbd\
-B\x01\x02,Yr\xe9\xfb\x1c\xd5?\x02E\x9dJ9\
-\x19\xefZ\xed\x89\x22\x04\x88Fz\xe9\xec\xdaF\xf7\xee\
-\x9d\xf4\xf6\x8d]\xf5\xadT\xf1\xfbCL\x9f\xb6/S\
-\xa7\xefOyY\xfewHb\xb1HJ\xf1\x15\xbd[\
-\xd26\xc7\xf6\x9d\x1d\x0e\xdf\xf1\xb4\xd7\x82\x14\x82\xbdF\
-\x01\x02,\x5c\xfa\xd9\xf7\xf8\x1c\xfb\x11\x949^\xcb2\
-\x16\x96X\x94\x97WSV^\x95\x87\x0c(\xd9\xe18\
-\x0e}}]\xf4\xf4t\xa4\xca*v\x8d\xabnF1\
- \x02eeUTU\xcf\xa0\xaaj\x06\xe5eU\x05\
-\xb1\xecF\xa3=\xf4\xf6v\x95\x82\xe2\x03\xd8\xe2\xf88\
-3\xdc\xbc\xf6Y\xaf\x05)\x14{\x95\x02\x04X\xb8\xf4\
-\x92\xc3|\xb6<B\x119K\x8fEYY%\x15\x15\
-\xd5\x9eg!Q\x85x\xac\x97H\xb4\x97h\xa4\x97h\
-\xac\x9bH\xa47Y\x01\xae\xc8,\xcb\x81@\x90P(\
-\xf9\xbeUTLeJE5\xd68R\xeb\x8f\x0b\xd5\
-d\x12\x86\xbe\xaeb\xde\xe3\x1b\xcek\xa8}\xc6\x86\x0d\
-\xbf|\xd5kA\x0a\xc9^\xa7\x00\x01\x16/\xbed\x7f\
-E~\x07\x9c\xe4\xb5,\xd9\x22\x02\x81`\x05\x15\xe5\xd5\
-\x04\x02#\x0b\x7f{\x89\xaa\x12\x8fG\x89'\xa2$\xe2\
-1\x12\xf1(\xb1D\x94D\x22F<\x1eI\x1eK\xc4\
-q\x1c;g\xd6N\xcb\xb2\xf0\xf9\x02\xf8\xfd!\x82\xa1\
-2\x02\x812B\x812\x82\xa1\x0a\xca\xca*=IT\
-\xeb86}}\xbb\x89Dv\x17\x9b\x13\xf3X<\xe3\
-\xf79\x1fin\xbek\xb3\xd7\x82\x14\x9a\xbdR\x01\x02\
-\x9cu\xd6\xf2)\xbd\x11\xeeF\xbd)\xb24\x11|\xbe\
-\x00eeS(/\xaf,hdI.H\xa6\xacJ\
-\xa6\x99r\x1c\x1b\xdb\xb1q\xec\xcc5:\x92e,}\
-\x03\x8f>_2\xe5X\xb1\xa4\xa3WM&&\x8dD\
-v\x13\x8b\xf5N\xa8\x08\xbcG\xfcQ\x9d@\xc9Tq\
-\xcb5{\xad\x02\x04X\xb6l\x99o\xcb\x96\xf2\x1f(\
-\xfau\xafe\x19/\xa1P\x05eeU\x04\x8b\xa4Z\
-\xdd\xde\x82m\xdbD\xa3\xdd\xf4E\xbaqJg\x99;\
-\x14\xe1V\xbf\xf5\xe6\xd7\x9a\x9b\x9bK\xf4\x05L\x9c\xbd\
-Z\x01\xf6\xb3h\xc9%\xdf@\xe5{\x94pz0\x9f\
-\xcfOYh\x0a\xa1\xb2)\x9e\xef\x15NV\x92Y~\
-z\x89F{\x88\xc7#\xa58\xdb\xebG\x11\xb9~C\
-\xcb\x9aF\xaf\x05\xf1\x1a\xa3\x00S,^|\xc9'\x14\
-\xf9\x05E\x1a5\xe2\x06\xbf?@(XA\xb0\xac\x12\
-\x7f\xa16\xfe')\xaa\x9a\xcc,\x1d\xed&\x1e\x8bL\
-\x06\xb7\xa0nA\x97\xb7\xb6\xde\xf9[\xaf\x05)\x06\x8c\
-\x02\x1c\xc4\xc2\xa5\x9f}\x8f\xcf\xb6\xff\x178\xcakY\
-r\x85\xdf\x1f$\x18\xaa \x14(\xc3\xe7\x0f\x15E%\
-\xb3b\xc7\xb6\x13\xc4c}\xc4b\x11b\xf1\xbe\xc9\xa0\
-\xf4R\xc8K\x8eO?\xbe7\xb9\xb9\x8c\x85\xf9:\x0c\
-\xa3\xb6\xf6sUX\xf1\x9f\x0b|\xc2kYr\x8d%\
-\x16\x81`\x19\xc1@\x19\x81`\x85gE\x9c\x8a\x0f%\
-\x1e\x8f\x11\x8b\xf5\x0d\xd4\x0c\x99t\x08\xbf\xf3[\xbeK\
-\x9b\x9b\xef\xe8\xf0Z\x94b\xc2(\xc0\xf4\xc8\xa2E\x97\
-\x5c\x8d\xc8\x0dL\x92\xac\xd9\xc3\x11\x01\x9f/H\xc0\x1f\
-\xc2\x1f\x0c\x11\xf0\x87\xf0\xed%\xcb\xe5~\xb7\x9dD<\
-\x92T|\x89\x08\xa5\xbc\xa17\x066\x22+6\xb4\x1c\
-r=4\x96\x94oN!0\x0ap\x14\x16/^~\
-6p\x97\x16A\x9a\xfdB`Y~\x02\x81\x10\x81@\
-\x08\xbf?Y\xf4\xdd\x8bp\xbc\x5c\xa2\x0a\xb6\x1d'a\
-'\xfd\x13\xe3\xf1\xe8\xe4\x9c\xe1\xa5g\xbbZzQ\xdb\
-\xa3w>\xec\xb5 \xc5\x8aQ\x80c\xb0t\xe9g\xf7\
-K\xd8\xf6\xcf\x81\x0fy-\x8b\x17X\x96\x8f\x80?\x88\
-\xcf\x1f\xc4\xe7\x0f\xe0\xf7\x05\xb0,\xbfg\xe1y\xa3a\
-'\xe2$\x9c\x04v\x22\x86\x9d\x88\x13O\xc4q\x9c\xd8\
-$\x9e\xdceF\xe1\xcfNB.mo_\xf3\x96\xd7\
-\xb2\x143F\x01f\x87,Zr\xc9\x95\xa8\xdc\x08\x14\
-\xbe\xf0o\x11\x22b\xe1\xf3\xf9\xb1,\x1f~\x9f\x1f\xcb\
-\xe7\xc7\x12_\xb2\xa0\xb8e%\xcf[>&nu\xd1\
-T\x01sgO\xdd_M:O\xdbN\x22\xf9h\xdb\
-%\x1b\xa3\x9c\x07\xe2\x88\xac4K\xde\xec0\x0a\xd0\x05\
-5K\x97\x1fk\xd9\xf2K\xd0\xe3\xbc\x96\xa5T\x10\x11\
-D|\x03\x89\x07\x06?\xf6?We DN\x07\x15\
-:\xcfe\xe8\xdc^\x81\xf2O\x11\xbd\xb8\xb5\xf5\xce\xa7\
-\xbc\x16\xa5T0\x0a\xd0%\x0b\x17.+\xf7\x05\xcaV\
-\xa1\x5c\x81y\xff\x0c\xc5\xc3\xda\x8ar\xbe\xf2\xd0Ck\
-\xf7\xbe\x84\x8e\x13\xc0|\x81\xc7\xc9\xe2\xc5\xcb?\xa0\xc8\
-m\xa0\x87{-\x8ba\xaf\xe65\x81\xaf\xb4\xb6\xae\xfd\
-\xa3\xd7\x82\x94\x22\x93\xd2\xc5\xa3\x10\xbc\xf1\xc6\xdf^\x9f\
-3\xe7\x88\xdb-_\xc0\x0f,\xa4\x84\xc3\xe8\x0c%\x89\
-\x83p\x9b\xdf\x179\xbf\xa5\xe5\xeeIU\xaa\xb2\x90\x98\
-\x19`\x0e\xa8\xa9\xf9\xec\x09\x96\xcf\xbe\x9d\x12J\xafe\
-(i\xfe&\xc8\x17[[\xd7<\xee\xb5 \xa5\x8e\x99\
-\x01\xe6\x807\xdf|z\xcb\xacY\x0b~\x1e\xf0'\xa2\
-\x08\x0b\x01\x93\x8d\xc0\x90\x0fz\x11\xf9\x8f\xbe\xde\xf2\xcb\
-6n\xfc\xd9\x9b^\x0b3\x1903\xc0\x1c\xb3t\xe9\
-\xc5s\x13\xb6\xb5\x12\xb8\x04\xf3\xfe\x1ar\xc7\xef\xfd>\
-\xdf\x15\xcd\xcdwl\xf2Z\x90\xc9\x84\xf9\x82\xe6\x89\xc5\
-\x8b/=E\x85\x1f\xa2\xba\xc0kY\x0c%\xcdSj\
-\xe97\xdb\x1e\xbd\xb3\xd5kA&#F\x01\xe6\x17Y\
-\xb4\xe8\x92\xe5\x88\xac\x06\xf6\xf3Z\x18CI\xf1\x0eJ\
-\xe3\xfe\xfbG~\xban\xdd\xba\xe2*\xb82\x890\x0a\
-\xb0\x00\x9cz\xea\xc5\xd5\xc1\xa0|K\x91o\x02U^\
-\xcbc(j\xba\x14~\x80\x13\xb8ioMS_H\
-\x8c\x02, \xa7|\xf0\xd2\x19\xc18W\xa0\xfa\xaf@\
-\xb5\xd7\xf2\x18\x8a\x8a\x1e\x84\x9f\xc6\xa3\x89\x95\x8f=v\
-\xf7V\xaf\x85\xd9[0\x0a\xd0\x03\x96.\xbdpf\xc2\
-\x09|\x0b\xd5+\x81r\xaf\xe51xJ\x14\xe1\x17~\
-\xcb\xf7\x9f\xcd\xcdwl\xf1Z\x98\xbd\x0d\xa3\x00=\xa4\
-\xb6\xf6\xd3\x07`\x05\xea\x04>\xc7$H\xc5opE\
-7*?\x15qV\xb7\xb6\xde\xf9\x8e\xd7\xc2\xec\xad\x18\
-\x05X\x04\x9cz\xea\xc5\xd5\x81\x90\x5c\x06\xf2m\x949\
-^\xcbc\xc8+\xdb\x10\xb9%\x16\xe0\xe6\xc7\xff\xb4f\
-\x87\xd7\xc2\xec\xed\x18\x05XD\x1cs\xcc\xb2\xe0\xf4\xe9\
-\xa1O#r5p\x8c\xd7\xf2\x18r\x89\xbc\x848?\
-\xb2\xe3\xd1[\xdb\xdb\xd7\xf5y-\x8d!\x89Q\x80\xc5\
-\x89,^|\xc99*|\x0d\x95\xb31q\xc6\xa5\x8a\
--\xf0GG\xf8Q[\xcb\xda\x07\x18H\xf4e(\x16\
-\x8c\x02,rjk?}\x80\x88\x7f9\x22_\x02\x0e\
-\xf6Z\x1eC\x16\x08o\x81\xdc\xe9\xb7\xac\x1f\x9b\xc8\x8d\
-\xe2\xc6(\xc0\x92\xa1\xd1Z\xb4\xe8\xd5\xd3\xb1\xf4r\x94\
-\xf30\xf1\xc6\xc5\x86\x0d\xacG\xb9\xd5\xef\x7f\xf3\xde\xe6\
-\xe6f\x93\xa2\xba\x040\x0a\xb0\x04\xa9\xa9Y\xbe\xaf\xe5\
-g\x99\xaa^ \xc8\x22\xcc\x12\xd9+\x1c\xa0\x15\x95{\
-\x1cG\x7f\x1d\x0e\xaf\xdd\xe6\xb5@\x06w\x18\x05X\xe2\
-,]z\xe1\xccD\xc2\xffqD/\x05\xa9\xc1|\xa6\
-\x85\xe0ID\xd7\xaa\x9dX\xd7\xd6\xf6?o{-\x8c\
-a\xfc\x98/\xcb$b\xc9\x92\xcb\xe6\xd9\x9a\xf8\x84(\
-\xe7 ,\x06\xca\xbc\x96i\x92\x10\x11\xb4E\x85\xfb\xfd\
-\x96\xfe\xa6\xb9\xf9\xae\xcd^\x0bd\xc8\x0dF\x01NR\
-\x16.\x5cV\xee\xf3\x95\xd7bq\x06\xaa\xe7\x02G{\
--S\x89\xf1*\xc2#8<\xa2\x1ax\xd0\xc4\xe5N\
-N\x8c\x02\xdcKX\xb2\xe4\xa2\xc3\x1d|g\xa1R\x0b\
-\xba\x08\x98\xe7\xb5LE\xc6\x1b(\x1b@\xdal\xbf\xf3\
-P{\xf3\x9d/{-\x90!\xff\x18\x05\xb8\x97\x92t\
-\xaf\x09\x9c\x84%\xb5\xa8\xb3\x08\xe4\x14\xf6\x1e\xcb\xb2\x0d\
-\xbc\x80\xb0\x01G\xdb,KZ[Z\xd6\xbe\xe6\xb5P\
-\x86\xc2c\x14\xa0\x01HF\xa1L\x9bVq\xb8\x88}\
-\x12\x96u4\xaa\xc7\xa0\xbc\x1fa\xb6\xd7\xb2M\x90\x0e\
-\xd0\xe7\x10y\x0e\xf4\x1f8\xd6\x93~\x7f\xdf\xd3\xcd\xcd\
-\xeb\xba\xbd\x16\xcc\xe0=F\x01\x1aFe\xe9\xd2\x8b\xe7\
-&\x12r\xac\x0a\x87\x89\xca|\xe0`\x84\xf9\xc0|`\
-\x1f\x0fE\x1b\xccN`\x93\xc2k\xa2l\xc2\xe25Q\
-^N$\xe4\xd9\xf6\xf65oy-\x9c\xa1x1\x0a\
-\xd00n\xce8c\xd9\xd4H$4_-\x99#\x0e\
-3T\x98!\xca\x0cDf\x803\x0b\x95\x19\x08\xd5\x02\
-S5\xe9\xab\x18\x00*S\xcd\xab\x00\x7f\xeay\x02\xe8\
-72t\x03q\x01G\xa1\x13\xa5\x0b\x8b\xed\xa8lG\
-u\x87\x0a;D\xd9\xa1\x16;\xc4\xd1\xb7\xe2q}\xed\
-\xb1\xc7\xee\xea*\xec+7\x18\x0c\x06\x83\xc1`0\x18\
-\x0c\x06\x83\xc1`0\x18\x0c\x06\x83\xc1`0\x18\x0c\x06\
-\x83\xc1`0\x18\x0c\x06\x83\xc1`0\x18\x0c\x06\x83\xc1\
-`0\x18\x0c\x06\x83\xc1`0\x18\x0c\x06\x83\xc1`0\
-\x18\x0c\x06\x83\xc1`0\x18\x0c\x06\x83\xc1`0\x18\x0c\
-\x06\x83\xc1`0\x18\x0c\x06\x83\xc1`0\x18\x0c\x06\x83\
-\xc1`0\x18\x0c\x06\x83\xc1`0\x18\x0c\x06\x83\xc1`\
-0\x18\x0c\x06\x83\xc1`0\x18\x0c\x06\x83\xc1`0\x18\
-\x0c\x86\xc9\x85x-\x80\xc1`(N\xb4q\xbd\x9f\x88\
-\xbf\x0aG\xca\xb1\xb4\x0c+P\x89C\x00+Q\x8d\xe3\
-\xf3\x81N\x07\xb1@\xa7b\x11\xc0\xd1JDB\x88T\
-\xa0\x94\x83\xae\x97\xa6\x9a\xdfz\xfd:F\xc3\xef\xb5\x00\
-\x06\x83\xa1H\x89\x94-Bt=\xbe\xd4\xdf\xea$\xa7\
-Lj\x81h\xff\xc1=\x0f\x92\x9aO\xe9\xc0\xb9n\xa0\
-\xa8\x15\xa0\xe5\xb5\x00\x06\x83\xc1\xe0\x15~\xadk\xbb&\
-g\xbd\x09}\xa8D\xb0\xb4\x17G\xa2\xa8\xf5\x0e\xca&\
-^{\xe3\x1dYw\x81\x9d\xb3q<B\xbf\xf5\xcc\x14\
-\xfc\xdd_\x9fpG\x16\x09\x1c\xd9\x8d\xa5]\x88\xd5\x83\
-j/\x8e\xd5\x81\xcf\xd9\x227\xd4\xbc\x95\x03Q\x0d\x06\
-C\x16\xf8\x11Y\x95\xd3\x1e\x05PI>\x8a\x93<v\
-\xd8\xdc\xb8\xd6\x85_E\xa4\x05\xd1fH\xac\x97\x95K\
-\xde\xc9\xe9\xb8\x85@\xa2U9y\xbf\x94=\xefS\xff\
-rA\x1cp@\xeb\xc3\x11\xe0E\x90'\x81\xbf\xe0\xb3\
-\xff,+\x16\xbd0\xe11\x0d\x06\xc3\x08\x0a\xb5\x07\x18\
-@8\x12\xf4H\x94/\x82\xdf\xd1\xfa\xb6?\xa1\xf2=\
-YU\xf3`\x81d(\x15\xca\x80\xf7\x82\xbe\x17\xb8\x0c\
-\xdbB\xeb\xc3\xaf\x80\xfe\x06\x9f\xfe\xcc(C\x83!w\
-x\xb5\x07h\x81\x9c\x89\xf0\x80\xd6\x87\x1f\xd6\xba\xf6\xf9\
-\x1e\xc9Q*\x1c\x0ar5\xb6\xf5O\xado{H\xeb\
-\xdb\x16z-\x90a/\xa0,\xb2\x018\x0aqN\x07\
-\xbd\x14\xb8\xc9k\x91r\x8dh}X\xc7\xbe,\xef\xec\
-\x00\xf9\x984-l\xf3Z\x90\xd1\xd0o?\xbe\x1f\xfe\
-Dq,\xdd\x85u`]!+\x17l\xf5Z\x14\xc3\
-\xde\x81\xd6?v\x04\xd8.V \xbaR\x9aj\xaf\xcd\
-\x9fD\x13\xa7X\xac\xc03@\xef\xd7\x86\xb6c\xbd\x16\
-\xa4dP\x96\xa1\xces\xda\x10>\xdbkQ\x0c\x86R\
-\xc5\x02V\x01k\x81f\xd0\x17\x01\xc7e\x1f\xbd\xc0.\
-\xa0k\x82\xb2T\xa3\xd6\x9dz\xf9\x13\x81\x09\xf6\x93?\
-$\xd6\x03z\x0b\xc2}(a\xe0U\x06\x1c\xa1\xb2\xa6\
-\x87\xe4\xfb\x95\x0b\xab\xf8\x0c\x94\xdfk]\xf8\xf2\x1c\xf4\
-e0\xecu\x8c\x88\x04\xd1\xfa\xf0[\xc0\x01.\xfa\xf8\
-\xb24\xd5\xfc\x04@\x1b\x9f\xa8 \x12=\x06K\xceG\
-\xb9\x12\x98\xe2Z\x22\xe5\xf3\xb2\xaa\xe6g\xae\xdby\x84\
-\xd6\x87w\x00\xfbd\xdfB>+M\x0b\x7f\x01)O\
-\xfbh\xe80T\x8fAd\x01p\x11\xee\xde\xfb\x011\
-@?#M\xb5k\xc7\xd1\xd6`\xc8\x8a\xc9\xb8\x04\xce\
-\xa9\x15X\x1aO\xee\x05\xfe\x02\xfcE\xaf\xdb\xf8sl\
-\xa7\x15\x98\xed\xae\x13\xbe\x0a\x94\x8c\x02\x9c\x08\xd2xZ\
-\x02\xf8g\xea\xdfot\xd9=u\x1c6\xf7\x5c\xe0\xbb\
-\xc0an\xba\x02\xf9\xa9^\x1b~En\xa8\x09\xe7C\
-V\x83a2\x92\xb7=@Y\xb1\xe0%\xd0\xf18\x0d\
-\x9f\xa8Wo\x18\xcf,\xa8\xe4\x91u\x17\xd8\xd2T\xf3\
-[l\xe7D\x94\x07\x5c6\x0f\xe0\xb0F\xaf\xdeP\x95\
-\x17\xe1\x0c\x86IH~\x8d /\xbfu/\xb0\xc5e\
-+!\xe0;)\x1f\xe2\x94\x0ar\xe3\xa2\xdd\x94E?\
-\x0e\xb4\xbblz(~\xc9]d\x8f\xc10\xc9\xc9\xab\
-\x02\x94u\x17\xd8\x88\xeb/1\xa8\xab\xe5\xdf\xa4D\x1a\
-O\x8b\xa0\xf6%@\xc4UC\x95o\xe8\xb7\xda\xf6\xcd\
-\x8fT\x06\xc3\xe4\x22\xff\x91 \x8e\xbc\xba'sD\xd6\
-\x8d\xa6\xe6E\x96\x12CV-~U\xeb\xc2?A\xf8\
-\x86\x8bf\x95\x04\xe4s$\xad\xfb\xae\xd0F\xb5\x88l\
-\x98J\xbc\xdcG\xa0\xaf\x1a\x09\xfaQ\xad\xa2\xac\xef\x15\
-i<\xadc\xc4\xf5u\xad\x87\x80\xff,,}\x1f0\
-\x0b\xb0@\xdfEy\x1c[\xff 7.z\xdb\xb5\x0c\
-\xa8p]\xdb\x11$\xe4X\x90\xa3\xb1\x98\x8bR\x09T\
-\xa0\x84\xb0\xe8F\xa5\x1bt\x07*/ <OD\x9f\
-\x92\xef\xd7\xf4\xb9\x1d\xcb\x95\x5c\x0d\x1bgc\xdb\x0b\x10\
-\xebX,g>\xc8T\x94*\xa0\x17\xd1\x9d8\xb2\x0b\
-\xf8'\xe2\xdb M\xa7\xbe\x98\xd3\xb1Q\xa1n\xc34\
-|\xbe\x0a\xc4\xaa \x1e\xaf\x90\xd5\x8b\x9f\x19w?N\
-`\x0a>\xa9@\xb5\x0a+QM\xac\xeaq\xb9\xe9\xf8\
-\x9e\x5c\xca\x9c\x0b\xf4\x9a'\xa6B\xf4x\xc4:\x1a\xe1\
-(\xd0)\x08\xd5(\xd5$\xbd)\xa2\x08\x9d8\xba\x09\
-\x91\x17PyZV-\xdc\xe4f\x8c\x02\x84\xc2i\xe7\
-8\x1a\xf9\x01\xb4>\xfcc\xe0K9\x12\xe4G\xd2T\
-\xf3u\x00\xadk\xff\x02\xa2\xb7\xb9jmQ\xeb\x89\x81\
-\xc1o\xfd\x08\xdb\xb9\x12W\xb9\x1b\xf52\x86)@m\
-h\xbf\x00\xd5/\x02\xd3R}MO=N\x1bx\x8c\
-\xb6\x83\xf8 \x18\x03|\x80\x9d<\x13\x0b.\x07\xee\x1c\
-\xe8\xeb\xba\xb6C\xb1\xf9\x1e\xc8G@\xad\xa1\x8e@\x02\
-\xf0\x05|\x12\xd5\xfa\xf0-tw\xd4\xc9\xcd\xe7D\xc7\
-\x94\xb8a\xe3{Q\xfd<\xb4\x9f\x87m\x1d8\xf0j\
-\x07\xf7-\xfd\x7f\xf7\xc7O\xa7\x1e\xcb\xe8\xd6\x86\xf0\x03\
-\xa8s\x874-\xba?\x8b7(+\xb41\xbc\x0fQ\
->\x07|\x1auN\xc2J\x09\xa0\xc3>\x8a\xfe\xd8w\
-\x00\xec\xa4'\x85\xca-\x94\xe9-\xd2X\xb33c\xff\
-\x0dm+@f\xe1H\x05\xa2\x15@5P\x05T\x90\
-\xf4\xa0\x98\x9a|\xde^\x0e\xbe\x94\x83\x9a\x03\x96o\x07\
-0sH_u\xe1\xf3\x11\xceO\xe6\xe2\xd3\xa9\xa8T\
-\xa6\xfa\xac\x1c\xd1\x8f/\xe5\xe9\xd6\x9f\xda\xca\xb7\xfbX\
-\xe0\xb9\x89\xbcW\xb9B\x1b\xd7\x97\x11\x0d.\x07\x96A\
-l)H`\xc8M0|.58\x0d\x97(Z\x1f\
-\xfe;*\xbf!\x1e\xf8\x91\xfc\xd7\xc9\xdb\xc7\x1a\xaf8\
-\xf3\x01:\xec\xf6Z\x84bAV,xI\xeb\xc3\x7f\
-\x05Nt\xd1\xea\x08\xbd\xba\xfd(\xb9q\xe1\xf3\x03\x87\
-\x94\xf9\xc0\x19\xe3\x12Be\xe0\xcb\xa6\xd7\xb6\x9f\x8b\xad\
-w3\xb6\x8bS\x08\xf8&USO\xd6+\xee?#\
-\x93\x12LF\xd7\xc4oB\x9d\x0b\x19\xff\x96L%\xca\
-2\xb0\x96i}\xf8\x11l\xb9r\xc8kw\x896\xae\
-\xaf$\x1a\xac'\xca7I*#\xb7\xccAt\x05Q\
-\xae\xd1\x86\xb6\xaf\xca\xca\xda;\xd3^\xa5\xf2o@\xb9\
-\xfb\x15R\x1a\x84S\x80\xe5{\x92\xe53\xbdv\x00\x00\
-\x14)IDATk\x14C\x80\x97;\xb4!|\x11\
-Q\x9a\x80\x03'\xd0\xcdq\x88\x1eG0\xf6Mmh\
-\xbf\x9e\xe0\x82\x1fJ\xa3d\xf4m\xce\x7f$\x88\xb8\xf1\
-\x91KaaRB\x0d\xe5\xcf\xae[X| w\xc3\
-\xeb,\x00m\xd8x&\x8e\xfe/n\xfc;U\x16Q\
-9\xf5\xbbiO]\xd3z<\xfe\xf8\xe3 \x17\x93\xbb\
-{\xf1\x0c|\xfa\x98\xd6\xb5\x9d>\x9e\xc6zm\xf8\x14\
-\xa2\xa1\xbf\x8140>\xe57\x98*T\xd6j]\xf8\
-\xc6\x09\xf63\xa9\xd1e\xf7\xf8\xb4.\xfc\x03\x94\xbb\x98\
-\x98\xf2\x1b\xcc4T\xbfG\xb4}\xddh\xc1\x15\x85\x08\
-\x85;n\x1cm\x9e\xcd\xb9\x14\xa5\x8c\xca\x13\xe3hU\
-\x9b;\x01\xacYZ\xd7:\x1du\xeeb\x5c\xab\x06\xf9\
-\x92^\xfb\xf8\xbc\xc1G\xb4\xbee\x16\x96\xef\x01\x90y\
-\xe9\xdb\xe8]\x88\x5c\x86\xc8\xa7P\xae@\xb8\x97\xec\xa3\
-g\xaa\x10\xb97\xe9\xb8\x9b=Z\x1f>\x0f\x87\x16\xe0\
-\xe0,\x9b\xec\x00\x9a\x81{\x80\xd6\x8c\xf2\x09\xdf\xd6\xfa\
-p\xae\xb6r&\x1f\x87\xcem\x18e\x9f{\x13\xaau\
-\x88^\x08\xf2Y\x84&`\x93\x8b\xde?\xce\x8c\xe8\x0f\
-3\x9d\xcc\xeb\x12X\x1b7V\x13u\x16\xb8j$\xba\
-\x9d\x97\xde\xfa{\x9eD*M,y~O\x9a\xf1,\
-\x11u\xf5\xe5\x1f\x1d\x9d\x85\xe5_\x81&g\x82\xe3 \
-\x88\xc6/\x00\xfekO\x97\x81\xef!\xba\x7f\xda\xab\x85\
-\xfbde\xed%\xc3\x8e\xfe\xb7^\x1b\xae\xc1\xe1A\x92\
-\xfbdcQ\x0d\xf6-\xc0\x07\xb3\x11P\x1b\xc2g\xa3\
-\xdc\x03d\x13\x8a\x19\x03\xa9'\xa2\xb7\x0c6\xbehC\
-\xdb\xb1\xa8\xb4\x90\xdc_\x1d\xceMZ\xdf\xf2\xbf\xd2\xb4\
-\xe4\xddl\xe4\xd9[\xd0\xab\xdb\x8fB\xf4?2^\xe0\
-\xd8\xe7\x0d7\xf8\xe8\xbf\x86\xbfC\x19?\x05.\xccn\
-\x14\xf9\xb2\xd6o\xb8[\x9a\x16\xb5\x0e?\x93\xdf\x19`\
-D\xaf\xc0m8\x9cZ\xf7\x0ed\x8fVn\xc2\x92\x8f\
-\x02_\x00\xfe\xe6vtT\xbf\x86\xe8\x85\x08\x1f\xc2\xe7\
-\xdb\xf3\xe5\x8b\x07~\x8bXg!\xf2)\xe0\xcb\xa4\xf7\
-U\x8c\x83~\x03\xe5\x22\x843\x08D\xdd\x8e\x9fK\xdc\
-g|\x11=d\xe8\x01\xa7\x15\xf4f\x94\xdf\x01\x7f\x07\
-W\xfb\xac\xa7\xa3:h\x06\xa3/\xa24 |\x06\xe4\
-\x7f\xb2\xeaAY2\xf0\xb41\xbc\x0f\xa2\xcb2_\xab\
-i\xad\xc7rCM8\xb5o\x96-\xa7\xeb\xb5\xe1\x9a\
-1E\xbb\xee\xb1\x83](?\x05>%M\x0b\xbf7\
-\xdc\xf2,+k\x9fE\xf47\x19\xdaUB\xe0\xcaa\
-=}\x1d\x91\xd5\xc0\xaf\x81\x11VvW\x88\xacC\xe5\
-:\xe0\x17\xc0k\x13\xea\xab\x90\xf8\x9c/0\xdaD\xcc\
-\x1ay/\xc8\xf7k\xfa\xe8\xee\xb8\x8c\xec_\xa7\x80\x95\
-6$/o3@\xadk_:\xaaf\xcf\xd0\x0c\xc7\
-\x1e\x98\xae\xca\xaa\x9a\x97\x81\x97\x01\xb4\xbe\xcd\x02\xb9\xd5\
-E_e\x88\xafYV.\xf8\xc7\xf0\x13)\xeb\xd0\xc3\
-\x00\xda\xd0\xb2?\xea\xff\xd1\x88\xd6\xc2\xfd\xb2\xb2\xf6\xff\
-\xb8\x94??\xf49]\x94\xb9l\xa32S\x1b\xd7\xfb\
-S\xe1vHSm;\x83\x1c\xab\xb5\xbem9\xc8\x9a\
-,{\xab\x1e\xf4\xfcnB\xb1K\xfb\xfb\xd5e\xf7\xdc\
-\xc5as\xff\x85\xa4\xa5q\x14\xac\x83\x06\x9eFYB\
-\xd2H\x92\x01\xf9\x8a\xd6\x87\xbf\x92|*\x9f\x92\x95\x0b\
-\xef\x198UV\xbd\x86h\xe7Mc\x8f\x97B\xe5b\
-`t\xeb\xbdm\xff\x8c\xa1\xafq4\xd6\x8cZ\xe9\xcc\
-\x91]\x99\xed\xf5\xfa1\xe0\xdf\xfb\xff\x1a\x1c\xf3\xae\xf5\
-\xed\x7f\x06=-K\x19F +\x17>\x05<\x05\xa0\
-\x0dm\x8d\xa8\xfc\xe7x\xfb*,2\x86a\xce\xbfM\
-\xeb\xc3\x00\xcfIS\xcd@\xb6(\xb9\xf9\x9c\xa8\xd6\x87\
-o\x05\x9a\xb2\x1c\xe8\x0cm\xd88{x\xfa\xb8\x9c\xcf\
-\x00\xf5\xaa'fjC[#\xa2\x0f\x01AW\x8dE\
-\x7f*\xab\x17\xa57\xc7\xab\xf3k \xe6R\x9a\x8f\x8c\
-}M\xe0\xd30P\xf7j\x0f\x8e\x16Mb\x81\xd4L\
-\xc3\xe5k\x07\xfa\xaa\xdc'\xa3\x18\x15}\x91\xee\x8e\xcb\
-\xfa\x95\x1f\x00G\x1ex\x08Y}\xce\xbagY(\x99\
-\xf6\xfd\xd25\x1b\xba\x87,\x8d\xc7\xc4R\x99x\xb2l\
-\xaf\xa3\x1aC\xb4>|\x1e\xb04ki\xd4\xbe~\xc4\
-\xc1\x86\xb6\x13\xb4>\xfc\x8a\xd6\x87_A\xf8\xf2(\xed\
-\x8fM\xfa\xb6\x19\x06\x91\xed\xbd\xf0\x9e\x11\xc6\x0c\xcbi\
-v1\x8e\x0f\xc7Y2\xfc`.f\x80\xe7k]\xf8\
-\xd0\x94\xb5\xf7h\x88\x9d\x88\xca(\xbf\xee\x99\xd0\x17\x09\
-\xc6\xbe\x9d\xe9\xac\xacZ\xbcK\xeb\xc3\x0f\x01Y(\xb5\
-\xfeF\xfaa`t\x0b\x9c\xea\xa7\xd3\x1c\xddEO\xe7\
-\xef\xb3\x1e\xa70t\x92t6\xce\x1e\x7f\xac2\xd5.\
-7\x08\xdf\xe9wg\xd1\xbap=\xc2W\xb1\x9d\xb9Y\
-\xb6\xee\x1e,Y\xf6c\xea\xc8\xa8\x16\xc1\x8d\x83\xf5\x11\
-\xba\xec\x1e_\xc6\xa2\x5c*\xd7d\xed2\xa2\xb4\xcb\xaa\
-\xc5\xaf\xa6\xe9\xe3$\xe0\x90\x91\x0dF X\xf6lr\
-\xf9\x99\x94>\xd9\xa6\xbf\xf31\xd5\x99\xc1\xe0\xed\xaa\x04\
-o\xbb\x9a\xc2\x09G\x0d?\x94\x8b\x19\xe0\xd9\x08\xdf\x06\
->\x0f,d\xd4\xa5MF\xde\xc2\xe7\xfbH\xbah\x83\
-!\x08w\xbb\xeaU\xa9\xd5\xfa\xc7fd<]\xd7z\
-\x08\xf0\xfe4\xa7\xee\xc9\xc6y\xb7\xc0\xb8\x97G\xad\xc4\
-\xd8\x17eM\x0f}\xb2g\x7fK8\x19\xc8V\xf9\x81\
-\xf2\xfa\x9e?\x9c\xec#%T\xd3\xdc\x13\xba#\xeb\xf6\
-`q\xd8~i]\xb1\xf4\x9a\xf0q\x88fo\xa4\x13\
-\x1eI\x7f\x22\x831'm\x1f\xeav3c\xb2\x93m\
-z-\x9b)\xd6\xd0\x9c\xa3v\x95\x9b\xfb\x00\xd2L \
-\x8a!#\xf4_\xb1\xb46\x99=f\x0cbS\xee#\
-\x19\x02\x93->$qf\xe6\xd3\xfe\x0bI\x1ba!\
-E\xb3\xfc\x1d\x84\xfb\xe5l\xac\xbc{\xec\x8b\xb2f\xe3\
-\xd0M\x7f\xdd\xe4\xaa\xb5H\xf3\xc0\xf3>\xf93\xa2c\
-z\xe9\xa7\xda\x8d\xf4\x81T2FW\xa4'\x98~\xe6\
-,\xf2qW\xdd8\xfaT\x86~\xb25()N\xfc\
-MWcNvT\xd7ew\x1d\x8f\xa5\xd2\xed\x0d\x90\
-\x0a\xdfs\xb15$3\x87\x1f\xf1R\x01\xf6!z\x03\
-\xdd\x1d\x0b\xe5\x86\xda\xd7\xc7\xbe\xbc\xff\x05\xab\xbb\xa5\xa9\
-c}8s\x87i\x97\xbf\x9bhZP\x8c9\xf5\xdc\
-*@\x87\x9b\xde\xdb;\xf6eY\xa2\xf2\xf4\x90\xbf-\
-\xab\xd9E\xeb>\xe2\xce\x1d\xfd\x7f\xc8\xf7k\xfaP\xb2\
-\xb1\xe6\xfe\x99\x95\x0b\x1f\x1aqT\xc4e6mM\xef\
-6c9\xee\x22c\xd4J?sUg\xec\x1f\xef$\
-O\xc8\xaa\xc5\xbb\x5c\x8d9\xd9)\x0b\xdd\xcc\xd8ax\
-\x09\x90L\x89U\xdd\xacrF\x18\xba\xbcP\x80\x1d\xa8\
-\xfc\x17\x96\xffHYY{\x9d\xeb\xa5\xa6\xe3r\x19,\
-z\x8e.\xbbg\x84\x91C\xaf\x09\x1f\x07\x8c\xacA\x22\
-\xfa\x0b)\xb28\xa2\xd4\xe6\xaf;\x83\x12l\xcb\xe9\xeb\
-\xb0\x18\xfa#\xf5n\xe0A\x84,\xc3\xcd\xb4Nn\xaa\
-\xdd6\xf8H2{\xb5^\x9aa&h\x03\xbf d\
-\x9d\x9f\x93\xd7`\xd9#3\x9f/\xbb\xc7\x87\xca\xfb\x5c\
-\xf5#\x81\xf4{\x8f\x11k=I\xa7\xe8\xd1Q]\xed\
-j\xbc\xbd\x00i<\xb9\x17\xb1>\x08d\x9a\xd8l\x02\
-\xe7c\xb2jas>\xc6/D,\xb0\x03\xbc\x88\xca\
-\x1f\xc0\xb9\x9f\x9d\xa1V\xb9\xf5\xe4\xf8\xb8{+\x9f\xf6\
-\x00\xd1\xce\x9dd\x9f\x86~\x1f\x0e\x9b\xb7\x00\x18Zq\
-\xce\xd2O\xa7]\xfd\xaa\xff\x97\xe3\x96-_\xccL\xec\
-\xe3\xba\xf2\x88\x90\xd3\x8c$8C\x97\x9dr\xeb\xc9q\
-\xad\xdf\xf8Ip\x1e&s\x1a\xff8\xc8u\xd2T\x93\
-\xd6\x9dH\x9aj\xd7j\xe3\xfau\xc4\xca\x17\x83s\x04\
-\xe0\xc7\x91-X\xf1\x16Y\xb9$\xbf\xd5\xf7\x0e?p\
-&\xea\xb8\x99U\xc7e\xf5\xc9i\x8d\x17\xf2\xfd\x9a>\
-\xadk\xff\x1a\xa2\xbf$\xe3\xa4Bo\x96U\xb5\x99|\
-\x04\xf7jR\xae)\xe7j]\xf80,jP\xf6\x05\
-\xed\xc4\x92\xe7\x08D\x1f\x1f\xe2u\x90cr\xa1\x00\x9f\
-Dx\x15\xa5\x0b\xe8C\xa4\x07t\x07\x0e\x9bP\xfbE\
-\xca\x13/H\xe3i\xeer\xda\x8d\x824\x1e\x13\xd3\xfa\
-\xf6\xfbR\x19O\xb2l\xa4\x1ff\xb8\x02D.\x18q\
-\x9d\x12\x96U\xb9Me\x94\x13l\xfb\xc8d&\x127\
-hn_\x870\x22\xdd\x944-\xf8\x87^\xf3\xc4\xd1\
-H\xf4\xcb\x88u6\xe8<\xa0\x0c\x95\xcd\xa0\xad\xf8\xf5\
-'\xb2\xa2\xe6\x95Q\xbbM\xde\x1b\x0f\xa7\xfe\x15\x0e%\
-\xa3q,\x03\xa3\xde\xc3\xb2j\xe1\xaf\xb4\xa1\xad\x1b\xb5\
-n\x00=~\xd0\xa9\xbf!\xfa\xdd\x8c\x09\x11\x0c\x03\x0c\
-\xf6\xfb-\x14\xb9P\x80\xb7\xc9\xcadQ\xa4\x82!r\
-7\xeaB\x01*\x1f\x06\x1a\x06\xfe\xaco?\x154M\
-\xd2\xd5\xa24~\x80\xc8{\x5c\xb7Q\x1e\xcf\xa9\x0c\x8e\
-\x93v\xdf-5+Z\x9d\xfa7n\xb4>\xfc\x9ed\
-a(g>\x0e\x07!RM&\xe7d\xe5 7\xc9\
-\xc1\xd2\x93\x98\xe1r\x07h\xcc\xcdvYY\xfb\x07\xe0\
-\x0fZ\xff\xd8\x0c\xd4\x9e\x0e\xf6\x0e\xb3\xe7\xe7\x0em\x5c\
-_I$\xb4\x08\xe1=(\xf3\x11\xdd\x0f\x95j$\xa3\
-\xbb\xccx\xbcN\x06(\xcetXc\xf1\xd2\x1b\x7f\xe6\
-\xb0\xb9[\xc9\xbe\xe0\xd2{\xf5\xda\xb6\x83\xf6\x18[\xd2\
-\x1a?b\x88\x95\x9dE\xaa\xf0\x1c\xed\xba\x85\xcf\x9f\xc1\
-e\xa3x\xd0\xfa\x96Y\xc9\xf00\xfd<\xb0\x7f2\xde\
-Y\xd2\xeeL\x0ca\xc2\xca\x0f\xb0|\xd3p\x5c\xed+\
-d\xad-\xa5\xe9\xd4\x1dd\xb3'h\x00H&jm\
-\xd8\xf8!T\xaf\x22\xca\x07\x90\x94^\x92\xd4\x7f\xb9\xf8\
-\xbc3P\x0cn0\xaeI9\xb5\xbaSV\x8eu\x0e\
-\x90\xccz\x0c#\xe3PE~\x97\xbaq\x8b\x91\x0f\xb9\
-\xbaZyIV\x9cZ\xd4\xf1\xa0zm\xfb\xb9\xe0\x7f\
-\x19\xf4: {?\xba\x5ca\xbb\xce9\xe9\xd6\x08e\
-\xc8\x02m\xdcXM}\xfb\xffC\xf5~\x92\x89+\x0a\
-:)+I\x05\x08\x80\xe5\xd6)Z\x93\xee0\xb1\xb6\
-\x0f\x00sF\x9c\xb7\x9d\xa2\x5c\xfe\xea5\xad\xc7#\x1c\
-\xe9\xb2\xd9\xcf\xf3\x22L\x8e\xd0k\xdb\xcf\xc5\xd1\xdf\x92\
-}\xfc-@\x1f\xf0\x0f\xe0I`\xf3\xc4\x85p\xe5L\
-\x0dP\x96\xce\x9b\xc00~\x92u\xb1\x9d\x87q\x13\xdd\
-\x95LF\xf16\xc9\xb8\xe7'I\xe5\xc9\x1e/\xa5\xb9\
-\x04\x06\xb8aa;\xf5\xed\x9b\x80\xf9Y]/\x9c\xae\
-\x8dOT\x10\x8d_82\xaf6;\xe9\xed|0\xa7\
-\xf2\xe5\x0a\xcb\xba\xc8e\x8b8\xb6\xbfh\x15`*E\
-\xdaO\xc8\xfe\xc7\xf7I\x1c\xe73\x83c\xc4\xb5>\xfc\
--\x92\xb5\x93\xc7\x8f/\xb1\x1duu\xfb\xfb8\xfc\xc0\
-\x99\x8c'3O\xa1Q\xcb\x97\xe6\x1e/>\x22\xc1\xab\
-R\x99\xac\xb3\xc1A\xf87\xfa\xb8uH\x0a\xb2\xfap\
-\x0f\x13H\x5c[\xb2\x0aP\x10Ui\xff\x15\xaa\xd9\x96\
-\x81,'\x1a;\x0bH\xe7\xfd\x7fw\x11\x86\xbe%\x0b\
-\xf1\xa8\xf3\x15W\x8dDn\x93\xef\x9e\xe2\xb6\x14i\xe1\
-\x889\xe7\x91\xfd\x92W\xc1w\x91\xac\xae\xc9\xbde\xfe\
-\xa5-\xdb8ln\x07\xc9\x9a(\xd9!\x89yd\xa9\
-\x00\xb5\xfe\xb1\x19H\xe2\x0a\xd4w\x8f4\x8d\xccH\x94\
-WT\xab\xf2\xb9o\x963DFK\x1c1\x14\x95_\
-J\xd3\xc2\x8c\x89M\xc7K\xe9.\x81\x01p\xb2\xcbE\
-\xb7\x87[ \x9d\xfbC\xf1Y\x7f\x15\x15\xd4\xbe\x95\xec\
-\x92\x7f\xf6\xd3\x89\xc6\x1b\xf3$RnP\xceuq\xf1\
-\xe6\x5cWX\xebG\xd6]`\xa3\x8cH\x909*\x8e\
-u\xfc\xd8\x17\xa5P\xfb\xf2dJ*\xe79\xad\x0f?\
-\xa7\x0dm\x8dZ\x1fvo\xcdO\xcf\xe8\x96O+\xa3\
-_f\xd1\x90\x0aD\x98\x9fu\x03\x8b?\xe5C\x8e\x92\
-V\x80\xb2\xb2\xf6i\x92\xfbB\xd9\xb2\xdf\x88#\xcaK\
-4-\xc8\xad\xcb\xc8\x04\xd1F\xb5\xa8o\xbf\x19\xe4\xa3\
-\xeeZ\xca7J \xe3p6YSRH\xfa\xd9\x96\
-jn\xf6\xe2,Y\xef\xb2EVuV\xb4q}\x19\
-\xc2W\x07\x1d::\x95\x9f\xef\xf9T\xfa\xadt\xad\xdc\
-\x84\xf7\x95\xe9\x88\xd2t\x83\xbb\xc2]\x84\x8b'\x0cO\
-\xd8;&\x99f\xde\x13Z\xc5\x96\xb4\x02L\xf1\xab\x09\
-\xb5\x16]SL\xa1oz\xddc\x07\x13m\xbf\x1f\xf8\
-\x9a\xbb\x96\xf2siZ\xf8\x8b\xbc\x08\x95S\x5c\xa4\xd5\
-WI\x1f\x01 \xe4\xa6\xf0\xbb%\xbf\xc7\xddf\xd9y\
-z\xf5\x86\xb1g\xe4\xb1`\x1d\xe93\xe5\xc4\xc1\x97~\
-\xd6)\xb8\xf1\x17\xf4S\xff\xf8\xe1\xe9NhC\xfb\x89\
-@\x1a\x1f\xd7\x22\xc3r\xfb\x19\x8e\xbc\x17R\xb9\x15\xb3\
-\xb7\xce\xeb\xc8\x1f\x8d\xd2W\x80>\xbdk\x02\xad\x15\x9f\
-\x7f\x22\xeds\x82^\xf5\xc4L\xad\x0b\x9f\xaf\xf5\xe1;\
-\xb0\xed\xe7\x81\xb3]v\xf1{B\xd5\xd9\xef\xa7\x94\x0a\
-\xa2#g\xec\xc9\x13\x19\x8eg\xc0\xf1\xa5\x9d1\xca\x8a\
-\x05/\xa1\xb81~U\xe1\xf3\xad\x18\xed\x02\xbd&|\
-\x1c*\x99\xf6\xa5\x7f\x9d\xd1\xd5\xcam\x86\x1bM\x8cH\
-\xe4\xa0\x97?\x11@\xb9\xc9U?^\xa1\x96\xbbI\x87\
-\xda#?s+\xe6\xce}JF&>\xf6kC\xdb\
-\x87Q\x0e@\x98\x83#\xf3H_\xd0e4\xbe\xa8\x0d\
-\xe1\x13@w\xa0\xd6N`\x07\x16;A\x9f\x92\x1bj\
-\xf2^\xdeRV\xd4\xbe\xa2\xf5\xe1'\x81\x93\xdc7\xa6\
-\xd5\x8d\xbf\x9c^q\x7f\x88\xaa\xa9\xcbp\x98\x83X\x07\
- :\x0fu\xb5G\x07\xe8g\xb5>|Z2C\xb2\
-LG\xd9\x17\x89\x1d\xc1x\xdd=\x85{\xd9\xddq\xa1\
-4\xd5d\x9d\x16(\xb9|\xdaX\xe9j\xf2cQ\xad\
-\x8dOT\x0cOI\xe4\x1e\xd9J\xf6Y\x80\x0f\xd2\xeb\
-6\x1e>8U\x9a6\xaaE\xb4}\x91\xab!\xd5\xc9\
-\xac0-\xb9\x0e\xd5\xb3\xc9z2\xa0Wj}[7\
-\xdd\x9d\xd7\x0f7\x9c\xa5\xca@\xdc\x0di\x0b\x18\xd8\xe8\
-(\x96k\xe5YWw\x80\xc8w\xb4.\xfc\x0eQ\x1e\
-djT\xe9\x0b\x9e\x82\x15\xbb\x9e=\xcb\xf4\xec\x0d<\
-~\xb7\xf7p\x0e\xf0\xb1\xd5\x95\x03\x8b\xca\x19\xc0\xd0\xbd\
-ze\x89\xbbo\x8d\x8c\x08\x9c\x10\xad\x0f\xe7g\xf9\xa7\
-|IV\xd5\xb8\xa9\xe11\xfe\xa1\x1a\xda\xaeB\xc5\xfd\
-/\x9f\xca\x17e\xd5\xc2\xdb\xb3\xbe\xfc\xdb\x8f\xef\x87?\
-\x91\xdf \xfd\xecqP\x1aY\xb5pE6Kx\xad\
-\x0b\x9f\x8fp\x15I\xe5\xb3?\xd9g\xe2\x1dN\x1c\xd1\
-NT:I~\xc9:\x11m\x97\x95\xb5\xd7e\xd3X\
-\xeb\xdb\x7f\xe6*\x8e\x1b~Mh\xea\xc5\xd2xL,\
-\xd9~\x5c.0\x8f!\xf2=T\x0f\x01\x22\xd2T\xf3\
-\x83\xa12\x85\xbf\x0b|\xcbe\x9f\xef\x02\x0f\x82\xbc\x8e\
-\xea\x94\x94;\xc7h\xa5H\xff[\x9aj\xae\xc8tR\
-\xaf\x09\x1f\x87\xe5\xba\xf0W&:P\xfd\x04\x22n\x0c\
-\x07\xbd\x08\xaf\xa3\xbc\xc9\xcb\x9b\xcf\x91u\x17\xd8z]\
-\xdb\xa1\xd8\xf2\xef\xa0\x07\x80\xcc!y\xef\xb8Q\x96q\
-\xd0-\xa8\xbc\x99\xcc\xe2\xad\x0fIS\xedm\x90\xda\xea\
-\xb1\xed\x91\xd9\xb53\x13\xc1rN\x93\x1b\x16m\x84\x81\
-\xefb\x98\xecK\x98\x02(\xa2\xdfF\xd9\x86\xca\x19\xc4\
-\x83W\x95\xac\x1b\xcc\x10\x12z7>\xb9\x11wK\xfa\
-\x08e\x91_\xe7K\xa4<\xf34\xe8WeUm\xfb\
-\xd8\x97\xa6\x109\x1c4\x17\xb5\x82\x03\xa8\xcc\x04\xf6$\
-\x97T\xc9\xde(aq/\x0en\x14\xe0'\x89v.\
-\xd0\xfa\xb6\xa7@\x0eaO\x0a\xb3w\xc9\xbeD\xc0\xa9\
-\xa8&\xf7\x8a\x95\x17\x80!\x0a\x90\xd0\xd4k\x89v\x9e\
-\x08\xb8)\xa6>\x0bX\x0e\x9a\xcd\xdc\xfdiB\xd1\xfa\
-Q\xafX\xbd\xf0Y\xea\xdb\x9f\x06Np!CzT\
-n\xc2\xa7\xaf\xb8t\x11\xae@9\x0a8\x8acf\x09\
-\xeb\x80\x845\x0f\xd1\xcfL \x16-\x002\x0f\xe9\x9f\
-\xf1\x8b\x1f\xb8\x0d@V\x9c\xfa\x9a\xd6\x87\xdd\xbc\xde2\
-\x1c\xabU\x1b\xc2a\x94\x08$\x16\x90t\xa4ws\x1f\
-\xc8\xc0DI\x80@\xfc\xfe\xd2\xdf\x03\x04\xe4\xc6Eo\
-#lp\xd7J\xef\x1b3\x05\x7f\xf1\xf1,\xa2\xcby\
-y\xf3\xc9\xa9*o\xa5G`\xc1\x1f\xc0u\xa2\x86\xb9\
-)\x8bxJ\xf9\xc9z\xc8\xda\xffs(\xc2\x91Z\xd7\
->\x7f\xc8\xa1\xc6cb\x84\xac\xf3!/\xae\x16\xafc\
-\xf1\x11i<m\xd4\xec\xdc\x82(\x8e6\xe6`\xbc\x97\
-)\x8b\xfc\x90hev\x19\xb7\xbdDu\xd4\xfd\xd44\
-\xf8S\xe5U\xcf\xa2?\x8a\xc8\xd1O2\xde2\xa0\xa2\
-gN\x0a\x05\x08\x80#\xb7\x92\x0c\x8d\x19\xfe/\xc3\x9b\
-#\xa5\x92\x9e\xa8\x1be\x0db\x9dE\xd3\xc2\xf7\xca\xca\
-\xda;3\x16\xf8)\x01\xa4Q\x1c\x1c\xfbrpe\xf5\
-\x1c\xcc\xbbh\xe2\x0b\x84bw\x03\xe3\xdbc\x16\x1dQ\
-,]\x1a\x17t\x11\x9azNj\x9fnB\xe1U\x83\
-x\x94\xb8\x9e\x92\xed^\xb8\xac\xae\xbd\x0fe\x22\xce\xbe\
-\xbbp\xecOJ\xe3i\xdd\xa9t\xf19KC\x97\x0f\
-R\xf9\x11\xc7\xef\xb9\xa0|WV\xd7\xb6 \xe3~\xcf\
-\xce\x98\x1cK`@V-\xbc\x0b\x18a\xd1\xd5\xba\xf0\
-\x0f\x10\xbe1\xec\xf06v\x04\xffX\x18\xc9\x5c\xd3\x01\
-<\x0dlD\xf5az:\xdb\x8a1Je\x22\xc8\xea\
-\xc5\xcfhC\xfb\x19\xa8s7\xc8\x11.\x9a\xfe\x03\xf8\
-D\x7fe6\xbd\xa6\xed\x22,\xb9\x9f\xec\xcb\x05\xec\x06\
-~D|JZ\x07\xfa\xd4>\xe3\xd5\xda\xd0\xf6KT\
-\xbe\x03\x9c\xc3\xf8<%\xb6 \xb2\x92`\xe4\x16ir\
-\x99\xcc\xf3\x95\xcdWq\xf8\x9c\x0eT\xae\xc5\x9d\x8f\xdb\
-?\x10\xebBY]3x\x1fq;n\x0aWy\xc1\
-\xcb\x9b?\xcf\xa1sw\x22\x5cI\xba\xf2\xb4\xe9I\xa0\
-\xb2\x82U\x0b\x92%J_\xda\xfc\xdf\x1c:\xf7\x83\x88\
-\x1b'{\x1e\x03\xb9\xca\x8f\xb8\xcc\xaa\x92-*n6\
-8\xf3#\xc2\xb2{|\x08\x9f\x1ay\x82\xbb\xc7\x95\x95\
-zJO\x84Xhb\xef\x97\x8a\x8dh\x17\x8e\xec\xc6\
-\xd2^\x1c\xed\xc1\xb2\xb6\xa2\xfa\x1a\x96n\xca\xb6>\xca\
-8\xf8g\xde>k\xd4u\xa8\x97\xac\x5c\xf8\x94^q\
-\xff{\x992\xed\x8b\x08\x9f\x01N\xcep\xa9\x03\xfc\x15\
-\x95\xdb\xd9\x19\xf8\xe9\xe0\xcfMV\xd7\xb6hC\xdb\x02\
-\xd4Z\x0dz6\xe9\xbf@\xdd -\xc0\xef\x09\xc9]\
-\xd2\xb8\xa0+\xcd5\xc3d\xab}\x9a\xfe\x0c\xc5\x22\x17\
-\x80\x9e\x03\x9c\x08\x94\x8f\xd2\xac\x1b\xe1O8\xdcOb\
-\xca]\xa9\x19\x98kR\xb3\xfbFmh\xfb5\xcaW\
-\x11\x96\xa5\xf6\x5c\xd3\xe1\x90L\x0ap;\xdd\x1dw\x8c\
-\xfc\xa1\xd4{\x5c\xd5`\xee\xe7\xb9w\x93F5\xb5\xdf\
-\xc5\xcai\x8a\xb8\xbf\x0c?\x90z\xbd\xff\xa6\x0dmk\
-P\xebJ\xd0\x8f\x93\xb9\xe8}\x07\xf0\x1bD\x7f M\
-5\xcf\x0e\xeeC/\x7f\xe2\x13\xcc\x88\xff+\xe87\xc8\
-\x94\xa1\x5cx\x1e\xe5O\xa8\xae\x91U\xb5\x7fI\x1e*\
-!\xb41\xbc\x0fQ\x96\x81\x9c\x04:\x15x\x1b\x9c\x87\
-i\xaa} \x9d%T\x1b\xc2g\xa7\xf5\xf3R\xebd\
-Y\xb5\xe0\xc9B\xc8l\xc8\x8e\xa4Sk\xe28,{\
-?\xc4\xaa\xc4\xd1\xced\xc6\x96\xd03\x99R\xd1\x0fi\
-\xdf\x18\xde\x87\x88\x9c\x88\xe5\xcc\x04\xfc8\xbc\x8d\xeaV\
-v\x95\xbd8\xa1\x12\x0c\x03\xfd\xaf\xf7\x93\x08\x1e\x84m\
-\xcd\x04{\x06\x22\xfb\xe0\x88\x8dH\x0f\x8e\xbeF\xf9\xd4\
-\x17\xfa-\xd5\xb9F\xeb\xda\xe7c\xc9\xe18\xce4,\
-\x99\x82j\x07\x8e\xb5\x1dM<#7.r\x9b\xd6\xab\
-\xa8\xd1F\xb5H\xb4\x1d\x8em\x1d\x8e\xf4g\x0b\x92]\
-$\xd8\xc4\x8d\x0b\xfe9\x96\xc7\x83.\xbb\xc7\xc7\xe1s\
-\x8eB\xad#\x10\xadD\xa5\x03\xcb\xde\x86\xe3\xbc\x92.\
-J\xaad\x14\xa0\xd6\xb5\x7f\x0a\xd1\x1f\x93\xd6\xb7I\xd6\
-\x13\x92\xf3\x86\xff\xbak]\xfbZD/\x19v\xf1?\
-\xa4\xa9\xe6\x98\xfcIj0\x18J\x85\x920\x82h]\
-\xf8C\xa9\x823\x19\x1c;\xf54\x22\xf6\x90\x8dP\xfd\
-\xd63S\x10M\x17wYt\x89\x0f\x0c\x06\x837\x14\
-\xbd\x02\xd4F\xb5\x10\xfd!c\xc9*rq2\xc5z\
-\x8a`\xcf\xc7\x80\xcaaW\xd9\xd8V\xa9X\x7f\x0d\x06\
-C\x9e)z\x05Hl\xe3\x09YZ\x0a\x03`\xbd\x7f\
-\xe0/\xe5\xd2\x91\x97\xc8\x1f\xe5\xc6\x05\x13\xcf&l0\
-\x18&\x05\xc5\xaf\x00\xd1\xecs\xa8\x895\x13@\xafk\
-;\x148s\xc4y\xc7)Hh\x9e\xc1`(\x0d\x8a\
-\xdf\x0f\xd0A\xb30\xd5l\x06\xb9\x19;p\x1f\x00\xb6\
-|\x93\x91\xca\xfd\x9f\x94\xd7\xfc.\xf7\x02\x1a\x0c\x86R\
-\xa5\xf8\x15\xa0Zo\x22\xa39\xe6\xebJv\x84\x1a\xfb\
-]\x1d\xb4.\xfc> Mj(])\x8d\xa3vd\
-0\x18\xf62\x8a\x7f\x09\x5c^\xf58\xa3\xd5X\x15\xeb\
-HB\xdb, Y\xf0\x5c\xb8\x97\xe1\x8a]t\x03M\
-5\xc6\xf8a0\x18\x86P\x12~\x80Z\x17\xfew\x84\
-\xebG\xb9\xa4\x1b\xe8\x22\xbd\x07\xf8N\x94SeU\xcd\
-\xcb\xf9\x91\xce`0\x94*\xc5?\x03\x04(\x8b6\xc1\
-\xa8\x99{+I\xaf\xfc:\x81\x8f\x1b\xe5g0\x18\xd2\
-Q\x12\x0aP\x1aOK\x10\x8a\x9e\x8b\xd0D\xb6\x19.\
-D7\xe0\xb3\xde/M5\x8f\xe6W:\x83\xc1P\xaa\
-\x94\xc4\x12x0z\xf5\x86\x03\xf0\xfb>\x85\xa3g\x22\
-z,\xc8\x0c\x92A\xf0;\x80\xb7QZQ\xfd\xad\xac\
-\xaem\xf1XT\x83\xc1P\xe4\xfc\x7f\x9c\xd61]\x01\
-\x97\xad\x06\x00\x00\x00\x00IEND\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x06\
-\x07\x03}\xc3\
-\x00i\
-\x00m\x00a\x00g\x00e\x00s\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x10\
-\x00\xa4\xda'\
-\x00c\
-\x00i\x00l\x00-\x00k\x00e\x00y\x00b\x00o\x00a\x00r\x00d\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x09\xba\x22\x87\
-\x00c\
-\x00i\x00l\x00-\x00c\x00l\x00o\x00n\x00e\x00.\x00p\x00n\x00g\
-\x00\x1b\
-\x01\xbdC\x87\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00d\x00o\x00u\x00b\x00l\
-\x00e\x00-\x00l\x00e\x00f\x00t\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x04\xfa\xbe\xc7\
-\x00c\
-\x00i\x00l\x00-\x00u\x00s\x00e\x00r\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x0c\xcb\x1e\xc7\
-\x00i\
-\x00c\x00o\x00n\x00_\x00m\x00a\x00x\x00i\x00m\x00i\x00z\x00e\x00.\x00p\x00n\x00g\
-\
-\x00\x15\
-\x0c\xfc\xa5\x07\
-\x00c\
-\x00i\x00l\x00-\x00m\x00o\x00o\x00d\x00-\x00v\x00e\x00r\x00y\x00-\x00b\x00a\x00d\
-\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x091E'\
-\x00c\
-\x00i\x00l\x00-\x00r\x00e\x00m\x00o\x00v\x00e\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x0d\xcf\xa5\xe7\
-\x00c\
-\x00i\x00l\x00-\x00a\x00i\x00r\x00p\x00l\x00a\x00n\x00e\x00-\x00m\x00o\x00d\x00e\
-\x00.\x00p\x00n\x00g\
-\x00\x17\
-\x065\x98\x07\
-\x00c\
-\x00i\x00l\x00-\x00h\x00a\x00n\x00d\x00-\x00p\x00o\x00i\x00n\x00t\x00-\x00d\x00o\
-\x00w\x00n\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x05\xa5\xbe\x07\
-\x00c\
-\x00i\x00l\x00-\x00t\x00a\x00s\x00k\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x06F\xb0\x07\
-\x00c\
-\x00i\x00l\x00-\x00d\x00e\x00a\x00f\x00.\x00p\x00n\x00g\
-\x00\x1a\
-\x07\x95a\xc7\
-\x00c\
-\x00i\x00l\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00c\x00i\x00r\x00c\x00l\x00e\x00-\
-\x00r\x00i\x00g\x00h\x00t\x00.\x00p\x00n\x00g\
-\x00\x19\
-\x05I\x81\xa7\
-\x00c\
-\x00i\x00l\x00-\x00f\x00e\x00a\x00t\x00u\x00r\x00e\x00d\x00-\x00p\x00l\x00a\x00y\
-\x00l\x00i\x00s\x00t\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x0f\xa9\xd9\xe7\
-\x00c\
-\x00i\x00l\x00-\x00p\x00r\x00i\x00n\x00t\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x01\x94.G\
-\x00c\
-\x00i\x00l\x00-\x00t\x00e\x00x\x00t\x00-\x00s\x00q\x00u\x00a\x00r\x00e\x00.\x00p\
-\x00n\x00g\
-\x00\x13\
-\x0f;kG\
-\x00c\
-\x00i\x00l\x00-\x00l\x00i\x00n\x00k\x00-\x00b\x00r\x00o\x00k\x00e\x00n\x00.\x00p\
-\x00n\x00g\
-\x00\x0c\
-\x0a\xdd\xbe\x07\
-\x00c\
-\x00i\x00l\x00-\x00t\x00a\x00g\x00s\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x018\xb3\xe7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00b\x00o\x00t\x00t\x00o\
-\x00m\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x0b\x0c\x22G\
-\x00c\
-\x00i\x00l\x00-\x00w\x00i\x00f\x00i\x00-\x00s\x00i\x00g\x00n\x00a\x00l\x00-\x004\
-\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x09<\xdc'\
-\x00c\
-\x00i\x00l\x00-\x00n\x00o\x00t\x00e\x00s\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x01,X\xe7\
-\x00c\
-\x00i\x00l\x00-\x00a\x00l\x00i\x00g\x00n\x00-\x00c\x00e\x00n\x00t\x00e\x00r\x00.\
-\x00p\x00n\x00g\
-\x00\x11\
-\x00y_\x07\
-\x00c\
-\x00i\x00l\x00-\x00l\x00i\x00g\x00h\x00t\x00b\x00u\x00l\x00b\x00.\x00p\x00n\x00g\
-\
-\x00\x0e\
-\x09\x82\x14\x07\
-\x00c\
-\x00i\x00l\x00-\x00c\x00u\x00r\x00s\x00o\x00r\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x01D\x10'\
-\x00c\
-\x00i\x00l\x00-\x00w\x00i\x00n\x00d\x00o\x00w\x00-\x00r\x00e\x00s\x00t\x00o\x00r\
-\x00e\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x0e?\x84\xa7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00a\x00t\x00-\x00b\x00u\x00b\x00b\x00l\x00e\x00.\x00p\
-\x00n\x00g\
-\x00\x0c\
-\x04\x5c\xb0'\
-\x00c\
-\x00i\x00l\x00-\x00d\x00r\x00o\x00p\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x03mJg\
-\x00c\
-\x00i\x00l\x00-\x00m\x00i\x00c\x00r\x00o\x00p\x00h\x00o\x00n\x00e\x00.\x00p\x00n\
-\x00g\
-\x00\x13\
-\x00\xa3O\x87\
-\x00c\
-\x00i\x00l\x00-\x00e\x00x\x00p\x00a\x00n\x00d\x00-\x00l\x00e\x00f\x00t\x00.\x00p\
-\x00n\x00g\
-\x00\x1c\
-\x0bV\x8f\xe7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00d\x00o\x00u\x00b\x00l\
-\x00e\x00-\x00r\x00i\x00g\x00h\x00t\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x025\x13\xc7\
-\x00c\
-\x00i\x00l\x00-\x00e\x00x\x00t\x00e\x00r\x00n\x00a\x00l\x00-\x00l\x00i\x00n\x00k\
-\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x08\x22\x96\xc7\
-\x00c\
-\x00i\x00l\x00-\x00h\x00i\x00g\x00h\x00l\x00i\x00g\x00t\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x0do\x91\xc7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00o\x00m\x00m\x00e\x00n\x00t\x00-\x00b\x00u\x00b\x00b\x00l\
-\x00e\x00.\x00p\x00n\x00g\
-\x00\x1f\
-\x0f\x93Kg\
-\x00c\
-\x00i\x00l\x00-\x00d\x00o\x00u\x00b\x00l\x00e\x00-\x00q\x00u\x00o\x00t\x00e\x00-\
-\x00s\x00a\x00n\x00s\x00-\x00r\x00i\x00g\x00h\x00t\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x04%\x01G\
-\x00c\
-\x00i\x00l\x00-\x00f\x00o\x00l\x00d\x00e\x00r\x00-\x00o\x00p\x00e\x00n\x00.\x00p\
-\x00n\x00g\
-\x00\x17\
-\x04-W\xa7\
-\x00c\
-\x00i\x00l\x00-\x00w\x00i\x00n\x00d\x00o\x00w\x00-\x00m\x00a\x00x\x00i\x00m\x00i\
-\x00z\x00e\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x0d\xbb\xb0\xe7\
-\x00c\
-\x00i\x00l\x00-\x00f\x00i\x00r\x00e\x00.\x00p\x00n\x00g\
-\x00\x1a\
-\x08k\xa0\xa7\
-\x00c\
-\x00i\x00l\x00-\x00o\x00p\x00t\x00i\x00o\x00n\x00s\x00-\x00h\x00o\x00r\x00i\x00z\
-\x00o\x00n\x00t\x00a\x00l\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x04r\x00G\
-\x00c\
-\x00i\x00l\x00-\x00s\x00p\x00e\x00e\x00c\x00h\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x0f\x0a\xde'\
-\x00c\
-\x00i\x00l\x00-\x00m\x00o\x00v\x00i\x00e\x00.\x00p\x00n\x00g\
-\x00\x1d\
-\x00h\xf9\xa7\
-\x00c\
-\x00i\x00l\x00-\x00v\x00e\x00r\x00t\x00i\x00c\x00a\x00l\x00-\x00a\x00l\x00i\x00g\
-\x00n\x00-\x00b\x00o\x00t\x00t\x00o\x00m\x00.\x00p\x00n\x00g\
-\x00\x1b\
-\x0du\x0dg\
-\x00c\
-\x00i\x00l\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00c\x00i\x00r\x00c\x00l\x00e\x00-\
-\x00b\x00o\x00t\x00t\x00o\x00m\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x0a0\xd2\x87\
-\x00c\
-\x00i\x00l\x00-\x00b\x00r\x00i\x00e\x00f\x00c\x00a\x00s\x00e\x00.\x00p\x00n\x00g\
-\
-\x00\x0b\
-\x08\xd2\xa9'\
-\x00c\
-\x00i\x00l\x00-\x00b\x00a\x00n\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x0b\x0b\xb0\xa7\
-\x00c\
-\x00i\x00l\x00-\x00h\x00o\x00m\x00e\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x03\xd0\xc6'\
-\x00c\
-\x00i\x00l\x00-\x00m\x00o\x00b\x00i\x00l\x00e\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x0b\x0e\x22G\
-\x00c\
-\x00i\x00l\x00-\x00w\x00i\x00f\x00i\x00-\x00s\x00i\x00g\x00n\x00a\x00l\x00-\x002\
-\x00.\x00p\x00n\x00g\
-\x00\x18\
-\x0a\x0e|\xc7\
-\x00c\
-\x00i\x00l\x00-\x00d\x00a\x00t\x00a\x00-\x00t\x00r\x00a\x00n\x00s\x00f\x00e\x00r\
-\x00-\x00u\x00p\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x03~\x1c\xc7\
-\x00c\
-\x00i\x00l\x00-\x00l\x00a\x00y\x00e\x00r\x00s\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x0f'fG\
-\x00c\
-\x00i\x00l\x00-\x00v\x00o\x00l\x00u\x00m\x00e\x00-\x00h\x00i\x00g\x00h\x00.\x00p\
-\x00n\x00g\
-\x00\x17\
-\x04%\x97\xa7\
-\x00c\
-\x00i\x00l\x00-\x00w\x00i\x00n\x00d\x00o\x00w\x00-\x00m\x00i\x00n\x00i\x00m\x00i\
-\x00z\x00e\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x08e\xbaG\
-\x00i\
-\x00c\x00o\x00n\x00_\x00s\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00p\x00n\x00g\
-\
-\x00\x11\
-\x0e\xf6\xe2\xe7\
-\x00c\
-\x00i\x00l\x00-\x00r\x00e\x00c\x00t\x00a\x00n\x00g\x00l\x00e\x00.\x00p\x00n\x00g\
-\
-\x00\x0c\
-\x0b\x9e\xbf\xc7\
-\x00c\
-\x00i\x00l\x00-\x00m\x00o\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x06d\x22\x87\
-\x00c\
-\x00i\x00l\x00-\x00c\x00l\x00o\x00c\x00k\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x02\x12\x89\x07\
-\x00c\
-\x00i\x00l\x00-\x00f\x00i\x00n\x00g\x00e\x00r\x00p\x00r\x00i\x00n\x00t\x00.\x00p\
-\x00n\x00g\
-\x00\x1d\
-\x0e*E\xe7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00d\x00o\x00u\x00b\x00l\
-\x00e\x00-\x00u\x00p\x00-\x00a\x00l\x00t\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x06\xb1\xd8G\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00c\x00k\x00-\x00c\x00i\x00r\x00c\x00l\x00e\x00.\
-\x00p\x00n\x00g\
-\x00\x15\
-\x00\xd3\x83\x87\
-\x00c\
-\x00i\x00l\x00-\x00h\x00a\x00n\x00d\x00-\x00p\x00o\x00i\x00n\x00t\x00-\x00u\x00p\
-\x00.\x00p\x00n\x00g\
-\x00\x17\
-\x0e\xbcA\xc7\
-\x00c\
-\x00i\x00l\x00-\x00w\x00i\x00f\x00i\x00-\x00s\x00i\x00g\x00n\x00a\x00l\x00-\x00o\
-\x00f\x00f\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x04\x5c\xb9'\
-\x00c\
-\x00i\x00l\x00-\x00a\x00l\x00i\x00g\x00n\x00-\x00l\x00e\x00f\x00t\x00.\x00p\x00n\
-\x00g\
-\x00\x0d\
-\x0bi%'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00a\x00r\x00t\x00.\x00p\x00n\x00g\
-\x00\x17\
-\x0b\x03\x87'\
-\x00c\
-\x00i\x00l\x00-\x00h\x00a\x00n\x00d\x00-\x00p\x00o\x00i\x00n\x00t\x00-\x00l\x00e\
-\x00f\x00t\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x05I`\xa7\
-\x00c\
-\x00i\x00l\x00-\x00l\x00e\x00v\x00e\x00l\x00-\x00d\x00o\x00w\x00n\x00.\x00p\x00n\
-\x00g\
-\x00\x0c\
-\x0b\xfb\xbf\xc7\
-\x00c\
-\x00i\x00l\x00-\x00m\x00o\x00v\x00e\x00.\x00p\x00n\x00g\
-\x00\x0b\
-\x06R\xa9\xc7\
-\x00c\
-\x00i\x00l\x00-\x00p\x00i\x00n\x00.\x00p\x00n\x00g\
-\x00\x0b\
-\x0ef\xa9'\
-\x00c\
-\x00i\x00l\x00-\x00h\x00d\x00r\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x04\xcd\xbd\x07\
-\x00c\
-\x00i\x00l\x00-\x00a\x00v\x00-\x00t\x00i\x00m\x00e\x00r\x00.\x00p\x00n\x00g\
-\x00\x0b\
-\x03h\xa9\xc7\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00h\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x0f=8\xc7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00l\x00e\x00f\x00t\x00.\
-\x00p\x00n\x00g\
-\x00\x0d\
-\x0bz\xc5'\
-\x00c\
-\x00i\x00l\x00-\x00s\x00h\x00a\x00r\x00e\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x0d\x86.'\
-\x00c\
-\x00i\x00l\x00-\x00t\x00h\x00u\x00m\x00b\x00-\x00u\x00p\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x0b\x04\xc5\xc7\
-\x00c\
-\x00i\x00l\x00-\x00e\x00x\x00p\x00o\x00s\x00u\x00r\x00e\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x09\xca\xa3\xa7\
-\x00c\
-\x00i\x00l\x00-\x00a\x00c\x00t\x00i\x00o\x00n\x00-\x00r\x00e\x00d\x00o\x00.\x00p\
-\x00n\x00g\
-\x00\x13\
-\x03\xf8\x07'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00u\x00r\x00s\x00o\x00r\x00-\x00m\x00o\x00v\x00e\x00.\x00p\
-\x00n\x00g\
-\x00\x13\
-\x03K\x17\x87\
-\x00c\
-\x00i\x00l\x00-\x00l\x00i\x00b\x00r\x00a\x00r\x00y\x00-\x00a\x00d\x00d\x00.\x00p\
-\x00n\x00g\
-\x00\x14\
-\x08\x91\xf7G\
-\x00c\
-\x00i\x00l\x00-\x00l\x00o\x00c\x00a\x00t\x00i\x00o\x00n\x00-\x00p\x00i\x00n\x00.\
-\x00p\x00n\x00g\
-\x00\x11\
-\x0c\xb6\xf2\x87\
-\x00c\
-\x00i\x00l\x00-\x00b\x00a\x00t\x00t\x00e\x00r\x00y\x00-\x003\x00.\x00p\x00n\x00g\
-\
-\x00\x0c\
-\x05\x1b\xb0\xc7\
-\x00c\
-\x00i\x00l\x00-\x00f\x00i\x00l\x00e\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x0d\xc4\x15'\
-\x00c\
-\x00i\x00l\x00-\x00v\x00i\x00e\x00w\x00-\x00q\x00u\x00i\x00l\x00t\x00.\x00p\x00n\
-\x00g\
-\x00\x16\
-\x0c\xc5\xf7\xa7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00o\x00m\x00m\x00e\x00n\x00t\x00-\x00s\x00q\x00u\x00a\x00r\
-\x00e\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x0e\x8d\xd7\xe7\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00d\x00i\x00a\x00-\x00p\x00a\x00u\x00s\x00e\x00.\x00p\
-\x00n\x00g\
-\x00\x12\
-\x0f\xad\x8fg\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00d\x00i\x00a\x00-\x00p\x00l\x00a\x00y\x00.\x00p\x00n\
-\x00g\
-\x00\x1d\
-\x0e\x1f\xc8'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00c\x00i\x00r\x00c\x00l\
-\x00e\x00-\x00u\x00p\x00-\x00a\x00l\x00t\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x0e\xc7\xe8\xa7\
-\x00c\
-\x00i\x00l\x00-\x00f\x00l\x00i\x00p\x00-\x00t\x00o\x00-\x00b\x00a\x00c\x00k\x00.\
-\x00p\x00n\x00g\
-\x00\x11\
-\x00@\xc3'\
-\x00c\
-\x00i\x00l\x00-\x00w\x00r\x00a\x00p\x00-\x00t\x00e\x00x\x00t\x00.\x00p\x00n\x00g\
-\
-\x00\x13\
-\x07;+\x87\
-\x00c\
-\x00i\x00l\x00-\x00v\x00i\x00e\x00w\x00-\x00c\x00o\x00l\x00u\x00m\x00n\x00.\x00p\
-\x00n\x00g\
-\x00\x19\
-\x00qeg\
-\x00c\
-\x00i\x00l\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00c\x00i\x00r\x00c\x00l\x00e\x00-\
-\x00l\x00e\x00f\x00t\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x0f\xa9;\x07\
-\x00c\
-\x00i\x00l\x00-\x00p\x00a\x00p\x00e\x00r\x00c\x00l\x00i\x00p\x00.\x00p\x00n\x00g\
-\
-\x00\x0d\
-\x0f\xda\xc2\x87\
-\x00c\
-\x00i\x00l\x00-\x00s\x00m\x00i\x00l\x00e\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x05\x22\xe1g\
-\x00c\
-\x00i\x00l\x00-\x00f\x00o\x00l\x00d\x00e\x00r\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x0b~\xfe\x07\
-\x00c\
-\x00i\x00l\x00-\x00u\x00s\x00e\x00r\x00-\x00f\x00e\x00m\x00a\x00l\x00e\x00.\x00p\
-\x00n\x00g\
-\x00\x1e\
-\x05\xf1\x07\xc7\
-\x00c\
-\x00i\x00l\x00-\x00d\x00o\x00u\x00b\x00l\x00e\x00-\x00q\x00u\x00o\x00t\x00e\x00-\
-\x00s\x00a\x00n\x00s\x00-\x00l\x00e\x00f\x00t\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x08\x1bY\x07\
-\x00c\
-\x00i\x00l\x00-\x00c\x00r\x00e\x00d\x00i\x00t\x00-\x00c\x00a\x00r\x00d\x00.\x00p\
-\x00n\x00g\
-\x00\x0f\
-\x08\xe7\xe5\xc7\
-\x00c\
-\x00i\x00l\x00-\x00h\x00i\x00s\x00t\x00o\x00r\x00y\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x09k\xbf'\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00n\x00u\x00.\x00p\x00n\x00g\
-\x00\x0b\
-\x0b\x8d\xa9'\
-\x00c\
-\x00i\x00l\x00-\x00d\x00o\x00g\x00.\x00p\x00n\x00g\
-\x00\x1f\
-\x01y\xed\x07\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00c\x00i\x00r\x00c\x00l\
-\x00e\x00-\x00l\x00e\x00f\x00t\x00-\x00a\x00l\x00t\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x02\x84Y\x07\
-\x00c\
-\x00i\x00l\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00l\x00e\x00f\x00t\x00.\x00p\x00n\
-\x00g\
-\x00\x19\
-\x0f\x857\xc7\
-\x00c\
-\x00i\x00l\x00-\x00v\x00o\x00i\x00c\x00e\x00-\x00o\x00v\x00e\x00r\x00-\x00r\x00e\
-\x00c\x00o\x00r\x00d\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x0c\x88#G\
-\x00c\
-\x00i\x00l\x00-\x00e\x00x\x00p\x00a\x00n\x00d\x00-\x00u\x00p\x00.\x00p\x00n\x00g\
-\
-\x00\x0d\
-\x09e\xcd\xe7\
-\x00c\
-\x00i\x00l\x00-\x00w\x00a\x00t\x00c\x00h\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x0db;'\
-\x00c\
-\x00i\x00l\x00-\x00z\x00o\x00o\x00m\x00-\x00i\x00n\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x07\x1c\xda\x87\
-\x00i\
-\x00c\x00o\x00n\x00_\x00m\x00e\x00n\x00u\x00.\x00p\x00n\x00g\
-\x00\x0b\
-\x04m\xa9\xc7\
-\x00c\
-\x00i\x00l\x00-\x00m\x00u\x00g\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x07\xb7\xddg\
-\x00c\
-\x00i\x00l\x00-\x00b\x00r\x00o\x00w\x00s\x00e\x00r\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x08B\x01g\
-\x00c\
-\x00i\x00l\x00-\x00s\x00h\x00a\x00r\x00e\x00-\x00b\x00o\x00x\x00e\x00d\x00.\x00p\
-\x00n\x00g\
-\x00\x11\
-\x0c\xc2^\xc7\
-\x00i\
-\x00c\x00o\x00n\x00_\x00m\x00i\x00n\x00i\x00m\x00i\x00z\x00e\x00.\x00p\x00n\x00g\
-\
-\x00\x0c\
-\x0b\x5c\xbf'\
-\x00c\
-\x00i\x00l\x00-\x00l\x00o\x00o\x00p\x00.\x00p\x00n\x00g\
-\x00\x0b\
-\x03P\xa9\xc7\
-\x00c\
-\x00i\x00l\x00-\x00m\x00a\x00p\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x00\xe4z'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00a\x00l\x00e\x00n\x00d\x00a\x00r\x00-\x00c\x00h\x00e\x00c\
-\x00k\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x08\x9b\xb0\x07\
-\x00c\
-\x00i\x00l\x00-\x00c\x00o\x00d\x00e\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x06G\x9f\xc7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00c\x00k\x00-\x00a\x00l\x00t\x00.\x00p\x00n\x00g\
-\
-\x00\x13\
-\x0e3\xc0G\
-\x00c\
-\x00i\x00l\x00-\x00p\x00a\x00p\x00e\x00r\x00-\x00p\x00l\x00a\x00n\x00e\x00.\x00p\
-\x00n\x00g\
-\x00\x0c\
-\x0e\xfd\xbf\xa7\
-\x00c\
-\x00i\x00l\x00-\x00p\x00l\x00u\x00s\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x08t-\x87\
-\x00c\
-\x00i\x00l\x00-\x00e\x00q\x00u\x00a\x00l\x00i\x00z\x00e\x00r\x00.\x00p\x00n\x00g\
-\
-\x00\x0d\
-\x0fj\xde'\
-\x00c\
-\x00i\x00l\x00-\x00m\x00o\x00u\x00s\x00e\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x0c\xdb\x05'\
-\x00c\
-\x00i\x00l\x00-\x00o\x00p\x00t\x00i\x00o\x00n\x00s\x00.\x00p\x00n\x00g\
-\x00\x09\
-\x0fK\x84\xa7\
-\x00c\
-\x00i\x00l\x00-\x00x\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x0d\x13\xef'\
-\x00c\
-\x00i\x00l\x00-\x00p\x00o\x00w\x00e\x00r\x00-\x00s\x00t\x00a\x00n\x00d\x00b\x00y\
-\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x03Q:'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00r\x00i\x00g\x00h\x00t\
-\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x0d\x0f\xb0g\
-\x00c\
-\x00i\x00l\x00-\x00d\x00e\x00s\x00c\x00r\x00i\x00p\x00t\x00i\x00o\x00n\x00.\x00p\
-\x00n\x00g\
-\x00\x11\
-\x0b\xf6g'\
-\x00c\
-\x00i\x00l\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00t\x00o\x00p\x00.\x00p\x00n\x00g\
-\
-\x00\x0f\
-\x08\x0c\xf7'\
-\x00c\
-\x00i\x00l\x00-\x00g\x00a\x00m\x00e\x00p\x00a\x00d\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x04<\x8c'\
-\x00c\
-\x00i\x00l\x00-\x00m\x00u\x00g\x00-\x00t\x00e\x00a\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x0a\x9eEG\
-\x00c\
-\x00i\x00l\x00-\x00r\x00e\x00l\x00o\x00a\x00d\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x0c\xec!\xe7\
-\x00c\
-\x00i\x00l\x00-\x00l\x00o\x00o\x00p\x00-\x001\x00.\x00p\x00n\x00g\
-\x00\x19\
-\x03\x89U\xa7\
-\x00c\
-\x00i\x00l\x00-\x00s\x00i\x00g\x00n\x00a\x00l\x00-\x00c\x00e\x00l\x00l\x00u\x00l\
-\x00a\x00r\x00-\x003\x00.\x00p\x00n\x00g\
-\x00\x19\
-\x00Q \x87\
-\x00c\
-\x00i\x00l\x00-\x00s\x00c\x00r\x00e\x00e\x00n\x00-\x00s\x00m\x00a\x00r\x00t\x00p\
-\x00h\x00o\x00n\x00e\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x03gmG\
-\x00c\
-\x00i\x00l\x00-\x00c\x00a\x00m\x00e\x00r\x00a\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x05AC'\
-\x00c\
-\x00i\x00l\x00-\x00t\x00e\x00x\x00t\x00-\x00s\x00i\x00z\x00e\x00.\x00p\x00n\x00g\
-\
-\x00\x13\
-\x05\x0a2'\
-\x00c\
-\x00i\x00l\x00-\x00l\x00o\x00c\x00k\x00-\x00l\x00o\x00c\x00k\x00e\x00d\x00.\x00p\
-\x00n\x00g\
-\x00\x12\
-\x05i\x94'\
-\x00c\
-\x00i\x00l\x00-\x00v\x00o\x00l\x00u\x00m\x00e\x00-\x00l\x00o\x00w\x00.\x00p\x00n\
-\x00g\
-\x00\x12\
-\x03\xc6\x94'\
-\x00c\
-\x00i\x00l\x00-\x00v\x00o\x00l\x00u\x00m\x00e\x00-\x00o\x00f\x00f\x00.\x00p\x00n\
-\x00g\
-\x00\x0e\
-\x02`\xf8\xc7\
-\x00i\
-\x00c\x00o\x00n\x00_\x00c\x00l\x00o\x00s\x00e\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x01\x843\xa7\
-\x00c\
-\x00i\x00l\x00-\x00j\x00u\x00s\x00t\x00i\x00f\x00y\x00-\x00c\x00e\x00n\x00t\x00e\
-\x00r\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x08\xc7'\x87\
-\x00c\
-\x00i\x00l\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00r\x00i\x00g\x00h\x00t\x00.\x00p\
-\x00n\x00g\
-\x00\x17\
-\x06\x8ce\xe7\
-\x00c\
-\x00i\x00l\x00-\x00e\x00n\x00v\x00e\x00l\x00o\x00p\x00e\x00-\x00c\x00l\x00o\x00s\
-\x00e\x00d\x00.\x00p\x00n\x00g\
-\x00\x1b\
-\x04\xcaZG\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00d\x00i\x00a\x00-\x00s\x00k\x00i\x00p\x00-\x00b\x00a\
-\x00c\x00k\x00w\x00a\x00r\x00d\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x0c4\xca\x07\
-\x00c\
-\x00i\x00l\x00-\x00u\x00s\x00e\x00r\x00-\x00f\x00o\x00l\x00l\x00o\x00w\x00.\x00p\
-\x00n\x00g\
-\x00\x0b\
-\x0a\x14\xa9'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00u\x00t\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x08\xab\xb0'\
-\x00c\
-\x00i\x00l\x00-\x00i\x00n\x00f\x00i\x00n\x00i\x00t\x00y\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x0fC\xa3\xe7\
-\x00c\
-\x00i\x00l\x00-\x00j\x00u\x00s\x00t\x00i\x00f\x00y\x00-\x00r\x00i\x00g\x00h\x00t\
-\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x0b\x0b\x22G\
-\x00c\
-\x00i\x00l\x00-\x00w\x00i\x00f\x00i\x00-\x00s\x00i\x00g\x00n\x00a\x00l\x00-\x001\
-\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x04\xdcWG\
-\x00c\
-\x00i\x00l\x00-\x00p\x00a\x00r\x00a\x00g\x00r\x00a\x00p\x00h\x00.\x00p\x00n\x00g\
-\
-\x00\x0d\
-\x049\xd6G\
-\x00c\
-\x00i\x00l\x00-\x00i\x00n\x00p\x00u\x00t\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x0d\xc9]\x07\
-\x00c\
-\x00i\x00l\x00-\x00s\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x06<\xd1\xe7\
-\x00c\
-\x00i\x00l\x00-\x00m\x00i\x00n\x00u\x00s\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x02\x22,\xe7\
-\x00c\
-\x00i\x00l\x00-\x00f\x00a\x00c\x00e\x00-\x00d\x00e\x00a\x00d\x00.\x00p\x00n\x00g\
-\
-\x00\x15\
-\x09Y\x86g\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00d\x00i\x00c\x00a\x00l\x00-\x00c\x00r\x00o\x00s\x00s\
-\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x04_\x0b\xe7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00l\x00o\x00u\x00d\x00y\x00.\x00p\x00n\x00g\
-\x00\x0a\
-\x03\x8ah\xa7\
-\x00c\
-\x00i\x00l\x00-\x00a\x00t\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x03S\x06\xa7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00o\x00f\x00f\x00e\x00e\x00.\x00p\x00n\x00g\
-\x00\x1a\
-\x0dI\xb8g\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00d\x00i\x00a\x00-\x00s\x00k\x00i\x00p\x00-\x00f\x00o\
-\x00r\x00w\x00a\x00r\x00d\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x08OF\x07\
-\x00c\
-\x00i\x00l\x00-\x00h\x00e\x00a\x00d\x00p\x00h\x00o\x00n\x00e\x00s\x00.\x00p\x00n\
-\x00g\
-\x00\x12\
-\x03\xd8\x22\xa7\
-\x00c\
-\x00i\x00l\x00-\x00t\x00h\x00u\x00m\x00b\x00-\x00d\x00o\x00w\x00n\x00.\x00p\x00n\
-\x00g\
-\x00\x0e\
-\x04\x8b\x1d\xc7\
-\x00c\
-\x00i\x00l\x00-\x00l\x00a\x00p\x00t\x00o\x00p\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x01\xc8\xbe\x07\
-\x00c\
-\x00i\x00l\x00-\x00t\x00e\x00x\x00t\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x0f:M\x87\
-\x00c\
-\x00i\x00l\x00-\x00m\x00o\x00o\x00d\x00-\x00g\x00o\x00o\x00d\x00.\x00p\x00n\x00g\
-\
-\x00\x16\
-\x09:\x87\xe7\
-\x00c\
-\x00i\x00l\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00b\x00o\x00t\x00t\x00o\x00m\x00-\
-\x002\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x053\x15\xe7\
-\x00c\
-\x00i\x00l\x00-\x00l\x00o\x00c\x00k\x00-\x00u\x00n\x00l\x00o\x00c\x00k\x00e\x00d\
-\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x0d<\x0f\x07\
-\x00c\
-\x00i\x00l\x00-\x00t\x00e\x00r\x00m\x00i\x00n\x00a\x00l\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x05{=\xe7\
-\x00c\
-\x00i\x00l\x00-\x00b\x00l\x00u\x00e\x00t\x00o\x00o\x00t\x00h\x00.\x00p\x00n\x00g\
-\
-\x00\x0d\
-\x05_-\xc7\
-\x00c\
-\x00i\x00l\x00-\x00f\x00r\x00o\x00w\x00n\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x08d\xc1\xc7\
-\x00c\
-\x00i\x00l\x00-\x00t\x00r\x00u\x00c\x00k\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x0ff\xc3\xa7\
-\x00c\
-\x00i\x00l\x00-\x00e\x00x\x00i\x00t\x00-\x00t\x00o\x00-\x00a\x00p\x00p\x00.\x00p\
-\x00n\x00g\
-\x00\x13\
-\x05I%G\
-\x00c\
-\x00i\x00l\x00-\x00a\x00l\x00i\x00g\x00n\x00-\x00r\x00i\x00g\x00h\x00t\x00.\x00p\
-\x00n\x00g\
-\x00\x14\
-\x06cjg\
-\x00c\
-\x00i\x00l\x00-\x00f\x00i\x00n\x00d\x00-\x00i\x00n\x00-\x00p\x00a\x00g\x00e\x00.\
-\x00p\x00n\x00g\
-\x00\x0a\
-\x03\xeah\xa7\
-\x00c\
-\x00i\x00l\x00-\x00h\x00d\x00.\x00p\x00n\x00g\
-\x00 \
-\x08]\xfc'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00c\x00i\x00r\x00c\x00l\
-\x00e\x00-\x00r\x00i\x00g\x00h\x00t\x00-\x00a\x00l\x00t\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x0d@y\x07\
-\x00c\
-\x00i\x00l\x00-\x00c\x00l\x00i\x00p\x00b\x00o\x00a\x00r\x00d\x00.\x00p\x00n\x00g\
-\
-\x00\x12\
-\x0c\x17&\x87\
-\x00c\
-\x00i\x00l\x00-\x00l\x00o\x00w\x00-\x00v\x00i\x00s\x00i\x00o\x00n\x00.\x00p\x00n\
-\x00g\
-\x00\x18\
-\x0e\x22g'\
-\x00c\
-\x00i\x00l\x00-\x00m\x00o\x00b\x00i\x00l\x00e\x00-\x00l\x00a\x00n\x00d\x00s\x00c\
-\x00a\x00p\x00e\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x08\x03\x18\xc7\
-\x00c\
-\x00i\x00l\x00-\x00d\x00i\x00a\x00l\x00p\x00a\x00d\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x09\x8fx\xe7\
-\x00c\
-\x00i\x00l\x00-\x00s\x00a\x00t\x00e\x00l\x00i\x00t\x00e\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x06C\xb9'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00a\x00m\x00e\x00r\x00a\x00-\x00r\x00o\x00l\x00l\x00.\x00p\
-\x00n\x00g\
-\x00\x10\
-\x0eN+\xa7\
-\x00i\
-\x00c\x00o\x00n\x00_\x00r\x00e\x00s\x00t\x00o\x00r\x00e\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x0c\xb3\xf2\x87\
-\x00c\
-\x00i\x00l\x00-\x00b\x00a\x00t\x00t\x00e\x00r\x00y\x00-\x000\x00.\x00p\x00n\x00g\
-\
-\x00\x11\
-\x04\x82\x85'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00a\x00r\x00t\x00-\x00p\x00i\x00e\x00.\x00p\x00n\x00g\
-\
-\x00\x0c\
-\x05\xa8\xb0g\
-\x00c\
-\x00i\x00l\x00-\x00c\x00a\x00r\x00t\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x0aN\xba'\
-\x00c\
-\x00i\x00l\x00-\x00s\x00p\x00e\x00e\x00d\x00o\x00m\x00e\x00t\x00e\x00r\x00.\x00p\
-\x00n\x00g\
-\x00\x0d\
-\x0fj('\
-\x00c\
-\x00i\x00l\x00-\x00h\x00o\x00u\x00s\x00e\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x04L0\xe7\
-\x00c\
-\x00i\x00l\x00-\x00v\x00i\x00e\x00w\x00-\x00s\x00t\x00r\x00e\x00a\x00m\x00.\x00p\
-\x00n\x00g\
-\x00\x18\
-\x00\xbbD\xa7\
-\x00c\
-\x00i\x00l\x00-\x00h\x00a\x00n\x00d\x00-\x00p\x00o\x00i\x00n\x00t\x00-\x00r\x00i\
-\x00g\x00h\x00t\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x0cy,\xe7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00a\x00r\x00e\x00t\x00-\x00b\x00o\x00t\x00t\x00o\x00m\x00.\
-\x00p\x00n\x00g\
-\x00\x13\
-\x06\xca\xa3\xa7\
-\x00c\
-\x00i\x00l\x00-\x00a\x00c\x00t\x00i\x00o\x00n\x00-\x00u\x00n\x00d\x00o\x00.\x00p\
-\x00n\x00g\
-\x00\x15\
-\x0b\x08\x22G\
-\x00c\
-\x00i\x00l\x00-\x00w\x00i\x00f\x00i\x00-\x00s\x00i\x00g\x00n\x00a\x00l\x00-\x000\
-\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x01\xfcY\x07\
-\x00c\
-\x00i\x00l\x00-\x00a\x00c\x00c\x00o\x00u\x00n\x00t\x00-\x00l\x00o\x00g\x00o\x00u\
-\x00t\x00.\x00p\x00n\x00g\
-\x00\x19\
-\x0d,B\x87\
-\x00c\
-\x00i\x00l\x00-\x00c\x00l\x00o\x00s\x00e\x00d\x00-\x00c\x00a\x00p\x00t\x00i\x00o\
-\x00n\x00i\x00n\x00g\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x05\xaf\xa3\xa7\
-\x00c\
-\x00i\x00l\x00-\x00t\x00r\x00a\x00n\x00s\x00f\x00e\x00r\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x0c\xbejg\
-\x00c\
-\x00i\x00l\x00-\x00e\x00n\x00v\x00e\x00l\x00o\x00p\x00e\x00-\x00o\x00p\x00e\x00n\
-\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x08\xd0\x85\xe7\
-\x00c\
-\x00i\x00l\x00-\x00p\x00e\x00o\x00p\x00l\x00e\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x09\x10\xb0G\
-\x00c\
-\x00i\x00l\x00-\x00b\x00e\x00l\x00l\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x0bi+\x87\
-\x00c\
-\x00i\x00l\x00-\x00h\x00e\x00a\x00r\x00t\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x02lK\xc7\
-\x00c\
-\x00i\x00l\x00-\x00i\x00m\x00a\x00g\x00e\x001\x00.\x00p\x00n\x00g\
-\x00\x0a\
-\x00\x9ah\xa7\
-\x00c\
-\x00i\x00l\x00-\x003\x00d\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x00\xe1\x86\xe7\
-\x00c\
-\x00i\x00l\x00-\x00m\x00o\x00o\x00d\x00-\x00b\x00a\x00d\x00.\x00p\x00n\x00g\
-\x00\x1a\
-\x0c\x0a\xcd\xa7\
-\x00c\
-\x00i\x00l\x00-\x00d\x00a\x00t\x00a\x00-\x00t\x00r\x00a\x00n\x00s\x00f\x00e\x00r\
-\x00-\x00d\x00o\x00w\x00n\x00.\x00p\x00n\x00g\
-\x00\x1a\
-\x0dN\x9bg\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00d\x00i\x00a\x00-\x00s\x00t\x00e\x00p\x00-\x00f\x00o\
-\x00r\x00w\x00a\x00r\x00d\x00.\x00p\x00n\x00g\
-\x00\x19\
-\x0e\x89=G\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00d\x00o\x00u\x00b\x00l\
-\x00e\x00-\x00u\x00p\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x0cP`g\
-\x00c\
-\x00i\x00l\x00-\x00c\x00l\x00o\x00u\x00d\x00-\x00u\x00p\x00l\x00o\x00a\x00d\x00.\
-\x00p\x00n\x00g\
-\x00\x18\
-\x0d\xa6e'\
-\x00c\
-\x00i\x00l\x00-\x00m\x00a\x00g\x00n\x00i\x00f\x00y\x00i\x00n\x00g\x00-\x00g\x00l\
-\x00a\x00s\x00s\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x08\xca\x95\xe7\
-\x00c\
-\x00i\x00l\x00-\x00l\x00o\x00o\x00p\x00-\x00c\x00i\x00r\x00c\x00u\x00l\x00a\x00r\
-\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x0fP&'\
-\x00c\
-\x00i\x00l\x00-\x00s\x00p\x00e\x00a\x00k\x00e\x00r\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x09NFG\
-\x00c\
-\x00i\x00l\x00-\x00b\x00a\x00t\x00t\x00e\x00r\x00y\x00-\x00a\x00l\x00e\x00r\x00t\
-\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x07\xba\xbe\x07\
-\x00c\
-\x00i\x00l\x00-\x00s\x00t\x00a\x00r\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x0b-yG\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00a\x00r\x00t\x00-\x00l\x00i\x00n\x00e\x00.\x00p\x00n\
-\x00g\
-\x00\x10\
-\x03]\xe9\x87\
-\x00c\
-\x00i\x00l\x00-\x00x\x00-\x00c\x00i\x00r\x00c\x00l\x00e\x00.\x00p\x00n\x00g\
-\x00\x19\
-\x07r\xc8\xa7\
-\x00c\
-\x00i\x00l\x00-\x00a\x00i\x00r\x00p\x00l\x00a\x00n\x00e\x00-\x00m\x00o\x00d\x00e\
-\x00-\x00o\x00f\x00f\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x0bH\x12\xa7\
-\x00c\
-\x00i\x00l\x00-\x00s\x00c\x00r\x00e\x00e\x00n\x00-\x00d\x00e\x00s\x00k\x00t\x00o\
-\x00p\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x0d.\xedG\
-\x00c\
-\x00i\x00l\x00-\x00w\x00a\x00l\x00l\x00e\x00t\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x07\xb2iG\
-\x00c\
-\x00i\x00l\x00-\x00d\x00e\x00v\x00i\x00c\x00e\x00s\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x0c\xa2Og\
-\x00c\
-\x00i\x00l\x00-\x00c\x00l\x00o\x00u\x00d\x00-\x00d\x00o\x00w\x00n\x00l\x00o\x00a\
-\x00d\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x04\xf1\xcag\
-\x00c\
-\x00i\x00l\x00-\x00p\x00a\x00i\x00n\x00t\x00-\x00b\x00u\x00c\x00k\x00e\x00t\x00.\
-\x00p\x00n\x00g\
-\x00\x17\
-\x05\xf8\xfaG\
-\x00c\
-\x00i\x00l\x00-\x00e\x00n\x00v\x00e\x00l\x00o\x00p\x00e\x00-\x00l\x00e\x00t\x00t\
-\x00e\x00r\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x00}\xbc\x87\
-\x00c\
-\x00i\x00l\x00-\x00l\x00i\x00n\x00k\x00-\x00a\x00l\x00t\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x09\xd5%'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00a\x00r\x00e\x00t\x00-\x00t\x00o\x00p\x00.\x00p\x00n\x00g\
-\
-\x00\x1f\
-\x02C\x81g\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00c\x00i\x00r\x00c\x00l\
-\x00e\x00-\x00d\x00o\x00w\x00n\x00-\x00a\x00l\x00t\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x05\xfb\xbeg\
-\x00c\
-\x00i\x00l\x00-\x00s\x00a\x00v\x00e\x00.\x00p\x00n\x00g\
-\x00\x19\
-\x03\x80U\xa7\
-\x00c\
-\x00i\x00l\x00-\x00s\x00i\x00g\x00n\x00a\x00l\x00-\x00c\x00e\x00l\x00l\x00u\x00l\
-\x00a\x00r\x00-\x000\x00.\x00p\x00n\x00g\
-\x00\x1b\
-\x04\xb8jG\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00d\x00i\x00a\x00-\x00s\x00t\x00e\x00p\x00-\x00b\x00a\
-\x00c\x00k\x00w\x00a\x00r\x00d\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x09\xba\xdb\x07\
-\x00c\
-\x00i\x00l\x00-\x00p\x00h\x00o\x00n\x00e\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x0a\xbar\xc7\
-\x00c\
-\x00i\x00l\x00-\x00p\x00e\x00n\x00-\x00a\x00l\x00t\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x0e\xe8r\x07\
-\x00c\
-\x00i\x00l\x00-\x00m\x00o\x00o\x00d\x00-\x00v\x00e\x00r\x00y\x00-\x00g\x00o\x00o\
-\x00d\x00.\x00p\x00n\x00g\
-\x00\x18\
-\x08\xd95g\
-\x00c\
-\x00i\x00l\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00c\x00i\x00r\x00c\x00l\x00e\x00-\
-\x00t\x00o\x00p\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x0bZ\xb0'\
-\x00c\
-\x00i\x00l\x00-\x00d\x00o\x00o\x00r\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x05\x98\xb0g\
-\x00c\
-\x00i\x00l\x00-\x00c\x00a\x00s\x00t\x00.\x00p\x00n\x00g\
-\x00\x0a\
-\x00\xa3h\xa7\
-\x00c\
-\x00i\x00l\x00-\x004\x00k\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x0fC\x0f\x87\
-\x00c\
-\x00i\x00l\x00-\x00i\x00m\x00a\x00g\x00e\x00-\x00p\x00l\x00u\x00s\x00.\x00p\x00n\
-\x00g\
-\x00\x11\
-\x0c\x84-\xa7\
-\x00c\
-\x00i\x00l\x00-\x00s\x00i\x00z\x00e\x00-\x00g\x00r\x00i\x00p\x00.\x00p\x00n\x00g\
-\
-\x00\x13\
-\x07\x1d\xec\x87\
-\x00c\
-\x00i\x00l\x00-\x00v\x00i\x00e\x00w\x00-\x00m\x00o\x00d\x00u\x00l\x00e\x00.\x00p\
-\x00n\x00g\
-\x00\x15\
-\x07\xd2\xcd\x87\
-\x00c\
-\x00i\x00l\x00-\x00u\x00s\x00e\x00r\x00-\x00u\x00n\x00f\x00o\x00l\x00l\x00o\x00w\
-\x00.\x00p\x00n\x00g\
-\x00\x11\
-\x0c\xb8\xf2\x87\
-\x00c\
-\x00i\x00l\x00-\x00b\x00a\x00t\x00t\x00e\x00r\x00y\x00-\x005\x00.\x00p\x00n\x00g\
-\
-\x00\x0d\
-\x08d%'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00c\x00k\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x06 \x03\xa7\
-\x00c\
-\x00i\x00l\x00-\x00l\x00i\x00b\x00r\x00a\x00r\x00y\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x06B\x8e\xc7\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00d\x00i\x00a\x00-\x00s\x00t\x00o\x00p\x00.\x00p\x00n\
-\x00g\
-\x00\x1b\
-\x0c\xcbD\xa7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00d\x00o\x00u\x00b\x00l\
-\x00e\x00-\x00d\x00o\x00w\x00n\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x0c\x80\xbfg\
-\x00c\
-\x00i\x00l\x00-\x00l\x00e\x00v\x00e\x00l\x00-\x00u\x00p\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x0c\xf1\x90\x87\
-\x00c\
-\x00i\x00l\x00-\x00z\x00o\x00o\x00m\x00-\x00o\x00u\x00t\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x05-\xf1'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00t\x00o\x00p\x00.\x00p\
-\x00n\x00g\
-\x00\x14\
-\x01\xfc\x11G\
-\x00c\
-\x00i\x00l\x00-\x00j\x00u\x00s\x00t\x00i\x00f\x00y\x00-\x00l\x00e\x00f\x00t\x00.\
-\x00p\x00n\x00g\
-\x00\x12\
-\x00\xb0yG\
-\x00c\
-\x00i\x00l\x00-\x00c\x00a\x00r\x00e\x00t\x00-\x00l\x00e\x00f\x00t\x00.\x00p\x00n\
-\x00g\
-\x00\x0e\
-\x06\x17\x85\xa7\
-\x00c\
-\x00i\x00l\x00-\x00p\x00e\x00n\x00c\x00i\x00l\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x08Yh\x87\
-\x00c\
-\x00i\x00l\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00b\x00o\x00t\x00t\x00o\x00m\x00.\
-\x00p\x00n\x00g\
-\x00\x14\
-\x0a\xb6\xcf\xc7\
-\x00c\
-\x00i\x00l\x00-\x00e\x00x\x00p\x00a\x00n\x00d\x00-\x00r\x00i\x00g\x00h\x00t\x00.\
-\x00p\x00n\x00g\
-\x00\x0b\
-\x09y\xa9\xc7\
-\x00c\
-\x00i\x00l\x00-\x00r\x00s\x00s\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x09\xc3\x0c'\
-\x00c\
-\x00i\x00l\x00-\x00c\x00i\x00r\x00c\x00l\x00e\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x0d\xd5@\xa7\
-\x00c\
-\x00i\x00l\x00-\x00e\x00x\x00p\x00a\x00n\x00d\x00-\x00d\x00o\x00w\x00n\x00.\x00p\
-\x00n\x00g\
-\x00\x0c\
-\x05u\xbf\x07\
-\x00c\
-\x00i\x00l\x00-\x00l\x00i\x00n\x00k\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x0br&\xa7\
-\x00c\
-\x00i\x00l\x00-\x00a\x00l\x00a\x00r\x00m\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x09\xba*\xe7\
-\x00c\
-\x00i\x00l\x00-\x00m\x00e\x00d\x00i\x00a\x00-\x00e\x00j\x00e\x00c\x00t\x00.\x00p\
-\x00n\x00g\
-\x00\x13\
-\x05\xb6\xdb\x87\
-\x00c\
-\x00i\x00l\x00-\x00i\x00n\x00p\x00u\x00t\x00-\x00p\x00o\x00w\x00e\x00r\x00.\x00p\
-\x00n\x00g\
-\x00\x10\
-\x07O\xc0\x07\
-\x00c\
-\x00i\x00l\x00-\x00t\x00r\x00i\x00a\x00n\x00g\x00l\x00e\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x03H\xf1\xa7\
-\x00c\
-\x00i\x00l\x00-\x00e\x00t\x00h\x00e\x00r\x00n\x00e\x00t\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x0b\x85#\xc7\
-\x00c\
-\x00i\x00l\x00-\x00c\x00a\x00r\x00e\x00t\x00-\x00r\x00i\x00g\x00h\x00t\x00.\x00p\
-\x00n\x00g\
-\x00\x15\
-\x0dB\xa2G\
-\x00c\
-\x00i\x00l\x00-\x00b\x00a\x00t\x00t\x00e\x00r\x00y\x00-\x00s\x00l\x00a\x00s\x00h\
-\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x07\x97YG\
-\x00P\
-\x00y\x00D\x00r\x00a\x00c\x00u\x00l\x00a\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x05'\x86\xa7\
-\x00P\
-\x00y\x00D\x00r\x00a\x00c\x00u\x00l\x00a\x00_\x00v\x00e\x00r\x00t\x00i\x00c\x00a\
-\x00l\x00.\x00p\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x12\x00\x02\x00\x00\x00\x01\x00\x00\x00\x07\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x04\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x05\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00)\xe4\x00\x00\x00\x00\x00\x01\x00\x07Q9\
-\x00\x00\x01x7LB\x97\
-\x00\x00)\xc4\x00\x00\x00\x00\x00\x01\x00\x07G\x1d\
-\x00\x00\x01x7Dc\xe2\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x08\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x12\x00\x02\x00\x00\x00\xff\x00\x00\x00\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x0e\x1a\x00\x00\x00\x00\x00\x01\x00\x02g\xfa\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x14\xc6\x00\x00\x00\x00\x00\x01\x00\x03\x9a\x93\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x06\xb4\x00\x00\x00\x00\x00\x01\x00\x01\x1es\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0en\x00\x00\x00\x00\x00\x01\x00\x02v\x9d\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x03\x94\x00\x00\x00\x00\x00\x01\x00\x00\x97\xa0\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00#(\x00\x00\x00\x00\x00\x01\x00\x06\x16\xe0\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1f\xa2\x00\x00\x00\x00\x00\x01\x00\x05\x80\x87\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x04\x84\x00\x00\x00\x00\x00\x01\x00\x00\xc4\xb2\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00%4\x00\x00\x00\x00\x00\x01\x00\x06o\xe8\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00't\x00\x00\x00\x00\x00\x01\x00\x06\xd8\x0f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1d\xa0\x00\x00\x00\x00\x00\x01\x00\x05&\xd8\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x09\xc4\x00\x00\x00\x00\x00\x01\x00\x01\x9e\x99\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1f\xbc\x00\x00\x00\x00\x00\x01\x00\x05\x88,\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x12\x08\x00\x00\x00\x00\x00\x01\x00\x03\x15\x22\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x03f\x00\x00\x00\x00\x00\x01\x00\x00\x90m\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x02\xe4\x00\x00\x00\x00\x00\x01\x00\x00y\xf5\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x03\xde\x00\x00\x00\x00\x00\x01\x00\x00\xa6\x9b\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x10\x08\x00\x00\x00\x00\x00\x01\x00\x02\xc1E\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x15\xea\x00\x00\x00\x00\x00\x01\x00\x03\xc8o\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x02n\x00\x00\x00\x00\x00\x01\x00\x00cY\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xd1\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x19z\x00\x00\x00\x00\x00\x01\x00\x04k-\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00'F\x00\x00\x00\x00\x00\x01\x00\x06\xd0\xf5\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1e`\x00\x00\x00\x00\x00\x01\x00\x05Dr\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x09*\x00\x00\x00\x00\x00\x01\x00\x01\x87\xe3\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x18\x14\x00\x00\x00\x00\x00\x01\x00\x04'\x9f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x04\xee\x00\x00\x00\x00\x00\x01\x00\x00\xd3\xce\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00#v\x00\x00\x00\x00\x00\x01\x00\x06%g\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x15\xc8\x00\x00\x00\x00\x00\x01\x00\x03\xc7\x99\
-\x00\x00\x01x7zol\
-\x00\x00\x1f\x80\x00\x00\x00\x00\x00\x01\x00\x05x\xe4\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x10L\x00\x00\x00\x00\x00\x01\x00\x02\xc8\xec\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00)B\x00\x00\x00\x00\x00\x01\x00\x071\x15\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0cZ\x00\x00\x00\x00\x00\x01\x00\x02\x1d\xd3\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x11\xec\x00\x00\x00\x00\x00\x01\x00\x03\x0d\xaa\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x13~\x00\x00\x00\x00\x00\x01\x00\x03^\xa4\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x18\xa8\x00\x00\x00\x00\x00\x01\x00\x04F\x16\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00!\xbe\x00\x00\x00\x00\x00\x01\x00\x05\xdah\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x14\xfe\x00\x00\x00\x00\x00\x01\x00\x03\xa1\xd5\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0bL\x00\x00\x00\x00\x00\x01\x00\x01\xe9Q\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x04Z\x00\x00\x00\x00\x00\x01\x00\x00\xbd+\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x08\x1a\x00\x00\x00\x00\x00\x01\x00\x01Z\x16\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00#\xd8\x00\x00\x00\x00\x00\x01\x00\x064\xa2\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x14\x8e\x00\x00\x00\x00\x00\x01\x00\x03\x93?\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x18\x8e\x00\x00\x00\x00\x00\x01\x00\x04>[\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x15\x9e\x00\x00\x00\x00\x00\x01\x00\x03\xbf\xfc\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x07\x92\x00\x00\x00\x00\x00\x01\x00\x01C\xd7\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x19.\x00\x00\x00\x00\x00\x01\x00\x04\x5cu\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1b6\x00\x00\x00\x00\x00\x01\x00\x04\xbc\xe9\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0c.\x00\x00\x00\x00\x00\x01\x00\x02\x16K\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x05\xba\x00\x00\x00\x00\x00\x01\x00\x00\xf1\xd3\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x08h\x00\x00\x00\x00\x00\x01\x00\x01i\x9e\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x05\xe6\x00\x00\x00\x00\x00\x01\x00\x00\xf9X\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x17\xae\x00\x00\x00\x00\x00\x01\x00\x04\x11\xed\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x14&\x00\x00\x00\x00\x00\x01\x00\x03|d\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1dt\x00\x00\x00\x00\x00\x01\x00\x05\x1f\xb8\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x04<\x00\x00\x00\x00\x00\x01\x00\x00\xb5\xc0\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0a(\x00\x00\x00\x00\x00\x01\x00\x01\xad\xc6\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x18l\x00\x00\x00\x00\x00\x01\x00\x046\xd0\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x11:\x00\x00\x00\x00\x00\x01\x00\x02\xef\x1f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x06r\x00\x00\x00\x00\x00\x01\x00\x01\x0f=\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1c\xe2\x00\x00\x00\x00\x00\x01\x00\x05\x01A\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x19X\x00\x00\x00\x00\x00\x01\x00\x04d\x0f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00$\x10\x00\x00\x00\x00\x00\x01\x00\x06;\xa4\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x16|\x00\x00\x00\x00\x00\x01\x00\x03\xde\x13\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0b&\x00\x00\x00\x00\x00\x01\x00\x01\xe1\xb0\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x17\x86\x00\x00\x00\x00\x00\x01\x00\x04\x0a\x90\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x22\xc6\x00\x00\x00\x00\x00\x01\x00\x06\x07\x88\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x16j\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x15H\x00\x00\x00\x00\x00\x01\x00\x03\xb0\xe3\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0c\xdc\x00\x00\x00\x00\x00\x01\x00\x024u\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0e\xee\x00\x00\x00\x00\x00\x01\x00\x02\x8dx\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00'\x1a\x00\x00\x00\x00\x00\x01\x00\x06\xc9\x9f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x19\xf2\x00\x00\x00\x00\x00\x01\x00\x04\x81\x22\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x15 \x00\x00\x00\x00\x00\x01\x00\x03\xa9i\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1a\xdc\x00\x00\x00\x00\x00\x01\x00\x04\xae<\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0a\xa6\x00\x00\x00\x00\x00\x01\x00\x01\xc3\xe3\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x00T$\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1ap\x00\x00\x00\x00\x00\x01\x00\x04\x97T\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x15t\x00\x00\x00\x00\x00\x01\x00\x03\xb8h\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00(\x86\x00\x00\x00\x00\x00\x01\x00\x07\x0b\xbf\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1aH\x00\x00\x00\x00\x00\x01\x00\x04\x8f\xf6\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00%\x16\x00\x00\x00\x00\x00\x01\x00\x06h\x86\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x01\xa0\x00\x00\x00\x00\x00\x01\x00\x00=;\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1d\x0a\x00\x00\x00\x00\x00\x01\x00\x05\x08\xe1\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1e\xca\x00\x00\x00\x00\x00\x01\x00\x05SB\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00(\xf0\x00\x00\x00\x00\x00\x01\x00\x07\x22O\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0f<\x00\x00\x00\x00\x00\x01\x00\x02\x9c/\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x22\xf4\x00\x00\x00\x00\x00\x01\x00\x06\x0f-\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00#\xba\x00\x00\x00\x00\x00\x01\x00\x06-\x0f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00'\x9e\x00\x00\x00\x00\x00\x01\x00\x06\xdfP\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00&D\x00\x00\x00\x00\x00\x01\x00\x06\xa4\xd8\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x01l\x00\x00\x00\x00\x00\x01\x00\x005\xb2\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x17\xf4\x00\x00\x00\x00\x00\x01\x00\x04 \xfa\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00&h\x00\x00\x00\x00\x00\x01\x00\x06\xac/\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1ch\x00\x00\x00\x00\x00\x01\x00\x04\xf1*\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x01\xbe\x00\x00\x00\x00\x00\x01\x00\x00D\xdf\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x12X\x00\x00\x00\x00\x00\x01\x00\x03$\x16\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0a\xee\x00\x00\x00\x00\x00\x01\x00\x01\xd2\x88\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1b\x08\x00\x00\x00\x00\x00\x01\x00\x04\xb5a\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x09\x0a\x00\x00\x00\x00\x00\x01\x00\x01\x80?\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x16H\x00\x00\x00\x00\x00\x01\x00\x03\xd6\x93\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x09\x96\x00\x00\x00\x00\x00\x01\x00\x01\x96\xe8\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1e\x04\x00\x00\x00\x00\x00\x01\x00\x055\xa1\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x11\x1a\x00\x00\x00\x00\x00\x01\x00\x02\xee#\
-\x00\x00\x01x6\xa1k\xd1\
-\x00\x00%\xa0\x00\x00\x00\x00\x00\x01\x00\x06\x87\x00\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0eB\x00\x00\x00\x00\x00\x01\x00\x02oR\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00)\x1c\x00\x00\x00\x00\x00\x01\x00\x07)\xcb\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00!\xe4\x00\x00\x00\x00\x00\x01\x00\x05\xe2\x1e\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x01\xdc\x00\x00\x00\x00\x00\x01\x00\x00Lo\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x22p\x00\x00\x00\x00\x00\x01\x00\x05\xf8q\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x11V\x00\x00\x00\x00\x00\x01\x00\x02\xf6\x9a\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00!v\x00\x00\x00\x00\x00\x01\x00\x05\xcby\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00%\xcc\x00\x00\x00\x00\x00\x01\x00\x06\x8e\x9a\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1c\x1e\x00\x00\x00\x00\x00\x01\x00\x04\xe2n\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x14\x02\x00\x00\x00\x00\x00\x01\x00\x03t\xa7\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0f~\x00\x00\x00\x00\x00\x01\x00\x02\xa3\xbc\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x05\x1e\x00\x00\x00\x00\x00\x01\x00\x00\xdb@\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x11z\x00\x00\x00\x00\x00\x01\x00\x02\xfd\xd9\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x19\x04\x00\x00\x00\x00\x00\x01\x00\x04U\x06\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00'\xc0\x00\x00\x00\x00\x00\x01\x00\x06\xe6\xa7\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1bP\x00\x00\x00\x00\x00\x01\x00\x04\xc4r\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00&$\x00\x00\x00\x00\x00\x01\x00\x06\x9d\x8f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1a\x90\x00\x00\x00\x00\x00\x01\x00\x04\x9f\x01\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x08\x9c\x00\x00\x00\x00\x00\x01\x00\x01p;\
-\x00\x00\x01x7\x04\x91\x93\
-\x00\x00\x068\x00\x00\x00\x00\x00\x01\x00\x01\x08\x16\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x12\xca\x00\x00\x00\x00\x00\x01\x00\x039\x96\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0c\x86\x00\x00\x00\x00\x00\x01\x00\x02%q\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x12:\x00\x00\x00\x00\x00\x01\x00\x03\x1c\xa0\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x17\x00\x00\x00\x00\x00\x00\x01\x00\x03\xf4\xa1\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x16\x1c\x00\x00\x00\x00\x00\x01\x00\x03\xcf\x8d\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00 \xf2\x00\x00\x00\x00\x00\x01\x00\x05\xb5\x03\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1f \x00\x00\x00\x00\x00\x01\x00\x05bH\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x07X\x00\x00\x00\x00\x00\x01\x00\x014\xcc\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00$\xc2\x00\x00\x00\x00\x00\x01\x00\x06Y\x8b\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0f\xaa\x00\x00\x00\x00\x00\x01\x00\x02\xab\x02\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1fB\x00\x00\x00\x00\x00\x01\x00\x05j\x02\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x01\x1a\x00\x00\x00\x00\x00\x01\x00\x00&\x88\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x19\xc0\x00\x00\x00\x00\x00\x01\x00\x04z\x19\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x03F\x00\x00\x00\x00\x00\x01\x00\x00\x89\x0e\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00!F\x00\x00\x00\x00\x00\x01\x00\x05\xc4\x0c\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x18<\x00\x00\x00\x00\x00\x01\x00\x04/X\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x10\xd6\x00\x00\x00\x00\x00\x01\x00\x02\xdf\x07\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0f\xce\x00\x00\x00\x00\x00\x01\x00\x02\xb2\xb4\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00(\x1c\x00\x00\x00\x00\x00\x01\x00\x06\xf5<\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x03\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x9f-\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1cB\x00\x00\x00\x00\x00\x01\x00\x04\xe9\x8e\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x00H\x00\x00\x00\x00\x00\x01\x00\x00\x07f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00(\xc4\x00\x00\x00\x00\x00\x01\x00\x07\x1a\xed\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00$L\x00\x00\x00\x00\x00\x01\x00\x06B\xf0\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00(8\x00\x00\x00\x00\x00\x01\x00\x06\xfc\xe4\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0c\x02\x00\x00\x00\x00\x00\x01\x00\x02\x0e\xf9\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00#N\x00\x00\x00\x00\x00\x01\x00\x06\x1e1\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x07\xe4\x00\x00\x00\x00\x00\x01\x00\x01R\xe9\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x16\xe4\x00\x00\x00\x00\x00\x01\x00\x03\xed\x15\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x070\x00\x00\x00\x00\x00\x01\x00\x01-4\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1d(\x00\x00\x00\x00\x00\x01\x00\x05\x10i\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x14J\x00\x00\x00\x00\x00\x01\x00\x03\x84\x1e\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00'\xee\x00\x00\x00\x00\x00\x01\x00\x06\xed\xc8\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00$l\x00\x00\x00\x00\x00\x01\x00\x06JU\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x02\xc6\x00\x00\x00\x00\x00\x01\x00\x00r[\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0ar\x00\x00\x00\x00\x00\x01\x00\x01\xbcg\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0b\xdc\x00\x00\x00\x00\x00\x01\x00\x02\x07p\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1e0\x00\x00\x00\x00\x00\x01\x00\x05<\xff\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x17V\x00\x00\x00\x00\x00\x01\x00\x04\x03\x0b\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x07t\x00\x00\x00\x00\x00\x01\x00\x01<]\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x03\x16\x00\x00\x00\x00\x00\x01\x00\x00\x81U\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x07\xb4\x00\x00\x00\x00\x00\x01\x00\x01KM\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00!\x94\x00\x00\x00\x00\x00\x01\x00\x05\xd3\x0b\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x22\x1c\x00\x00\x00\x00\x00\x01\x00\x05\xe9\xe5\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x04\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xcc-\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00$\xf8\x00\x00\x00\x00\x00\x01\x00\x06aB\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x11\xce\x00\x00\x00\x00\x00\x01\x00\x03\x06B\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0aR\x00\x00\x00\x00\x00\x01\x00\x01\xb4\xf8\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1f`\x00\x00\x00\x00\x00\x01\x00\x05qu\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00(\xa4\x00\x00\x00\x00\x00\x01\x00\x07\x133\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0b\x96\x00\x00\x00\x00\x00\x01\x00\x01\xf8P\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0f\x10\x00\x00\x00\x00\x00\x01\x00\x02\x94\xa6\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00)h\x00\x00\x00\x00\x00\x01\x00\x078T\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0f\xec\x00\x00\x00\x00\x00\x01\x00\x02\xb9\xa7\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x08\xec\x00\x00\x00\x00\x00\x01\x00\x01x\xbd\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x13\xda\x00\x00\x00\x00\x00\x01\x00\x03m\x83\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0a\xd0\x00\x00\x00\x00\x00\x01\x00\x01\xcb\x0a\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1f\xe2\x00\x00\x00\x00\x00\x01\x00\x05\x8f\xe0\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1b\xbe\x00\x00\x00\x00\x00\x01\x00\x04\xd3d\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x16\xb8\x00\x00\x00\x00\x00\x01\x00\x03\xe5\x95\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00 \x8e\x00\x00\x00\x00\x00\x01\x00\x05\xa5\xea\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1d\xd6\x00\x00\x00\x00\x00\x01\x00\x05.Q\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00&\xce\x00\x00\x00\x00\x00\x01\x00\x06\xba\xe3\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00%x\x00\x00\x00\x00\x00\x01\x00\x06\x7f7\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x10\xae\x00\x00\x00\x00\x00\x01\x00\x02\xd7\x95\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x22\x94\x00\x00\x00\x00\x00\x01\x00\x05\xff\xf1\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1c\xba\x00\x00\x00\x00\x00\x01\x00\x04\xfa\x17\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0c\xb4\x00\x00\x00\x00\x00\x01\x00\x02,\xf8\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00%\xfc\x00\x00\x00\x00\x00\x01\x00\x06\x964\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1e\xf0\x00\x00\x00\x00\x00\x01\x00\x05Z\x93\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x11\xa6\x00\x00\x00\x00\x00\x01\x00\x03\x05\x92\
-\x00\x00\x01x7u\x98\xef\
-\x00\x00\x0d$\x00\x00\x00\x00\x00\x01\x00\x02C6\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xce\
-\x00\x00\x01x7{eJ\
-\x00\x00&\x92\x00\x00\x00\x00\x00\x01\x00\x06\xb3;\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x13\x12\x00\x00\x00\x00\x00\x01\x00\x03H\xc2\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x14l\x00\x00\x00\x00\x00\x01\x00\x03\x8b\x9f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00&\xf4\x00\x00\x00\x00\x00\x01\x00\x06\xc2\x09\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x00\xea\x00\x00\x00\x00\x00\x01\x00\x00\x1e\xca\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x13\xae\x00\x00\x00\x00\x00\x01\x00\x03e\xfd\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x13N\x00\x00\x00\x00\x00\x01\x00\x03W\x19\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1e\x92\x00\x00\x00\x00\x00\x01\x00\x05K\xbf\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x22N\x00\x00\x00\x00\x00\x01\x00\x05\xf1$\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1a\x22\x00\x00\x00\x00\x00\x01\x00\x04\x88\x91\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1b\x96\x00\x00\x00\x00\x00\x01\x00\x04\xcc\x17\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00)\x94\x00\x00\x00\x00\x00\x01\x00\x07?\x9f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x18\xca\x00\x00\x00\x00\x00\x01\x00\x04M\x83\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00 \x1c\x00\x00\x00\x00\x00\x01\x00\x05\x97\x07\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x10\xf6\x00\x00\x00\x00\x00\x01\x00\x02\xe6\x86\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x05D\x00\x00\x00\x00\x00\x01\x00\x00\xe2\xb3\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x06\xf4\x00\x00\x00\x00\x00\x01\x00\x01%~\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0b\xb6\x00\x00\x00\x00\x00\x01\x00\x01\xff\xd5\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00 \xbc\x00\x00\x00\x00\x00\x01\x00\x05\xad\x89\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x06\x1a\x00\x00\x00\x00\x00\x01\x00\x01\x00u\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0c\xfa\x00\x00\x00\x00\x00\x01\x00\x02;\xc7\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x17\xce\x00\x00\x00\x00\x00\x01\x00\x04\x19D\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x01<\x00\x00\x00\x00\x00\x01\x00\x00.\x10\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00(Z\x00\x00\x00\x00\x00\x01\x00\x07\x04S\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0d\xac\x00\x00\x00\x00\x00\x01\x00\x02X\xd9\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1b\xe8\x00\x00\x00\x00\x00\x01\x00\x04\xdb(\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x09V\x00\x00\x00\x00\x00\x01\x00\x01\x8f\xb4\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x12\x80\x00\x00\x00\x00\x00\x01\x00\x03+\x07\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x04\x10\x00\x00\x00\x00\x00\x01\x00\x00\xae\x1a\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1c\x94\x00\x00\x00\x00\x00\x01\x00\x04\xf8\xd1\
-\x00\x00\x01x7v\x9bG\
-\x00\x00\x0b\x0a\x00\x00\x00\x00\x00\x01\x00\x01\xda\x19\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00 V\x00\x00\x00\x00\x00\x01\x00\x05\x9eX\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0dV\x00\x00\x00\x00\x00\x01\x00\x02JZ\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x09\xf4\x00\x00\x00\x00\x00\x01\x00\x01\xa6\x1f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0d\xec\x00\x00\x00\x00\x00\x01\x00\x02`\x80\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00$\x90\x00\x00\x00\x00\x00\x01\x00\x06Q\xd6\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x08\xc4\x00\x00\x00\x00\x00\x01\x00\x01q\xc1\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x12\xac\x00\x00\x00\x00\x00\x01\x00\x032\x93\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x06\x94\x00\x00\x00\x00\x00\x01\x00\x01\x16\x9f\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x08<\x00\x00\x00\x00\x00\x01\x00\x01a\xd8\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x19\x98\x00\x00\x00\x00\x00\x01\x00\x04rk\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x02\x9a\x00\x00\x00\x00\x00\x01\x00\x00j\xc5\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0bh\x00\x00\x00\x00\x00\x01\x00\x01\xf0\xfc\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00%N\x00\x00\x00\x00\x00\x01\x00\x06w\x88\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x17&\x00\x00\x00\x00\x00\x01\x00\x03\xfb\xf8\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x136\x00\x00\x00\x00\x00\x01\x00\x03O\xe1\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00!\x22\x00\x00\x00\x00\x00\x01\x00\x05\xbcr\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1a\xb0\x00\x00\x00\x00\x00\x01\x00\x04\xa6\xbe\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x1dT\x00\x00\x00\x00\x00\x01\x00\x05\x18\x18\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x12\xf2\x00\x00\x00\x00\x00\x01\x00\x03A:\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x10v\x00\x00\x00\x00\x00\x01\x00\x02\xcf\xee\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x05v\x00\x00\x00\x00\x00\x01\x00\x00\xeaD\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0e\xa6\x00\x00\x00\x00\x00\x01\x00\x02~P\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x02N\x00\x00\x00\x00\x00\x01\x00\x00[\xa3\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0d\x82\x00\x00\x00\x00\x00\x01\x00\x02Q\x95\
-\x00\x00\x01v+M\xdd\xa0\
-\x00\x00\x0e\xce\x00\x00\x00\x00\x00\x01\x00\x02\x85\xc5\
-\x00\x00\x01v+M\xdd\xa0\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
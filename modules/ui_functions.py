@@ -14,16 +14,22 @@
 #
 # ///////////////////////////////////////////////////////////////
 
-# MAIN FILE
+# IMPORTS
 # ///////////////////////////////////////////////////////////////
-from main import *
+# 不再 from main import *：以 __main__ 启动时那样会把 main.py 再导入一遍
+from PySide6.QtCore import Qt, QEvent, QTimer, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup
+from PySide6.QtGui import QColor, QIcon
+from PySide6.QtWidgets import QGraphicsDropShadowEffect, QPushButton, QSizeGrip
+from widgets import CustomGrip
+from . app_settings import Settings
 
 # GLOBALS
 # ///////////////////////////////////////////////////////////////
 GLOBAL_STATE = False
 GLOBAL_TITLE_BAR = True
 
-class UIFunctions(MainWindow):
+# 方法的 self 是 MainWindow 实例，以 UIFunctions.xxx(window) 的形式调用
+class UIFunctions:
     # MAXIMIZE/RESTORE
     # ///////////////////////////////////////////////////////////////
     def maximize_restore(self):
@@ -1,27 +1,141 @@
 import time
+import queue
+import itertools
 import threading
-from PySide6.QtCore import QObject, Signal
-import pyautogui
+from concurrent.futures import Future
+import numpy as np
+from PySide6.QtCore import QObject, QThread, QCoreApplication, Signal
+from input_injector import get_default_injector
+from playback_scheduler import PlaybackScheduler
+from region_stability import wait_until_stable
+from trajectory_processing import prepare_trajectory
 
-# 确保鼠标操作安全，防止意外移动到屏幕边缘
-pyautogui.FAILSAFE = True
+# 没有 QGuiApplication 或无法取得刷新率时的轨迹回放频率（Hz）
+DEFAULT_PLAYBACK_RATE = 60.0
+
+def default_playback_rate():
+    """
+    返回主屏幕的刷新率，作为轨迹回放的注入频率
+
+    只在已经存在 QGuiApplication 时查询屏幕，不会为此加载 QtGui。
+
+    返回:
+        刷新率（Hz），无法取得时返回 DEFAULT_PLAYBACK_RATE
+    """
+    app = QCoreApplication.instance()
+    # QCoreApplication.instance() 返回实际的应用程序类型，只有 QGuiApplication 才有屏幕
+    screen = app.primaryScreen() if hasattr(app, "primaryScreen") else None
+    rate = screen.refreshRate() if screen is not None else 0
+    return rate if rate > 0 else DEFAULT_PLAYBACK_RATE
 
 class MouseActionSignals(QObject):
     """信号类，用于发送鼠标操作结果"""
     actionCompleted = Signal(bool, str)  # 成功/失败，消息
+    jitterReported = Signal(object)  # 每次回放后的 JitterReport
+    jobFinished = Signal(int, bool, str)  # 任务 ID，成功/失败，消息
+
+class JobCancelled(Exception):
+    """任务被取消"""
+
+class MouseJob:
+    """
+    执行器队列中的一个任务
+    """
+    
+    def __init__(self, job_id, priority, perform, args, done_message, settle):
+        """
+        初始化任务
+        
+        参数:
+            job_id: 任务 ID
+            priority: 优先级，数值越小越先执行
+            perform: 在工作线程中同步执行的方法
+            args: 传给 perform 的参数
+            done_message: 成功时的消息
+            settle: 执行前后是否等待选定区域稳定
+        """
+        self.job_id = job_id
+        self.priority = priority
+        self.perform = perform
+        self.args = args
+        self.done_message = done_message
+        self.settle = settle
+        # 完成时结果为 (成功/失败, 消息)
+        self.future = Future()
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """请求取消任务：排队中的任务不会再执行，正在执行的任务在下一个事件前停止"""
+        self._cancel_event.set()
+        self.future.cancel()
+    
+    def is_cancelled(self):
+        """是否已请求取消"""
+        return self._cancel_event.is_set()
+    
+    def __repr__(self):
+        return f"MouseJob(id={self.job_id}, priority={self.priority}, message={self.done_message!r})"
 
 class MouseActionExecutor:
     """
     鼠标操作执行器，用于根据保存的坐标执行鼠标操作
+    
+    所有操作都作为任务放入有界优先级队列，由一个常驻工作线程依次执行。
     """
     
-    def __init__(self):
-        """初始化鼠标操作执行器"""
+    def __init__(self, capture_engine=None, injector=None, max_pending=64, playback_rate=None):
+        """
+        初始化鼠标操作执行器
+        
+        参数:
+            capture_engine: RegionCaptureEngine 实例；提供时用“等待区域稳定”代替固定延时
+            injector: InputInjector 注入后端，默认在第一次执行时使用 get_default_injector()
+            max_pending: 队列中最多等待的任务数，队列满时提交会阻塞（背压；在 GUI 线程中提交时直接报错）
+            playback_rate: 轨迹回放的注入频率（Hz），默认使用主屏幕的刷新率
+        """
         self.signals = MouseActionSignals()
         self.actionCompleted = self.signals.actionCompleted
-        self.is_running = False
+        self.jitterReported = self.signals.jitterReported
+        self.jobFinished = self.signals.jobFinished
+        self.capture_engine = capture_engine
+        self._injector = injector
+        # 回放前轨迹简化的像素容差，以及重新采样的注入频率（与显示器刷新率一致）
+        self.simplify_tolerance = 1.0
+        self.playback_rate = playback_rate if playback_rate is not None else default_playback_rate()
+        # 按时间表精确注入事件，并记录每个事件的实际时间
+        self.scheduler = PlaybackScheduler()
+        
+        self._queue = queue.PriorityQueue(maxsize=max_pending)
+        self._job_ids = itertools.count(1)
+        self._jobs = {}
+        self._jobs_lock = threading.Lock()
+        self._worker = None
+        self._current_job = None
+        # 记录当前线程正在执行的任务，用于在事件之间检查取消
+        self._local = threading.local()
     
-    def execute_mouse_track(self, start_x, start_y, end_x, end_y, duration=0.5):
+    @property
+    def injector(self):
+        """鼠标事件注入后端，第一次使用时才创建"""
+        if self._injector is None:
+            self._injector = get_default_injector()
+        return self._injector
+    
+    @property
+    def is_running(self):
+        """是否有任务正在执行"""
+        return self._current_job is not None
+    
+    @property
+    def is_stopped(self):
+        """工作线程是否已经退出（或从未启动）"""
+        return self._worker is None or not self._worker.is_alive()
+    
+    def pending_count(self):
+        """排队中的任务数"""
+        return self._queue.qsize()
+    
+    def execute_mouse_track(self, start_x, start_y, end_x, end_y, duration=0.5, priority=0):
         """
         执行鼠标轨迹操作
         
@@ -31,75 +145,316 @@ class MouseActionExecutor:
             end_x: 结束点 x 坐标
             end_y: 结束点 y 坐标
             duration: 鼠标移动持续时间（秒）
+            priority: 优先级，数值越小越先执行
+        
+        返回:
+            MouseJob 任务
         """
-        if self.is_running:
-            self.signals.actionCompleted.emit(False, "操作正在执行中，请等待完成")
-            return
-            
-        # 使用线程执行鼠标操作，避免阻塞UI
-        thread = threading.Thread(
-            target=self._execute_mouse_track_thread,
-            args=(start_x, start_y, end_x, end_y, duration)
+        return self.submit(
+            self.perform_mouse_track,
+            (start_x, start_y, end_x, end_y, duration),
+            "鼠标轨迹操作完成",
+            priority=priority
         )
-        thread.daemon = True
-        thread.start()
     
-    def _execute_mouse_track_thread(self, start_x, start_y, end_x, end_y, duration):
+    def execute_mouse_trajectory(self, trajectory, priority=0):
         """
-        在线程中执行鼠标轨迹操作
+        按录制时的时间节奏回放完整的鼠标轨迹
         
         参数:
-            start_x: 起始点 x 坐标
-            start_y: 起始点 y 坐标
-            end_x: 结束点 x 坐标
-            end_y: 结束点 y 坐标
-            duration: 鼠标移动持续时间（秒）
+            trajectory: MouseTrajectory 实例
+            priority: 优先级，数值越小越先执行
+        
+        返回:
+            MouseJob 任务
+        """
+        return self.submit(self.perform_mouse_trajectory, (trajectory,), "鼠标轨迹回放完成", priority=priority)
+    
+    def execute_macro(self, program, trajectory=None, priority=0):
+        """
+        在工作线程中执行编译好的宏程序，步骤之间不经过 UI 线程
+        
+        参数:
+            program: compile_macro() 返回的 MacroProgram
+            trajectory: drag 步骤使用 "trajectory": true 时回放的 MouseTrajectory
+            priority: 优先级，数值越小越先执行
+        
+        返回:
+            MouseJob 任务
+        """
+        return self.submit(
+            program.run,
+            (self, self.capture_engine, trajectory),
+            f"宏 {program.name!r} 执行完成",
+            priority=priority,
+            settle=False
+        )
+    
+    def submit(self, perform, args=(), done_message="操作完成", priority=0, settle=True,
+               block=True, timeout=None):
         """
+        把任务放入队列，由工作线程按优先级依次执行
+        
+        perform 返回 (成功/失败, 消息) 元组时以它作为任务结果，否则视为成功并使用 done_message。
+        
+        参数:
+            perform: 在工作线程中同步执行的方法
+            args: 传给 perform 的参数
+            done_message: 成功时的消息
+            priority: 优先级，数值越小越先执行；相同优先级按提交顺序执行
+            settle: 执行前后是否等待选定区域稳定
+            block: 队列已满时是否阻塞等待；在 GUI 线程中提交时总是不阻塞
+            timeout: 阻塞等待的最长时间（秒）
+        
+        返回:
+            MouseJob 任务
+        
+        异常:
+            queue.Full: 队列已满且不阻塞、在 GUI 线程中提交或等待超时
+        """
+        if block and self._on_gui_thread():
+            # 正在执行的任务截图时要等 GUI 线程处理跨线程调用，GUI 线程在这里阻塞会互相等待而死锁
+            block = False
+        job = MouseJob(next(self._job_ids), priority, perform, args, done_message, settle)
+        with self._jobs_lock:
+            self._jobs[job.job_id] = job
+        self._ensure_worker()
         try:
-            self.is_running = True
-            
-            # 获取当前鼠标位置（可选，用于操作后恢复）
-            # original_position = pyautogui.position()
-            
-            # 执行前暂停一下，给主窗口最小化时间
-            time.sleep(0.5)
-            
-            # 移动鼠标到起始位置
-            print(f"移动鼠标到起始位置: ({start_x}, {start_y})")
-            pyautogui.moveTo(start_x, start_y, duration=0.2)
-            
-            # 鼠标左键按下
-            print("鼠标左键按下")
-            pyautogui.mouseDown()
-            
-            # 移动到结束位置
-            print(f"拖动到结束位置: ({end_x}, {end_y})")
-            pyautogui.moveTo(end_x, end_y, duration=duration)
-            
-            # 鼠标左键释放
-            print("鼠标左键释放")
-            pyautogui.mouseUp()
-            
-            # 操作完成后短暂延迟，确保操作完成
-            time.sleep(0.5)
+            self._queue.put((priority, job.job_id, job), block=block, timeout=timeout)
+        except queue.Full:
+            with self._jobs_lock:
+                self._jobs.pop(job.job_id, None)
+            raise queue.Full(f"任务队列已满（最多 {self._queue.maxsize} 个等待中的任务）") from None
+        return job
+    
+    @staticmethod
+    def _on_gui_thread():
+        """当前线程是否为 Qt 的 GUI（主）线程"""
+        app = QCoreApplication.instance()
+        return app is not None and QThread.currentThread() is app.thread()
+    
+    def cancel(self, job_id):
+        """
+        取消任务
+        
+        参数:
+            job_id: 任务 ID
+        
+        返回:
+            任务是否存在且尚未结束
+        """
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return False
+        job.cancel()
+        return True
+    
+    def cancel_all(self):
+        """取消所有排队中和正在执行的任务"""
+        with self._jobs_lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job.cancel()
+    
+    def check_cancelled(self):
+        """
+        在长时间运行的操作中调用：当前线程的任务已被取消时抛出 JobCancelled
+        """
+        job = getattr(self._local, "job", None)
+        if job is not None and job.is_cancelled():
+            raise JobCancelled(f"任务 {job.job_id} 已取消")
+    
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            # 常驻工作线程，避免每次操作都创建新线程
+            self._worker = threading.Thread(target=self._worker_loop, name="MouseActionWorker")
+            self._worker.daemon = True
+            self._worker.start()
+    
+    def _worker_loop(self):
+        while True:
+            _, _, job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._run_job(job)
+            finally:
+                self._queue.task_done()
+    
+    def shutdown(self, wait=True):
+        """
+        取消所有任务并停止工作线程
+        
+        参数:
+            wait: 是否等待工作线程退出
+        """
+        if self._worker is None:
+            return
+        self.cancel_all()
+        # 排队中的任务已经取消，直接移出队列；哨兵不能阻塞等待队列空位，
+        # 否则在 GUI 线程中调用时会与等待 GUI 线程截图的任务互相等待
+        while True:
+            self._drain_cancelled()
+            try:
+                # 哨兵任务使用最低优先级，排在所有任务之后
+                self._queue.put_nowait((float("inf"), next(self._job_ids), None))
+                break
+            except queue.Full:
+                # 其他线程在清空后又提交了任务
+                self.cancel_all()
+        if wait:
+            self._worker.join()
+    
+    def _drain_cancelled(self):
+        """取出队列中所有排队的任务，以已取消结束"""
+        while True:
+            try:
+                _, _, job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._queue.task_done()
+            if job is not None:
+                job.future.cancel()
+                self._finish_job(job, False, f"任务 {job.job_id} 已取消", emit_action=False)
+    
+    def _run_job(self, job):
+        """
+        在工作线程中执行一个任务
+        
+        参数:
+            job: MouseJob 任务
+        """
+        if not job.future.set_running_or_notify_cancel():
+            # 排队期间已被取消
+            self._finish_job(job, False, f"任务 {job.job_id} 已取消", emit_action=False)
+            return
+        self._current_job = job
+        self._local.job = job
+        try:
+            if job.settle:
+                # 执行前等待主窗口最小化完成
+                self.wait_for_settle()
             
-            # 操作完成
-            print("鼠标轨迹操作完成")
-            self.signals.actionCompleted.emit(True, "鼠标轨迹操作完成")
+            result = job.perform(*job.args)
             
-            # 移动回原位置（可选）
-            # pyautogui.moveTo(original_position.x, original_position.y, duration=0.2)
+            if job.settle:
+                # 操作完成后等待画面停止变化，确保操作完成
+                self.wait_for_settle()
             
+            if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], bool):
+                success, message = result
+            else:
+                success, message = True, job.done_message
+            print(message)
+            self._finish_job(job, success, message)
+        except JobCancelled as e:
+            print(str(e))
+            self._finish_job(job, False, str(e))
         except Exception as e:
             error_message = f"执行鼠标操作时出错: {str(e)}"
             print(error_message)
-            self.signals.actionCompleted.emit(False, error_message)
+            self._finish_job(job, False, error_message)
+        finally:
+            self._local.job = None
+            self._current_job = None
+    
+    def _finish_job(self, job, success, message, emit_action=True):
+        with self._jobs_lock:
+            self._jobs.pop(job.job_id, None)
+        if not job.future.done():
+            job.future.set_result((success, message))
+        self.signals.jobFinished.emit(job.job_id, success, message)
+        if emit_action:
+            self.signals.actionCompleted.emit(success, message)
+
+    def wait_for_settle(self, fallback_delay=0.5):
+        """
+        等待选定区域的画面稳定；没有可用的截图区域时退回到固定延时
+        
+        参数:
+            fallback_delay: 无法检测画面时使用的固定延时（秒）
+        """
+        if self.capture_engine is None or not self.capture_engine.is_valid():
+            time.sleep(fallback_delay)
+            return
+        stable, _, elapsed = wait_until_stable(self.capture_engine)
+        if not stable:
+            print(f"等待区域稳定超时（{elapsed:.0f} ms）")
+
+    def perform_mouse_track(self, start_x, start_y, end_x, end_y, duration=0.5):
+        """
+        在当前线程中同步执行一次拖动，不做任何前后等待
+
+        供宏引擎（战报宏、滚动截图）等已经运行在工作线程中的调用方使用
+        
+        参数:
+            start_x: 起始点 x 坐标
+            start_y: 起始点 y 坐标
+            end_x: 结束点 x 坐标
+            end_y: 结束点 y 坐标
+            duration: 鼠标移动持续时间（秒）
+        """
+        print(f"拖动: 从 ({start_x}, {start_y}) 到 ({end_x}, {end_y})")
+        # 按注入频率生成直线路径，每一帧注入一个移动事件
+        steps = max(1, int(round(duration * self.playback_rate)))
+        xs = np.rint(np.linspace(start_x, end_x, steps + 1)).astype(np.int32)
+        ys = np.rint(np.linspace(start_y, end_y, steps + 1)).astype(np.int32)
+        ts = np.linspace(0.0, duration, steps + 1)
+        self._play_drag(xs, ys, ts)
+
+    def perform_mouse_trajectory(self, trajectory):
+        """
+        在当前线程中同步回放完整轨迹：在起点按下，按录制的时间逐点移动，在终点释放
+        
+        回放前先简化轨迹并按 playback_rate 重新采样，减少注入的事件数量
+        
+        参数:
+            trajectory: MouseTrajectory 实例
+        """
+        if len(trajectory) < 2:
+            raise ValueError("鼠标轨迹点数不足，无法回放")
+        recorded = len(trajectory)
+        trajectory = prepare_trajectory(trajectory, self.simplify_tolerance, self.playback_rate)
+        
+        print(f"回放鼠标轨迹: 录制 {recorded} 个点，注入 {len(trajectory)} 个点, {trajectory.duration:.3f} 秒")
+        self._play_drag(trajectory.xs, trajectory.ys, trajectory.ts)
+
+    def _play_drag(self, xs, ys, ts, button="left"):
+        """
+        在第一个点按下鼠标，按时间表逐点移动，在最后一个点释放
+        
+        移动事件由 PlaybackScheduler 调度，回放结束后通过 jitterReported 发出抖动统计
+        
+        参数:
+            xs: x 坐标序列
+            ys: y 坐标序列
+            ts: 每个点相对开始的时间（秒）
+            button: 拖动使用的鼠标按钮
+        """
+        injector = self.injector
+        injector.move_to(xs[0], ys[0])
+        injector.mouse_down(button)
+        injector.flush()
+        
+        def move(i):
+            injector.move_to(xs[i], ys[i])
+            injector.flush()
+        
+        job = getattr(self._local, "job", None)
+        try:
+            report = self.scheduler.run(ts, move, should_stop=job.is_cancelled if job else None)
         finally:
-            self.is_running = False
+            # 无论是否被取消，都要释放按钮，避免鼠标保持按下状态
+            injector.mouse_up(button)
+            injector.flush()
+        print(f"回放时间抖动: {report}")
+        self.signals.jitterReported.emit(report)
+        self.check_cancelled()
 
 
 # 单次点击操作
-def click_at_position(x, y, button='left'):
+def click_at_position(x, y, button='left', injector=None):
     """
     在指定位置执行单次点击
     
@@ -107,12 +462,12 @@ def click_at_position(x, y, button='left'):
         x: 点击位置的 x 坐标
         y: 点击位置的 y 坐标
         button: 使用的鼠标按钮，默认为'left'（左键）
+        injector: InputInjector 注入后端，默认使用 get_default_injector()
     """
     try:
-        # 移动鼠标到指定位置
-        pyautogui.moveTo(x, y, duration=0.2)
-        # 执行点击
-        pyautogui.click(button=button)
+        if injector is None:
+            injector = get_default_injector()
+        injector.click(x, y, button)
         return True, "点击操作完成"
     except Exception as e:
-        return False, f"点击操作失败: {str(e)}" 
\ No newline at end of file
+        return False, f"点击操作失败: {str(e)}"
@@ -1,21 +1,37 @@
-from PySide6.QtCore import Qt, Signal, QObject, QPoint, QTimer
+from PySide6.QtCore import Qt, Signal, QObject, QPoint, QRect, QTimer
 from PySide6.QtGui import QScreen, QPixmap, QPainter, QPen, QColor
 from PySide6.QtWidgets import QApplication, QWidget
+from mouse_trajectory import MouseTrajectory
+from screenshot_cache import shared_screenshot_cache, create_dimmed_pixmap, paint_dimmed, source_rect
+
+# 遮罩颜色、轨迹线宽和端点标记半径
+DIM_COLOR = QColor(0, 0, 0, 50)
+LINE_WIDTH = 3
+MARKER_RADIUS = 5
+# 坐标信息文字的基线位置
+TEXT_LEFT = 10
+TEXT_BASELINES = (30, 50)
 
 class MouseTrackerSignals(QObject):
     """信号类，用于发送鼠标轨迹数据"""
     trackCompleted = Signal(int, int, int, int)  # start_x, start_y, end_x, end_y
     trackerClosed = Signal()  # 新增：跟踪器关闭信号
+    trajectoryCompleted = Signal(object)  # 完整轨迹 MouseTrajectory
 
 class MouseTracker(QWidget):
-    """鼠标轨迹跟踪器，捕获鼠标按下和释放的坐标"""
+    """鼠标轨迹跟踪器，捕获鼠标按下和释放的坐标，以及中间的完整移动轨迹"""
     
-    def __init__(self):
+    def __init__(self, screenshotCache=None):
+        """
+        参数:
+            screenshotCache: 截图缓存，默认使用全局共用的缓存
+        """
         super().__init__()
         # 创建信号对象
         self.signals = MouseTrackerSignals()
         self.trackCompleted = self.signals.trackCompleted
         self.trackerClosed = self.signals.trackerClosed
+        self.trajectoryCompleted = self.signals.trajectoryCompleted
         
         # 设置全屏无边框窗口
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
@@ -24,69 +40,164 @@ class MouseTracker(QWidget):
         
         # 设置透明背景
         self.setStyleSheet("background-color: rgba(0, 0, 0, 50);")
+        # paintEvent 会画满需要重绘的区域，不需要 Qt 先擦除背景
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        # 跟踪器隐藏后保留下来重复使用，关闭时不能让整个应用程序退出
+        self.setAttribute(Qt.WA_QuitOnClose, False)
         
         # 初始化轨迹坐标
         self.start_point = None
         self.current_point = None
         self.end_point = None
+        # 完整轨迹，记录每一次鼠标移动
+        self.trajectory = None
         
-        # 获取屏幕截图作为背景
+        # 背景截图在每次显示时获取，隐藏时交还给缓存
         screen = QApplication.primaryScreen()
-        self.screenshot = screen.grabWindow(0)
+        self.screenshotCache = screenshotCache or shared_screenshot_cache()
+        self.screenshot = None
+        self.dimmedScreenshot = None
+        
+        # 上一次绘制的轨迹线、标记和文字所占区域
+        self.overlayRect = QRect()
+        # 尚未重绘的区域；高回报率鼠标的一连串移动事件合并为每个显示帧最多一次重绘
+        self.pendingDirtyRect = QRect()
+        self.repaintTimer = QTimer(self)
+        self.repaintTimer.setSingleShot(True)
+        self.repaintTimer.setTimerType(Qt.PreciseTimer)
+        self.repaintTimer.setInterval(max(1, int(1000 / (screen.refreshRate() or 60))))
+        self.repaintTimer.timeout.connect(self.flushRepaint)
+        
+    def loadScreenshot(self):
+        """获取背景截图（刚截取过时直接复用缓存中的截图）并开始新的一次跟踪"""
+        if self.screenshot is not None:
+            return
+        self.screenshot = self.screenshotCache.acquire()
+        # 遮罩层在第一帧画完后才合成（buildDimmedLayer），不占用从点击到显示的时间
+        self.dimmedScreenshot = None
+        self.start_point = None
+        self.current_point = None
+        self.end_point = None
+        self.trajectory = None
+        self.overlayRect = QRect()
+        self.pendingDirtyRect = QRect()
+        
+    def buildDimmedLayer(self):
+        """合成预先变暗的截图，之后的绘制直接贴图"""
+        if self.screenshot is not None and self.dimmedScreenshot is None:
+            self.dimmedScreenshot = create_dimmed_pixmap(self.screenshot, DIM_COLOR)
+        
+    def showEvent(self, event):
+        # 主窗口在 show() 之前已调用 loadScreenshot()，这里只处理直接 show() 的情况：
+        # 显示之前跟踪器还没有映射到屏幕上，此时截取的是跟踪器下面的桌面
+        # 窗口管理器发来的显示事件（spontaneous）发生在映射之后，此时截图只会截到覆盖层本身
+        if not event.spontaneous():
+            self.loadScreenshot()
+        super().showEvent(event)
+        
+    def hideEvent(self, event):
+        # 每次跟踪结束（完成、取消、关闭窗口，或被窗口管理器隐藏/最小化）只在这里发出一次关闭信号
+        if self.screenshot is not None:
+            self.repaintTimer.stop()
+            self.releaseScreenshot()
+            self.signals.trackerClosed.emit()
+            if event.spontaneous():
+                # 被窗口管理器隐藏时本次跟踪同样结束，真正隐藏窗口，下次由 show() 重新开始
+                QTimer.singleShot(0, self, self.hide)
+        super().hideEvent(event)
+        
+    def coordinateTexts(self):
+        """返回起点和当前点的坐标信息文字"""
+        return (f"起点: ({self.start_point.x()}, {self.start_point.y()})",
+                f"当前点: ({self.current_point.x()}, {self.current_point.y()})")
+    
+    def computeOverlayRect(self):
+        """计算轨迹线、端点标记和坐标文字当前所占的区域"""
+        if not (self.start_point and self.current_point):
+            return QRect()
+        margin = MARKER_RADIUS + LINE_WIDTH
+        rect = QRect(self.start_point, self.current_point).normalized().adjusted(-margin, -margin, margin, margin)
+        metrics = self.fontMetrics()
+        for text, baseline in zip(self.coordinateTexts(), TEXT_BASELINES):
+            rect = rect.united(metrics.boundingRect(text).translated(TEXT_LEFT, baseline).adjusted(-1, -1, 1, 1))
+        return rect
+    
+    def scheduleRepaint(self):
+        """记录新旧叠加层的并集为待重绘区域，并在下一个显示帧统一重绘"""
+        newRect = self.computeOverlayRect()
+        self.pendingDirtyRect = self.pendingDirtyRect.united(self.overlayRect).united(newRect)
+        self.overlayRect = newRect
+        if not self.repaintTimer.isActive():
+            self.repaintTimer.start()
+    
+    def flushRepaint(self):
+        """重绘累计的待重绘区域"""
+        if not self.pendingDirtyRect.isEmpty():
+            self.update(self.pendingDirtyRect)
+        self.pendingDirtyRect = QRect()
+        
+    def releaseScreenshot(self):
+        """把截图交还给缓存并丢弃遮罩层，可以重复调用"""
+        if self.screenshot is not None:
+            self.screenshot = None
+            self.dimmedScreenshot = None
+            self.screenshotCache.release()
         
     def paintEvent(self, event):
+        if self.screenshot is None:
+            return
         painter = QPainter(self)
+        # 只重绘需要更新的区域
+        dirty = event.rect()
         
-        # 绘制背景截图
-        painter.drawPixmap(0, 0, self.screenshot)
-        
-        # 绘制半透明黑色遮罩
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 50))
+        # 绘制预先叠加了遮罩的背景截图
+        paint_dimmed(painter, dirty, self.screenshot, self.dimmedScreenshot, DIM_COLOR)
+        if self.dimmedScreenshot is None:
+            QTimer.singleShot(0, self, self.buildDimmedLayer)
         
         # 如果有起点和当前点，绘制轨迹线
         if self.start_point and self.current_point:
             # 设置绘制轨迹的笔
-            pen = QPen(QColor(255, 0, 0), 3)  # 红色，宽度为3
+            pen = QPen(QColor(255, 0, 0), LINE_WIDTH)  # 红色，宽度为3
             painter.setPen(pen)
             painter.drawLine(self.start_point, self.current_point)
             
             # 绘制起点和当前点的圆圈标记
             painter.setBrush(QColor(0, 255, 0))  # 绿色填充
-            painter.drawEllipse(self.start_point, 5, 5)  # 起点
+            painter.drawEllipse(self.start_point, MARKER_RADIUS, MARKER_RADIUS)  # 起点
             painter.setBrush(QColor(255, 0, 0))  # 红色填充
-            painter.drawEllipse(self.current_point, 5, 5)  # 当前点/终点
-            
-            # 显示坐标信息
-            painter.setPen(QColor(255, 255, 255))
-            start_text = f"起点: ({self.start_point.x()}, {self.start_point.y()})"
-            current_text = f"当前点: ({self.current_point.x()}, {self.current_point.y()})"
+            painter.drawEllipse(self.current_point, MARKER_RADIUS, MARKER_RADIUS)  # 当前点/终点
             
             # 在屏幕顶部显示坐标信息
-            painter.drawText(10, 30, start_text)
-            painter.drawText(10, 50, current_text)
+            painter.setPen(QColor(255, 255, 255))
+            for text, baseline in zip(self.coordinateTexts(), TEXT_BASELINES):
+                painter.drawText(TEXT_LEFT, baseline, text)
             
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             # 记录起点
             self.start_point = event.pos()
             self.current_point = event.pos()
-            self.update()
+            self.trajectory = MouseTrajectory()
+            self.trajectory.append(self.start_point.x(), self.start_point.y())
+            self.scheduleRepaint()
         elif event.button() == Qt.RightButton:
             # 右键取消
-            print("右键取消跟踪，发送关闭信号")
-            self.signals.trackerClosed.emit()
-            QTimer.singleShot(100, self.safeClose)
+            print("右键取消跟踪")
+            self.safeClose()
             
     def mouseMoveEvent(self, event):
         if self.start_point:
             # 更新当前点
             self.current_point = event.pos()
-            self.update()
+            self.trajectory.append(self.current_point.x(), self.current_point.y())
+            self.scheduleRepaint()
             
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton and self.start_point:
             # 记录终点
             self.end_point = event.pos()
+            self.trajectory.append(self.end_point.x(), self.end_point.y())
             
             # 发送信号
             start_x, start_y = self.start_point.x(), self.start_point.y()
@@ -94,40 +205,24 @@ class MouseTracker(QWidget):
             
             print(f"鼠标轨迹: 从 ({start_x}, {start_y}) 到 ({end_x}, {end_y})")
             self.signals.trackCompleted.emit(start_x, start_y, end_x, end_y)
+            print(f"记录完整轨迹: {len(self.trajectory)} 个点, {self.trajectory.duration:.3f} 秒")
+            self.signals.trajectoryCompleted.emit(self.trajectory)
             
-            # 发送关闭信号
-            print("发送轨迹完成信号，准备关闭跟踪器")
-            self.signals.trackerClosed.emit()
-            
-            # 安全关闭跟踪器
-            QTimer.singleShot(100, self.safeClose)
+            # 隐藏跟踪器（隐藏时发出关闭信号）
+            self.safeClose()
             
     def safeClose(self):
-        print("安全关闭鼠标跟踪器...")
-        try:
-            # 在关闭前再次发送信号
-            self.signals.trackerClosed.emit()
-            # 仅销毁此窗口而不是退出程序
-            self.deleteLater()
-        except Exception as e:
-            print(f"关闭鼠标跟踪器时出错: {str(e)}")
+        print("关闭鼠标跟踪器...")
+        # 仅隐藏此窗口，下次跟踪时直接重新显示；关闭信号在 hideEvent 中发出
+        self.hide()
             
     def closeEvent(self, event):
-        print("鼠标跟踪器正在关闭...")
-        try:
-            # 再次发送关闭信号，以防万一
-            self.signals.trackerClosed.emit()
-            # 接受关闭事件但不传播到整个应用程序
-            event.accept()
-            super().closeEvent(event)
-        except Exception as e:
-            print(f"处理关闭事件时出错: {str(e)}")
-            # 确保事件被接受
-            event.accept()
+        # 接受关闭事件但不传播到整个应用程序，关闭信号由随后的 hideEvent 发出
+        event.accept()
+        super().closeEvent(event)
             
     def keyPressEvent(self, event):
         # 按ESC键取消
         if event.key() == Qt.Key_Escape:
-            print("按ESC取消跟踪，发送关闭信号")
-            self.signals.trackerClosed.emit()
-            QTimer.singleShot(100, self.safeClose) 
\ No newline at end of file
+            print("按ESC取消跟踪")
+            self.safeClose() 
\ No newline at end of file
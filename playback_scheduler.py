@@ -0,0 +1,116 @@
+import time
+import numpy as np
+
+
+class JitterReport:
+    """
+    一次回放的时间抖动统计
+
+    jitter 为每个事件实际执行时间与计划时间之差（毫秒，正数表示晚于计划）
+    """
+
+    def __init__(self, planned, actual):
+        """
+        初始化抖动统计
+
+        参数:
+            planned: 每个事件的计划时间（秒，相对回放开始）
+            actual: 每个事件的实际时间（秒，相对回放开始）
+        """
+        self.planned = np.asarray(planned, dtype=np.float64)
+        self.actual = np.asarray(actual, dtype=np.float64)
+        self.jitter = (self.actual - self.planned) * 1000
+
+    @property
+    def count(self):
+        return len(self.jitter)
+
+    def percentile(self, q):
+        """返回抖动绝对值的第 q 百分位（毫秒）"""
+        if self.count == 0:
+            return 0.0
+        return float(np.percentile(np.abs(self.jitter), q))
+
+    @property
+    def p50(self):
+        return self.percentile(50)
+
+    @property
+    def p99(self):
+        return self.percentile(99)
+
+    @property
+    def max(self):
+        return float(np.max(np.abs(self.jitter))) if self.count else 0.0
+
+    def to_dict(self):
+        """以字典形式返回统计结果，便于输出 JSON"""
+        return {
+            "events": self.count,
+            "p50_ms": round(self.p50, 4),
+            "p99_ms": round(self.p99, 4),
+            "max_ms": round(self.max, 4),
+        }
+
+    def __str__(self):
+        return f"{self.count} 个事件, 抖动 p50={self.p50:.3f} ms, p99={self.p99:.3f} ms, max={self.max:.3f} ms"
+
+
+class PlaybackScheduler:
+    """
+    高精度回放调度器
+
+    先用 time.sleep 睡到截止时间前 spin_threshold 秒，最后这一小段忙等，
+    避免操作系统调度导致的睡眠过头。每个事件的计划/实际时间都会记录下来。
+    """
+
+    def __init__(self, spin_threshold=0.001):
+        """
+        初始化回放调度器
+
+        参数:
+            spin_threshold: 截止时间前改为忙等的时长（秒）
+        """
+        self.spin_threshold = spin_threshold
+        self.last_report = None
+
+    def wait_until(self, deadline):
+        """
+        等待到 time.perf_counter() 达到 deadline
+
+        参数:
+            deadline: 截止时间（time.perf_counter 的秒数）
+        """
+        remaining = deadline - time.perf_counter()
+        if remaining > self.spin_threshold:
+            time.sleep(remaining - self.spin_threshold)
+        while time.perf_counter() < deadline:
+            pass
+
+    def run(self, times, action, should_stop=None):
+        """
+        按时间表依次执行事件
+
+        参数:
+            times: 每个事件相对开始的计划时间（秒，递增）
+            action: 执行第 i 个事件的回调 action(i)
+            should_stop: 可选的回调，返回 True 时在下一个事件前停止
+
+        返回:
+            JitterReport，只包含已经执行的事件
+        """
+        count = len(times)
+        planned = np.empty(count, dtype=np.float64)
+        actual = np.empty(count, dtype=np.float64)
+        executed = 0
+        start = time.perf_counter()
+        for i in range(count):
+            if should_stop is not None and should_stop():
+                break
+            self.wait_until(start + times[i])
+            actual[i] = time.perf_counter() - start
+            planned[i] = times[i]
+            action(i)
+            executed += 1
+        self.last_report = JitterReport(planned[:executed], actual[:executed])
+        return self.last_report
@@ -0,0 +1,239 @@
+import time
+import sqlite3
+import threading
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    resolution TEXT NOT NULL DEFAULT '',
+    area_x INTEGER NOT NULL DEFAULT 0,
+    area_y INTEGER NOT NULL DEFAULT 0,
+    area_width INTEGER NOT NULL DEFAULT 0,
+    area_height INTEGER NOT NULL DEFAULT 0,
+    start_x INTEGER NOT NULL DEFAULT 0,
+    start_y INTEGER NOT NULL DEFAULT 0,
+    end_x INTEGER NOT NULL DEFAULT 0,
+    end_y INTEGER NOT NULL DEFAULT 0,
+    trajectory BLOB,
+    updated_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_profiles_name_resolution ON profiles (name, resolution);
+CREATE INDEX IF NOT EXISTS idx_profiles_resolution ON profiles (resolution);
+CREATE TABLE IF NOT EXISTS profile_tags (
+    tag TEXT NOT NULL,
+    profile_id INTEGER NOT NULL REFERENCES profiles (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, profile_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_profile_tags_profile ON profile_tags (profile_id);
+"""
+
+# 区域和拖动轨迹字段与 ConfigManager 返回的字典键的对应关系
+AREA_COLUMNS = {"x": "area_x", "y": "area_y", "width": "area_width", "height": "area_height"}
+TRACK_COLUMNS = {"start_x": "start_x", "start_y": "start_y", "end_x": "end_x", "end_y": "end_y"}
+
+
+class ProfileStore:
+    """
+    基于 SQLite 的区域/轨迹配置档案存储
+
+    每个档案由 (名称, 分辨率) 唯一确定，保存一个选定区域、一条拖动轨迹和可选的完整鼠标轨迹。
+    数据库使用 WAL 模式；按名称+分辨率、分辨率、标签查找都走 B 树索引，
+    档案数量增长时读写仍为 O(log n)，保存一个档案只更新一行而不是重写整个文件。
+    """
+
+    def __init__(self, db_path):
+        """
+        打开（必要时创建）档案数据库
+
+        参数:
+            db_path: SQLite 数据库文件路径
+        """
+        self.db_path = db_path
+        # 执行器工作线程和主线程都可能访问，同一连接由锁串行化
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                               (str(SCHEMA_VERSION),))
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def get_meta(self, key, default=None):
+        """读取元数据"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    def set_meta(self, key, value):
+        """写入元数据"""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def get_profile(self, name, resolution=""):
+        """
+        读取一个档案
+
+        参数:
+            name: 档案名称
+            resolution: 分辨率，例如 "2560x1440"，空字符串表示不区分分辨率
+
+        返回:
+            档案字典（含 selected_area、mouse_track、tags），不存在时返回 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM profiles WHERE name = ? AND resolution = ?", (name, resolution)).fetchone()
+            if row is None:
+                return None
+            tags = [r["tag"] for r in self._conn.execute(
+                "SELECT tag FROM profile_tags WHERE profile_id = ? ORDER BY tag", (row["id"],))]
+        return self._to_dict(row, tags)
+
+    @staticmethod
+    def _to_dict(row, tags=None):
+        profile = {
+            "name": row["name"],
+            "resolution": row["resolution"],
+            "selected_area": {key: row[column] for key, column in AREA_COLUMNS.items()},
+            "mouse_track": {key: row[column] for key, column in TRACK_COLUMNS.items()},
+            "has_trajectory": bool(row["trajectory"]),
+            "updated_at": row["updated_at"],
+        }
+        if tags is not None:
+            profile["tags"] = tags
+        return profile
+
+    def _upsert(self, name, resolution, columns):
+        """插入档案或只更新给定的列"""
+        columns = dict(columns, updated_at=time.time())
+        names = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns)
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO profiles (name, resolution, {names}) VALUES (?, ?, {placeholders}) "
+                f"ON CONFLICT (name, resolution) DO UPDATE SET {updates}",
+                (name, resolution, *columns.values()))
+
+    def save_selected_area(self, name, resolution, area):
+        """
+        保存档案的选定区域
+
+        参数:
+            name: 档案名称
+            resolution: 分辨率
+            area: 包含 x, y, width, height 的字典
+        """
+        self._upsert(name, resolution, {column: int(area[key]) for key, column in AREA_COLUMNS.items()})
+
+    def save_mouse_track(self, name, resolution, track):
+        """
+        保存档案的拖动轨迹
+
+        参数:
+            name: 档案名称
+            resolution: 分辨率
+            track: 包含 start_x, start_y, end_x, end_y 的字典
+        """
+        self._upsert(name, resolution, {column: int(track[key]) for key, column in TRACK_COLUMNS.items()})
+
+    def get_trajectory_bytes(self, name, resolution=""):
+        """
+        读取档案的完整鼠标轨迹
+
+        返回:
+            MouseTrajectory.to_bytes() 格式的字节串，没有时返回 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT trajectory FROM profiles WHERE name = ? AND resolution = ?", (name, resolution)).fetchone()
+        return bytes(row["trajectory"]) if row and row["trajectory"] is not None else None
+
+    def save_trajectory_bytes(self, name, resolution, data):
+        """
+        保存档案的完整鼠标轨迹
+
+        参数:
+            name: 档案名称
+            resolution: 分辨率
+            data: MouseTrajectory.to_bytes() 的结果
+        """
+        self._upsert(name, resolution, {"trajectory": sqlite3.Binary(data)})
+
+    def set_tags(self, name, resolution, tags):
+        """
+        设置档案的标签（替换原有标签），档案不存在时先创建
+
+        参数:
+            name: 档案名称
+            resolution: 分辨率
+            tags: 标签列表
+        """
+        self._upsert(name, resolution, {})
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                (profile_id,) = self._conn.execute(
+                    "SELECT id FROM profiles WHERE name = ? AND resolution = ?", (name, resolution)).fetchone()
+                self._conn.execute("DELETE FROM profile_tags WHERE profile_id = ?", (profile_id,))
+                self._conn.executemany("INSERT OR IGNORE INTO profile_tags (tag, profile_id) VALUES (?, ?)",
+                                       [(tag, profile_id) for tag in tags])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def list_profiles(self, resolution=None, tag=None):
+        """
+        列出档案（不含轨迹数据），可按分辨率和标签过滤
+
+        参数:
+            resolution: 只列出该分辨率的档案
+            tag: 只列出带有该标签的档案
+
+        返回:
+            按名称排序的档案字典列表
+        """
+        query = ("SELECT p.id, p.name, p.resolution, p.area_x, p.area_y, p.area_width, p.area_height, "
+                 "p.start_x, p.start_y, p.end_x, p.end_y, p.trajectory IS NOT NULL AS trajectory, p.updated_at "
+                 "FROM profiles p")
+        conditions, params = [], []
+        if tag is not None:
+            query += " JOIN profile_tags t ON t.profile_id = p.id"
+            conditions.append("t.tag = ?")
+            params.append(tag)
+        if resolution is not None:
+            conditions.append("p.resolution = ?")
+            params.append(resolution)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY p.name, p.resolution"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def delete_profile(self, name, resolution=""):
+        """
+        删除档案及其标签
+
+        返回:
+            是否删除了档案
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM profiles WHERE name = ? AND resolution = ?", (name, resolution))
+        return cursor.rowcount > 0
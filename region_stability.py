@@ -0,0 +1,162 @@
+import time
+import zlib
+import numpy as np
+from PySide6.QtCore import Qt, QObject, QTimer, Signal
+
+
+class StabilityDetector:
+    """
+    区域稳定检测器
+
+    每一帧先计算稀疏网格像素的校验和，只有校验和保持不变达到 stable_ms 之后，
+    才与静止期开始时的参考帧做一次整帧比较来确认。
+    大多数帧只需要读取 1/(grid_step^2) 的像素。
+    """
+
+    def __init__(self, stable_ms=150, grid_step=16):
+        """
+        初始化稳定检测器
+
+        参数:
+            stable_ms: 画面保持不变多久（毫秒）视为稳定
+            grid_step: 稀疏采样网格的间距（像素）
+        """
+        self.stable_ms = stable_ms
+        self.grid_step = grid_step
+        self.reset()
+
+    def reset(self):
+        """清除历史状态，重新开始检测"""
+        self._checksum = None
+        self._reference = None
+        self._quiet_since = None
+
+    def _sparse_checksum(self, frame):
+        sample = np.ascontiguousarray(frame.pixels[::self.grid_step, ::self.grid_step])
+        return zlib.crc32(sample)
+
+    def feed(self, frame, now=None):
+        """
+        输入一帧截图
+
+        参数:
+            frame: CaptureFrame 截图帧
+            now: 当前时间（秒，time.perf_counter），默认使用帧的时间戳
+
+        返回:
+            画面是否已稳定
+        """
+        if now is None:
+            now = frame.timestamp
+        checksum = self._sparse_checksum(frame)
+        if checksum != self._checksum:
+            # 稀疏网格发生变化，重新开始计时
+            self._checksum = checksum
+            self._reference = frame
+            self._quiet_since = now
+            return False
+
+        if (now - self._quiet_since) * 1000 < self.stable_ms:
+            return False
+
+        # 稀疏网格已静止足够久，用整帧比较确认，避免漏掉网格之间的变化
+        if np.array_equal(frame.pixels, self._reference.pixels):
+            return True
+        self._reference = frame
+        self._quiet_since = now
+        return False
+
+
+def wait_until_stable(capture_engine, stable_ms=150, timeout_ms=3000, poll_ms=15, grid_step=16):
+    """
+    阻塞等待，直到选定区域的画面停止变化
+
+    用于工作线程（截图会自动转发到 GUI 线程）；在 GUI 线程中请使用 RegionStabilityWatcher。
+
+    参数:
+        capture_engine: RegionCaptureEngine 实例
+        stable_ms: 画面保持不变多久（毫秒）视为稳定
+        timeout_ms: 最长等待时间（毫秒）
+        poll_ms: 轮询间隔（毫秒）
+        grid_step: 稀疏采样网格的间距（像素）
+
+    返回:
+        (是否稳定, 最后一帧, 实际等待毫秒数)
+    """
+    detector = StabilityDetector(stable_ms, grid_step)
+    start = time.perf_counter()
+    deadline = start + timeout_ms / 1000
+    frame = None
+    while True:
+        frame = capture_engine.capture_frame()
+        if frame is None:
+            return False, None, (time.perf_counter() - start) * 1000
+        if detector.feed(frame):
+            return True, frame, (time.perf_counter() - start) * 1000
+        now = time.perf_counter()
+        if now >= deadline:
+            return False, frame, (now - start) * 1000
+        time.sleep(min(poll_ms / 1000, deadline - now))
+
+
+class RegionStabilitySignals(QObject):
+    """信号类，用于发送区域稳定检测结果"""
+    regionStable = Signal(object, float)  # 最后一帧 CaptureFrame，等待毫秒数
+    waitTimedOut = Signal(float)  # 等待毫秒数
+
+
+class RegionStabilityWatcher:
+    """
+    事件驱动的区域稳定等待器，在 GUI 线程中用 QTimer 轮询，不阻塞事件循环
+    """
+
+    def __init__(self, capture_engine, stable_ms=150, timeout_ms=3000, poll_ms=15, grid_step=16):
+        """
+        初始化区域稳定等待器
+
+        参数:
+            capture_engine: RegionCaptureEngine 实例
+            stable_ms: 画面保持不变多久（毫秒）视为稳定
+            timeout_ms: 最长等待时间（毫秒）
+            poll_ms: 轮询间隔（毫秒）
+            grid_step: 稀疏采样网格的间距（像素）
+        """
+        self.signals = RegionStabilitySignals()
+        self.regionStable = self.signals.regionStable
+        self.waitTimedOut = self.signals.waitTimedOut
+
+        self.capture_engine = capture_engine
+        self.timeout_ms = timeout_ms
+        self.detector = StabilityDetector(stable_ms, grid_step)
+        self._start = None
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(poll_ms)
+        self._timer.timeout.connect(self._poll)
+
+    def start(self):
+        """开始等待，结果通过 regionStable 或 waitTimedOut 信号发出"""
+        self.detector.reset()
+        self._start = time.perf_counter()
+        self._timer.start()
+        self._poll()
+
+    def cancel(self):
+        """取消等待，不发送任何信号"""
+        self._timer.stop()
+
+    def is_waiting(self):
+        """是否正在等待"""
+        return self._timer.isActive()
+
+    def _poll(self):
+        if not self._timer.isActive():
+            return
+        frame = self.capture_engine.capture_frame()
+        elapsed = (time.perf_counter() - self._start) * 1000
+        if frame is not None and self.detector.feed(frame):
+            self._timer.stop()
+            self.signals.regionStable.emit(frame, elapsed)
+        elif frame is None or elapsed >= self.timeout_ms:
+            self._timer.stop()
+            self.signals.waitTimedOut.emit(elapsed)
@@ -0,0 +1,201 @@
+import tempfile
+import numpy as np
+from PySide6.QtGui import QImage
+
+# 行哈希使用的固定随机权重（奇数，保证每个像素都参与混合）
+_WEIGHT_SEED = 0x5EED
+_weights_cache = {}
+
+
+def _row_weights(width):
+    weights = _weights_cache.get(width)
+    if weights is None:
+        rng = np.random.default_rng(_WEIGHT_SEED)
+        weights = rng.integers(1, 2 ** 63, size=width, dtype=np.uint64) | np.uint64(1)
+        _weights_cache[width] = weights
+    return weights
+
+
+def row_hashes(pixels):
+    """
+    计算每一行像素的哈希值（向量化）
+
+    参数:
+        pixels: (height, width) 的 uint32 像素数组，例如 CaptureFrame.pixels
+
+    返回:
+        长度为 height 的 uint64 数组
+    """
+    weights = _row_weights(pixels.shape[1])
+    # uint64 乘法和求和按 2^64 取模回绕，相当于一个多项式哈希
+    return (pixels.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+
+
+def find_overlap(prev_hashes, cur_hashes, min_overlap=8):
+    """
+    查找上一帧底部与当前帧顶部重叠的行数
+
+    只在上一帧中与当前帧第一行哈希相同的位置上做候选，
+    再用数组整体比较验证，不逐像素循环。
+
+    参数:
+        prev_hashes: 上一帧的行哈希
+        cur_hashes: 当前帧的行哈希
+        min_overlap: 认定为有效重叠的最少行数
+
+    返回:
+        重叠行数，没有找到可靠重叠时返回 0
+    """
+    prev_height = len(prev_hashes)
+    cur_height = len(cur_hashes)
+    candidates = np.flatnonzero(prev_hashes == cur_hashes[0])
+    # 候选偏移从小到大，即重叠从大到小，优先选择最大的重叠
+    for offset in candidates:
+        overlap = min(prev_height - offset, cur_height)
+        if overlap < min_overlap:
+            break
+        if np.array_equal(prev_hashes[offset:offset + overlap], cur_hashes[:overlap]):
+            return int(overlap)
+    return 0
+
+
+class ReportStitcher:
+    """
+    战报长图拼接器（流式）
+
+    每加入一帧只把与上一帧不重叠的新行追加到磁盘上的原始像素文件，
+    内存中只保留上一帧的行哈希，帧本身在重叠确定后即可释放。
+    无论战报有多少页，内存占用都约等于两帧。
+    """
+
+    def __init__(self, min_overlap=8, buffer_file=None):
+        """
+        初始化拼接器
+
+        参数:
+            min_overlap: 认定为有效重叠的最少行数
+            buffer_file: 保存像素行的文件路径，默认使用自动删除的临时文件
+        """
+        self.min_overlap = min_overlap
+        self.width = None
+        self.height = 0
+        self.frame_count = 0
+        self._prev_hashes = None
+        if buffer_file is None:
+            self._file = tempfile.TemporaryFile()
+        else:
+            self._file = open(buffer_file, "w+b")
+
+    def push(self, frame):
+        """
+        加入一帧截图
+
+        参数:
+            frame: CaptureFrame 截图帧
+
+        返回:
+            本帧新增的行数；返回 0 表示与上一帧完全相同（已滚动到底部）
+        """
+        pixels = frame.pixels
+        if self.width is None:
+            self.width = frame.width
+        elif frame.width != self.width:
+            raise ValueError(f"帧宽度不一致: {frame.width} != {self.width}")
+
+        hashes = row_hashes(pixels)
+        if self._prev_hashes is None:
+            overlap = 0
+        elif np.array_equal(hashes, self._prev_hashes):
+            return 0
+        else:
+            overlap = find_overlap(self._prev_hashes, hashes, self.min_overlap)
+
+        # 新行直接从截图缓冲区写入文件，不在内存中累积
+        new_rows = np.ascontiguousarray(frame.array[overlap:])
+        self._file.write(new_rows.data)
+        self._prev_hashes = hashes
+        self.height += len(new_rows)
+        self.frame_count += 1
+        return len(new_rows)
+
+    def consume(self, frames, on_page=None):
+        """
+        从生成器中逐帧读取并拼接，遇到与上一帧相同的帧时停止
+
+        参数:
+            frames: 产生 CaptureFrame 的可迭代对象（通常是生成器）
+            on_page: 每处理一帧后的回调 on_page(页码, 新增行数)
+
+        返回:
+            是否因为连续两帧相同（到达底部）而停止
+        """
+        for page, frame in enumerate(frames):
+            new_rows = self.push(frame)
+            # 重叠已经确定，立即释放本帧
+            del frame
+            if on_page is not None:
+                on_page(page, new_rows)
+            if page > 0 and new_rows == 0:
+                if hasattr(frames, "close"):
+                    frames.close()
+                return True
+        return False
+
+    def result(self):
+        """
+        返回拼接后的长图（内存映射，只在访问时按需读入）
+
+        返回:
+            (height, width, 4) 的只读 uint8 np.memmap，没有任何帧时返回 None
+        """
+        if self.height == 0:
+            return None
+        self._file.flush()
+        return np.memmap(self._file, dtype=np.uint8, mode="r",
+                         shape=(self.height, self.width, 4))
+
+    def save(self, path):
+        """
+        把拼接结果保存为图片文件
+
+        参数:
+            path: 输出文件路径，格式由扩展名决定（如 .png）
+
+        返回:
+            是否保存成功
+        """
+        stitched = self.result()
+        if stitched is None:
+            return False
+        # QImage 直接引用内存映射，编码时按需读页，不复制整张长图
+        image = QImage(stitched.data, self.width, self.height, self.width * 4, QImage.Format_RGB32)
+        saved = image.save(path)
+        del image
+        return saved
+
+    def close(self):
+        """关闭并释放像素缓冲文件"""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def array_to_image(array):
+    """
+    把 (height, width, 4) 的 uint8 数组（CaptureFrame 的像素格式）转换为 QImage
+
+    参数:
+        array: 像素数组
+
+    返回:
+        拥有独立内存的 QImage
+    """
+    array = np.ascontiguousarray(array)
+    height, width = array.shape[:2]
+    image = QImage(array.data, width, height, width * 4, QImage.Format_RGB32)
+    # QImage 不拥有 array 的内存，复制一份以免数组释放后失效
+    return image.copy()
@@ -0,0 +1,191 @@
+from PySide6.QtCore import Qt, QObject, QRect, QThread, QTimer, Signal, Slot
+from PySide6.QtGui import QGuiApplication
+from capture_frame import CaptureFrame
+
+
+class RegionCaptureSignals(QObject):
+    """信号类，用于发送区域截图结果"""
+    frameCaptured = Signal(object)  # CaptureFrame
+    captureStopped = Signal()
+
+
+class _CaptureInvoker(QObject):
+    """
+    截图调用转发器
+
+    QPixmap 只能在 GUI 线程中使用，工作线程通过 BlockingQueuedConnection
+    把截图请求转发到 GUI 线程执行，并在返回前拿到结果。
+    """
+    requested = Signal(object)
+
+    def __init__(self, engine):
+        super().__init__()
+        self._engine = engine
+        self.requested.connect(self._capture, Qt.BlockingQueuedConnection)
+
+    @Slot(object)
+    def _capture(self, result):
+        result.append(self._engine._capture_frame_direct())
+
+
+class RegionCaptureEngine:
+    """
+    区域截图引擎，只截取配置中的选定区域，而不是整个桌面
+
+    QScreen.grabWindow(0, x, y, width, height) 只会读取指定矩形的像素，
+    在 652x353 这样的小区域上比整屏截图再 copy() 快一个数量级。
+
+    引擎需要在 GUI 线程中创建；capture_frame() 可以在任意线程调用。
+    """
+
+    def __init__(self, x=0, y=0, width=0, height=0, fps=10):
+        """
+        初始化区域截图引擎
+
+        参数:
+            x: 区域左上角 x 坐标（全局坐标）
+            y: 区域左上角 y 坐标（全局坐标）
+            width: 区域宽度
+            height: 区域高度
+            fps: 连续截图时的目标帧率
+        """
+        self.signals = RegionCaptureSignals()
+        self.frameCaptured = self.signals.frameCaptured
+        self.captureStopped = self.signals.captureStopped
+
+        self.fps = fps
+        self.frame_count = 0
+        self._screen = None
+        self._local_rect = QRect()
+        self._timer = None
+        self._invoker = _CaptureInvoker(self)
+        self.set_region(x, y, width, height)
+
+    @classmethod
+    def from_config(cls, config_manager, fps=10):
+        """
+        根据 ConfigManager 中保存的 selected_area 创建截图引擎
+
+        参数:
+            config_manager: 配置管理器实例
+            fps: 连续截图时的目标帧率
+        """
+        area = config_manager.get_selected_area()
+        return cls(area["x"], area["y"], area["width"], area["height"], fps=fps)
+
+    def set_region(self, x, y, width, height):
+        """
+        设置要截取的区域，并重新定位所在屏幕
+
+        参数:
+            x: 区域左上角 x 坐标（全局坐标）
+            y: 区域左上角 y 坐标（全局坐标）
+            width: 区域宽度
+            height: 区域高度
+        """
+        self.region = QRect(x, y, width, height)
+        # 屏幕在下一次截图时再解析，避免在 QGuiApplication 创建前调用
+        self._screen = None
+
+    def is_valid(self):
+        """区域是否有效（宽高都大于 0）"""
+        return self.region.width() > 0 and self.region.height() > 0
+
+    def _resolve_screen(self):
+        """
+        找到包含区域中心点的屏幕，并把全局坐标换算成该屏幕内的局部坐标
+
+        返回:
+            QScreen 实例
+        """
+        if self._screen is None:
+            screen = QGuiApplication.screenAt(self.region.center())
+            if screen is None:
+                screen = QGuiApplication.primaryScreen()
+            geometry = screen.geometry()
+            self._local_rect = self.region.translated(-geometry.topLeft())
+            self._screen = screen
+        return self._screen
+
+    def capture_pixmap(self):
+        """
+        截取选定区域
+
+        返回:
+            QPixmap，区域无效时返回 None
+        """
+        if not self.is_valid():
+            return None
+        screen = self._resolve_screen()
+        rect = self._local_rect
+        pixmap = screen.grabWindow(0, rect.x(), rect.y(), rect.width(), rect.height())
+        self.frame_count += 1
+        return pixmap
+
+    def capture_image(self):
+        """
+        截取选定区域并转换为 QImage
+
+        返回:
+            QImage，区域无效时返回 None
+        """
+        pixmap = self.capture_pixmap()
+        if pixmap is None:
+            return None
+        return pixmap.toImage()
+
+    def capture_frame(self):
+        """
+        截取选定区域并包装为 CaptureFrame，像素可直接以 NumPy 数组访问
+
+        在工作线程中调用时，截图会转发到 GUI 线程执行，当前线程阻塞到截图完成。
+
+        返回:
+            CaptureFrame，区域无效时返回 None
+        """
+        if QThread.currentThread() != self._invoker.thread():
+            result = []
+            self._invoker.requested.emit(result)
+            return result[0] if result else None
+        return self._capture_frame_direct()
+
+    def _capture_frame_direct(self):
+        image = self.capture_image()
+        if image is None:
+            return None
+        return CaptureFrame(image, self.region.x(), self.region.y())
+
+    def start(self, fps=None):
+        """
+        按目标帧率连续截图，每一帧通过 frameCaptured 信号发出
+
+        参数:
+            fps: 目标帧率，默认使用初始化时的值
+        """
+        if fps is not None:
+            self.fps = fps
+        if not self.is_valid():
+            print("截图区域无效，请先选择屏幕区域")
+            return False
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setTimerType(Qt.PreciseTimer)
+            self._timer.timeout.connect(self._on_timeout)
+        self._timer.start(max(1, int(round(1000 / self.fps))))
+        return True
+
+    def stop(self):
+        """停止连续截图"""
+        if self._timer is not None and self._timer.isActive():
+            self._timer.stop()
+            self.signals.captureStopped.emit()
+
+    def is_running(self):
+        """是否正在连续截图"""
+        return self._timer is not None and self._timer.isActive()
+
+    def _on_timeout(self):
+        frame = self.capture_frame()
+        if frame is not None:
+            self.signals.frameCaptured.emit(frame)
+
@@ -0,0 +1,155 @@
+import time
+from PySide6.QtCore import QObject, QTimer, QRect, QPoint
+from PySide6.QtGui import QGuiApplication, QPixmap, QPainter
+
+
+def create_dimmed_pixmap(screenshot, color):
+    """
+    生成叠加了半透明遮罩的截图副本
+
+    参数:
+        screenshot: 原始屏幕截图
+        color: 遮罩颜色（带透明度）
+
+    返回:
+        与截图大小、设备像素比相同的 QPixmap
+    """
+    dimmed = QPixmap(screenshot.size())
+    dimmed.setDevicePixelRatio(screenshot.devicePixelRatio())
+    painter = QPainter(dimmed)
+    painter.drawPixmap(0, 0, screenshot)
+    painter.fillRect(QRect(QPoint(0, 0), screenshot.deviceIndependentSize().toSize()), color)
+    painter.end()
+    return dimmed
+
+
+def paint_dimmed(painter, rect, screenshot, dimmed, color):
+    """
+    绘制覆盖层背景中 rect 部分
+
+    已经合成了遮罩层时直接贴图；还没有合成时（覆盖层刚显示的第一帧）画截图再叠加遮罩。
+
+    参数:
+        painter: 覆盖层的 QPainter
+        rect: 要绘制的区域（窗口坐标）
+        screenshot: 原始屏幕截图
+        dimmed: create_dimmed_pixmap() 的结果，尚未合成时为 None
+        color: 遮罩颜色
+    """
+    if dimmed is not None:
+        painter.drawPixmap(rect, dimmed, source_rect(dimmed, rect))
+    else:
+        painter.drawPixmap(rect, screenshot, source_rect(screenshot, rect))
+        painter.fillRect(rect, color)
+
+
+def source_rect(pixmap, rect):
+    """把窗口坐标（逻辑像素）的矩形换算为 pixmap 中的物理像素矩形"""
+    ratio = pixmap.devicePixelRatio()
+    return QRect(round(rect.x() * ratio), round(rect.y() * ratio),
+                 round(rect.width() * ratio), round(rect.height() * ratio))
+
+
+class ScreenshotCache(QObject):
+    """
+    全屏截图缓存，供区域选择器和鼠标跟踪器共用
+
+    同一时刻最多持有一张全屏截图。覆盖层打开时 acquire() 取得截图，关闭时 release()；
+    在有效期 ttl 内再次打开覆盖层直接复用同一张截图，不再重复截取整个桌面。
+    所有覆盖层都关闭后，截图在有效期结束时释放；超过有效期或调用 invalidate() 后重新截取。
+    """
+
+    def __init__(self, ttl=2.0, parent=None):
+        """
+        初始化截图缓存
+
+        参数:
+            ttl: 截图的有效期（秒）
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.ttl = ttl
+        self._pixmap = None
+        self._captured_at = 0.0
+        self._users = 0
+        # 没有覆盖层使用截图时，有效期结束就释放内存
+        self._expire_timer = QTimer(self)
+        self._expire_timer.setSingleShot(True)
+        self._expire_timer.timeout.connect(self._expire)
+        # 屏幕增减、主屏幕切换、分辨率/排列或缩放比例变化后旧截图不再可用
+        app = QGuiApplication.instance()
+        app.primaryScreenChanged.connect(self.invalidate)
+        app.screenAdded.connect(self._watch_screen)
+        app.screenAdded.connect(self.invalidate)
+        app.screenRemoved.connect(self.invalidate)
+        for screen in app.screens():
+            self._watch_screen(screen)
+
+    def _watch_screen(self, screen):
+        """屏幕的几何或 DPI 变化时让截图失效"""
+        screen.geometryChanged.connect(self.invalidate)
+        screen.logicalDotsPerInchChanged.connect(self.invalidate)
+        screen.physicalDotsPerInchChanged.connect(self.invalidate)
+
+    @property
+    def is_fresh(self):
+        """缓存中是否有仍在有效期内的截图"""
+        return self._pixmap is not None and time.monotonic() - self._captured_at < self.ttl
+
+    def acquire(self):
+        """
+        取得全屏截图，缓存仍有效时直接返回缓存
+
+        每次 acquire() 都要有对应的 release()。
+
+        返回:
+            主屏幕的 QPixmap 截图
+        """
+        self._expire_timer.stop()
+        # 有覆盖层打开时屏幕已被覆盖层遮住，重新截取只会截到覆盖层本身，继续复用当前截图
+        if self._pixmap is None or (self._users == 0 and not self.is_fresh):
+            # 先释放旧截图再截取，避免同时持有两张全屏截图
+            self._pixmap = None
+            start_time = time.perf_counter()
+            self._pixmap = QGuiApplication.primaryScreen().grabWindow(0)
+            self._captured_at = time.monotonic()
+            print(f"截取全屏截图: {self._pixmap.width()}x{self._pixmap.height()}，"
+                  f"耗时 {(time.perf_counter() - start_time) * 1000:.1f} ms")
+        self._users += 1
+        return self._pixmap
+
+    def release(self):
+        """覆盖层不再使用截图；最后一个使用者释放后，截图在有效期结束时丢弃"""
+        self._users = max(0, self._users - 1)
+        if self._users == 0 and self._pixmap is not None:
+            remaining = self.ttl - (time.monotonic() - self._captured_at)
+            if remaining <= 0:
+                self._expire()
+            else:
+                self._expire_timer.start(int(remaining * 1000))
+
+    def invalidate(self, *args):
+        """让缓存的截图失效，下一次 acquire() 重新截取（可直接连接带参数的屏幕信号）"""
+        self._captured_at = 0.0
+        if self._users == 0:
+            self._expire()
+
+    def _expire(self):
+        if self._users == 0:
+            self._pixmap = None
+
+
+_shared_cache = None
+
+
+def shared_screenshot_cache():
+    """
+    返回全局共用的截图缓存（需要已创建 QApplication）
+
+    返回:
+        ScreenshotCache 实例
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ScreenshotCache(parent=QGuiApplication.instance())
+    return _shared_cache
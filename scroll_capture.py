@@ -0,0 +1,136 @@
+import queue
+from PySide6.QtCore import QObject, Signal
+from macro_engine import build_report_macro, compile_macro
+
+
+class ScrollCaptureSignals(QObject):
+    """信号类，用于发送滚动截图进度和结果"""
+    pageCaptured = Signal(int, int)  # 页码，新增行数
+    pipelineFinished = Signal(bool, str)  # 成功/失败，消息
+
+
+class ScrollCapturePipeline:
+    """
+    滚动截图流水线：回放拖动 → 等待 → 截取选定区域，循环直到战报底部，最后拼接成一张长图
+
+    流程由 build_report_macro() 生成的战报宏描述，交给宏引擎在执行器的工作线程中运行；
+    连续两帧完全相同时认为已经滚动到底部，自动停止。
+    """
+
+    def __init__(self, config_manager, mouse_executor, capture_engine=None, stable_ms=150,
+                 settle_timeout_ms=3000, drag_duration=0.5, max_pages=300, use_trajectory=True):
+        """
+        初始化滚动截图流水线
+
+        参数:
+            config_manager: 配置管理器，提供 mouse_track 和完整轨迹
+            mouse_executor: MouseActionExecutor 实例，用于回放拖动
+            capture_engine: RegionCaptureEngine 实例，默认使用执行器的截图引擎
+            stable_ms: 拖动后画面保持不变多久（毫秒）视为滚动结束
+            settle_timeout_ms: 每次拖动后等待画面稳定的最长时间（毫秒）
+            drag_duration: 直线拖动的持续时间（秒）
+            max_pages: 最多截取的页数，防止异常情况下无限循环
+            use_trajectory: 有完整轨迹时是否回放完整轨迹
+        """
+        self.signals = ScrollCaptureSignals()
+        self.pageCaptured = self.signals.pageCaptured
+        self.pipelineFinished = self.signals.pipelineFinished
+
+        self.config_manager = config_manager
+        self.mouse_executor = mouse_executor
+        self.capture_engine = capture_engine if capture_engine is not None else mouse_executor.capture_engine
+        self.stable_ms = stable_ms
+        self.settle_timeout_ms = settle_timeout_ms
+        self.drag_duration = drag_duration
+        self.max_pages = max_pages
+        self.use_trajectory = use_trajectory
+        self._job = None
+
+    @property
+    def is_running(self):
+        """流水线任务是否在排队或执行中"""
+        return self._job is not None and not self._job.future.done()
+
+    def build_program(self, output_path):
+        """
+        根据当前保存的轨迹编译战报宏
+
+        参数:
+            output_path: 拼接长图的保存路径
+
+        返回:
+            MacroProgram
+
+        异常:
+            ValueError: 没有可用的鼠标轨迹
+        """
+        macro = build_report_macro(
+            self.config_manager, output_path, use_trajectory=self.use_trajectory,
+            stable_ms=self.stable_ms, timeout_ms=self.settle_timeout_ms,
+            drag_duration=self.drag_duration, max_pages=self.max_pages
+        )
+        return compile_macro(macro, "scroll_capture")
+
+    def start(self, output_path):
+        """
+        把流水线提交到执行器的任务队列中运行，结果通过 pipelineFinished 信号发出
+
+        参数:
+            output_path: 拼接长图的保存路径
+
+        返回:
+            MouseJob 任务；流水线正在运行或没有可用轨迹时返回 None
+        """
+        if self.is_running:
+            self.signals.pipelineFinished.emit(False, "滚动截图正在执行中，请等待完成")
+            return None
+        try:
+            program = self.build_program(output_path)
+        except ValueError as e:
+            self.signals.pipelineFinished.emit(False, str(e))
+            return None
+        # 作为一个任务放入执行器队列，与其他鼠标操作依次执行
+        try:
+            self._job = self.mouse_executor.submit(
+                program.run,
+                (self.mouse_executor, self.capture_engine,
+                 self.config_manager.get_mouse_trajectory(), self.signals.pageCaptured.emit),
+                "滚动截图完成",
+                settle=False
+            )
+        except queue.Full as e:
+            self.signals.pipelineFinished.emit(False, str(e))
+            return None
+        self._job.future.add_done_callback(self._on_job_done)
+        return self._job
+
+    def stop(self):
+        """取消流水线：尚未开始时不再执行，正在执行时在下一条指令前停止，不保存长图"""
+        if self._job is not None:
+            self._job.cancel()
+
+    def run(self, output_path):
+        """
+        在当前线程中运行流水线（不能在 GUI 线程中调用，截图需要 GUI 线程转发）
+
+        参数:
+            output_path: 拼接长图的保存路径
+
+        返回:
+            (是否成功, 消息)
+        """
+        try:
+            program = self.build_program(output_path)
+            result = program.run(self.mouse_executor, self.capture_engine,
+                                 self.config_manager.get_mouse_trajectory(), self.signals.pageCaptured.emit)
+        except Exception as e:
+            result = (False, f"滚动截图时出错: {str(e)}")
+        self.signals.pipelineFinished.emit(*result)
+        return result
+
+    def _on_job_done(self, future):
+        # 在工作线程中调用，信号会排队投递到接收者所在的线程
+        if future.cancelled():
+            self.signals.pipelineFinished.emit(False, "滚动截图已取消")
+        else:
+            self.signals.pipelineFinished.emit(*future.result())
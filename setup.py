@@ -3,7 +3,7 @@ import os
 from cx_Freeze import setup, Executable
 
 # ADD FILES
-files = ['icon.ico','themes/']
+files = ['icon.ico','themes/',('modules/resources.rcc','modules/resources.rcc')]
 
 # TARGET
 target = Executable(
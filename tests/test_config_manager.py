@@ -0,0 +1,45 @@
+import pytest
+
+from config_manager import ConfigManager
+from write_behind import WriteBehindWriter
+
+
+@pytest.fixture
+def manager(tmp_path):
+    # 写入器在测试期间不会自动写盘，验证读取不依赖 flush
+    manager = ConfigManager(str(tmp_path / "config.json"), writer=WriteBehindWriter(debounce=60, max_delay=60))
+    yield manager
+    manager.close()
+
+
+def test_switching_profiles_reads_unwritten_changes(manager):
+    manager.save_selected_area(1, 2, 3, 4)
+    manager.use_profile("other", "1920x1080")
+    assert manager.get_selected_area() == {"x": 0, "y": 0, "width": 0, "height": 0}
+    manager.use_profile("default")
+    assert manager.get_selected_area() == {"x": 1, "y": 2, "width": 3, "height": 4}
+    assert manager.writer.pending
+
+
+def test_list_profiles_includes_unwritten_changes(manager):
+    manager.use_profile("other", "1920x1080")
+    manager.save_mouse_track(0, 400, 0, 100)
+    manager.set_profile_tags(["client"])
+    assert [p["name"] for p in manager.list_profiles()] == ["other"]
+    assert [p["name"] for p in manager.list_profiles(tag="client")] == ["other"]
+    assert manager.list_profiles(resolution="2560x1440") == []
+    assert manager.list_profiles()[0]["mouse_track"]["start_y"] == 400
+
+
+def test_delete_then_save_keeps_new_profile(manager):
+    manager.save_selected_area(1, 2, 3, 4)
+    assert manager.flush(5)
+    manager.save_selected_area(5, 6, 7, 8)
+    assert manager.delete_profile("default")
+    assert not manager.delete_profile("default")
+    assert manager.list_profiles() == []
+    assert manager.get_selected_area()["width"] == 0
+
+    manager.save_selected_area(9, 9, 9, 9)
+    assert manager.flush(5)
+    assert manager.store.get_profile("default")["selected_area"]["x"] == 9
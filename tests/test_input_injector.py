@@ -0,0 +1,139 @@
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+import input_injector
+from input_injector import create_injector
+
+
+class _FakeXTest(input_injector.InputInjector):
+    name = "xtest"
+    available = True
+
+    def __init__(self, display_name=None):
+        if not self.available:
+            raise RuntimeError("X 服务器不支持 XTEST 扩展")
+
+
+class _FakePyAutoGUI(input_injector.InputInjector):
+    name = "pyautogui"
+
+
+@pytest.fixture
+def fake_backends(monkeypatch):
+    """把两个真实后端替换为不依赖 X 服务器和 pyautogui 的假对象"""
+    monkeypatch.setattr(input_injector, "XTestInjector", _FakeXTest)
+    monkeypatch.setattr(input_injector, "PyAutoGUIInjector", _FakePyAutoGUI)
+    monkeypatch.setattr(_FakeXTest, "available", True)
+    monkeypatch.delenv("BATTLE_REPORT_INJECTOR", raising=False)
+    monkeypatch.setattr(sys, "platform", "linux")
+    return monkeypatch
+
+
+@pytest.mark.parametrize("backend", ["xtest", "pyautogui"])
+def test_explicit_backend(fake_backends, backend):
+    assert create_injector(backend).name == backend
+
+
+def test_backend_from_environment(fake_backends):
+    fake_backends.setenv("BATTLE_REPORT_INJECTOR", "pyautogui")
+    fake_backends.setenv("DISPLAY", ":0")
+    assert create_injector().name == "pyautogui"
+
+
+def test_unknown_backend(fake_backends):
+    with pytest.raises(ValueError):
+        create_injector("uinput")
+
+
+def test_auto_prefers_xtest_with_display(fake_backends):
+    fake_backends.setenv("DISPLAY", ":0")
+    assert create_injector("auto").name == "xtest"
+
+
+def test_auto_without_display_uses_pyautogui(fake_backends):
+    fake_backends.delenv("DISPLAY", raising=False)
+    assert create_injector("auto").name == "pyautogui"
+
+
+def test_auto_on_other_platforms_uses_pyautogui(fake_backends):
+    fake_backends.setenv("DISPLAY", ":0")
+    fake_backends.setattr(sys, "platform", "win32")
+    assert create_injector("auto").name == "pyautogui"
+
+
+def test_auto_falls_back_when_xtest_fails(fake_backends):
+    fake_backends.setenv("DISPLAY", ":0")
+    fake_backends.setattr(_FakeXTest, "available", False)
+    assert create_injector("auto").name == "pyautogui"
+
+
+@pytest.fixture(scope="module")
+def xvfb_display():
+    """启动一个独立的 Xvfb，测试不会移动真实桌面上的鼠标；没有 Xvfb 或 python-xlib 时跳过"""
+    pytest.importorskip("Xlib")
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        pytest.skip("没有安装 Xvfb")
+    proc = subprocess.Popen([xvfb, "-displayfd", "1", "-screen", "0", "640x480x24", "-nolisten", "tcp"],
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    number = proc.stdout.readline().strip()
+    if not number:
+        proc.kill()
+        pytest.skip("Xvfb 启动失败")
+    yield f":{number}"
+    proc.terminate()
+    proc.wait()
+
+
+@pytest.fixture
+def xtest(xvfb_display):
+    injector = input_injector.XTestInjector(xvfb_display)
+    yield injector
+    injector.close()
+
+
+def _pointer(injector):
+    injector.display.sync()
+    return injector.display.screen().root.query_pointer()
+
+
+def _wait_for_pointer(injector, condition, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    pointer = _pointer(injector)
+    while not condition(pointer) and time.monotonic() < deadline:
+        time.sleep(0.01)
+        pointer = _pointer(injector)
+    return pointer
+
+
+def test_xtest_move(xtest):
+    xtest.move_to(123, 45)
+    xtest.flush()
+    pointer = _wait_for_pointer(xtest, lambda p: (p.root_x, p.root_y) == (123, 45))
+    assert (pointer.root_x, pointer.root_y) == (123, 45)
+
+
+def test_xtest_press_release_and_click(xtest):
+    from Xlib import X
+    xtest.move_to(10, 20)
+    xtest.mouse_down("left")
+    xtest.flush()
+    assert _wait_for_pointer(xtest, lambda p: p.mask & X.Button1Mask).mask & X.Button1Mask
+    xtest.mouse_up("left")
+    xtest.flush()
+    assert not _wait_for_pointer(xtest, lambda p: not p.mask & X.Button1Mask).mask & X.Button1Mask
+
+    xtest.click(300, 200)
+    pointer = _wait_for_pointer(xtest, lambda p: (p.root_x, p.root_y) == (300, 200))
+    assert (pointer.root_x, pointer.root_y) == (300, 200)
+    assert not pointer.mask & X.Button1Mask
+
+
+def test_xtest_rejects_unknown_button(xtest):
+    with pytest.raises(ValueError):
+        xtest.mouse_down("fourth")
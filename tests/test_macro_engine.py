@@ -0,0 +1,168 @@
+import re
+
+import numpy as np
+import pytest
+
+from macro_engine import (
+    MacroError, build_report_macro, compile_macro,
+    OP_CAPTURE, OP_DRAG, OP_DRAG_TRAJECTORY, OP_LOOP_INIT, OP_LOOP_TEST, OP_WAIT, OP_WAIT_STABLE,
+)
+
+REPORT_MACRO = {
+    "output": "report.png",
+    "steps": [
+        {"type": "capture", "stitch": True},
+        {"type": "loop_until", "condition": "unchanged", "steps": [
+            {"type": "drag", "start": [10, 400], "end": [10, 100]},
+            {"type": "wait_stable"},
+            {"type": "capture", "stitch": True},
+        ]},
+    ],
+}
+
+
+def test_compile_flattens_loop_into_jump():
+    program = compile_macro(REPORT_MACRO, name="report")
+    ops = [op for op, _ in program.instructions]
+    assert ops == [OP_CAPTURE, OP_LOOP_INIT, OP_DRAG, OP_WAIT_STABLE, OP_CAPTURE, OP_LOOP_TEST]
+    assert program.loop_count == 1
+    assert program.output == "report.png"
+    # 循环测试跳回循环体的第一条指令
+    assert program.instructions[-1][1] == (0, "unchanged", 300, 2)
+    assert program.instructions[2][1][:4] == (10, 400, 10, 100)
+
+
+def test_compile_accepts_step_list_and_numeric_coercion():
+    program = compile_macro([{"type": "wait", "seconds": 1}, {"type": "drag", "trajectory": True}])
+    assert program.instructions == ((OP_WAIT, (1.0,)), (OP_DRAG_TRAJECTORY, ()))
+    assert program.output is None
+
+
+def test_nested_loops_use_separate_counters():
+    inner = {"type": "loop_until", "condition": "count", "max_iterations": 2,
+             "steps": [{"type": "wait", "seconds": 0}]}
+    program = compile_macro([{"type": "loop_until", "condition": "count", "max_iterations": 3,
+                              "steps": [inner]}])
+    slots = [args[0] for op, args in program.instructions if op == OP_LOOP_TEST]
+    assert sorted(slots) == [0, 1]
+    assert program.loop_count == 2
+
+
+@pytest.mark.parametrize("macro, message", [
+    ([], "至少需要一个步骤"),
+    ({"steps": [{"type": "wait", "seconds": 1}], "output": 3}, "output"),
+    (["wait"], "步骤应为字典"),
+    ([{"type": "teleport"}], "未知的步骤类型"),
+    ([{"type": "drag", "start": [0, 0]}], "'end'"),
+    ([{"type": "drag", "start": [0, 0], "end": [1.5, 2]}], "[x, y]"),
+    ([{"type": "wait"}], "缺少字段 'seconds'"),
+    ([{"type": "wait", "seconds": -1}], "不能为负数"),
+    ([{"type": "wait", "seconds": True}], "类型应为 float"),
+    ([{"type": "wait_stable", "stable_ms": 0}], "必须大于 0"),
+    ([{"type": "loop_until", "condition": "forever", "steps": [{"type": "capture"}]}], "不支持的循环条件"),
+    ([{"type": "loop_until", "steps": []}], "至少需要一个步骤"),
+    ([{"type": "loop_until", "max_iterations": 0, "steps": [{"type": "capture"}]}], "max_iterations"),
+    ([{"type": "loop_until", "steps": [{"type": "wait", "seconds": 0}]}], "需要 capture 步骤"),
+    ([{"type": "capture", "path": "page_{i}.png"}], "{index}"),
+    ([{"type": "capture", "path": "page_{}.png"}], "{index}"),
+    ([{"type": "capture", "path": "page_{index.png"}], "{index}"),
+])
+def test_compile_rejects_invalid_steps(macro, message):
+    with pytest.raises(MacroError, match=re.escape(message)):
+        compile_macro(macro)
+
+
+def test_error_reports_step_path():
+    macro = [{"type": "loop_until", "steps": [{"type": "capture"}, {"type": "wait"}]}]
+    with pytest.raises(MacroError, match=r"steps\[0\]\.steps\[1\]"):
+        compile_macro(macro)
+
+
+def test_loop_depth_is_limited():
+    step = {"type": "capture"}
+    for _ in range(5):
+        step = {"type": "loop_until", "condition": "count", "steps": [step]}
+    with pytest.raises(MacroError, match="嵌套"):
+        compile_macro([step])
+
+
+class _Frame:
+    def __init__(self, value):
+        self.pixels = np.full((2, 2), value, dtype=np.uint32)
+
+
+class _Engine:
+    """按顺序返回预先给定的帧"""
+
+    def __init__(self, values):
+        self.values = list(values)
+        self.captured = 0
+
+    def is_valid(self):
+        return True
+
+    def capture_frame(self):
+        self.captured += 1
+        return _Frame(self.values.pop(0))
+
+
+class _Executor:
+    def check_cancelled(self):
+        pass
+
+
+def _run(steps, values):
+    engine = _Engine(values)
+    success, message = compile_macro(steps).run(_Executor(), engine)
+    assert success, message
+    return engine.captured
+
+
+def test_second_unchanged_loop_does_not_reuse_first_loop_result():
+    loop = {"type": "loop_until", "condition": "unchanged", "steps": [{"type": "capture"}]}
+    # 第一个循环在 1 → 1 时结束；第二个循环从新的画面开始，到 3 → 3 才结束
+    assert _run([{"type": "capture"}, loop, {"type": "wait", "seconds": 0}, loop],
+                [1, 1, 2, 3, 3]) == 5
+
+
+def test_outer_unchanged_loop_waits_for_its_own_iteration():
+    inner = {"type": "loop_until", "condition": "unchanged", "steps": [{"type": "capture"}]}
+    outer = {"type": "loop_until", "condition": "unchanged", "max_iterations": 10, "steps": [inner]}
+    # 外层第一轮中画面有变化（1 → 2 → 2），第二轮的截图都不变（2 → 2）才结束
+    assert _run([{"type": "capture"}, outer], [1, 2, 2, 2]) == 4
+
+
+class _Config:
+    def __init__(self, track, trajectory=None):
+        self.track = track
+        self.trajectory = trajectory
+
+    def get_mouse_track(self):
+        return self.track
+
+    def get_mouse_trajectory(self):
+        return self.trajectory
+
+
+@pytest.mark.parametrize("track", [
+    {"start_x": 0, "start_y": 0, "end_x": 0, "end_y": 0},
+    {"start_x": 5, "start_y": 9, "end_x": 5, "end_y": 9},
+    {},
+    None,
+])
+def test_report_macro_requires_a_track(track):
+    with pytest.raises(ValueError):
+        build_report_macro(_Config(track))
+
+
+def test_report_macro_uses_trajectory_without_track():
+    macro = build_report_macro(_Config(None, trajectory=object()))
+    assert macro["steps"][2]["steps"][0] == {"type": "drag", "trajectory": True}
+    compile_macro(macro)
+
+
+def test_report_macro_linear_drag():
+    track = {"start_x": 10, "start_y": 400, "end_x": 10, "end_y": 100}
+    macro = build_report_macro(_Config(track, trajectory=object()), use_trajectory=False)
+    assert macro["steps"][2]["steps"][0] == {"type": "drag", "start": [10, 400], "end": [10, 100],
+                                             "duration": 0.5}
@@ -0,0 +1,50 @@
+import threading
+import time
+
+from mouse_action import MouseActionExecutor
+
+
+def test_shutdown_with_full_queue_does_not_block():
+    executor = MouseActionExecutor(max_pending=2)
+    started, release = threading.Event(), threading.Event()
+    running = executor.submit(lambda: (started.set(), release.wait(5))[-1] and (True, "done"), settle=False)
+    assert started.wait(5)
+    queued = [executor.submit(lambda: (True, "queued"), settle=False) for _ in range(2)]
+    assert executor.pending_count() == 2
+
+    begin = time.perf_counter()
+    executor.shutdown(wait=False)
+    assert time.perf_counter() - begin < 1.0
+    assert all(job.future.cancelled() for job in queued)
+
+    release.set()
+    executor._worker.join(5)
+    assert executor.is_stopped
+    assert running.future.done()
+
+
+def test_jobs_run_in_priority_order():
+    executor = MouseActionExecutor()
+    gate = threading.Event()
+    order = []
+    executor.submit(gate.wait, (5,), settle=False)
+    jobs = [executor.submit(order.append, (name,), settle=False, priority=priority)
+            for name, priority in (("low", 5), ("high", 0), ("mid", 1))]
+    gate.set()
+    for job in jobs:
+        job.future.result(5)
+    executor.shutdown()
+    assert order == ["high", "mid", "low"]
+
+
+def test_playback_rate_defaults_and_override():
+    # 测试进程中没有 QGuiApplication 时使用默认频率
+    from PySide6.QtCore import QCoreApplication
+    from mouse_action import DEFAULT_PLAYBACK_RATE
+    executor = MouseActionExecutor(playback_rate=144.0)
+    assert executor.playback_rate == 144.0
+    executor.shutdown()
+    if QCoreApplication.instance() is None:
+        executor = MouseActionExecutor()
+        assert executor.playback_rate == DEFAULT_PLAYBACK_RATE
+        executor.shutdown()
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from PySide6.QtGui import QImage
+
+from capture_frame import CaptureFrame
+from report_stitcher import ReportStitcher, find_overlap, row_hashes
+
+
+def _page(height=40, width=16, seed=0):
+    """生成每一行都不同的整页像素（uint32，0xffRRGGBB）"""
+    rng = np.random.default_rng(seed)
+    return (rng.integers(0, 2 ** 24, size=(height, width), dtype=np.uint32) | np.uint32(0xff000000))
+
+
+def _frame(pixels):
+    height, width = pixels.shape
+    pixels = np.ascontiguousarray(pixels)
+    image = QImage(pixels.data, width, height, width * 4, QImage.Format_RGB32).copy()
+    return CaptureFrame(image)
+
+
+def test_find_overlap_detects_scrolled_rows():
+    report = _page(100)
+    prev, cur = report[0:40], report[25:65]
+    assert find_overlap(row_hashes(prev), row_hashes(cur)) == 15
+
+
+def test_find_overlap_prefers_largest_overlap():
+    # 重复出现的行会产生多个候选偏移，应选择最大的重叠
+    rows = _page(10)
+    prev = np.concatenate([rows, rows, rows])
+    cur = np.concatenate([rows, rows, _page(10, seed=1)])
+    assert find_overlap(row_hashes(prev), row_hashes(cur)) == 20
+
+
+def test_find_overlap_below_minimum_is_rejected():
+    report = _page(100)
+    prev, cur = report[0:40], report[35:75]
+    assert find_overlap(row_hashes(prev), row_hashes(cur), min_overlap=8) == 0
+    assert find_overlap(row_hashes(prev), row_hashes(cur), min_overlap=5) == 5
+
+
+def test_stitcher_rebuilds_report():
+    report = _page(120)
+    pages = [report[0:40], report[30:70], report[60:100], report[80:120], report[80:120]]
+    with ReportStitcher() as stitcher:
+        added = []
+        reached_end = stitcher.consume((_frame(page) for page in pages),
+                                       on_page=lambda page, rows: added.append(rows))
+        assert reached_end
+        assert added == [40, 30, 30, 20, 0]
+        assert stitcher.frame_count == 4
+        assert (stitcher.width, stitcher.height) == (16, 120)
+        result = stitcher.result().view(np.uint32)[:, :, 0]
+        assert np.array_equal(result, report)
+
+
+def test_stitcher_rejects_width_change():
+    with ReportStitcher() as stitcher:
+        stitcher.push(_frame(_page(20, width=16)))
+        with pytest.raises(ValueError):
+            stitcher.push(_frame(_page(20, width=8)))
@@ -0,0 +1,86 @@
+import numpy as np
+from PySide6.QtGui import QImage
+
+from capture_frame import CaptureFrame
+from scroll_capture import ScrollCapturePipeline
+
+REPORT_HEIGHT = 120
+PAGE_HEIGHT = 40
+SCROLL_ROWS = 30
+
+
+def _report():
+    rng = np.random.default_rng(3)
+    return rng.integers(0, 2 ** 24, size=(REPORT_HEIGHT, 16), dtype=np.uint32) | np.uint32(0xff000000)
+
+
+class _ScrollingEngine:
+    """每次拖动向下滚动 SCROLL_ROWS 行，到底部后画面不再变化"""
+
+    def __init__(self):
+        self.report = _report()
+        self.top = 0
+
+    def is_valid(self):
+        return True
+
+    def capture_frame(self):
+        pixels = np.ascontiguousarray(self.report[self.top:self.top + PAGE_HEIGHT])
+        image = QImage(pixels.data, pixels.shape[1], PAGE_HEIGHT, pixels.shape[1] * 4, QImage.Format_RGB32)
+        return CaptureFrame(image.copy())
+
+
+class _Executor:
+    def __init__(self, engine):
+        self.capture_engine = engine
+        self.drags = []
+
+    def check_cancelled(self):
+        pass
+
+    def perform_mouse_track(self, *args):
+        self.drags.append(args)
+        engine = self.capture_engine
+        engine.top = min(engine.top + SCROLL_ROWS, REPORT_HEIGHT - PAGE_HEIGHT)
+
+
+class _Config:
+    def __init__(self, track):
+        self.track = track
+
+    def get_mouse_track(self):
+        return self.track
+
+    def get_mouse_trajectory(self):
+        return None
+
+
+def _pipeline(track):
+    executor = _Executor(_ScrollingEngine())
+    return ScrollCapturePipeline(_Config(track), executor, stable_ms=1, settle_timeout_ms=500), executor
+
+
+def test_pipeline_stitches_until_bottom(tmp_path):
+    pipeline, executor = _pipeline({"start_x": 10, "start_y": 300, "end_x": 10, "end_y": 100})
+    pages, finished = [], []
+    pipeline.pageCaptured.connect(lambda page, rows: pages.append((page, rows)))
+    pipeline.pipelineFinished.connect(lambda success, message: finished.append(success))
+    output = str(tmp_path / "report.png")
+
+    success, message = pipeline.run(output)
+
+    assert success, message
+    assert finished == [True]
+    # 0 → 30 → 60 → 80（底部）→ 80（不变，停止）
+    assert [rows for _, rows in pages] == [40, 30, 30, 20, 0]
+    assert executor.drags[0][:4] == (10, 300, 10, 100)
+    image = QImage(output)
+    assert (image.width(), image.height()) == (16, REPORT_HEIGHT)
+
+
+def test_pipeline_without_track_does_not_drag(tmp_path):
+    pipeline, executor = _pipeline({"start_x": 0, "start_y": 0, "end_x": 0, "end_y": 0})
+    success, message = pipeline.run(str(tmp_path / "report.png"))
+    assert not success
+    assert "鼠标轨迹" in message
+    assert executor.drags == []
@@ -0,0 +1,49 @@
+import numpy as np
+
+from trajectory_processing import simplify_rdp, resample
+
+
+def test_simplify_rdp_keeps_reversal_point():
+    # 冲过头再折返（0 → 100 → 50）与首尾共线，但折返点不能被删掉
+    xs = np.array([0, 25, 50, 75, 100, 75, 50])
+    ys = np.zeros(7)
+    kept = simplify_rdp(xs, ys, tolerance=1.0)
+    assert list(xs[kept]) == [0, 100, 50]
+
+
+def test_simplify_rdp_drops_collinear_points():
+    xs = np.arange(0, 101, 10)
+    ys = xs * 2
+    assert list(simplify_rdp(xs, ys, tolerance=0.5)) == [0, len(xs) - 1]
+
+
+def test_simplify_rdp_closed_loop():
+    # 首尾重合时按到该点的距离拆分
+    xs = np.array([0, 10, 10, 0, 0])
+    ys = np.array([0, 0, 10, 10, 0])
+    kept = simplify_rdp(xs, ys, tolerance=1.0)
+    assert kept[0] == 0 and kept[-1] == 4
+    assert 2 in kept
+
+
+def test_resample_includes_original_points():
+    # 60 Hz 采样点之外，原轨迹的拐点时间也必须出现
+    xs, ys, ts = resample([0, 100, 100], [0, 0, 50], [0.0, 0.05, 0.1], rate_hz=60.0)
+    assert 0.05 in ts
+    assert ts[0] == 0.0 and ts[-1] == 0.1
+    assert np.all(np.diff(ts) > 0)
+    corner = np.flatnonzero(ts == 0.05)[0]
+    assert (xs[corner], ys[corner]) == (100, 0)
+
+
+def test_resample_interpolates_linearly():
+    xs, ys, ts = resample([0, 60], [0, 30], [0.0, 1.0], rate_hz=10.0)
+    assert len(ts) == 11
+    assert list(xs) == [round(t * 60) for t in ts]
+    assert list(ys) == [round(t * 30) for t in ts]
+    assert xs.dtype == np.int32
+
+
+def test_resample_too_short_is_unchanged():
+    xs, ys, ts = resample([5], [7], [0.0])
+    assert list(xs) == [5] and list(ys) == [7] and list(ts) == [0.0]
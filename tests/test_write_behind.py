@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from write_behind import WriteBehindWriter
+
+
+def test_submit_after_close_raises():
+    writer = WriteBehindWriter(debounce=0.01)
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.submit(print, "never")
+    with pytest.raises(RuntimeError):
+        writer.write_file("unused.json", b"{}")
+
+
+def test_flush_returns_immediately_when_thread_is_gone():
+    writer = WriteBehindWriter(debounce=60, max_delay=60)
+    writer.close()
+    # 模拟关闭后仍有未写入的修改
+    writer._sequence += 1
+    begin = time.perf_counter()
+    assert writer.flush() is False
+    assert time.perf_counter() - begin < 1.0
+
+
+def test_discard_moves_key_behind_later_tasks():
+    writer = WriteBehindWriter(debounce=60, max_delay=60)
+    order = []
+    writer.submit(order.append, "save", key="area")
+    writer.submit(order.append, "delete")
+    assert writer.discard("area")
+    writer.submit(order.append, "save again", key="area")
+    assert writer.flush(5)
+    writer.close()
+    assert order == ["delete", "save again"]
+
+
+def test_discarding_last_task_leaves_nothing_pending():
+    writer = WriteBehindWriter(debounce=60, max_delay=60)
+    writer.submit(print, "dropped", key="area")
+    assert writer.pending
+    assert writer.discard("area")
+    assert not writer.discard("area")
+    assert not writer.pending
+    assert writer.flush(1)
+    writer.close()
@@ -0,0 +1,97 @@
+import numpy as np
+from mouse_trajectory import MouseTrajectory
+
+
+def simplify_rdp(xs, ys, tolerance=1.0):
+    """
+    Ramer–Douglas–Peucker 折线简化
+
+    每一段的点到线段距离用 NumPy 一次算完，只对需要继续拆分的段入栈，
+    不对单个点做 Python 循环。
+
+    参数:
+        xs: x 坐标数组
+        ys: y 坐标数组
+        tolerance: 允许的最大偏差（像素）
+
+    返回:
+        保留点的下标数组（升序，总是包含首尾两点）
+    """
+    points = np.column_stack((xs, ys)).astype(np.float64)
+    count = len(points)
+    if count < 3:
+        return np.arange(count)
+
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start, end = points[first], points[last]
+        interior = points[first + 1:last]
+        segment = end - start
+        offsets = interior - start
+        length_sq = segment @ segment
+        if length_sq == 0:
+            # 首尾重合时退化为到该点的距离
+            nearest = offsets
+        else:
+            # 投影参数限制在 [0, 1]，越过端点（折返、冲过头）的点按到端点的距离计算，
+            # 否则与首尾共线的折返会被当作直线删掉
+            t = np.clip(offsets @ segment / length_sq, 0.0, 1.0)
+            nearest = offsets - t[:, None] * segment
+        distances = np.hypot(nearest[:, 0], nearest[:, 1])
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(keep)
+
+
+def resample(xs, ys, ts, rate_hz=60.0):
+    """
+    按固定频率对轨迹重新采样，时间上线性插值
+
+    原轨迹的各个点（通常是简化后的拐点）也会保留，避免在拐角处走捷径。
+
+    参数:
+        xs: x 坐标数组
+        ys: y 坐标数组
+        ts: 时间数组（秒，递增）
+        rate_hz: 采样频率，通常与显示器刷新率一致
+
+    返回:
+        (xs, ys, ts) 重新采样后的数组，坐标已四舍五入为整数
+    """
+    ts = np.asarray(ts, dtype=np.float64)
+    if len(ts) < 2 or ts[-1] <= 0:
+        return np.asarray(xs, dtype=np.int32), np.asarray(ys, dtype=np.int32), ts
+    ticks = np.union1d(np.arange(0.0, ts[-1], 1.0 / rate_hz), ts)
+    new_xs = np.rint(np.interp(ticks, ts, xs)).astype(np.int32)
+    new_ys = np.rint(np.interp(ticks, ts, ys)).astype(np.int32)
+    return new_xs, new_ys, ticks
+
+
+def prepare_trajectory(trajectory, tolerance=1.0, rate_hz=60.0):
+    """
+    回放前处理录制的轨迹：先按像素容差简化，再按注入频率重新采样
+
+    参数:
+        trajectory: 录制的 MouseTrajectory
+        tolerance: 简化时允许的最大偏差（像素）
+        rate_hz: 注入鼠标事件的频率（Hz）
+
+    返回:
+        处理后的新 MouseTrajectory
+    """
+    xs, ys, ts = trajectory.as_numpy()
+    kept = simplify_rdp(xs, ys, tolerance)
+    new_xs, new_ys, new_ts = resample(xs[kept], ys[kept], ts[kept], rate_hz)
+    # 重新采样后相邻位置可能取整到同一像素，这些点不需要注入
+    moved = np.ones(len(new_xs), dtype=bool)
+    moved[1:-1] = (np.diff(new_xs[:-1]) != 0) | (np.diff(new_ys[:-1]) != 0)
+    return MouseTrajectory.from_arrays(new_xs[moved], new_ys[moved], new_ts[moved])
@@ -0,0 +1,156 @@
+from PySide6.QtCore import QObject, QEvent, QTimer, Signal
+
+# 窗口系统没有发来隐藏/显示完成的通知时，最多等待的时间（毫秒）
+EXPOSE_TIMEOUT_MS = 250
+
+
+class WindowVisibilitySignals(QObject):
+    hidden = Signal()  # 窗口已经从屏幕上移除
+    restored = Signal()  # 窗口已经重新显示在屏幕上
+
+
+class WindowVisibilityController(QObject):
+    """
+    主窗口隐藏/恢复的状态机
+
+    状态: visible → hiding → hidden → restoring → visible
+    隐藏和恢复都以窗口真正从屏幕上移除/重新显示（QWindow 的 Expose 事件）为完成标志，
+    不用固定延时等待。restore() 是幂等的：恢复进行中或窗口已在前台时重复调用不做任何事，
+    多个信号同时要求恢复时窗口只会被显示、提升和激活一次。
+    """
+
+    VISIBLE = "visible"
+    HIDING = "hiding"
+    HIDDEN = "hidden"
+    RESTORING = "restoring"
+
+    def __init__(self, window, expose_timeout_ms=EXPOSE_TIMEOUT_MS):
+        """
+        初始化状态机
+
+        参数:
+            window: 要控制的顶层窗口（QWidget）
+            expose_timeout_ms: 等待 Expose 事件的最长时间（毫秒），超时后按已完成处理
+        """
+        super().__init__(window)
+        self.window = window
+        self.signals = WindowVisibilitySignals()
+        self.hidden = self.signals.hidden
+        self.restored = self.signals.restored
+        self.state = self.VISIBLE if window.isVisible() else self.HIDDEN
+        self._hidden_callbacks = []
+        self._exposed_callbacks = []
+        self._watched_handle = None
+        # 某些平台（例如没有窗口管理器时）不一定发送 Expose 事件，超时后不再等待
+        self._expose_timer = QTimer(self)
+        self._expose_timer.setSingleShot(True)
+        self._expose_timer.setInterval(expose_timeout_ms)
+        self._expose_timer.timeout.connect(self._on_expose_timeout)
+        self._exposed_timer = QTimer(self)
+        self._exposed_timer.setSingleShot(True)
+        self._exposed_timer.setInterval(expose_timeout_ms)
+        self._exposed_timer.timeout.connect(self._run_exposed_callbacks)
+
+    def _window_handle(self):
+        """返回窗口的 QWindow，并在第一次取得时安装事件过滤器"""
+        handle = self.window.windowHandle()
+        if handle is not None and handle is not self._watched_handle:
+            handle.installEventFilter(self)
+            self._watched_handle = handle
+        return handle
+
+    def hide_then(self, callback):
+        """
+        隐藏窗口，窗口真正从屏幕上移除后调用 callback
+
+        参数:
+            callback: 无参数的回调函数
+        """
+        if self.state == self.HIDDEN:
+            callback()
+            return
+        self._hidden_callbacks.append(callback)
+        if self.state == self.HIDING:
+            return
+        self.state = self.HIDING
+        handle = self._window_handle()
+        self.window.setVisible(False)
+        if handle is None or not handle.isExposed():
+            # 窗口本来就不在屏幕上（例如已最小化）或平台同步完成了隐藏
+            self._finish_hiding()
+        else:
+            self._expose_timer.start()
+
+    def when_exposed(self, callback):
+        """
+        窗口显示在屏幕上并完成这一帧的绘制后调用 callback
+
+        参数:
+            callback: 无参数的回调函数
+        """
+        self._exposed_callbacks.append(callback)
+        handle = self._window_handle()
+        if handle is not None and handle.isExposed():
+            self._run_exposed_callbacks()
+        else:
+            self._exposed_timer.start()
+
+    def restore(self):
+        """恢复窗口到前台；可以重复调用，恢复进行中或窗口已在前台时不做任何事"""
+        if self.state == self.RESTORING:
+            return
+        if (self.state == self.VISIBLE and self.window.isVisible()
+                and not self.window.isMinimized() and self.window.isActiveWindow()):
+            return
+        # 尚未完成的隐藏被恢复取代，不再打开隐藏后要显示的窗口
+        self._hidden_callbacks.clear()
+        self.state = self.RESTORING
+        print("恢复主窗口...", flush=True)
+        if self.window.isMinimized():
+            self.window.showNormal()
+        else:
+            self.window.show()
+        self.window.raise_()
+        self.window.activateWindow()
+        handle = self._window_handle()
+        if handle is not None and handle.isExposed():
+            self._finish_restoring()
+        else:
+            self._expose_timer.start()
+
+    def _finish_hiding(self):
+        self._expose_timer.stop()
+        self.state = self.HIDDEN
+        callbacks, self._hidden_callbacks = self._hidden_callbacks, []
+        self.hidden.emit()
+        for callback in callbacks:
+            callback()
+
+    def _finish_restoring(self):
+        self._expose_timer.stop()
+        self.state = self.VISIBLE
+        print("主窗口已恢复!", flush=True)
+        self.restored.emit()
+
+    def _run_exposed_callbacks(self):
+        self._exposed_timer.stop()
+        callbacks, self._exposed_callbacks = self._exposed_callbacks, []
+        # Expose 事件处理完（窗口绘制完成）之后才执行
+        for callback in callbacks:
+            QTimer.singleShot(0, self, callback)
+
+    def _on_expose_timeout(self):
+        if self.state == self.HIDING:
+            self._finish_hiding()
+        elif self.state == self.RESTORING:
+            self._finish_restoring()
+
+    def eventFilter(self, obj, event):
+        if obj is self._watched_handle and event.type() == QEvent.Expose:
+            if self._exposed_callbacks and obj.isExposed():
+                self._run_exposed_callbacks()
+            if self.state == self.HIDING and not obj.isExposed():
+                self._finish_hiding()
+            elif self.state == self.RESTORING and obj.isExposed():
+                self._finish_restoring()
+        return False
@@ -0,0 +1,217 @@
+import os
+import time
+import atexit
+import tempfile
+import itertools
+import threading
+
+
+def atomic_write(path, data):
+    """
+    原子地写入文件：先写同目录下的临时文件并 fsync，再用 os.replace 替换目标文件
+
+    任何时刻目标文件要么是旧内容，要么是完整的新内容，写到一半崩溃不会留下截断的文件。
+
+    参数:
+        path: 目标文件路径
+        data: 要写入的字节串
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    # 同步目录项，确保重命名本身也已落盘（Windows 不支持打开目录）
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class WriteBehindWriter:
+    """
+    后台延迟写入器
+
+    调用方只登记要写的内容，立即返回；后台线程在 debounce 秒内没有新的修改后
+    （最迟 max_delay 秒）统一写入。同一文件的多次修改只写最后一次；
+    其它写操作（例如数据库更新）按提交顺序执行，带相同 key 的写操作只执行最后一次。
+    """
+
+    def __init__(self, debounce=0.3, max_delay=2.0, name="write-behind"):
+        """
+        初始化并启动后台写入线程
+
+        参数:
+            debounce: 最后一次修改后等待的时间（秒）
+            max_delay: 第一次修改后最多等待的时间（秒），持续修改时也会按时写入
+            name: 线程名称
+        """
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self._cond = threading.Condition()
+        self._files = {}
+        self._tasks = {}
+        self._task_ids = itertools.count()
+        self._first_change = None
+        self._last_change = None
+        self._flush_requested = False
+        self._closed = False
+        # 每次登记修改序号加一，写完后 _written 追上即表示这之前的修改都已写入
+        self._sequence = 0
+        self._written = 0
+        self._writing = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        # 没有显式 close() 时，解释器退出前也要把修改写完
+        atexit.register(self.close)
+
+    def write_file(self, path, data):
+        """
+        登记一次文件写入，之前尚未写入的同一文件内容会被覆盖
+
+        参数:
+            path: 文件路径
+            data: 完整的文件内容（字节串）
+
+        异常:
+            RuntimeError: 写入器已关闭
+        """
+        with self._cond:
+            self._check_open()
+            self._files[path] = data
+            self._mark_dirty()
+
+    def submit(self, func, *args, key=None):
+        """
+        登记一个写操作，在后台线程中按提交顺序执行
+
+        参数:
+            func: 可调用对象
+            *args: 调用参数
+            key: 可选的合并键，尚未执行的同 key 写操作会被替换（保留原来的执行位置）
+
+        异常:
+            RuntimeError: 写入器已关闭
+        """
+        with self._cond:
+            self._check_open()
+            self._tasks[key if key is not None else next(self._task_ids)] = (func, args)
+            self._mark_dirty()
+
+    def discard(self, key):
+        """
+        丢弃尚未执行的同 key 写操作，之后再提交该 key 时排在当前所有写操作之后
+
+        参数:
+            key: 合并键
+
+        返回:
+            是否丢弃了写操作
+        """
+        with self._cond:
+            if self._tasks.pop(key, None) is None:
+                return False
+            # 丢弃的是最后一项修改时没有批次会再写入，直接视为已写完
+            if not (self._files or self._tasks or self._writing):
+                self._written = self._sequence
+                self._cond.notify_all()
+            return True
+
+    def _check_open(self):
+        # 关闭后后台线程不再取新的修改，继续登记只会被悄悄丢掉
+        if self._closed:
+            raise RuntimeError("写入器已关闭，不能再登记修改")
+
+    def _mark_dirty(self):
+        now = time.monotonic()
+        if self._first_change is None:
+            self._first_change = now
+        self._last_change = now
+        self._sequence += 1
+        self._cond.notify_all()
+
+    @property
+    def pending(self):
+        """是否还有尚未写入的修改"""
+        with self._cond:
+            return self._written < self._sequence
+
+    def flush(self, timeout=None):
+        """
+        立即写入所有已登记的修改并等待完成
+
+        参数:
+            timeout: 最长等待时间（秒），None 表示一直等待
+
+        返回:
+            是否在超时前全部写入
+        """
+        with self._cond:
+            target = self._sequence
+            # 后台线程已经退出时没有人会再写入，不能等下去
+            if self._written >= target or not self._thread.is_alive():
+                return self._written >= target
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._written >= target, timeout)
+
+    def close(self, timeout=None):
+        """写入所有修改并停止后台线程，可以重复调用"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def _wait_for_batch(self):
+        """等待到需要写入的时刻，返回 (文件, 写操作, 序号)；关闭且没有修改时返回 None"""
+        with self._cond:
+            while not (self._files or self._tasks):
+                if self._closed:
+                    return None
+                self._cond.wait()
+            while not (self._flush_requested or self._closed):
+                deadline = min(self._last_change + self.debounce, self._first_change + self.max_delay)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            files, self._files = self._files, {}
+            tasks, self._tasks = self._tasks, {}
+            self._first_change = None
+            self._flush_requested = False
+            self._writing = True
+            return files, tasks, self._sequence
+
+    def _run(self):
+        while True:
+            batch = self._wait_for_batch()
+            if batch is None:
+                return
+            files, tasks, sequence = batch
+            for func, args in tasks.values():
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"后台写入失败: {e}")
+            for path, data in files.items():
+                try:
+                    atomic_write(path, data)
+                except Exception as e:
+                    print(f"写入文件 {path} 失败: {e}")
+            with self._cond:
+                self._writing = False
+                # 写入期间登记的修改若都已被丢弃，之前的序号也都算写完
+                self._written = sequence if (self._files or self._tasks) else self._sequence
+                self._cond.notify_all()